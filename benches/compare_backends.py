@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Compare the JSON results of two runs of the `osu` benchmark.
+
+Usage:
+    python3 benches/compare_backends.py BASELINE.json OTHER.json [-o REPORT.md]
+
+Prints a Markdown report with one table per benchmark. The ratio column is
+OTHER / BASELINE for rates (MB/s, msg/s) and BASELINE / OTHER for times (us),
+so a ratio above 1 always means OTHER is faster.
+"""
+
+import argparse
+import json
+import sys
+
+# Units where a larger value is better
+RATE_UNITS = {"MB/s", "msg/s"}
+
+
+def load(path):
+    with open(path) as f:
+        run = json.load(f)
+    results = {}
+    for r in run["results"]:
+        results[(r["benchmark"], r["size"])] = r
+    return run, results
+
+
+def ratio(unit, base, other):
+    if unit in RATE_UNITS:
+        return other / base if base else float("nan")
+    return base / other if other else float("nan")
+
+
+def report(base_path, other_path):
+    base, base_results = load(base_path)
+    other, other_results = load(other_path)
+    lines = ["# Backend comparison", ""]
+    lines.append("| | Baseline | Other |")
+    lines.append("|---|---|---|")
+    for key in ("label", "backend", "library", "processes"):
+        lines.append("| %s | %s | %s |" % (key, base.get(key, ""), other.get(key, "")))
+    lines.append("")
+
+    benchmarks = []
+    for name, _ in base_results:
+        if name not in benchmarks:
+            benchmarks.append(name)
+    for name in benchmarks:
+        sizes = sorted(s for n, s in base_results if n == name and (n, s) in other_results)
+        if not sizes:
+            continue
+        unit = base_results[(name, sizes[0])]["unit"]
+        lines.append("## %s (%s)" % (name, unit))
+        lines.append("")
+        lines.append("| Size (bytes) | %s | %s | Ratio |" % (base["label"], other["label"]))
+        lines.append("|---:|---:|---:|---:|")
+        for size in sizes:
+            b = base_results[(name, size)]["value"]
+            o = other_results[(name, size)]["value"]
+            lines.append("| %d | %.2f | %.2f | %.3f |" % (size, b, o, ratio(unit, b, o)))
+        lines.append("")
+
+    missing = sorted(set(base_results) ^ set(other_results))
+    if missing:
+        lines.append("Not measured in both runs: %s" % ", ".join("%s/%d" % m for m in missing))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", help="JSON results of the baseline run")
+    parser.add_argument("other", help="JSON results of the run to compare")
+    parser.add_argument("-o", "--output", help="write the report to this file")
+    args = parser.parse_args()
+
+    text = report(args.baseline, args.other)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,607 @@
+//! Micro-benchmarks in the style of the OSU Micro-Benchmarks.
+//!
+//! Measures point-to-point latency, bandwidth, bidirectional bandwidth and message rate, and the
+//! latency of allreduce, broadcast and all-to-all over a range of message sizes, using only the
+//! public API of the `mpi` crate. Results are printed as tables by rank 0 and can be written as
+//! JSON or CSV for `benches/compare_backends.py`.
+//!
+//! Build with `cargo bench --bench osu --no-run` (plus the backend features) and start the
+//! executable under the MPI launcher; `benches/run_backend_comparison.sh` does both for the two
+//! backends. Run with `--help` for the options.
+
+#![deny(warnings)]
+
+use std::{fmt::Write as _, fs, path::PathBuf, process};
+
+use mpi::{collective::SystemOperation, topology::SimpleCommunicator, traits::*};
+
+const BACKEND: &str = if cfg!(feature = "mpi-rt-sys-backend") {
+    "mpi-rt-sys-backend"
+} else {
+    "mpi-sys-backend"
+};
+
+/// Messages of at least this many bytes use the large iteration and warmup counts
+const LARGE_MESSAGE_SIZE: usize = 8192;
+
+const USAGE: &str = "\
+usage: osu [options]
+
+  --benchmarks LIST     comma separated list of benchmarks to run (default: all)
+                        latency, bandwidth, bibw, message-rate, allreduce, bcast, alltoall
+  --min-size BYTES      smallest message size (default: 1)
+  --max-size BYTES      largest message size (default: 1048576)
+  --iterations N        timed iterations for small messages (default: 1000)
+  --large-iterations N  timed iterations for large messages (default: 100)
+  --warmup N            untimed iterations before timing (default: 10% of iterations)
+  --window N            messages in flight per iteration of the streaming benchmarks (default: 64)
+  --label NAME          name of this run in the output (default: the backend)
+  --json PATH           write the results to PATH as JSON
+  --csv PATH            write the results to PATH as CSV
+";
+
+#[derive(Copy, Clone, Debug, PartialEq)]
+enum Benchmark {
+    Latency,
+    Bandwidth,
+    BiBandwidth,
+    MessageRate,
+    Allreduce,
+    Bcast,
+    Alltoall,
+}
+
+impl Benchmark {
+    const ALL: [Benchmark; 7] = [
+        Benchmark::Latency,
+        Benchmark::Bandwidth,
+        Benchmark::BiBandwidth,
+        Benchmark::MessageRate,
+        Benchmark::Allreduce,
+        Benchmark::Bcast,
+        Benchmark::Alltoall,
+    ];
+
+    fn name(self) -> &'static str {
+        match self {
+            Benchmark::Latency => "latency",
+            Benchmark::Bandwidth => "bandwidth",
+            Benchmark::BiBandwidth => "bibw",
+            Benchmark::MessageRate => "message-rate",
+            Benchmark::Allreduce => "allreduce",
+            Benchmark::Bcast => "bcast",
+            Benchmark::Alltoall => "alltoall",
+        }
+    }
+
+    fn unit(self) -> &'static str {
+        match self {
+            Benchmark::Bandwidth | Benchmark::BiBandwidth => "MB/s",
+            Benchmark::MessageRate => "msg/s",
+            _ => "us",
+        }
+    }
+}
+
+struct Options {
+    benchmarks: Vec<Benchmark>,
+    min_size: usize,
+    max_size: usize,
+    iterations: usize,
+    large_iterations: usize,
+    warmup: Option<usize>,
+    window: usize,
+    label: String,
+    json: Option<PathBuf>,
+    csv: Option<PathBuf>,
+}
+
+impl Options {
+    fn parse() -> Result<Options, String> {
+        let mut options = Options {
+            benchmarks: Benchmark::ALL.to_vec(),
+            min_size: 1,
+            max_size: 1 << 20,
+            iterations: 1000,
+            large_iterations: 100,
+            warmup: None,
+            window: 64,
+            label: BACKEND.to_owned(),
+            json: None,
+            csv: None,
+        };
+        let mut args = std::env::args().skip(1);
+        while let Some(arg) = args.next() {
+            // `cargo bench` passes `--bench` to benchmarks without the default harness
+            if arg == "--bench" {
+                continue;
+            }
+            if arg == "--help" || arg == "-h" {
+                print!("{}", USAGE);
+                process::exit(0);
+            }
+            let value = args
+                .next()
+                .ok_or_else(|| format!("missing value for {}", arg))?;
+            let number = || {
+                value
+                    .parse::<usize>()
+                    .map_err(|_| format!("invalid value for {}: {}", arg, value))
+            };
+            match arg.as_str() {
+                "--benchmarks" => {
+                    options.benchmarks = value
+                        .split(',')
+                        .map(|name| {
+                            Benchmark::ALL
+                                .into_iter()
+                                .find(|b| b.name() == name)
+                                .ok_or_else(|| format!("unknown benchmark: {}", name))
+                        })
+                        .collect::<Result<_, _>>()?
+                }
+                "--min-size" => options.min_size = number()?.max(1),
+                "--max-size" => options.max_size = number()?,
+                "--iterations" => options.iterations = number()?.max(1),
+                "--large-iterations" => options.large_iterations = number()?.max(1),
+                "--warmup" => options.warmup = Some(number()?),
+                "--window" => options.window = number()?.max(1),
+                "--label" => options.label = value,
+                "--json" => options.json = Some(value.into()),
+                "--csv" => options.csv = Some(value.into()),
+                _ => return Err(format!("unknown option: {}", arg)),
+            }
+        }
+        Ok(options)
+    }
+
+    /// Message sizes from `min_size` to `max_size` in powers of two, starting no lower than
+    /// `floor`.
+    fn sizes(&self, floor: usize) -> Vec<usize> {
+        let mut size = self.min_size.max(floor).next_power_of_two();
+        let mut sizes = Vec::new();
+        while size <= self.max_size {
+            sizes.push(size);
+            size *= 2;
+        }
+        sizes
+    }
+
+    /// Warmup and timed iterations for messages of `size` bytes.
+    fn iterations(&self, size: usize) -> (usize, usize) {
+        let iterations = if size >= LARGE_MESSAGE_SIZE {
+            self.large_iterations
+        } else {
+            self.iterations
+        };
+        (self.warmup.unwrap_or(iterations / 10), iterations)
+    }
+}
+
+/// One measurement. Point-to-point benchmarks are measured at one rank, so `min` and `max`
+/// equal `value`; collectives report the average, minimum and maximum over all ranks.
+struct Record {
+    benchmark: Benchmark,
+    size: usize,
+    iterations: usize,
+    value: f64,
+    min: f64,
+    max: f64,
+}
+
+impl Record {
+    fn new(benchmark: Benchmark, size: usize, iterations: usize, value: f64) -> Record {
+        Record {
+            benchmark,
+            size,
+            iterations,
+            value,
+            min: value,
+            max: value,
+        }
+    }
+}
+
+/// Ping-pong between ranks 0 and 1; half the round trip time.
+fn latency(world: &SimpleCommunicator, options: &Options) -> Vec<Record> {
+    let rank = world.rank();
+    let mut records = Vec::new();
+    for size in options.sizes(1) {
+        let (warmup, iterations) = options.iterations(size);
+        let mut buf = vec![b'a'; size];
+        world.barrier();
+        let mut start = mpi::time();
+        for i in 0..warmup + iterations {
+            if i == warmup {
+                start = mpi::time();
+            }
+            if rank == 0 {
+                world.process_at_rank(1).send(&buf[..]);
+                world.process_at_rank(1).receive_into(&mut buf[..]);
+            } else if rank == 1 {
+                world.process_at_rank(0).receive_into(&mut buf[..]);
+                world.process_at_rank(0).send(&buf[..]);
+            }
+        }
+        let elapsed = mpi::time() - start;
+        let latency = elapsed * 1e6 / (2 * iterations) as f64;
+        records.push(Record::new(Benchmark::Latency, size, iterations, latency));
+    }
+    records
+}
+
+/// Senders (the first `pairs` ranks) stream windows of non-blocking sends to their partners,
+/// which acknowledge each window. Returns the message size, the timed iterations and the
+/// longest time any sender took.
+fn stream(world: &SimpleCommunicator, options: &Options, pairs: i32) -> Vec<(usize, usize, f64)> {
+    let rank = world.rank();
+    let window = options.window;
+    let mut results = Vec::new();
+    for size in options.sizes(1) {
+        let (warmup, iterations) = options.iterations(size);
+        let sendbuf = vec![b'a'; size];
+        let mut recvbuf = vec![0u8; size * window];
+        let mut ack = 0u8;
+        world.barrier();
+        let mut start = mpi::time();
+        for i in 0..warmup + iterations {
+            if i == warmup {
+                start = mpi::time();
+            }
+            if rank < pairs {
+                let partner = world.process_at_rank(rank + pairs);
+                mpi::request::multiple_scope(window, |scope, coll| {
+                    for _ in 0..window {
+                        coll.add(partner.immediate_send(scope, &sendbuf[..]));
+                    }
+                    let mut completed = Vec::with_capacity(coll.incomplete());
+                    coll.wait_all(&mut completed);
+                });
+                partner.receive_into(&mut ack);
+            } else if rank < 2 * pairs {
+                let partner = world.process_at_rank(rank - pairs);
+                mpi::request::multiple_scope(window, |scope, coll| {
+                    for chunk in recvbuf.chunks_mut(size) {
+                        coll.add(partner.immediate_receive_into(scope, chunk));
+                    }
+                    let mut completed = Vec::with_capacity(coll.incomplete());
+                    coll.wait_all(&mut completed);
+                });
+                partner.send(&ack);
+            }
+        }
+        let elapsed = if rank < pairs {
+            mpi::time() - start
+        } else {
+            0.0
+        };
+        let mut longest = 0.0;
+        world.all_reduce_into(&elapsed, &mut longest, SystemOperation::max());
+        results.push((size, iterations, longest));
+    }
+    results
+}
+
+/// Unidirectional bandwidth from rank 0 to rank 1.
+fn bandwidth(world: &SimpleCommunicator, options: &Options) -> Vec<Record> {
+    stream(world, options, 1)
+        .into_iter()
+        .map(|(size, iterations, elapsed)| {
+            let bytes = (size * options.window * iterations) as f64;
+            Record::new(
+                Benchmark::Bandwidth,
+                size,
+                iterations,
+                bytes / elapsed / 1e6,
+            )
+        })
+        .collect()
+}
+
+/// Aggregate message rate of all pairs of ranks `r` and `r + size / 2`.
+fn message_rate(world: &SimpleCommunicator, options: &Options) -> Vec<Record> {
+    let pairs = world.size() / 2;
+    stream(world, options, pairs)
+        .into_iter()
+        .map(|(size, iterations, elapsed)| {
+            let messages = (pairs as usize * options.window * iterations) as f64;
+            Record::new(Benchmark::MessageRate, size, iterations, messages / elapsed)
+        })
+        .collect()
+}
+
+/// Ranks 0 and 1 stream windows of non-blocking sends to each other at the same time.
+fn bibw(world: &SimpleCommunicator, options: &Options) -> Vec<Record> {
+    let rank = world.rank();
+    let window = options.window;
+    let mut records = Vec::new();
+    for size in options.sizes(1) {
+        let (warmup, iterations) = options.iterations(size);
+        let sendbuf = vec![b'a'; size];
+        let mut recvbuf = vec![0u8; size * window];
+        world.barrier();
+        let mut start = mpi::time();
+        for i in 0..warmup + iterations {
+            if i == warmup {
+                start = mpi::time();
+            }
+            if rank < 2 {
+                let partner = world.process_at_rank(1 - rank);
+                mpi::request::multiple_scope(2 * window, |scope, coll| {
+                    for chunk in recvbuf.chunks_mut(size) {
+                        coll.add(partner.immediate_receive_into(scope, chunk));
+                    }
+                    for _ in 0..window {
+                        coll.add(partner.immediate_send(scope, &sendbuf[..]));
+                    }
+                    let mut completed = Vec::with_capacity(coll.incomplete());
+                    coll.wait_all(&mut completed);
+                });
+            }
+        }
+        let elapsed = mpi::time() - start;
+        let bytes = (2 * size * window * iterations) as f64;
+        records.push(Record::new(
+            Benchmark::BiBandwidth,
+            size,
+            iterations,
+            bytes / elapsed / 1e6,
+        ));
+    }
+    records
+}
+
+/// Time each call of a collective separately, with a barrier in between, and report the
+/// average, minimum and maximum over the ranks of the mean time per call.
+fn collective<B>(
+    world: &SimpleCommunicator,
+    options: &Options,
+    benchmark: Benchmark,
+    floor: usize,
+    mut buffers: impl FnMut(usize) -> B,
+    mut call: impl FnMut(&mut B),
+) -> Vec<Record> {
+    let mut records = Vec::new();
+    for size in options.sizes(floor) {
+        let (warmup, iterations) = options.iterations(size);
+        let mut bufs = buffers(size);
+        let mut total = 0.0;
+        world.barrier();
+        for i in 0..warmup + iterations {
+            let start = mpi::time();
+            call(&mut bufs);
+            let elapsed = mpi::time() - start;
+            if i >= warmup {
+                total += elapsed;
+            }
+            world.barrier();
+        }
+        let latency = total * 1e6 / iterations as f64;
+        let (mut sum, mut min, mut max) = (0.0, 0.0, 0.0);
+        world.all_reduce_into(&latency, &mut sum, SystemOperation::sum());
+        world.all_reduce_into(&latency, &mut min, SystemOperation::min());
+        world.all_reduce_into(&latency, &mut max, SystemOperation::max());
+        records.push(Record {
+            benchmark,
+            size,
+            iterations,
+            value: sum / world.size() as f64,
+            min,
+            max,
+        });
+    }
+    records
+}
+
+fn allreduce(world: &SimpleCommunicator, options: &Options) -> Vec<Record> {
+    let element = std::mem::size_of::<f32>();
+    collective(
+        world,
+        options,
+        Benchmark::Allreduce,
+        element,
+        |size| (vec![1.0f32; size / element], vec![0.0f32; size / element]),
+        |(send, recv)| world.all_reduce_into(&send[..], &mut recv[..], SystemOperation::sum()),
+    )
+}
+
+fn bcast(world: &SimpleCommunicator, options: &Options) -> Vec<Record> {
+    let root = world.process_at_rank(0);
+    collective(
+        world,
+        options,
+        Benchmark::Bcast,
+        1,
+        |size| vec![b'a'; size],
+        |buf| root.broadcast_into(&mut buf[..]),
+    )
+}
+
+/// All-to-all with `size` bytes for each pair of ranks.
+fn alltoall(world: &SimpleCommunicator, options: &Options) -> Vec<Record> {
+    let n = world.size() as usize;
+    collective(
+        world,
+        options,
+        Benchmark::Alltoall,
+        1,
+        |size| (vec![b'a'; size * n], vec![0u8; size * n]),
+        |(send, recv)| world.all_to_all_into(&send[..], &mut recv[..]),
+    )
+}
+
+fn print_table(records: &[Record], benchmark: Benchmark, processes: i32, label: &str) {
+    println!(
+        "# {} ({} processes, {})",
+        benchmark.name(),
+        processes,
+        label
+    );
+    let unit = benchmark.unit();
+    match benchmark {
+        Benchmark::Allreduce | Benchmark::Bcast | Benchmark::Alltoall => {
+            println!(
+                "# {:<10} {:>16} {:>16} {:>16}",
+                "Size",
+                format!("Avg ({})", unit),
+                format!("Min ({})", unit),
+                format!("Max ({})", unit)
+            );
+            for r in records {
+                println!(
+                    "{:<12} {:>16.2} {:>16.2} {:>16.2}",
+                    r.size, r.value, r.min, r.max
+                );
+            }
+        }
+        _ => {
+            println!("# {:<10} {:>16}", "Size", unit);
+            for r in records {
+                println!("{:<12} {:>16.2}", r.size, r.value);
+            }
+        }
+    }
+    println!();
+}
+
+fn json_string(s: &str) -> String {
+    let mut out = String::from("\"");
+    for c in s.chars() {
+        match c {
+            '"' => out.push_str("\\\""),
+            '\\' => out.push_str("\\\\"),
+            c if (c as u32) < 0x20 => write!(out, "\\u{:04x}", c as u32).unwrap(),
+            c => out.push(c),
+        }
+    }
+    out.push('"');
+    out
+}
+
+struct Run {
+    label: String,
+    library: String,
+    processes: i32,
+    records: Vec<Record>,
+}
+
+impl Run {
+    fn to_json(&self) -> String {
+        let mut out = String::new();
+        writeln!(out, "{{").unwrap();
+        writeln!(out, "  \"label\": {},", json_string(&self.label)).unwrap();
+        writeln!(out, "  \"backend\": {},", json_string(BACKEND)).unwrap();
+        writeln!(out, "  \"library\": {},", json_string(&self.library)).unwrap();
+        writeln!(out, "  \"processes\": {},", self.processes).unwrap();
+        writeln!(out, "  \"results\": [").unwrap();
+        for (i, r) in self.records.iter().enumerate() {
+            write!(
+                out,
+                "    {{\"benchmark\": {}, \"size\": {}, \"iterations\": {}, \"unit\": {}, \
+                 \"value\": {}, \"min\": {}, \"max\": {}}}",
+                json_string(r.benchmark.name()),
+                r.size,
+                r.iterations,
+                json_string(r.benchmark.unit()),
+                r.value,
+                r.min,
+                r.max
+            )
+            .unwrap();
+            out.push_str(if i + 1 < self.records.len() {
+                ",\n"
+            } else {
+                "\n"
+            });
+        }
+        writeln!(out, "  ]").unwrap();
+        writeln!(out, "}}").unwrap();
+        out
+    }
+
+    fn to_csv(&self) -> String {
+        let mut out =
+            String::from("label,backend,processes,benchmark,size,iterations,unit,value,min,max\n");
+        for r in &self.records {
+            writeln!(
+                out,
+                "{},{},{},{},{},{},{},{},{},{}",
+                self.label.replace(',', ";"),
+                BACKEND,
+                self.processes,
+                r.benchmark.name(),
+                r.size,
+                r.iterations,
+                r.benchmark.unit(),
+                r.value,
+                r.min,
+                r.max
+            )
+            .unwrap();
+        }
+        out
+    }
+}
+
+fn main() {
+    let options = Options::parse().unwrap_or_else(|err| {
+        eprintln!("osu: {}\n\n{}", err, USAGE);
+        process::exit(2);
+    });
+
+    let universe = mpi::initialize().unwrap();
+    let world = universe.world();
+    let rank = world.rank();
+    let size = world.size();
+
+    let library = mpi::environment::library_version()
+        .map(|v| v.lines().next().unwrap_or_default().trim().to_owned())
+        .unwrap_or_default();
+    let mut run = Run {
+        label: options.label.clone(),
+        library,
+        processes: size,
+        records: Vec::new(),
+    };
+
+    for &benchmark in &options.benchmarks {
+        let records = match benchmark {
+            Benchmark::Latency
+            | Benchmark::Bandwidth
+            | Benchmark::BiBandwidth
+            | Benchmark::MessageRate
+                if size < 2 =>
+            {
+                if rank == 0 {
+                    println!(
+                        "# {}: skipped, needs at least 2 processes\n",
+                        benchmark.name()
+                    );
+                }
+                continue;
+            }
+            Benchmark::Latency => latency(&world, &options),
+            Benchmark::Bandwidth => bandwidth(&world, &options),
+            Benchmark::BiBandwidth => bibw(&world, &options),
+            Benchmark::MessageRate => message_rate(&world, &options),
+            Benchmark::Allreduce => allreduce(&world, &options),
+            Benchmark::Bcast => bcast(&world, &options),
+            Benchmark::Alltoall => alltoall(&world, &options),
+        };
+        if rank == 0 {
+            print_table(&records, benchmark, size, &options.label);
+        }
+        run.records.extend(records);
+    }
+
+    if rank == 0 {
+        if let Some(path) = &options.json {
+            fs::write(path, run.to_json())
+                .unwrap_or_else(|err| panic!("cannot write {}: {}", path.display(), err));
+        }
+        if let Some(path) = &options.csv {
+            fs::write(path, run.to_csv())
+                .unwrap_or_else(|err| panic!("cannot write {}: {}", path.display(), err));
+        }
+    }
+}
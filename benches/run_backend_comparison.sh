@@ -0,0 +1,63 @@
+#!/bin/bash
+# Run the OSU-style benchmarks with both backends and compare the results.
+#
+# Builds benches/osu.rs once with mpi-sys-backend and once with
+# mpi-rt-sys-backend, runs each under mpiexec against the same MPI
+# implementation, and writes JSON and CSV results plus a Markdown report.
+#
+# Prerequisites:
+#   - MPI implementation (MPICH or OpenMPI) with mpiexec in PATH
+#   - MPI_RT_LIB set to the shared library of that implementation
+#   - Python 3 for the report
+#
+# Usage:
+#   bash benches/run_backend_comparison.sh [--np N] [--out DIR] [-- OSU_OPTIONS...]
+#
+# OSU_OPTIONS are passed to the benchmark, e.g. -- --max-size 65536 --benchmarks latency,allreduce
+
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+PROJECT_DIR="$(cd "$SCRIPT_DIR/.." && pwd)"
+
+NP=2
+OUT_DIR="$PROJECT_DIR/target/backend-comparison"
+while [[ $# -gt 0 ]]; do
+    case $1 in
+        --np) NP="$2"; shift 2 ;;
+        --out) OUT_DIR="$2"; shift 2 ;;
+        --) shift; break ;;
+        *) echo "Unknown option: $1"; exit 1 ;;
+    esac
+done
+
+if [ -z "${MPI_RT_LIB:-}" ]; then
+    echo "MPI_RT_LIB must point to the MPI library used by mpiexec"
+    exit 1
+fi
+
+mkdir -p "$OUT_DIR"
+
+# Build the benchmark and print the path of the executable
+build() {
+    cargo bench --manifest-path "$PROJECT_DIR/Cargo.toml" "$@" \
+        --bench osu --no-run --message-format=json \
+        | sed -n 's/.*"executable":"\([^"]*\)".*/\1/p' | tail -n 1
+}
+
+for BACKEND in mpi-sys-backend mpi-rt-sys-backend; do
+    echo "=== Building (backend: $BACKEND) ==="
+    if [ "$BACKEND" = "mpi-rt-sys-backend" ]; then
+        BIN=$(build --no-default-features --features "$BACKEND")
+    else
+        BIN=$(build --features "$BACKEND")
+    fi
+    echo "=== Running on $NP processes (backend: $BACKEND) ==="
+    mpiexec -n "$NP" "$BIN" --label "$BACKEND" \
+        --json "$OUT_DIR/$BACKEND.json" --csv "$OUT_DIR/$BACKEND.csv" "$@"
+done
+
+python3 "$SCRIPT_DIR/compare_backends.py" \
+    "$OUT_DIR/mpi-sys-backend.json" "$OUT_DIR/mpi-rt-sys-backend.json" \
+    -o "$OUT_DIR/report.md"
+echo "=== Report written to $OUT_DIR/report.md ==="
@@ -0,0 +1,59 @@
+#!/bin/sh
+
+# Run the examples with the mpi-rt-sys backend against the mpi-loopback library.
+# Arguments are passed to cargo when building the examples.
+
+set -e
+
+# Examples that use features mpi-loopback does not implement
+SKIP="all_to_all_w cartesian cartesian_map distributed_graph neighbor_collectives partitioned persistent_collectives spawn spawn_multiple"
+# Examples that need synchronous sends to complete only once matched; mpi-loopback sends eagerly
+SKIP="${SKIP} sparse_exchange"
+
+EXAMPLES_DIR="examples"
+
+cargo build -p mpi-loopback
+cargo build "$@" --examples
+
+target_dir=$(cargo metadata --format-version 1 --no-deps | sed 's/.*"target_directory":"\([^"]*\)".*/\1/')
+export MPI_RT_LIB="${target_dir}/debug/libmpi_loopback.so"
+
+examples=$(ls ${EXAMPLES_DIR} | sed "s/\\.rs\$//")
+
+maxnp=3
+
+num_ok=0
+num_failed=0
+result="ok"
+
+for example in ${examples}
+do
+  case " ${SKIP} " in
+    *" ${example} "*) continue ;;
+  esac
+  binary="${target_dir}/debug/examples/${example}"
+  # Examples whose required features are not enabled are not built
+  [ -x "${binary}" ] || continue
+  printf "example ${example} on 2...${maxnp} processes"
+  output_file="/tmp/${example}_output"
+  for num_proc in $(seq 2 ${maxnp})
+  do
+    if (MPI_LOOPBACK_NP=${num_proc} timeout 120 "${binary}" > "${output_file}" 2>&1)
+    then
+      printf "."
+      rm -f "${output_file}"
+    else
+      printf " failed on %d processes.\noutput:\n" ${num_proc}
+      cat "${output_file}"
+      rm -f "${output_file}"
+      num_failed=$((${num_failed} + 1))
+      result="failed"
+      continue 2
+    fi
+  done
+  printf " ok.\n"
+  num_ok=$((${num_ok} + 1))
+done
+
+printf "\nexample result: ${result}. ${num_ok} passed; ${num_failed} failed\n\n"
+exit ${num_failed}
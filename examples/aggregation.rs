@@ -0,0 +1,69 @@
+#![deny(warnings)]
+
+use mpi::{
+    aggregation::{Aggregator, FlushPolicy},
+    traits::*,
+};
+
+const RECORDS: u64 = 1000;
+const EPOCHS: u64 = 3;
+
+/// Pack the sending rank, the epoch and the index of a record into one `u64`
+fn encode(rank: u64, epoch: u64, i: u64) -> u64 {
+    (rank << 32) | (epoch << 16) | i
+}
+
+fn decode(record: u64) -> (u64, u64, u64) {
+    (record >> 32, (record >> 16) & 0xffff, record & 0xffff)
+}
+
+fn main() {
+    let universe = mpi::initialize().unwrap();
+    let world = universe.world();
+    let rank = world.rank();
+    let size = world.size();
+
+    let policy = FlushPolicy {
+        max_records: 64,
+        ..FlushPolicy::default()
+    };
+    let mut aggregator = Aggregator::<_, u64>::new(&world, 7, policy);
+
+    for epoch in 0..EPOCHS {
+        let mut received = vec![0u64; size as usize];
+        let mut check = |source: mpi::Rank, records: &[u64]| {
+            for &record in records {
+                let (from, e, i) = decode(record);
+                assert_eq!(from, source as u64);
+                assert_eq!(e, epoch);
+                assert_eq!(i % size as u64, rank as u64);
+            }
+            received[source as usize] += records.len() as u64;
+        };
+
+        for i in 0..RECORDS {
+            aggregator.push(
+                (i % size as u64) as mpi::Rank,
+                encode(rank as u64, epoch, i),
+            );
+            if i % 100 == 0 {
+                while let Some(batch) = aggregator.poll() {
+                    check(batch.source(), &batch);
+                }
+            }
+        }
+        for batch in aggregator.end_epoch() {
+            check(batch.source(), &batch);
+        }
+        assert_eq!(aggregator.epoch(), epoch + 1);
+
+        let expected = (0..RECORDS)
+            .filter(|i| i % size as u64 == rank as u64)
+            .count() as u64;
+        assert!(received.iter().all(|&n| n == expected));
+    }
+
+    // Buffers of sent and received batches are reused.
+    let stats = aggregator.pool().stats();
+    assert!(stats.hits > 0);
+}
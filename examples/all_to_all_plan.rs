@@ -0,0 +1,93 @@
+#![deny(warnings)]
+
+use mpi::{collective::SystemOperation, traits::*, Count, Rank};
+
+/// The count of elements `from` sends to `to`
+fn count(from: Rank, to: Rank) -> Count {
+    (from + 2 * to) % 3 + 1
+}
+
+fn main() {
+    let universe = mpi::initialize().unwrap();
+    let world = universe.world();
+    let rank = world.rank();
+    let size = world.size();
+
+    // Exchange the counts once, then run the exchange with new data every iteration.
+    let send_counts: Vec<Count> = (0..size).map(|to| count(rank, to)).collect();
+    let plan = world.all_to_all_plan(&send_counts);
+    assert_eq!(
+        plan.recv_layout().counts(),
+        (0..size).map(|from| count(from, rank)).collect::<Vec<_>>()
+    );
+    let expected = |iteration: Rank| -> Vec<Rank> {
+        (0..size)
+            .flat_map(|from| {
+                std::iter::repeat(iteration * 10000 + from * 100 + rank)
+                    .take(count(from, rank) as usize)
+            })
+            .collect()
+    };
+    let mut y = vec![0; plan.recv_layout().len()];
+    for iteration in 0..3 {
+        let x: Vec<Rank> = (0..size)
+            .flat_map(|to| {
+                std::iter::repeat(iteration * 10000 + rank * 100 + to)
+                    .take(count(rank, to) as usize)
+            })
+            .collect();
+        assert_eq!(x.len(), plan.send_layout().len());
+        if iteration == 2 {
+            mpi::request::scope(|scope| {
+                plan.immediate_all_to_all_into(scope, &x[..], &mut y[..])
+                    .wait();
+            });
+        } else {
+            plan.all_to_all_into(&x[..], &mut y[..]);
+        }
+        assert_eq!(y, expected(iteration));
+    }
+
+    // Layouts for all-gather, gather and scatter with varying counts
+    let x = vec![rank; rank as usize + 1];
+    let layout = world.all_gather_layout(rank + 1);
+    let mut all = vec![-1; layout.len()];
+    world.all_gather_varcount_into(&x[..], &mut layout.partition_mut(&mut all[..]));
+    let expected: Vec<Rank> = (0..size)
+        .flat_map(|r| std::iter::repeat(r).take(r as usize + 1))
+        .collect();
+    assert_eq!(all, expected);
+
+    let root = world.process_at_rank(0);
+    let mut back = vec![-1; rank as usize + 1];
+    if rank == 0 {
+        let layout = root.gather_layout_root(rank + 1);
+        let mut gathered = vec![-1; layout.len()];
+        root.gather_varcount_into_root(&x[..], &mut layout.partition_mut(&mut gathered[..]));
+        assert_eq!(gathered, expected);
+        root.scatter_varcount_into_root(&layout.partition(&gathered[..]), &mut back[..]);
+    } else {
+        root.gather_layout(rank + 1);
+        root.gather_varcount_into(&x[..]);
+        root.scatter_varcount_into(&mut back[..]);
+    }
+    assert_eq!(back, x);
+
+    // Process i receives a block of i + 1 elements of the sum.
+    let recv_counts: Vec<Count> = (1..=size).collect();
+    let plan = world.reduce_scatter_plan(&recv_counts);
+    let x: Vec<Rank> = (0..plan.layout().len() as Rank).map(|i| rank + i).collect();
+    let mut sum = vec![0; rank as usize + 1];
+    plan.reduce_scatter_into(&x[..], &mut sum[..], SystemOperation::sum());
+    let first = plan.layout().displs()[rank as usize];
+    let ranks: Rank = (0..size).sum();
+    for (i, &s) in sum.iter().enumerate() {
+        assert_eq!(s, ranks + size * (first + i as Rank));
+    }
+    let mut sum2 = vec![0; rank as usize + 1];
+    mpi::request::scope(|scope| {
+        plan.immediate_reduce_scatter_into(scope, &x[..], &mut sum2[..], SystemOperation::sum())
+            .wait();
+    });
+    assert_eq!(sum, sum2);
+}
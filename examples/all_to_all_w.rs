@@ -0,0 +1,55 @@
+#![deny(warnings)]
+
+use std::mem::size_of;
+
+use mpi::{
+    collective::TypedBlock,
+    datatype::{Equivalence, UserDatatype},
+    traits::*,
+    Count,
+};
+
+fn main() {
+    let universe = mpi::initialize().unwrap();
+    let world = universe.world();
+    let rank = world.rank();
+    let size = world.size();
+    let n = size as usize;
+
+    // Every process sends row `i` of an `n` x `n` matrix to process `i` and receives the rows as
+    // the columns of its receive matrix.
+    let column = UserDatatype::vector(size, 1, size, &i32::equivalent_datatype());
+    let row = i32::equivalent_datatype();
+    let elem = size_of::<i32>() as Count;
+    let sends: Vec<TypedBlock> = (0..size)
+        .map(|i| TypedBlock {
+            count: size,
+            displ: i * size * elem,
+            datatype: row,
+        })
+        .collect();
+    let recvs: Vec<TypedBlock> = (0..size)
+        .map(|i| TypedBlock {
+            count: 1,
+            displ: i * elem,
+            datatype: column.as_ref(),
+        })
+        .collect();
+    let plan = world.all_to_all_w_plan(&sends, &recvs);
+
+    for iteration in 0..2 {
+        let x: Vec<i32> = (0..n * n)
+            .map(|k| iteration * 10000 + rank * 100 + k as i32)
+            .collect();
+        let mut y = vec![-1; n * n];
+        // The blocks lie within the `n` x `n` matrices.
+        unsafe { plan.all_to_all_w_into(&x[..], &mut y[..]) };
+        for j in 0..n {
+            for i in 0..n {
+                // Element j of the row sent by process i
+                let expected = iteration * 10000 + i as i32 * 100 + (rank as usize * n + j) as i32;
+                assert_eq!(y[j * n + i], expected);
+            }
+        }
+    }
+}
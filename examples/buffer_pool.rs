@@ -0,0 +1,56 @@
+#![deny(warnings)]
+
+use mpi::{buffer_pool::BufferPool, traits::*};
+
+const ROUNDS: usize = 20;
+
+fn main() {
+    let universe = mpi::initialize().unwrap();
+    let world = universe.world();
+    let rank = world.rank();
+    let size = world.size();
+    let next = world.process_at_rank((rank + 1) % size);
+    let previous = world.process_at_rank((rank + size - 1) % size);
+
+    let pool = BufferPool::new(1 << 20);
+
+    // Messages of varying size land in buffers reused from the pool
+    for i in 0..ROUNDS {
+        let msg: Vec<u64> = (0..(i % 5) * 100 + 1).map(|j| j as u64).collect();
+        mpi::request::scope(|scope| {
+            let sreq = next.immediate_send(scope, &msg[..]);
+            let (received, status) = previous.receive_vec_pooled::<u64>(&pool);
+            assert_eq!(status.source_rank(), previous.rank());
+            assert_eq!(received, msg);
+            pool.put(received);
+            sreq.wait();
+        });
+    }
+
+    // Matched probes and receive futures can use the same pool
+    for i in 0..ROUNDS {
+        let msg = [rank as f64; 3];
+        let x = i as u64;
+        mpi::request::scope(|scope| {
+            let sreq = next.immediate_send(scope, &msg[..]);
+            let (received, _) = previous
+                .matched_probe()
+                .matched_receive_vec_pooled::<f64>(&pool);
+            assert_eq!(received, [previous.rank() as f64; 3]);
+            pool.put(received);
+            sreq.wait();
+
+            let sreq = next.immediate_send(scope, &x);
+            let (y, _) = previous.immediate_receive_pooled::<u64>(&pool).get();
+            assert_eq!(y, x);
+            sreq.wait();
+        });
+    }
+
+    let stats = pool.stats();
+    assert_eq!(stats.hits + stats.misses, 3 * ROUNDS as u64);
+    assert!(stats.hit_rate() > 0.5);
+    assert!(stats.bytes_held > 0);
+    pool.clear();
+    assert_eq!(pool.stats().bytes_held, 0);
+}
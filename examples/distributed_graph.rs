@@ -0,0 +1,81 @@
+#![deny(warnings)]
+
+use mpi::{topology::IntoTopology, traits::*, Rank};
+
+fn main() {
+    let universe = mpi::initialize().unwrap();
+    let world = universe.world();
+    let size = world.size();
+    let rank = world.rank();
+    let left = (rank + size - 1) % size;
+    let right = (rank + 1) % size;
+
+    // A directed, weighted ring: every process receives from its left and sends to its right
+    // neighbor.
+    let ring = world.create_distributed_graph_communicator_adjacent(
+        &[left],
+        &[right],
+        Some((&[left + 1], &[rank + 1])),
+        false,
+    );
+    assert_eq!(ring.rank(), rank);
+    assert_eq!(ring.sources(), [left]);
+    assert_eq!(ring.destinations(), [right]);
+    assert!(ring.is_weighted());
+    assert_eq!(ring.source_weights(), Some(&[left + 1][..]));
+    assert_eq!(ring.destination_weights(), Some(&[rank + 1][..]));
+    assert_eq!(ring.neighbor_degrees(), (1, 1));
+
+    let mut received = -1;
+    ring.neighbor_all_to_all_into(&rank, &mut received);
+    assert_eq!(received, left);
+
+    // The topology and the neighbors survive duplication.
+    match ring.duplicate().into_topology() {
+        IntoTopology::DistributedGraph(dup) => {
+            assert_eq!(dup.sources(), ring.sources());
+            assert_eq!(dup.destinations(), ring.destinations());
+        }
+        _ => panic!("duplicate of a distributed graph communicator lost its topology"),
+    }
+
+    // A star read in by the root: the root contributes all edges, between itself and every other
+    // process in both directions.
+    let edges: Vec<(Rank, Rank)> = if rank == 0 {
+        (1..size).flat_map(|r| [(0, r), (r, 0)]).collect()
+    } else {
+        Vec::new()
+    };
+    let star = world.create_distributed_graph_communicator(&edges, None, false);
+    assert!(!star.is_weighted());
+    assert_eq!(star.source_weights(), None);
+    if rank == 0 {
+        let mut leaves = star.sources().to_vec();
+        leaves.sort_unstable();
+        assert_eq!(leaves, (1..size).collect::<Vec<_>>());
+        let mut leaves = star.destinations().to_vec();
+        leaves.sort_unstable();
+        assert_eq!(leaves, (1..size).collect::<Vec<_>>());
+    } else {
+        assert_eq!(star.sources(), [0]);
+        assert_eq!(star.destinations(), [0]);
+    }
+
+    let mut gathered = vec![-1; star.sources().len()];
+    star.neighbor_all_gather_into(&(star.rank() * 10), &mut gathered[..]);
+    let expected: Vec<Rank> = star.sources().iter().map(|&r| r * 10).collect();
+    assert_eq!(gathered, expected);
+
+    // With reordering, MPI may assign new ranks, but every process keeps its two neighbors.
+    let ring = world.create_distributed_graph_communicator_adjacent(
+        &[left, right],
+        &[left, right],
+        Some((&[1, 10], &[10, 1])),
+        true,
+    );
+    assert_eq!(ring.size(), size);
+    assert_eq!(ring.neighbor_degrees(), (2, 2));
+    let mut received = [-1; 2];
+    ring.neighbor_all_gather_into(&ring.rank(), &mut received[..]);
+    assert_eq!(received, ring.sources());
+}
@@ -0,0 +1,52 @@
+#![deny(warnings)]
+
+use mpi::{collective::SystemOperation, hierarchy::HierarchicalCommunicator, traits::*, Rank};
+
+fn main() {
+    let universe = mpi::initialize().unwrap();
+    let mut world = universe.world();
+    let size = world.size();
+    let rank = world.rank();
+
+    let num_nodes = {
+        let hier = HierarchicalCommunicator::new(&mut world);
+        assert_eq!(hier.leaders().is_some(), hier.node().rank() == 0);
+        hier.num_nodes()
+    };
+
+    // Wrapping the communicator again reuses the cached node and leader communicators.
+    let hier = HierarchicalCommunicator::new(&mut world);
+    assert_eq!(hier.num_nodes(), num_nodes);
+    assert_eq!(hier.communicator().size(), size);
+
+    hier.barrier();
+
+    for root in 0..size {
+        let mut x = if rank == root { [root, 42] } else { [-1, -1] };
+        hier.broadcast_into(root, &mut x[..]);
+        assert_eq!(x, [root, 42]);
+    }
+
+    let mut sum = [0; 3];
+    hier.all_reduce_into(
+        &[rank, 1, 2 * rank][..],
+        &mut sum[..],
+        SystemOperation::sum(),
+    );
+    let ranks: Rank = (0..size).sum();
+    assert_eq!(sum, [ranks, size, 2 * ranks]);
+
+    let mut max = 0;
+    hier.all_reduce_into(&rank, &mut max, SystemOperation::max());
+    assert_eq!(max, size - 1);
+
+    let mut all = vec![0.0; size as usize];
+    hier.all_gather_into(&[f64::from(rank) / 2.0], &mut all[..]);
+    assert!(all.iter().zip(0..).all(|(&x, r)| x == f64::from(r) / 2.0));
+
+    let mut blocks = vec![0; 2 * size as usize];
+    hier.all_gather_into(&[rank, -rank], &mut blocks[..]);
+    assert!(blocks.chunks(2).zip(0..).all(|(b, r)| b == [r, -r]));
+
+    hier.barrier();
+}
@@ -3,6 +3,7 @@ use mpi::request::{RequestCollection, Scope};
 use mpi::{traits::*, Rank};
 
 const COUNT: usize = 128;
+const WINDOW: usize = 8;
 
 /// Send and receive COUNT number of immediate requests.
 fn send_recv<'a, S: Scope<'a> + Copy>(
@@ -89,4 +90,65 @@ fn main() {
         let buf: Vec<[i32; 4]> = complete.iter().map(|elm| *elm.2).collect();
         check_result_buffer(&x, buf);
     });
+
+    // Completion without statuses
+    let mut recv: Vec<[i32; 4]> = vec![[0, 0, 0, 0]; COUNT];
+    mpi::request::multiple_scope(2 * COUNT, |scope, coll| {
+        send_recv(&world, scope, coll, next_proc, prev_proc, &x, &mut recv);
+
+        let mut completed = 0;
+        if coll.wait_any_without_status().is_some() {
+            completed += 1;
+        }
+        completed += coll.wait_some_without_status(|_, _| ());
+        while coll.test_any_without_status().is_some() {
+            completed += 1;
+        }
+        completed += coll.test_some_without_status(|_, _| ());
+        assert_eq!(completed + coll.incomplete(), 2 * COUNT);
+        if coll.incomplete() % 2 == 0 {
+            coll.wait_all_without_status();
+        } else {
+            while !coll.test_all_without_status() {}
+        }
+        assert_eq!(coll.incomplete(), 0);
+    });
+    assert_eq!(recv, x);
+
+    // Keep a window of requests in flight and replace every request that completes. The slots of
+    // completed requests are reused, so the collection does not grow beyond the window.
+    let mut recv: Vec<[i32; 4]> = vec![[0, 0, 0, 0]; COUNT];
+    mpi::request::multiple_scope(2 * WINDOW, |scope, coll| {
+        let next = world.process_at_rank(next_proc);
+        let prev = world.process_at_rank(prev_proc);
+        let mut sends = x.iter();
+        let mut receives = recv.iter_mut();
+        for _ in 0..WINDOW {
+            coll.add(next.immediate_send(scope, sends.next().unwrap()));
+            coll.add(prev.immediate_receive_into(scope, receives.next().unwrap()));
+        }
+
+        let mut complete = vec![];
+        let mut buf = vec![];
+        let mut send_next = true;
+        while coll.incomplete() > 0 {
+            coll.wait_some(&mut complete);
+            for &(slot, _, data) in complete.iter() {
+                assert!(slot < 2 * WINDOW);
+                buf.push(*data);
+            }
+            for _ in 0..complete.len() {
+                send_next = !send_next;
+                let send = if send_next { sends.next() } else { None };
+                if let Some(elm) = send {
+                    coll.add(next.immediate_send(scope, elm));
+                } else if let Some(elm) = receives.next() {
+                    coll.add(prev.immediate_receive_into(scope, elm));
+                } else if let Some(elm) = sends.next() {
+                    coll.add(next.immediate_send(scope, elm));
+                }
+            }
+        }
+        check_result_buffer(&x, buf);
+    });
 }
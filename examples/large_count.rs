@@ -0,0 +1,61 @@
+#![deny(warnings)]
+
+use mpi::{
+    datatype::{LargePartition, LargePartitionMut},
+    traits::*,
+    Address, LargeCount,
+};
+
+fn main() {
+    let universe = mpi::initialize().unwrap();
+    let world = universe.world();
+
+    let rank = world.rank();
+    let size = world.size();
+
+    // Partitions given in `LargeCount`s always use the large-count variants of the MPI functions.
+    let counts: Vec<LargeCount> = (0..LargeCount::from(size)).collect();
+    let displs: Vec<Address> = (0..size as Address).map(|r| r * (r - 1) / 2).collect();
+
+    let msg: Vec<_> = (0..rank).collect();
+    let mut buf = vec![0; (size * (size - 1) / 2) as usize];
+    {
+        let mut partition = LargePartitionMut::new(&mut buf[..], &counts[..], &displs[..]);
+        world.all_gather_varcount_into(&msg[..], &mut partition);
+    }
+    assert!(buf
+        .iter()
+        .zip((0..size).flat_map(|r| 0..r))
+        .all(|(&i, j)| i == j));
+
+    let root_process = world.process_at_rank(0);
+    let mut received = vec![0; rank as usize];
+    if rank == 0 {
+        let partition = LargePartition::new(&buf[..], &counts[..], &displs[..]);
+        root_process.scatter_varcount_into_root(&partition, &mut received[..]);
+    } else {
+        root_process.scatter_varcount_into(&mut received[..]);
+    }
+    assert_eq!(received, msg);
+
+    // Buffers longer than `Count::MAX` elements are sent with `MPI_Send_c`/`MPI_Recv_c`. That
+    // needs more than 2 GiB per process, so it only runs on request.
+    if std::env::var_os("RSMPI_LARGE_COUNT_MESSAGE").is_some() && size >= 2 {
+        let len = mpi::Count::MAX as usize + 16;
+        if rank == 0 {
+            let mut data = vec![0u8; len];
+            data[len - 1] = 42;
+            world.process_at_rank(1).send(&data[..]);
+        } else if rank == 1 {
+            let (data, status) = world.process_at_rank(0).receive_vec::<u8>();
+            assert_eq!(data.len(), len);
+            assert_eq!(
+                status.large_count(u8::equivalent_datatype()),
+                len as LargeCount
+            );
+            assert_eq!(data[len - 1], 42);
+        }
+    }
+
+    println!("Process {} got message {:?}", rank, received);
+}
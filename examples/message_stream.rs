@@ -0,0 +1,78 @@
+#![deny(warnings)]
+
+use std::{
+    pin::Pin,
+    sync::Arc,
+    task::{Context, Poll, Wake},
+};
+
+use mpi::{buffer_pool::BufferPool, traits::*};
+
+const TASKS: u32 = 50;
+const TAG: mpi::Tag = 3;
+
+struct NoopWaker;
+
+impl Wake for NoopWaker {
+    fn wake(self: Arc<Self>) {}
+}
+
+fn main() {
+    let universe = mpi::initialize().unwrap();
+    let world = universe.world();
+    let rank = world.rank();
+    let size = world.size();
+    let root = world.process_at_rank(0);
+    let any = world.any_process();
+
+    // Every process, the root included, sends results of varying length to the root.
+    let results: Vec<Vec<u32>> = (0..TASKS)
+        .map(|i| vec![rank as u32 * 1000 + i; i as usize % 7 + 1])
+        .collect();
+    let last = [rank as u32];
+    mpi::request::multiple_scope(results.len() + 1, |scope, coll| {
+        for result in &results {
+            coll.add(root.immediate_send_with_tag(scope, &result[..], TAG));
+        }
+
+        if rank == 0 {
+            let pool = BufferPool::new(1 << 20);
+            let mut stream = any.message_stream_with_tag::<u32>(4, TAG).with_pool(&pool);
+            assert_eq!(stream.depth(), 4);
+            let mut received = vec![0u32; size as usize];
+            for (msg, status) in stream.by_ref().take((TASKS * size as u32) as usize) {
+                let source = status.source_rank();
+                let i = msg[0] - source as u32 * 1000;
+                assert_eq!(msg.len(), i as usize % 7 + 1);
+                assert!(msg.iter().all(|&x| x == msg[0]));
+                assert_eq!(status.tag(), TAG);
+                received[source as usize] += 1;
+                pool.put(msg);
+            }
+            assert!(received.iter().all(|&n| n == TASKS));
+            assert_eq!(stream.in_flight(), 0);
+            assert!(stream.finish().is_empty());
+            assert!(pool.stats().hits > 0);
+        }
+        coll.wait_all_without_status();
+
+        // Poll for one final message per process, as an asynchronous stream would.
+        coll.add(root.immediate_send_with_tag(scope, &last[..], TAG + 1));
+        if rank == 0 {
+            let mut stream = any.message_stream::<u32>(2);
+            let waker = Arc::new(NoopWaker).into();
+            let mut cx = Context::from_waker(&waker);
+            let mut sources = Vec::new();
+            while sources.len() < size as usize {
+                if let Poll::Ready(Some((msg, status))) = Pin::new(&mut stream).poll_next(&mut cx) {
+                    assert_eq!(msg, [status.source_rank() as u32]);
+                    assert_eq!(status.tag(), TAG + 1);
+                    sources.push(status.source_rank());
+                }
+            }
+            sources.sort_unstable();
+            assert_eq!(sources, (0..size).collect::<Vec<_>>());
+        }
+        coll.wait_all_without_status();
+    });
+}
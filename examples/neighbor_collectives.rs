@@ -0,0 +1,74 @@
+#![deny(warnings)]
+
+use mpi::{datatype::PartitionMut, traits::*, Count};
+
+fn main() {
+    let universe = mpi::initialize().unwrap();
+    let world = universe.world();
+    let size = world.size();
+
+    // A periodic ring: the neighbors of every process are the one to its left and the one to its
+    // right, in that order.
+    let ring = world
+        .create_cartesian_communicator(&[size], &[true], false)
+        .unwrap();
+    let rank = ring.rank();
+    let (left, right) = ring.shift(0, 1);
+    let (left, right) = (left.unwrap(), right.unwrap());
+    assert_eq!(ring.neighbor_degrees(), (2, 2));
+
+    let mut ranks = [-1; 2];
+    ring.neighbor_all_gather_into(&rank, &mut ranks[..]);
+    assert_eq!(ranks, [left, right]);
+
+    // Halo exchange: send the first element to the left and the last element to the right, and
+    // receive the left halo from the left neighbor and the right halo from the right neighbor.
+    let interior = [rank * 10, rank * 10 + 1, rank * 10 + 2];
+    let boundary = [interior[0], interior[2]];
+    let mut halo = [-1; 2];
+    ring.neighbor_all_to_all_into(&boundary[..], &mut halo[..]);
+    assert_eq!(halo, [left * 10 + 2, right * 10]);
+
+    let mut halo = [-1; 2];
+    mpi::request::scope(|scope| {
+        ring.immediate_neighbor_all_to_all_into(scope, &boundary[..], &mut halo[..])
+            .wait();
+    });
+    assert_eq!(halo, [left * 10 + 2, right * 10]);
+
+    // Send `rank + 1` elements to the right neighbor and nothing to the left neighbor.
+    let msg = vec![rank; (rank + 1) as usize];
+    let send_counts: [Count; 2] = [0, rank + 1];
+    let send_displs: [Count; 2] = [0, 0];
+    let recv_counts: [Count; 2] = [left + 1, 0];
+    let recv_displs: [Count; 2] = [0, left + 1];
+    let mut buf = vec![-1; (left + 1) as usize];
+    {
+        let send = mpi::datatype::Partition::new(&msg[..], &send_counts[..], &send_displs[..]);
+        let mut recv = PartitionMut::new(&mut buf[..], &recv_counts[..], &recv_displs[..]);
+        ring.neighbor_all_to_all_varcount_into(&send, &mut recv);
+    }
+    assert!(buf.iter().all(|&x| x == left));
+
+    let counts: [Count; 2] = [left + 1, right + 1];
+    let displs: [Count; 2] = [0, left + 1];
+    let mut gathered = vec![-1; (left + right + 2) as usize];
+    let mut recv = PartitionMut::new(&mut gathered[..], &counts[..], &displs[..]);
+    mpi::request::scope(|scope| {
+        ring.immediate_neighbor_all_gather_varcount_into(scope, &msg[..], &mut recv)
+            .wait();
+    });
+    let (from_left, from_right) = gathered.split_at((left + 1) as usize);
+    assert!(from_left.iter().all(|&x| x == left));
+    assert!(from_right.iter().all(|&x| x == right));
+
+    // Without periodicity, the processes at the ends of the line have only one neighbor and the
+    // blocks for the missing one are left untouched.
+    let line = world
+        .create_cartesian_communicator(&[size], &[false], false)
+        .unwrap();
+    let (left, right) = line.shift(0, 1);
+    let mut ranks = [-1; 2];
+    line.neighbor_all_gather_into(&rank, &mut ranks[..]);
+    assert_eq!(ranks, [left.unwrap_or(-1), right.unwrap_or(-1)]);
+}
@@ -0,0 +1,55 @@
+#![deny(warnings)]
+
+use std::thread;
+
+use mpi::{traits::*, Threading};
+
+const PARTITIONS: usize = 4;
+const PARTITION_LEN: usize = 1000;
+const ITERATIONS: usize = 3;
+
+fn main() {
+    let (universe, threading) = mpi::initialize_with_threading(Threading::Multiple).unwrap();
+    let world = universe.world();
+    let rank = world.rank() as usize;
+    let size = world.size();
+    let next = world.process_at_rank((world.rank() + 1) % size);
+    let previous = world.process_at_rank((world.rank() + size - 1) % size);
+
+    let mut x = vec![0usize; PARTITIONS * PARTITION_LEN];
+    let mut y = vec![0usize; PARTITIONS * PARTITION_LEN];
+    mpi::request::scope(|scope| {
+        let mut sreq = next.partitioned_send_init(scope, &mut x[..], PARTITIONS);
+        let mut rreq = previous.partitioned_receive_init(scope, &mut y[..], PARTITIONS);
+        assert_eq!(sreq.partitions(), PARTITIONS);
+
+        for i in 0..ITERATIONS {
+            rreq.start();
+            let fill = |mut partition: mpi::request::SendPartition<usize>| {
+                let value = rank * 1000 + i * 10 + partition.index();
+                partition.fill(value);
+                partition.ready();
+            };
+            if threading == Threading::Multiple {
+                // Each partition is computed and marked ready by its own thread
+                thread::scope(|s| {
+                    for partition in sreq.start() {
+                        s.spawn(move || fill(partition));
+                    }
+                });
+            } else {
+                sreq.start().into_iter().for_each(fill);
+            }
+
+            while !(0..PARTITIONS).all(|p| rreq.arrived(p)) {}
+            let sender = previous.rank() as usize;
+            for p in 0..PARTITIONS {
+                let expected = sender * 1000 + i * 10 + p;
+                assert!(rreq.partition(p).unwrap().iter().all(|&v| v == expected));
+            }
+            rreq.wait();
+            sreq.wait();
+            assert_eq!(rreq.buffer()[0], sender * 1000 + i * 10);
+        }
+    });
+}
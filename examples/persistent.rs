@@ -0,0 +1,55 @@
+#![deny(warnings)]
+
+use mpi::{request::PersistentRequestCollection, traits::*};
+
+const ITERATIONS: i32 = 10;
+
+fn main() {
+    let universe = mpi::initialize().unwrap();
+    let world = universe.world();
+    let rank = world.rank();
+    let size = world.size();
+    let next = world.process_at_rank((rank + 1) % size);
+    let previous = world.process_at_rank((rank + size - 1) % size);
+
+    let mut x = vec![0; 4];
+    let mut y = vec![0; 4];
+    mpi::request::scope(|scope| {
+        let mut sreq = next.send_init(scope, &mut x[..]);
+        let mut rreq = previous.receive_init(scope, &mut y[..]);
+        for i in 0..ITERATIONS {
+            sreq.buffer_mut().fill(rank * ITERATIONS + i);
+            rreq.start();
+            sreq.start();
+            assert!(rreq.is_active());
+            let status = rreq.wait();
+            sreq.wait();
+            assert_eq!(status.source_rank(), previous.rank());
+            assert!(rreq
+                .buffer()
+                .iter()
+                .all(|&v| v == previous.rank() * ITERATIONS + i));
+        }
+    });
+
+    mpi::request::scope(|scope| {
+        let mut coll = PersistentRequestCollection::new(scope);
+        let recv = coll.add(previous.receive_init(scope, &mut y[..]));
+        let send = coll.add(next.send_init(scope, &mut x[..]));
+        let mut result = Vec::with_capacity(2);
+        for i in 0..ITERATIONS {
+            coll.buffer_mut(send).fill(-(rank * ITERATIONS + i));
+            coll.start_all();
+            assert_eq!(coll.active(), 2);
+            coll.wait_all(&mut result);
+            assert_eq!(result.len(), 2);
+            assert_eq!(coll.active(), 0);
+            assert!(coll
+                .buffer(recv)
+                .iter()
+                .all(|&v| v == -(previous.rank() * ITERATIONS + i)));
+        }
+        // Completing inactive requests returns immediately
+        assert!(coll.wait_any().is_none());
+    });
+}
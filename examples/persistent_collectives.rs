@@ -0,0 +1,145 @@
+#![deny(warnings)]
+
+use mpi::{collective::SystemOperation, traits::*};
+
+const ITERATIONS: i32 = 5;
+const COUNT: usize = 4;
+
+fn main() {
+    let universe = mpi::initialize().unwrap();
+    let world = universe.world();
+    let rank = world.rank();
+    let size = world.size();
+    let n = size as usize;
+    let root = world.process_at_rank(0);
+    let ranks = (0..size).sum::<i32>();
+
+    let mut barrier = world.barrier_init();
+
+    let mut x = [0; COUNT];
+    let mut sum = [0; COUNT];
+    let mut y = 0;
+    let mut all = vec![0; n];
+    let mut z = 0;
+    let mut prefix = 0;
+    mpi::request::scope(|scope| {
+        let op = SystemOperation::sum();
+        let mut all_reduce = world.all_reduce_init(scope, &mut x[..], &mut sum[..], op);
+        let mut all_gather = world.all_gather_init(scope, &mut y, &mut all[..]);
+        let mut scan = world.scan_init(scope, &mut z, &mut prefix, op);
+        for i in 0..ITERATIONS {
+            all_reduce.send_buffer_mut().fill(rank + i);
+            *all_gather.send_buffer_mut() = rank * i;
+            *scan.send_buffer_mut() = rank + i;
+            all_reduce.start();
+            all_gather.start();
+            scan.start();
+            assert!(all_reduce.is_active());
+            all_reduce.wait();
+            all_gather.wait();
+            scan.wait();
+            assert!(all_reduce
+                .recv_buffer()
+                .iter()
+                .all(|&s| s == ranks + size * i));
+            assert!(all_gather
+                .recv_buffer()
+                .iter()
+                .enumerate()
+                .all(|(r, &v)| v == r as i32 * i));
+            assert_eq!(
+                *scan.recv_buffer(),
+                (0..=rank).sum::<i32>() + (rank + 1) * i
+            );
+
+            barrier.start();
+            barrier.wait();
+        }
+    });
+
+    // Rooted collectives: broadcast, reduce, gather and scatter
+    let mut value = 0;
+    let mut contribution = 0;
+    let mut total = 0;
+    let mut gathered = vec![0; n];
+    let mut part = 0;
+    mpi::request::scope(|scope| {
+        let op = SystemOperation::sum();
+        let mut broadcast = root.broadcast_init(scope, &mut value);
+        if rank == 0 {
+            let mut reduce = root.reduce_init_root(scope, &mut contribution, &mut total, op);
+            let mut gather = root.gather_init_root(scope, &mut part, &mut gathered[..]);
+            for i in 0..ITERATIONS {
+                *broadcast.buffer_mut() = 100 + i;
+                broadcast.start();
+                broadcast.wait();
+                *reduce.send_buffer_mut() = *broadcast.buffer() + rank;
+                reduce.start();
+                reduce.wait();
+                assert_eq!(*reduce.recv_buffer(), size * (100 + i) + ranks);
+                *gather.send_buffer_mut() = rank * i;
+                gather.start();
+                gather.wait();
+                assert!(gather
+                    .recv_buffer()
+                    .iter()
+                    .enumerate()
+                    .all(|(r, &v)| v == r as i32 * i));
+            }
+        } else {
+            let mut reduce = root.reduce_init(scope, &mut contribution, op);
+            let mut gather = root.gather_init(scope, &mut part);
+            for i in 0..ITERATIONS {
+                broadcast.start();
+                broadcast.wait();
+                assert_eq!(*broadcast.buffer(), 100 + i);
+                *reduce.buffer_mut() = *broadcast.buffer() + rank;
+                reduce.start();
+                reduce.wait();
+                *gather.buffer_mut() = rank * i;
+                gather.start();
+                gather.wait();
+            }
+        }
+    });
+
+    let mut pieces: Vec<i32> = (0..size).map(|r| r * 10).collect();
+    let mut piece = -1;
+    mpi::request::scope(|scope| {
+        if rank == 0 {
+            let mut scatter = root.scatter_init_root(scope, &mut pieces[..], &mut piece);
+            for i in 0..ITERATIONS {
+                scatter.send_buffer_mut().iter_mut().for_each(|p| *p += 1);
+                scatter.start();
+                scatter.wait();
+                assert_eq!(*scatter.recv_buffer(), i + 1);
+            }
+        } else {
+            let mut scatter = root.scatter_init(scope, &mut piece);
+            for i in 0..ITERATIONS {
+                scatter.start();
+                scatter.wait();
+                assert_eq!(*scatter.buffer(), rank * 10 + i + 1);
+            }
+        }
+    });
+
+    // A halo exchange on a periodic ring with the same buffers in every step
+    let ring = world
+        .create_cartesian_communicator(&[size], &[true], false)
+        .unwrap();
+    let (left, right) = ring.shift(0, 1);
+    let (left, right) = (left.unwrap(), right.unwrap());
+    let mut boundary = [0; 2];
+    let mut halo = [0; 2];
+    mpi::request::scope(|scope| {
+        let mut exchange = ring.neighbor_all_to_all_init(scope, &mut boundary[..], &mut halo[..]);
+        for i in 0..ITERATIONS {
+            exchange.send_buffer_mut()[0] = rank * 10 + i;
+            exchange.send_buffer_mut()[1] = rank * 10 + i + 1;
+            exchange.start();
+            exchange.wait();
+            assert_eq!(*exchange.recv_buffer(), [left * 10 + i + 1, right * 10 + i]);
+        }
+    });
+}
@@ -0,0 +1,87 @@
+#![deny(warnings)]
+
+use std::{
+    future::Future,
+    pin::pin,
+    sync::Arc,
+    task::{Context, Poll, Wake},
+    thread::{self, Thread},
+};
+
+use mpi::{progress::ProgressDriver, traits::*};
+
+const COUNT: usize = 8;
+
+struct ThreadWaker(Thread);
+
+impl Wake for ThreadWaker {
+    fn wake(self: Arc<Self>) {
+        self.0.unpark();
+    }
+}
+
+/// Run `future` to completion on the current thread.
+fn block_on<F: Future>(future: F) -> F::Output {
+    let mut future = pin!(future);
+    let waker = Arc::new(ThreadWaker(thread::current())).into();
+    let mut cx = Context::from_waker(&waker);
+    loop {
+        if let Poll::Ready(output) = future.as_mut().poll(&mut cx) {
+            return output;
+        }
+        thread::park();
+    }
+}
+
+fn main() {
+    let universe = mpi::initialize().unwrap();
+    let world = universe.world();
+    let rank = world.rank();
+    let size = world.size();
+    let next = world.process_at_rank((rank + 1) % size);
+    let previous = world.process_at_rank((rank + size - 1) % size);
+    let driver = ProgressDriver::new();
+
+    let x = vec![rank; COUNT];
+    let mut y = vec![-1; COUNT];
+    mpi::request::scope(|scope| {
+        let rreq = driver.wait(previous.immediate_receive_into(scope, &mut y[..]));
+        let sreq = driver.wait(next.immediate_send(scope, &x[..]));
+        assert_eq!(driver.outstanding(), 2);
+        let status = block_on(async {
+            let status = rreq.await;
+            sreq.await;
+            status
+        });
+        assert_eq!(status.source_rank(), previous.rank());
+    });
+    assert!(y.iter().all(|&v| v == previous.rank()));
+    assert_eq!(driver.outstanding(), 0);
+    assert_eq!(driver.stats().completed, 2);
+
+    // A future that is dropped before it completes waits for its request.
+    let mut z = 0;
+    mpi::request::scope(|scope| {
+        let sreq = world.this_process().immediate_send(scope, &rank);
+        drop(driver.wait(world.this_process().immediate_receive_into(scope, &mut z)));
+        sreq.wait();
+    });
+    assert_eq!(z, rank);
+
+    let mut ys = vec![-1; COUNT];
+    mpi::request::multiple_scope(2 * COUNT, |scope, coll| {
+        for (i, y) in ys.iter_mut().enumerate() {
+            coll.add(previous.immediate_receive_into_with_tag(scope, y, i as i32));
+        }
+        for (i, x) in x.iter().enumerate() {
+            coll.add(next.immediate_send_with_tag(scope, x, i as i32));
+        }
+        let mut completed = block_on(driver.wait_some(coll)).len();
+        assert!(completed > 0);
+        completed += block_on(driver.wait_all(coll)).len();
+        assert_eq!(completed, 2 * COUNT);
+        assert_eq!(coll.incomplete(), 0);
+        assert!(block_on(driver.wait_some(coll)).is_empty());
+    });
+    assert!(ys.iter().all(|&v| v == previous.rank()));
+}
@@ -0,0 +1,67 @@
+#![deny(warnings)]
+
+use std::time::{Duration, Instant};
+
+use mpi::{collective::SystemOperation, progress::Backoff, traits::*, Threading};
+
+const COUNT: usize = 1 << 16;
+const ITERATIONS: usize = 4;
+
+/// Work that does not call MPI
+fn compute(duration: Duration) -> u64 {
+    let start = Instant::now();
+    let mut x = 0u64;
+    while start.elapsed() < duration {
+        x = x.wrapping_mul(6364136223846793005).wrapping_add(1);
+    }
+    x
+}
+
+fn main() {
+    let (mut universe, threading) = mpi::initialize_with_threading(Threading::Multiple).unwrap();
+    if threading != Threading::Multiple {
+        // A progress thread needs full multithreading support.
+        return;
+    }
+    let driver = universe.start_progress_thread(Backoff::default());
+    assert!(universe.progress_driver().is_some());
+    let world = universe.world();
+    let rank = world.rank();
+    let size = world.size();
+    let next = world.process_at_rank((rank + 1) % size);
+    let previous = world.process_at_rank((rank + size - 1) % size);
+
+    let x = vec![rank as u64; COUNT];
+    let mut sum = vec![0u64; COUNT];
+    let mut y = vec![0u64; COUNT];
+    for _ in 0..ITERATIONS {
+        mpi::request::scope(|scope| {
+            let reduce = driver.wait(world.immediate_all_reduce_into(
+                scope,
+                &x[..],
+                &mut sum[..],
+                SystemOperation::sum(),
+            ));
+            let receive = driver.wait(previous.immediate_receive_into(scope, &mut y[..]));
+            let send = driver.wait(next.immediate_send(scope, &x[..]));
+            compute(Duration::from_millis(20));
+            reduce.wait();
+            receive.wait();
+            send.wait();
+        });
+        let expected = (0..size as u64).sum::<u64>();
+        assert!(sum.iter().all(|&v| v == expected));
+        assert!(y.iter().all(|&v| v == previous.rank() as u64));
+    }
+
+    let stats = driver.stats();
+    assert_eq!(stats.awaited, 3 * ITERATIONS as u64);
+    assert_eq!(stats.outstanding, 0);
+    assert!(stats.background_polls > 0);
+    if rank == 0 {
+        println!(
+            "{} of {} requests completed before they were awaited ({} completed in the background)",
+            stats.ready_when_awaited, stats.awaited, stats.background_completed
+        );
+    }
+}
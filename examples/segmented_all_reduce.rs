@@ -0,0 +1,58 @@
+#![deny(warnings)]
+
+use mpi::{collective::SystemOperation, traits::*};
+
+const LEN: usize = 100_000;
+const SEGMENT_LEN: usize = 4096;
+const DEPTH: usize = 4;
+
+fn main() {
+    let universe = mpi::initialize().unwrap();
+    let world = universe.world();
+    let rank = world.rank();
+    let size = world.size();
+
+    let values: Vec<u64> = (0..LEN as u64)
+        .map(|i| i * u64::from(rank as u32 + 1))
+        .collect();
+    let mut result = vec![0; LEN];
+    let factor = u64::from((size * (size + 1) / 2) as u32);
+
+    let mut covered = vec![false; LEN.div_ceil(SEGMENT_LEN)];
+    world.segmented_all_reduce_into(
+        &values[..],
+        &mut result[..],
+        SystemOperation::sum(),
+        SEGMENT_LEN,
+        DEPTH,
+        |offset, segment| {
+            assert_eq!(offset % SEGMENT_LEN, 0);
+            assert_eq!(segment.len(), SEGMENT_LEN.min(LEN - offset));
+            for (i, &x) in segment.iter().enumerate() {
+                assert_eq!(x, (offset + i) as u64 * factor);
+            }
+            assert!(!covered[offset / SEGMENT_LEN], "segment consumed twice");
+            covered[offset / SEGMENT_LEN] = true;
+        },
+    );
+    assert!(covered.iter().all(|&c| c), "segment not consumed");
+
+    for (i, &x) in result.iter().enumerate() {
+        assert_eq!(x, i as u64 * factor);
+    }
+
+    // Segments longer than the buffer reduce it in one piece
+    let mut calls = 0;
+    world.segmented_all_reduce_into(
+        &values[..],
+        &mut result[..],
+        SystemOperation::sum(),
+        2 * LEN,
+        DEPTH,
+        |offset, segment| {
+            assert_eq!((offset, segment.len()), (0, LEN));
+            calls += 1;
+        },
+    );
+    assert_eq!(calls, 1);
+}
@@ -0,0 +1,56 @@
+#![deny(warnings)]
+
+use mpi::{traits::*, Rank};
+
+/// The ranks that `rank` sends to in a communicator of `size` processes
+fn targets(rank: Rank, size: Rank) -> [Rank; 2] {
+    [(rank + 1) % size, (rank + 3) % size]
+}
+
+fn main() {
+    let universe = mpi::initialize().unwrap();
+    let world = universe.world();
+    let rank = world.rank();
+    let size = world.size();
+
+    for round in 0..4 {
+        // The message for each target holds `target + round + 1` copies of the sender's rank.
+        let messages: Vec<(Rank, Vec<Rank>)> = targets(rank, size)
+            .iter()
+            .map(|&target| (target, vec![rank; (target + round + 1) as usize]))
+            .collect();
+        let sends: Vec<(Rank, &[Rank])> = messages
+            .iter()
+            .map(|(target, msg)| (*target, &msg[..]))
+            .collect();
+        // Consecutive exchanges alternate between two tags.
+        let mut received = world.sparse_exchange(&sends, round % 2);
+
+        received.sort_unstable();
+        let mut expected: Vec<Rank> = (0..size)
+            .flat_map(|source| targets(source, size).map(|target| (source, target)))
+            .filter(|&(_, target)| target == rank)
+            .map(|(source, _)| source)
+            .collect();
+        expected.sort_unstable();
+        assert_eq!(received.len(), expected.len());
+        for ((source, msg), expected) in received.iter().zip(expected) {
+            assert_eq!(*source, expected);
+            assert_eq!(msg.len(), (rank + round + 1) as usize);
+            assert!(msg.iter().all(|&x| x == expected));
+        }
+    }
+
+    // A process may have nothing to send.
+    let sends: Vec<(Rank, &[u8])> = if rank == 0 {
+        vec![(size - 1, &b"hello"[..])]
+    } else {
+        Vec::new()
+    };
+    let received = world.sparse_exchange(&sends, 4);
+    if rank == size - 1 {
+        assert_eq!(received, vec![(0, b"hello".to_vec())]);
+    } else {
+        assert!(received.is_empty());
+    }
+}
@@ -0,0 +1,46 @@
+#![deny(warnings)]
+
+use mpi::{
+    collective::{self, TypedUserOperation},
+    traits::*,
+};
+
+const LEN: usize = 1000;
+
+fn main() {
+    let universe = mpi::initialize().unwrap();
+    let world = universe.world();
+    let rank = world.rank();
+    let size = world.size();
+
+    // The value with the largest magnitude, element-wise
+    let max_abs = TypedUserOperation::<f64>::commutative(|x, y| {
+        for (a, b) in x.iter().zip(y) {
+            if a.abs() > b.abs() {
+                *b = *a;
+            }
+        }
+    });
+
+    let sign = if rank % 2 == 0 { 1.0 } else { -1.0 };
+    let values: Vec<f64> = (0..LEN)
+        .map(|i| sign * f64::from(rank) * (i % 7) as f64)
+        .collect();
+    let mut result = vec![0.0; LEN];
+    world.all_reduce_into(&values[..], &mut result[..], &max_abs);
+    let last = size - 1;
+    let last_sign = if last % 2 == 0 { 1.0 } else { -1.0 };
+    for (i, r) in result.iter().enumerate() {
+        assert_eq!(*r, last_sign * f64::from(last) * (i % 7) as f64);
+    }
+
+    // Keeps the value of the lowest rank, which is associative but not commutative.
+    let first = TypedUserOperation::<i32>::associative(|x, y| y.copy_from_slice(x));
+    let mut lowest = [-1; 3];
+    world.all_reduce_into(&[rank, rank + 1, rank + 2][..], &mut lowest[..], &first);
+    assert_eq!(lowest, [0, 1, 2]);
+
+    let mut acc = [1, 2, 3];
+    collective::reduce_local_into(&[4, 5, 6][..], &mut acc[..], &first);
+    assert_eq!(acc, [4, 5, 6]);
+}
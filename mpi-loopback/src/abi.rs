@@ -0,0 +1,220 @@
+//! Types and constants of the MPI standard ABI (MPI 5.0, `mpi_abi.h`) used by this library.
+
+use std::os::raw::{c_int, c_void};
+
+pub type Handle = usize;
+pub type MPI_Comm = Handle;
+pub type MPI_Datatype = Handle;
+pub type MPI_Group = Handle;
+pub type MPI_Message = Handle;
+pub type MPI_Op = Handle;
+pub type MPI_Request = Handle;
+pub type MPI_Aint = isize;
+pub type MPI_Count = i64;
+
+/// `MPI_Status` of the standard ABI: three public fields followed by five internal `int`s.
+///
+/// The internal fields hold the received byte count and the cancellation flag.
+#[repr(C)]
+#[derive(Copy, Clone, Debug, Default)]
+pub struct MPI_Status {
+    pub MPI_SOURCE: c_int,
+    pub MPI_TAG: c_int,
+    pub MPI_ERROR: c_int,
+    count_lo: c_int,
+    count_hi: c_int,
+    cancelled: c_int,
+    reserved: [c_int; 2],
+}
+
+impl MPI_Status {
+    pub fn new(source: c_int, tag: c_int, bytes: usize) -> Self {
+        let bytes = bytes as u64;
+        MPI_Status {
+            MPI_SOURCE: source,
+            MPI_TAG: tag,
+            count_lo: bytes as u32 as c_int,
+            count_hi: (bytes >> 32) as u32 as c_int,
+            ..Default::default()
+        }
+    }
+
+    /// The status of a receive from `MPI_PROC_NULL`.
+    pub fn proc_null() -> Self {
+        Self::new(MPI_PROC_NULL, MPI_ANY_TAG, 0)
+    }
+
+    /// The status of a cancelled receive.
+    pub fn cancelled() -> Self {
+        MPI_Status {
+            cancelled: 1,
+            ..Self::new(MPI_ANY_SOURCE, MPI_ANY_TAG, 0)
+        }
+    }
+
+    pub fn bytes(&self) -> u64 {
+        u64::from(self.count_lo as u32) | (u64::from(self.count_hi as u32) << 32)
+    }
+
+    pub fn is_cancelled(&self) -> bool {
+        self.cancelled != 0
+    }
+
+    /// Write `self` to a caller supplied status unless it is `MPI_STATUS_IGNORE`.
+    pub unsafe fn write_to(&self, status: *mut MPI_Status) {
+        if !status.is_null() {
+            *status = *self;
+        }
+    }
+}
+
+/// Counts and displacements, as `int` in the classic and as `MPI_Count` or `MPI_Aint` in the
+/// large-count (`_c`) variants of functions.
+pub trait Int: Copy + std::fmt::Display {
+    fn to_i64(self) -> i64;
+}
+
+impl Int for c_int {
+    fn to_i64(self) -> i64 {
+        self.into()
+    }
+}
+
+impl Int for MPI_Count {
+    fn to_i64(self) -> i64 {
+        self
+    }
+}
+
+impl Int for MPI_Aint {
+    fn to_i64(self) -> i64 {
+        self as i64
+    }
+}
+
+/// A count argument of `func`, checked to be non-negative.
+pub fn count(func: &str, count: impl Int) -> usize {
+    usize::try_from(count.to_i64())
+        .unwrap_or_else(|_| crate::state::fatal(func, format!("invalid count {}", count)))
+}
+
+pub type MPI_User_function =
+    unsafe extern "C" fn(*mut c_void, *mut c_void, *mut c_int, *mut MPI_Datatype);
+pub type MPI_Comm_copy_attr_function = unsafe extern "C" fn(
+    MPI_Comm,
+    c_int,
+    *mut c_void,
+    *mut c_void,
+    *mut c_void,
+    *mut c_int,
+) -> c_int;
+pub type MPI_Comm_delete_attr_function =
+    unsafe extern "C" fn(MPI_Comm, c_int, *mut c_void, *mut c_void) -> c_int;
+
+pub const MPI_SUCCESS: c_int = 0;
+
+pub const MPI_ANY_SOURCE: c_int = -1;
+pub const MPI_ANY_TAG: c_int = -2;
+pub const MPI_PROC_NULL: c_int = -3;
+pub const MPI_UNDEFINED: c_int = -32766;
+
+pub const MPI_IDENT: c_int = 201;
+pub const MPI_CONGRUENT: c_int = 202;
+pub const MPI_SIMILAR: c_int = 203;
+pub const MPI_UNEQUAL: c_int = 204;
+
+pub const MPI_TAG_UB: c_int = 501;
+pub const MPI_HOST: c_int = 503;
+pub const MPI_IO: c_int = 502;
+pub const MPI_WTIME_IS_GLOBAL: c_int = 504;
+pub const MPI_UNIVERSE_SIZE: c_int = 507;
+pub const MPI_KEYVAL_INVALID: c_int = 0;
+
+pub const MPI_THREAD_SINGLE: c_int = 0;
+pub const MPI_THREAD_MULTIPLE: c_int = 4096;
+
+pub const MPI_IN_PLACE: usize = 0x1;
+
+pub const MPI_COMM_NULL: MPI_Comm = 0x100;
+pub const MPI_COMM_WORLD: MPI_Comm = 0x101;
+pub const MPI_COMM_SELF: MPI_Comm = 0x102;
+pub const MPI_GROUP_NULL: MPI_Group = 0x108;
+pub const MPI_GROUP_EMPTY: MPI_Group = 0x109;
+pub const MPI_MESSAGE_NULL: MPI_Message = 0x128;
+pub const MPI_MESSAGE_NO_PROC: MPI_Message = 0x129;
+pub const MPI_REQUEST_NULL: MPI_Request = 0x180;
+pub const MPI_DATATYPE_NULL: MPI_Datatype = 0x200;
+pub const MPI_OP_NULL: MPI_Op = 0x20;
+
+pub const MPI_NULL_COPY_FN: usize = 0x0;
+pub const MPI_DUP_FN: usize = 0x1;
+
+pub const MPI_MAX_PROCESSOR_NAME: usize = 256;
+pub const MPI_MAX_LIBRARY_VERSION_STRING: usize = 8192;
+pub const MPI_MAX_OBJECT_NAME: usize = 128;
+
+/// Predefined reduction operations
+pub mod op {
+    use super::MPI_Op;
+
+    pub const MPI_SUM: MPI_Op = 0x21;
+    pub const MPI_MIN: MPI_Op = 0x22;
+    pub const MPI_MAX: MPI_Op = 0x23;
+    pub const MPI_PROD: MPI_Op = 0x24;
+    pub const MPI_BAND: MPI_Op = 0x28;
+    pub const MPI_BOR: MPI_Op = 0x29;
+    pub const MPI_BXOR: MPI_Op = 0x2a;
+    pub const MPI_LAND: MPI_Op = 0x30;
+    pub const MPI_LOR: MPI_Op = 0x31;
+    pub const MPI_LXOR: MPI_Op = 0x32;
+    pub const MPI_MINLOC: MPI_Op = 0x38;
+    pub const MPI_MAXLOC: MPI_Op = 0x39;
+    pub const MPI_REPLACE: MPI_Op = 0x3c;
+    pub const MPI_NO_OP: MPI_Op = 0x3d;
+}
+
+/// Predefined datatypes
+pub mod datatype {
+    use super::MPI_Datatype;
+
+    pub const MPI_AINT: MPI_Datatype = 0x201;
+    pub const MPI_COUNT: MPI_Datatype = 0x202;
+    pub const MPI_OFFSET: MPI_Datatype = 0x203;
+    pub const MPI_PACKED: MPI_Datatype = 0x207;
+    pub const MPI_SHORT: MPI_Datatype = 0x208;
+    pub const MPI_INT: MPI_Datatype = 0x209;
+    pub const MPI_LONG: MPI_Datatype = 0x20a;
+    pub const MPI_LONG_LONG: MPI_Datatype = 0x20b;
+    pub const MPI_UNSIGNED_SHORT: MPI_Datatype = 0x20c;
+    pub const MPI_UNSIGNED: MPI_Datatype = 0x20d;
+    pub const MPI_UNSIGNED_LONG: MPI_Datatype = 0x20e;
+    pub const MPI_UNSIGNED_LONG_LONG: MPI_Datatype = 0x20f;
+    pub const MPI_FLOAT: MPI_Datatype = 0x210;
+    pub const MPI_C_FLOAT_COMPLEX: MPI_Datatype = 0x212;
+    pub const MPI_CXX_FLOAT_COMPLEX: MPI_Datatype = 0x213;
+    pub const MPI_DOUBLE: MPI_Datatype = 0x214;
+    pub const MPI_C_DOUBLE_COMPLEX: MPI_Datatype = 0x216;
+    pub const MPI_CXX_DOUBLE_COMPLEX: MPI_Datatype = 0x217;
+    pub const MPI_LONG_DOUBLE: MPI_Datatype = 0x220;
+    pub const MPI_C_LONG_DOUBLE_COMPLEX: MPI_Datatype = 0x224;
+    pub const MPI_FLOAT_INT: MPI_Datatype = 0x228;
+    pub const MPI_DOUBLE_INT: MPI_Datatype = 0x229;
+    pub const MPI_LONG_INT: MPI_Datatype = 0x22a;
+    pub const MPI_2INT: MPI_Datatype = 0x22b;
+    pub const MPI_SHORT_INT: MPI_Datatype = 0x22c;
+    pub const MPI_C_BOOL: MPI_Datatype = 0x238;
+    pub const MPI_CXX_BOOL: MPI_Datatype = 0x239;
+    pub const MPI_WCHAR: MPI_Datatype = 0x23c;
+    pub const MPI_INT8_T: MPI_Datatype = 0x240;
+    pub const MPI_UINT8_T: MPI_Datatype = 0x241;
+    pub const MPI_CHAR: MPI_Datatype = 0x243;
+    pub const MPI_SIGNED_CHAR: MPI_Datatype = 0x244;
+    pub const MPI_UNSIGNED_CHAR: MPI_Datatype = 0x245;
+    pub const MPI_BYTE: MPI_Datatype = 0x247;
+    pub const MPI_INT16_T: MPI_Datatype = 0x248;
+    pub const MPI_UINT16_T: MPI_Datatype = 0x249;
+    pub const MPI_INT32_T: MPI_Datatype = 0x250;
+    pub const MPI_UINT32_T: MPI_Datatype = 0x251;
+    pub const MPI_INT64_T: MPI_Datatype = 0x258;
+    pub const MPI_UINT64_T: MPI_Datatype = 0x259;
+}
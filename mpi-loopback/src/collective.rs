@@ -0,0 +1,884 @@
+//! Collective operations as schedules of message rounds.
+//!
+//! Every collective is a chain of continuations (see [`Step`]) that the request machinery runs
+//! as messages arrive, so the blocking and non-blocking variants share one implementation. The
+//! algorithms are linear: each rank exchanges messages with the ranks it needs directly, and
+//! reductions combine contributions in rank order, so results are deterministic.
+
+use std::{
+    cell::RefCell,
+    os::raw::{c_int, c_void},
+    rc::Rc,
+    sync::Arc,
+};
+
+use crate::{
+    abi::*,
+    comm::CommInfo,
+    datatype::{self, Datatype},
+    op::{self, Op},
+    state::{lock, wait, Continuation, Step},
+};
+
+fn done() -> Continuation {
+    Box::new(|_| Step::Done)
+}
+
+fn others(n: usize, me: usize) -> impl Iterator<Item = usize> {
+    (0..n).filter(move |&r| r != me)
+}
+
+/// Insert this rank's own contribution into the data received from the other ranks.
+fn by_rank(me: usize, own: Vec<u8>, mut received: Vec<Vec<u8>>) -> Vec<Vec<u8>> {
+    received.insert(me, own);
+    received
+}
+
+/// Reduce `values` in rank order: `v0 op (v1 op (... op vn))`.
+fn combine(
+    func: &'static str,
+    reduction: &Reduction,
+    count: usize,
+    mut values: Vec<Vec<u8>>,
+) -> Vec<u8> {
+    let mut acc = values.pop().unwrap_or_default();
+    while let Some(v) = values.pop() {
+        op::reduce(
+            func,
+            reduction.op,
+            reduction.handle,
+            &reduction.datatype,
+            count,
+            &v,
+            &mut acc,
+        );
+    }
+    acc
+}
+
+struct Reduction {
+    op: Op,
+    handle: MPI_Datatype,
+    datatype: Arc<Datatype>,
+}
+
+fn reduction(func: &str, datatype: MPI_Datatype, op: MPI_Op) -> Reduction {
+    Reduction {
+        op: op::get(func, op),
+        handle: datatype,
+        datatype: datatype::get(func, datatype),
+    }
+}
+
+fn comm_info(func: &str, comm: MPI_Comm) -> CommInfo {
+    lock().comms.info(func, comm)
+}
+
+unsafe fn counts(func: &str, ptr: *const impl Int, n: usize) -> Vec<usize> {
+    std::slice::from_raw_parts(ptr, n)
+        .iter()
+        .map(|&c| count(func, c))
+        .collect()
+}
+
+unsafe fn displs(ptr: *const impl Int, n: usize) -> Vec<isize> {
+    std::slice::from_raw_parts(ptr, n)
+        .iter()
+        .map(|&d| d.to_i64() as isize)
+        .collect()
+}
+
+fn is_in_place(buf: *const c_void) -> bool {
+    buf as usize == MPI_IN_PLACE
+}
+
+/// A buffer pointer offset by `elements` elements of `dt`.
+fn at(buf: usize, dt: &Datatype, elements: isize) -> *mut c_void {
+    (buf as *mut u8).wrapping_offset(elements * dt.extent) as *mut c_void
+}
+
+/// Run a collective to completion.
+fn run(func: &'static str, comm: &CommInfo, start: Continuation) -> c_int {
+    let request = lock().start_schedule(comm, start);
+    wait(func, request);
+    lock().requests.remove(func, request);
+    MPI_SUCCESS
+}
+
+/// Start a non-blocking collective.
+unsafe fn start(
+    func: &'static str,
+    comm: &CommInfo,
+    start: Continuation,
+    request: *mut MPI_Request,
+) -> c_int {
+    let handle = lock().start_schedule(comm, start);
+    crate::state::advance(func, handle);
+    *request = handle;
+    MPI_SUCCESS
+}
+
+/// Exchange a byte string with every rank of `comm`, returning all of them in rank order.
+pub fn exchange(comm: &CommInfo, data: Vec<u8>) -> Vec<Vec<u8>> {
+    let (n, me) = (comm.size(), comm.rank);
+    let result = Rc::new(RefCell::new(Vec::new()));
+    let out = result.clone();
+    run(
+        "exchange",
+        comm,
+        Box::new(move |_| Step::Round {
+            sends: others(n, me).map(|r| (r, data.clone())).collect(),
+            recvs: others(n, me).collect(),
+            then: Box::new(move |received| {
+                *out.borrow_mut() = by_rank(me, data, received);
+                Step::Done
+            }),
+        }),
+    );
+    result.take()
+}
+
+fn barrier(comm: &CommInfo) -> Continuation {
+    let (n, me) = (comm.size(), comm.rank);
+    Box::new(move |_| Step::Round {
+        sends: others(n, me).map(|r| (r, Vec::new())).collect(),
+        recvs: others(n, me).collect(),
+        then: done(),
+    })
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Barrier(comm: MPI_Comm) -> c_int {
+    let info = comm_info("MPI_Barrier", comm);
+    run("MPI_Barrier", &info, barrier(&info))
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Ibarrier(comm: MPI_Comm, request: *mut MPI_Request) -> c_int {
+    let info = comm_info("MPI_Ibarrier", comm);
+    start("MPI_Ibarrier", &info, barrier(&info), request)
+}
+
+unsafe fn bcast(
+    func: &'static str,
+    buffer: *mut c_void,
+    count_: impl Int,
+    datatype: MPI_Datatype,
+    root: c_int,
+    comm: &CommInfo,
+) -> Continuation {
+    let (n, me, root) = (comm.size(), comm.rank, comm.index(func, root));
+    let (buf, count, dt) = (
+        buffer as usize,
+        count(func, count_),
+        datatype::get(func, datatype),
+    );
+    Box::new(move |_| {
+        if me == root {
+            let data = dt.pack(buf as *const c_void, count);
+            Step::Round {
+                sends: others(n, me).map(|r| (r, data.clone())).collect(),
+                recvs: Vec::new(),
+                then: done(),
+            }
+        } else {
+            Step::Round {
+                sends: Vec::new(),
+                recvs: vec![root],
+                then: Box::new(move |received| {
+                    dt.unpack(&received[0], buf as *mut c_void, count);
+                    Step::Done
+                }),
+            }
+        }
+    })
+}
+
+/// Counts and displacements (in elements) of the per-rank blocks of a buffer.
+struct Blocks {
+    buf: usize,
+    counts: Vec<usize>,
+    displs: Vec<isize>,
+    datatype: Arc<Datatype>,
+}
+
+impl Blocks {
+    fn uniform(
+        func: &str,
+        buf: *const c_void,
+        n: usize,
+        count_: impl Int,
+        datatype: MPI_Datatype,
+    ) -> Self {
+        let count = count(func, count_);
+        Blocks {
+            buf: buf as usize,
+            counts: vec![count; n],
+            displs: (0..n as isize).map(|r| r * count as isize).collect(),
+            datatype: datatype::get(func, datatype),
+        }
+    }
+
+    unsafe fn varying(
+        func: &str,
+        buf: *const c_void,
+        n: usize,
+        counts_: *const impl Int,
+        displs_: *const impl Int,
+        datatype: MPI_Datatype,
+    ) -> Self {
+        Blocks {
+            buf: buf as usize,
+            counts: counts(func, counts_, n),
+            displs: displs(displs_, n),
+            datatype: datatype::get(func, datatype),
+        }
+    }
+
+    unsafe fn pack(&self, r: usize) -> Vec<u8> {
+        self.datatype
+            .pack(at(self.buf, &self.datatype, self.displs[r]), self.counts[r])
+    }
+
+    unsafe fn unpack(&self, r: usize, data: &[u8]) {
+        self.datatype.unpack(
+            data,
+            at(self.buf, &self.datatype, self.displs[r]),
+            self.counts[r],
+        );
+    }
+}
+
+/// A buffer of `count` elements of one datatype.
+struct Single {
+    buf: usize,
+    count: usize,
+    datatype: Arc<Datatype>,
+}
+
+impl Single {
+    fn new(func: &str, buf: *const c_void, count_: impl Int, datatype: MPI_Datatype) -> Self {
+        Single {
+            buf: buf as usize,
+            count: count(func, count_),
+            datatype: datatype::get(func, datatype),
+        }
+    }
+
+    unsafe fn pack(&self) -> Vec<u8> {
+        self.datatype.pack(self.buf as *const c_void, self.count)
+    }
+
+    unsafe fn unpack(&self, data: &[u8]) {
+        self.datatype
+            .unpack(data, self.buf as *mut c_void, self.count);
+    }
+}
+
+/// Gather blocks from every rank into `recv` at `root`. `send` is `None` for `MPI_IN_PLACE`.
+fn gather(
+    comm: &CommInfo,
+    root: usize,
+    send: Option<Single>,
+    recv: Option<Blocks>,
+) -> Continuation {
+    let (n, me) = (comm.size(), comm.rank);
+    Box::new(move |_| unsafe {
+        if me != root {
+            let send = send.unwrap();
+            return Step::Round {
+                sends: vec![(root, send.pack())],
+                recvs: Vec::new(),
+                then: done(),
+            };
+        }
+        let recv = recv.unwrap();
+        if let Some(send) = send {
+            recv.unpack(me, &send.pack());
+        }
+        Step::Round {
+            sends: Vec::new(),
+            recvs: others(n, me).collect(),
+            then: Box::new(move |received| {
+                for (r, data) in others(n, me).zip(received) {
+                    recv.unpack(r, &data);
+                }
+                Step::Done
+            }),
+        }
+    })
+}
+
+/// Scatter blocks of `send` at `root` to every rank. `recv` is `None` for `MPI_IN_PLACE`.
+fn scatter(
+    comm: &CommInfo,
+    root: usize,
+    send: Option<Blocks>,
+    recv: Option<Single>,
+) -> Continuation {
+    let (n, me) = (comm.size(), comm.rank);
+    Box::new(move |_| unsafe {
+        if me != root {
+            let recv = recv.unwrap();
+            return Step::Round {
+                sends: Vec::new(),
+                recvs: vec![root],
+                then: Box::new(move |received| {
+                    recv.unpack(&received[0]);
+                    Step::Done
+                }),
+            };
+        }
+        let send = send.unwrap();
+        if let Some(recv) = recv {
+            recv.unpack(&send.pack(me));
+        }
+        Step::Round {
+            sends: others(n, me).map(|r| (r, send.pack(r))).collect(),
+            recvs: Vec::new(),
+            then: done(),
+        }
+    })
+}
+
+/// Every rank contributes one block of `recv`. `send` is `None` for `MPI_IN_PLACE`.
+fn allgather(comm: &CommInfo, send: Option<Single>, recv: Blocks) -> Continuation {
+    let (n, me) = (comm.size(), comm.rank);
+    Box::new(move |_| unsafe {
+        let own = match send {
+            Some(send) => {
+                let own = send.pack();
+                recv.unpack(me, &own);
+                own
+            }
+            None => recv.pack(me),
+        };
+        Step::Round {
+            sends: others(n, me).map(|r| (r, own.clone())).collect(),
+            recvs: others(n, me).collect(),
+            then: Box::new(move |received| {
+                for (r, data) in others(n, me).zip(received) {
+                    recv.unpack(r, &data);
+                }
+                Step::Done
+            }),
+        }
+    })
+}
+
+/// Every rank sends block `r` of `send` to rank `r`. `send` is `None` for `MPI_IN_PLACE`.
+fn alltoall(comm: &CommInfo, send: Option<Blocks>, recv: Blocks) -> Continuation {
+    let (n, me) = (comm.size(), comm.rank);
+    Box::new(move |_| unsafe {
+        let send = send.as_ref().unwrap_or(&recv);
+        let mut blocks: Vec<Vec<u8>> = (0..n).map(|r| send.pack(r)).collect();
+        recv.unpack(me, &blocks[me]);
+        let sends = others(n, me)
+            .map(|r| (r, std::mem::take(&mut blocks[r])))
+            .collect();
+        Step::Round {
+            sends,
+            recvs: others(n, me).collect(),
+            then: Box::new(move |received| {
+                for (r, data) in others(n, me).zip(received) {
+                    recv.unpack(r, &data);
+                }
+                Step::Done
+            }),
+        }
+    })
+}
+
+/// The type of an argument of kind `$kind` in the classic (`int`) or the large-count
+/// (`large`) variant of a collective.
+macro_rules! arg {
+    (int, count) => { c_int };
+    (large, count) => { MPI_Count };
+    (int, counts) => { *const c_int };
+    (large, counts) => { *const MPI_Count };
+    (int, displs) => { *const c_int };
+    (large, displs) => { *const MPI_Aint };
+    ($variant:ident, buf) => { *const c_void };
+    ($variant:ident, mut_buf) => { *mut c_void };
+    ($variant:ident, datatype) => { MPI_Datatype };
+    ($variant:ident, op) => { MPI_Op };
+    ($variant:ident, rank) => { c_int };
+}
+
+/// Define the blocking and non-blocking variants of a collective, in both the classic and the
+/// large-count (`_c`) form, from a function that builds its schedule.
+macro_rules! collective {
+    (
+        $blocking:ident, $nonblocking:ident, $blocking_c:ident, $nonblocking_c:ident,
+        ($($arg:ident: $kind:ident),* $(,)?), $comm:ident, $schedule:expr
+    ) => {
+        collective!(@define int, $blocking, $nonblocking, ($($arg: $kind),*), $comm, $schedule);
+        collective!(
+            @define large, $blocking_c, $nonblocking_c, ($($arg: $kind),*), $comm, $schedule
+        );
+    };
+    (
+        @define $variant:ident, $blocking:ident, $nonblocking:ident,
+        ($($arg:ident: $kind:ident),*), $comm:ident, $schedule:expr
+    ) => {
+        #[no_mangle]
+        pub unsafe extern "C" fn $blocking($($arg: arg!($variant, $kind),)* $comm: MPI_Comm) -> c_int {
+            let func = stringify!($blocking);
+            let info = comm_info(func, $comm);
+            let schedule = $schedule(func, &info);
+            run(func, &info, schedule)
+        }
+
+        #[no_mangle]
+        pub unsafe extern "C" fn $nonblocking(
+            $($arg: arg!($variant, $kind),)*
+            $comm: MPI_Comm,
+            request: *mut MPI_Request,
+        ) -> c_int {
+            let func = stringify!($nonblocking);
+            let info = comm_info(func, $comm);
+            let schedule = $schedule(func, &info);
+            start(func, &info, schedule, request)
+        }
+    };
+}
+
+collective!(
+    MPI_Bcast,
+    MPI_Ibcast,
+    MPI_Bcast_c,
+    MPI_Ibcast_c,
+    (buffer: mut_buf, count: count, datatype: datatype, root: rank),
+    comm,
+    |func: &'static str, info: &CommInfo| bcast(func, buffer, count, datatype, root, info)
+);
+
+collective!(
+    MPI_Gather,
+    MPI_Igather,
+    MPI_Gather_c,
+    MPI_Igather_c,
+    (
+        sendbuf: buf,
+        sendcount: count,
+        sendtype: datatype,
+        recvbuf: mut_buf,
+        recvcount: count,
+        recvtype: datatype,
+        root: rank,
+    ),
+    comm,
+    |func: &'static str, info: &CommInfo| {
+        let root = info.index(func, root);
+        let is_root = info.rank == root;
+        let send = (!(is_root && is_in_place(sendbuf)))
+            .then(|| Single::new(func, sendbuf, sendcount, sendtype));
+        let recv = is_root.then(|| Blocks::uniform(func, recvbuf, info.size(), recvcount, recvtype));
+        gather(info, root, send, recv)
+    }
+);
+
+collective!(
+    MPI_Gatherv,
+    MPI_Igatherv,
+    MPI_Gatherv_c,
+    MPI_Igatherv_c,
+    (
+        sendbuf: buf,
+        sendcount: count,
+        sendtype: datatype,
+        recvbuf: mut_buf,
+        recvcounts: counts,
+        displs: displs,
+        recvtype: datatype,
+        root: rank,
+    ),
+    comm,
+    |func: &'static str, info: &CommInfo| {
+        let root = info.index(func, root);
+        let is_root = info.rank == root;
+        let send = (!(is_root && is_in_place(sendbuf)))
+            .then(|| Single::new(func, sendbuf, sendcount, sendtype));
+        let recv = is_root.then(|| {
+            Blocks::varying(func, recvbuf, info.size(), recvcounts, displs, recvtype)
+        });
+        gather(info, root, send, recv)
+    }
+);
+
+collective!(
+    MPI_Scatter,
+    MPI_Iscatter,
+    MPI_Scatter_c,
+    MPI_Iscatter_c,
+    (
+        sendbuf: buf,
+        sendcount: count,
+        sendtype: datatype,
+        recvbuf: mut_buf,
+        recvcount: count,
+        recvtype: datatype,
+        root: rank,
+    ),
+    comm,
+    |func: &'static str, info: &CommInfo| {
+        let root = info.index(func, root);
+        let is_root = info.rank == root;
+        let send = is_root.then(|| Blocks::uniform(func, sendbuf, info.size(), sendcount, sendtype));
+        let recv = (!(is_root && is_in_place(recvbuf)))
+            .then(|| Single::new(func, recvbuf, recvcount, recvtype));
+        scatter(info, root, send, recv)
+    }
+);
+
+collective!(
+    MPI_Scatterv,
+    MPI_Iscatterv,
+    MPI_Scatterv_c,
+    MPI_Iscatterv_c,
+    (
+        sendbuf: buf,
+        sendcounts: counts,
+        displs: displs,
+        sendtype: datatype,
+        recvbuf: mut_buf,
+        recvcount: count,
+        recvtype: datatype,
+        root: rank,
+    ),
+    comm,
+    |func: &'static str, info: &CommInfo| {
+        let root = info.index(func, root);
+        let is_root = info.rank == root;
+        let send = is_root.then(|| {
+            Blocks::varying(func, sendbuf, info.size(), sendcounts, displs, sendtype)
+        });
+        let recv = (!(is_root && is_in_place(recvbuf)))
+            .then(|| Single::new(func, recvbuf, recvcount, recvtype));
+        scatter(info, root, send, recv)
+    }
+);
+
+collective!(
+    MPI_Allgather,
+    MPI_Iallgather,
+    MPI_Allgather_c,
+    MPI_Iallgather_c,
+    (
+        sendbuf: buf,
+        sendcount: count,
+        sendtype: datatype,
+        recvbuf: mut_buf,
+        recvcount: count,
+        recvtype: datatype,
+    ),
+    comm,
+    |func: &'static str, info: &CommInfo| {
+        let send = (!is_in_place(sendbuf)).then(|| Single::new(func, sendbuf, sendcount, sendtype));
+        let recv = Blocks::uniform(func, recvbuf, info.size(), recvcount, recvtype);
+        allgather(info, send, recv)
+    }
+);
+
+collective!(
+    MPI_Allgatherv,
+    MPI_Iallgatherv,
+    MPI_Allgatherv_c,
+    MPI_Iallgatherv_c,
+    (
+        sendbuf: buf,
+        sendcount: count,
+        sendtype: datatype,
+        recvbuf: mut_buf,
+        recvcounts: counts,
+        displs: displs,
+        recvtype: datatype,
+    ),
+    comm,
+    |func: &'static str, info: &CommInfo| {
+        let send = (!is_in_place(sendbuf)).then(|| Single::new(func, sendbuf, sendcount, sendtype));
+        let recv = Blocks::varying(func, recvbuf, info.size(), recvcounts, displs, recvtype);
+        allgather(info, send, recv)
+    }
+);
+
+collective!(
+    MPI_Alltoall,
+    MPI_Ialltoall,
+    MPI_Alltoall_c,
+    MPI_Ialltoall_c,
+    (
+        sendbuf: buf,
+        sendcount: count,
+        sendtype: datatype,
+        recvbuf: mut_buf,
+        recvcount: count,
+        recvtype: datatype,
+    ),
+    comm,
+    |func: &'static str, info: &CommInfo| {
+        let send = (!is_in_place(sendbuf))
+            .then(|| Blocks::uniform(func, sendbuf, info.size(), sendcount, sendtype));
+        let recv = Blocks::uniform(func, recvbuf, info.size(), recvcount, recvtype);
+        alltoall(info, send, recv)
+    }
+);
+
+collective!(
+    MPI_Alltoallv,
+    MPI_Ialltoallv,
+    MPI_Alltoallv_c,
+    MPI_Ialltoallv_c,
+    (
+        sendbuf: buf,
+        sendcounts: counts,
+        sdispls: displs,
+        sendtype: datatype,
+        recvbuf: mut_buf,
+        recvcounts: counts,
+        rdispls: displs,
+        recvtype: datatype,
+    ),
+    comm,
+    |func: &'static str, info: &CommInfo| {
+        let n = info.size();
+        let send = (!is_in_place(sendbuf))
+            .then(|| Blocks::varying(func, sendbuf, n, sendcounts, sdispls, sendtype));
+        let recv = Blocks::varying(func, recvbuf, n, recvcounts, rdispls, recvtype);
+        alltoall(info, send, recv)
+    }
+);
+
+/// The packed contribution of this rank to a reduction.
+unsafe fn contribution(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: usize,
+    dt: &Datatype,
+) -> Vec<u8> {
+    if is_in_place(sendbuf) {
+        dt.pack(recvbuf, count)
+    } else {
+        dt.pack(sendbuf, count)
+    }
+}
+
+collective!(
+    MPI_Reduce,
+    MPI_Ireduce,
+    MPI_Reduce_c,
+    MPI_Ireduce_c,
+    (
+        sendbuf: buf,
+        recvbuf: mut_buf,
+        count_: count,
+        datatype: datatype,
+        op: op,
+        root: rank,
+    ),
+    comm,
+    |func: &'static str, info: &CommInfo| -> Continuation {
+        let (n, me, root) = (info.size(), info.rank, info.index(func, root));
+        let count = count(func, count_);
+        let reduction = reduction(func, datatype, op);
+        let (sendbuf, recvbuf) = (sendbuf as usize, recvbuf as usize);
+        Box::new(move |_| {
+            let own = contribution(sendbuf as _, recvbuf as _, count, &reduction.datatype);
+            if me != root {
+                return Step::Round {
+                    sends: vec![(root, own)],
+                    recvs: Vec::new(),
+                    then: done(),
+                };
+            }
+            Step::Round {
+                sends: Vec::new(),
+                recvs: others(n, me).collect(),
+                then: Box::new(move |received| {
+                    let result = combine(func, &reduction, count, by_rank(me, own, received));
+                    reduction.datatype.unpack(&result, recvbuf as _, count);
+                    Step::Done
+                }),
+            }
+        })
+    }
+);
+
+collective!(
+    MPI_Allreduce,
+    MPI_Iallreduce,
+    MPI_Allreduce_c,
+    MPI_Iallreduce_c,
+    (
+        sendbuf: buf,
+        recvbuf: mut_buf,
+        count_: count,
+        datatype: datatype,
+        op: op,
+    ),
+    comm,
+    |func: &'static str, info: &CommInfo| -> Continuation {
+        let (n, me) = (info.size(), info.rank);
+        let count = count(func, count_);
+        let reduction = reduction(func, datatype, op);
+        let (sendbuf, recvbuf) = (sendbuf as usize, recvbuf as usize);
+        Box::new(move |_| {
+            let own = contribution(sendbuf as _, recvbuf as _, count, &reduction.datatype);
+            Step::Round {
+                sends: others(n, me).map(|r| (r, own.clone())).collect(),
+                recvs: others(n, me).collect(),
+                then: Box::new(move |received| {
+                    let result = combine(func, &reduction, count, by_rank(me, own, received));
+                    reduction.datatype.unpack(&result, recvbuf as _, count);
+                    Step::Done
+                }),
+            }
+        })
+    }
+);
+
+/// Inclusive or exclusive prefix reduction.
+#[allow(clippy::too_many_arguments)]
+unsafe fn scan(
+    func: &'static str,
+    info: &CommInfo,
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count_: impl Int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    inclusive: bool,
+) -> Continuation {
+    let (n, me) = (info.size(), info.rank);
+    let count = count(func, count_);
+    let reduction = reduction(func, datatype, op);
+    let (sendbuf, recvbuf) = (sendbuf as usize, recvbuf as usize);
+    Box::new(move |_| {
+        let own = contribution(sendbuf as _, recvbuf as _, count, &reduction.datatype);
+        Step::Round {
+            sends: (me + 1..n).map(|r| (r, own.clone())).collect(),
+            recvs: (0..me).collect(),
+            then: Box::new(move |mut values| {
+                if inclusive {
+                    values.push(own);
+                }
+                if !values.is_empty() {
+                    let result = combine(func, &reduction, count, values);
+                    reduction.datatype.unpack(&result, recvbuf as _, count);
+                }
+                Step::Done
+            }),
+        }
+    })
+}
+
+collective!(
+    MPI_Scan,
+    MPI_Iscan,
+    MPI_Scan_c,
+    MPI_Iscan_c,
+    (
+        sendbuf: buf,
+        recvbuf: mut_buf,
+        count: count,
+        datatype: datatype,
+        op: op,
+    ),
+    comm,
+    |func: &'static str, info: &CommInfo| {
+        scan(func, info, sendbuf, recvbuf, count, datatype, op, true)
+    }
+);
+
+collective!(
+    MPI_Exscan,
+    MPI_Iexscan,
+    MPI_Exscan_c,
+    MPI_Iexscan_c,
+    (
+        sendbuf: buf,
+        recvbuf: mut_buf,
+        count: count,
+        datatype: datatype,
+        op: op,
+    ),
+    comm,
+    |func: &'static str, info: &CommInfo| {
+        scan(func, info, sendbuf, recvbuf, count, datatype, op, false)
+    }
+);
+
+/// Reduce blocks of `counts[r]` elements and leave block `r` at rank `r`.
+unsafe fn reduce_scatter(
+    func: &'static str,
+    info: &CommInfo,
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    counts: Vec<usize>,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+) -> Continuation {
+    let (n, me) = (info.size(), info.rank);
+    let reduction = reduction(func, datatype, op);
+    let (sendbuf, recvbuf) = (sendbuf as usize, recvbuf as usize);
+    Box::new(move |_| {
+        let total = counts.iter().sum();
+        let all = contribution(sendbuf as _, recvbuf as _, total, &reduction.datatype);
+        let size = reduction.datatype.size;
+        let mut offsets = vec![0];
+        offsets.extend(counts.iter().scan(0, |o, &c| {
+            *o += c * size;
+            Some(*o)
+        }));
+        let block = |r: usize| all[offsets[r]..offsets[r + 1]].to_vec();
+        let own = block(me);
+        Step::Round {
+            sends: others(n, me).map(|r| (r, block(r))).collect(),
+            recvs: others(n, me).collect(),
+            then: Box::new(move |received| {
+                let count = counts[me];
+                let result = combine(func, &reduction, count, by_rank(me, own, received));
+                reduction.datatype.unpack(&result, recvbuf as _, count);
+                Step::Done
+            }),
+        }
+    })
+}
+
+collective!(
+    MPI_Reduce_scatter_block,
+    MPI_Ireduce_scatter_block,
+    MPI_Reduce_scatter_block_c,
+    MPI_Ireduce_scatter_block_c,
+    (
+        sendbuf: buf,
+        recvbuf: mut_buf,
+        recvcount: count,
+        datatype: datatype,
+        op: op,
+    ),
+    comm,
+    |func: &'static str, info: &CommInfo| {
+        let counts = vec![count(func, recvcount); info.size()];
+        reduce_scatter(func, info, sendbuf, recvbuf, counts, datatype, op)
+    }
+);
+
+collective!(
+    MPI_Reduce_scatter,
+    MPI_Ireduce_scatter,
+    MPI_Reduce_scatter_c,
+    MPI_Ireduce_scatter_c,
+    (
+        sendbuf: buf,
+        recvbuf: mut_buf,
+        recvcounts: counts,
+        datatype: datatype,
+        op: op,
+    ),
+    comm,
+    |func: &'static str, info: &CommInfo| {
+        let counts = counts(func, recvcounts, info.size());
+        reduce_scatter(func, info, sendbuf, recvbuf, counts, datatype, op)
+    }
+);
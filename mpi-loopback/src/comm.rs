@@ -0,0 +1,731 @@
+//! Communicators, groups and attributes.
+//!
+//! A communicator is a list of world ranks and a context that tags its messages. Contexts of
+//! new communicators are derived from the parent's context and a counter that every member
+//! advances in the same order, so no communication is needed to agree on them.
+
+use std::{
+    collections::{BTreeMap, HashMap},
+    ffi::CStr,
+    os::raw::{c_char, c_int, c_void},
+    sync::Arc,
+};
+
+use crate::{
+    abi::*,
+    collective,
+    state::{comm_rank, fatal, lock},
+};
+
+/// Set in the context of collective messages to keep them apart from point-to-point ones
+const COLLECTIVE_BIT: u64 = 1 << 63;
+
+const TAG_UB_VALUE: c_int = c_int::MAX;
+const WTIME_IS_GLOBAL_VALUE: c_int = 1;
+const HOST_VALUE: c_int = MPI_PROC_NULL;
+const IO_VALUE: c_int = MPI_ANY_SOURCE;
+
+/// What point-to-point and collective operations need to know about a communicator.
+#[derive(Clone)]
+pub struct CommInfo {
+    pub handle: MPI_Comm,
+    pub ctx: u64,
+    /// World rank of each rank of the communicator
+    pub ranks: Arc<[usize]>,
+    pub rank: usize,
+}
+
+impl CommInfo {
+    pub fn size(&self) -> usize {
+        self.ranks.len()
+    }
+
+    pub fn collective_ctx(&self) -> u64 {
+        self.ctx | COLLECTIVE_BIT
+    }
+
+    /// World rank of communicator rank `rank`.
+    pub fn world(&self, func: &str, rank: c_int) -> usize {
+        usize::try_from(rank)
+            .ok()
+            .and_then(|r| self.ranks.get(r).copied())
+            .unwrap_or_else(|| fatal(func, format!("invalid rank {}", rank)))
+    }
+
+    /// Communicator rank `rank` as an index, checked against the size.
+    pub fn index(&self, func: &str, rank: c_int) -> usize {
+        self.world(func, rank);
+        rank as usize
+    }
+}
+
+struct Comm {
+    info: CommInfo,
+    /// Number of communicators derived from this one so far
+    children: u64,
+    /// Number of collectives started on this communicator so far
+    collectives: c_int,
+    name: String,
+    attrs: BTreeMap<c_int, *mut c_void>,
+}
+
+#[derive(Copy, Clone)]
+struct Keyval {
+    copy_fn: usize,
+    delete_fn: usize,
+    extra_state: *mut c_void,
+}
+
+/// Registry of communicators, groups and attribute keys.
+pub struct Comms {
+    comms: HashMap<MPI_Comm, Comm>,
+    groups: HashMap<MPI_Group, Arc<[usize]>>,
+    keyvals: HashMap<c_int, Keyval>,
+    next_keyval: c_int,
+    /// Number of `MPI_Comm_create_group` calls per parent context and group
+    group_children: HashMap<(u64, Vec<usize>, c_int), u64>,
+    world_rank: usize,
+    universe_size: Box<c_int>,
+}
+
+fn derive_ctx(parent: u64, salt: u64) -> u64 {
+    // splitmix64 finalizer
+    let mut z = parent ^ salt.wrapping_mul(0x9e37_79b9_7f4a_7c15);
+    z = (z ^ (z >> 30)).wrapping_mul(0xbf58_476d_1ce4_e5b9);
+    z = (z ^ (z >> 27)).wrapping_mul(0x94d0_49bb_1331_11eb);
+    (z ^ (z >> 31)) & !COLLECTIVE_BIT
+}
+
+impl Comms {
+    pub fn new(rank: usize, size: usize) -> Self {
+        let mut comms = Comms {
+            comms: HashMap::new(),
+            groups: HashMap::new(),
+            keyvals: HashMap::new(),
+            next_keyval: 1000,
+            group_children: HashMap::new(),
+            world_rank: rank,
+            universe_size: Box::new(size as c_int),
+        };
+        comms.groups.insert(MPI_GROUP_EMPTY, Arc::from(Vec::new()));
+        comms.insert(
+            MPI_COMM_WORLD,
+            1,
+            (0..size).collect::<Vec<_>>().into(),
+            rank,
+        );
+        comms.insert(MPI_COMM_SELF, 2, Arc::from(vec![rank]), 0);
+        comms.comms.get_mut(&MPI_COMM_WORLD).unwrap().name = "MPI_COMM_WORLD".into();
+        comms.comms.get_mut(&MPI_COMM_SELF).unwrap().name = "MPI_COMM_SELF".into();
+        comms
+    }
+
+    fn insert(&mut self, handle: MPI_Comm, ctx: u64, ranks: Arc<[usize]>, rank: usize) {
+        self.comms.insert(
+            handle,
+            Comm {
+                info: CommInfo {
+                    handle,
+                    ctx,
+                    ranks,
+                    rank,
+                },
+                children: 0,
+                collectives: 0,
+                name: String::new(),
+                attrs: BTreeMap::new(),
+            },
+        );
+    }
+
+    fn comm(&mut self, func: &str, handle: MPI_Comm) -> &mut Comm {
+        self.comms
+            .get_mut(&handle)
+            .unwrap_or_else(|| fatal(func, format!("invalid communicator {:#x}", handle)))
+    }
+
+    pub fn info(&mut self, func: &str, handle: MPI_Comm) -> CommInfo {
+        self.comm(func, handle).info.clone()
+    }
+
+    /// Tag of the next collective on `handle`.
+    pub fn next_collective(&mut self, handle: MPI_Comm) -> c_int {
+        let comm = self.comm("collective", handle);
+        comm.collectives = comm.collectives.wrapping_add(1) & c_int::MAX;
+        comm.collectives
+    }
+
+    /// Context of the next communicator derived from `handle`.
+    fn next_child(&mut self, func: &str, handle: MPI_Comm, salt: u64) -> u64 {
+        let comm = self.comm(func, handle);
+        comm.children += 1;
+        derive_ctx(
+            comm.info.ctx,
+            comm.children.wrapping_mul(0x1_0000_0001) ^ salt,
+        )
+    }
+
+    pub fn group(&self, func: &str, handle: MPI_Group) -> Arc<[usize]> {
+        self.groups
+            .get(&handle)
+            .cloned()
+            .unwrap_or_else(|| fatal(func, format!("invalid group {:#x}", handle)))
+    }
+
+    fn keyval(&self, func: &str, keyval: c_int) -> Keyval {
+        *self
+            .keyvals
+            .get(&keyval)
+            .unwrap_or_else(|| fatal(func, format!("invalid attribute key {}", keyval)))
+    }
+}
+
+/// Register a new communicator of this process.
+fn create(ctx: u64, ranks: Arc<[usize]>) -> MPI_Comm {
+    let mut st = lock();
+    let rank = comm_rank(&ranks, st.rank);
+    let handle = st.new_handle();
+    st.comms.insert(handle, ctx, ranks, rank as usize);
+    handle
+}
+
+fn new_group(ranks: Vec<usize>) -> MPI_Group {
+    let mut st = lock();
+    let handle = st.new_handle();
+    st.comms.groups.insert(handle, ranks.into());
+    handle
+}
+
+unsafe fn slice<'a, T>(ptr: *const T, len: c_int) -> &'a [T] {
+    if len <= 0 {
+        &[]
+    } else {
+        std::slice::from_raw_parts(ptr, len as usize)
+    }
+}
+
+unsafe fn call_delete(comm: MPI_Comm, keyval: c_int, value: *mut c_void, key: Keyval) {
+    if key.delete_fn != 0 {
+        let delete: MPI_Comm_delete_attr_function = std::mem::transmute(key.delete_fn);
+        delete(comm, keyval, value, key.extra_state);
+    }
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_size(comm: MPI_Comm, size: *mut c_int) -> c_int {
+    *size = lock().comms.info("MPI_Comm_size", comm).size() as c_int;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_rank(comm: MPI_Comm, rank: *mut c_int) -> c_int {
+    *rank = lock().comms.info("MPI_Comm_rank", comm).rank as c_int;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_compare(
+    comm1: MPI_Comm,
+    comm2: MPI_Comm,
+    result: *mut c_int,
+) -> c_int {
+    let mut st = lock();
+    let a = st.comms.info("MPI_Comm_compare", comm1);
+    let b = st.comms.info("MPI_Comm_compare", comm2);
+    *result = if comm1 == comm2 {
+        MPI_IDENT
+    } else if a.ranks == b.ranks {
+        MPI_CONGRUENT
+    } else if a.size() == b.size() && a.ranks.iter().all(|r| b.ranks.contains(r)) {
+        MPI_SIMILAR
+    } else {
+        MPI_UNEQUAL
+    };
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_dup(comm: MPI_Comm, newcomm: *mut MPI_Comm) -> c_int {
+    let (ctx, ranks, attrs) = {
+        let mut st = lock();
+        let ctx = st.comms.next_child("MPI_Comm_dup", comm, 0);
+        let info = st.comms.info("MPI_Comm_dup", comm);
+        let attrs: Vec<_> = st
+            .comms
+            .comm("MPI_Comm_dup", comm)
+            .attrs
+            .clone()
+            .into_iter()
+            .collect();
+        let attrs: Vec<_> = attrs
+            .into_iter()
+            .map(|(k, v)| (k, v, st.comms.keyval("MPI_Comm_dup", k)))
+            .collect();
+        (ctx, info.ranks, attrs)
+    };
+    let handle = create(ctx, ranks);
+    let mut copied = BTreeMap::new();
+    for (keyval, value, key) in attrs {
+        match key.copy_fn {
+            MPI_NULL_COPY_FN => {}
+            MPI_DUP_FN => {
+                copied.insert(keyval, value);
+            }
+            copy_fn => {
+                let copy: MPI_Comm_copy_attr_function = std::mem::transmute(copy_fn);
+                let mut out = std::ptr::null_mut::<c_void>();
+                let mut flag = 0;
+                copy(
+                    comm,
+                    keyval,
+                    key.extra_state,
+                    value,
+                    &mut out as *mut _ as *mut c_void,
+                    &mut flag,
+                );
+                if flag != 0 {
+                    copied.insert(keyval, out);
+                }
+            }
+        }
+    }
+    lock().comms.comm("MPI_Comm_dup", handle).attrs = copied;
+    *newcomm = handle;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_split(
+    comm: MPI_Comm,
+    color: c_int,
+    key: c_int,
+    newcomm: *mut MPI_Comm,
+) -> c_int {
+    let (info, ctx) = {
+        let mut st = lock();
+        let info = st.comms.info("MPI_Comm_split", comm);
+        let ctx = st.comms.next_child("MPI_Comm_split", comm, color as u64);
+        (info, ctx)
+    };
+    let mine = [color.to_ne_bytes(), key.to_ne_bytes()].concat();
+    let all = collective::exchange(&info, mine);
+    if color == MPI_UNDEFINED {
+        *newcomm = MPI_COMM_NULL;
+        return MPI_SUCCESS;
+    }
+    let mut members: Vec<(c_int, usize)> = all
+        .iter()
+        .enumerate()
+        .filter_map(|(r, data)| {
+            let c = c_int::from_ne_bytes(data[0..4].try_into().unwrap());
+            let k = c_int::from_ne_bytes(data[4..8].try_into().unwrap());
+            (c == color).then_some((k, r))
+        })
+        .collect();
+    members.sort();
+    let ranks: Vec<usize> = members.into_iter().map(|(_, r)| info.ranks[r]).collect();
+    *newcomm = create(ctx, ranks.into());
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_split_type(
+    comm: MPI_Comm,
+    split_type: c_int,
+    key: c_int,
+    _info: Handle,
+    newcomm: *mut MPI_Comm,
+) -> c_int {
+    // All ranks share one node
+    let color = if split_type == MPI_UNDEFINED {
+        MPI_UNDEFINED
+    } else {
+        0
+    };
+    MPI_Comm_split(comm, color, key, newcomm)
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_create(
+    comm: MPI_Comm,
+    group: MPI_Group,
+    newcomm: *mut MPI_Comm,
+) -> c_int {
+    let (ctx, ranks, member) = {
+        let mut st = lock();
+        let ctx = st.comms.next_child("MPI_Comm_create", comm, 0);
+        let ranks = st.comms.group("MPI_Comm_create", group);
+        let member = ranks.contains(&st.rank);
+        (ctx, ranks, member)
+    };
+    *newcomm = if member {
+        create(ctx, ranks)
+    } else {
+        MPI_COMM_NULL
+    };
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_create_group(
+    comm: MPI_Comm,
+    group: MPI_Group,
+    tag: c_int,
+    newcomm: *mut MPI_Comm,
+) -> c_int {
+    let (ctx, ranks) = {
+        let mut st = lock();
+        let parent = st.comms.info("MPI_Comm_create_group", comm).ctx;
+        let ranks = st.comms.group("MPI_Comm_create_group", group);
+        if !ranks.contains(&st.rank) {
+            *newcomm = MPI_COMM_NULL;
+            return MPI_SUCCESS;
+        }
+        let n = st
+            .comms
+            .group_children
+            .entry((parent, ranks.to_vec(), tag))
+            .or_insert(0);
+        *n += 1;
+        let salt = ranks
+            .iter()
+            .fold(*n ^ (tag as u64) << 32, |h, &r| derive_ctx(h, r as u64 + 1));
+        (derive_ctx(parent, salt), ranks)
+    };
+    *newcomm = create(ctx, ranks);
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_free(comm: *mut MPI_Comm) -> c_int {
+    if *comm == MPI_COMM_WORLD || *comm == MPI_COMM_SELF {
+        fatal("MPI_Comm_free", "cannot free a predefined communicator");
+    }
+    let attrs: Vec<_> = {
+        let mut st = lock();
+        let attrs = std::mem::take(&mut st.comms.comm("MPI_Comm_free", *comm).attrs);
+        attrs
+            .into_iter()
+            .map(|(k, v)| (k, v, st.comms.keyval("MPI_Comm_free", k)))
+            .collect()
+    };
+    for (keyval, value, key) in attrs {
+        call_delete(*comm, keyval, value, key);
+    }
+    lock().comms.comms.remove(&*comm);
+    *comm = MPI_COMM_NULL;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_disconnect(comm: *mut MPI_Comm) -> c_int {
+    MPI_Comm_free(comm)
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_get_parent(parent: *mut MPI_Comm) -> c_int {
+    *parent = MPI_COMM_NULL;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_test_inter(comm: MPI_Comm, flag: *mut c_int) -> c_int {
+    lock().comms.info("MPI_Comm_test_inter", comm);
+    *flag = 0;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Topo_test(comm: MPI_Comm, status: *mut c_int) -> c_int {
+    lock().comms.info("MPI_Topo_test", comm);
+    *status = MPI_UNDEFINED;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_group(comm: MPI_Comm, group: *mut MPI_Group) -> c_int {
+    let ranks = lock().comms.info("MPI_Comm_group", comm).ranks;
+    *group = new_group(ranks.to_vec());
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_set_name(comm: MPI_Comm, name: *const c_char) -> c_int {
+    let name = CStr::from_ptr(name).to_string_lossy().into_owned();
+    lock().comms.comm("MPI_Comm_set_name", comm).name = name;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_get_name(
+    comm: MPI_Comm,
+    name: *mut c_char,
+    resultlen: *mut c_int,
+) -> c_int {
+    let mut st = lock();
+    let bytes = st.comms.comm("MPI_Comm_get_name", comm).name.as_bytes();
+    let len = bytes.len().min(MPI_MAX_OBJECT_NAME - 1);
+    std::ptr::copy_nonoverlapping(bytes.as_ptr() as *const c_char, name, len);
+    *name.add(len) = 0;
+    *resultlen = len as c_int;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_create_keyval(
+    copy_fn: usize,
+    delete_fn: usize,
+    keyval: *mut c_int,
+    extra_state: *mut c_void,
+) -> c_int {
+    let mut st = lock();
+    st.comms.next_keyval += 1;
+    *keyval = st.comms.next_keyval;
+    st.comms.keyvals.insert(
+        *keyval,
+        Keyval {
+            copy_fn,
+            delete_fn,
+            extra_state,
+        },
+    );
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_free_keyval(keyval: *mut c_int) -> c_int {
+    // The key stays registered for the attributes that still use it
+    lock().comms.keyval("MPI_Comm_free_keyval", *keyval);
+    *keyval = MPI_KEYVAL_INVALID;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_set_attr(
+    comm: MPI_Comm,
+    keyval: c_int,
+    attribute_val: *mut c_void,
+) -> c_int {
+    let old = {
+        let mut st = lock();
+        let key = st.comms.keyval("MPI_Comm_set_attr", keyval);
+        let old = st
+            .comms
+            .comm("MPI_Comm_set_attr", comm)
+            .attrs
+            .insert(keyval, attribute_val);
+        old.map(|v| (v, key))
+    };
+    if let Some((value, key)) = old {
+        call_delete(comm, keyval, value, key);
+    }
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_get_attr(
+    comm: MPI_Comm,
+    keyval: c_int,
+    attribute_val: *mut c_void,
+    flag: *mut c_int,
+) -> c_int {
+    let mut st = lock();
+    let predefined: Option<*const c_int> = match keyval {
+        MPI_TAG_UB => Some(&TAG_UB_VALUE),
+        MPI_WTIME_IS_GLOBAL => Some(&WTIME_IS_GLOBAL_VALUE),
+        MPI_HOST => Some(&HOST_VALUE),
+        MPI_IO => Some(&IO_VALUE),
+        MPI_UNIVERSE_SIZE => Some(&*st.comms.universe_size),
+        _ => None,
+    };
+    let value = match predefined {
+        Some(value) => Some(value as *mut c_void),
+        None => st
+            .comms
+            .comm("MPI_Comm_get_attr", comm)
+            .attrs
+            .get(&keyval)
+            .copied(),
+    };
+    *flag = value.is_some().into();
+    if let Some(value) = value {
+        *(attribute_val as *mut *mut c_void) = value;
+    }
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Comm_delete_attr(comm: MPI_Comm, keyval: c_int) -> c_int {
+    let old = {
+        let mut st = lock();
+        let key = st.comms.keyval("MPI_Comm_delete_attr", keyval);
+        let old = st
+            .comms
+            .comm("MPI_Comm_delete_attr", comm)
+            .attrs
+            .remove(&keyval);
+        old.map(|v| (v, key))
+    };
+    if let Some((value, key)) = old {
+        call_delete(comm, keyval, value, key);
+    }
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Group_size(group: MPI_Group, size: *mut c_int) -> c_int {
+    *size = lock().comms.group("MPI_Group_size", group).len() as c_int;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Group_rank(group: MPI_Group, rank: *mut c_int) -> c_int {
+    let st = lock();
+    *rank = comm_rank(
+        &st.comms.group("MPI_Group_rank", group),
+        st.comms.world_rank,
+    );
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Group_incl(
+    group: MPI_Group,
+    n: c_int,
+    ranks: *const c_int,
+    newgroup: *mut MPI_Group,
+) -> c_int {
+    let old = lock().comms.group("MPI_Group_incl", group);
+    let new = slice(ranks, n)
+        .iter()
+        .map(|&r| {
+            *usize::try_from(r)
+                .ok()
+                .and_then(|r| old.get(r))
+                .unwrap_or_else(|| fatal("MPI_Group_incl", format!("invalid rank {}", r)))
+        })
+        .collect();
+    *newgroup = new_group(new);
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Group_excl(
+    group: MPI_Group,
+    n: c_int,
+    ranks: *const c_int,
+    newgroup: *mut MPI_Group,
+) -> c_int {
+    let old = lock().comms.group("MPI_Group_excl", group);
+    let excluded = slice(ranks, n);
+    let new = old
+        .iter()
+        .enumerate()
+        .filter(|&(r, _)| !excluded.contains(&(r as c_int)))
+        .map(|(_, &w)| w)
+        .collect();
+    *newgroup = new_group(new);
+    MPI_SUCCESS
+}
+
+unsafe fn group_op(
+    func: &str,
+    group1: MPI_Group,
+    group2: MPI_Group,
+    newgroup: *mut MPI_Group,
+    combine: impl FnOnce(&[usize], &[usize]) -> Vec<usize>,
+) -> c_int {
+    let (a, b) = {
+        let st = lock();
+        (st.comms.group(func, group1), st.comms.group(func, group2))
+    };
+    *newgroup = new_group(combine(&a, &b));
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Group_union(
+    group1: MPI_Group,
+    group2: MPI_Group,
+    newgroup: *mut MPI_Group,
+) -> c_int {
+    group_op("MPI_Group_union", group1, group2, newgroup, |a, b| {
+        let mut new = a.to_vec();
+        new.extend(b.iter().filter(|r| !a.contains(r)));
+        new
+    })
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Group_intersection(
+    group1: MPI_Group,
+    group2: MPI_Group,
+    newgroup: *mut MPI_Group,
+) -> c_int {
+    group_op(
+        "MPI_Group_intersection",
+        group1,
+        group2,
+        newgroup,
+        |a, b| a.iter().filter(|r| b.contains(r)).copied().collect(),
+    )
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Group_difference(
+    group1: MPI_Group,
+    group2: MPI_Group,
+    newgroup: *mut MPI_Group,
+) -> c_int {
+    group_op("MPI_Group_difference", group1, group2, newgroup, |a, b| {
+        a.iter().filter(|r| !b.contains(r)).copied().collect()
+    })
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Group_compare(
+    group1: MPI_Group,
+    group2: MPI_Group,
+    result: *mut c_int,
+) -> c_int {
+    let st = lock();
+    let a = st.comms.group("MPI_Group_compare", group1);
+    let b = st.comms.group("MPI_Group_compare", group2);
+    *result = if a == b {
+        MPI_IDENT
+    } else if a.len() == b.len() && a.iter().all(|r| b.contains(r)) {
+        MPI_SIMILAR
+    } else {
+        MPI_UNEQUAL
+    };
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Group_translate_ranks(
+    group1: MPI_Group,
+    n: c_int,
+    ranks1: *const c_int,
+    group2: MPI_Group,
+    ranks2: *mut c_int,
+) -> c_int {
+    let st = lock();
+    let a = st.comms.group("MPI_Group_translate_ranks", group1);
+    let b = st.comms.group("MPI_Group_translate_ranks", group2);
+    for (i, &r) in slice(ranks1, n).iter().enumerate() {
+        *ranks2.add(i) = match r {
+            MPI_PROC_NULL => MPI_PROC_NULL,
+            r => comm_rank(&b, a[r as usize]),
+        };
+    }
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Group_free(group: *mut MPI_Group) -> c_int {
+    if *group != MPI_GROUP_EMPTY && lock().comms.groups.remove(&*group).is_none() {
+        fatal("MPI_Group_free", format!("invalid group {:#x}", *group));
+    }
+    *group = MPI_GROUP_NULL;
+    MPI_SUCCESS
+}
@@ -0,0 +1,590 @@
+//! Datatypes as lists of contiguous byte blocks, and the `MPI_Type_*` functions.
+
+use std::{
+    collections::HashMap,
+    os::raw::{c_int, c_void},
+    sync::{Arc, OnceLock},
+};
+
+use crate::{
+    abi::{datatype::*, *},
+    state::{fatal, lock},
+};
+
+/// The element type of a datatype, as far as reductions are concerned.
+#[derive(Copy, Clone, Debug, PartialEq, Eq)]
+pub enum Basic {
+    I8,
+    U8,
+    I16,
+    U16,
+    I32,
+    U32,
+    I64,
+    U64,
+    F32,
+    F64,
+    C32,
+    C64,
+    Bool,
+    FloatInt,
+    DoubleInt,
+    LongInt,
+    TwoInt,
+    ShortInt,
+    /// A type without predefined reductions, e.g. `MPI_LONG_DOUBLE`
+    Opaque(usize),
+}
+
+impl Basic {
+    /// Size of one element in packed form
+    pub fn size(self) -> usize {
+        match self {
+            Basic::I8 | Basic::U8 | Basic::Bool => 1,
+            Basic::I16 | Basic::U16 => 2,
+            Basic::I32 | Basic::U32 | Basic::F32 => 4,
+            Basic::I64 | Basic::U64 | Basic::F64 | Basic::C32 => 8,
+            Basic::C64 => 16,
+            Basic::FloatInt | Basic::TwoInt => 8,
+            Basic::DoubleInt | Basic::LongInt => 12,
+            Basic::ShortInt => 6,
+            Basic::Opaque(size) => size,
+        }
+    }
+
+    /// The blocks of one element in memory, and its extent
+    fn layout(self) -> (Vec<(isize, usize)>, isize) {
+        match self {
+            Basic::FloatInt | Basic::TwoInt => (vec![(0, 8)], 8),
+            Basic::DoubleInt | Basic::LongInt => (vec![(0, 12)], 16),
+            Basic::ShortInt => (vec![(0, 2), (4, 4)], 8),
+            _ => (vec![(0, self.size())], self.size() as isize),
+        }
+    }
+
+    fn align(self) -> usize {
+        match self {
+            Basic::C32 => 4,
+            Basic::C64 | Basic::DoubleInt | Basic::LongInt => 8,
+            Basic::FloatInt | Basic::TwoInt | Basic::ShortInt => 4,
+            _ => self.size().clamp(1, 8),
+        }
+    }
+}
+
+/// A datatype: the blocks of one element relative to the buffer pointer, and its bounds.
+#[derive(Clone, Debug)]
+pub struct Datatype {
+    /// Bytes of data in one element
+    pub size: usize,
+    pub lb: isize,
+    pub extent: isize,
+    pub true_lb: isize,
+    pub true_ub: isize,
+    blocks: Vec<(isize, usize)>,
+    /// The element type if all data in the type has the same one
+    pub basic: Option<Basic>,
+    align: usize,
+}
+
+impl Datatype {
+    fn predefined(basic: Basic) -> Self {
+        let (blocks, extent) = basic.layout();
+        Datatype {
+            size: basic.size(),
+            lb: 0,
+            extent,
+            true_lb: 0,
+            true_ub: blocks.last().map_or(0, |&(o, l)| o + l as isize),
+            blocks,
+            basic: Some(basic),
+            align: basic.align(),
+        }
+    }
+
+    /// A type made of `count` elements of `dt` at each displacement, in order.
+    fn compose(parts: &[(isize, &Datatype, usize)], pad: bool) -> Self {
+        let mut blocks: Vec<(isize, usize)> = Vec::new();
+        let mut bounds: Option<(isize, isize)> = None;
+        let mut basic = None;
+        let mut mixed = false;
+        let mut align = 1;
+        for &(disp, dt, count) in parts {
+            if count == 0 {
+                continue;
+            }
+            let last = disp + (count as isize - 1) * dt.extent;
+            let (lo, hi) = (disp.min(last) + dt.lb, disp.max(last) + dt.lb + dt.extent);
+            bounds = Some(bounds.map_or((lo, hi), |(l, u)| (l.min(lo), u.max(hi))));
+            match (basic, dt.basic) {
+                (_, None) => mixed = true,
+                (None, b) => basic = b,
+                (Some(a), Some(b)) if a != b => mixed = true,
+                _ => {}
+            }
+            align = align.max(dt.align);
+            for i in 0..count as isize {
+                for &(off, len) in &dt.blocks {
+                    let off = disp + i * dt.extent + off;
+                    match blocks.last_mut() {
+                        Some((o, l)) if *o + *l as isize == off => *l += len,
+                        _ => blocks.push((off, len)),
+                    }
+                }
+            }
+        }
+        let (lb, mut ub) = bounds.unwrap_or((0, 0));
+        if pad && (ub - lb) % align as isize != 0 {
+            ub += align as isize - (ub - lb) % align as isize;
+        }
+        let true_lb = blocks.iter().map(|&(o, _)| o).min().unwrap_or(0);
+        let true_ub = blocks
+            .iter()
+            .map(|&(o, l)| o + l as isize)
+            .max()
+            .unwrap_or(0);
+        Datatype {
+            size: blocks.iter().map(|&(_, l)| l).sum(),
+            lb,
+            extent: ub - lb,
+            true_lb,
+            true_ub,
+            blocks,
+            basic: if mixed { None } else { basic },
+            align,
+        }
+    }
+
+    /// Whether `count` elements occupy `count * size` contiguous bytes starting at the first
+    /// block.
+    pub fn is_contiguous(&self) -> bool {
+        self.blocks.len() == 1 && self.extent == self.size as isize
+    }
+
+    /// Offset of the first byte of a contiguous type
+    pub fn offset(&self) -> isize {
+        self.blocks.first().map_or(0, |&(o, _)| o)
+    }
+
+    /// Append `count` elements at `buf` to `out` in packed form.
+    pub unsafe fn pack_into(&self, buf: *const c_void, count: usize, out: &mut Vec<u8>) {
+        let buf = buf as *const u8;
+        if self.is_contiguous() {
+            let data =
+                std::slice::from_raw_parts(buf.wrapping_offset(self.offset()), count * self.size);
+            out.extend_from_slice(data);
+            return;
+        }
+        out.reserve(count * self.size);
+        for i in 0..count as isize {
+            for &(off, len) in &self.blocks {
+                let p = buf.wrapping_offset(i * self.extent + off);
+                out.extend_from_slice(std::slice::from_raw_parts(p, len));
+            }
+        }
+    }
+
+    /// `count` elements at `buf` in packed form.
+    pub unsafe fn pack(&self, buf: *const c_void, count: usize) -> Vec<u8> {
+        let mut out = Vec::new();
+        self.pack_into(buf, count, &mut out);
+        out
+    }
+
+    /// Unpack `data` into at most `count` elements at `buf`.
+    ///
+    /// Returns the number of bytes that did not fit.
+    pub unsafe fn unpack(&self, data: &[u8], buf: *mut c_void, count: usize) -> usize {
+        let buf = buf as *mut u8;
+        let fits = data.len().min(count * self.size);
+        if self.is_contiguous() {
+            let p = buf.wrapping_offset(self.offset());
+            std::ptr::copy_nonoverlapping(data.as_ptr(), p, fits);
+            return data.len() - fits;
+        }
+        let mut data_pos = 0;
+        'elements: for i in 0..count as isize {
+            for &(off, len) in &self.blocks {
+                if data_pos == fits {
+                    break 'elements;
+                }
+                let len = len.min(fits - data_pos);
+                let p = buf.wrapping_offset(i * self.extent + off);
+                std::ptr::copy_nonoverlapping(data.as_ptr().add(data_pos), p, len);
+                data_pos += len;
+            }
+        }
+        data.len() - fits
+    }
+
+    /// A buffer of `count` elements in memory layout, and the offset of the element pointer
+    /// within it.
+    pub fn layout_buffer(&self, count: usize) -> (Vec<u128>, isize) {
+        if count == 0 {
+            return (Vec::new(), 0);
+        }
+        let span = (count as isize - 1) * self.extent + (self.true_ub - self.true_lb);
+        let words = (span.max(0) as usize).div_ceil(16);
+        (vec![0; words], -self.true_lb)
+    }
+}
+
+fn predefined_types() -> &'static HashMap<MPI_Datatype, Arc<Datatype>> {
+    static TYPES: OnceLock<HashMap<MPI_Datatype, Arc<Datatype>>> = OnceLock::new();
+    TYPES.get_or_init(|| {
+        // `long` and the MPI address types are 64-bit on every target this library builds for
+        [
+            (MPI_CHAR, Basic::I8),
+            (MPI_SIGNED_CHAR, Basic::I8),
+            (MPI_INT8_T, Basic::I8),
+            (MPI_UNSIGNED_CHAR, Basic::U8),
+            (MPI_UINT8_T, Basic::U8),
+            (MPI_BYTE, Basic::U8),
+            (MPI_PACKED, Basic::U8),
+            (MPI_SHORT, Basic::I16),
+            (MPI_INT16_T, Basic::I16),
+            (MPI_UNSIGNED_SHORT, Basic::U16),
+            (MPI_UINT16_T, Basic::U16),
+            (MPI_INT, Basic::I32),
+            (MPI_INT32_T, Basic::I32),
+            (MPI_WCHAR, Basic::I32),
+            (MPI_UNSIGNED, Basic::U32),
+            (MPI_UINT32_T, Basic::U32),
+            (MPI_LONG, Basic::I64),
+            (MPI_LONG_LONG, Basic::I64),
+            (MPI_INT64_T, Basic::I64),
+            (MPI_AINT, Basic::I64),
+            (MPI_COUNT, Basic::I64),
+            (MPI_OFFSET, Basic::I64),
+            (MPI_UNSIGNED_LONG, Basic::U64),
+            (MPI_UNSIGNED_LONG_LONG, Basic::U64),
+            (MPI_UINT64_T, Basic::U64),
+            (MPI_FLOAT, Basic::F32),
+            (MPI_DOUBLE, Basic::F64),
+            (MPI_C_FLOAT_COMPLEX, Basic::C32),
+            (MPI_CXX_FLOAT_COMPLEX, Basic::C32),
+            (MPI_C_DOUBLE_COMPLEX, Basic::C64),
+            (MPI_CXX_DOUBLE_COMPLEX, Basic::C64),
+            (MPI_C_BOOL, Basic::Bool),
+            (MPI_CXX_BOOL, Basic::Bool),
+            (MPI_LONG_DOUBLE, Basic::Opaque(16)),
+            (MPI_C_LONG_DOUBLE_COMPLEX, Basic::Opaque(32)),
+            (MPI_FLOAT_INT, Basic::FloatInt),
+            (MPI_DOUBLE_INT, Basic::DoubleInt),
+            (MPI_LONG_INT, Basic::LongInt),
+            (MPI_2INT, Basic::TwoInt),
+            (MPI_SHORT_INT, Basic::ShortInt),
+        ]
+        .into_iter()
+        .map(|(handle, basic)| (handle, Arc::new(Datatype::predefined(basic))))
+        .collect()
+    })
+}
+
+/// Registry of the derived datatypes.
+#[derive(Default)]
+pub struct Datatypes {
+    derived: HashMap<MPI_Datatype, Arc<Datatype>>,
+}
+
+impl Datatypes {
+    pub fn get(&self, func: &str, handle: MPI_Datatype) -> Arc<Datatype> {
+        self.derived
+            .get(&handle)
+            .or_else(|| predefined_types().get(&handle))
+            .cloned()
+            .unwrap_or_else(|| fatal(func, format!("invalid datatype {:#x}", handle)))
+    }
+
+    fn is_predefined(handle: MPI_Datatype) -> bool {
+        predefined_types().contains_key(&handle)
+    }
+}
+
+/// The datatype of `handle`.
+pub fn get(func: &str, handle: MPI_Datatype) -> Arc<Datatype> {
+    match predefined_types().get(&handle) {
+        Some(dt) => dt.clone(),
+        None => lock().datatypes.get(func, handle),
+    }
+}
+
+unsafe fn create(newtype: *mut MPI_Datatype, dt: Datatype) -> c_int {
+    let mut st = lock();
+    let handle = st.new_handle();
+    st.datatypes.derived.insert(handle, Arc::new(dt));
+    *newtype = handle;
+    MPI_SUCCESS
+}
+
+unsafe fn slice<'a, T>(ptr: *const T, len: c_int) -> &'a [T] {
+    if len <= 0 {
+        &[]
+    } else {
+        std::slice::from_raw_parts(ptr, len as usize)
+    }
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Type_size(datatype: MPI_Datatype, size: *mut c_int) -> c_int {
+    *size = get("MPI_Type_size", datatype).size as c_int;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Type_size_c(datatype: MPI_Datatype, size: *mut MPI_Count) -> c_int {
+    *size = get("MPI_Type_size_c", datatype).size as MPI_Count;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Type_get_extent(
+    datatype: MPI_Datatype,
+    lb: *mut MPI_Aint,
+    extent: *mut MPI_Aint,
+) -> c_int {
+    let dt = get("MPI_Type_get_extent", datatype);
+    *lb = dt.lb;
+    *extent = dt.extent;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Type_get_true_extent(
+    datatype: MPI_Datatype,
+    true_lb: *mut MPI_Aint,
+    true_extent: *mut MPI_Aint,
+) -> c_int {
+    let dt = get("MPI_Type_get_true_extent", datatype);
+    *true_lb = dt.true_lb;
+    *true_extent = dt.true_ub - dt.true_lb;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Type_contiguous(
+    count_: c_int,
+    oldtype: MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    let n = count("MPI_Type_contiguous", count_);
+    let old = get("MPI_Type_contiguous", oldtype);
+    create(newtype, Datatype::compose(&[(0, &old, n)], false))
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Type_vector(
+    count_: c_int,
+    blocklength: c_int,
+    stride: c_int,
+    oldtype: MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    let old = get("MPI_Type_vector", oldtype);
+    MPI_Type_create_hvector(
+        count_,
+        blocklength,
+        stride as MPI_Aint * old.extent,
+        oldtype,
+        newtype,
+    )
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Type_create_hvector(
+    count_: c_int,
+    blocklength: c_int,
+    stride: MPI_Aint,
+    oldtype: MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    let n = count("MPI_Type_create_hvector", count_);
+    let len = count("MPI_Type_create_hvector", blocklength);
+    let old = get("MPI_Type_create_hvector", oldtype);
+    let parts: Vec<_> = (0..n as isize).map(|i| (i * stride, &*old, len)).collect();
+    create(newtype, Datatype::compose(&parts, false))
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Type_indexed(
+    count_: c_int,
+    blocklengths: *const c_int,
+    displacements: *const c_int,
+    oldtype: MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    let old = get("MPI_Type_indexed", oldtype);
+    let displs: Vec<MPI_Aint> = slice(displacements, count_)
+        .iter()
+        .map(|&d| d as MPI_Aint * old.extent)
+        .collect();
+    MPI_Type_create_hindexed(count_, blocklengths, displs.as_ptr(), oldtype, newtype)
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Type_create_hindexed(
+    count_: c_int,
+    blocklengths: *const c_int,
+    displacements: *const MPI_Aint,
+    oldtype: MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    let old = get("MPI_Type_create_hindexed", oldtype);
+    let parts: Vec<_> = slice(displacements, count_)
+        .iter()
+        .zip(slice(blocklengths, count_))
+        .map(|(&d, &l)| (d, &*old, count("MPI_Type_create_hindexed", l)))
+        .collect();
+    create(newtype, Datatype::compose(&parts, false))
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Type_create_indexed_block(
+    count_: c_int,
+    blocklength: c_int,
+    displacements: *const c_int,
+    oldtype: MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    let old = get("MPI_Type_create_indexed_block", oldtype);
+    let displs: Vec<MPI_Aint> = slice(displacements, count_)
+        .iter()
+        .map(|&d| d as MPI_Aint * old.extent)
+        .collect();
+    MPI_Type_create_hindexed_block(count_, blocklength, displs.as_ptr(), oldtype, newtype)
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Type_create_hindexed_block(
+    count_: c_int,
+    blocklength: c_int,
+    displacements: *const MPI_Aint,
+    oldtype: MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    let len = count("MPI_Type_create_hindexed_block", blocklength);
+    let old = get("MPI_Type_create_hindexed_block", oldtype);
+    let parts: Vec<_> = slice(displacements, count_)
+        .iter()
+        .map(|&d| (d, &*old, len))
+        .collect();
+    create(newtype, Datatype::compose(&parts, false))
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Type_create_struct(
+    count_: c_int,
+    blocklengths: *const c_int,
+    displacements: *const MPI_Aint,
+    types: *const MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    let olds: Vec<_> = slice(types, count_)
+        .iter()
+        .map(|&t| get("MPI_Type_create_struct", t))
+        .collect();
+    let parts: Vec<_> = slice(displacements, count_)
+        .iter()
+        .zip(slice(blocklengths, count_))
+        .zip(&olds)
+        .map(|((&d, &l), old)| (d, &**old, count("MPI_Type_create_struct", l)))
+        .collect();
+    create(newtype, Datatype::compose(&parts, true))
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Type_create_resized(
+    oldtype: MPI_Datatype,
+    lb: MPI_Aint,
+    extent: MPI_Aint,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    let mut dt = (*get("MPI_Type_create_resized", oldtype)).clone();
+    dt.lb = lb;
+    dt.extent = extent;
+    create(newtype, dt)
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Type_dup(oldtype: MPI_Datatype, newtype: *mut MPI_Datatype) -> c_int {
+    let dt = (*get("MPI_Type_dup", oldtype)).clone();
+    create(newtype, dt)
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Type_commit(datatype: *mut MPI_Datatype) -> c_int {
+    get("MPI_Type_commit", *datatype);
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Type_free(datatype: *mut MPI_Datatype) -> c_int {
+    if Datatypes::is_predefined(*datatype) || lock().datatypes.derived.remove(&*datatype).is_none()
+    {
+        fatal(
+            "MPI_Type_free",
+            format!("invalid datatype {:#x}", *datatype),
+        );
+    }
+    *datatype = MPI_DATATYPE_NULL;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Get_address(location: *const c_void, address: *mut MPI_Aint) -> c_int {
+    *address = location as MPI_Aint;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Pack(
+    inbuf: *const c_void,
+    incount: c_int,
+    datatype: MPI_Datatype,
+    outbuf: *mut c_void,
+    outsize: c_int,
+    position: *mut c_int,
+    _comm: MPI_Comm,
+) -> c_int {
+    let data = get("MPI_Pack", datatype).pack(inbuf, count("MPI_Pack", incount));
+    let pos = count("MPI_Pack", *position);
+    if pos + data.len() > count("MPI_Pack", outsize) {
+        fatal("MPI_Pack", "output buffer too small");
+    }
+    std::ptr::copy_nonoverlapping(data.as_ptr(), (outbuf as *mut u8).add(pos), data.len());
+    *position = (pos + data.len()) as c_int;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Unpack(
+    inbuf: *const c_void,
+    insize: c_int,
+    position: *mut c_int,
+    outbuf: *mut c_void,
+    outcount: c_int,
+    datatype: MPI_Datatype,
+    _comm: MPI_Comm,
+) -> c_int {
+    let dt = get("MPI_Unpack", datatype);
+    let pos = count("MPI_Unpack", *position);
+    let len = dt.size * count("MPI_Unpack", outcount);
+    if pos + len > count("MPI_Unpack", insize) {
+        fatal("MPI_Unpack", "input buffer too small");
+    }
+    let data = std::slice::from_raw_parts((inbuf as *const u8).add(pos), len);
+    dt.unpack(data, outbuf, count("MPI_Unpack", outcount));
+    *position = (pos + len) as c_int;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Pack_size(
+    incount: c_int,
+    datatype: MPI_Datatype,
+    _comm: MPI_Comm,
+    size: *mut c_int,
+) -> c_int {
+    *size = (get("MPI_Pack_size", datatype).size * count("MPI_Pack_size", incount)) as c_int;
+    MPI_SUCCESS
+}
@@ -0,0 +1,160 @@
+//! Initialization, finalization and environment queries.
+
+use std::{
+    os::raw::{c_char, c_int},
+    sync::OnceLock,
+    thread,
+    time::Instant,
+};
+
+use crate::{
+    abi::*,
+    collective::MPI_Barrier,
+    state::{self, fatal, lock, try_lock},
+};
+
+/// Environment variable with the number of ranks to start
+const NP_VAR: &str = "MPI_LOOPBACK_NP";
+
+const LIBRARY_VERSION: &str = concat!("mpi-loopback ", env!("CARGO_PKG_VERSION"));
+
+fn epoch() -> Instant {
+    static EPOCH: OnceLock<Instant> = OnceLock::new();
+    *EPOCH.get_or_init(Instant::now)
+}
+
+fn init(func: &str, required: c_int) -> c_int {
+    if try_lock().is_some() {
+        fatal(func, "MPI is already initialized");
+    }
+    let size = match std::env::var(NP_VAR) {
+        Ok(np) => np
+            .parse()
+            .ok()
+            .filter(|&np: &usize| np > 0)
+            .unwrap_or_else(|| fatal(func, format!("invalid {}={:?}", NP_VAR, np))),
+        Err(_) => 1,
+    };
+    epoch();
+    let provided = required.clamp(MPI_THREAD_SINGLE, MPI_THREAD_MULTIPLE);
+    state::start(size, provided);
+    provided
+}
+
+/// Copy `s` into a C string buffer of `capacity` bytes.
+unsafe fn write_string(s: &str, buf: *mut c_char, capacity: usize, resultlen: *mut c_int) {
+    let len = s.len().min(capacity - 1);
+    std::ptr::copy_nonoverlapping(s.as_ptr() as *const c_char, buf, len);
+    *buf.add(len) = 0;
+    *resultlen = len as c_int;
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Init(_argc: *mut c_int, _argv: *mut *mut *mut c_char) -> c_int {
+    init("MPI_Init", MPI_THREAD_SINGLE);
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Init_thread(
+    _argc: *mut c_int,
+    _argv: *mut *mut *mut c_char,
+    required: c_int,
+    provided: *mut c_int,
+) -> c_int {
+    *provided = init("MPI_Init_thread", required);
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Initialized(flag: *mut c_int) -> c_int {
+    *flag = try_lock().is_some().into();
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Finalized(flag: *mut c_int) -> c_int {
+    *flag = try_lock().is_some_and(|st| st.finalized).into();
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Finalize() -> c_int {
+    MPI_Barrier(MPI_COMM_WORLD);
+    state::finish();
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Query_thread(provided: *mut c_int) -> c_int {
+    *provided = lock().thread_level;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Is_thread_main(flag: *mut c_int) -> c_int {
+    *flag = (lock().main_thread == thread::current().id()).into();
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Abort(_comm: MPI_Comm, errorcode: c_int) -> c_int {
+    eprintln!(
+        "mpi-loopback: MPI_Abort called with error code {}",
+        errorcode
+    );
+    std::process::exit(errorcode)
+}
+
+#[no_mangle]
+pub extern "C" fn MPI_Wtime() -> f64 {
+    epoch().elapsed().as_secs_f64()
+}
+
+#[no_mangle]
+pub extern "C" fn MPI_Wtick() -> f64 {
+    1e-9
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Get_processor_name(name: *mut c_char, resultlen: *mut c_int) -> c_int {
+    let mut buf = [0u8; MPI_MAX_PROCESSOR_NAME];
+    libc::gethostname(buf.as_mut_ptr() as *mut c_char, buf.len() - 1);
+    let len = buf.iter().position(|&b| b == 0).unwrap_or(0);
+    let host = String::from_utf8_lossy(&buf[..len]);
+    write_string(&host, name, MPI_MAX_PROCESSOR_NAME, resultlen);
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Get_library_version(
+    version: *mut c_char,
+    resultlen: *mut c_int,
+) -> c_int {
+    write_string(
+        LIBRARY_VERSION,
+        version,
+        MPI_MAX_LIBRARY_VERSION_STRING,
+        resultlen,
+    );
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Get_version(version: *mut c_int, subversion: *mut c_int) -> c_int {
+    *version = 3;
+    *subversion = 1;
+    MPI_SUCCESS
+}
+
+/// Version of the standard ABI this library implements; its presence marks the library as a
+/// standard ABI implementation for `mpi-rt-sys`.
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Abi_get_version(
+    abi_major: *mut c_int,
+    abi_minor: *mut c_int,
+) -> c_int {
+    *abi_major = 1;
+    *abi_minor = 0;
+    MPI_SUCCESS
+}
@@ -0,0 +1,41 @@
+//! A single-machine MPI library for testing and benchmarking `mpi-rt-sys` without a real MPI.
+//!
+//! The library implements a subset of the MPI standard ABI (`mpi_abi.h`) and exports
+//! `MPI_Abi_get_version`, so `mpi-rt-sys` loads it like any other standard ABI implementation:
+//!
+//! ```text
+//! cargo build -p mpi-loopback
+//! MPI_RT_LIB=target/debug/libmpi_loopback.so MPI_LOOPBACK_NP=3 target/debug/examples/broadcast
+//! ```
+//!
+//! `MPI_Init` forks the calling process into `MPI_LOOPBACK_NP` ranks (default 1); the original
+//! process becomes rank 0 and waits for the others in `MPI_Finalize`, exiting with the status of
+//! the first rank that failed. No launcher is needed.
+//!
+//! # Scope
+//!
+//! - Point-to-point communication in all send modes, probes and matched probes, persistent
+//!   requests, and all wait and test variants
+//! - Blocking and non-blocking collectives on intra-communicators: barrier, broadcast, gather(v),
+//!   scatter(v), allgather(v), all-to-all(v), reduce, allreduce, scan, exscan and
+//!   reduce-scatter
+//! - Derived datatypes, predefined and user-defined operations, groups, communicator
+//!   construction and attributes
+//!
+//! Sends are buffered eagerly, so all send modes complete locally. Collectives use linear
+//! algorithms and reduce in rank order, which keeps results and timings deterministic. Errors
+//! are always fatal. Topologies, one-sided communication, I/O and dynamic processes are not
+//! implemented; `mpi-rt-sys` reports calls to them as missing functions.
+//!
+//! Because ranks are forked, `MPI_Init` must be called before the process starts any threads.
+#![cfg(unix)]
+#![allow(non_snake_case, non_camel_case_types, clippy::missing_safety_doc)]
+
+mod abi;
+mod collective;
+mod comm;
+mod datatype;
+mod env;
+mod op;
+mod p2p;
+mod state;
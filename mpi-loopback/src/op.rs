@@ -0,0 +1,377 @@
+//! Reduction operations and the `MPI_Op_*` functions.
+
+use std::{
+    collections::HashMap,
+    os::raw::{c_int, c_void},
+};
+
+use crate::{
+    abi::{op::*, *},
+    datatype::{self, Basic, Datatype},
+    state::{fatal, lock},
+};
+
+/// A reduction operation.
+#[derive(Copy, Clone, Debug)]
+pub enum Op {
+    Builtin(MPI_Op),
+    User {
+        function: MPI_User_function,
+        commute: bool,
+    },
+}
+
+/// Registry of the user-defined operations.
+#[derive(Default)]
+pub struct Ops {
+    user: HashMap<MPI_Op, Op>,
+}
+
+fn is_builtin(op: MPI_Op) -> bool {
+    matches!(
+        op,
+        MPI_SUM
+            | MPI_MIN
+            | MPI_MAX
+            | MPI_PROD
+            | MPI_BAND
+            | MPI_BOR
+            | MPI_BXOR
+            | MPI_LAND
+            | MPI_LOR
+            | MPI_LXOR
+            | MPI_MINLOC
+            | MPI_MAXLOC
+            | MPI_REPLACE
+            | MPI_NO_OP
+    )
+}
+
+/// The operation of `handle`.
+pub fn get(func: &str, handle: MPI_Op) -> Op {
+    if is_builtin(handle) {
+        return Op::Builtin(handle);
+    }
+    lock()
+        .ops
+        .user
+        .get(&handle)
+        .copied()
+        .unwrap_or_else(|| fatal(func, format!("invalid operation {:#x}", handle)))
+}
+
+trait Element: Copy + PartialOrd {
+    const SIZE: usize;
+    fn read(bytes: &[u8]) -> Self;
+    fn write(self, bytes: &mut [u8]);
+    fn sum(self, other: Self) -> Self;
+    fn prod(self, other: Self) -> Self;
+    fn truth(self) -> bool;
+    fn from_bool(b: bool) -> Self;
+    fn bitwise(self, _other: Self, _op: MPI_Op) -> Option<Self> {
+        None
+    }
+}
+
+macro_rules! element {
+    ($t:ty, int) => {
+        element!(@impl $t, wrapping_add, wrapping_mul, 0 as $t, 1 as $t,
+            fn bitwise(self, other: Self, op: MPI_Op) -> Option<Self> {
+                match op {
+                    MPI_BAND => Some(self & other),
+                    MPI_BOR => Some(self | other),
+                    _ => Some(self ^ other),
+                }
+            }
+        );
+    };
+    ($t:ty, float) => {
+        element!(@impl $t, add, mul, 0.0, 1.0,);
+    };
+    (@impl $t:ty, $add:ident, $mul:ident, $zero:expr, $one:expr, $($bitwise:item)?) => {
+        impl Element for $t {
+            const SIZE: usize = std::mem::size_of::<$t>();
+            fn read(bytes: &[u8]) -> Self {
+                <$t>::from_ne_bytes(bytes.try_into().unwrap())
+            }
+            fn write(self, bytes: &mut [u8]) {
+                bytes.copy_from_slice(&self.to_ne_bytes());
+            }
+            fn sum(self, other: Self) -> Self {
+                #[allow(unused_imports)]
+                use std::ops::{Add, Mul};
+                self.$add(other)
+            }
+            fn prod(self, other: Self) -> Self {
+                #[allow(unused_imports)]
+                use std::ops::{Add, Mul};
+                self.$mul(other)
+            }
+            fn truth(self) -> bool {
+                self != $zero
+            }
+            fn from_bool(b: bool) -> Self {
+                if b {
+                    $one
+                } else {
+                    $zero
+                }
+            }
+            $($bitwise)?
+        }
+    };
+}
+
+element!(i8, int);
+element!(u8, int);
+element!(i16, int);
+element!(u16, int);
+element!(i32, int);
+element!(u32, int);
+element!(i64, int);
+element!(u64, int);
+element!(f32, float);
+element!(f64, float);
+
+fn combine<T: Element>(op: MPI_Op, a: T, b: T) -> Option<T> {
+    match op {
+        MPI_SUM => Some(a.sum(b)),
+        MPI_PROD => Some(a.prod(b)),
+        MPI_MIN => Some(if b < a { b } else { a }),
+        MPI_MAX => Some(if b > a { b } else { a }),
+        MPI_LAND => Some(T::from_bool(a.truth() && b.truth())),
+        MPI_LOR => Some(T::from_bool(a.truth() || b.truth())),
+        MPI_LXOR => Some(T::from_bool(a.truth() != b.truth())),
+        MPI_BAND | MPI_BOR | MPI_BXOR => a.bitwise(b, op),
+        _ => None,
+    }
+}
+
+fn elementwise<T: Element>(op: MPI_Op, input: &[u8], inout: &mut [u8]) -> bool {
+    for (a, b) in input
+        .chunks_exact(T::SIZE)
+        .zip(inout.chunks_exact_mut(T::SIZE))
+    {
+        match combine(op, T::read(a), T::read(b)) {
+            Some(r) => r.write(b),
+            None => return false,
+        }
+    }
+    true
+}
+
+fn complex<T: Element + std::ops::Sub<Output = T>>(
+    op: MPI_Op,
+    input: &[u8],
+    inout: &mut [u8],
+) -> bool {
+    let n = T::SIZE;
+    for (a, b) in input.chunks_exact(2 * n).zip(inout.chunks_exact_mut(2 * n)) {
+        let (ar, ai) = (T::read(&a[..n]), T::read(&a[n..]));
+        let (br, bi) = (T::read(&b[..n]), T::read(&b[n..]));
+        let (r, i) = match op {
+            MPI_SUM => (ar.sum(br), ai.sum(bi)),
+            MPI_PROD => (ar.prod(br) - ai.prod(bi), ar.prod(bi).sum(ai.prod(br))),
+            _ => return false,
+        };
+        r.write(&mut b[..n]);
+        i.write(&mut b[n..]);
+    }
+    true
+}
+
+fn location<T: Element>(op: MPI_Op, input: &[u8], inout: &mut [u8]) -> bool {
+    let n = T::SIZE;
+    for (a, b) in input.chunks_exact(n + 4).zip(inout.chunks_exact_mut(n + 4)) {
+        let (av, ai) = (T::read(&a[..n]), i32::read(&a[n..]));
+        let (bv, bi) = (T::read(&b[..n]), i32::read(&b[n..]));
+        let better = match op {
+            MPI_MINLOC => av < bv,
+            MPI_MAXLOC => av > bv,
+            _ => return false,
+        };
+        if better {
+            b.copy_from_slice(a);
+        } else if av == bv {
+            ai.min(bi).write(&mut b[n..]);
+        }
+    }
+    true
+}
+
+fn builtin(op: MPI_Op, basic: Basic, input: &[u8], inout: &mut [u8]) -> bool {
+    match op {
+        MPI_REPLACE => {
+            inout.copy_from_slice(input);
+            return true;
+        }
+        MPI_NO_OP => return true,
+        _ => {}
+    }
+    match basic {
+        Basic::I8 => elementwise::<i8>(op, input, inout),
+        Basic::U8 | Basic::Bool => elementwise::<u8>(op, input, inout),
+        Basic::I16 => elementwise::<i16>(op, input, inout),
+        Basic::U16 => elementwise::<u16>(op, input, inout),
+        Basic::I32 => elementwise::<i32>(op, input, inout),
+        Basic::U32 => elementwise::<u32>(op, input, inout),
+        Basic::I64 => elementwise::<i64>(op, input, inout),
+        Basic::U64 => elementwise::<u64>(op, input, inout),
+        Basic::F32 => elementwise::<f32>(op, input, inout),
+        Basic::F64 => elementwise::<f64>(op, input, inout),
+        Basic::C32 => complex::<f32>(op, input, inout),
+        Basic::C64 => complex::<f64>(op, input, inout),
+        Basic::FloatInt => location::<f32>(op, input, inout),
+        Basic::DoubleInt => location::<f64>(op, input, inout),
+        Basic::LongInt => location::<i64>(op, input, inout),
+        Basic::TwoInt => location::<i32>(op, input, inout),
+        Basic::ShortInt => location::<i16>(op, input, inout),
+        Basic::Opaque(_) => false,
+    }
+}
+
+/// Combine `count` packed elements of `input` into `inout` (`inout = input op inout`).
+///
+/// User functions are called with buffers in the memory layout of the datatype, so packed
+/// data of non-contiguous types is unpacked around the call.
+pub fn reduce(
+    func: &str,
+    op: Op,
+    handle: MPI_Datatype,
+    dt: &Datatype,
+    count: usize,
+    input: &[u8],
+    inout: &mut [u8],
+) {
+    match op {
+        Op::Builtin(op) => {
+            let ok = dt
+                .basic
+                .is_some_and(|basic| builtin(op, basic, input, inout));
+            if !ok {
+                fatal(
+                    func,
+                    format!(
+                        "operation {:#x} is not defined for datatype {:#x}",
+                        op, handle
+                    ),
+                );
+            }
+        }
+        Op::User { function, .. } if dt.is_contiguous() && dt.offset() == 0 => unsafe {
+            call_user(
+                function,
+                input.as_ptr() as _,
+                inout.as_mut_ptr() as _,
+                count,
+                handle,
+            );
+        },
+        Op::User { function, .. } => unsafe {
+            let (mut a, offset) = dt.layout_buffer(count);
+            let (mut b, _) = dt.layout_buffer(count);
+            let pa = (a.as_mut_ptr() as *mut u8).wrapping_offset(offset) as *mut c_void;
+            let pb = (b.as_mut_ptr() as *mut u8).wrapping_offset(offset) as *mut c_void;
+            dt.unpack(input, pa, count);
+            dt.unpack(inout, pb, count);
+            call_user(function, pa, pb, count, handle);
+            inout.copy_from_slice(&dt.pack(pb, count));
+        },
+    }
+}
+
+unsafe fn call_user(
+    function: MPI_User_function,
+    input: *mut c_void,
+    inout: *mut c_void,
+    count: usize,
+    mut handle: MPI_Datatype,
+) {
+    let mut len = count as c_int;
+    function(input, inout, &mut len, &mut handle);
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Op_create(
+    user_fn: Option<MPI_User_function>,
+    commute: c_int,
+    op: *mut MPI_Op,
+) -> c_int {
+    let function = user_fn.unwrap_or_else(|| fatal("MPI_Op_create", "null function"));
+    let mut st = lock();
+    let handle = st.new_handle();
+    st.ops.user.insert(
+        handle,
+        Op::User {
+            function,
+            commute: commute != 0,
+        },
+    );
+    *op = handle;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Op_free(op: *mut MPI_Op) -> c_int {
+    if lock().ops.user.remove(&*op).is_none() {
+        fatal("MPI_Op_free", format!("invalid operation {:#x}", *op));
+    }
+    *op = MPI_OP_NULL;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Op_commutative(op: MPI_Op, commute: *mut c_int) -> c_int {
+    *commute = match get("MPI_Op_commutative", op) {
+        Op::Builtin(_) => 1,
+        Op::User { commute, .. } => commute.into(),
+    };
+    MPI_SUCCESS
+}
+
+unsafe fn reduce_local(
+    func: &str,
+    inbuf: *const c_void,
+    inoutbuf: *mut c_void,
+    count_: impl Int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+) -> c_int {
+    let n = count(func, count_);
+    match get(func, op) {
+        // User functions work on the buffers directly
+        Op::User { function, .. } => {
+            call_user(function, inbuf as *mut c_void, inoutbuf, n, datatype);
+        }
+        op => {
+            let dt = datatype::get(func, datatype);
+            let input = dt.pack(inbuf, n);
+            let mut inout = dt.pack(inoutbuf, n);
+            reduce(func, op, datatype, &dt, n, &input, &mut inout);
+            dt.unpack(&inout, inoutbuf, n);
+        }
+    }
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Reduce_local(
+    inbuf: *const c_void,
+    inoutbuf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+) -> c_int {
+    reduce_local("MPI_Reduce_local", inbuf, inoutbuf, count, datatype, op)
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Reduce_local_c(
+    inbuf: *const c_void,
+    inoutbuf: *mut c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+) -> c_int {
+    reduce_local("MPI_Reduce_local_c", inbuf, inoutbuf, count, datatype, op)
+}
@@ -0,0 +1,828 @@
+//! Point-to-point communication, probes and request completion.
+
+use std::{
+    os::raw::{c_int, c_void},
+    sync::Arc,
+};
+
+use crate::{
+    abi::{datatype::MPI_BYTE, *},
+    datatype,
+    state::{
+        advance, block, fatal, lock, wait, Kind, Message, Persistent, Receive, Request, State,
+    },
+};
+
+/// Number of `int`s in an `MPI_Status`, the stride of status arrays
+const STATUS_INTS: usize = std::mem::size_of::<MPI_Status>() / std::mem::size_of::<c_int>();
+
+/// The status of a null or inactive request.
+fn empty_status() -> MPI_Status {
+    MPI_Status::new(MPI_ANY_SOURCE, MPI_ANY_TAG, 0)
+}
+
+unsafe fn status_at(statuses: *mut MPI_Status, i: usize) -> *mut MPI_Status {
+    if statuses.is_null() {
+        statuses
+    } else {
+        (statuses as *mut c_int).add(i * STATUS_INTS) as *mut MPI_Status
+    }
+}
+
+#[allow(clippy::too_many_arguments)]
+unsafe fn send(
+    func: &str,
+    buf: *const c_void,
+    count_: impl Int,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+) {
+    let mut st = lock();
+    let info = st.comms.info(func, comm);
+    if dest == MPI_PROC_NULL {
+        return;
+    }
+    let data = st
+        .datatypes
+        .get(func, datatype)
+        .pack(buf, count(func, count_));
+    let dest = info.world(func, dest);
+    st.send(dest, info.ctx, tag, data);
+}
+
+/// The receive described by the arguments, `None` for a receive from `MPI_PROC_NULL`.
+#[allow(clippy::too_many_arguments)]
+fn receive(
+    st: &mut State,
+    func: &str,
+    buf: *mut c_void,
+    count_: impl Int,
+    datatype: MPI_Datatype,
+    source: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+) -> Option<Receive> {
+    let info = st.comms.info(func, comm);
+    let source = match source {
+        MPI_PROC_NULL => return None,
+        MPI_ANY_SOURCE => None,
+        source => Some(info.world(func, source)),
+    };
+    Some(Receive {
+        buf: buf as usize,
+        count: count(func, count_),
+        datatype: st.datatypes.get(func, datatype),
+        ctx: info.ctx,
+        source,
+        tag,
+        ranks: info.ranks,
+    })
+}
+
+fn complete_request(st: &mut State, status: MPI_Status) -> MPI_Request {
+    st.requests.insert(Request {
+        kind: Kind::Complete(status),
+        persistent: None,
+        freed: false,
+    })
+}
+
+#[allow(clippy::too_many_arguments)]
+unsafe fn irecv(
+    func: &str,
+    buf: *mut c_void,
+    count: impl Int,
+    datatype: MPI_Datatype,
+    source: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+) -> MPI_Request {
+    let mut st = lock();
+    match receive(&mut st, func, buf, count, datatype, source, tag, comm) {
+        Some(recv) => {
+            st.progress();
+            st.post(func, recv, None)
+        }
+        None => complete_request(&mut st, MPI_Status::proc_null()),
+    }
+}
+
+/// Take the status of a complete request and free it unless it is persistent.
+fn finish(st: &mut State, func: &str, request: &mut MPI_Request) -> MPI_Status {
+    let req = st.requests.get_mut(func, *request);
+    let status = match std::mem::replace(&mut req.kind, Kind::Inactive) {
+        Kind::Complete(status) => status,
+        Kind::Inactive => empty_status(),
+        _ => unreachable!(),
+    };
+    if req.persistent.is_none() {
+        st.requests.remove(func, *request);
+        *request = MPI_REQUEST_NULL;
+    }
+    status
+}
+
+/// Whether `request` is neither null nor an inactive persistent request.
+fn is_active(st: &State, func: &str, request: MPI_Request) -> bool {
+    request != MPI_REQUEST_NULL && !matches!(st.requests.get(func, request).kind, Kind::Inactive)
+}
+
+macro_rules! send_functions {
+    ($($count:ty => $name:ident, $iname:ident, $init:ident;)*) => {$(
+        #[no_mangle]
+        pub unsafe extern "C" fn $name(
+            buf: *const c_void,
+            count: $count,
+            datatype: MPI_Datatype,
+            dest: c_int,
+            tag: c_int,
+            comm: MPI_Comm,
+        ) -> c_int {
+            send(stringify!($name), buf, count, datatype, dest, tag, comm);
+            MPI_SUCCESS
+        }
+
+        #[no_mangle]
+        pub unsafe extern "C" fn $iname(
+            buf: *const c_void,
+            count: $count,
+            datatype: MPI_Datatype,
+            dest: c_int,
+            tag: c_int,
+            comm: MPI_Comm,
+            request: *mut MPI_Request,
+        ) -> c_int {
+            send(stringify!($iname), buf, count, datatype, dest, tag, comm);
+            *request = complete_request(&mut lock(), empty_status());
+            MPI_SUCCESS
+        }
+
+        #[no_mangle]
+        pub unsafe extern "C" fn $init(
+            buf: *const c_void,
+            count_: $count,
+            datatype: MPI_Datatype,
+            dest: c_int,
+            tag: c_int,
+            comm: MPI_Comm,
+            request: *mut MPI_Request,
+        ) -> c_int {
+            let func = stringify!($init);
+            let mut st = lock();
+            let info = st.comms.info(func, comm);
+            let persistent = Persistent::Send {
+                buf: buf as usize,
+                count: count(func, count_),
+                datatype: st.datatypes.get(func, datatype),
+                dest: (dest != MPI_PROC_NULL).then(|| info.world(func, dest)),
+                ctx: info.ctx,
+                tag,
+            };
+            *request = st.requests.insert(Request {
+                kind: Kind::Inactive,
+                persistent: Some(persistent),
+                freed: false,
+            });
+            MPI_SUCCESS
+        }
+    )*};
+}
+
+// Sends are buffered eagerly, so every send mode completes locally.
+send_functions! {
+    c_int => MPI_Send, MPI_Isend, MPI_Send_init;
+    c_int => MPI_Bsend, MPI_Ibsend, MPI_Bsend_init;
+    c_int => MPI_Ssend, MPI_Issend, MPI_Ssend_init;
+    c_int => MPI_Rsend, MPI_Irsend, MPI_Rsend_init;
+    MPI_Count => MPI_Send_c, MPI_Isend_c, MPI_Send_init_c;
+    MPI_Count => MPI_Bsend_c, MPI_Ibsend_c, MPI_Bsend_init_c;
+    MPI_Count => MPI_Ssend_c, MPI_Issend_c, MPI_Ssend_init_c;
+    MPI_Count => MPI_Rsend_c, MPI_Irsend_c, MPI_Rsend_init_c;
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Start(request: *mut MPI_Request) -> c_int {
+    let func = "MPI_Start";
+    let mut st = lock();
+    let req = st.requests.get_mut(func, *request);
+    let persistent = req
+        .persistent
+        .clone()
+        .unwrap_or_else(|| fatal(func, "request is not persistent"));
+    if !matches!(req.kind, Kind::Inactive) {
+        fatal(func, "request is already active");
+    }
+    match persistent {
+        Persistent::Send {
+            buf,
+            count,
+            datatype,
+            dest,
+            ctx,
+            tag,
+        } => {
+            if let Some(dest) = dest {
+                let data = datatype.pack(buf as *const c_void, count);
+                st.send(dest, ctx, tag, data);
+            }
+            st.requests.get_mut(func, *request).kind = Kind::Complete(empty_status());
+        }
+        Persistent::Recv(Some(recv)) => {
+            st.progress();
+            st.repost(func, *request, recv);
+        }
+        Persistent::Recv(None) => {
+            st.requests.get_mut(func, *request).kind = Kind::Complete(MPI_Status::proc_null());
+        }
+    }
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Startall(count: c_int, requests: *mut MPI_Request) -> c_int {
+    for i in 0..self::count("MPI_Startall", count) {
+        MPI_Start(requests.add(i));
+    }
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Wait(request: *mut MPI_Request, status: *mut MPI_Status) -> c_int {
+    if *request == MPI_REQUEST_NULL {
+        empty_status().write_to(status);
+        return MPI_SUCCESS;
+    }
+    wait("MPI_Wait", *request);
+    finish(&mut lock(), "MPI_Wait", &mut *request).write_to(status);
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Test(
+    request: *mut MPI_Request,
+    flag: *mut c_int,
+    status: *mut MPI_Status,
+) -> c_int {
+    if *request == MPI_REQUEST_NULL {
+        *flag = 1;
+        empty_status().write_to(status);
+        return MPI_SUCCESS;
+    }
+    *flag = advance("MPI_Test", *request).into();
+    if *flag != 0 {
+        finish(&mut lock(), "MPI_Test", &mut *request).write_to(status);
+    }
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Waitall(
+    count: c_int,
+    requests: *mut MPI_Request,
+    statuses: *mut MPI_Status,
+) -> c_int {
+    for i in 0..self::count("MPI_Waitall", count) {
+        MPI_Wait(requests.add(i), status_at(statuses, i));
+    }
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Testall(
+    count: c_int,
+    requests: *mut MPI_Request,
+    flag: *mut c_int,
+    statuses: *mut MPI_Status,
+) -> c_int {
+    let n = self::count("MPI_Testall", count);
+    let mut all = true;
+    for i in 0..n {
+        let request = *requests.add(i);
+        if request != MPI_REQUEST_NULL {
+            all &= advance("MPI_Testall", request);
+        }
+    }
+    *flag = all.into();
+    if all {
+        MPI_Waitall(count, requests, statuses);
+    }
+    MPI_SUCCESS
+}
+
+/// Complete the first complete request of `requests`, or report that none is active.
+unsafe fn any(
+    func: &str,
+    count: c_int,
+    requests: *mut MPI_Request,
+    index: *mut c_int,
+    status: *mut MPI_Status,
+) -> bool {
+    let mut active = false;
+    for i in 0..self::count(func, count) {
+        let request = *requests.add(i);
+        if !is_active(&lock(), func, request) {
+            continue;
+        }
+        active = true;
+        if advance(func, request) {
+            *index = i as c_int;
+            finish(&mut lock(), func, &mut *requests.add(i)).write_to(status);
+            return true;
+        }
+    }
+    if !active {
+        *index = MPI_UNDEFINED;
+        empty_status().write_to(status);
+    }
+    !active
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Waitany(
+    count: c_int,
+    requests: *mut MPI_Request,
+    index: *mut c_int,
+    status: *mut MPI_Status,
+) -> c_int {
+    while !any("MPI_Waitany", count, requests, index, status) {
+        block(lock());
+    }
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Testany(
+    count: c_int,
+    requests: *mut MPI_Request,
+    index: *mut c_int,
+    flag: *mut c_int,
+    status: *mut MPI_Status,
+) -> c_int {
+    let done = any("MPI_Testany", count, requests, index, status);
+    if !done {
+        *index = MPI_UNDEFINED;
+    }
+    *flag = done.into();
+    MPI_SUCCESS
+}
+
+/// Complete all complete requests of `requests`. Returns false if there are active requests
+/// but none of them is complete.
+unsafe fn some(
+    func: &str,
+    incount: c_int,
+    requests: *mut MPI_Request,
+    outcount: *mut c_int,
+    indices: *mut c_int,
+    statuses: *mut MPI_Status,
+) -> bool {
+    let mut active = false;
+    let mut done = 0;
+    for i in 0..count(func, incount) {
+        let request = *requests.add(i);
+        if !is_active(&lock(), func, request) {
+            continue;
+        }
+        active = true;
+        if advance(func, request) {
+            *indices.add(done) = i as c_int;
+            let status = finish(&mut lock(), func, &mut *requests.add(i));
+            status.write_to(status_at(statuses, done));
+            done += 1;
+        }
+    }
+    *outcount = if active { done as c_int } else { MPI_UNDEFINED };
+    !active || done > 0
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Waitsome(
+    incount: c_int,
+    requests: *mut MPI_Request,
+    outcount: *mut c_int,
+    indices: *mut c_int,
+    statuses: *mut MPI_Status,
+) -> c_int {
+    while !some(
+        "MPI_Waitsome",
+        incount,
+        requests,
+        outcount,
+        indices,
+        statuses,
+    ) {
+        block(lock());
+    }
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Testsome(
+    incount: c_int,
+    requests: *mut MPI_Request,
+    outcount: *mut c_int,
+    indices: *mut c_int,
+    statuses: *mut MPI_Status,
+) -> c_int {
+    some(
+        "MPI_Testsome",
+        incount,
+        requests,
+        outcount,
+        indices,
+        statuses,
+    );
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Request_free(request: *mut MPI_Request) -> c_int {
+    let func = "MPI_Request_free";
+    let mut st = lock();
+    let req = st.requests.get_mut(func, *request);
+    match req.kind {
+        Kind::Inactive | Kind::Complete(_) => {
+            st.requests.remove(func, *request);
+        }
+        // Freed once it completes
+        Kind::Recv(_) | Kind::Schedule(_) => req.freed = true,
+    }
+    *request = MPI_REQUEST_NULL;
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Request_get_status(
+    request: MPI_Request,
+    flag: *mut c_int,
+    status: *mut MPI_Status,
+) -> c_int {
+    if request == MPI_REQUEST_NULL {
+        *flag = 1;
+        empty_status().write_to(status);
+        return MPI_SUCCESS;
+    }
+    *flag = advance("MPI_Request_get_status", request).into();
+    if *flag != 0 {
+        match lock().requests.get("MPI_Request_get_status", request).kind {
+            Kind::Complete(s) => s,
+            _ => empty_status(),
+        }
+        .write_to(status);
+    }
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Cancel(request: *mut MPI_Request) -> c_int {
+    let mut st = lock();
+    let pending = matches!(st.requests.get("MPI_Cancel", *request).kind, Kind::Recv(_));
+    // Sends have completed already and cannot be cancelled
+    if pending && st.unpost(*request) {
+        st.requests.get_mut("MPI_Cancel", *request).kind = Kind::Complete(MPI_Status::cancelled());
+    }
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Test_cancelled(status: *const MPI_Status, flag: *mut c_int) -> c_int {
+    *flag = (*status).is_cancelled().into();
+    MPI_SUCCESS
+}
+
+/// Find a message matching a probe, removing it from the unexpected queue if `take` is set.
+#[allow(clippy::type_complexity)]
+fn probe(
+    func: &str,
+    source: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    take: bool,
+) -> Option<(MPI_Status, Option<(Message, Arc<[usize]>)>)> {
+    let mut st = lock();
+    let null = std::ptr::null_mut();
+    let Some(recv) = receive(&mut st, func, null, 0, MPI_BYTE, source, tag, comm) else {
+        return Some((MPI_Status::proc_null(), None));
+    };
+    st.progress();
+    let pos = st.unexpected.iter().position(|m| recv.matches(m))?;
+    let message = &st.unexpected[pos];
+    let status = MPI_Status::new(
+        crate::state::comm_rank(&recv.ranks, message.source),
+        message.tag,
+        message.data.len(),
+    );
+    let message = take.then(|| (st.unexpected.remove(pos).unwrap(), recv.ranks));
+    Some((status, message))
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Probe(
+    source: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    status: *mut MPI_Status,
+) -> c_int {
+    loop {
+        if let Some((found, _)) = probe("MPI_Probe", source, tag, comm, false) {
+            found.write_to(status);
+            return MPI_SUCCESS;
+        }
+        block(lock());
+    }
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Iprobe(
+    source: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    flag: *mut c_int,
+    status: *mut MPI_Status,
+) -> c_int {
+    let found = probe("MPI_Iprobe", source, tag, comm, false);
+    *flag = found.is_some().into();
+    if let Some((found, _)) = found {
+        found.write_to(status);
+    }
+    MPI_SUCCESS
+}
+
+/// Register a message matched by a probe and return its handle.
+fn matched(message: Option<(Message, Arc<[usize]>)>) -> MPI_Message {
+    match message {
+        Some(message) => {
+            let mut st = lock();
+            let handle = st.new_handle();
+            st.messages.insert(handle, message);
+            handle
+        }
+        None => MPI_MESSAGE_NO_PROC,
+    }
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Mprobe(
+    source: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    message: *mut MPI_Message,
+    status: *mut MPI_Status,
+) -> c_int {
+    loop {
+        if let Some((found, m)) = probe("MPI_Mprobe", source, tag, comm, true) {
+            *message = matched(m);
+            found.write_to(status);
+            return MPI_SUCCESS;
+        }
+        block(lock());
+    }
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Improbe(
+    source: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    flag: *mut c_int,
+    message: *mut MPI_Message,
+    status: *mut MPI_Status,
+) -> c_int {
+    let found = probe("MPI_Improbe", source, tag, comm, true);
+    *flag = found.is_some().into();
+    if let Some((found, m)) = found {
+        *message = matched(m);
+        found.write_to(status);
+    }
+    MPI_SUCCESS
+}
+
+/// Receive a message matched by a probe.
+unsafe fn mrecv(
+    func: &str,
+    buf: *mut c_void,
+    count_: impl Int,
+    datatype: MPI_Datatype,
+    message: *mut MPI_Message,
+) -> MPI_Status {
+    if *message == MPI_MESSAGE_NO_PROC {
+        *message = MPI_MESSAGE_NULL;
+        return MPI_Status::proc_null();
+    }
+    let mut st = lock();
+    let (msg, ranks) = st
+        .messages
+        .remove(&*message)
+        .unwrap_or_else(|| fatal(func, format!("invalid message {:#x}", *message)));
+    let recv = Receive {
+        buf: buf as usize,
+        count: count(func, count_),
+        datatype: st.datatypes.get(func, datatype),
+        ctx: msg.ctx,
+        source: Some(msg.source),
+        tag: msg.tag,
+        ranks,
+    };
+    *message = MPI_MESSAGE_NULL;
+    recv.complete(func, msg)
+}
+
+macro_rules! receive_functions {
+    ($(
+        $count:ty => $recv:ident, $irecv:ident, $recv_init:ident, $sendrecv:ident,
+            $sendrecv_replace:ident, $mrecv:ident, $imrecv:ident;
+    )*) => {$(
+        #[no_mangle]
+        pub unsafe extern "C" fn $recv(
+            buf: *mut c_void,
+            count: $count,
+            datatype: MPI_Datatype,
+            source: c_int,
+            tag: c_int,
+            comm: MPI_Comm,
+            status: *mut MPI_Status,
+        ) -> c_int {
+            let mut request = irecv(stringify!($recv), buf, count, datatype, source, tag, comm);
+            wait(stringify!($recv), request);
+            finish(&mut lock(), stringify!($recv), &mut request).write_to(status);
+            MPI_SUCCESS
+        }
+
+        #[no_mangle]
+        pub unsafe extern "C" fn $irecv(
+            buf: *mut c_void,
+            count: $count,
+            datatype: MPI_Datatype,
+            source: c_int,
+            tag: c_int,
+            comm: MPI_Comm,
+            request: *mut MPI_Request,
+        ) -> c_int {
+            *request = irecv(stringify!($irecv), buf, count, datatype, source, tag, comm);
+            MPI_SUCCESS
+        }
+
+        #[no_mangle]
+        pub unsafe extern "C" fn $recv_init(
+            buf: *mut c_void,
+            count: $count,
+            datatype: MPI_Datatype,
+            source: c_int,
+            tag: c_int,
+            comm: MPI_Comm,
+            request: *mut MPI_Request,
+        ) -> c_int {
+            let mut st = lock();
+            let recv = receive(&mut st, stringify!($recv_init), buf, count, datatype, source, tag, comm);
+            *request = st.requests.insert(Request {
+                kind: Kind::Inactive,
+                persistent: Some(Persistent::Recv(recv)),
+                freed: false,
+            });
+            MPI_SUCCESS
+        }
+
+        #[no_mangle]
+        pub unsafe extern "C" fn $sendrecv(
+            sendbuf: *const c_void,
+            sendcount: $count,
+            sendtype: MPI_Datatype,
+            dest: c_int,
+            sendtag: c_int,
+            recvbuf: *mut c_void,
+            recvcount: $count,
+            recvtype: MPI_Datatype,
+            source: c_int,
+            recvtag: c_int,
+            comm: MPI_Comm,
+            status: *mut MPI_Status,
+        ) -> c_int {
+            send(stringify!($sendrecv), sendbuf, sendcount, sendtype, dest, sendtag, comm);
+            $recv(recvbuf, recvcount, recvtype, source, recvtag, comm, status)
+        }
+
+        #[no_mangle]
+        pub unsafe extern "C" fn $sendrecv_replace(
+            buf: *mut c_void,
+            count: $count,
+            datatype: MPI_Datatype,
+            dest: c_int,
+            sendtag: c_int,
+            source: c_int,
+            recvtag: c_int,
+            comm: MPI_Comm,
+            status: *mut MPI_Status,
+        ) -> c_int {
+            // The send packs the buffer before the receive overwrites it
+            send(stringify!($sendrecv_replace), buf, count, datatype, dest, sendtag, comm);
+            $recv(buf, count, datatype, source, recvtag, comm, status)
+        }
+
+        #[no_mangle]
+        pub unsafe extern "C" fn $mrecv(
+            buf: *mut c_void,
+            count: $count,
+            datatype: MPI_Datatype,
+            message: *mut MPI_Message,
+            status: *mut MPI_Status,
+        ) -> c_int {
+            mrecv(stringify!($mrecv), buf, count, datatype, message).write_to(status);
+            MPI_SUCCESS
+        }
+
+        #[no_mangle]
+        pub unsafe extern "C" fn $imrecv(
+            buf: *mut c_void,
+            count: $count,
+            datatype: MPI_Datatype,
+            message: *mut MPI_Message,
+            request: *mut MPI_Request,
+        ) -> c_int {
+            let status = mrecv(stringify!($imrecv), buf, count, datatype, message);
+            *request = complete_request(&mut lock(), status);
+            MPI_SUCCESS
+        }
+    )*};
+}
+
+receive_functions! {
+    c_int => MPI_Recv, MPI_Irecv, MPI_Recv_init, MPI_Sendrecv,
+        MPI_Sendrecv_replace, MPI_Mrecv, MPI_Imrecv;
+    MPI_Count => MPI_Recv_c, MPI_Irecv_c, MPI_Recv_init_c, MPI_Sendrecv_c,
+        MPI_Sendrecv_replace_c, MPI_Mrecv_c, MPI_Imrecv_c;
+}
+
+fn elements(func: &str, status: &MPI_Status, datatype: MPI_Datatype, basic: bool) -> MPI_Count {
+    let dt = datatype::get(func, datatype);
+    let size = match dt.basic {
+        Some(b) if basic => b.size(),
+        _ => dt.size,
+    } as u64;
+    let bytes = status.bytes();
+    match (bytes, size) {
+        (0, _) => 0,
+        (_, 0) => MPI_UNDEFINED.into(),
+        (bytes, size) if bytes % size != 0 => MPI_UNDEFINED.into(),
+        (bytes, size) => (bytes / size) as MPI_Count,
+    }
+}
+
+fn to_int(count: MPI_Count) -> c_int {
+    c_int::try_from(count).unwrap_or(MPI_UNDEFINED)
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Get_count(
+    status: *const MPI_Status,
+    datatype: MPI_Datatype,
+    count: *mut c_int,
+) -> c_int {
+    *count = to_int(elements("MPI_Get_count", &*status, datatype, false));
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Get_count_c(
+    status: *const MPI_Status,
+    datatype: MPI_Datatype,
+    count: *mut MPI_Count,
+) -> c_int {
+    *count = elements("MPI_Get_count_c", &*status, datatype, false);
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Get_elements(
+    status: *const MPI_Status,
+    datatype: MPI_Datatype,
+    count: *mut c_int,
+) -> c_int {
+    *count = to_int(elements("MPI_Get_elements", &*status, datatype, true));
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Get_elements_x(
+    status: *const MPI_Status,
+    datatype: MPI_Datatype,
+    count: *mut MPI_Count,
+) -> c_int {
+    *count = elements("MPI_Get_elements_x", &*status, datatype, true);
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Buffer_attach(buffer: *mut c_void, size: c_int) -> c_int {
+    lock().buffer = Some((buffer as usize, size));
+    MPI_SUCCESS
+}
+
+#[no_mangle]
+pub unsafe extern "C" fn MPI_Buffer_detach(buffer_addr: *mut c_void, size: *mut c_int) -> c_int {
+    let (buffer, len) = lock().buffer.take().unwrap_or((0, 0));
+    *(buffer_addr as *mut *mut c_void) = buffer as *mut c_void;
+    *size = len;
+    MPI_SUCCESS
+}
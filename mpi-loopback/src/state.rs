@@ -0,0 +1,757 @@
+//! Process state: the ranks, the socket transport between them, message matching and requests.
+//!
+//! Every pair of ranks is connected by a Unix stream socket. Messages are framed with a small
+//! header and sent eagerly: whatever the socket does not accept right away is buffered and
+//! written by later progress calls, so sends never block. Received frames are matched against
+//! the posted receives in the order they were posted and queued as unexpected otherwise.
+
+use std::{
+    collections::{HashMap, VecDeque},
+    fmt::Display,
+    ops::{Deref, DerefMut},
+    os::raw::c_int,
+    sync::{Arc, Mutex, MutexGuard},
+    thread::{self, ThreadId},
+};
+
+use crate::{
+    abi::*,
+    comm::{CommInfo, Comms},
+    datatype::{Datatype, Datatypes},
+    op::Ops,
+};
+
+/// Context of the frame a rank sends to every peer in `MPI_Finalize`
+const FINALIZE_CONTEXT: u64 = u64::MAX;
+const HEADER_LEN: usize = 24;
+
+/// Handles of requests are `REQUEST_BASE` plus their slot, all other handles are below.
+const REQUEST_BASE: Handle = 1 << 40;
+const FIRST_HANDLE: Handle = 0x1000;
+
+static STATE: Mutex<Option<State>> = Mutex::new(None);
+
+/// Report an error and terminate the process, as `MPI_ERRORS_ARE_FATAL` does.
+#[cold]
+pub fn fatal(func: &str, msg: impl Display) -> ! {
+    eprintln!("mpi-loopback: {}: {}", func, msg);
+    std::process::exit(1)
+}
+
+/// The state of the initialized library.
+pub fn lock() -> StateGuard {
+    let guard = STATE.lock().unwrap_or_else(|e| e.into_inner());
+    if guard.is_none() {
+        fatal("mpi-loopback", "MPI is not initialized");
+    }
+    StateGuard(guard)
+}
+
+/// The state of the library if it has been initialized.
+pub fn try_lock() -> Option<StateGuard> {
+    let guard = STATE.lock().unwrap_or_else(|e| e.into_inner());
+    guard.as_ref()?;
+    Some(StateGuard(guard))
+}
+
+pub struct StateGuard(MutexGuard<'static, Option<State>>);
+
+impl Deref for StateGuard {
+    type Target = State;
+
+    fn deref(&self) -> &State {
+        self.0.as_ref().unwrap()
+    }
+}
+
+impl DerefMut for StateGuard {
+    fn deref_mut(&mut self) -> &mut State {
+        self.0.as_mut().unwrap()
+    }
+}
+
+/// A message that has arrived but not been received yet.
+pub struct Message {
+    /// World rank of the sender
+    pub source: usize,
+    pub ctx: u64,
+    pub tag: c_int,
+    pub data: Vec<u8>,
+}
+
+struct Peer {
+    fd: c_int,
+    input: Vec<u8>,
+    output: Vec<u8>,
+    written: usize,
+    finalized: bool,
+    closed: bool,
+}
+
+impl Peer {
+    fn new(fd: c_int) -> Self {
+        unsafe {
+            let flags = libc::fcntl(fd, libc::F_GETFL);
+            libc::fcntl(fd, libc::F_SETFL, flags | libc::O_NONBLOCK);
+        }
+        Peer {
+            fd,
+            input: Vec::new(),
+            output: Vec::new(),
+            written: 0,
+            finalized: false,
+            closed: false,
+        }
+    }
+
+    fn send(&mut self, header: &[u8], data: &[u8]) {
+        self.flush();
+        if !self.output.is_empty() {
+            self.output.extend_from_slice(header);
+            self.output.extend_from_slice(data);
+            return;
+        }
+        let Some(n) = write(self.fd, &[header, data]) else {
+            return;
+        };
+        if n < header.len() {
+            self.output.extend_from_slice(&header[n..]);
+            self.output.extend_from_slice(data);
+        } else {
+            self.output.extend_from_slice(&data[n - header.len()..]);
+        }
+    }
+
+    fn flush(&mut self) {
+        while self.written < self.output.len() {
+            match write(self.fd, &[&self.output[self.written..]]) {
+                Some(0) => return,
+                Some(n) => self.written += n,
+                // The peer is gone; reading from it reports whether that is an error.
+                None => break,
+            }
+        }
+        self.output.clear();
+        self.written = 0;
+    }
+
+    /// Read everything available. Returns false once the peer has closed its end.
+    fn read(&mut self) -> bool {
+        loop {
+            self.input.reserve(1 << 16);
+            let spare = self.input.capacity() - self.input.len();
+            let n = unsafe {
+                libc::recv(
+                    self.fd,
+                    self.input.as_mut_ptr().add(self.input.len()) as *mut _,
+                    spare,
+                    0,
+                )
+            };
+            match n {
+                0 => return false,
+                n if n > 0 => unsafe { self.input.set_len(self.input.len() + n as usize) },
+                _ => {
+                    return matches!(
+                        std::io::Error::last_os_error().raw_os_error(),
+                        Some(libc::EAGAIN) | Some(libc::EINTR)
+                    )
+                }
+            }
+        }
+    }
+
+    /// Split complete frames off the input.
+    fn frames(&mut self, source: usize) -> Vec<Message> {
+        let mut messages = Vec::new();
+        let mut pos = 0;
+        while self.input.len() - pos >= HEADER_LEN {
+            let header = &self.input[pos..pos + HEADER_LEN];
+            let ctx = u64::from_ne_bytes(header[0..8].try_into().unwrap());
+            let tag = c_int::from_ne_bytes(header[8..12].try_into().unwrap());
+            let len = u64::from_ne_bytes(header[16..24].try_into().unwrap()) as usize;
+            if self.input.len() - pos - HEADER_LEN < len {
+                break;
+            }
+            let start = pos + HEADER_LEN;
+            messages.push(Message {
+                source,
+                ctx,
+                tag,
+                data: self.input[start..start + len].to_vec(),
+            });
+            pos = start + len;
+        }
+        self.input.drain(..pos);
+        messages
+    }
+}
+
+/// Write as much of `bufs` as the socket takes without blocking. Returns `None` if the socket
+/// is broken.
+fn write(fd: c_int, bufs: &[&[u8]]) -> Option<usize> {
+    let mut iov: Vec<libc::iovec> = bufs
+        .iter()
+        .map(|b| libc::iovec {
+            iov_base: b.as_ptr() as *mut _,
+            iov_len: b.len(),
+        })
+        .collect();
+    let mut msg: libc::msghdr = unsafe { std::mem::zeroed() };
+    msg.msg_iov = iov.as_mut_ptr();
+    msg.msg_iovlen = iov.len() as _;
+    let n = unsafe { libc::sendmsg(fd, &msg, libc::MSG_NOSIGNAL) };
+    if n >= 0 {
+        return Some(n as usize);
+    }
+    match std::io::Error::last_os_error().raw_os_error() {
+        Some(libc::EAGAIN) | Some(libc::EINTR) => Some(0),
+        _ => None,
+    }
+}
+
+fn header(ctx: u64, tag: c_int, len: usize) -> [u8; HEADER_LEN] {
+    let mut header = [0; HEADER_LEN];
+    header[0..8].copy_from_slice(&ctx.to_ne_bytes());
+    header[8..12].copy_from_slice(&tag.to_ne_bytes());
+    header[16..24].copy_from_slice(&(len as u64).to_ne_bytes());
+    header
+}
+
+/// A receive that has been posted but not matched yet.
+#[derive(Clone)]
+pub struct Receive {
+    pub buf: usize,
+    pub count: usize,
+    pub datatype: Arc<Datatype>,
+    pub ctx: u64,
+    /// World rank to receive from, `None` for `MPI_ANY_SOURCE`
+    pub source: Option<usize>,
+    pub tag: c_int,
+    /// World ranks of the communicator, to translate the source of the status
+    pub ranks: Arc<[usize]>,
+}
+
+impl Receive {
+    pub fn matches(&self, message: &Message) -> bool {
+        self.ctx == message.ctx
+            && self.source.map_or(true, |s| s == message.source)
+            && (self.tag == MPI_ANY_TAG || self.tag == message.tag)
+    }
+
+    /// Copy `message` into the receive buffer.
+    pub fn complete(&self, func: &str, message: Message) -> MPI_Status {
+        let excess = unsafe {
+            self.datatype
+                .unpack(&message.data, self.buf as *mut _, self.count)
+        };
+        if excess > 0 {
+            fatal(
+                func,
+                format!(
+                    "message of {} bytes truncated to {} bytes",
+                    message.data.len(),
+                    message.data.len() - excess
+                ),
+            );
+        }
+        MPI_Status::new(
+            comm_rank(&self.ranks, message.source),
+            message.tag,
+            message.data.len(),
+        )
+    }
+}
+
+/// The rank within `ranks` of world rank `world`.
+pub fn comm_rank(ranks: &[usize], world: usize) -> c_int {
+    ranks
+        .iter()
+        .position(|&r| r == world)
+        .map_or(MPI_UNDEFINED, |r| r as c_int)
+}
+
+/// What a collective does once the messages of a round have arrived, given their contents in
+/// the order the round listed their sources.
+pub type Continuation = Box<dyn FnOnce(Vec<Vec<u8>>) -> Step>;
+
+/// The next round of a collective.
+pub enum Step {
+    Done,
+    /// Send data to communicator ranks, then wait for a message from each of `recvs`.
+    Round {
+        sends: Vec<(usize, Vec<u8>)>,
+        recvs: Vec<usize>,
+        then: Continuation,
+    },
+}
+
+/// A collective in progress.
+pub struct Schedule {
+    ctx: u64,
+    tag: c_int,
+    ranks: Arc<[usize]>,
+    recvs: Vec<usize>,
+    received: Vec<Option<Vec<u8>>>,
+    /// `None` while the continuation runs
+    then: Option<Continuation>,
+}
+
+impl Schedule {
+    /// Take the messages of this round from `unexpected`. Returns true once all have arrived.
+    fn receive(&mut self, unexpected: &mut VecDeque<Message>) -> bool {
+        for (&src, slot) in self.recvs.iter().zip(&mut self.received) {
+            if slot.is_some() {
+                continue;
+            }
+            let source = self.ranks[src];
+            if let Some(pos) = unexpected
+                .iter()
+                .position(|m| m.ctx == self.ctx && m.tag == self.tag && m.source == source)
+            {
+                *slot = unexpected.remove(pos).map(|m| m.data);
+            }
+        }
+        self.received.iter().all(Option::is_some)
+    }
+}
+
+pub enum Kind {
+    /// A persistent request that has not been started
+    Inactive,
+    Complete(MPI_Status),
+    Recv(Receive),
+    Schedule(Schedule),
+}
+
+/// How a persistent request is started.
+#[derive(Clone)]
+pub enum Persistent {
+    Send {
+        buf: usize,
+        count: usize,
+        datatype: Arc<Datatype>,
+        dest: Option<usize>,
+        ctx: u64,
+        tag: c_int,
+    },
+    Recv(Option<Receive>),
+}
+
+pub struct Request {
+    pub kind: Kind,
+    pub persistent: Option<Persistent>,
+    /// Freed with `MPI_Request_free` while still in progress
+    pub freed: bool,
+}
+
+/// Slab of requests; a request's handle is derived from its slot.
+#[derive(Default)]
+pub struct Requests {
+    slots: Vec<Option<Request>>,
+    free: Vec<usize>,
+}
+
+impl Requests {
+    pub fn insert(&mut self, request: Request) -> MPI_Request {
+        let slot = match self.free.pop() {
+            Some(slot) => {
+                self.slots[slot] = Some(request);
+                slot
+            }
+            None => {
+                self.slots.push(Some(request));
+                self.slots.len() - 1
+            }
+        };
+        REQUEST_BASE + slot
+    }
+
+    fn slot(&self, func: &str, handle: MPI_Request) -> usize {
+        handle
+            .checked_sub(REQUEST_BASE)
+            .filter(|&slot| matches!(self.slots.get(slot), Some(Some(_))))
+            .unwrap_or_else(|| fatal(func, format!("invalid request {:#x}", handle)))
+    }
+
+    pub fn get(&self, func: &str, handle: MPI_Request) -> &Request {
+        let slot = self.slot(func, handle);
+        self.slots[slot].as_ref().unwrap()
+    }
+
+    pub fn get_mut(&mut self, func: &str, handle: MPI_Request) -> &mut Request {
+        let slot = self.slot(func, handle);
+        self.slots[slot].as_mut().unwrap()
+    }
+
+    pub fn remove(&mut self, func: &str, handle: MPI_Request) -> Request {
+        let slot = self.slot(func, handle);
+        self.free.push(slot);
+        self.slots[slot].take().unwrap()
+    }
+}
+
+pub struct State {
+    pub rank: usize,
+    pub size: usize,
+    pub thread_level: c_int,
+    pub main_thread: ThreadId,
+    pub finalized: bool,
+    peers: Vec<Option<Peer>>,
+    children: Vec<libc::pid_t>,
+    pub unexpected: VecDeque<Message>,
+    posted: VecDeque<MPI_Request>,
+    pub requests: Requests,
+    pub datatypes: Datatypes,
+    pub ops: Ops,
+    pub comms: Comms,
+    /// Messages matched by `MPI_Mprobe`, with the world ranks of their communicator
+    pub messages: HashMap<MPI_Message, (Message, Arc<[usize]>)>,
+    /// The buffer attached with `MPI_Buffer_attach`
+    pub buffer: Option<(usize, c_int)>,
+    next_handle: Handle,
+}
+
+unsafe impl Send for State {}
+
+impl State {
+    pub fn new_handle(&mut self) -> Handle {
+        self.next_handle += 1;
+        self.next_handle
+    }
+
+    /// Send `data` to world rank `dest`.
+    pub fn send(&mut self, dest: usize, ctx: u64, tag: c_int, data: Vec<u8>) {
+        if dest == self.rank {
+            let source = self.rank;
+            self.deliver(
+                "MPI_Send",
+                Message {
+                    source,
+                    ctx,
+                    tag,
+                    data,
+                },
+            );
+            return;
+        }
+        let peer = self.peers[dest].as_mut().unwrap();
+        if !peer.closed {
+            peer.send(&header(ctx, tag, data.len()), &data);
+        }
+    }
+
+    /// Hand an arrived message to the first matching posted receive, or queue it.
+    fn deliver(&mut self, func: &str, message: Message) {
+        if message.ctx == FINALIZE_CONTEXT {
+            self.peers[message.source].as_mut().unwrap().finalized = true;
+            return;
+        }
+        let matched =
+            self.posted
+                .iter()
+                .position(|&handle| match &self.requests.get(func, handle).kind {
+                    Kind::Recv(recv) => recv.matches(&message),
+                    _ => false,
+                });
+        let Some(pos) = matched else {
+            self.unexpected.push_back(message);
+            return;
+        };
+        let handle = self.posted.remove(pos).unwrap();
+        let request = self.requests.get_mut(func, handle);
+        let Kind::Recv(recv) = &request.kind else {
+            unreachable!()
+        };
+        request.kind = Kind::Complete(recv.complete(func, message));
+        if request.freed {
+            self.requests.remove(func, handle);
+        }
+    }
+
+    /// Post a receive, or complete it right away from the unexpected messages.
+    pub fn post(
+        &mut self,
+        func: &str,
+        recv: Receive,
+        persistent: Option<Persistent>,
+    ) -> MPI_Request {
+        let kind = match self.unexpected.iter().position(|m| recv.matches(m)) {
+            Some(pos) => {
+                let message = self.unexpected.remove(pos).unwrap();
+                Kind::Complete(recv.complete(func, message))
+            }
+            None => Kind::Recv(recv),
+        };
+        let pending = matches!(kind, Kind::Recv(_));
+        let handle = self.requests.insert(Request {
+            kind,
+            persistent,
+            freed: false,
+        });
+        if pending {
+            self.posted.push_back(handle);
+        }
+        handle
+    }
+
+    /// Start receiving into an existing (persistent) request.
+    pub fn repost(&mut self, func: &str, handle: MPI_Request, recv: Receive) {
+        let kind = match self.unexpected.iter().position(|m| recv.matches(m)) {
+            Some(pos) => {
+                let message = self.unexpected.remove(pos).unwrap();
+                Kind::Complete(recv.complete(func, message))
+            }
+            None => {
+                self.posted.push_back(handle);
+                Kind::Recv(recv)
+            }
+        };
+        self.requests.get_mut(func, handle).kind = kind;
+    }
+
+    /// Withdraw a posted receive. Returns false if it has already been matched.
+    pub fn unpost(&mut self, handle: MPI_Request) -> bool {
+        match self.posted.iter().position(|&h| h == handle) {
+            Some(pos) => {
+                self.posted.remove(pos);
+                true
+            }
+            None => false,
+        }
+    }
+
+    /// Move data between the sockets and the message queues without blocking.
+    pub fn progress(&mut self) {
+        for source in 0..self.peers.len() {
+            let Some(peer) = self.peers[source].as_mut() else {
+                continue;
+            };
+            if peer.closed {
+                continue;
+            }
+            peer.flush();
+            let open = peer.read();
+            let messages = peer.frames(source);
+            for message in messages {
+                self.deliver("progress", message);
+            }
+            if !open {
+                let peer = self.peers[source].as_mut().unwrap();
+                if !peer.finalized && !self.finalized {
+                    fatal(
+                        "mpi-loopback",
+                        format!("rank {} exited without calling MPI_Finalize", source),
+                    );
+                }
+                peer.closed = true;
+            }
+        }
+    }
+
+    /// Start a collective on `comm`; `start` computes its first round.
+    pub fn start_schedule(&mut self, comm: &CommInfo, start: Continuation) -> MPI_Request {
+        let tag = self.comms.next_collective(comm.handle);
+        self.requests.insert(Request {
+            kind: Kind::Schedule(Schedule {
+                ctx: comm.collective_ctx(),
+                tag,
+                ranks: comm.ranks.clone(),
+                recvs: Vec::new(),
+                received: Vec::new(),
+                then: Some(Box::new(move |_| start(Vec::new()))),
+            }),
+            persistent: None,
+            freed: false,
+        })
+    }
+}
+
+/// Progress request `handle` without blocking. Returns true once it is complete or inactive.
+///
+/// Continuations of collectives run without the lock, so that user-defined reductions may call
+/// into MPI.
+pub fn advance(func: &str, handle: MPI_Request) -> bool {
+    let mut st = lock();
+    st.progress();
+    loop {
+        let State {
+            requests,
+            unexpected,
+            ..
+        } = &mut *st;
+        let request = requests.get_mut(func, handle);
+        let (then, data) = match &mut request.kind {
+            Kind::Inactive | Kind::Complete(_) => return true,
+            Kind::Recv(_) => return false,
+            Kind::Schedule(schedule) => {
+                if schedule.then.is_none() || !schedule.receive(unexpected) {
+                    return false;
+                }
+                let data = schedule.received.drain(..).map(Option::unwrap).collect();
+                (schedule.then.take().unwrap(), data)
+            }
+        };
+        drop(st);
+        let step = then(data);
+        st = lock();
+        let request = st.requests.get_mut(func, handle);
+        let Kind::Schedule(schedule) = &mut request.kind else {
+            unreachable!()
+        };
+        match step {
+            Step::Done => {
+                request.kind = Kind::Complete(MPI_Status::new(MPI_ANY_SOURCE, MPI_ANY_TAG, 0));
+                if request.freed {
+                    st.requests.remove(func, handle);
+                    return true;
+                }
+            }
+            Step::Round { sends, recvs, then } => {
+                let (ctx, tag, ranks) = (schedule.ctx, schedule.tag, schedule.ranks.clone());
+                schedule.received = vec![None; recvs.len()];
+                schedule.recvs = recvs;
+                schedule.then = Some(then);
+                for (dest, data) in sends {
+                    st.send(ranks[dest], ctx, tag, data);
+                }
+            }
+        }
+    }
+}
+
+/// Release the lock and wait until a socket is ready or a short timeout passes.
+pub fn block(st: StateGuard) {
+    let mut fds: Vec<libc::pollfd> = st
+        .peers
+        .iter()
+        .flatten()
+        .filter(|p| !p.closed)
+        .map(|p| libc::pollfd {
+            fd: p.fd,
+            events: if p.output.is_empty() {
+                libc::POLLIN
+            } else {
+                libc::POLLIN | libc::POLLOUT
+            },
+            revents: 0,
+        })
+        .collect();
+    drop(st);
+    unsafe { libc::poll(fds.as_mut_ptr(), fds.len() as _, 1) };
+}
+
+/// Block until request `handle` is complete.
+pub fn wait(func: &str, handle: MPI_Request) {
+    while !advance(func, handle) {
+        block(lock());
+    }
+}
+
+/// Set up `size` ranks by forking this process and install the calling rank's state.
+pub fn start(size: usize, thread_level: c_int) {
+    let mut guard = STATE.lock().unwrap_or_else(|e| e.into_inner());
+    let mut ends = vec![vec![-1; size]; size];
+    for i in 0..size {
+        for j in i + 1..size {
+            let mut pair = [0; 2];
+            if unsafe { libc::socketpair(libc::AF_UNIX, libc::SOCK_STREAM, 0, pair.as_mut_ptr()) }
+                != 0
+            {
+                fatal("MPI_Init", std::io::Error::last_os_error());
+            }
+            ends[i][j] = pair[0];
+            ends[j][i] = pair[1];
+        }
+    }
+    let mut rank = 0;
+    let mut children = Vec::new();
+    for r in 1..size {
+        match unsafe { libc::fork() } {
+            -1 => fatal("MPI_Init", std::io::Error::last_os_error()),
+            0 => {
+                rank = r;
+                children.clear();
+                break;
+            }
+            pid => children.push(pid),
+        }
+    }
+    let mut peers: Vec<Option<Peer>> = (0..size).map(|_| None).collect();
+    for (i, row) in ends.iter().enumerate() {
+        for (j, &fd) in row.iter().enumerate() {
+            if i == rank {
+                if fd >= 0 {
+                    peers[j] = Some(Peer::new(fd));
+                }
+            } else if fd >= 0 {
+                unsafe { libc::close(fd) };
+            }
+        }
+    }
+    *guard = Some(State {
+        rank,
+        size,
+        thread_level,
+        main_thread: thread::current().id(),
+        finalized: false,
+        peers,
+        children,
+        unexpected: VecDeque::new(),
+        posted: VecDeque::new(),
+        requests: Requests::default(),
+        datatypes: Datatypes::default(),
+        ops: Ops::default(),
+        comms: Comms::new(rank, size),
+        messages: HashMap::new(),
+        buffer: None,
+        next_handle: FIRST_HANDLE,
+    });
+}
+
+/// Tell the peers that this rank is done, close the sockets and wait for the forked ranks.
+pub fn finish() {
+    let mut st = lock();
+    st.finalized = true;
+    for dest in 0..st.size {
+        if dest != st.rank {
+            st.send(dest, FINALIZE_CONTEXT, 0, Vec::new());
+        }
+    }
+    loop {
+        st.progress();
+        if st
+            .peers
+            .iter()
+            .flatten()
+            .all(|p| p.closed || p.output.is_empty())
+        {
+            break;
+        }
+        block(st);
+        st = lock();
+    }
+    for peer in st.peers.iter_mut().flatten() {
+        unsafe { libc::close(peer.fd) };
+        peer.closed = true;
+    }
+    let children = std::mem::take(&mut st.children);
+    drop(st);
+    let mut failed = 0;
+    for (i, pid) in children.into_iter().enumerate() {
+        let mut status = 0;
+        unsafe { libc::waitpid(pid, &mut status, 0) };
+        let code = if libc::WIFEXITED(status) {
+            libc::WEXITSTATUS(status)
+        } else {
+            1
+        };
+        if code != 0 {
+            eprintln!("mpi-loopback: rank {} exited with status {}", i + 1, code);
+            failed = code;
+        }
+    }
+    if failed != 0 {
+        std::process::exit(failed);
+    }
+}
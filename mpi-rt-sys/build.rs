@@ -0,0 +1,33 @@
+use std::{env, path::Path};
+
+fn main() {
+    println!("cargo:rerun-if-env-changed=MPI_RT_LIB");
+
+    if env::var_os("CARGO_FEATURE_LINK").is_none() {
+        return;
+    }
+
+    // With the `link` feature, MPI_RT_LIB names the MPIABI library to link against at build
+    // time instead of the library to load at run time.
+    let path = env::var("MPI_RT_LIB").expect(
+        "MPI_RT_LIB environment variable not set. The `link` feature needs it at build time to \
+         locate the MPIwrapper library (e.g., /path/to/libmpiwrapper.so)",
+    );
+    let path = Path::new(&path);
+
+    let name = path
+        .file_stem()
+        .and_then(|stem| stem.to_str())
+        .and_then(|stem| stem.strip_prefix("lib"))
+        .unwrap_or_else(|| {
+            panic!(
+                "MPI_RT_LIB '{}' does not name a shared library of the form lib<name>.so",
+                path.display()
+            )
+        });
+
+    if let Some(dir) = path.parent().filter(|dir| !dir.as_os_str().is_empty()) {
+        println!("cargo:rustc-link-search=native={}", dir.display());
+    }
+    println!("cargo:rustc-link-lib=dylib={}", name);
+}
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Extract the constant values of the MPI standard ABI from mpi_abi.h.
+
+The MPI standard ABI (MPI 5.0) fixes the value of every predefined constant and
+handle in `mpi_abi.h`, so libraries implementing it (e.g. MPICH's libmpi_abi.so)
+do not export them as symbols. This script reads the header and writes
+mpiabi/mpi_abi_constants.py with the values of every constant gen_rust.py knows
+about.
+
+Usage: python3 extract_mpi_abi.py /path/to/mpi_abi.h
+"""
+
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mpiabi.mpi_constants import constants
+
+OUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mpiabi", "mpi_abi_constants.py")
+
+# Sizes that gen_rust.py emits in addition to the constants in mpi_constants.py
+EXTRA_NAMES = [
+    "MPI_MAX_LIBRARY_VERSION_STRING",
+    "MPI_MAX_OBJECT_NAME",
+    "MPI_MAX_PROCESSOR_NAME",
+]
+
+DEFINE_CAST = re.compile(r"^#define\s+(MPI_\w+)\s+\(\([^)]*\)\s*(-?(?:0x[0-9a-fA-F]+|\d+))\)")
+DEFINE_VALUE = re.compile(r"^#define\s+(MPI_\w+)\s+(-?(?:0x[0-9a-fA-F]+|\d+))\b")
+DEFINE_ALIAS = re.compile(r"^#define\s+(MPI_\w+)\s+(MPI_\w+)\s*$")
+ENUM_VALUE = re.compile(r"^\s*(MPI_\w+)\s*=\s*(-?(?:0x[0-9a-fA-F]+|\d+))")
+
+
+def parse_header(path: str) -> dict:
+    """Return a map from constant name to integer value."""
+    values = {}
+    aliases = {}
+    with open(path) as f:
+        for line in f:
+            for pattern in (DEFINE_CAST, DEFINE_VALUE, ENUM_VALUE):
+                m = pattern.match(line)
+                if m:
+                    values[m.group(1)] = int(m.group(2), 0)
+                    break
+            else:
+                m = DEFINE_ALIAS.match(line)
+                if m:
+                    aliases[m.group(1)] = m.group(2)
+    for name, target in aliases.items():
+        if target in values:
+            values[name] = values[target]
+    return values
+
+
+def main():
+    if len(sys.argv) != 2:
+        sys.exit(__doc__)
+    values = parse_header(sys.argv[1])
+
+    names = [c[1] for c in constants] + EXTRA_NAMES
+    # Handles read better in hex, like in mpi_abi.h
+    hex_names = {c[1] for c in constants if c[0] != "int"}
+    lines = []
+    lines.append("# Constant values of the MPI standard ABI (MPI 5.0, mpi_abi.h)")
+    lines.append("#")
+    lines.append("# Auto-generated by extract_mpi_abi.py. Do not edit manually.")
+    lines.append("# Constants that mpi_abi.h does not define are listed as None and emitted as null pointers.")
+    lines.append("")
+    lines.append("standard_abi_values = {")
+    for name in names:
+        value = values.get(name)
+        if value is None:
+            lines.append(f"    \"{name}\": None,")
+        elif name in hex_names and value >= 0:
+            lines.append(f"    \"{name}\": {value:#x},")
+        else:
+            lines.append(f"    \"{name}\": {value},")
+    lines.append("}")
+    lines.append("")
+
+    with open(OUT_PATH, "w") as f:
+        f.write("\n".join(lines))
+    missing = [n for n in names if n not in values]
+    print(f"Generated {OUT_PATH} ({len(names) - len(missing)} values, {len(missing)} missing)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,10 @@
 """Generate Rust bindings for mpi-rt-sys from mpiabi definitions.
 
 Reads mpiabi/mpi_functions.py and mpiabi/mpi_constants.py and generates:
-- ../src/functions.rs  -- dynamic-dispatch function wrappers
+- ../src/functions.rs  -- function table and dispatch wrappers
 - ../src/constants.rs  -- constant loading and accessor functions
+- ../src/linked_functions.rs, ../src/linked_constants.rs
+                        -- extern "C" declarations for the `link` feature
 """
 
 import os
@@ -14,6 +16,13 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from mpiabi.mpi_functions import functions
 from mpiabi.mpi_constants import constants
+from mpiabi.mpi_abi_constants import standard_abi_values
+
+# Constants may carry a third element, a value fixed across MPIABI implementations. If the MPI
+# standard ABI uses the same value, the constant is emitted as a Rust `const` and checked against
+# MPIABI libraries once by `verify_constants()` instead of being loaded.
+fixed_constants = [c for c in constants if len(c) == 3 and standard_abi_values[c[1]] == c[2]]
+loaded_constants = [(c[0], c[1]) for c in constants if c not in fixed_constants]
 
 OUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
 
@@ -41,6 +50,7 @@ TYPE_MAP = {
     "MPI_Aint": "MPI_Aint",
     "const MPI_Aint *": "*const MPI_Aint",
     "const MPI_Aint []": "*const MPI_Aint",
+    "const MPI_Count *": "*const MPI_Count",
     "const MPI_Count []": "*const MPI_Count",
     "MPI_Aint *": "*mut MPI_Aint",
     "MPI_Count": "MPI_Count",
@@ -155,61 +165,280 @@ def mpi_to_rsmpi_const(name: str) -> str:
     return "RSMPI_" + name[4:]
 
 
+RUST_KEYWORDS = ("type", "match", "ref", "mod", "fn", "in")
+
+
+# Functions that fill an array of statuses, and the expression for the number of filled entries.
+# A standard ABI library writes those with its own, possibly shorter, MPI_Status stride.
+STATUS_ARRAY_COUNT = {
+    "MPI_Waitall": "count",
+    "MPI_Testall": "count",
+    "MPI_Waitsome": "*outcount",
+    "MPI_Testsome": "*outcount",
+}
+
+
+# Count parameters whose data volume the `trace` feature records, with the names the buffer
+# and datatype parameters that go with them may have.
+TRACED_COUNTS = {
+    "count": (("buf", "buffer", "sendbuf", "inbuf"), "datatype"),
+    "sendcount": (("sendbuf",), "sendtype"),
+    "recvcount": (("recvbuf",), "recvtype"),
+    "origin_count": (("origin_addr",), "origin_datatype"),
+    "result_count": (("result_addr",), "result_datatype"),
+}
+
+
+def trace_volume(params) -> str:
+    """Rust expression for the number of bytes a call moves, for the `trace` feature."""
+    types = {p_name: p_type for p_type, p_name in params}
+    terms = []
+    for p_type, p_name in params:
+        if p_type not in ("int", "MPI_Count") or p_name not in TRACED_COUNTS:
+            continue
+        bufs, datatype = TRACED_COUNTS[p_name]
+        if datatype not in types:
+            continue
+        buf = next((b for b in bufs if b in types), None)
+        if buf is None:
+            buf_arg = "std::ptr::null()"
+        elif types[buf] == "const void *":
+            buf_arg = buf
+        else:
+            buf_arg = f"{buf} as *const c_void"
+        terms.append(f"trace::volume({buf_arg}, {p_name}, {datatype})")
+    return " + ".join(terms) if terms else "0"
+
+
+def rust_signature(ret_type: str, params) -> tuple:
+    """Map a spec entry to (named params, param types, call args, return suffix)."""
+    rust_params = []
+    fn_type_params = []
+    call_args = []
+
+    for p_type, p_name in params:
+        rust_type = map_type(p_type)
+        # Sanitize parameter name (avoid Rust keywords)
+        safe_name = p_name
+        if safe_name in RUST_KEYWORDS:
+            safe_name = safe_name + "_"
+        rust_params.append(f"{safe_name}: {rust_type}")
+        fn_type_params.append(rust_type)
+        call_args.append(safe_name)
+
+    rust_ret = map_type(ret_type)
+    ret_suffix = f" -> {rust_ret}" if rust_ret != "()" else ""
+    return rust_params, fn_type_params, call_args, ret_suffix
+
+
 def generate_functions() -> str:
-    """Generate functions.rs content."""
+    """Generate functions.rs content.
+
+    All entry points live in a single static `MpiFunctionTable`. Every entry starts
+    out bound to a stub that resolves the whole table in one pass and forwards the
+    call, so the table is resolved the first time any MPI function is called (or
+    eagerly through `crate::preload()`). Each wrapper loads its entry and calls it,
+    without checking whether the table has been resolved.
+    """
     lines = []
     lines.append("//! MPI function bindings via dynamic loading.")
     lines.append("//!")
     lines.append("//! Auto-generated by gen_rust.py. Do not edit manually.")
     lines.append("")
-    lines.append("use std::os::raw::{c_char, c_double, c_int, c_void};")
-    lines.append("use std::sync::OnceLock;")
+    lines.append("use std::{")
+    lines.append("    mem,")
+    lines.append("    os::raw::{c_char, c_double, c_int, c_void},")
+    lines.append("    sync::{")
+    lines.append("        atomic::{AtomicPtr, Ordering},")
+    lines.append("        Once,")
+    lines.append("    },")
+    lines.append("};")
     lines.append("")
-    lines.append("use crate::callback_types::*;")
-    lines.append("use crate::types::*;")
-    lines.append("use crate::loader;")
+    lines.append("#[cfg(feature = \"trace\")]")
+    lines.append("use crate::trace;")
+    lines.append("use crate::{callback_types::*, loader, types::*};")
     lines.append("")
 
-    for ret_type, name, params, tag in functions:
-        # Build Rust parameter list
-        rust_params = []
-        fn_type_params = []
-        call_args = []
-
-        for p_type, p_name in params:
-            rust_type = map_type(p_type)
-            # Sanitize parameter name (avoid Rust keywords)
-            safe_name = p_name
-            if safe_name in ("type", "match", "ref", "mod", "fn", "in"):
-                safe_name = safe_name + "_"
-            rust_params.append(f"    {safe_name}: {rust_type},")
-            fn_type_params.append(rust_type)
-            call_args.append(safe_name)
-
-        rust_ret = map_type(ret_type)
-        ret_suffix = f" -> {rust_ret}" if rust_ret != "()" else ""
-
-        fn_type_params_str = ", ".join(fn_type_params)
-        fn_type_ret = f" -> {rust_ret}" if rust_ret != "()" else ""
+    signatures = [(name, rust_signature(ret_type, params)) for ret_type, name, params, tag in functions]
+    volumes = [trace_volume(params) for _, _, params, _ in functions]
+
+    # The table itself
+    lines.append("/// Every MPI entry point of the loaded library.")
+    lines.append("///")
+    lines.append("/// Each entry starts out bound to a stub in `lazy` that resolves the whole table and")
+    lines.append("/// then forwards the call. Resolving binds every entry to the library's symbol, or to a")
+    lines.append("/// stub in `missing` that panics with the symbol name if the library does not export it.")
+    lines.append("/// Every value an entry ever holds can be called, so the wrappers load their entry with")
+    lines.append("/// a relaxed load, which is a plain load, and call it without any check.")
+    lines.append("struct MpiFunctionTable {")
+    for name, _ in signatures:
+        lines.append(f"    {name}: AtomicPtr<c_void>,")
+    lines.append("}")
+    lines.append("")
+
+    lines.append("static TABLE: MpiFunctionTable = MpiFunctionTable {")
+    for name, _ in signatures:
+        lines.append(f"    {name}: AtomicPtr::new(lazy::{name} as *mut c_void),")
+    lines.append("};")
+    lines.append("")
+
+    lines.append("macro_rules! resolve {")
+    lines.append("    ($name:ident) => {")
+    lines.append("        TABLE.$name.store(")
+    lines.append("            loader::find_symbol(concat!(stringify!($name), \"\\0\").as_bytes())")
+    lines.append("                .unwrap_or(missing::$name as *const c_void) as *mut c_void,")
+    lines.append("            Ordering::Relaxed,")
+    lines.append("        )")
+    lines.append("    };")
+    lines.append("}")
+    lines.append("")
+    lines.append("static RESOLVED: Once = Once::new();")
+    lines.append("")
+    lines.append("/// Resolve every entry point of the loaded library, if that has not happened yet.")
+    lines.append("pub fn resolve_function_table() {")
+    lines.append("    RESOLVED.call_once(|| {")
+    for name, _ in signatures:
+        lines.append(f"        resolve!({name});")
+    lines.append("    });")
+    lines.append("}")
+    lines.append("")
+
+    # Typed access to the entries
+    lines.append("/// The current entry point of each function in `TABLE`.")
+    lines.append("pub(crate) mod entry {")
+    lines.append("    use super::*;")
+    lines.append("")
+    for name, (_, fn_type_params, _, ret_suffix) in signatures:
+        lines.append("    #[inline(always)]")
+        lines.append(f"    pub(crate) fn {name}() -> unsafe extern \"C\" fn({', '.join(fn_type_params)}){ret_suffix} {{")
+        lines.append(f"        unsafe {{ mem::transmute(TABLE.{name}.load(Ordering::Relaxed)) }}")
+        lines.append("    }")
+        lines.append("")
+    lines.append("}")
+    lines.append("")
+
+    # Stand-ins that resolve the table on the first call
+    lines.append("mod lazy {")
+    lines.append("    use super::*;")
+    lines.append("")
+    for name, (rust_params, _, call_args, ret_suffix) in signatures:
+        lines.append("    #[cold]")
+        lines.append(f"    pub(super) unsafe extern \"C\" fn {name}({', '.join(rust_params)}){ret_suffix} {{")
+        lines.append("        resolve_function_table();")
+        lines.append(f"        (entry::{name}())({', '.join(call_args)})")
+        lines.append("    }")
+        lines.append("")
+    lines.append("}")
+    lines.append("")
+
+    # Stand-ins for symbols missing from the library
+    lines.append("mod missing {")
+    lines.append("    use super::*;")
+    lines.append("")
+    for name, (_, fn_type_params, _, ret_suffix) in signatures:
+        stub_params = ", ".join(f"_: {t}" for t in fn_type_params)
+        lines.append(f"    pub(super) unsafe extern \"C\" fn {name}({stub_params}){ret_suffix} {{")
+        lines.append(f"        loader::missing_symbol(\"{name}\")")
+        lines.append("    }")
+        lines.append("")
+    lines.append("}")
+    lines.append("")
+
+    # Names for the `trace` feature, indexed like the wrappers below
+    lines.append("/// Names of the MPI functions, in the order `trace` records them.")
+    lines.append("#[cfg(feature = \"trace\")]")
+    lines.append(f"pub(crate) static FUNCTION_NAMES: [&str; {len(signatures)}] = [")
+    for name, _ in signatures:
+        lines.append(f"    \"{name}\",")
+    lines.append("];")
+    lines.append("")
 
+    # The wrappers
+    for index, (name, (rust_params, _, call_args, ret_suffix)) in enumerate(signatures):
+        lines.append("#[inline]")
         lines.append(f"pub unsafe fn {name}(")
         for p in rust_params:
-            lines.append(p)
+            lines.append(f"    {p},")
         lines.append(f"){ret_suffix} {{")
-        lines.append(f"    type F = unsafe extern \"C\" fn({fn_type_params_str}){fn_type_ret};")
-        lines.append(f"    static FN: OnceLock<F> = OnceLock::new();")
-        lines.append(f"    let f = FN.get_or_init(|| {{")
-        lines.append(f"        let ptr = loader::get_symbol::<F>(b\"{name}\\0\");")
-        lines.append(f"        std::mem::transmute(ptr)")
-        lines.append(f"    }});")
-        call_args_str = ", ".join(call_args)
-        lines.append(f"    f({call_args_str})")
-        lines.append(f"}}")
+        lines.append("    #[cfg(feature = \"trace\")]")
+        lines.append(f"    let _call = trace::Call::new({index}, {volumes[index]});")
+        if name in STATUS_ARRAY_COUNT:
+            lines.append(f"    let ret = (entry::{name}())({', '.join(call_args)});")
+            lines.append(f"    spread_statuses(array_of_statuses, {STATUS_ARRAY_COUNT[name]});")
+            lines.append("    ret")
+        else:
+            lines.append(f"    (entry::{name}())({', '.join(call_args)})")
+        lines.append("}")
         lines.append("")
 
     return "\n".join(lines)
 
 
+def standard_abi_value(c_type: str, rust_type: str, name: str) -> str:
+    """Rust expression for the standard ABI value of a constant."""
+    value = standard_abi_values[name]
+    if rust_type.startswith("*mut"):
+        pointee = rust_type[len("*mut "):]
+        return "std::ptr::null_mut()" if not value else f"std::ptr::null_mut::<{pointee}>().wrapping_byte_add({value:#x})"
+    if c_type in CALLBACK_TYPE_MAP:
+        return "None" if not value else f"std::mem::transmute::<usize, {rust_type}>({value:#x})"
+    assert value is not None, f"{name} has no value in mpi_abi.h"
+    return f"{value:#x}" if c_type != "int" and value >= 0 else str(value)
+
+
+def emit_fixed_constants(lines):
+    """Emit `const` values and accessors for constants with a fixed value."""
+    lines.append("// Constants with the same value in every supported MPI implementation,")
+    lines.append("// checked against the library by `verify_constants()`")
+    for c_type, name, value in fixed_constants:
+        rust_type, _ = CONST_TYPE_MAP[c_type]
+        rsmpi_name = mpi_to_rsmpi_const(name)
+        lines.append(f"pub const {name}: {rust_type} = {value};")
+        lines.append("")
+        lines.append("#[inline(always)]")
+        lines.append(f"pub const fn {rsmpi_name}_fn() -> {rust_type} {{")
+        lines.append(f"    {name}")
+        lines.append("}")
+        lines.append("")
+        lines.append("#[inline(always)]")
+        lines.append(f"pub const fn {rsmpi_name}() -> {rust_type} {{")
+        lines.append(f"    {name}")
+        lines.append("}")
+        lines.append("")
+
+
+def emit_verify_constants(lines, read_expr, setup=None):
+    """Emit `verify_constants()`, comparing every fixed constant with the library.
+
+    `read_expr` is a format string with `{t}` (Rust type) and `{abi}` (MPIABI symbol)
+    that reads the value exported by the library.
+    """
+    lines.append("/// Check the constants that are compiled in as `const` against the MPI library.")
+    lines.append("///")
+    lines.append("/// Panics if the library disagrees about any of them. The check only runs once.")
+    lines.append("pub fn verify_constants() {")
+    lines.append("    static VERIFIED: Once = Once::new();")
+    lines.append("    VERIFIED.call_once(|| {")
+    for line in setup or []:
+        lines.append(f"        {line}")
+    lines.append("        let mut mismatches = Vec::new();")
+    for c_type, name, _ in fixed_constants:
+        rust_type, _ = CONST_TYPE_MAP[c_type]
+        read = read_expr.format(t=rust_type, abi=mpi_to_mpiabi_const(name))
+        lines.append(f"        let value = unsafe {{ {read} }};")
+        lines.append(f"        if value != {name} {{")
+        lines.append(f"            mismatches.push(format!(\"{name}: expected {{}}, found {{}}\", {name}, value));")
+        lines.append("        }")
+    lines.append("        assert!(")
+    lines.append("            mismatches.is_empty(),")
+    lines.append("            \"MPI library does not match the constants compiled into mpi-rt-sys:\\n{}\",")
+    lines.append("            mismatches.join(\"\\n\")")
+    lines.append("        );")
+    lines.append("    });")
+    lines.append("}")
+    lines.append("")
+
+
 def generate_constants() -> str:
     """Generate constants.rs content."""
     lines = []
@@ -217,17 +446,17 @@ def generate_constants() -> str:
     lines.append("//!")
     lines.append("//! Auto-generated by gen_rust.py. Do not edit manually.")
     lines.append("")
-    lines.append("use std::os::raw::{c_char, c_double, c_int, c_void};")
-    lines.append("use std::sync::OnceLock;")
+    lines.append("use std::{")
+    lines.append("    os::raw::{c_char, c_double, c_int, c_void},")
+    lines.append("    sync::{Once, OnceLock},")
+    lines.append("};")
     lines.append("")
-    lines.append("use crate::callback_types::*;")
-    lines.append("use crate::types::*;")
-    lines.append("use crate::loader;")
+    lines.append("use crate::{callback_types::*, loader, types::*};")
     lines.append("")
 
     # Generate struct fields
     lines.append("struct MpiConstants {")
-    for c_type, name in constants:
+    for c_type, name in loaded_constants:
         if c_type not in CONST_TYPE_MAP:
             lines.append(f"    // SKIPPED: {name} (unknown type: {c_type})")
             continue
@@ -246,32 +475,62 @@ def generate_constants() -> str:
     # Generate init function
     lines.append("static CONSTANTS: OnceLock<MpiConstants> = OnceLock::new();")
     lines.append("")
+    lines.append("#[inline(always)]")
     lines.append("fn get_constants() -> &'static MpiConstants {")
-    lines.append("    CONSTANTS.get_or_init(|| {")
-    lines.append("        let lib = loader::library();")
-    lines.append("        unsafe {")
-    lines.append("            MpiConstants {")
-    for c_type, name in constants:
+    lines.append("    match CONSTANTS.get() {")
+    lines.append("        Some(constants) => constants,")
+    lines.append("        None => load_constants(),")
+    lines.append("    }")
+    lines.append("}")
+    lines.append("")
+    lines.append("#[cold]")
+    lines.append("#[inline(never)]")
+    lines.append("fn load_constants() -> &'static MpiConstants {")
+    lines.append("    CONSTANTS.get_or_init(|| match loader::abi() {")
+    lines.append("        Abi::Mpiabi => mpiabi_constants(),")
+    lines.append("        Abi::Standard => standard_abi_constants(),")
+    lines.append("    })")
+    lines.append("}")
+    lines.append("")
+    lines.append("fn mpiabi_constants() -> MpiConstants {")
+    lines.append("    let lib = loader::library();")
+    lines.append("    unsafe {")
+    lines.append("        MpiConstants {")
+    for c_type, name in loaded_constants:
         if c_type not in CONST_TYPE_MAP:
             continue
         rust_type, _ = CONST_TYPE_MAP[c_type]
         field_name = name.lower()
         mpiabi_name = mpi_to_mpiabi_const(name)
-        lines.append(f"                {field_name}: *lib.get::<{rust_type}>(b\"{mpiabi_name}\\0\").expect(\"symbol {mpiabi_name}\"),")
-    lines.append("            }")
+        lines.append(f"            {field_name}: *lib.get::<{rust_type}>(b\"{mpiabi_name}\\0\").expect(\"symbol {mpiabi_name}\"),")
     lines.append("        }")
-    lines.append("    })")
+    lines.append("    }")
+    lines.append("}")
+    lines.append("")
+    lines.append("// Values from mpi_abi.h, see mpiabi/mpi_abi_constants.py")
+    lines.append("fn standard_abi_constants() -> MpiConstants {")
+    lines.append("    unsafe {")
+    lines.append("        MpiConstants {")
+    for c_type, name in loaded_constants:
+        if c_type not in CONST_TYPE_MAP:
+            continue
+        rust_type, _ = CONST_TYPE_MAP[c_type]
+        field_name = name.lower()
+        lines.append(f"            {field_name}: {standard_abi_value(c_type, rust_type, name)},")
+    lines.append("        }")
+    lines.append("    }")
     lines.append("}")
     lines.append("")
 
     # Generate RSMPI_*_fn() accessor functions
     # These use the RSMPI_ naming to match what the main mpi crate expects
-    for c_type, name in constants:
+    for c_type, name in loaded_constants:
         if c_type not in CONST_TYPE_MAP:
             continue
         rust_type, _ = CONST_TYPE_MAP[c_type]
         rsmpi_name = mpi_to_rsmpi_const(name)
         field_name = name.lower()
+        lines.append("#[inline]")
         lines.append(f"pub fn {rsmpi_name}_fn() -> {rust_type} {{")
         lines.append(f"    get_constants().{field_name}")
         lines.append(f"}}")
@@ -279,18 +538,32 @@ def generate_constants() -> str:
 
     # Also generate MPI_* aliases (for code that uses MPI_* names directly)
     # These are extern-compatible names
-    for c_type, name in constants:
+    for c_type, name in loaded_constants:
         if c_type not in CONST_TYPE_MAP:
             continue
         rust_type, _ = CONST_TYPE_MAP[c_type]
         rsmpi_name = mpi_to_rsmpi_const(name)
         field_name = name.lower()
         # Also export as RSMPI_ (non-fn) for mpi-rt-sys direct use
+        lines.append("#[inline]")
         lines.append(f"pub fn {rsmpi_name}() -> {rust_type} {{")
         lines.append(f"    get_constants().{field_name}")
         lines.append(f"}}")
         lines.append("")
 
+    emit_fixed_constants(lines)
+    emit_verify_constants(
+        lines,
+        "*lib.get::<{t}>(b\"{abi}\\0\").expect(\"symbol {abi}\")",
+        [
+            "// The folded values are taken from mpi_abi.h, so only MPIABI libraries need checking",
+            "if loader::abi() == Abi::Standard {",
+            "    return;",
+            "}",
+            "let lib = loader::library();",
+        ],
+    )
+
     # Additional constants that rsmpi uses but aren't in mpiabi constants
     # MAX_LIBRARY_VERSION_STRING and MAX_PROCESSOR_NAME
     lines.append("// Additional constants used by rsmpi (loaded from MPIABI symbols)")
@@ -298,9 +571,12 @@ def generate_constants() -> str:
     lines.append("    // MPI standard defines this as MPI_MAX_LIBRARY_VERSION_STRING")
     lines.append("    // MPItrampoline exposes it as MPIABI_MAX_LIBRARY_VERSION_STRING")
     lines.append("    static VAL: OnceLock<c_int> = OnceLock::new();")
-    lines.append("    *VAL.get_or_init(|| {")
-    lines.append("        let lib = loader::library();")
-    lines.append("        unsafe { *lib.get::<c_int>(b\"MPIABI_MAX_LIBRARY_VERSION_STRING\\0\").expect(\"MPIABI_MAX_LIBRARY_VERSION_STRING\") }")
+    lines.append("    *VAL.get_or_init(|| match loader::abi() {")
+    lines.append("        Abi::Mpiabi => {")
+    lines.append("            let lib = loader::library();")
+    lines.append("            unsafe { *lib.get::<c_int>(b\"MPIABI_MAX_LIBRARY_VERSION_STRING\\0\").expect(\"MPIABI_MAX_LIBRARY_VERSION_STRING\") }")
+    lines.append("        }")
+    lines.append(f"        Abi::Standard => {standard_abi_values['MPI_MAX_LIBRARY_VERSION_STRING']},")
     lines.append("    })")
     lines.append("}")
     lines.append("")
@@ -310,9 +586,12 @@ def generate_constants() -> str:
     lines.append("")
     lines.append("pub fn RSMPI_MAX_PROCESSOR_NAME_fn() -> c_int {")
     lines.append("    static VAL: OnceLock<c_int> = OnceLock::new();")
-    lines.append("    *VAL.get_or_init(|| {")
-    lines.append("        let lib = loader::library();")
-    lines.append("        unsafe { *lib.get::<c_int>(b\"MPIABI_MAX_PROCESSOR_NAME\\0\").expect(\"MPIABI_MAX_PROCESSOR_NAME\") }")
+    lines.append("    *VAL.get_or_init(|| match loader::abi() {")
+    lines.append("        Abi::Mpiabi => {")
+    lines.append("            let lib = loader::library();")
+    lines.append("            unsafe { *lib.get::<c_int>(b\"MPIABI_MAX_PROCESSOR_NAME\\0\").expect(\"MPIABI_MAX_PROCESSOR_NAME\") }")
+    lines.append("        }")
+    lines.append(f"        Abi::Standard => {standard_abi_values['MPI_MAX_PROCESSOR_NAME']},")
     lines.append("    })")
     lines.append("}")
     lines.append("")
@@ -320,6 +599,17 @@ def generate_constants() -> str:
     lines.append("    RSMPI_MAX_PROCESSOR_NAME_fn()")
     lines.append("}")
     lines.append("")
+    lines.append("/// MPI_MAX_OBJECT_NAME from MPIABI spec (MPIABI_MAX_OBJECT_NAME = 128)")
+    lines.append("pub const MPI_MAX_OBJECT_NAME: usize = 128;")
+    lines.append("pub const RSMPI_MAX_OBJECT_NAME: usize = MPI_MAX_OBJECT_NAME;")
+    lines.append("")
+    lines.append("/// Load every constant from the library now instead of on first access.")
+    lines.append("pub(crate) fn resolve_constants() {")
+    lines.append("    get_constants();")
+    lines.append("    RSMPI_MAX_LIBRARY_VERSION_STRING_fn();")
+    lines.append("    RSMPI_MAX_PROCESSOR_NAME_fn();")
+    lines.append("}")
+    lines.append("")
 
     # RSMPI_Wtime and RSMPI_Wtick (these are functions, not constants)
     lines.append("pub unsafe fn RSMPI_Wtime() -> c_double {")
@@ -344,6 +634,124 @@ def generate_constants() -> str:
     return "\n".join(lines)
 
 
+def generate_linked_functions() -> str:
+    """Generate linked_functions.rs content.
+
+    Used with the `link` feature: the MPIABI library is linked at build time and
+    every MPI function is a direct `extern "C"` call with the same signature as the
+    dynamic-dispatch wrappers in functions.rs.
+    """
+    lines = []
+    lines.append("//! MPI function bindings linked against an MPIABI library at build time.")
+    lines.append("//!")
+    lines.append("//! Auto-generated by gen_rust.py. Do not edit manually.")
+    lines.append("")
+    lines.append("use std::os::raw::{c_char, c_double, c_int, c_void};")
+    lines.append("")
+    lines.append("use crate::{callback_types::*, types::*};")
+    lines.append("")
+    lines.append("extern \"C\" {")
+    for ret_type, name, params, tag in functions:
+        rust_params, _, _, ret_suffix = rust_signature(ret_type, params)
+        lines.append(f"    pub fn {name}({', '.join(rust_params)}){ret_suffix};")
+    lines.append("}")
+    lines.append("")
+
+    return "\n".join(lines)
+
+
+def generate_linked_constants() -> str:
+    """Generate linked_constants.rs content.
+
+    Used with the `link` feature: constants are read directly from the `MPIABI_*`
+    variables of the linked library.
+    """
+    lines = []
+    lines.append("//! MPI constant accessors linked against an MPIABI library at build time.")
+    lines.append("//!")
+    lines.append("//! Auto-generated by gen_rust.py. Do not edit manually.")
+    lines.append("")
+    lines.append("use std::{")
+    lines.append("    os::raw::{c_char, c_double, c_int, c_void},")
+    lines.append("    sync::Once,")
+    lines.append("};")
+    lines.append("")
+    lines.append("use crate::{callback_types::*, types::*};")
+    lines.append("")
+
+    lines.append("extern \"C\" {")
+    for c_type, name in loaded_constants:
+        if c_type not in CONST_TYPE_MAP:
+            lines.append(f"    // SKIPPED: {name} (unknown type: {c_type})")
+            continue
+        rust_type, _ = CONST_TYPE_MAP[c_type]
+        lines.append(f"    static {mpi_to_mpiabi_const(name)}: {rust_type};")
+    for c_type, name, _ in fixed_constants:
+        rust_type, _ = CONST_TYPE_MAP[c_type]
+        lines.append(f"    static {mpi_to_mpiabi_const(name)}: {rust_type};")
+    lines.append("    static MPIABI_MAX_LIBRARY_VERSION_STRING: c_int;")
+    lines.append("    static MPIABI_MAX_PROCESSOR_NAME: c_int;")
+    lines.append("}")
+    lines.append("")
+
+    for c_type, name in loaded_constants:
+        if c_type not in CONST_TYPE_MAP:
+            continue
+        rust_type, _ = CONST_TYPE_MAP[c_type]
+        rsmpi_name = mpi_to_rsmpi_const(name)
+        mpiabi_name = mpi_to_mpiabi_const(name)
+        lines.append("#[inline]")
+        lines.append(f"pub fn {rsmpi_name}_fn() -> {rust_type} {{")
+        lines.append(f"    unsafe {{ {mpiabi_name} }}")
+        lines.append(f"}}")
+        lines.append("")
+
+    for c_type, name in loaded_constants:
+        if c_type not in CONST_TYPE_MAP:
+            continue
+        rust_type, _ = CONST_TYPE_MAP[c_type]
+        rsmpi_name = mpi_to_rsmpi_const(name)
+        lines.append("#[inline]")
+        lines.append(f"pub fn {rsmpi_name}() -> {rust_type} {{")
+        lines.append(f"    {rsmpi_name}_fn()")
+        lines.append(f"}}")
+        lines.append("")
+
+    emit_fixed_constants(lines)
+    emit_verify_constants(lines, "{abi}")
+
+    for name in ("MAX_LIBRARY_VERSION_STRING", "MAX_PROCESSOR_NAME"):
+        lines.append(f"pub fn RSMPI_{name}_fn() -> c_int {{")
+        lines.append(f"    unsafe {{ MPIABI_{name} }}")
+        lines.append("}")
+        lines.append("")
+        lines.append(f"pub fn RSMPI_{name}() -> c_int {{")
+        lines.append(f"    RSMPI_{name}_fn()")
+        lines.append("}")
+        lines.append("")
+
+    lines.append("/// MPI_MAX_OBJECT_NAME from MPIABI spec (MPIABI_MAX_OBJECT_NAME = 128)")
+    lines.append("pub const MPI_MAX_OBJECT_NAME: usize = 128;")
+    lines.append("pub const RSMPI_MAX_OBJECT_NAME: usize = MPI_MAX_OBJECT_NAME;")
+    lines.append("")
+    lines.append("pub unsafe fn RSMPI_Wtime() -> c_double {")
+    lines.append("    crate::functions::MPI_Wtime()")
+    lines.append("}")
+    lines.append("")
+    lines.append("pub unsafe fn RSMPI_Wtick() -> c_double {")
+    lines.append("    crate::functions::MPI_Wtick()")
+    lines.append("}")
+    lines.append("")
+    lines.append("// Aliases matching mpi-sys naming convention")
+    lines.append("// mpi-sys: RSMPI_FLOAT_COMPLEX = MPI_C_FLOAT_COMPLEX")
+    lines.append("pub fn RSMPI_FLOAT_COMPLEX_fn() -> MPI_Datatype {")
+    lines.append("    RSMPI_C_FLOAT_COMPLEX_fn()")
+    lines.append("}")
+    lines.append("")
+
+    return "\n".join(lines)
+
+
 def generate_callback_types() -> str:
     """Generate callback_types.rs with function pointer type aliases.
 
@@ -411,6 +819,17 @@ def main():
         f.write(constants_content)
     print(f"Generated {path} ({len(constants)} constants)")
 
+    # Generate linked_functions.rs and linked_constants.rs (`link` feature)
+    path = os.path.join(OUT_DIR, "linked_functions.rs")
+    with open(path, "w") as f:
+        f.write(generate_linked_functions())
+    print(f"Generated {path} ({len(functions)} functions)")
+
+    path = os.path.join(OUT_DIR, "linked_constants.rs")
+    with open(path, "w") as f:
+        f.write(generate_linked_constants())
+    print(f"Generated {path} ({len(constants)} constants)")
+
     # Generate callback_types.rs
     callback_content = generate_callback_types()
     path = os.path.join(OUT_DIR, "callback_types.rs")
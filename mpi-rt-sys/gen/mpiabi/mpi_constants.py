@@ -1,23 +1,26 @@
+# Each entry is (c_type, name) or (c_type, name, value). A value is given only
+# where every supported MPI implementation agrees on it; such constants are
+# compiled in as Rust `const`s and checked against the library at startup.
 constants = [
     ("int", "MPI_ANY_SOURCE"),                                  # mpich: -2; openmpi: -1
-    ("int", "MPI_ANY_TAG"),                                     # mpich: -1; openmpi: -1
+    ("int", "MPI_ANY_TAG", -1),                                 # mpich: -1; openmpi: -1
     ("int", "MPI_PROC_NULL"),                                   # mpich: -1; openmpi: -2
     ("int", "MPI_ROOT"),                                        # mpich: -3; openmpi: -4
 
     ("int", "MPI_CART"),                                        # mpich: 2; openmpi: 1
-    ("int", "MPI_DIST_GRAPH"),                                  # mpich: 3; openmpi: 3
+    ("int", "MPI_DIST_GRAPH", 3),                               # mpich: 3; openmpi: 3
     ("int", "MPI_GRAPH"),                                       # mpich: 1; openmpi: 2
 
     # Results of compare operations
-    ("int", "MPI_CONGRUENT"),                                   # mpich: 1; openmpi: 1
-    ("int", "MPI_IDENT"),                                       # mpich: 0; openmpi: 0
-    ("int", "MPI_SIMILAR"),                                     # mpich: 2; openmpi: 2
-    ("int", "MPI_UNEQUAL"),                                     # mpich: 3; openmpi: 3
+    ("int", "MPI_CONGRUENT", 1),                                # mpich: 1; openmpi: 1
+    ("int", "MPI_IDENT", 0),                                    # mpich: 0; openmpi: 0
+    ("int", "MPI_SIMILAR", 2),                                  # mpich: 2; openmpi: 2
+    ("int", "MPI_UNEQUAL", 3),                                  # mpich: 3; openmpi: 3
 
     # Predefined constants
     ("int", "MPI_BSEND_OVERHEAD"),                              # openmpi: 128
     ("int", "MPI_KEYVAL_INVALID"),                              # mpich: 0x24000000; openmpi: -1
-    ("int", "MPI_UNDEFINED"),                                   # mpich: -32766;     openmpi: -32766
+    ("int", "MPI_UNDEFINED", -32766),                           # mpich: -32766;     openmpi: -32766
 
     # Key values
     ("int", "MPI_APPNUM"),                                      # mpich: 0x6440000d; openmpi: 4
@@ -121,7 +124,7 @@ constants = [
     ("int", "MPI_ERR_UNSUPPORTED_DATAREP"),
     ("int", "MPI_ERR_UNSUPPORTED_OPERATION"),
     ("int", "MPI_ERR_WIN"),
-    ("int", "MPI_SUCCESS"),                                     # mpich: 0; openmpi: 0
+    ("int", "MPI_SUCCESS", 0),                                  # mpich: 0; openmpi: 0
 
     ("int", "MPI_LOCK_EXCLUSIVE"),                              # mpich: 234; openmpi: 1
     ("int", "MPI_LOCK_SHARED"),                                 # mpich: 235; openmpi: 2
@@ -151,22 +154,22 @@ constants = [
     ("int", "MPI_SEEK_SET"),                                    # openmpi: 600
 
     # Thread support
-    ("int", "MPI_THREAD_FUNNELED"),                             # mpich: 1; openmpi: 1
-    ("int", "MPI_THREAD_MULTIPLE"),                             # mpich: 3; openmpi: 3
-    ("int", "MPI_THREAD_SERIALIZED"),                           # mpich: 2; openmpi: 2
-    ("int", "MPI_THREAD_SINGLE"),                               # mpich: 0; openmpi: 0
+    ("int", "MPI_THREAD_FUNNELED", 1),                          # mpich: 1; openmpi: 1
+    ("int", "MPI_THREAD_MULTIPLE", 3),                          # mpich: 3; openmpi: 3
+    ("int", "MPI_THREAD_SERIALIZED", 2),                        # mpich: 2; openmpi: 2
+    ("int", "MPI_THREAD_SINGLE", 0),                            # mpich: 0; openmpi: 0
 
     # File operation constants
-    ("int", "MPI_TYPECLASS_COMPLEX"),                           # mpich: 3; openmpi: 3
+    ("int", "MPI_TYPECLASS_COMPLEX", 3),                        # mpich: 3; openmpi: 3
     ("int", "MPI_TYPECLASS_INTEGER"),                           # mpich: 2; openmpi: 1
     ("int", "MPI_TYPECLASS_REAL"),                              # mpich: 1; openmpi: 2
 
     # Windows
-    ("int", "MPI_WIN_FLAVOR_ALLOCATE"),                         # mpich: 2; openmpi: 2
-    ("int", "MPI_WIN_FLAVOR_CREATE"),                           # mpich: 1; openmpi: 1
-    ("int", "MPI_WIN_FLAVOR_DYNAMIC"),                          # mpich: 3; openmpi: 3
-    ("int", "MPI_WIN_FLAVOR_SHARED"),                           # mpich: 4; openmpi: 4
-    ("int", "MPI_WIN_SEPARATE"),                                # mpich: 1; openmpi: 1
+    ("int", "MPI_WIN_FLAVOR_ALLOCATE", 2),                      # mpich: 2; openmpi: 2
+    ("int", "MPI_WIN_FLAVOR_CREATE", 1),                        # mpich: 1; openmpi: 1
+    ("int", "MPI_WIN_FLAVOR_DYNAMIC", 3),                       # mpich: 3; openmpi: 3
+    ("int", "MPI_WIN_FLAVOR_SHARED", 4),                        # mpich: 4; openmpi: 4
+    ("int", "MPI_WIN_SEPARATE", 1),                             # mpich: 1; openmpi: 1
     ("int", "MPI_WIN_UNIFIED"),                                 # mpich: 2; openmpi: 0
 
     ("char **", "MPI_ARGV_NULL"),                               # mpich: 0; openmpi: 0
@@ -2799,6 +2799,1309 @@ functions = [
         ("MPI_Fint *", "f_status"),
     ], None),
 
+    # MPI 4.0 large-count variants ("_c"). Counts are MPI_Count and displacements are MPI_Aint.
+
+    # 3 Point-to-Point Communication
+
+    ("int", "MPI_Send_c", [
+        ("const void *", "buf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "dest"),
+        ("int", "tag"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Recv_c", [
+        ("void *", "buf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "source"),
+        ("int", "tag"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Status *", "status"),
+    ], None),
+
+    ("int", "MPI_Get_count_c", [
+        ("const MPI_Status *", "status"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Count *", "count"),
+    ], None),
+
+    ("int", "MPI_Bsend_c", [
+        ("const void *", "buf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "dest"),
+        ("int", "tag"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Ssend_c", [
+        ("const void *", "buf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "dest"),
+        ("int", "tag"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Rsend_c", [
+        ("const void *", "buf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "dest"),
+        ("int", "tag"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Isend_c", [
+        ("const void *", "buf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "dest"),
+        ("int", "tag"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Ibsend_c", [
+        ("const void *", "buf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "dest"),
+        ("int", "tag"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Issend_c", [
+        ("const void *", "buf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "dest"),
+        ("int", "tag"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Irsend_c", [
+        ("const void *", "buf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "dest"),
+        ("int", "tag"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Irecv_c", [
+        ("void *", "buf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "source"),
+        ("int", "tag"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Send_init_c", [
+        ("const void *", "buf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "dest"),
+        ("int", "tag"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Bsend_init_c", [
+        ("const void *", "buf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "dest"),
+        ("int", "tag"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Ssend_init_c", [
+        ("const void *", "buf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "dest"),
+        ("int", "tag"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Rsend_init_c", [
+        ("const void *", "buf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "dest"),
+        ("int", "tag"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Recv_init_c", [
+        ("void *", "buf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "source"),
+        ("int", "tag"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Sendrecv_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("int", "dest"),
+        ("int", "sendtag"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("int", "source"),
+        ("int", "recvtag"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Status *", "status"),
+    ], None),
+
+    ("int", "MPI_Sendrecv_replace_c", [
+        ("void *", "buf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "dest"),
+        ("int", "sendtag"),
+        ("int", "source"),
+        ("int", "recvtag"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Status *", "status"),
+    ], None),
+
+    ("int", "MPI_Mrecv_c", [
+        ("void *", "buf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Message *", "message"),
+        ("MPI_Status *", "status"),
+    ], None),
+
+    ("int", "MPI_Imrecv_c", [
+        ("void *", "buf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Message *", "message"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    # 5 Datatypes
+
+    ("int", "MPI_Get_elements_c", [
+        ("const MPI_Status *", "status"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Count *", "count"),
+    ], None),
+
+    ("int", "MPI_Type_size_c", [
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Count *", "size"),
+    ], None),
+
+    ("int", "MPI_Type_get_extent_c", [
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Count *", "lb"),
+        ("MPI_Count *", "extent"),
+    ], None),
+
+    ("int", "MPI_Type_get_true_extent_c", [
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Count *", "true_lb"),
+        ("MPI_Count *", "true_extent"),
+    ], None),
+
+    ("int", "MPI_Pack_c", [
+        ("const void *", "inbuf"),
+        ("MPI_Count", "incount"),
+        ("MPI_Datatype", "datatype"),
+        ("void *", "outbuf"),
+        ("MPI_Count", "outsize"),
+        ("MPI_Count *", "position"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Unpack_c", [
+        ("const void *", "inbuf"),
+        ("MPI_Count", "insize"),
+        ("MPI_Count *", "position"),
+        ("void *", "outbuf"),
+        ("MPI_Count", "outcount"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Pack_size_c", [
+        ("MPI_Count", "incount"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Count *", "size"),
+    ], None),
+
+    # 6 Collective Communication
+
+    ("int", "MPI_Bcast_c", [
+        ("void *", "buffer"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Ibcast_c", [
+        ("void *", "buffer"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Gather_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Igather_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Gatherv_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "displs"),
+        ("MPI_Datatype", "recvtype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Igatherv_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "displs"),
+        ("MPI_Datatype", "recvtype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Scatter_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Iscatter_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Scatterv_c", [
+        ("const void *", "sendbuf"),
+        ("const MPI_Count *", "sendcounts"),
+        ("const MPI_Aint *", "displs"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Iscatterv_c", [
+        ("const void *", "sendbuf"),
+        ("const MPI_Count *", "sendcounts"),
+        ("const MPI_Aint *", "displs"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Allgather_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Iallgather_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Allgatherv_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "displs"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Iallgatherv_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "displs"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Alltoall_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Ialltoall_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Alltoallv_c", [
+        ("const void *", "sendbuf"),
+        ("const MPI_Count *", "sendcounts"),
+        ("const MPI_Aint *", "sdispls"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "rdispls"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Ialltoallv_c", [
+        ("const void *", "sendbuf"),
+        ("const MPI_Count *", "sendcounts"),
+        ("const MPI_Aint *", "sdispls"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "rdispls"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Alltoallw_c", [
+        ("const void *", "sendbuf"),
+        ("const MPI_Count *", "sendcounts"),
+        ("const MPI_Aint *", "sdispls"),
+        ("const MPI_Datatype *", "sendtypes"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "rdispls"),
+        ("const MPI_Datatype *", "recvtypes"),
+        ("MPI_Comm", "comm"),
+    ], 'manual'),
+
+    ("int", "MPI_Ialltoallw_c", [
+        ("const void *", "sendbuf"),
+        ("const MPI_Count *", "sendcounts"),
+        ("const MPI_Aint *", "sdispls"),
+        ("const MPI_Datatype *", "sendtypes"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "rdispls"),
+        ("const MPI_Datatype *", "recvtypes"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], 'manual'),
+
+    ("int", "MPI_Reduce_c", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Ireduce_c", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Allreduce_c", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Iallreduce_c", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Reduce_local_c", [
+        ("const void *", "inbuf"),
+        ("void *", "inoutbuf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+    ], None),
+
+    ("int", "MPI_Reduce_scatter_block_c", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Ireduce_scatter_block_c", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Reduce_scatter_c", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Ireduce_scatter_c", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Scan_c", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Iscan_c", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Exscan_c", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Iexscan_c", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    # 8.6 Neighborhood Collective Communication
+
+    ("int", "MPI_Neighbor_allgather_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Ineighbor_allgather_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Neighbor_allgatherv_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "displs"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Ineighbor_allgatherv_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "displs"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Neighbor_alltoall_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "senddtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Ineighbor_alltoall_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "senddtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Neighbor_alltoallv_c", [
+        ("const void *", "sendbuf"),
+        ("const MPI_Count *", "sendcounts"),
+        ("const MPI_Aint *", "sdispls"),
+        ("MPI_Datatype", "senddtype"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "rdispls"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+    ], None),
+
+    ("int", "MPI_Ineighbor_alltoallv_c", [
+        ("const void *", "sendbuf"),
+        ("const MPI_Count *", "sendcounts"),
+        ("const MPI_Aint *", "sdispls"),
+        ("MPI_Datatype", "senddtype"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "rdispls"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Neighbor_alltoallw_c", [
+        ("const void *", "sendbuf"),
+        ("const MPI_Count *", "sendcounts"),
+        ("const MPI_Aint *", "sdispls"),
+        ("const MPI_Datatype *", "sendtypes"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "rdispls"),
+        ("const MPI_Datatype *", "recvtypes"),
+        ("MPI_Comm", "comm"),
+    ], 'manual'),
+
+    ("int", "MPI_Ineighbor_alltoallw_c", [
+        ("const void *", "sendbuf"),
+        ("const MPI_Count *", "sendcounts"),
+        ("const MPI_Aint *", "sdispls"),
+        ("const MPI_Datatype *", "sendtypes"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "rdispls"),
+        ("const MPI_Datatype *", "recvtypes"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Request *", "request"),
+    ], 'manual'),
+
+    # MPI 4.0 4 Partitioned Point-to-Point Communication
+
+    ("int", "MPI_Psend_init", [
+        ("const void *", "buf"),
+        ("int", "partitions"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "dest"),
+        ("int", "tag"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Precv_init", [
+        ("void *", "buf"),
+        ("int", "partitions"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "source"),
+        ("int", "tag"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Pready", [
+        ("int", "partition"),
+        ("MPI_Request", "request"),
+    ], None),
+
+    ("int", "MPI_Pready_range", [
+        ("int", "partition_low"),
+        ("int", "partition_high"),
+        ("MPI_Request", "request"),
+    ], None),
+
+    ("int", "MPI_Pready_list", [
+        ("int", "length"),
+        ("const int []", "array_of_partitions"),
+        ("MPI_Request", "request"),
+    ], None),
+
+    ("int", "MPI_Parrived", [
+        ("MPI_Request", "request"),
+        ("int", "partition"),
+        ("int *", "flag"),
+    ], None),
+
+    # MPI 4.0 6.13 Persistent Collective Operations
+
+    ("int", "MPI_Barrier_init", [
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Bcast_init", [
+        ("void *", "buffer"),
+        ("int", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Gather_init", [
+        ("const void *", "sendbuf"),
+        ("int", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("int", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Gatherv_init", [
+        ("const void *", "sendbuf"),
+        ("int", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("const int *", "recvcounts"),
+        ("const int *", "displs"),
+        ("MPI_Datatype", "recvtype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Scatter_init", [
+        ("const void *", "sendbuf"),
+        ("int", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("int", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Scatterv_init", [
+        ("const void *", "sendbuf"),
+        ("const int *", "sendcounts"),
+        ("const int *", "displs"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("int", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Allgather_init", [
+        ("const void *", "sendbuf"),
+        ("int", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("int", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Allgatherv_init", [
+        ("const void *", "sendbuf"),
+        ("int", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("const int *", "recvcounts"),
+        ("const int *", "displs"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Alltoall_init", [
+        ("const void *", "sendbuf"),
+        ("int", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("int", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Alltoallv_init", [
+        ("const void *", "sendbuf"),
+        ("const int *", "sendcounts"),
+        ("const int *", "sdispls"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("const int *", "recvcounts"),
+        ("const int *", "rdispls"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Alltoallw_init", [
+        ("const void *", "sendbuf"),
+        ("const int *", "sendcounts"),
+        ("const int *", "sdispls"),
+        ("const MPI_Datatype *", "sendtypes"),
+        ("void *", "recvbuf"),
+        ("const int *", "recvcounts"),
+        ("const int *", "rdispls"),
+        ("const MPI_Datatype *", "recvtypes"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], "manual"),
+
+    ("int", "MPI_Reduce_init", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("int", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Allreduce_init", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("int", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Reduce_scatter_block_init", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("int", "recvcount"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Reduce_scatter_init", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("const int *", "recvcounts"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Scan_init", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("int", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Exscan_init", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("int", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Bcast_init_c", [
+        ("void *", "buffer"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Gather_init_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Gatherv_init_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "displs"),
+        ("MPI_Datatype", "recvtype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Scatter_init_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Scatterv_init_c", [
+        ("const void *", "sendbuf"),
+        ("const MPI_Count *", "sendcounts"),
+        ("const MPI_Aint *", "displs"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Allgather_init_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Allgatherv_init_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "displs"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Alltoall_init_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Alltoallv_init_c", [
+        ("const void *", "sendbuf"),
+        ("const MPI_Count *", "sendcounts"),
+        ("const MPI_Aint *", "sdispls"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "rdispls"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Alltoallw_init_c", [
+        ("const void *", "sendbuf"),
+        ("const MPI_Count *", "sendcounts"),
+        ("const MPI_Aint *", "sdispls"),
+        ("const MPI_Datatype *", "sendtypes"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "rdispls"),
+        ("const MPI_Datatype *", "recvtypes"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], "manual"),
+
+    ("int", "MPI_Reduce_init_c", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("int", "root"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Allreduce_init_c", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Reduce_scatter_block_init_c", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Reduce_scatter_init_c", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Scan_init_c", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Exscan_init_c", [
+        ("const void *", "sendbuf"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "count"),
+        ("MPI_Datatype", "datatype"),
+        ("MPI_Op", "op"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    # MPI 4.0 7.8 Persistent Neighborhood Communication on Process Topologies
+
+    ("int", "MPI_Neighbor_allgather_init", [
+        ("const void *", "sendbuf"),
+        ("int", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("int", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Neighbor_allgatherv_init", [
+        ("const void *", "sendbuf"),
+        ("int", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("const int *", "recvcounts"),
+        ("const int *", "displs"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Neighbor_alltoall_init", [
+        ("const void *", "sendbuf"),
+        ("int", "sendcount"),
+        ("MPI_Datatype", "senddtype"),
+        ("void *", "recvbuf"),
+        ("int", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Neighbor_alltoallv_init", [
+        ("const void *", "sendbuf"),
+        ("const int *", "sendcounts"),
+        ("const int *", "sdispls"),
+        ("MPI_Datatype", "senddtype"),
+        ("void *", "recvbuf"),
+        ("const int *", "recvcounts"),
+        ("const int *", "rdispls"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Neighbor_alltoallw_init", [
+        ("const void *", "sendbuf"),
+        ("const int *", "sendcounts"),
+        ("const MPI_Aint *", "sdispls"),
+        ("const MPI_Datatype *", "sendtypes"),
+        ("void *", "recvbuf"),
+        ("const int *", "recvcounts"),
+        ("const MPI_Aint *", "rdispls"),
+        ("const MPI_Datatype *", "recvtypes"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], "manual"),
+
+    ("int", "MPI_Neighbor_allgather_init_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Neighbor_allgatherv_init_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "sendtype"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "displs"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Neighbor_alltoall_init_c", [
+        ("const void *", "sendbuf"),
+        ("MPI_Count", "sendcount"),
+        ("MPI_Datatype", "senddtype"),
+        ("void *", "recvbuf"),
+        ("MPI_Count", "recvcount"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Neighbor_alltoallv_init_c", [
+        ("const void *", "sendbuf"),
+        ("const MPI_Count *", "sendcounts"),
+        ("const MPI_Aint *", "sdispls"),
+        ("MPI_Datatype", "senddtype"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "rdispls"),
+        ("MPI_Datatype", "recvtype"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], None),
+
+    ("int", "MPI_Neighbor_alltoallw_init_c", [
+        ("const void *", "sendbuf"),
+        ("const MPI_Count *", "sendcounts"),
+        ("const MPI_Aint *", "sdispls"),
+        ("const MPI_Datatype *", "sendtypes"),
+        ("void *", "recvbuf"),
+        ("const MPI_Count *", "recvcounts"),
+        ("const MPI_Aint *", "rdispls"),
+        ("const MPI_Datatype *", "recvtypes"),
+        ("MPI_Comm", "comm"),
+        ("MPI_Info", "info"),
+        ("MPI_Request *", "request"),
+    ], 'manual'),
+
     # MPIX
 
     ("int", "MPIX_Query_cuda_support", [
@@ -3,40 +3,1564 @@
 //! Auto-generated by gen_rust.py. Do not edit manually.
 
 use std::{
+    mem,
     os::raw::{c_char, c_double, c_int, c_void},
-    sync::OnceLock,
+    sync::{
+        atomic::{AtomicPtr, Ordering},
+        Once,
+    },
 };
 
+#[cfg(feature = "trace")]
+use crate::trace;
 use crate::{callback_types::*, loader, types::*};
 
-pub unsafe fn MPI_Send(
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    dest: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-) -> c_int {
-    type F =
-        unsafe extern "C" fn(*const c_void, c_int, MPI_Datatype, c_int, c_int, MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Send\0");
-        std::mem::transmute(ptr)
-    });
-    f(buf, count, datatype, dest, tag, comm)
-}
+/// Every MPI entry point of the loaded library.
+///
+/// Each entry starts out bound to a stub in `lazy` that resolves the whole table and
+/// then forwards the call. Resolving binds every entry to the library's symbol, or to a
+/// stub in `missing` that panics with the symbol name if the library does not export it.
+/// Every value an entry ever holds can be called, so the wrappers load their entry with
+/// a relaxed load, which is a plain load, and call it without any check.
+struct MpiFunctionTable {
+    MPI_Send: AtomicPtr<c_void>,
+    MPI_Recv: AtomicPtr<c_void>,
+    MPI_Get_count: AtomicPtr<c_void>,
+    MPI_Bsend: AtomicPtr<c_void>,
+    MPI_Ssend: AtomicPtr<c_void>,
+    MPI_Rsend: AtomicPtr<c_void>,
+    MPI_Buffer_attach: AtomicPtr<c_void>,
+    MPI_Buffer_detach: AtomicPtr<c_void>,
+    MPI_Isend: AtomicPtr<c_void>,
+    MPI_Ibsend: AtomicPtr<c_void>,
+    MPI_Issend: AtomicPtr<c_void>,
+    MPI_Irsend: AtomicPtr<c_void>,
+    MPI_Irecv: AtomicPtr<c_void>,
+    MPI_Wait: AtomicPtr<c_void>,
+    MPI_Test: AtomicPtr<c_void>,
+    MPI_Request_free: AtomicPtr<c_void>,
+    MPI_Waitany: AtomicPtr<c_void>,
+    MPI_Testany: AtomicPtr<c_void>,
+    MPI_Waitall: AtomicPtr<c_void>,
+    MPI_Testall: AtomicPtr<c_void>,
+    MPI_Waitsome: AtomicPtr<c_void>,
+    MPI_Testsome: AtomicPtr<c_void>,
+    MPI_Request_get_status: AtomicPtr<c_void>,
+    MPI_Iprobe: AtomicPtr<c_void>,
+    MPI_Probe: AtomicPtr<c_void>,
+    MPI_Improbe: AtomicPtr<c_void>,
+    MPI_Mprobe: AtomicPtr<c_void>,
+    MPI_Mrecv: AtomicPtr<c_void>,
+    MPI_Imrecv: AtomicPtr<c_void>,
+    MPI_Cancel: AtomicPtr<c_void>,
+    MPI_Test_cancelled: AtomicPtr<c_void>,
+    MPI_Send_init: AtomicPtr<c_void>,
+    MPI_Bsend_init: AtomicPtr<c_void>,
+    MPI_Ssend_init: AtomicPtr<c_void>,
+    MPI_Rsend_init: AtomicPtr<c_void>,
+    MPI_Recv_init: AtomicPtr<c_void>,
+    MPI_Start: AtomicPtr<c_void>,
+    MPI_Startall: AtomicPtr<c_void>,
+    MPI_Sendrecv: AtomicPtr<c_void>,
+    MPI_Sendrecv_replace: AtomicPtr<c_void>,
+    MPI_Type_contiguous: AtomicPtr<c_void>,
+    MPI_Type_vector: AtomicPtr<c_void>,
+    MPI_Type_create_hvector: AtomicPtr<c_void>,
+    MPI_Type_indexed: AtomicPtr<c_void>,
+    MPI_Type_create_hindexed: AtomicPtr<c_void>,
+    MPI_Type_create_indexed_block: AtomicPtr<c_void>,
+    MPI_Type_create_hindexed_block: AtomicPtr<c_void>,
+    MPI_Type_create_struct: AtomicPtr<c_void>,
+    MPI_Type_struct: AtomicPtr<c_void>,
+    MPI_Type_create_subarray: AtomicPtr<c_void>,
+    MPI_Type_create_darray: AtomicPtr<c_void>,
+    MPI_Get_address: AtomicPtr<c_void>,
+    MPI_Aint_add: AtomicPtr<c_void>,
+    MPI_Aint_diff: AtomicPtr<c_void>,
+    MPI_Type_size: AtomicPtr<c_void>,
+    MPI_Type_size_x: AtomicPtr<c_void>,
+    MPI_Type_get_extent: AtomicPtr<c_void>,
+    MPI_Type_get_extent_x: AtomicPtr<c_void>,
+    MPI_Type_create_resized: AtomicPtr<c_void>,
+    MPI_Type_get_true_extent: AtomicPtr<c_void>,
+    MPI_Type_get_true_extent_x: AtomicPtr<c_void>,
+    MPI_Type_commit: AtomicPtr<c_void>,
+    MPI_Type_free: AtomicPtr<c_void>,
+    MPI_Type_dup: AtomicPtr<c_void>,
+    MPI_Get_elements: AtomicPtr<c_void>,
+    MPI_Get_elements_x: AtomicPtr<c_void>,
+    MPI_Type_get_envelope: AtomicPtr<c_void>,
+    MPI_Type_get_contents: AtomicPtr<c_void>,
+    MPI_Pack: AtomicPtr<c_void>,
+    MPI_Unpack: AtomicPtr<c_void>,
+    MPI_Pack_size: AtomicPtr<c_void>,
+    MPI_Pack_external: AtomicPtr<c_void>,
+    MPI_Unpack_external: AtomicPtr<c_void>,
+    MPI_Pack_external_size: AtomicPtr<c_void>,
+    MPI_Barrier: AtomicPtr<c_void>,
+    MPI_Bcast: AtomicPtr<c_void>,
+    MPI_Gather: AtomicPtr<c_void>,
+    MPI_Gatherv: AtomicPtr<c_void>,
+    MPI_Scatter: AtomicPtr<c_void>,
+    MPI_Scatterv: AtomicPtr<c_void>,
+    MPI_Allgather: AtomicPtr<c_void>,
+    MPI_Allgatherv: AtomicPtr<c_void>,
+    MPI_Alltoall: AtomicPtr<c_void>,
+    MPI_Alltoallv: AtomicPtr<c_void>,
+    MPI_Alltoallw: AtomicPtr<c_void>,
+    MPI_Reduce: AtomicPtr<c_void>,
+    MPI_Op_create: AtomicPtr<c_void>,
+    MPI_Op_free: AtomicPtr<c_void>,
+    MPI_Allreduce: AtomicPtr<c_void>,
+    MPI_Op_commutative: AtomicPtr<c_void>,
+    MPI_Reduce_local: AtomicPtr<c_void>,
+    MPI_Reduce_scatter_block: AtomicPtr<c_void>,
+    MPI_Reduce_scatter: AtomicPtr<c_void>,
+    MPI_Scan: AtomicPtr<c_void>,
+    MPI_Exscan: AtomicPtr<c_void>,
+    MPI_Ibarrier: AtomicPtr<c_void>,
+    MPI_Ibcast: AtomicPtr<c_void>,
+    MPI_Igather: AtomicPtr<c_void>,
+    MPI_Igatherv: AtomicPtr<c_void>,
+    MPI_Iscatter: AtomicPtr<c_void>,
+    MPI_Iscatterv: AtomicPtr<c_void>,
+    MPI_Iallgather: AtomicPtr<c_void>,
+    MPI_Iallgatherv: AtomicPtr<c_void>,
+    MPI_Ialltoall: AtomicPtr<c_void>,
+    MPI_Ialltoallv: AtomicPtr<c_void>,
+    MPI_Ialltoallw: AtomicPtr<c_void>,
+    MPI_Ireduce: AtomicPtr<c_void>,
+    MPI_Iallreduce: AtomicPtr<c_void>,
+    MPI_Ireduce_scatter_block: AtomicPtr<c_void>,
+    MPI_Ireduce_scatter: AtomicPtr<c_void>,
+    MPI_Iscan: AtomicPtr<c_void>,
+    MPI_Iexscan: AtomicPtr<c_void>,
+    MPI_Group_size: AtomicPtr<c_void>,
+    MPI_Group_rank: AtomicPtr<c_void>,
+    MPI_Group_translate_ranks: AtomicPtr<c_void>,
+    MPI_Group_compare: AtomicPtr<c_void>,
+    MPI_Comm_group: AtomicPtr<c_void>,
+    MPI_Group_union: AtomicPtr<c_void>,
+    MPI_Group_intersection: AtomicPtr<c_void>,
+    MPI_Group_difference: AtomicPtr<c_void>,
+    MPI_Group_incl: AtomicPtr<c_void>,
+    MPI_Group_excl: AtomicPtr<c_void>,
+    MPI_Group_range_incl: AtomicPtr<c_void>,
+    MPI_Group_range_excl: AtomicPtr<c_void>,
+    MPI_Group_free: AtomicPtr<c_void>,
+    MPI_Comm_size: AtomicPtr<c_void>,
+    MPI_Comm_rank: AtomicPtr<c_void>,
+    MPI_Comm_compare: AtomicPtr<c_void>,
+    MPI_Comm_dup: AtomicPtr<c_void>,
+    MPI_Comm_dup_with_info: AtomicPtr<c_void>,
+    MPI_Comm_idup: AtomicPtr<c_void>,
+    MPI_Comm_create: AtomicPtr<c_void>,
+    MPI_Comm_create_group: AtomicPtr<c_void>,
+    MPI_Comm_split: AtomicPtr<c_void>,
+    MPI_Comm_split_type: AtomicPtr<c_void>,
+    MPI_Comm_free: AtomicPtr<c_void>,
+    MPI_Comm_set_info: AtomicPtr<c_void>,
+    MPI_Comm_get_info: AtomicPtr<c_void>,
+    MPI_Comm_test_inter: AtomicPtr<c_void>,
+    MPI_Comm_remote_size: AtomicPtr<c_void>,
+    MPI_Comm_remote_group: AtomicPtr<c_void>,
+    MPI_Intercomm_create: AtomicPtr<c_void>,
+    MPI_Intercomm_merge: AtomicPtr<c_void>,
+    MPI_Comm_create_keyval: AtomicPtr<c_void>,
+    MPI_Comm_free_keyval: AtomicPtr<c_void>,
+    MPI_Comm_set_attr: AtomicPtr<c_void>,
+    MPI_Comm_get_attr: AtomicPtr<c_void>,
+    MPI_Comm_delete_attr: AtomicPtr<c_void>,
+    MPI_Win_create_keyval: AtomicPtr<c_void>,
+    MPI_Win_free_keyval: AtomicPtr<c_void>,
+    MPI_Win_set_attr: AtomicPtr<c_void>,
+    MPI_Win_get_attr: AtomicPtr<c_void>,
+    MPI_Win_delete_attr: AtomicPtr<c_void>,
+    MPI_Type_create_keyval: AtomicPtr<c_void>,
+    MPI_Type_free_keyval: AtomicPtr<c_void>,
+    MPI_Type_set_attr: AtomicPtr<c_void>,
+    MPI_Type_get_attr: AtomicPtr<c_void>,
+    MPI_Type_delete_attr: AtomicPtr<c_void>,
+    MPI_Comm_set_name: AtomicPtr<c_void>,
+    MPI_Comm_get_name: AtomicPtr<c_void>,
+    MPI_Type_set_name: AtomicPtr<c_void>,
+    MPI_Type_get_name: AtomicPtr<c_void>,
+    MPI_Win_set_name: AtomicPtr<c_void>,
+    MPI_Win_get_name: AtomicPtr<c_void>,
+    MPI_Cart_create: AtomicPtr<c_void>,
+    MPI_Dims_create: AtomicPtr<c_void>,
+    MPI_Graph_create: AtomicPtr<c_void>,
+    MPI_Dist_graph_create_adjacent: AtomicPtr<c_void>,
+    MPI_Dist_graph_create: AtomicPtr<c_void>,
+    MPI_Topo_test: AtomicPtr<c_void>,
+    MPI_Graphdims_get: AtomicPtr<c_void>,
+    MPI_Graph_get: AtomicPtr<c_void>,
+    MPI_Cartdim_get: AtomicPtr<c_void>,
+    MPI_Cart_get: AtomicPtr<c_void>,
+    MPI_Cart_rank: AtomicPtr<c_void>,
+    MPI_Cart_coords: AtomicPtr<c_void>,
+    MPI_Graph_neighbors_count: AtomicPtr<c_void>,
+    MPI_Graph_neighbors: AtomicPtr<c_void>,
+    MPI_Dist_graph_neighbors_count: AtomicPtr<c_void>,
+    MPI_Dist_graph_neighbors: AtomicPtr<c_void>,
+    MPI_Cart_shift: AtomicPtr<c_void>,
+    MPI_Cart_sub: AtomicPtr<c_void>,
+    MPI_Cart_map: AtomicPtr<c_void>,
+    MPI_Graph_map: AtomicPtr<c_void>,
+    MPI_Neighbor_allgather: AtomicPtr<c_void>,
+    MPI_Neighbor_allgatherv: AtomicPtr<c_void>,
+    MPI_Neighbor_alltoall: AtomicPtr<c_void>,
+    MPI_Neighbor_alltoallv: AtomicPtr<c_void>,
+    MPI_Neighbor_alltoallw: AtomicPtr<c_void>,
+    MPI_Ineighbor_allgather: AtomicPtr<c_void>,
+    MPI_Ineighbor_allgatherv: AtomicPtr<c_void>,
+    MPI_Ineighbor_alltoall: AtomicPtr<c_void>,
+    MPI_Ineighbor_alltoallv: AtomicPtr<c_void>,
+    MPI_Ineighbor_alltoallw: AtomicPtr<c_void>,
+    MPI_Get_version: AtomicPtr<c_void>,
+    MPI_Get_library_version: AtomicPtr<c_void>,
+    MPI_Get_processor_name: AtomicPtr<c_void>,
+    MPI_Alloc_mem: AtomicPtr<c_void>,
+    MPI_Free_mem: AtomicPtr<c_void>,
+    MPI_Comm_create_errhandler: AtomicPtr<c_void>,
+    MPI_Comm_set_errhandler: AtomicPtr<c_void>,
+    MPI_Comm_get_errhandler: AtomicPtr<c_void>,
+    MPI_Win_create_errhandler: AtomicPtr<c_void>,
+    MPI_Win_set_errhandler: AtomicPtr<c_void>,
+    MPI_Win_get_errhandler: AtomicPtr<c_void>,
+    MPI_File_create_errhandler: AtomicPtr<c_void>,
+    MPI_File_set_errhandler: AtomicPtr<c_void>,
+    MPI_File_get_errhandler: AtomicPtr<c_void>,
+    MPI_Errhandler_free: AtomicPtr<c_void>,
+    MPI_Error_string: AtomicPtr<c_void>,
+    MPI_Error_class: AtomicPtr<c_void>,
+    MPI_Add_error_class: AtomicPtr<c_void>,
+    MPI_Add_error_code: AtomicPtr<c_void>,
+    MPI_Add_error_string: AtomicPtr<c_void>,
+    MPI_Comm_call_errhandler: AtomicPtr<c_void>,
+    MPI_Win_call_errhandler: AtomicPtr<c_void>,
+    MPI_File_call_errhandler: AtomicPtr<c_void>,
+    MPI_Wtime: AtomicPtr<c_void>,
+    MPI_Wtick: AtomicPtr<c_void>,
+    MPI_Init: AtomicPtr<c_void>,
+    MPI_Finalize: AtomicPtr<c_void>,
+    MPI_Initialized: AtomicPtr<c_void>,
+    MPI_Abort: AtomicPtr<c_void>,
+    MPI_Finalized: AtomicPtr<c_void>,
+    MPI_Info_create: AtomicPtr<c_void>,
+    MPI_Info_set: AtomicPtr<c_void>,
+    MPI_Info_delete: AtomicPtr<c_void>,
+    MPI_Info_get: AtomicPtr<c_void>,
+    MPI_Info_get_valuelen: AtomicPtr<c_void>,
+    MPI_Info_get_nkeys: AtomicPtr<c_void>,
+    MPI_Info_get_nthkey: AtomicPtr<c_void>,
+    MPI_Info_dup: AtomicPtr<c_void>,
+    MPI_Info_free: AtomicPtr<c_void>,
+    MPI_Comm_spawn: AtomicPtr<c_void>,
+    MPI_Comm_get_parent: AtomicPtr<c_void>,
+    MPI_Comm_spawn_multiple: AtomicPtr<c_void>,
+    MPI_Open_port: AtomicPtr<c_void>,
+    MPI_Close_port: AtomicPtr<c_void>,
+    MPI_Comm_accept: AtomicPtr<c_void>,
+    MPI_Comm_connect: AtomicPtr<c_void>,
+    MPI_Publish_name: AtomicPtr<c_void>,
+    MPI_Unpublish_name: AtomicPtr<c_void>,
+    MPI_Lookup_name: AtomicPtr<c_void>,
+    MPI_Comm_disconnect: AtomicPtr<c_void>,
+    MPI_Comm_join: AtomicPtr<c_void>,
+    MPI_Win_create: AtomicPtr<c_void>,
+    MPI_Win_allocate: AtomicPtr<c_void>,
+    MPI_Win_allocate_shared: AtomicPtr<c_void>,
+    MPI_Win_shared_query: AtomicPtr<c_void>,
+    MPI_Win_create_dynamic: AtomicPtr<c_void>,
+    MPI_Win_attach: AtomicPtr<c_void>,
+    MPI_Win_detach: AtomicPtr<c_void>,
+    MPI_Win_free: AtomicPtr<c_void>,
+    MPI_Win_get_group: AtomicPtr<c_void>,
+    MPI_Win_set_info: AtomicPtr<c_void>,
+    MPI_Win_get_info: AtomicPtr<c_void>,
+    MPI_Put: AtomicPtr<c_void>,
+    MPI_Get: AtomicPtr<c_void>,
+    MPI_Accumulate: AtomicPtr<c_void>,
+    MPI_Get_accumulate: AtomicPtr<c_void>,
+    MPI_Fetch_and_op: AtomicPtr<c_void>,
+    MPI_Compare_and_swap: AtomicPtr<c_void>,
+    MPI_Rput: AtomicPtr<c_void>,
+    MPI_Rget: AtomicPtr<c_void>,
+    MPI_Raccumulate: AtomicPtr<c_void>,
+    MPI_Rget_accumulate: AtomicPtr<c_void>,
+    MPI_Win_fence: AtomicPtr<c_void>,
+    MPI_Win_start: AtomicPtr<c_void>,
+    MPI_Win_complete: AtomicPtr<c_void>,
+    MPI_Win_post: AtomicPtr<c_void>,
+    MPI_Win_wait: AtomicPtr<c_void>,
+    MPI_Win_test: AtomicPtr<c_void>,
+    MPI_Win_lock: AtomicPtr<c_void>,
+    MPI_Win_lock_all: AtomicPtr<c_void>,
+    MPI_Win_unlock: AtomicPtr<c_void>,
+    MPI_Win_unlock_all: AtomicPtr<c_void>,
+    MPI_Win_flush: AtomicPtr<c_void>,
+    MPI_Win_flush_all: AtomicPtr<c_void>,
+    MPI_Win_flush_local: AtomicPtr<c_void>,
+    MPI_Win_flush_local_all: AtomicPtr<c_void>,
+    MPI_Win_sync: AtomicPtr<c_void>,
+    MPI_Grequest_start: AtomicPtr<c_void>,
+    MPI_Grequest_complete: AtomicPtr<c_void>,
+    MPI_Status_set_elements: AtomicPtr<c_void>,
+    MPI_Status_set_elements_x: AtomicPtr<c_void>,
+    MPI_Status_set_cancelled: AtomicPtr<c_void>,
+    MPI_Init_thread: AtomicPtr<c_void>,
+    MPI_Query_thread: AtomicPtr<c_void>,
+    MPI_Is_thread_main: AtomicPtr<c_void>,
+    MPI_File_open: AtomicPtr<c_void>,
+    MPI_File_close: AtomicPtr<c_void>,
+    MPI_File_delete: AtomicPtr<c_void>,
+    MPI_File_set_size: AtomicPtr<c_void>,
+    MPI_File_preallocate: AtomicPtr<c_void>,
+    MPI_File_get_size: AtomicPtr<c_void>,
+    MPI_File_get_group: AtomicPtr<c_void>,
+    MPI_File_get_amode: AtomicPtr<c_void>,
+    MPI_File_set_info: AtomicPtr<c_void>,
+    MPI_File_get_info: AtomicPtr<c_void>,
+    MPI_File_set_view: AtomicPtr<c_void>,
+    MPI_File_get_view: AtomicPtr<c_void>,
+    MPI_File_read_at: AtomicPtr<c_void>,
+    MPI_File_read_at_all: AtomicPtr<c_void>,
+    MPI_File_write_at: AtomicPtr<c_void>,
+    MPI_File_write_at_all: AtomicPtr<c_void>,
+    MPI_File_iread_at: AtomicPtr<c_void>,
+    MPI_File_iread_at_all: AtomicPtr<c_void>,
+    MPI_File_iwrite_at: AtomicPtr<c_void>,
+    MPI_File_iwrite_at_all: AtomicPtr<c_void>,
+    MPI_File_read: AtomicPtr<c_void>,
+    MPI_File_read_all: AtomicPtr<c_void>,
+    MPI_File_write: AtomicPtr<c_void>,
+    MPI_File_write_all: AtomicPtr<c_void>,
+    MPI_File_iread: AtomicPtr<c_void>,
+    MPI_File_iread_all: AtomicPtr<c_void>,
+    MPI_File_iwrite: AtomicPtr<c_void>,
+    MPI_File_iwrite_all: AtomicPtr<c_void>,
+    MPI_File_seek: AtomicPtr<c_void>,
+    MPI_File_get_position: AtomicPtr<c_void>,
+    MPI_File_get_byte_offset: AtomicPtr<c_void>,
+    MPI_File_read_shared: AtomicPtr<c_void>,
+    MPI_File_write_shared: AtomicPtr<c_void>,
+    MPI_File_iread_shared: AtomicPtr<c_void>,
+    MPI_File_iwrite_shared: AtomicPtr<c_void>,
+    MPI_File_read_ordered: AtomicPtr<c_void>,
+    MPI_File_write_ordered: AtomicPtr<c_void>,
+    MPI_File_seek_shared: AtomicPtr<c_void>,
+    MPI_File_get_position_shared: AtomicPtr<c_void>,
+    MPI_File_read_at_all_begin: AtomicPtr<c_void>,
+    MPI_File_read_at_all_end: AtomicPtr<c_void>,
+    MPI_File_write_at_all_begin: AtomicPtr<c_void>,
+    MPI_File_write_at_all_end: AtomicPtr<c_void>,
+    MPI_File_read_all_begin: AtomicPtr<c_void>,
+    MPI_File_read_all_end: AtomicPtr<c_void>,
+    MPI_File_write_all_begin: AtomicPtr<c_void>,
+    MPI_File_write_all_end: AtomicPtr<c_void>,
+    MPI_File_read_ordered_begin: AtomicPtr<c_void>,
+    MPI_File_read_ordered_end: AtomicPtr<c_void>,
+    MPI_File_write_ordered_begin: AtomicPtr<c_void>,
+    MPI_File_write_ordered_end: AtomicPtr<c_void>,
+    MPI_File_get_type_extent: AtomicPtr<c_void>,
+    MPI_Register_datarep: AtomicPtr<c_void>,
+    MPI_File_set_atomicity: AtomicPtr<c_void>,
+    MPI_File_get_atomicity: AtomicPtr<c_void>,
+    MPI_File_sync: AtomicPtr<c_void>,
+    MPI_Type_create_f90_real: AtomicPtr<c_void>,
+    MPI_Type_create_f90_complex: AtomicPtr<c_void>,
+    MPI_Type_create_f90_integer: AtomicPtr<c_void>,
+    MPI_Type_match_size: AtomicPtr<c_void>,
+    MPI_Comm_f2c: AtomicPtr<c_void>,
+    MPI_Comm_c2f: AtomicPtr<c_void>,
+    MPI_Type_f2c: AtomicPtr<c_void>,
+    MPI_Type_c2f: AtomicPtr<c_void>,
+    MPI_Group_f2c: AtomicPtr<c_void>,
+    MPI_Group_c2f: AtomicPtr<c_void>,
+    MPI_Request_f2c: AtomicPtr<c_void>,
+    MPI_Request_c2f: AtomicPtr<c_void>,
+    MPI_File_f2c: AtomicPtr<c_void>,
+    MPI_File_c2f: AtomicPtr<c_void>,
+    MPI_Win_f2c: AtomicPtr<c_void>,
+    MPI_Win_c2f: AtomicPtr<c_void>,
+    MPI_Op_f2c: AtomicPtr<c_void>,
+    MPI_Op_c2f: AtomicPtr<c_void>,
+    MPI_Info_f2c: AtomicPtr<c_void>,
+    MPI_Info_c2f: AtomicPtr<c_void>,
+    MPI_Errhandler_f2c: AtomicPtr<c_void>,
+    MPI_Errhandler_c2f: AtomicPtr<c_void>,
+    MPI_Message_f2c: AtomicPtr<c_void>,
+    MPI_Message_c2f: AtomicPtr<c_void>,
+    MPI_Status_f2c: AtomicPtr<c_void>,
+    MPI_Status_c2f: AtomicPtr<c_void>,
+    MPI_Send_c: AtomicPtr<c_void>,
+    MPI_Recv_c: AtomicPtr<c_void>,
+    MPI_Get_count_c: AtomicPtr<c_void>,
+    MPI_Bsend_c: AtomicPtr<c_void>,
+    MPI_Ssend_c: AtomicPtr<c_void>,
+    MPI_Rsend_c: AtomicPtr<c_void>,
+    MPI_Isend_c: AtomicPtr<c_void>,
+    MPI_Ibsend_c: AtomicPtr<c_void>,
+    MPI_Issend_c: AtomicPtr<c_void>,
+    MPI_Irsend_c: AtomicPtr<c_void>,
+    MPI_Irecv_c: AtomicPtr<c_void>,
+    MPI_Send_init_c: AtomicPtr<c_void>,
+    MPI_Bsend_init_c: AtomicPtr<c_void>,
+    MPI_Ssend_init_c: AtomicPtr<c_void>,
+    MPI_Rsend_init_c: AtomicPtr<c_void>,
+    MPI_Recv_init_c: AtomicPtr<c_void>,
+    MPI_Sendrecv_c: AtomicPtr<c_void>,
+    MPI_Sendrecv_replace_c: AtomicPtr<c_void>,
+    MPI_Mrecv_c: AtomicPtr<c_void>,
+    MPI_Imrecv_c: AtomicPtr<c_void>,
+    MPI_Get_elements_c: AtomicPtr<c_void>,
+    MPI_Type_size_c: AtomicPtr<c_void>,
+    MPI_Type_get_extent_c: AtomicPtr<c_void>,
+    MPI_Type_get_true_extent_c: AtomicPtr<c_void>,
+    MPI_Pack_c: AtomicPtr<c_void>,
+    MPI_Unpack_c: AtomicPtr<c_void>,
+    MPI_Pack_size_c: AtomicPtr<c_void>,
+    MPI_Bcast_c: AtomicPtr<c_void>,
+    MPI_Ibcast_c: AtomicPtr<c_void>,
+    MPI_Gather_c: AtomicPtr<c_void>,
+    MPI_Igather_c: AtomicPtr<c_void>,
+    MPI_Gatherv_c: AtomicPtr<c_void>,
+    MPI_Igatherv_c: AtomicPtr<c_void>,
+    MPI_Scatter_c: AtomicPtr<c_void>,
+    MPI_Iscatter_c: AtomicPtr<c_void>,
+    MPI_Scatterv_c: AtomicPtr<c_void>,
+    MPI_Iscatterv_c: AtomicPtr<c_void>,
+    MPI_Allgather_c: AtomicPtr<c_void>,
+    MPI_Iallgather_c: AtomicPtr<c_void>,
+    MPI_Allgatherv_c: AtomicPtr<c_void>,
+    MPI_Iallgatherv_c: AtomicPtr<c_void>,
+    MPI_Alltoall_c: AtomicPtr<c_void>,
+    MPI_Ialltoall_c: AtomicPtr<c_void>,
+    MPI_Alltoallv_c: AtomicPtr<c_void>,
+    MPI_Ialltoallv_c: AtomicPtr<c_void>,
+    MPI_Alltoallw_c: AtomicPtr<c_void>,
+    MPI_Ialltoallw_c: AtomicPtr<c_void>,
+    MPI_Reduce_c: AtomicPtr<c_void>,
+    MPI_Ireduce_c: AtomicPtr<c_void>,
+    MPI_Allreduce_c: AtomicPtr<c_void>,
+    MPI_Iallreduce_c: AtomicPtr<c_void>,
+    MPI_Reduce_local_c: AtomicPtr<c_void>,
+    MPI_Reduce_scatter_block_c: AtomicPtr<c_void>,
+    MPI_Ireduce_scatter_block_c: AtomicPtr<c_void>,
+    MPI_Reduce_scatter_c: AtomicPtr<c_void>,
+    MPI_Ireduce_scatter_c: AtomicPtr<c_void>,
+    MPI_Scan_c: AtomicPtr<c_void>,
+    MPI_Iscan_c: AtomicPtr<c_void>,
+    MPI_Exscan_c: AtomicPtr<c_void>,
+    MPI_Iexscan_c: AtomicPtr<c_void>,
+    MPI_Neighbor_allgather_c: AtomicPtr<c_void>,
+    MPI_Ineighbor_allgather_c: AtomicPtr<c_void>,
+    MPI_Neighbor_allgatherv_c: AtomicPtr<c_void>,
+    MPI_Ineighbor_allgatherv_c: AtomicPtr<c_void>,
+    MPI_Neighbor_alltoall_c: AtomicPtr<c_void>,
+    MPI_Ineighbor_alltoall_c: AtomicPtr<c_void>,
+    MPI_Neighbor_alltoallv_c: AtomicPtr<c_void>,
+    MPI_Ineighbor_alltoallv_c: AtomicPtr<c_void>,
+    MPI_Neighbor_alltoallw_c: AtomicPtr<c_void>,
+    MPI_Ineighbor_alltoallw_c: AtomicPtr<c_void>,
+    MPI_Psend_init: AtomicPtr<c_void>,
+    MPI_Precv_init: AtomicPtr<c_void>,
+    MPI_Pready: AtomicPtr<c_void>,
+    MPI_Pready_range: AtomicPtr<c_void>,
+    MPI_Pready_list: AtomicPtr<c_void>,
+    MPI_Parrived: AtomicPtr<c_void>,
+    MPI_Barrier_init: AtomicPtr<c_void>,
+    MPI_Bcast_init: AtomicPtr<c_void>,
+    MPI_Gather_init: AtomicPtr<c_void>,
+    MPI_Gatherv_init: AtomicPtr<c_void>,
+    MPI_Scatter_init: AtomicPtr<c_void>,
+    MPI_Scatterv_init: AtomicPtr<c_void>,
+    MPI_Allgather_init: AtomicPtr<c_void>,
+    MPI_Allgatherv_init: AtomicPtr<c_void>,
+    MPI_Alltoall_init: AtomicPtr<c_void>,
+    MPI_Alltoallv_init: AtomicPtr<c_void>,
+    MPI_Alltoallw_init: AtomicPtr<c_void>,
+    MPI_Reduce_init: AtomicPtr<c_void>,
+    MPI_Allreduce_init: AtomicPtr<c_void>,
+    MPI_Reduce_scatter_block_init: AtomicPtr<c_void>,
+    MPI_Reduce_scatter_init: AtomicPtr<c_void>,
+    MPI_Scan_init: AtomicPtr<c_void>,
+    MPI_Exscan_init: AtomicPtr<c_void>,
+    MPI_Bcast_init_c: AtomicPtr<c_void>,
+    MPI_Gather_init_c: AtomicPtr<c_void>,
+    MPI_Gatherv_init_c: AtomicPtr<c_void>,
+    MPI_Scatter_init_c: AtomicPtr<c_void>,
+    MPI_Scatterv_init_c: AtomicPtr<c_void>,
+    MPI_Allgather_init_c: AtomicPtr<c_void>,
+    MPI_Allgatherv_init_c: AtomicPtr<c_void>,
+    MPI_Alltoall_init_c: AtomicPtr<c_void>,
+    MPI_Alltoallv_init_c: AtomicPtr<c_void>,
+    MPI_Alltoallw_init_c: AtomicPtr<c_void>,
+    MPI_Reduce_init_c: AtomicPtr<c_void>,
+    MPI_Allreduce_init_c: AtomicPtr<c_void>,
+    MPI_Reduce_scatter_block_init_c: AtomicPtr<c_void>,
+    MPI_Reduce_scatter_init_c: AtomicPtr<c_void>,
+    MPI_Scan_init_c: AtomicPtr<c_void>,
+    MPI_Exscan_init_c: AtomicPtr<c_void>,
+    MPI_Neighbor_allgather_init: AtomicPtr<c_void>,
+    MPI_Neighbor_allgatherv_init: AtomicPtr<c_void>,
+    MPI_Neighbor_alltoall_init: AtomicPtr<c_void>,
+    MPI_Neighbor_alltoallv_init: AtomicPtr<c_void>,
+    MPI_Neighbor_alltoallw_init: AtomicPtr<c_void>,
+    MPI_Neighbor_allgather_init_c: AtomicPtr<c_void>,
+    MPI_Neighbor_allgatherv_init_c: AtomicPtr<c_void>,
+    MPI_Neighbor_alltoall_init_c: AtomicPtr<c_void>,
+    MPI_Neighbor_alltoallv_init_c: AtomicPtr<c_void>,
+    MPI_Neighbor_alltoallw_init_c: AtomicPtr<c_void>,
+    MPIX_Query_cuda_support: AtomicPtr<c_void>,
+    MPIX_Query_hip_support: AtomicPtr<c_void>,
+    MPIX_Query_rocm_support: AtomicPtr<c_void>,
+    MPIX_Query_ze_support: AtomicPtr<c_void>,
+}
+
+static TABLE: MpiFunctionTable = MpiFunctionTable {
+    MPI_Send: AtomicPtr::new(lazy::MPI_Send as *mut c_void),
+    MPI_Recv: AtomicPtr::new(lazy::MPI_Recv as *mut c_void),
+    MPI_Get_count: AtomicPtr::new(lazy::MPI_Get_count as *mut c_void),
+    MPI_Bsend: AtomicPtr::new(lazy::MPI_Bsend as *mut c_void),
+    MPI_Ssend: AtomicPtr::new(lazy::MPI_Ssend as *mut c_void),
+    MPI_Rsend: AtomicPtr::new(lazy::MPI_Rsend as *mut c_void),
+    MPI_Buffer_attach: AtomicPtr::new(lazy::MPI_Buffer_attach as *mut c_void),
+    MPI_Buffer_detach: AtomicPtr::new(lazy::MPI_Buffer_detach as *mut c_void),
+    MPI_Isend: AtomicPtr::new(lazy::MPI_Isend as *mut c_void),
+    MPI_Ibsend: AtomicPtr::new(lazy::MPI_Ibsend as *mut c_void),
+    MPI_Issend: AtomicPtr::new(lazy::MPI_Issend as *mut c_void),
+    MPI_Irsend: AtomicPtr::new(lazy::MPI_Irsend as *mut c_void),
+    MPI_Irecv: AtomicPtr::new(lazy::MPI_Irecv as *mut c_void),
+    MPI_Wait: AtomicPtr::new(lazy::MPI_Wait as *mut c_void),
+    MPI_Test: AtomicPtr::new(lazy::MPI_Test as *mut c_void),
+    MPI_Request_free: AtomicPtr::new(lazy::MPI_Request_free as *mut c_void),
+    MPI_Waitany: AtomicPtr::new(lazy::MPI_Waitany as *mut c_void),
+    MPI_Testany: AtomicPtr::new(lazy::MPI_Testany as *mut c_void),
+    MPI_Waitall: AtomicPtr::new(lazy::MPI_Waitall as *mut c_void),
+    MPI_Testall: AtomicPtr::new(lazy::MPI_Testall as *mut c_void),
+    MPI_Waitsome: AtomicPtr::new(lazy::MPI_Waitsome as *mut c_void),
+    MPI_Testsome: AtomicPtr::new(lazy::MPI_Testsome as *mut c_void),
+    MPI_Request_get_status: AtomicPtr::new(lazy::MPI_Request_get_status as *mut c_void),
+    MPI_Iprobe: AtomicPtr::new(lazy::MPI_Iprobe as *mut c_void),
+    MPI_Probe: AtomicPtr::new(lazy::MPI_Probe as *mut c_void),
+    MPI_Improbe: AtomicPtr::new(lazy::MPI_Improbe as *mut c_void),
+    MPI_Mprobe: AtomicPtr::new(lazy::MPI_Mprobe as *mut c_void),
+    MPI_Mrecv: AtomicPtr::new(lazy::MPI_Mrecv as *mut c_void),
+    MPI_Imrecv: AtomicPtr::new(lazy::MPI_Imrecv as *mut c_void),
+    MPI_Cancel: AtomicPtr::new(lazy::MPI_Cancel as *mut c_void),
+    MPI_Test_cancelled: AtomicPtr::new(lazy::MPI_Test_cancelled as *mut c_void),
+    MPI_Send_init: AtomicPtr::new(lazy::MPI_Send_init as *mut c_void),
+    MPI_Bsend_init: AtomicPtr::new(lazy::MPI_Bsend_init as *mut c_void),
+    MPI_Ssend_init: AtomicPtr::new(lazy::MPI_Ssend_init as *mut c_void),
+    MPI_Rsend_init: AtomicPtr::new(lazy::MPI_Rsend_init as *mut c_void),
+    MPI_Recv_init: AtomicPtr::new(lazy::MPI_Recv_init as *mut c_void),
+    MPI_Start: AtomicPtr::new(lazy::MPI_Start as *mut c_void),
+    MPI_Startall: AtomicPtr::new(lazy::MPI_Startall as *mut c_void),
+    MPI_Sendrecv: AtomicPtr::new(lazy::MPI_Sendrecv as *mut c_void),
+    MPI_Sendrecv_replace: AtomicPtr::new(lazy::MPI_Sendrecv_replace as *mut c_void),
+    MPI_Type_contiguous: AtomicPtr::new(lazy::MPI_Type_contiguous as *mut c_void),
+    MPI_Type_vector: AtomicPtr::new(lazy::MPI_Type_vector as *mut c_void),
+    MPI_Type_create_hvector: AtomicPtr::new(lazy::MPI_Type_create_hvector as *mut c_void),
+    MPI_Type_indexed: AtomicPtr::new(lazy::MPI_Type_indexed as *mut c_void),
+    MPI_Type_create_hindexed: AtomicPtr::new(lazy::MPI_Type_create_hindexed as *mut c_void),
+    MPI_Type_create_indexed_block: AtomicPtr::new(
+        lazy::MPI_Type_create_indexed_block as *mut c_void,
+    ),
+    MPI_Type_create_hindexed_block: AtomicPtr::new(
+        lazy::MPI_Type_create_hindexed_block as *mut c_void,
+    ),
+    MPI_Type_create_struct: AtomicPtr::new(lazy::MPI_Type_create_struct as *mut c_void),
+    MPI_Type_struct: AtomicPtr::new(lazy::MPI_Type_struct as *mut c_void),
+    MPI_Type_create_subarray: AtomicPtr::new(lazy::MPI_Type_create_subarray as *mut c_void),
+    MPI_Type_create_darray: AtomicPtr::new(lazy::MPI_Type_create_darray as *mut c_void),
+    MPI_Get_address: AtomicPtr::new(lazy::MPI_Get_address as *mut c_void),
+    MPI_Aint_add: AtomicPtr::new(lazy::MPI_Aint_add as *mut c_void),
+    MPI_Aint_diff: AtomicPtr::new(lazy::MPI_Aint_diff as *mut c_void),
+    MPI_Type_size: AtomicPtr::new(lazy::MPI_Type_size as *mut c_void),
+    MPI_Type_size_x: AtomicPtr::new(lazy::MPI_Type_size_x as *mut c_void),
+    MPI_Type_get_extent: AtomicPtr::new(lazy::MPI_Type_get_extent as *mut c_void),
+    MPI_Type_get_extent_x: AtomicPtr::new(lazy::MPI_Type_get_extent_x as *mut c_void),
+    MPI_Type_create_resized: AtomicPtr::new(lazy::MPI_Type_create_resized as *mut c_void),
+    MPI_Type_get_true_extent: AtomicPtr::new(lazy::MPI_Type_get_true_extent as *mut c_void),
+    MPI_Type_get_true_extent_x: AtomicPtr::new(lazy::MPI_Type_get_true_extent_x as *mut c_void),
+    MPI_Type_commit: AtomicPtr::new(lazy::MPI_Type_commit as *mut c_void),
+    MPI_Type_free: AtomicPtr::new(lazy::MPI_Type_free as *mut c_void),
+    MPI_Type_dup: AtomicPtr::new(lazy::MPI_Type_dup as *mut c_void),
+    MPI_Get_elements: AtomicPtr::new(lazy::MPI_Get_elements as *mut c_void),
+    MPI_Get_elements_x: AtomicPtr::new(lazy::MPI_Get_elements_x as *mut c_void),
+    MPI_Type_get_envelope: AtomicPtr::new(lazy::MPI_Type_get_envelope as *mut c_void),
+    MPI_Type_get_contents: AtomicPtr::new(lazy::MPI_Type_get_contents as *mut c_void),
+    MPI_Pack: AtomicPtr::new(lazy::MPI_Pack as *mut c_void),
+    MPI_Unpack: AtomicPtr::new(lazy::MPI_Unpack as *mut c_void),
+    MPI_Pack_size: AtomicPtr::new(lazy::MPI_Pack_size as *mut c_void),
+    MPI_Pack_external: AtomicPtr::new(lazy::MPI_Pack_external as *mut c_void),
+    MPI_Unpack_external: AtomicPtr::new(lazy::MPI_Unpack_external as *mut c_void),
+    MPI_Pack_external_size: AtomicPtr::new(lazy::MPI_Pack_external_size as *mut c_void),
+    MPI_Barrier: AtomicPtr::new(lazy::MPI_Barrier as *mut c_void),
+    MPI_Bcast: AtomicPtr::new(lazy::MPI_Bcast as *mut c_void),
+    MPI_Gather: AtomicPtr::new(lazy::MPI_Gather as *mut c_void),
+    MPI_Gatherv: AtomicPtr::new(lazy::MPI_Gatherv as *mut c_void),
+    MPI_Scatter: AtomicPtr::new(lazy::MPI_Scatter as *mut c_void),
+    MPI_Scatterv: AtomicPtr::new(lazy::MPI_Scatterv as *mut c_void),
+    MPI_Allgather: AtomicPtr::new(lazy::MPI_Allgather as *mut c_void),
+    MPI_Allgatherv: AtomicPtr::new(lazy::MPI_Allgatherv as *mut c_void),
+    MPI_Alltoall: AtomicPtr::new(lazy::MPI_Alltoall as *mut c_void),
+    MPI_Alltoallv: AtomicPtr::new(lazy::MPI_Alltoallv as *mut c_void),
+    MPI_Alltoallw: AtomicPtr::new(lazy::MPI_Alltoallw as *mut c_void),
+    MPI_Reduce: AtomicPtr::new(lazy::MPI_Reduce as *mut c_void),
+    MPI_Op_create: AtomicPtr::new(lazy::MPI_Op_create as *mut c_void),
+    MPI_Op_free: AtomicPtr::new(lazy::MPI_Op_free as *mut c_void),
+    MPI_Allreduce: AtomicPtr::new(lazy::MPI_Allreduce as *mut c_void),
+    MPI_Op_commutative: AtomicPtr::new(lazy::MPI_Op_commutative as *mut c_void),
+    MPI_Reduce_local: AtomicPtr::new(lazy::MPI_Reduce_local as *mut c_void),
+    MPI_Reduce_scatter_block: AtomicPtr::new(lazy::MPI_Reduce_scatter_block as *mut c_void),
+    MPI_Reduce_scatter: AtomicPtr::new(lazy::MPI_Reduce_scatter as *mut c_void),
+    MPI_Scan: AtomicPtr::new(lazy::MPI_Scan as *mut c_void),
+    MPI_Exscan: AtomicPtr::new(lazy::MPI_Exscan as *mut c_void),
+    MPI_Ibarrier: AtomicPtr::new(lazy::MPI_Ibarrier as *mut c_void),
+    MPI_Ibcast: AtomicPtr::new(lazy::MPI_Ibcast as *mut c_void),
+    MPI_Igather: AtomicPtr::new(lazy::MPI_Igather as *mut c_void),
+    MPI_Igatherv: AtomicPtr::new(lazy::MPI_Igatherv as *mut c_void),
+    MPI_Iscatter: AtomicPtr::new(lazy::MPI_Iscatter as *mut c_void),
+    MPI_Iscatterv: AtomicPtr::new(lazy::MPI_Iscatterv as *mut c_void),
+    MPI_Iallgather: AtomicPtr::new(lazy::MPI_Iallgather as *mut c_void),
+    MPI_Iallgatherv: AtomicPtr::new(lazy::MPI_Iallgatherv as *mut c_void),
+    MPI_Ialltoall: AtomicPtr::new(lazy::MPI_Ialltoall as *mut c_void),
+    MPI_Ialltoallv: AtomicPtr::new(lazy::MPI_Ialltoallv as *mut c_void),
+    MPI_Ialltoallw: AtomicPtr::new(lazy::MPI_Ialltoallw as *mut c_void),
+    MPI_Ireduce: AtomicPtr::new(lazy::MPI_Ireduce as *mut c_void),
+    MPI_Iallreduce: AtomicPtr::new(lazy::MPI_Iallreduce as *mut c_void),
+    MPI_Ireduce_scatter_block: AtomicPtr::new(lazy::MPI_Ireduce_scatter_block as *mut c_void),
+    MPI_Ireduce_scatter: AtomicPtr::new(lazy::MPI_Ireduce_scatter as *mut c_void),
+    MPI_Iscan: AtomicPtr::new(lazy::MPI_Iscan as *mut c_void),
+    MPI_Iexscan: AtomicPtr::new(lazy::MPI_Iexscan as *mut c_void),
+    MPI_Group_size: AtomicPtr::new(lazy::MPI_Group_size as *mut c_void),
+    MPI_Group_rank: AtomicPtr::new(lazy::MPI_Group_rank as *mut c_void),
+    MPI_Group_translate_ranks: AtomicPtr::new(lazy::MPI_Group_translate_ranks as *mut c_void),
+    MPI_Group_compare: AtomicPtr::new(lazy::MPI_Group_compare as *mut c_void),
+    MPI_Comm_group: AtomicPtr::new(lazy::MPI_Comm_group as *mut c_void),
+    MPI_Group_union: AtomicPtr::new(lazy::MPI_Group_union as *mut c_void),
+    MPI_Group_intersection: AtomicPtr::new(lazy::MPI_Group_intersection as *mut c_void),
+    MPI_Group_difference: AtomicPtr::new(lazy::MPI_Group_difference as *mut c_void),
+    MPI_Group_incl: AtomicPtr::new(lazy::MPI_Group_incl as *mut c_void),
+    MPI_Group_excl: AtomicPtr::new(lazy::MPI_Group_excl as *mut c_void),
+    MPI_Group_range_incl: AtomicPtr::new(lazy::MPI_Group_range_incl as *mut c_void),
+    MPI_Group_range_excl: AtomicPtr::new(lazy::MPI_Group_range_excl as *mut c_void),
+    MPI_Group_free: AtomicPtr::new(lazy::MPI_Group_free as *mut c_void),
+    MPI_Comm_size: AtomicPtr::new(lazy::MPI_Comm_size as *mut c_void),
+    MPI_Comm_rank: AtomicPtr::new(lazy::MPI_Comm_rank as *mut c_void),
+    MPI_Comm_compare: AtomicPtr::new(lazy::MPI_Comm_compare as *mut c_void),
+    MPI_Comm_dup: AtomicPtr::new(lazy::MPI_Comm_dup as *mut c_void),
+    MPI_Comm_dup_with_info: AtomicPtr::new(lazy::MPI_Comm_dup_with_info as *mut c_void),
+    MPI_Comm_idup: AtomicPtr::new(lazy::MPI_Comm_idup as *mut c_void),
+    MPI_Comm_create: AtomicPtr::new(lazy::MPI_Comm_create as *mut c_void),
+    MPI_Comm_create_group: AtomicPtr::new(lazy::MPI_Comm_create_group as *mut c_void),
+    MPI_Comm_split: AtomicPtr::new(lazy::MPI_Comm_split as *mut c_void),
+    MPI_Comm_split_type: AtomicPtr::new(lazy::MPI_Comm_split_type as *mut c_void),
+    MPI_Comm_free: AtomicPtr::new(lazy::MPI_Comm_free as *mut c_void),
+    MPI_Comm_set_info: AtomicPtr::new(lazy::MPI_Comm_set_info as *mut c_void),
+    MPI_Comm_get_info: AtomicPtr::new(lazy::MPI_Comm_get_info as *mut c_void),
+    MPI_Comm_test_inter: AtomicPtr::new(lazy::MPI_Comm_test_inter as *mut c_void),
+    MPI_Comm_remote_size: AtomicPtr::new(lazy::MPI_Comm_remote_size as *mut c_void),
+    MPI_Comm_remote_group: AtomicPtr::new(lazy::MPI_Comm_remote_group as *mut c_void),
+    MPI_Intercomm_create: AtomicPtr::new(lazy::MPI_Intercomm_create as *mut c_void),
+    MPI_Intercomm_merge: AtomicPtr::new(lazy::MPI_Intercomm_merge as *mut c_void),
+    MPI_Comm_create_keyval: AtomicPtr::new(lazy::MPI_Comm_create_keyval as *mut c_void),
+    MPI_Comm_free_keyval: AtomicPtr::new(lazy::MPI_Comm_free_keyval as *mut c_void),
+    MPI_Comm_set_attr: AtomicPtr::new(lazy::MPI_Comm_set_attr as *mut c_void),
+    MPI_Comm_get_attr: AtomicPtr::new(lazy::MPI_Comm_get_attr as *mut c_void),
+    MPI_Comm_delete_attr: AtomicPtr::new(lazy::MPI_Comm_delete_attr as *mut c_void),
+    MPI_Win_create_keyval: AtomicPtr::new(lazy::MPI_Win_create_keyval as *mut c_void),
+    MPI_Win_free_keyval: AtomicPtr::new(lazy::MPI_Win_free_keyval as *mut c_void),
+    MPI_Win_set_attr: AtomicPtr::new(lazy::MPI_Win_set_attr as *mut c_void),
+    MPI_Win_get_attr: AtomicPtr::new(lazy::MPI_Win_get_attr as *mut c_void),
+    MPI_Win_delete_attr: AtomicPtr::new(lazy::MPI_Win_delete_attr as *mut c_void),
+    MPI_Type_create_keyval: AtomicPtr::new(lazy::MPI_Type_create_keyval as *mut c_void),
+    MPI_Type_free_keyval: AtomicPtr::new(lazy::MPI_Type_free_keyval as *mut c_void),
+    MPI_Type_set_attr: AtomicPtr::new(lazy::MPI_Type_set_attr as *mut c_void),
+    MPI_Type_get_attr: AtomicPtr::new(lazy::MPI_Type_get_attr as *mut c_void),
+    MPI_Type_delete_attr: AtomicPtr::new(lazy::MPI_Type_delete_attr as *mut c_void),
+    MPI_Comm_set_name: AtomicPtr::new(lazy::MPI_Comm_set_name as *mut c_void),
+    MPI_Comm_get_name: AtomicPtr::new(lazy::MPI_Comm_get_name as *mut c_void),
+    MPI_Type_set_name: AtomicPtr::new(lazy::MPI_Type_set_name as *mut c_void),
+    MPI_Type_get_name: AtomicPtr::new(lazy::MPI_Type_get_name as *mut c_void),
+    MPI_Win_set_name: AtomicPtr::new(lazy::MPI_Win_set_name as *mut c_void),
+    MPI_Win_get_name: AtomicPtr::new(lazy::MPI_Win_get_name as *mut c_void),
+    MPI_Cart_create: AtomicPtr::new(lazy::MPI_Cart_create as *mut c_void),
+    MPI_Dims_create: AtomicPtr::new(lazy::MPI_Dims_create as *mut c_void),
+    MPI_Graph_create: AtomicPtr::new(lazy::MPI_Graph_create as *mut c_void),
+    MPI_Dist_graph_create_adjacent: AtomicPtr::new(
+        lazy::MPI_Dist_graph_create_adjacent as *mut c_void,
+    ),
+    MPI_Dist_graph_create: AtomicPtr::new(lazy::MPI_Dist_graph_create as *mut c_void),
+    MPI_Topo_test: AtomicPtr::new(lazy::MPI_Topo_test as *mut c_void),
+    MPI_Graphdims_get: AtomicPtr::new(lazy::MPI_Graphdims_get as *mut c_void),
+    MPI_Graph_get: AtomicPtr::new(lazy::MPI_Graph_get as *mut c_void),
+    MPI_Cartdim_get: AtomicPtr::new(lazy::MPI_Cartdim_get as *mut c_void),
+    MPI_Cart_get: AtomicPtr::new(lazy::MPI_Cart_get as *mut c_void),
+    MPI_Cart_rank: AtomicPtr::new(lazy::MPI_Cart_rank as *mut c_void),
+    MPI_Cart_coords: AtomicPtr::new(lazy::MPI_Cart_coords as *mut c_void),
+    MPI_Graph_neighbors_count: AtomicPtr::new(lazy::MPI_Graph_neighbors_count as *mut c_void),
+    MPI_Graph_neighbors: AtomicPtr::new(lazy::MPI_Graph_neighbors as *mut c_void),
+    MPI_Dist_graph_neighbors_count: AtomicPtr::new(
+        lazy::MPI_Dist_graph_neighbors_count as *mut c_void,
+    ),
+    MPI_Dist_graph_neighbors: AtomicPtr::new(lazy::MPI_Dist_graph_neighbors as *mut c_void),
+    MPI_Cart_shift: AtomicPtr::new(lazy::MPI_Cart_shift as *mut c_void),
+    MPI_Cart_sub: AtomicPtr::new(lazy::MPI_Cart_sub as *mut c_void),
+    MPI_Cart_map: AtomicPtr::new(lazy::MPI_Cart_map as *mut c_void),
+    MPI_Graph_map: AtomicPtr::new(lazy::MPI_Graph_map as *mut c_void),
+    MPI_Neighbor_allgather: AtomicPtr::new(lazy::MPI_Neighbor_allgather as *mut c_void),
+    MPI_Neighbor_allgatherv: AtomicPtr::new(lazy::MPI_Neighbor_allgatherv as *mut c_void),
+    MPI_Neighbor_alltoall: AtomicPtr::new(lazy::MPI_Neighbor_alltoall as *mut c_void),
+    MPI_Neighbor_alltoallv: AtomicPtr::new(lazy::MPI_Neighbor_alltoallv as *mut c_void),
+    MPI_Neighbor_alltoallw: AtomicPtr::new(lazy::MPI_Neighbor_alltoallw as *mut c_void),
+    MPI_Ineighbor_allgather: AtomicPtr::new(lazy::MPI_Ineighbor_allgather as *mut c_void),
+    MPI_Ineighbor_allgatherv: AtomicPtr::new(lazy::MPI_Ineighbor_allgatherv as *mut c_void),
+    MPI_Ineighbor_alltoall: AtomicPtr::new(lazy::MPI_Ineighbor_alltoall as *mut c_void),
+    MPI_Ineighbor_alltoallv: AtomicPtr::new(lazy::MPI_Ineighbor_alltoallv as *mut c_void),
+    MPI_Ineighbor_alltoallw: AtomicPtr::new(lazy::MPI_Ineighbor_alltoallw as *mut c_void),
+    MPI_Get_version: AtomicPtr::new(lazy::MPI_Get_version as *mut c_void),
+    MPI_Get_library_version: AtomicPtr::new(lazy::MPI_Get_library_version as *mut c_void),
+    MPI_Get_processor_name: AtomicPtr::new(lazy::MPI_Get_processor_name as *mut c_void),
+    MPI_Alloc_mem: AtomicPtr::new(lazy::MPI_Alloc_mem as *mut c_void),
+    MPI_Free_mem: AtomicPtr::new(lazy::MPI_Free_mem as *mut c_void),
+    MPI_Comm_create_errhandler: AtomicPtr::new(lazy::MPI_Comm_create_errhandler as *mut c_void),
+    MPI_Comm_set_errhandler: AtomicPtr::new(lazy::MPI_Comm_set_errhandler as *mut c_void),
+    MPI_Comm_get_errhandler: AtomicPtr::new(lazy::MPI_Comm_get_errhandler as *mut c_void),
+    MPI_Win_create_errhandler: AtomicPtr::new(lazy::MPI_Win_create_errhandler as *mut c_void),
+    MPI_Win_set_errhandler: AtomicPtr::new(lazy::MPI_Win_set_errhandler as *mut c_void),
+    MPI_Win_get_errhandler: AtomicPtr::new(lazy::MPI_Win_get_errhandler as *mut c_void),
+    MPI_File_create_errhandler: AtomicPtr::new(lazy::MPI_File_create_errhandler as *mut c_void),
+    MPI_File_set_errhandler: AtomicPtr::new(lazy::MPI_File_set_errhandler as *mut c_void),
+    MPI_File_get_errhandler: AtomicPtr::new(lazy::MPI_File_get_errhandler as *mut c_void),
+    MPI_Errhandler_free: AtomicPtr::new(lazy::MPI_Errhandler_free as *mut c_void),
+    MPI_Error_string: AtomicPtr::new(lazy::MPI_Error_string as *mut c_void),
+    MPI_Error_class: AtomicPtr::new(lazy::MPI_Error_class as *mut c_void),
+    MPI_Add_error_class: AtomicPtr::new(lazy::MPI_Add_error_class as *mut c_void),
+    MPI_Add_error_code: AtomicPtr::new(lazy::MPI_Add_error_code as *mut c_void),
+    MPI_Add_error_string: AtomicPtr::new(lazy::MPI_Add_error_string as *mut c_void),
+    MPI_Comm_call_errhandler: AtomicPtr::new(lazy::MPI_Comm_call_errhandler as *mut c_void),
+    MPI_Win_call_errhandler: AtomicPtr::new(lazy::MPI_Win_call_errhandler as *mut c_void),
+    MPI_File_call_errhandler: AtomicPtr::new(lazy::MPI_File_call_errhandler as *mut c_void),
+    MPI_Wtime: AtomicPtr::new(lazy::MPI_Wtime as *mut c_void),
+    MPI_Wtick: AtomicPtr::new(lazy::MPI_Wtick as *mut c_void),
+    MPI_Init: AtomicPtr::new(lazy::MPI_Init as *mut c_void),
+    MPI_Finalize: AtomicPtr::new(lazy::MPI_Finalize as *mut c_void),
+    MPI_Initialized: AtomicPtr::new(lazy::MPI_Initialized as *mut c_void),
+    MPI_Abort: AtomicPtr::new(lazy::MPI_Abort as *mut c_void),
+    MPI_Finalized: AtomicPtr::new(lazy::MPI_Finalized as *mut c_void),
+    MPI_Info_create: AtomicPtr::new(lazy::MPI_Info_create as *mut c_void),
+    MPI_Info_set: AtomicPtr::new(lazy::MPI_Info_set as *mut c_void),
+    MPI_Info_delete: AtomicPtr::new(lazy::MPI_Info_delete as *mut c_void),
+    MPI_Info_get: AtomicPtr::new(lazy::MPI_Info_get as *mut c_void),
+    MPI_Info_get_valuelen: AtomicPtr::new(lazy::MPI_Info_get_valuelen as *mut c_void),
+    MPI_Info_get_nkeys: AtomicPtr::new(lazy::MPI_Info_get_nkeys as *mut c_void),
+    MPI_Info_get_nthkey: AtomicPtr::new(lazy::MPI_Info_get_nthkey as *mut c_void),
+    MPI_Info_dup: AtomicPtr::new(lazy::MPI_Info_dup as *mut c_void),
+    MPI_Info_free: AtomicPtr::new(lazy::MPI_Info_free as *mut c_void),
+    MPI_Comm_spawn: AtomicPtr::new(lazy::MPI_Comm_spawn as *mut c_void),
+    MPI_Comm_get_parent: AtomicPtr::new(lazy::MPI_Comm_get_parent as *mut c_void),
+    MPI_Comm_spawn_multiple: AtomicPtr::new(lazy::MPI_Comm_spawn_multiple as *mut c_void),
+    MPI_Open_port: AtomicPtr::new(lazy::MPI_Open_port as *mut c_void),
+    MPI_Close_port: AtomicPtr::new(lazy::MPI_Close_port as *mut c_void),
+    MPI_Comm_accept: AtomicPtr::new(lazy::MPI_Comm_accept as *mut c_void),
+    MPI_Comm_connect: AtomicPtr::new(lazy::MPI_Comm_connect as *mut c_void),
+    MPI_Publish_name: AtomicPtr::new(lazy::MPI_Publish_name as *mut c_void),
+    MPI_Unpublish_name: AtomicPtr::new(lazy::MPI_Unpublish_name as *mut c_void),
+    MPI_Lookup_name: AtomicPtr::new(lazy::MPI_Lookup_name as *mut c_void),
+    MPI_Comm_disconnect: AtomicPtr::new(lazy::MPI_Comm_disconnect as *mut c_void),
+    MPI_Comm_join: AtomicPtr::new(lazy::MPI_Comm_join as *mut c_void),
+    MPI_Win_create: AtomicPtr::new(lazy::MPI_Win_create as *mut c_void),
+    MPI_Win_allocate: AtomicPtr::new(lazy::MPI_Win_allocate as *mut c_void),
+    MPI_Win_allocate_shared: AtomicPtr::new(lazy::MPI_Win_allocate_shared as *mut c_void),
+    MPI_Win_shared_query: AtomicPtr::new(lazy::MPI_Win_shared_query as *mut c_void),
+    MPI_Win_create_dynamic: AtomicPtr::new(lazy::MPI_Win_create_dynamic as *mut c_void),
+    MPI_Win_attach: AtomicPtr::new(lazy::MPI_Win_attach as *mut c_void),
+    MPI_Win_detach: AtomicPtr::new(lazy::MPI_Win_detach as *mut c_void),
+    MPI_Win_free: AtomicPtr::new(lazy::MPI_Win_free as *mut c_void),
+    MPI_Win_get_group: AtomicPtr::new(lazy::MPI_Win_get_group as *mut c_void),
+    MPI_Win_set_info: AtomicPtr::new(lazy::MPI_Win_set_info as *mut c_void),
+    MPI_Win_get_info: AtomicPtr::new(lazy::MPI_Win_get_info as *mut c_void),
+    MPI_Put: AtomicPtr::new(lazy::MPI_Put as *mut c_void),
+    MPI_Get: AtomicPtr::new(lazy::MPI_Get as *mut c_void),
+    MPI_Accumulate: AtomicPtr::new(lazy::MPI_Accumulate as *mut c_void),
+    MPI_Get_accumulate: AtomicPtr::new(lazy::MPI_Get_accumulate as *mut c_void),
+    MPI_Fetch_and_op: AtomicPtr::new(lazy::MPI_Fetch_and_op as *mut c_void),
+    MPI_Compare_and_swap: AtomicPtr::new(lazy::MPI_Compare_and_swap as *mut c_void),
+    MPI_Rput: AtomicPtr::new(lazy::MPI_Rput as *mut c_void),
+    MPI_Rget: AtomicPtr::new(lazy::MPI_Rget as *mut c_void),
+    MPI_Raccumulate: AtomicPtr::new(lazy::MPI_Raccumulate as *mut c_void),
+    MPI_Rget_accumulate: AtomicPtr::new(lazy::MPI_Rget_accumulate as *mut c_void),
+    MPI_Win_fence: AtomicPtr::new(lazy::MPI_Win_fence as *mut c_void),
+    MPI_Win_start: AtomicPtr::new(lazy::MPI_Win_start as *mut c_void),
+    MPI_Win_complete: AtomicPtr::new(lazy::MPI_Win_complete as *mut c_void),
+    MPI_Win_post: AtomicPtr::new(lazy::MPI_Win_post as *mut c_void),
+    MPI_Win_wait: AtomicPtr::new(lazy::MPI_Win_wait as *mut c_void),
+    MPI_Win_test: AtomicPtr::new(lazy::MPI_Win_test as *mut c_void),
+    MPI_Win_lock: AtomicPtr::new(lazy::MPI_Win_lock as *mut c_void),
+    MPI_Win_lock_all: AtomicPtr::new(lazy::MPI_Win_lock_all as *mut c_void),
+    MPI_Win_unlock: AtomicPtr::new(lazy::MPI_Win_unlock as *mut c_void),
+    MPI_Win_unlock_all: AtomicPtr::new(lazy::MPI_Win_unlock_all as *mut c_void),
+    MPI_Win_flush: AtomicPtr::new(lazy::MPI_Win_flush as *mut c_void),
+    MPI_Win_flush_all: AtomicPtr::new(lazy::MPI_Win_flush_all as *mut c_void),
+    MPI_Win_flush_local: AtomicPtr::new(lazy::MPI_Win_flush_local as *mut c_void),
+    MPI_Win_flush_local_all: AtomicPtr::new(lazy::MPI_Win_flush_local_all as *mut c_void),
+    MPI_Win_sync: AtomicPtr::new(lazy::MPI_Win_sync as *mut c_void),
+    MPI_Grequest_start: AtomicPtr::new(lazy::MPI_Grequest_start as *mut c_void),
+    MPI_Grequest_complete: AtomicPtr::new(lazy::MPI_Grequest_complete as *mut c_void),
+    MPI_Status_set_elements: AtomicPtr::new(lazy::MPI_Status_set_elements as *mut c_void),
+    MPI_Status_set_elements_x: AtomicPtr::new(lazy::MPI_Status_set_elements_x as *mut c_void),
+    MPI_Status_set_cancelled: AtomicPtr::new(lazy::MPI_Status_set_cancelled as *mut c_void),
+    MPI_Init_thread: AtomicPtr::new(lazy::MPI_Init_thread as *mut c_void),
+    MPI_Query_thread: AtomicPtr::new(lazy::MPI_Query_thread as *mut c_void),
+    MPI_Is_thread_main: AtomicPtr::new(lazy::MPI_Is_thread_main as *mut c_void),
+    MPI_File_open: AtomicPtr::new(lazy::MPI_File_open as *mut c_void),
+    MPI_File_close: AtomicPtr::new(lazy::MPI_File_close as *mut c_void),
+    MPI_File_delete: AtomicPtr::new(lazy::MPI_File_delete as *mut c_void),
+    MPI_File_set_size: AtomicPtr::new(lazy::MPI_File_set_size as *mut c_void),
+    MPI_File_preallocate: AtomicPtr::new(lazy::MPI_File_preallocate as *mut c_void),
+    MPI_File_get_size: AtomicPtr::new(lazy::MPI_File_get_size as *mut c_void),
+    MPI_File_get_group: AtomicPtr::new(lazy::MPI_File_get_group as *mut c_void),
+    MPI_File_get_amode: AtomicPtr::new(lazy::MPI_File_get_amode as *mut c_void),
+    MPI_File_set_info: AtomicPtr::new(lazy::MPI_File_set_info as *mut c_void),
+    MPI_File_get_info: AtomicPtr::new(lazy::MPI_File_get_info as *mut c_void),
+    MPI_File_set_view: AtomicPtr::new(lazy::MPI_File_set_view as *mut c_void),
+    MPI_File_get_view: AtomicPtr::new(lazy::MPI_File_get_view as *mut c_void),
+    MPI_File_read_at: AtomicPtr::new(lazy::MPI_File_read_at as *mut c_void),
+    MPI_File_read_at_all: AtomicPtr::new(lazy::MPI_File_read_at_all as *mut c_void),
+    MPI_File_write_at: AtomicPtr::new(lazy::MPI_File_write_at as *mut c_void),
+    MPI_File_write_at_all: AtomicPtr::new(lazy::MPI_File_write_at_all as *mut c_void),
+    MPI_File_iread_at: AtomicPtr::new(lazy::MPI_File_iread_at as *mut c_void),
+    MPI_File_iread_at_all: AtomicPtr::new(lazy::MPI_File_iread_at_all as *mut c_void),
+    MPI_File_iwrite_at: AtomicPtr::new(lazy::MPI_File_iwrite_at as *mut c_void),
+    MPI_File_iwrite_at_all: AtomicPtr::new(lazy::MPI_File_iwrite_at_all as *mut c_void),
+    MPI_File_read: AtomicPtr::new(lazy::MPI_File_read as *mut c_void),
+    MPI_File_read_all: AtomicPtr::new(lazy::MPI_File_read_all as *mut c_void),
+    MPI_File_write: AtomicPtr::new(lazy::MPI_File_write as *mut c_void),
+    MPI_File_write_all: AtomicPtr::new(lazy::MPI_File_write_all as *mut c_void),
+    MPI_File_iread: AtomicPtr::new(lazy::MPI_File_iread as *mut c_void),
+    MPI_File_iread_all: AtomicPtr::new(lazy::MPI_File_iread_all as *mut c_void),
+    MPI_File_iwrite: AtomicPtr::new(lazy::MPI_File_iwrite as *mut c_void),
+    MPI_File_iwrite_all: AtomicPtr::new(lazy::MPI_File_iwrite_all as *mut c_void),
+    MPI_File_seek: AtomicPtr::new(lazy::MPI_File_seek as *mut c_void),
+    MPI_File_get_position: AtomicPtr::new(lazy::MPI_File_get_position as *mut c_void),
+    MPI_File_get_byte_offset: AtomicPtr::new(lazy::MPI_File_get_byte_offset as *mut c_void),
+    MPI_File_read_shared: AtomicPtr::new(lazy::MPI_File_read_shared as *mut c_void),
+    MPI_File_write_shared: AtomicPtr::new(lazy::MPI_File_write_shared as *mut c_void),
+    MPI_File_iread_shared: AtomicPtr::new(lazy::MPI_File_iread_shared as *mut c_void),
+    MPI_File_iwrite_shared: AtomicPtr::new(lazy::MPI_File_iwrite_shared as *mut c_void),
+    MPI_File_read_ordered: AtomicPtr::new(lazy::MPI_File_read_ordered as *mut c_void),
+    MPI_File_write_ordered: AtomicPtr::new(lazy::MPI_File_write_ordered as *mut c_void),
+    MPI_File_seek_shared: AtomicPtr::new(lazy::MPI_File_seek_shared as *mut c_void),
+    MPI_File_get_position_shared: AtomicPtr::new(lazy::MPI_File_get_position_shared as *mut c_void),
+    MPI_File_read_at_all_begin: AtomicPtr::new(lazy::MPI_File_read_at_all_begin as *mut c_void),
+    MPI_File_read_at_all_end: AtomicPtr::new(lazy::MPI_File_read_at_all_end as *mut c_void),
+    MPI_File_write_at_all_begin: AtomicPtr::new(lazy::MPI_File_write_at_all_begin as *mut c_void),
+    MPI_File_write_at_all_end: AtomicPtr::new(lazy::MPI_File_write_at_all_end as *mut c_void),
+    MPI_File_read_all_begin: AtomicPtr::new(lazy::MPI_File_read_all_begin as *mut c_void),
+    MPI_File_read_all_end: AtomicPtr::new(lazy::MPI_File_read_all_end as *mut c_void),
+    MPI_File_write_all_begin: AtomicPtr::new(lazy::MPI_File_write_all_begin as *mut c_void),
+    MPI_File_write_all_end: AtomicPtr::new(lazy::MPI_File_write_all_end as *mut c_void),
+    MPI_File_read_ordered_begin: AtomicPtr::new(lazy::MPI_File_read_ordered_begin as *mut c_void),
+    MPI_File_read_ordered_end: AtomicPtr::new(lazy::MPI_File_read_ordered_end as *mut c_void),
+    MPI_File_write_ordered_begin: AtomicPtr::new(lazy::MPI_File_write_ordered_begin as *mut c_void),
+    MPI_File_write_ordered_end: AtomicPtr::new(lazy::MPI_File_write_ordered_end as *mut c_void),
+    MPI_File_get_type_extent: AtomicPtr::new(lazy::MPI_File_get_type_extent as *mut c_void),
+    MPI_Register_datarep: AtomicPtr::new(lazy::MPI_Register_datarep as *mut c_void),
+    MPI_File_set_atomicity: AtomicPtr::new(lazy::MPI_File_set_atomicity as *mut c_void),
+    MPI_File_get_atomicity: AtomicPtr::new(lazy::MPI_File_get_atomicity as *mut c_void),
+    MPI_File_sync: AtomicPtr::new(lazy::MPI_File_sync as *mut c_void),
+    MPI_Type_create_f90_real: AtomicPtr::new(lazy::MPI_Type_create_f90_real as *mut c_void),
+    MPI_Type_create_f90_complex: AtomicPtr::new(lazy::MPI_Type_create_f90_complex as *mut c_void),
+    MPI_Type_create_f90_integer: AtomicPtr::new(lazy::MPI_Type_create_f90_integer as *mut c_void),
+    MPI_Type_match_size: AtomicPtr::new(lazy::MPI_Type_match_size as *mut c_void),
+    MPI_Comm_f2c: AtomicPtr::new(lazy::MPI_Comm_f2c as *mut c_void),
+    MPI_Comm_c2f: AtomicPtr::new(lazy::MPI_Comm_c2f as *mut c_void),
+    MPI_Type_f2c: AtomicPtr::new(lazy::MPI_Type_f2c as *mut c_void),
+    MPI_Type_c2f: AtomicPtr::new(lazy::MPI_Type_c2f as *mut c_void),
+    MPI_Group_f2c: AtomicPtr::new(lazy::MPI_Group_f2c as *mut c_void),
+    MPI_Group_c2f: AtomicPtr::new(lazy::MPI_Group_c2f as *mut c_void),
+    MPI_Request_f2c: AtomicPtr::new(lazy::MPI_Request_f2c as *mut c_void),
+    MPI_Request_c2f: AtomicPtr::new(lazy::MPI_Request_c2f as *mut c_void),
+    MPI_File_f2c: AtomicPtr::new(lazy::MPI_File_f2c as *mut c_void),
+    MPI_File_c2f: AtomicPtr::new(lazy::MPI_File_c2f as *mut c_void),
+    MPI_Win_f2c: AtomicPtr::new(lazy::MPI_Win_f2c as *mut c_void),
+    MPI_Win_c2f: AtomicPtr::new(lazy::MPI_Win_c2f as *mut c_void),
+    MPI_Op_f2c: AtomicPtr::new(lazy::MPI_Op_f2c as *mut c_void),
+    MPI_Op_c2f: AtomicPtr::new(lazy::MPI_Op_c2f as *mut c_void),
+    MPI_Info_f2c: AtomicPtr::new(lazy::MPI_Info_f2c as *mut c_void),
+    MPI_Info_c2f: AtomicPtr::new(lazy::MPI_Info_c2f as *mut c_void),
+    MPI_Errhandler_f2c: AtomicPtr::new(lazy::MPI_Errhandler_f2c as *mut c_void),
+    MPI_Errhandler_c2f: AtomicPtr::new(lazy::MPI_Errhandler_c2f as *mut c_void),
+    MPI_Message_f2c: AtomicPtr::new(lazy::MPI_Message_f2c as *mut c_void),
+    MPI_Message_c2f: AtomicPtr::new(lazy::MPI_Message_c2f as *mut c_void),
+    MPI_Status_f2c: AtomicPtr::new(lazy::MPI_Status_f2c as *mut c_void),
+    MPI_Status_c2f: AtomicPtr::new(lazy::MPI_Status_c2f as *mut c_void),
+    MPI_Send_c: AtomicPtr::new(lazy::MPI_Send_c as *mut c_void),
+    MPI_Recv_c: AtomicPtr::new(lazy::MPI_Recv_c as *mut c_void),
+    MPI_Get_count_c: AtomicPtr::new(lazy::MPI_Get_count_c as *mut c_void),
+    MPI_Bsend_c: AtomicPtr::new(lazy::MPI_Bsend_c as *mut c_void),
+    MPI_Ssend_c: AtomicPtr::new(lazy::MPI_Ssend_c as *mut c_void),
+    MPI_Rsend_c: AtomicPtr::new(lazy::MPI_Rsend_c as *mut c_void),
+    MPI_Isend_c: AtomicPtr::new(lazy::MPI_Isend_c as *mut c_void),
+    MPI_Ibsend_c: AtomicPtr::new(lazy::MPI_Ibsend_c as *mut c_void),
+    MPI_Issend_c: AtomicPtr::new(lazy::MPI_Issend_c as *mut c_void),
+    MPI_Irsend_c: AtomicPtr::new(lazy::MPI_Irsend_c as *mut c_void),
+    MPI_Irecv_c: AtomicPtr::new(lazy::MPI_Irecv_c as *mut c_void),
+    MPI_Send_init_c: AtomicPtr::new(lazy::MPI_Send_init_c as *mut c_void),
+    MPI_Bsend_init_c: AtomicPtr::new(lazy::MPI_Bsend_init_c as *mut c_void),
+    MPI_Ssend_init_c: AtomicPtr::new(lazy::MPI_Ssend_init_c as *mut c_void),
+    MPI_Rsend_init_c: AtomicPtr::new(lazy::MPI_Rsend_init_c as *mut c_void),
+    MPI_Recv_init_c: AtomicPtr::new(lazy::MPI_Recv_init_c as *mut c_void),
+    MPI_Sendrecv_c: AtomicPtr::new(lazy::MPI_Sendrecv_c as *mut c_void),
+    MPI_Sendrecv_replace_c: AtomicPtr::new(lazy::MPI_Sendrecv_replace_c as *mut c_void),
+    MPI_Mrecv_c: AtomicPtr::new(lazy::MPI_Mrecv_c as *mut c_void),
+    MPI_Imrecv_c: AtomicPtr::new(lazy::MPI_Imrecv_c as *mut c_void),
+    MPI_Get_elements_c: AtomicPtr::new(lazy::MPI_Get_elements_c as *mut c_void),
+    MPI_Type_size_c: AtomicPtr::new(lazy::MPI_Type_size_c as *mut c_void),
+    MPI_Type_get_extent_c: AtomicPtr::new(lazy::MPI_Type_get_extent_c as *mut c_void),
+    MPI_Type_get_true_extent_c: AtomicPtr::new(lazy::MPI_Type_get_true_extent_c as *mut c_void),
+    MPI_Pack_c: AtomicPtr::new(lazy::MPI_Pack_c as *mut c_void),
+    MPI_Unpack_c: AtomicPtr::new(lazy::MPI_Unpack_c as *mut c_void),
+    MPI_Pack_size_c: AtomicPtr::new(lazy::MPI_Pack_size_c as *mut c_void),
+    MPI_Bcast_c: AtomicPtr::new(lazy::MPI_Bcast_c as *mut c_void),
+    MPI_Ibcast_c: AtomicPtr::new(lazy::MPI_Ibcast_c as *mut c_void),
+    MPI_Gather_c: AtomicPtr::new(lazy::MPI_Gather_c as *mut c_void),
+    MPI_Igather_c: AtomicPtr::new(lazy::MPI_Igather_c as *mut c_void),
+    MPI_Gatherv_c: AtomicPtr::new(lazy::MPI_Gatherv_c as *mut c_void),
+    MPI_Igatherv_c: AtomicPtr::new(lazy::MPI_Igatherv_c as *mut c_void),
+    MPI_Scatter_c: AtomicPtr::new(lazy::MPI_Scatter_c as *mut c_void),
+    MPI_Iscatter_c: AtomicPtr::new(lazy::MPI_Iscatter_c as *mut c_void),
+    MPI_Scatterv_c: AtomicPtr::new(lazy::MPI_Scatterv_c as *mut c_void),
+    MPI_Iscatterv_c: AtomicPtr::new(lazy::MPI_Iscatterv_c as *mut c_void),
+    MPI_Allgather_c: AtomicPtr::new(lazy::MPI_Allgather_c as *mut c_void),
+    MPI_Iallgather_c: AtomicPtr::new(lazy::MPI_Iallgather_c as *mut c_void),
+    MPI_Allgatherv_c: AtomicPtr::new(lazy::MPI_Allgatherv_c as *mut c_void),
+    MPI_Iallgatherv_c: AtomicPtr::new(lazy::MPI_Iallgatherv_c as *mut c_void),
+    MPI_Alltoall_c: AtomicPtr::new(lazy::MPI_Alltoall_c as *mut c_void),
+    MPI_Ialltoall_c: AtomicPtr::new(lazy::MPI_Ialltoall_c as *mut c_void),
+    MPI_Alltoallv_c: AtomicPtr::new(lazy::MPI_Alltoallv_c as *mut c_void),
+    MPI_Ialltoallv_c: AtomicPtr::new(lazy::MPI_Ialltoallv_c as *mut c_void),
+    MPI_Alltoallw_c: AtomicPtr::new(lazy::MPI_Alltoallw_c as *mut c_void),
+    MPI_Ialltoallw_c: AtomicPtr::new(lazy::MPI_Ialltoallw_c as *mut c_void),
+    MPI_Reduce_c: AtomicPtr::new(lazy::MPI_Reduce_c as *mut c_void),
+    MPI_Ireduce_c: AtomicPtr::new(lazy::MPI_Ireduce_c as *mut c_void),
+    MPI_Allreduce_c: AtomicPtr::new(lazy::MPI_Allreduce_c as *mut c_void),
+    MPI_Iallreduce_c: AtomicPtr::new(lazy::MPI_Iallreduce_c as *mut c_void),
+    MPI_Reduce_local_c: AtomicPtr::new(lazy::MPI_Reduce_local_c as *mut c_void),
+    MPI_Reduce_scatter_block_c: AtomicPtr::new(lazy::MPI_Reduce_scatter_block_c as *mut c_void),
+    MPI_Ireduce_scatter_block_c: AtomicPtr::new(lazy::MPI_Ireduce_scatter_block_c as *mut c_void),
+    MPI_Reduce_scatter_c: AtomicPtr::new(lazy::MPI_Reduce_scatter_c as *mut c_void),
+    MPI_Ireduce_scatter_c: AtomicPtr::new(lazy::MPI_Ireduce_scatter_c as *mut c_void),
+    MPI_Scan_c: AtomicPtr::new(lazy::MPI_Scan_c as *mut c_void),
+    MPI_Iscan_c: AtomicPtr::new(lazy::MPI_Iscan_c as *mut c_void),
+    MPI_Exscan_c: AtomicPtr::new(lazy::MPI_Exscan_c as *mut c_void),
+    MPI_Iexscan_c: AtomicPtr::new(lazy::MPI_Iexscan_c as *mut c_void),
+    MPI_Neighbor_allgather_c: AtomicPtr::new(lazy::MPI_Neighbor_allgather_c as *mut c_void),
+    MPI_Ineighbor_allgather_c: AtomicPtr::new(lazy::MPI_Ineighbor_allgather_c as *mut c_void),
+    MPI_Neighbor_allgatherv_c: AtomicPtr::new(lazy::MPI_Neighbor_allgatherv_c as *mut c_void),
+    MPI_Ineighbor_allgatherv_c: AtomicPtr::new(lazy::MPI_Ineighbor_allgatherv_c as *mut c_void),
+    MPI_Neighbor_alltoall_c: AtomicPtr::new(lazy::MPI_Neighbor_alltoall_c as *mut c_void),
+    MPI_Ineighbor_alltoall_c: AtomicPtr::new(lazy::MPI_Ineighbor_alltoall_c as *mut c_void),
+    MPI_Neighbor_alltoallv_c: AtomicPtr::new(lazy::MPI_Neighbor_alltoallv_c as *mut c_void),
+    MPI_Ineighbor_alltoallv_c: AtomicPtr::new(lazy::MPI_Ineighbor_alltoallv_c as *mut c_void),
+    MPI_Neighbor_alltoallw_c: AtomicPtr::new(lazy::MPI_Neighbor_alltoallw_c as *mut c_void),
+    MPI_Ineighbor_alltoallw_c: AtomicPtr::new(lazy::MPI_Ineighbor_alltoallw_c as *mut c_void),
+    MPI_Psend_init: AtomicPtr::new(lazy::MPI_Psend_init as *mut c_void),
+    MPI_Precv_init: AtomicPtr::new(lazy::MPI_Precv_init as *mut c_void),
+    MPI_Pready: AtomicPtr::new(lazy::MPI_Pready as *mut c_void),
+    MPI_Pready_range: AtomicPtr::new(lazy::MPI_Pready_range as *mut c_void),
+    MPI_Pready_list: AtomicPtr::new(lazy::MPI_Pready_list as *mut c_void),
+    MPI_Parrived: AtomicPtr::new(lazy::MPI_Parrived as *mut c_void),
+    MPI_Barrier_init: AtomicPtr::new(lazy::MPI_Barrier_init as *mut c_void),
+    MPI_Bcast_init: AtomicPtr::new(lazy::MPI_Bcast_init as *mut c_void),
+    MPI_Gather_init: AtomicPtr::new(lazy::MPI_Gather_init as *mut c_void),
+    MPI_Gatherv_init: AtomicPtr::new(lazy::MPI_Gatherv_init as *mut c_void),
+    MPI_Scatter_init: AtomicPtr::new(lazy::MPI_Scatter_init as *mut c_void),
+    MPI_Scatterv_init: AtomicPtr::new(lazy::MPI_Scatterv_init as *mut c_void),
+    MPI_Allgather_init: AtomicPtr::new(lazy::MPI_Allgather_init as *mut c_void),
+    MPI_Allgatherv_init: AtomicPtr::new(lazy::MPI_Allgatherv_init as *mut c_void),
+    MPI_Alltoall_init: AtomicPtr::new(lazy::MPI_Alltoall_init as *mut c_void),
+    MPI_Alltoallv_init: AtomicPtr::new(lazy::MPI_Alltoallv_init as *mut c_void),
+    MPI_Alltoallw_init: AtomicPtr::new(lazy::MPI_Alltoallw_init as *mut c_void),
+    MPI_Reduce_init: AtomicPtr::new(lazy::MPI_Reduce_init as *mut c_void),
+    MPI_Allreduce_init: AtomicPtr::new(lazy::MPI_Allreduce_init as *mut c_void),
+    MPI_Reduce_scatter_block_init: AtomicPtr::new(
+        lazy::MPI_Reduce_scatter_block_init as *mut c_void,
+    ),
+    MPI_Reduce_scatter_init: AtomicPtr::new(lazy::MPI_Reduce_scatter_init as *mut c_void),
+    MPI_Scan_init: AtomicPtr::new(lazy::MPI_Scan_init as *mut c_void),
+    MPI_Exscan_init: AtomicPtr::new(lazy::MPI_Exscan_init as *mut c_void),
+    MPI_Bcast_init_c: AtomicPtr::new(lazy::MPI_Bcast_init_c as *mut c_void),
+    MPI_Gather_init_c: AtomicPtr::new(lazy::MPI_Gather_init_c as *mut c_void),
+    MPI_Gatherv_init_c: AtomicPtr::new(lazy::MPI_Gatherv_init_c as *mut c_void),
+    MPI_Scatter_init_c: AtomicPtr::new(lazy::MPI_Scatter_init_c as *mut c_void),
+    MPI_Scatterv_init_c: AtomicPtr::new(lazy::MPI_Scatterv_init_c as *mut c_void),
+    MPI_Allgather_init_c: AtomicPtr::new(lazy::MPI_Allgather_init_c as *mut c_void),
+    MPI_Allgatherv_init_c: AtomicPtr::new(lazy::MPI_Allgatherv_init_c as *mut c_void),
+    MPI_Alltoall_init_c: AtomicPtr::new(lazy::MPI_Alltoall_init_c as *mut c_void),
+    MPI_Alltoallv_init_c: AtomicPtr::new(lazy::MPI_Alltoallv_init_c as *mut c_void),
+    MPI_Alltoallw_init_c: AtomicPtr::new(lazy::MPI_Alltoallw_init_c as *mut c_void),
+    MPI_Reduce_init_c: AtomicPtr::new(lazy::MPI_Reduce_init_c as *mut c_void),
+    MPI_Allreduce_init_c: AtomicPtr::new(lazy::MPI_Allreduce_init_c as *mut c_void),
+    MPI_Reduce_scatter_block_init_c: AtomicPtr::new(
+        lazy::MPI_Reduce_scatter_block_init_c as *mut c_void,
+    ),
+    MPI_Reduce_scatter_init_c: AtomicPtr::new(lazy::MPI_Reduce_scatter_init_c as *mut c_void),
+    MPI_Scan_init_c: AtomicPtr::new(lazy::MPI_Scan_init_c as *mut c_void),
+    MPI_Exscan_init_c: AtomicPtr::new(lazy::MPI_Exscan_init_c as *mut c_void),
+    MPI_Neighbor_allgather_init: AtomicPtr::new(lazy::MPI_Neighbor_allgather_init as *mut c_void),
+    MPI_Neighbor_allgatherv_init: AtomicPtr::new(lazy::MPI_Neighbor_allgatherv_init as *mut c_void),
+    MPI_Neighbor_alltoall_init: AtomicPtr::new(lazy::MPI_Neighbor_alltoall_init as *mut c_void),
+    MPI_Neighbor_alltoallv_init: AtomicPtr::new(lazy::MPI_Neighbor_alltoallv_init as *mut c_void),
+    MPI_Neighbor_alltoallw_init: AtomicPtr::new(lazy::MPI_Neighbor_alltoallw_init as *mut c_void),
+    MPI_Neighbor_allgather_init_c: AtomicPtr::new(
+        lazy::MPI_Neighbor_allgather_init_c as *mut c_void,
+    ),
+    MPI_Neighbor_allgatherv_init_c: AtomicPtr::new(
+        lazy::MPI_Neighbor_allgatherv_init_c as *mut c_void,
+    ),
+    MPI_Neighbor_alltoall_init_c: AtomicPtr::new(lazy::MPI_Neighbor_alltoall_init_c as *mut c_void),
+    MPI_Neighbor_alltoallv_init_c: AtomicPtr::new(
+        lazy::MPI_Neighbor_alltoallv_init_c as *mut c_void,
+    ),
+    MPI_Neighbor_alltoallw_init_c: AtomicPtr::new(
+        lazy::MPI_Neighbor_alltoallw_init_c as *mut c_void,
+    ),
+    MPIX_Query_cuda_support: AtomicPtr::new(lazy::MPIX_Query_cuda_support as *mut c_void),
+    MPIX_Query_hip_support: AtomicPtr::new(lazy::MPIX_Query_hip_support as *mut c_void),
+    MPIX_Query_rocm_support: AtomicPtr::new(lazy::MPIX_Query_rocm_support as *mut c_void),
+    MPIX_Query_ze_support: AtomicPtr::new(lazy::MPIX_Query_ze_support as *mut c_void),
+};
 
-pub unsafe fn MPI_Recv(
-    buf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    source: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-    status: *mut MPI_Status,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+macro_rules! resolve {
+    ($name:ident) => {
+        TABLE.$name.store(
+            loader::find_symbol(concat!(stringify!($name), "\0").as_bytes())
+                .unwrap_or(missing::$name as *const c_void) as *mut c_void,
+            Ordering::Relaxed,
+        )
+    };
+}
+
+static RESOLVED: Once = Once::new();
+
+/// Resolve every entry point of the loaded library, if that has not happened yet.
+pub fn resolve_function_table() {
+    RESOLVED.call_once(|| {
+        resolve!(MPI_Send);
+        resolve!(MPI_Recv);
+        resolve!(MPI_Get_count);
+        resolve!(MPI_Bsend);
+        resolve!(MPI_Ssend);
+        resolve!(MPI_Rsend);
+        resolve!(MPI_Buffer_attach);
+        resolve!(MPI_Buffer_detach);
+        resolve!(MPI_Isend);
+        resolve!(MPI_Ibsend);
+        resolve!(MPI_Issend);
+        resolve!(MPI_Irsend);
+        resolve!(MPI_Irecv);
+        resolve!(MPI_Wait);
+        resolve!(MPI_Test);
+        resolve!(MPI_Request_free);
+        resolve!(MPI_Waitany);
+        resolve!(MPI_Testany);
+        resolve!(MPI_Waitall);
+        resolve!(MPI_Testall);
+        resolve!(MPI_Waitsome);
+        resolve!(MPI_Testsome);
+        resolve!(MPI_Request_get_status);
+        resolve!(MPI_Iprobe);
+        resolve!(MPI_Probe);
+        resolve!(MPI_Improbe);
+        resolve!(MPI_Mprobe);
+        resolve!(MPI_Mrecv);
+        resolve!(MPI_Imrecv);
+        resolve!(MPI_Cancel);
+        resolve!(MPI_Test_cancelled);
+        resolve!(MPI_Send_init);
+        resolve!(MPI_Bsend_init);
+        resolve!(MPI_Ssend_init);
+        resolve!(MPI_Rsend_init);
+        resolve!(MPI_Recv_init);
+        resolve!(MPI_Start);
+        resolve!(MPI_Startall);
+        resolve!(MPI_Sendrecv);
+        resolve!(MPI_Sendrecv_replace);
+        resolve!(MPI_Type_contiguous);
+        resolve!(MPI_Type_vector);
+        resolve!(MPI_Type_create_hvector);
+        resolve!(MPI_Type_indexed);
+        resolve!(MPI_Type_create_hindexed);
+        resolve!(MPI_Type_create_indexed_block);
+        resolve!(MPI_Type_create_hindexed_block);
+        resolve!(MPI_Type_create_struct);
+        resolve!(MPI_Type_struct);
+        resolve!(MPI_Type_create_subarray);
+        resolve!(MPI_Type_create_darray);
+        resolve!(MPI_Get_address);
+        resolve!(MPI_Aint_add);
+        resolve!(MPI_Aint_diff);
+        resolve!(MPI_Type_size);
+        resolve!(MPI_Type_size_x);
+        resolve!(MPI_Type_get_extent);
+        resolve!(MPI_Type_get_extent_x);
+        resolve!(MPI_Type_create_resized);
+        resolve!(MPI_Type_get_true_extent);
+        resolve!(MPI_Type_get_true_extent_x);
+        resolve!(MPI_Type_commit);
+        resolve!(MPI_Type_free);
+        resolve!(MPI_Type_dup);
+        resolve!(MPI_Get_elements);
+        resolve!(MPI_Get_elements_x);
+        resolve!(MPI_Type_get_envelope);
+        resolve!(MPI_Type_get_contents);
+        resolve!(MPI_Pack);
+        resolve!(MPI_Unpack);
+        resolve!(MPI_Pack_size);
+        resolve!(MPI_Pack_external);
+        resolve!(MPI_Unpack_external);
+        resolve!(MPI_Pack_external_size);
+        resolve!(MPI_Barrier);
+        resolve!(MPI_Bcast);
+        resolve!(MPI_Gather);
+        resolve!(MPI_Gatherv);
+        resolve!(MPI_Scatter);
+        resolve!(MPI_Scatterv);
+        resolve!(MPI_Allgather);
+        resolve!(MPI_Allgatherv);
+        resolve!(MPI_Alltoall);
+        resolve!(MPI_Alltoallv);
+        resolve!(MPI_Alltoallw);
+        resolve!(MPI_Reduce);
+        resolve!(MPI_Op_create);
+        resolve!(MPI_Op_free);
+        resolve!(MPI_Allreduce);
+        resolve!(MPI_Op_commutative);
+        resolve!(MPI_Reduce_local);
+        resolve!(MPI_Reduce_scatter_block);
+        resolve!(MPI_Reduce_scatter);
+        resolve!(MPI_Scan);
+        resolve!(MPI_Exscan);
+        resolve!(MPI_Ibarrier);
+        resolve!(MPI_Ibcast);
+        resolve!(MPI_Igather);
+        resolve!(MPI_Igatherv);
+        resolve!(MPI_Iscatter);
+        resolve!(MPI_Iscatterv);
+        resolve!(MPI_Iallgather);
+        resolve!(MPI_Iallgatherv);
+        resolve!(MPI_Ialltoall);
+        resolve!(MPI_Ialltoallv);
+        resolve!(MPI_Ialltoallw);
+        resolve!(MPI_Ireduce);
+        resolve!(MPI_Iallreduce);
+        resolve!(MPI_Ireduce_scatter_block);
+        resolve!(MPI_Ireduce_scatter);
+        resolve!(MPI_Iscan);
+        resolve!(MPI_Iexscan);
+        resolve!(MPI_Group_size);
+        resolve!(MPI_Group_rank);
+        resolve!(MPI_Group_translate_ranks);
+        resolve!(MPI_Group_compare);
+        resolve!(MPI_Comm_group);
+        resolve!(MPI_Group_union);
+        resolve!(MPI_Group_intersection);
+        resolve!(MPI_Group_difference);
+        resolve!(MPI_Group_incl);
+        resolve!(MPI_Group_excl);
+        resolve!(MPI_Group_range_incl);
+        resolve!(MPI_Group_range_excl);
+        resolve!(MPI_Group_free);
+        resolve!(MPI_Comm_size);
+        resolve!(MPI_Comm_rank);
+        resolve!(MPI_Comm_compare);
+        resolve!(MPI_Comm_dup);
+        resolve!(MPI_Comm_dup_with_info);
+        resolve!(MPI_Comm_idup);
+        resolve!(MPI_Comm_create);
+        resolve!(MPI_Comm_create_group);
+        resolve!(MPI_Comm_split);
+        resolve!(MPI_Comm_split_type);
+        resolve!(MPI_Comm_free);
+        resolve!(MPI_Comm_set_info);
+        resolve!(MPI_Comm_get_info);
+        resolve!(MPI_Comm_test_inter);
+        resolve!(MPI_Comm_remote_size);
+        resolve!(MPI_Comm_remote_group);
+        resolve!(MPI_Intercomm_create);
+        resolve!(MPI_Intercomm_merge);
+        resolve!(MPI_Comm_create_keyval);
+        resolve!(MPI_Comm_free_keyval);
+        resolve!(MPI_Comm_set_attr);
+        resolve!(MPI_Comm_get_attr);
+        resolve!(MPI_Comm_delete_attr);
+        resolve!(MPI_Win_create_keyval);
+        resolve!(MPI_Win_free_keyval);
+        resolve!(MPI_Win_set_attr);
+        resolve!(MPI_Win_get_attr);
+        resolve!(MPI_Win_delete_attr);
+        resolve!(MPI_Type_create_keyval);
+        resolve!(MPI_Type_free_keyval);
+        resolve!(MPI_Type_set_attr);
+        resolve!(MPI_Type_get_attr);
+        resolve!(MPI_Type_delete_attr);
+        resolve!(MPI_Comm_set_name);
+        resolve!(MPI_Comm_get_name);
+        resolve!(MPI_Type_set_name);
+        resolve!(MPI_Type_get_name);
+        resolve!(MPI_Win_set_name);
+        resolve!(MPI_Win_get_name);
+        resolve!(MPI_Cart_create);
+        resolve!(MPI_Dims_create);
+        resolve!(MPI_Graph_create);
+        resolve!(MPI_Dist_graph_create_adjacent);
+        resolve!(MPI_Dist_graph_create);
+        resolve!(MPI_Topo_test);
+        resolve!(MPI_Graphdims_get);
+        resolve!(MPI_Graph_get);
+        resolve!(MPI_Cartdim_get);
+        resolve!(MPI_Cart_get);
+        resolve!(MPI_Cart_rank);
+        resolve!(MPI_Cart_coords);
+        resolve!(MPI_Graph_neighbors_count);
+        resolve!(MPI_Graph_neighbors);
+        resolve!(MPI_Dist_graph_neighbors_count);
+        resolve!(MPI_Dist_graph_neighbors);
+        resolve!(MPI_Cart_shift);
+        resolve!(MPI_Cart_sub);
+        resolve!(MPI_Cart_map);
+        resolve!(MPI_Graph_map);
+        resolve!(MPI_Neighbor_allgather);
+        resolve!(MPI_Neighbor_allgatherv);
+        resolve!(MPI_Neighbor_alltoall);
+        resolve!(MPI_Neighbor_alltoallv);
+        resolve!(MPI_Neighbor_alltoallw);
+        resolve!(MPI_Ineighbor_allgather);
+        resolve!(MPI_Ineighbor_allgatherv);
+        resolve!(MPI_Ineighbor_alltoall);
+        resolve!(MPI_Ineighbor_alltoallv);
+        resolve!(MPI_Ineighbor_alltoallw);
+        resolve!(MPI_Get_version);
+        resolve!(MPI_Get_library_version);
+        resolve!(MPI_Get_processor_name);
+        resolve!(MPI_Alloc_mem);
+        resolve!(MPI_Free_mem);
+        resolve!(MPI_Comm_create_errhandler);
+        resolve!(MPI_Comm_set_errhandler);
+        resolve!(MPI_Comm_get_errhandler);
+        resolve!(MPI_Win_create_errhandler);
+        resolve!(MPI_Win_set_errhandler);
+        resolve!(MPI_Win_get_errhandler);
+        resolve!(MPI_File_create_errhandler);
+        resolve!(MPI_File_set_errhandler);
+        resolve!(MPI_File_get_errhandler);
+        resolve!(MPI_Errhandler_free);
+        resolve!(MPI_Error_string);
+        resolve!(MPI_Error_class);
+        resolve!(MPI_Add_error_class);
+        resolve!(MPI_Add_error_code);
+        resolve!(MPI_Add_error_string);
+        resolve!(MPI_Comm_call_errhandler);
+        resolve!(MPI_Win_call_errhandler);
+        resolve!(MPI_File_call_errhandler);
+        resolve!(MPI_Wtime);
+        resolve!(MPI_Wtick);
+        resolve!(MPI_Init);
+        resolve!(MPI_Finalize);
+        resolve!(MPI_Initialized);
+        resolve!(MPI_Abort);
+        resolve!(MPI_Finalized);
+        resolve!(MPI_Info_create);
+        resolve!(MPI_Info_set);
+        resolve!(MPI_Info_delete);
+        resolve!(MPI_Info_get);
+        resolve!(MPI_Info_get_valuelen);
+        resolve!(MPI_Info_get_nkeys);
+        resolve!(MPI_Info_get_nthkey);
+        resolve!(MPI_Info_dup);
+        resolve!(MPI_Info_free);
+        resolve!(MPI_Comm_spawn);
+        resolve!(MPI_Comm_get_parent);
+        resolve!(MPI_Comm_spawn_multiple);
+        resolve!(MPI_Open_port);
+        resolve!(MPI_Close_port);
+        resolve!(MPI_Comm_accept);
+        resolve!(MPI_Comm_connect);
+        resolve!(MPI_Publish_name);
+        resolve!(MPI_Unpublish_name);
+        resolve!(MPI_Lookup_name);
+        resolve!(MPI_Comm_disconnect);
+        resolve!(MPI_Comm_join);
+        resolve!(MPI_Win_create);
+        resolve!(MPI_Win_allocate);
+        resolve!(MPI_Win_allocate_shared);
+        resolve!(MPI_Win_shared_query);
+        resolve!(MPI_Win_create_dynamic);
+        resolve!(MPI_Win_attach);
+        resolve!(MPI_Win_detach);
+        resolve!(MPI_Win_free);
+        resolve!(MPI_Win_get_group);
+        resolve!(MPI_Win_set_info);
+        resolve!(MPI_Win_get_info);
+        resolve!(MPI_Put);
+        resolve!(MPI_Get);
+        resolve!(MPI_Accumulate);
+        resolve!(MPI_Get_accumulate);
+        resolve!(MPI_Fetch_and_op);
+        resolve!(MPI_Compare_and_swap);
+        resolve!(MPI_Rput);
+        resolve!(MPI_Rget);
+        resolve!(MPI_Raccumulate);
+        resolve!(MPI_Rget_accumulate);
+        resolve!(MPI_Win_fence);
+        resolve!(MPI_Win_start);
+        resolve!(MPI_Win_complete);
+        resolve!(MPI_Win_post);
+        resolve!(MPI_Win_wait);
+        resolve!(MPI_Win_test);
+        resolve!(MPI_Win_lock);
+        resolve!(MPI_Win_lock_all);
+        resolve!(MPI_Win_unlock);
+        resolve!(MPI_Win_unlock_all);
+        resolve!(MPI_Win_flush);
+        resolve!(MPI_Win_flush_all);
+        resolve!(MPI_Win_flush_local);
+        resolve!(MPI_Win_flush_local_all);
+        resolve!(MPI_Win_sync);
+        resolve!(MPI_Grequest_start);
+        resolve!(MPI_Grequest_complete);
+        resolve!(MPI_Status_set_elements);
+        resolve!(MPI_Status_set_elements_x);
+        resolve!(MPI_Status_set_cancelled);
+        resolve!(MPI_Init_thread);
+        resolve!(MPI_Query_thread);
+        resolve!(MPI_Is_thread_main);
+        resolve!(MPI_File_open);
+        resolve!(MPI_File_close);
+        resolve!(MPI_File_delete);
+        resolve!(MPI_File_set_size);
+        resolve!(MPI_File_preallocate);
+        resolve!(MPI_File_get_size);
+        resolve!(MPI_File_get_group);
+        resolve!(MPI_File_get_amode);
+        resolve!(MPI_File_set_info);
+        resolve!(MPI_File_get_info);
+        resolve!(MPI_File_set_view);
+        resolve!(MPI_File_get_view);
+        resolve!(MPI_File_read_at);
+        resolve!(MPI_File_read_at_all);
+        resolve!(MPI_File_write_at);
+        resolve!(MPI_File_write_at_all);
+        resolve!(MPI_File_iread_at);
+        resolve!(MPI_File_iread_at_all);
+        resolve!(MPI_File_iwrite_at);
+        resolve!(MPI_File_iwrite_at_all);
+        resolve!(MPI_File_read);
+        resolve!(MPI_File_read_all);
+        resolve!(MPI_File_write);
+        resolve!(MPI_File_write_all);
+        resolve!(MPI_File_iread);
+        resolve!(MPI_File_iread_all);
+        resolve!(MPI_File_iwrite);
+        resolve!(MPI_File_iwrite_all);
+        resolve!(MPI_File_seek);
+        resolve!(MPI_File_get_position);
+        resolve!(MPI_File_get_byte_offset);
+        resolve!(MPI_File_read_shared);
+        resolve!(MPI_File_write_shared);
+        resolve!(MPI_File_iread_shared);
+        resolve!(MPI_File_iwrite_shared);
+        resolve!(MPI_File_read_ordered);
+        resolve!(MPI_File_write_ordered);
+        resolve!(MPI_File_seek_shared);
+        resolve!(MPI_File_get_position_shared);
+        resolve!(MPI_File_read_at_all_begin);
+        resolve!(MPI_File_read_at_all_end);
+        resolve!(MPI_File_write_at_all_begin);
+        resolve!(MPI_File_write_at_all_end);
+        resolve!(MPI_File_read_all_begin);
+        resolve!(MPI_File_read_all_end);
+        resolve!(MPI_File_write_all_begin);
+        resolve!(MPI_File_write_all_end);
+        resolve!(MPI_File_read_ordered_begin);
+        resolve!(MPI_File_read_ordered_end);
+        resolve!(MPI_File_write_ordered_begin);
+        resolve!(MPI_File_write_ordered_end);
+        resolve!(MPI_File_get_type_extent);
+        resolve!(MPI_Register_datarep);
+        resolve!(MPI_File_set_atomicity);
+        resolve!(MPI_File_get_atomicity);
+        resolve!(MPI_File_sync);
+        resolve!(MPI_Type_create_f90_real);
+        resolve!(MPI_Type_create_f90_complex);
+        resolve!(MPI_Type_create_f90_integer);
+        resolve!(MPI_Type_match_size);
+        resolve!(MPI_Comm_f2c);
+        resolve!(MPI_Comm_c2f);
+        resolve!(MPI_Type_f2c);
+        resolve!(MPI_Type_c2f);
+        resolve!(MPI_Group_f2c);
+        resolve!(MPI_Group_c2f);
+        resolve!(MPI_Request_f2c);
+        resolve!(MPI_Request_c2f);
+        resolve!(MPI_File_f2c);
+        resolve!(MPI_File_c2f);
+        resolve!(MPI_Win_f2c);
+        resolve!(MPI_Win_c2f);
+        resolve!(MPI_Op_f2c);
+        resolve!(MPI_Op_c2f);
+        resolve!(MPI_Info_f2c);
+        resolve!(MPI_Info_c2f);
+        resolve!(MPI_Errhandler_f2c);
+        resolve!(MPI_Errhandler_c2f);
+        resolve!(MPI_Message_f2c);
+        resolve!(MPI_Message_c2f);
+        resolve!(MPI_Status_f2c);
+        resolve!(MPI_Status_c2f);
+        resolve!(MPI_Send_c);
+        resolve!(MPI_Recv_c);
+        resolve!(MPI_Get_count_c);
+        resolve!(MPI_Bsend_c);
+        resolve!(MPI_Ssend_c);
+        resolve!(MPI_Rsend_c);
+        resolve!(MPI_Isend_c);
+        resolve!(MPI_Ibsend_c);
+        resolve!(MPI_Issend_c);
+        resolve!(MPI_Irsend_c);
+        resolve!(MPI_Irecv_c);
+        resolve!(MPI_Send_init_c);
+        resolve!(MPI_Bsend_init_c);
+        resolve!(MPI_Ssend_init_c);
+        resolve!(MPI_Rsend_init_c);
+        resolve!(MPI_Recv_init_c);
+        resolve!(MPI_Sendrecv_c);
+        resolve!(MPI_Sendrecv_replace_c);
+        resolve!(MPI_Mrecv_c);
+        resolve!(MPI_Imrecv_c);
+        resolve!(MPI_Get_elements_c);
+        resolve!(MPI_Type_size_c);
+        resolve!(MPI_Type_get_extent_c);
+        resolve!(MPI_Type_get_true_extent_c);
+        resolve!(MPI_Pack_c);
+        resolve!(MPI_Unpack_c);
+        resolve!(MPI_Pack_size_c);
+        resolve!(MPI_Bcast_c);
+        resolve!(MPI_Ibcast_c);
+        resolve!(MPI_Gather_c);
+        resolve!(MPI_Igather_c);
+        resolve!(MPI_Gatherv_c);
+        resolve!(MPI_Igatherv_c);
+        resolve!(MPI_Scatter_c);
+        resolve!(MPI_Iscatter_c);
+        resolve!(MPI_Scatterv_c);
+        resolve!(MPI_Iscatterv_c);
+        resolve!(MPI_Allgather_c);
+        resolve!(MPI_Iallgather_c);
+        resolve!(MPI_Allgatherv_c);
+        resolve!(MPI_Iallgatherv_c);
+        resolve!(MPI_Alltoall_c);
+        resolve!(MPI_Ialltoall_c);
+        resolve!(MPI_Alltoallv_c);
+        resolve!(MPI_Ialltoallv_c);
+        resolve!(MPI_Alltoallw_c);
+        resolve!(MPI_Ialltoallw_c);
+        resolve!(MPI_Reduce_c);
+        resolve!(MPI_Ireduce_c);
+        resolve!(MPI_Allreduce_c);
+        resolve!(MPI_Iallreduce_c);
+        resolve!(MPI_Reduce_local_c);
+        resolve!(MPI_Reduce_scatter_block_c);
+        resolve!(MPI_Ireduce_scatter_block_c);
+        resolve!(MPI_Reduce_scatter_c);
+        resolve!(MPI_Ireduce_scatter_c);
+        resolve!(MPI_Scan_c);
+        resolve!(MPI_Iscan_c);
+        resolve!(MPI_Exscan_c);
+        resolve!(MPI_Iexscan_c);
+        resolve!(MPI_Neighbor_allgather_c);
+        resolve!(MPI_Ineighbor_allgather_c);
+        resolve!(MPI_Neighbor_allgatherv_c);
+        resolve!(MPI_Ineighbor_allgatherv_c);
+        resolve!(MPI_Neighbor_alltoall_c);
+        resolve!(MPI_Ineighbor_alltoall_c);
+        resolve!(MPI_Neighbor_alltoallv_c);
+        resolve!(MPI_Ineighbor_alltoallv_c);
+        resolve!(MPI_Neighbor_alltoallw_c);
+        resolve!(MPI_Ineighbor_alltoallw_c);
+        resolve!(MPI_Psend_init);
+        resolve!(MPI_Precv_init);
+        resolve!(MPI_Pready);
+        resolve!(MPI_Pready_range);
+        resolve!(MPI_Pready_list);
+        resolve!(MPI_Parrived);
+        resolve!(MPI_Barrier_init);
+        resolve!(MPI_Bcast_init);
+        resolve!(MPI_Gather_init);
+        resolve!(MPI_Gatherv_init);
+        resolve!(MPI_Scatter_init);
+        resolve!(MPI_Scatterv_init);
+        resolve!(MPI_Allgather_init);
+        resolve!(MPI_Allgatherv_init);
+        resolve!(MPI_Alltoall_init);
+        resolve!(MPI_Alltoallv_init);
+        resolve!(MPI_Alltoallw_init);
+        resolve!(MPI_Reduce_init);
+        resolve!(MPI_Allreduce_init);
+        resolve!(MPI_Reduce_scatter_block_init);
+        resolve!(MPI_Reduce_scatter_init);
+        resolve!(MPI_Scan_init);
+        resolve!(MPI_Exscan_init);
+        resolve!(MPI_Bcast_init_c);
+        resolve!(MPI_Gather_init_c);
+        resolve!(MPI_Gatherv_init_c);
+        resolve!(MPI_Scatter_init_c);
+        resolve!(MPI_Scatterv_init_c);
+        resolve!(MPI_Allgather_init_c);
+        resolve!(MPI_Allgatherv_init_c);
+        resolve!(MPI_Alltoall_init_c);
+        resolve!(MPI_Alltoallv_init_c);
+        resolve!(MPI_Alltoallw_init_c);
+        resolve!(MPI_Reduce_init_c);
+        resolve!(MPI_Allreduce_init_c);
+        resolve!(MPI_Reduce_scatter_block_init_c);
+        resolve!(MPI_Reduce_scatter_init_c);
+        resolve!(MPI_Scan_init_c);
+        resolve!(MPI_Exscan_init_c);
+        resolve!(MPI_Neighbor_allgather_init);
+        resolve!(MPI_Neighbor_allgatherv_init);
+        resolve!(MPI_Neighbor_alltoall_init);
+        resolve!(MPI_Neighbor_alltoallv_init);
+        resolve!(MPI_Neighbor_alltoallw_init);
+        resolve!(MPI_Neighbor_allgather_init_c);
+        resolve!(MPI_Neighbor_allgatherv_init_c);
+        resolve!(MPI_Neighbor_alltoall_init_c);
+        resolve!(MPI_Neighbor_alltoallv_init_c);
+        resolve!(MPI_Neighbor_alltoallw_init_c);
+        resolve!(MPIX_Query_cuda_support);
+        resolve!(MPIX_Query_hip_support);
+        resolve!(MPIX_Query_rocm_support);
+        resolve!(MPIX_Query_ze_support);
+    });
+}
+
+/// The current entry point of each function in `TABLE`.
+pub(crate) mod entry {
+    use super::*;
+
+    #[inline(always)]
+    pub(crate) fn MPI_Send(
+    ) -> unsafe extern "C" fn(*const c_void, c_int, MPI_Datatype, c_int, c_int, MPI_Comm) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Send.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Recv() -> unsafe extern "C" fn(
         *mut c_void,
         c_int,
         MPI_Datatype,
@@ -44,113 +1568,49 @@ pub unsafe fn MPI_Recv(
         c_int,
         MPI_Comm,
         *mut MPI_Status,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Recv\0");
-        std::mem::transmute(ptr)
-    });
-    f(buf, count, datatype, source, tag, comm, status)
-}
-
-pub unsafe fn MPI_Get_count(
-    status: *const MPI_Status,
-    datatype: MPI_Datatype,
-    count: *mut c_int,
-) -> c_int {
-    type F = unsafe extern "C" fn(*const MPI_Status, MPI_Datatype, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Get_count\0");
-        std::mem::transmute(ptr)
-    });
-    f(status, datatype, count)
-}
-
-pub unsafe fn MPI_Bsend(
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    dest: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-) -> c_int {
-    type F =
-        unsafe extern "C" fn(*const c_void, c_int, MPI_Datatype, c_int, c_int, MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Bsend\0");
-        std::mem::transmute(ptr)
-    });
-    f(buf, count, datatype, dest, tag, comm)
-}
-
-pub unsafe fn MPI_Ssend(
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    dest: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-) -> c_int {
-    type F =
-        unsafe extern "C" fn(*const c_void, c_int, MPI_Datatype, c_int, c_int, MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Ssend\0");
-        std::mem::transmute(ptr)
-    });
-    f(buf, count, datatype, dest, tag, comm)
-}
-
-pub unsafe fn MPI_Rsend(
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    dest: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-) -> c_int {
-    type F =
-        unsafe extern "C" fn(*const c_void, c_int, MPI_Datatype, c_int, c_int, MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Rsend\0");
-        std::mem::transmute(ptr)
-    });
-    f(buf, count, datatype, dest, tag, comm)
-}
-
-pub unsafe fn MPI_Buffer_attach(buffer: *mut c_void, size: c_int) -> c_int {
-    type F = unsafe extern "C" fn(*mut c_void, c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Buffer_attach\0");
-        std::mem::transmute(ptr)
-    });
-    f(buffer, size)
-}
-
-pub unsafe fn MPI_Buffer_detach(buffer_addr: *mut c_void, size: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(*mut c_void, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Buffer_detach\0");
-        std::mem::transmute(ptr)
-    });
-    f(buffer_addr, size)
-}
-
-pub unsafe fn MPI_Isend(
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    dest: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Recv.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Get_count(
+    ) -> unsafe extern "C" fn(*const MPI_Status, MPI_Datatype, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Get_count.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Bsend(
+    ) -> unsafe extern "C" fn(*const c_void, c_int, MPI_Datatype, c_int, c_int, MPI_Comm) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Bsend.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ssend(
+    ) -> unsafe extern "C" fn(*const c_void, c_int, MPI_Datatype, c_int, c_int, MPI_Comm) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Ssend.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Rsend(
+    ) -> unsafe extern "C" fn(*const c_void, c_int, MPI_Datatype, c_int, c_int, MPI_Comm) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Rsend.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Buffer_attach() -> unsafe extern "C" fn(*mut c_void, c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Buffer_attach.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Buffer_detach() -> unsafe extern "C" fn(*mut c_void, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Buffer_detach.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Isend() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -158,25 +1618,12 @@ pub unsafe fn MPI_Isend(
         c_int,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Isend\0");
-        std::mem::transmute(ptr)
-    });
-    f(buf, count, datatype, dest, tag, comm, request)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Isend.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Ibsend(
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    dest: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Ibsend() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -184,25 +1631,12 @@ pub unsafe fn MPI_Ibsend(
         c_int,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Ibsend\0");
-        std::mem::transmute(ptr)
-    });
-    f(buf, count, datatype, dest, tag, comm, request)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ibsend.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Issend(
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    dest: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Issend() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -210,25 +1644,12 @@ pub unsafe fn MPI_Issend(
         c_int,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Issend\0");
-        std::mem::transmute(ptr)
-    });
-    f(buf, count, datatype, dest, tag, comm, request)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Issend.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Irsend(
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    dest: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Irsend() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -236,25 +1657,12 @@ pub unsafe fn MPI_Irsend(
         c_int,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Irsend\0");
-        std::mem::transmute(ptr)
-    });
-    f(buf, count, datatype, dest, tag, comm, request)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Irsend.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Irecv(
-    buf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    source: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Irecv() -> unsafe extern "C" fn(
         *mut c_void,
         c_int,
         MPI_Datatype,
@@ -262,331 +1670,149 @@ pub unsafe fn MPI_Irecv(
         c_int,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Irecv\0");
-        std::mem::transmute(ptr)
-    });
-    f(buf, count, datatype, source, tag, comm, request)
-}
-
-pub unsafe fn MPI_Wait(request: *mut MPI_Request, status: *mut MPI_Status) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Request, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Wait\0");
-        std::mem::transmute(ptr)
-    });
-    f(request, status)
-}
-
-pub unsafe fn MPI_Test(
-    request: *mut MPI_Request,
-    flag: *mut c_int,
-    status: *mut MPI_Status,
-) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Request, *mut c_int, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Test\0");
-        std::mem::transmute(ptr)
-    });
-    f(request, flag, status)
-}
-
-pub unsafe fn MPI_Request_free(request: *mut MPI_Request) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Request) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Request_free\0");
-        std::mem::transmute(ptr)
-    });
-    f(request)
-}
-
-pub unsafe fn MPI_Waitany(
-    count: c_int,
-    array_of_requests: *mut MPI_Request,
-    index: *mut c_int,
-    status: *mut MPI_Status,
-) -> c_int {
-    type F = unsafe extern "C" fn(c_int, *mut MPI_Request, *mut c_int, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Waitany\0");
-        std::mem::transmute(ptr)
-    });
-    f(count, array_of_requests, index, status)
-}
-
-pub unsafe fn MPI_Testany(
-    count: c_int,
-    array_of_requests: *mut MPI_Request,
-    index: *mut c_int,
-    flag: *mut c_int,
-    status: *mut MPI_Status,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Irecv.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Wait() -> unsafe extern "C" fn(*mut MPI_Request, *mut MPI_Status) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Wait.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Test(
+    ) -> unsafe extern "C" fn(*mut MPI_Request, *mut c_int, *mut MPI_Status) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Test.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Request_free() -> unsafe extern "C" fn(*mut MPI_Request) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Request_free.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Waitany(
+    ) -> unsafe extern "C" fn(c_int, *mut MPI_Request, *mut c_int, *mut MPI_Status) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Waitany.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Testany() -> unsafe extern "C" fn(
         c_int,
         *mut MPI_Request,
         *mut c_int,
         *mut c_int,
         *mut MPI_Status,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Testany\0");
-        std::mem::transmute(ptr)
-    });
-    f(count, array_of_requests, index, flag, status)
-}
-
-pub unsafe fn MPI_Waitall(
-    count: c_int,
-    array_of_requests: *mut MPI_Request,
-    array_of_statuses: *mut MPI_Status,
-) -> c_int {
-    type F = unsafe extern "C" fn(c_int, *mut MPI_Request, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Waitall\0");
-        std::mem::transmute(ptr)
-    });
-    f(count, array_of_requests, array_of_statuses)
-}
-
-pub unsafe fn MPI_Testall(
-    count: c_int,
-    array_of_requests: *mut MPI_Request,
-    flag: *mut c_int,
-    array_of_statuses: *mut MPI_Status,
-) -> c_int {
-    type F = unsafe extern "C" fn(c_int, *mut MPI_Request, *mut c_int, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Testall\0");
-        std::mem::transmute(ptr)
-    });
-    f(count, array_of_requests, flag, array_of_statuses)
-}
-
-pub unsafe fn MPI_Waitsome(
-    incount: c_int,
-    array_of_requests: *mut MPI_Request,
-    outcount: *mut c_int,
-    array_of_indices: *mut c_int,
-    array_of_statuses: *mut MPI_Status,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Testany.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Waitall(
+    ) -> unsafe extern "C" fn(c_int, *mut MPI_Request, *mut MPI_Status) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Waitall.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Testall(
+    ) -> unsafe extern "C" fn(c_int, *mut MPI_Request, *mut c_int, *mut MPI_Status) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Testall.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Waitsome() -> unsafe extern "C" fn(
         c_int,
         *mut MPI_Request,
         *mut c_int,
         *mut c_int,
         *mut MPI_Status,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Waitsome\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        incount,
-        array_of_requests,
-        outcount,
-        array_of_indices,
-        array_of_statuses,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Waitsome.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Testsome(
-    incount: c_int,
-    array_of_requests: *mut MPI_Request,
-    outcount: *mut c_int,
-    array_of_indices: *mut c_int,
-    array_of_statuses: *mut MPI_Status,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Testsome() -> unsafe extern "C" fn(
         c_int,
         *mut MPI_Request,
         *mut c_int,
         *mut c_int,
         *mut MPI_Status,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Testsome\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        incount,
-        array_of_requests,
-        outcount,
-        array_of_indices,
-        array_of_statuses,
-    )
-}
-
-pub unsafe fn MPI_Request_get_status(
-    request: MPI_Request,
-    flag: *mut c_int,
-    status: *mut MPI_Status,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Request, *mut c_int, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Request_get_status\0");
-        std::mem::transmute(ptr)
-    });
-    f(request, flag, status)
-}
-
-pub unsafe fn MPI_Iprobe(
-    source: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-    flag: *mut c_int,
-    status: *mut MPI_Status,
-) -> c_int {
-    type F = unsafe extern "C" fn(c_int, c_int, MPI_Comm, *mut c_int, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Iprobe\0");
-        std::mem::transmute(ptr)
-    });
-    f(source, tag, comm, flag, status)
-}
-
-pub unsafe fn MPI_Probe(
-    source: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-    status: *mut MPI_Status,
-) -> c_int {
-    type F = unsafe extern "C" fn(c_int, c_int, MPI_Comm, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Probe\0");
-        std::mem::transmute(ptr)
-    });
-    f(source, tag, comm, status)
-}
-
-pub unsafe fn MPI_Improbe(
-    source: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-    flag: *mut c_int,
-    message: *mut MPI_Message,
-    status: *mut MPI_Status,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Testsome.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Request_get_status(
+    ) -> unsafe extern "C" fn(MPI_Request, *mut c_int, *mut MPI_Status) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Request_get_status.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Iprobe(
+    ) -> unsafe extern "C" fn(c_int, c_int, MPI_Comm, *mut c_int, *mut MPI_Status) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Iprobe.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Probe(
+    ) -> unsafe extern "C" fn(c_int, c_int, MPI_Comm, *mut MPI_Status) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Probe.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Improbe() -> unsafe extern "C" fn(
         c_int,
         c_int,
         MPI_Comm,
         *mut c_int,
         *mut MPI_Message,
         *mut MPI_Status,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Improbe\0");
-        std::mem::transmute(ptr)
-    });
-    f(source, tag, comm, flag, message, status)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Improbe.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Mprobe(
+    ) -> unsafe extern "C" fn(c_int, c_int, MPI_Comm, *mut MPI_Message, *mut MPI_Status) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Mprobe.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Mrecv() -> unsafe extern "C" fn(
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        *mut MPI_Message,
+        *mut MPI_Status,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Mrecv.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Mprobe(
-    source: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-    message: *mut MPI_Message,
-    status: *mut MPI_Status,
-) -> c_int {
-    type F =
-        unsafe extern "C" fn(c_int, c_int, MPI_Comm, *mut MPI_Message, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Mprobe\0");
-        std::mem::transmute(ptr)
-    });
-    f(source, tag, comm, message, status)
-}
-
-pub unsafe fn MPI_Mrecv(
-    buf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    message: *mut MPI_Message,
-    status: *mut MPI_Status,
-) -> c_int {
-    type F = unsafe extern "C" fn(
-        *mut c_void,
-        c_int,
-        MPI_Datatype,
-        *mut MPI_Message,
-        *mut MPI_Status,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Mrecv\0");
-        std::mem::transmute(ptr)
-    });
-    f(buf, count, datatype, message, status)
-}
-
-pub unsafe fn MPI_Imrecv(
-    buf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    message: *mut MPI_Message,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Imrecv() -> unsafe extern "C" fn(
         *mut c_void,
         c_int,
         MPI_Datatype,
         *mut MPI_Message,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Imrecv\0");
-        std::mem::transmute(ptr)
-    });
-    f(buf, count, datatype, message, request)
-}
-
-pub unsafe fn MPI_Cancel(request: *mut MPI_Request) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Request) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Cancel\0");
-        std::mem::transmute(ptr)
-    });
-    f(request)
-}
-
-pub unsafe fn MPI_Test_cancelled(status: *const MPI_Status, flag: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(*const MPI_Status, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Test_cancelled\0");
-        std::mem::transmute(ptr)
-    });
-    f(status, flag)
-}
-
-pub unsafe fn MPI_Send_init(
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    dest: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Imrecv.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Cancel() -> unsafe extern "C" fn(*mut MPI_Request) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Cancel.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Test_cancelled(
+    ) -> unsafe extern "C" fn(*const MPI_Status, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Test_cancelled.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Send_init() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -594,25 +1820,12 @@ pub unsafe fn MPI_Send_init(
         c_int,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Send_init\0");
-        std::mem::transmute(ptr)
-    });
-    f(buf, count, datatype, dest, tag, comm, request)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Send_init.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Bsend_init(
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    dest: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Bsend_init() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -620,25 +1833,12 @@ pub unsafe fn MPI_Bsend_init(
         c_int,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Bsend_init\0");
-        std::mem::transmute(ptr)
-    });
-    f(buf, count, datatype, dest, tag, comm, request)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Bsend_init.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Ssend_init(
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    dest: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Ssend_init() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -646,25 +1846,12 @@ pub unsafe fn MPI_Ssend_init(
         c_int,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Ssend_init\0");
-        std::mem::transmute(ptr)
-    });
-    f(buf, count, datatype, dest, tag, comm, request)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ssend_init.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Rsend_init(
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    dest: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Rsend_init() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -672,25 +1859,12 @@ pub unsafe fn MPI_Rsend_init(
         c_int,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Rsend_init\0");
-        std::mem::transmute(ptr)
-    });
-    f(buf, count, datatype, dest, tag, comm, request)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Rsend_init.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Recv_init(
-    buf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    source: c_int,
-    tag: c_int,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Recv_init() -> unsafe extern "C" fn(
         *mut c_void,
         c_int,
         MPI_Datatype,
@@ -698,50 +1872,22 @@ pub unsafe fn MPI_Recv_init(
         c_int,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Recv_init\0");
-        std::mem::transmute(ptr)
-    });
-    f(buf, count, datatype, source, tag, comm, request)
-}
-
-pub unsafe fn MPI_Start(request: *mut MPI_Request) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Request) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Start\0");
-        std::mem::transmute(ptr)
-    });
-    f(request)
-}
-
-pub unsafe fn MPI_Startall(count: c_int, array_of_requests: *mut MPI_Request) -> c_int {
-    type F = unsafe extern "C" fn(c_int, *mut MPI_Request) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Startall\0");
-        std::mem::transmute(ptr)
-    });
-    f(count, array_of_requests)
-}
-
-pub unsafe fn MPI_Sendrecv(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    sendtype: MPI_Datatype,
-    dest: c_int,
-    sendtag: c_int,
-    recvbuf: *mut c_void,
-    recvcount: c_int,
-    recvtype: MPI_Datatype,
-    source: c_int,
-    recvtag: c_int,
-    comm: MPI_Comm,
-    status: *mut MPI_Status,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Recv_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Start() -> unsafe extern "C" fn(*mut MPI_Request) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Start.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Startall() -> unsafe extern "C" fn(c_int, *mut MPI_Request) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Startall.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Sendrecv() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -754,30 +1900,12 @@ pub unsafe fn MPI_Sendrecv(
         c_int,
         MPI_Comm,
         *mut MPI_Status,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Sendrecv\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, sendtype, dest, sendtag, recvbuf, recvcount, recvtype, source, recvtag,
-        comm, status,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Sendrecv.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Sendrecv_replace(
-    buf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    dest: c_int,
-    sendtag: c_int,
-    source: c_int,
-    recvtag: c_int,
-    comm: MPI_Comm,
-    status: *mut MPI_Status,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Sendrecv_replace() -> unsafe extern "C" fn(
         *mut c_void,
         c_int,
         MPI_Datatype,
@@ -787,261 +1915,102 @@ pub unsafe fn MPI_Sendrecv_replace(
         c_int,
         MPI_Comm,
         *mut MPI_Status,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Sendrecv_replace\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        buf, count, datatype, dest, sendtag, source, recvtag, comm, status,
-    )
-}
-
-pub unsafe fn MPI_Type_contiguous(
-    count: c_int,
-    oldtype: MPI_Datatype,
-    newtype: *mut MPI_Datatype,
-) -> c_int {
-    type F = unsafe extern "C" fn(c_int, MPI_Datatype, *mut MPI_Datatype) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_contiguous\0");
-        std::mem::transmute(ptr)
-    });
-    f(count, oldtype, newtype)
-}
-
-pub unsafe fn MPI_Type_vector(
-    count: c_int,
-    blocklength: c_int,
-    stride: c_int,
-    oldtype: MPI_Datatype,
-    newtype: *mut MPI_Datatype,
-) -> c_int {
-    type F = unsafe extern "C" fn(c_int, c_int, c_int, MPI_Datatype, *mut MPI_Datatype) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_vector\0");
-        std::mem::transmute(ptr)
-    });
-    f(count, blocklength, stride, oldtype, newtype)
-}
-
-pub unsafe fn MPI_Type_create_hvector(
-    count: c_int,
-    blocklength: c_int,
-    stride: MPI_Aint,
-    oldtype: MPI_Datatype,
-    newtype: *mut MPI_Datatype,
-) -> c_int {
-    type F = unsafe extern "C" fn(c_int, c_int, MPI_Aint, MPI_Datatype, *mut MPI_Datatype) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_create_hvector\0");
-        std::mem::transmute(ptr)
-    });
-    f(count, blocklength, stride, oldtype, newtype)
-}
-
-pub unsafe fn MPI_Type_indexed(
-    count: c_int,
-    array_of_blocklengths: *const c_int,
-    array_of_displacements: *const c_int,
-    oldtype: MPI_Datatype,
-    newtype: *mut MPI_Datatype,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Sendrecv_replace.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_contiguous(
+    ) -> unsafe extern "C" fn(c_int, MPI_Datatype, *mut MPI_Datatype) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_contiguous.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_vector(
+    ) -> unsafe extern "C" fn(c_int, c_int, c_int, MPI_Datatype, *mut MPI_Datatype) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_vector.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_create_hvector(
+    ) -> unsafe extern "C" fn(c_int, c_int, MPI_Aint, MPI_Datatype, *mut MPI_Datatype) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Type_create_hvector.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_indexed() -> unsafe extern "C" fn(
         c_int,
         *const c_int,
         *const c_int,
         MPI_Datatype,
         *mut MPI_Datatype,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_indexed\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        count,
-        array_of_blocklengths,
-        array_of_displacements,
-        oldtype,
-        newtype,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_indexed.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Type_create_hindexed(
-    count: c_int,
-    array_of_blocklengths: *const c_int,
-    array_of_displacements: *const MPI_Aint,
-    oldtype: MPI_Datatype,
-    newtype: *mut MPI_Datatype,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Type_create_hindexed() -> unsafe extern "C" fn(
         c_int,
         *const c_int,
         *const MPI_Aint,
         MPI_Datatype,
         *mut MPI_Datatype,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_create_hindexed\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        count,
-        array_of_blocklengths,
-        array_of_displacements,
-        oldtype,
-        newtype,
-    )
-}
-
-pub unsafe fn MPI_Type_create_indexed_block(
-    count: c_int,
-    blocklength: c_int,
-    array_of_displacements: *const c_int,
-    oldtype: MPI_Datatype,
-    newtype: *mut MPI_Datatype,
-) -> c_int {
-    type F =
-        unsafe extern "C" fn(c_int, c_int, *const c_int, MPI_Datatype, *mut MPI_Datatype) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_create_indexed_block\0");
-        std::mem::transmute(ptr)
-    });
-    f(count, blocklength, array_of_displacements, oldtype, newtype)
-}
-
-pub unsafe fn MPI_Type_create_hindexed_block(
-    count: c_int,
-    blocklength: c_int,
-    array_of_displacements: *const MPI_Aint,
-    oldtype: MPI_Datatype,
-    newtype: *mut MPI_Datatype,
-) -> c_int {
-    type F = unsafe extern "C" fn(
-        c_int,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_create_hindexed.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_create_indexed_block(
+    ) -> unsafe extern "C" fn(c_int, c_int, *const c_int, MPI_Datatype, *mut MPI_Datatype) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Type_create_indexed_block.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_create_hindexed_block(
+    ) -> unsafe extern "C" fn(c_int, c_int, *const MPI_Aint, MPI_Datatype, *mut MPI_Datatype) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Type_create_hindexed_block.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_create_struct() -> unsafe extern "C" fn(
         c_int,
+        *const c_int,
         *const MPI_Aint,
-        MPI_Datatype,
+        *const MPI_Datatype,
         *mut MPI_Datatype,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_create_hindexed_block\0");
-        std::mem::transmute(ptr)
-    });
-    f(count, blocklength, array_of_displacements, oldtype, newtype)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_create_struct.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Type_create_struct(
-    count: c_int,
-    array_of_blocklengths: *const c_int,
-    array_of_displacements: *const MPI_Aint,
-    array_of_types: *const MPI_Datatype,
-    newtype: *mut MPI_Datatype,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Type_struct() -> unsafe extern "C" fn(
         c_int,
         *const c_int,
         *const MPI_Aint,
         *const MPI_Datatype,
         *mut MPI_Datatype,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_create_struct\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        count,
-        array_of_blocklengths,
-        array_of_displacements,
-        array_of_types,
-        newtype,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_struct.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Type_struct(
-    count: c_int,
-    array_of_blocklengths: *const c_int,
-    array_of_displacements: *const MPI_Aint,
-    array_of_types: *const MPI_Datatype,
-    newtype: *mut MPI_Datatype,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Type_create_subarray() -> unsafe extern "C" fn(
         c_int,
         *const c_int,
-        *const MPI_Aint,
-        *const MPI_Datatype,
+        *const c_int,
+        *const c_int,
+        c_int,
+        MPI_Datatype,
         *mut MPI_Datatype,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_struct\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        count,
-        array_of_blocklengths,
-        array_of_displacements,
-        array_of_types,
-        newtype,
-    )
-}
-
-pub unsafe fn MPI_Type_create_subarray(
-    ndims: c_int,
-    array_of_sizes: *const c_int,
-    array_of_subsizes: *const c_int,
-    array_of_starts: *const c_int,
-    ordder: c_int,
-    oldtype: MPI_Datatype,
-    newtype: *mut MPI_Datatype,
-) -> c_int {
-    type F = unsafe extern "C" fn(
-        c_int,
-        *const c_int,
-        *const c_int,
-        *const c_int,
-        c_int,
-        MPI_Datatype,
-        *mut MPI_Datatype,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_create_subarray\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        ndims,
-        array_of_sizes,
-        array_of_subsizes,
-        array_of_starts,
-        ordder,
-        oldtype,
-        newtype,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_create_subarray.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Type_create_darray(
-    size: c_int,
-    rank: c_int,
-    ndims: c_int,
-    array_of_gsizes: *const c_int,
-    array_of_distribs: *const c_int,
-    array_of_dargs: *const c_int,
-    array_of_psizes: *const c_int,
-    order: c_int,
-    oldtype: MPI_Datatype,
-    newtype: *mut MPI_Datatype,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Type_create_darray() -> unsafe extern "C" fn(
         c_int,
         c_int,
         c_int,
@@ -1052,238 +2021,101 @@ pub unsafe fn MPI_Type_create_darray(
         c_int,
         MPI_Datatype,
         *mut MPI_Datatype,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_create_darray\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        size,
-        rank,
-        ndims,
-        array_of_gsizes,
-        array_of_distribs,
-        array_of_dargs,
-        array_of_psizes,
-        order,
-        oldtype,
-        newtype,
-    )
-}
-
-pub unsafe fn MPI_Get_address(location: *const c_void, address: *mut MPI_Aint) -> c_int {
-    type F = unsafe extern "C" fn(*const c_void, *mut MPI_Aint) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Get_address\0");
-        std::mem::transmute(ptr)
-    });
-    f(location, address)
-}
-
-pub unsafe fn MPI_Aint_add(base: MPI_Aint, disp: MPI_Aint) -> MPI_Aint {
-    type F = unsafe extern "C" fn(MPI_Aint, MPI_Aint) -> MPI_Aint;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Aint_add\0");
-        std::mem::transmute(ptr)
-    });
-    f(base, disp)
-}
-
-pub unsafe fn MPI_Aint_diff(addr1: MPI_Aint, addr2: MPI_Aint) -> MPI_Aint {
-    type F = unsafe extern "C" fn(MPI_Aint, MPI_Aint) -> MPI_Aint;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Aint_diff\0");
-        std::mem::transmute(ptr)
-    });
-    f(addr1, addr2)
-}
-
-pub unsafe fn MPI_Type_size(datatype: MPI_Datatype, size: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Datatype, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_size\0");
-        std::mem::transmute(ptr)
-    });
-    f(datatype, size)
-}
-
-pub unsafe fn MPI_Type_size_x(datatype: MPI_Datatype, size: *mut MPI_Count) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Datatype, *mut MPI_Count) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_size_x\0");
-        std::mem::transmute(ptr)
-    });
-    f(datatype, size)
-}
-
-pub unsafe fn MPI_Type_get_extent(
-    datatype: MPI_Datatype,
-    lb: *mut MPI_Aint,
-    extent: *mut MPI_Aint,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Datatype, *mut MPI_Aint, *mut MPI_Aint) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_get_extent\0");
-        std::mem::transmute(ptr)
-    });
-    f(datatype, lb, extent)
-}
-
-pub unsafe fn MPI_Type_get_extent_x(
-    datatype: MPI_Datatype,
-    lb: *mut MPI_Count,
-    extent: *mut MPI_Count,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Datatype, *mut MPI_Count, *mut MPI_Count) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_get_extent_x\0");
-        std::mem::transmute(ptr)
-    });
-    f(datatype, lb, extent)
-}
-
-pub unsafe fn MPI_Type_create_resized(
-    oldtype: MPI_Datatype,
-    lb: MPI_Aint,
-    extent: MPI_Aint,
-    newtype: *mut MPI_Datatype,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Datatype, MPI_Aint, MPI_Aint, *mut MPI_Datatype) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_create_resized\0");
-        std::mem::transmute(ptr)
-    });
-    f(oldtype, lb, extent, newtype)
-}
-
-pub unsafe fn MPI_Type_get_true_extent(
-    datatype: MPI_Datatype,
-    true_lb: *mut MPI_Aint,
-    true_extent: *mut MPI_Aint,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Datatype, *mut MPI_Aint, *mut MPI_Aint) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_get_true_extent\0");
-        std::mem::transmute(ptr)
-    });
-    f(datatype, true_lb, true_extent)
-}
-
-pub unsafe fn MPI_Type_get_true_extent_x(
-    datatype: MPI_Datatype,
-    true_lb: *mut MPI_Count,
-    true_extent: *mut MPI_Count,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Datatype, *mut MPI_Count, *mut MPI_Count) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_get_true_extent_x\0");
-        std::mem::transmute(ptr)
-    });
-    f(datatype, true_lb, true_extent)
-}
-
-pub unsafe fn MPI_Type_commit(datatype: *mut MPI_Datatype) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Datatype) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_commit\0");
-        std::mem::transmute(ptr)
-    });
-    f(datatype)
-}
-
-pub unsafe fn MPI_Type_free(datatype: *mut MPI_Datatype) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Datatype) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_free\0");
-        std::mem::transmute(ptr)
-    });
-    f(datatype)
-}
-
-pub unsafe fn MPI_Type_dup(oldtype: MPI_Datatype, newtype: *mut MPI_Datatype) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Datatype, *mut MPI_Datatype) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_dup\0");
-        std::mem::transmute(ptr)
-    });
-    f(oldtype, newtype)
-}
-
-pub unsafe fn MPI_Get_elements(
-    status: *const MPI_Status,
-    datatype: MPI_Datatype,
-    count: *mut c_int,
-) -> c_int {
-    type F = unsafe extern "C" fn(*const MPI_Status, MPI_Datatype, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Get_elements\0");
-        std::mem::transmute(ptr)
-    });
-    f(status, datatype, count)
-}
-
-pub unsafe fn MPI_Get_elements_x(
-    status: *const MPI_Status,
-    datatype: MPI_Datatype,
-    count: *mut MPI_Count,
-) -> c_int {
-    type F = unsafe extern "C" fn(*const MPI_Status, MPI_Datatype, *mut MPI_Count) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Get_elements_x\0");
-        std::mem::transmute(ptr)
-    });
-    f(status, datatype, count)
-}
-
-pub unsafe fn MPI_Type_get_envelope(
-    datatype: MPI_Datatype,
-    num_integers: *mut c_int,
-    num_addresses: *mut c_int,
-    num_datatypes: *mut c_int,
-    combiner: *mut c_int,
-) -> c_int {
-    type F =
-        unsafe extern "C" fn(MPI_Datatype, *mut c_int, *mut c_int, *mut c_int, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_get_envelope\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        datatype,
-        num_integers,
-        num_addresses,
-        num_datatypes,
-        combiner,
-    )
-}
-
-pub unsafe fn MPI_Type_get_contents(
-    datatype: MPI_Datatype,
-    max_integers: c_int,
-    max_addresses: c_int,
-    max_datatypes: c_int,
-    array_of_integers: *mut c_int,
-    array_of_addresses: *mut MPI_Aint,
-    array_of_datatypes: *mut MPI_Datatype,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_create_darray.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Get_address() -> unsafe extern "C" fn(*const c_void, *mut MPI_Aint) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Get_address.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Aint_add() -> unsafe extern "C" fn(MPI_Aint, MPI_Aint) -> MPI_Aint {
+        unsafe { mem::transmute(TABLE.MPI_Aint_add.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Aint_diff() -> unsafe extern "C" fn(MPI_Aint, MPI_Aint) -> MPI_Aint {
+        unsafe { mem::transmute(TABLE.MPI_Aint_diff.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_size() -> unsafe extern "C" fn(MPI_Datatype, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_size.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_size_x() -> unsafe extern "C" fn(MPI_Datatype, *mut MPI_Count) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_size_x.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_get_extent(
+    ) -> unsafe extern "C" fn(MPI_Datatype, *mut MPI_Aint, *mut MPI_Aint) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_get_extent.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_get_extent_x(
+    ) -> unsafe extern "C" fn(MPI_Datatype, *mut MPI_Count, *mut MPI_Count) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_get_extent_x.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_create_resized(
+    ) -> unsafe extern "C" fn(MPI_Datatype, MPI_Aint, MPI_Aint, *mut MPI_Datatype) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_create_resized.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_get_true_extent(
+    ) -> unsafe extern "C" fn(MPI_Datatype, *mut MPI_Aint, *mut MPI_Aint) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_get_true_extent.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_get_true_extent_x(
+    ) -> unsafe extern "C" fn(MPI_Datatype, *mut MPI_Count, *mut MPI_Count) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_get_true_extent_x.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_commit() -> unsafe extern "C" fn(*mut MPI_Datatype) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_commit.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_free() -> unsafe extern "C" fn(*mut MPI_Datatype) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_free.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_dup() -> unsafe extern "C" fn(MPI_Datatype, *mut MPI_Datatype) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_dup.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Get_elements(
+    ) -> unsafe extern "C" fn(*const MPI_Status, MPI_Datatype, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Get_elements.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Get_elements_x(
+    ) -> unsafe extern "C" fn(*const MPI_Status, MPI_Datatype, *mut MPI_Count) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Get_elements_x.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_get_envelope(
+    ) -> unsafe extern "C" fn(MPI_Datatype, *mut c_int, *mut c_int, *mut c_int, *mut c_int) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Type_get_envelope.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_get_contents() -> unsafe extern "C" fn(
         MPI_Datatype,
         c_int,
         c_int,
@@ -1291,33 +2123,12 @@ pub unsafe fn MPI_Type_get_contents(
         *mut c_int,
         *mut MPI_Aint,
         *mut MPI_Datatype,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_get_contents\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        datatype,
-        max_integers,
-        max_addresses,
-        max_datatypes,
-        array_of_integers,
-        array_of_addresses,
-        array_of_datatypes,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_get_contents.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Pack(
-    inbuf: *const c_void,
-    incount: c_int,
-    datatype: MPI_Datatype,
-    outbuf: *mut c_void,
-    outsize: c_int,
-    position: *mut c_int,
-    comm: MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Pack() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -1325,25 +2136,12 @@ pub unsafe fn MPI_Pack(
         c_int,
         *mut c_int,
         MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Pack\0");
-        std::mem::transmute(ptr)
-    });
-    f(inbuf, incount, datatype, outbuf, outsize, position, comm)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Pack.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Unpack(
-    inbuf: *const c_void,
-    insize: c_int,
-    position: *mut c_int,
-    outbuf: *mut c_void,
-    outcount: c_int,
-    datatype: MPI_Datatype,
-    comm: MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Unpack() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         *mut c_int,
@@ -1351,40 +2149,18 @@ pub unsafe fn MPI_Unpack(
         c_int,
         MPI_Datatype,
         MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Unpack\0");
-        std::mem::transmute(ptr)
-    });
-    f(inbuf, insize, position, outbuf, outcount, datatype, comm)
-}
-
-pub unsafe fn MPI_Pack_size(
-    incount: c_int,
-    datatype: MPI_Datatype,
-    comm: MPI_Comm,
-    size: *mut c_int,
-) -> c_int {
-    type F = unsafe extern "C" fn(c_int, MPI_Datatype, MPI_Comm, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Pack_size\0");
-        std::mem::transmute(ptr)
-    });
-    f(incount, datatype, comm, size)
-}
-
-pub unsafe fn MPI_Pack_external(
-    datarep: *const c_char,
-    inbuf: *const c_void,
-    incount: c_int,
-    datatype: MPI_Datatype,
-    outbuf: *mut c_void,
-    outsize: MPI_Aint,
-    position: *mut MPI_Aint,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Unpack.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Pack_size(
+    ) -> unsafe extern "C" fn(c_int, MPI_Datatype, MPI_Comm, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Pack_size.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Pack_external() -> unsafe extern "C" fn(
         *const c_char,
         *const c_void,
         c_int,
@@ -1392,25 +2168,12 @@ pub unsafe fn MPI_Pack_external(
         *mut c_void,
         MPI_Aint,
         *mut MPI_Aint,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Pack_external\0");
-        std::mem::transmute(ptr)
-    });
-    f(datarep, inbuf, incount, datatype, outbuf, outsize, position)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Pack_external.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Unpack_external(
-    datarep: *const c_char,
-    inbuf: *const c_void,
-    insize: MPI_Aint,
-    position: *mut MPI_Aint,
-    outbuf: *mut c_void,
-    outcount: c_int,
-    datatype: MPI_Datatype,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Unpack_external() -> unsafe extern "C" fn(
         *const c_char,
         *const c_void,
         MPI_Aint,
@@ -1418,98 +2181,43 @@ pub unsafe fn MPI_Unpack_external(
         *mut c_void,
         c_int,
         MPI_Datatype,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Unpack_external\0");
-        std::mem::transmute(ptr)
-    });
-    f(datarep, inbuf, insize, position, outbuf, outcount, datatype)
-}
-
-pub unsafe fn MPI_Pack_external_size(
-    datarep: *const c_char,
-    incount: c_int,
-    datatype: MPI_Datatype,
-    size: *mut MPI_Aint,
-) -> c_int {
-    type F = unsafe extern "C" fn(*const c_char, c_int, MPI_Datatype, *mut MPI_Aint) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Pack_external_size\0");
-        std::mem::transmute(ptr)
-    });
-    f(datarep, incount, datatype, size)
-}
-
-pub unsafe fn MPI_Barrier(comm: MPI_Comm) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Barrier\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Unpack_external.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Pack_external_size(
+    ) -> unsafe extern "C" fn(*const c_char, c_int, MPI_Datatype, *mut MPI_Aint) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Pack_external_size.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Barrier() -> unsafe extern "C" fn(MPI_Comm) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Barrier.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Bcast(
+    ) -> unsafe extern "C" fn(*mut c_void, c_int, MPI_Datatype, c_int, MPI_Comm) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Bcast.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Gather() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Gather.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Bcast(
-    buffer: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    root: c_int,
-    comm: MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(*mut c_void, c_int, MPI_Datatype, c_int, MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Bcast\0");
-        std::mem::transmute(ptr)
-    });
-    f(buffer, count, datatype, root, comm)
-}
-
-pub unsafe fn MPI_Gather(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcount: c_int,
-    recvtype: MPI_Datatype,
-    root: c_int,
-    comm: MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut c_void,
-        c_int,
-        MPI_Datatype,
-        c_int,
-        MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Gather\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm,
-    )
-}
-
-pub unsafe fn MPI_Gatherv(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcounts: *const c_int,
-    displs: *const c_int,
-    recvtype: MPI_Datatype,
-    root: c_int,
-    comm: MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Gatherv() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -1519,28 +2227,12 @@ pub unsafe fn MPI_Gatherv(
         MPI_Datatype,
         c_int,
         MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Gatherv\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, root, comm,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Gatherv.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Scatter(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcount: c_int,
-    recvtype: MPI_Datatype,
-    root: c_int,
-    comm: MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Scatter() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -1549,29 +2241,12 @@ pub unsafe fn MPI_Scatter(
         MPI_Datatype,
         c_int,
         MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Scatter\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Scatter.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Scatterv(
-    sendbuf: *const c_void,
-    sendcounts: *const c_int,
-    displs: *const c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcount: c_int,
-    recvtype: MPI_Datatype,
-    root: c_int,
-    comm: MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Scatterv() -> unsafe extern "C" fn(
         *const c_void,
         *const c_int,
         *const c_int,
@@ -1581,27 +2256,12 @@ pub unsafe fn MPI_Scatterv(
         MPI_Datatype,
         c_int,
         MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Scatterv\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcounts, displs, sendtype, recvbuf, recvcount, recvtype, root, comm,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Scatterv.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Allgather(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcount: c_int,
-    recvtype: MPI_Datatype,
-    comm: MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Allgather() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -1609,28 +2269,12 @@ pub unsafe fn MPI_Allgather(
         c_int,
         MPI_Datatype,
         MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Allgather\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Allgather.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Allgatherv(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcounts: *const c_int,
-    displs: *const c_int,
-    recvtype: MPI_Datatype,
-    comm: MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Allgatherv() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -1639,27 +2283,12 @@ pub unsafe fn MPI_Allgatherv(
         *const c_int,
         MPI_Datatype,
         MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Allgatherv\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Allgatherv.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Alltoall(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcount: c_int,
-    recvtype: MPI_Datatype,
-    comm: MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Alltoall() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -1667,29 +2296,12 @@ pub unsafe fn MPI_Alltoall(
         c_int,
         MPI_Datatype,
         MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Alltoall\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Alltoall.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Alltoallv(
-    sendbuf: *const c_void,
-    sendcounts: *const c_int,
-    sdispls: *const c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcounts: *const c_int,
-    rdispls: *const c_int,
-    recvtype: MPI_Datatype,
-    comm: MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Alltoallv() -> unsafe extern "C" fn(
         *const c_void,
         *const c_int,
         *const c_int,
@@ -1699,29 +2311,12 @@ pub unsafe fn MPI_Alltoallv(
         *const c_int,
         MPI_Datatype,
         MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Alltoallv\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcounts, sdispls, sendtype, recvbuf, recvcounts, rdispls, recvtype, comm,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Alltoallv.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Alltoallw(
-    sendbuf: *const c_void,
-    sendcounts: *const c_int,
-    sdispls: *const c_int,
-    sendtypes: *const MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcounts: *const c_int,
-    rdispls: *const c_int,
-    recvtypes: *const MPI_Datatype,
-    comm: MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Alltoallw() -> unsafe extern "C" fn(
         *const c_void,
         *const c_int,
         *const c_int,
@@ -1731,27 +2326,12 @@ pub unsafe fn MPI_Alltoallw(
         *const c_int,
         *const MPI_Datatype,
         MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Alltoallw\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Alltoallw.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Reduce(
-    sendbuf: *const c_void,
-    recvbuf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    op: MPI_Op,
-    root: c_int,
-    comm: MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Reduce() -> unsafe extern "C" fn(
         *const c_void,
         *mut c_void,
         c_int,
@@ -1759,227 +2339,112 @@ pub unsafe fn MPI_Reduce(
         MPI_Op,
         c_int,
         MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Reduce\0");
-        std::mem::transmute(ptr)
-    });
-    f(sendbuf, recvbuf, count, datatype, op, root, comm)
-}
-
-pub unsafe fn MPI_Op_create(user_fn: MPI_User_function, commute: c_int, op: *mut MPI_Op) -> c_int {
-    type F = unsafe extern "C" fn(MPI_User_function, c_int, *mut MPI_Op) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Op_create\0");
-        std::mem::transmute(ptr)
-    });
-    f(user_fn, commute, op)
-}
-
-pub unsafe fn MPI_Op_free(op: *mut MPI_Op) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Op) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Op_free\0");
-        std::mem::transmute(ptr)
-    });
-    f(op)
-}
-
-pub unsafe fn MPI_Allreduce(
-    sendbuf: *const c_void,
-    recvbuf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    op: MPI_Op,
-    comm: MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Reduce.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Op_create(
+    ) -> unsafe extern "C" fn(MPI_User_function, c_int, *mut MPI_Op) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Op_create.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Op_free() -> unsafe extern "C" fn(*mut MPI_Op) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Op_free.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Allreduce() -> unsafe extern "C" fn(
         *const c_void,
         *mut c_void,
         c_int,
         MPI_Datatype,
         MPI_Op,
         MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Allreduce\0");
-        std::mem::transmute(ptr)
-    });
-    f(sendbuf, recvbuf, count, datatype, op, comm)
-}
-
-pub unsafe fn MPI_Op_commutative(op: MPI_Op, commute: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Op, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Op_commutative\0");
-        std::mem::transmute(ptr)
-    });
-    f(op, commute)
-}
-
-pub unsafe fn MPI_Reduce_local(
-    inbuf: *const c_void,
-    inoutbuf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    op: MPI_Op,
-) -> c_int {
-    type F = unsafe extern "C" fn(*const c_void, *mut c_void, c_int, MPI_Datatype, MPI_Op) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Reduce_local\0");
-        std::mem::transmute(ptr)
-    });
-    f(inbuf, inoutbuf, count, datatype, op)
-}
-
-pub unsafe fn MPI_Reduce_scatter_block(
-    sendbuf: *const c_void,
-    recvbuf: *mut c_void,
-    recvcount: c_int,
-    datatype: MPI_Datatype,
-    op: MPI_Op,
-    comm: MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Allreduce.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Op_commutative() -> unsafe extern "C" fn(MPI_Op, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Op_commutative.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Reduce_local(
+    ) -> unsafe extern "C" fn(*const c_void, *mut c_void, c_int, MPI_Datatype, MPI_Op) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Reduce_local.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Reduce_scatter_block() -> unsafe extern "C" fn(
         *const c_void,
         *mut c_void,
         c_int,
         MPI_Datatype,
         MPI_Op,
         MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Reduce_scatter_block\0");
-        std::mem::transmute(ptr)
-    });
-    f(sendbuf, recvbuf, recvcount, datatype, op, comm)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Reduce_scatter_block.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Reduce_scatter(
-    sendbuf: *const c_void,
-    recvbuf: *mut c_void,
-    recvcounts: *const c_int,
-    datatype: MPI_Datatype,
-    op: MPI_Op,
-    comm: MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Reduce_scatter() -> unsafe extern "C" fn(
         *const c_void,
         *mut c_void,
         *const c_int,
         MPI_Datatype,
         MPI_Op,
         MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Reduce_scatter\0");
-        std::mem::transmute(ptr)
-    });
-    f(sendbuf, recvbuf, recvcounts, datatype, op, comm)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Reduce_scatter.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Scan(
-    sendbuf: *const c_void,
-    recvbuf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    op: MPI_Op,
-    comm: MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Scan() -> unsafe extern "C" fn(
         *const c_void,
         *mut c_void,
         c_int,
         MPI_Datatype,
         MPI_Op,
         MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Scan\0");
-        std::mem::transmute(ptr)
-    });
-    f(sendbuf, recvbuf, count, datatype, op, comm)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Scan.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Exscan(
-    sendbuf: *const c_void,
-    recvbuf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    op: MPI_Op,
-    comm: MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Exscan() -> unsafe extern "C" fn(
         *const c_void,
         *mut c_void,
         c_int,
         MPI_Datatype,
         MPI_Op,
         MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Exscan\0");
-        std::mem::transmute(ptr)
-    });
-    f(sendbuf, recvbuf, count, datatype, op, comm)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Exscan.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Ibarrier(comm: MPI_Comm, request: *mut MPI_Request) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *mut MPI_Request) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Ibarrier\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, request)
-}
+    #[inline(always)]
+    pub(crate) fn MPI_Ibarrier() -> unsafe extern "C" fn(MPI_Comm, *mut MPI_Request) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ibarrier.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Ibcast(
-    buffer: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    root: c_int,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Ibcast() -> unsafe extern "C" fn(
         *mut c_void,
         c_int,
         MPI_Datatype,
         c_int,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Ibcast\0");
-        std::mem::transmute(ptr)
-    });
-    f(buffer, count, datatype, root, comm, request)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ibcast.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Igather(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcount: c_int,
-    recvtype: MPI_Datatype,
-    root: c_int,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Igather() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -1989,30 +2454,12 @@ pub unsafe fn MPI_Igather(
         c_int,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Igather\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm, request,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Igather.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Igatherv(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcounts: *const c_int,
-    displs: *const c_int,
-    recvtype: MPI_Datatype,
-    root: c_int,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Igatherv() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -2023,29 +2470,12 @@ pub unsafe fn MPI_Igatherv(
         c_int,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Igatherv\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, root, comm, request,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Igatherv.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Iscatter(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcount: c_int,
-    recvtype: MPI_Datatype,
-    root: c_int,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Iscatter() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -2055,30 +2485,12 @@ pub unsafe fn MPI_Iscatter(
         c_int,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Iscatter\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm, request,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Iscatter.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Iscatterv(
-    sendbuf: *const c_void,
-    sendcounts: *const c_int,
-    displs: *const c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcount: c_int,
-    recvtype: MPI_Datatype,
-    root: c_int,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Iscatterv() -> unsafe extern "C" fn(
         *const c_void,
         *const c_int,
         *const c_int,
@@ -2089,28 +2501,12 @@ pub unsafe fn MPI_Iscatterv(
         c_int,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Iscatterv\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcounts, displs, sendtype, recvbuf, recvcount, recvtype, root, comm, request,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Iscatterv.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Iallgather(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcount: c_int,
-    recvtype: MPI_Datatype,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Iallgather() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -2119,29 +2515,12 @@ pub unsafe fn MPI_Iallgather(
         MPI_Datatype,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Iallgather\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, request,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Iallgather.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Iallgatherv(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcounts: *const c_int,
-    displs: *const c_int,
-    recvtype: MPI_Datatype,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Iallgatherv() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -2151,28 +2530,12 @@ pub unsafe fn MPI_Iallgatherv(
         MPI_Datatype,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Iallgatherv\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm, request,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Iallgatherv.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Ialltoall(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcount: c_int,
-    recvtype: MPI_Datatype,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Ialltoall() -> unsafe extern "C" fn(
         *const c_void,
         c_int,
         MPI_Datatype,
@@ -2181,30 +2544,12 @@ pub unsafe fn MPI_Ialltoall(
         MPI_Datatype,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Ialltoall\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, request,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ialltoall.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Ialltoallv(
-    sendbuf: *const c_void,
-    sendcounts: *const c_int,
-    sdispls: *const c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcounts: *const c_int,
-    rdispls: *const c_int,
-    recvtype: MPI_Datatype,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Ialltoallv() -> unsafe extern "C" fn(
         *const c_void,
         *const c_int,
         *const c_int,
@@ -2215,31 +2560,12 @@ pub unsafe fn MPI_Ialltoallv(
         MPI_Datatype,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Ialltoallv\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcounts, sdispls, sendtype, recvbuf, recvcounts, rdispls, recvtype, comm,
-        request,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ialltoallv.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Ialltoallw(
-    sendbuf: *const c_void,
-    sendcounts: *const c_int,
-    sdispls: *const c_int,
-    sendtypes: *const MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcounts: *const c_int,
-    rdispls: *const c_int,
-    recvtypes: *const MPI_Datatype,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Ialltoallw() -> unsafe extern "C" fn(
         *const c_void,
         *const c_int,
         *const c_int,
@@ -2250,29 +2576,12 @@ pub unsafe fn MPI_Ialltoallw(
         *const MPI_Datatype,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Ialltoallw\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
-        request,
-    )
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ialltoallw.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Ireduce(
-    sendbuf: *const c_void,
-    recvbuf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    op: MPI_Op,
-    root: c_int,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Ireduce() -> unsafe extern "C" fn(
         *const c_void,
         *mut c_void,
         c_int,
@@ -2281,25 +2590,12 @@ pub unsafe fn MPI_Ireduce(
         c_int,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Ireduce\0");
-        std::mem::transmute(ptr)
-    });
-    f(sendbuf, recvbuf, count, datatype, op, root, comm, request)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ireduce.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Iallreduce(
-    sendbuf: *const c_void,
-    recvbuf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    op: MPI_Op,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Iallreduce() -> unsafe extern "C" fn(
         *const c_void,
         *mut c_void,
         c_int,
@@ -2307,25 +2603,12 @@ pub unsafe fn MPI_Iallreduce(
         MPI_Op,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Iallreduce\0");
-        std::mem::transmute(ptr)
-    });
-    f(sendbuf, recvbuf, count, datatype, op, comm, request)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Iallreduce.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Ireduce_scatter_block(
-    sendbuf: *const c_void,
-    recvbuf: *mut c_void,
-    recvcount: c_int,
-    datatype: MPI_Datatype,
-    op: MPI_Op,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Ireduce_scatter_block() -> unsafe extern "C" fn(
         *const c_void,
         *mut c_void,
         c_int,
@@ -2333,25 +2616,12 @@ pub unsafe fn MPI_Ireduce_scatter_block(
         MPI_Op,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Ireduce_scatter_block\0");
-        std::mem::transmute(ptr)
-    });
-    f(sendbuf, recvbuf, recvcount, datatype, op, comm, request)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ireduce_scatter_block.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Ireduce_scatter(
-    sendbuf: *const c_void,
-    recvbuf: *mut c_void,
-    recvcounts: *const c_int,
-    datatype: MPI_Datatype,
-    op: MPI_Op,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Ireduce_scatter() -> unsafe extern "C" fn(
         *const c_void,
         *mut c_void,
         *const c_int,
@@ -2359,25 +2629,12 @@ pub unsafe fn MPI_Ireduce_scatter(
         MPI_Op,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Ireduce_scatter\0");
-        std::mem::transmute(ptr)
-    });
-    f(sendbuf, recvbuf, recvcounts, datatype, op, comm, request)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ireduce_scatter.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Iscan(
-    sendbuf: *const c_void,
-    recvbuf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    op: MPI_Op,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Iscan() -> unsafe extern "C" fn(
         *const c_void,
         *mut c_void,
         c_int,
@@ -2385,25 +2642,12 @@ pub unsafe fn MPI_Iscan(
         MPI_Op,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Iscan\0");
-        std::mem::transmute(ptr)
-    });
-    f(sendbuf, recvbuf, count, datatype, op, comm, request)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Iscan.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Iexscan(
-    sendbuf: *const c_void,
-    recvbuf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    op: MPI_Op,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
-) -> c_int {
-    type F = unsafe extern "C" fn(
+    #[inline(always)]
+    pub(crate) fn MPI_Iexscan() -> unsafe extern "C" fn(
         *const c_void,
         *mut c_void,
         c_int,
@@ -2411,4041 +2655,21177 @@ pub unsafe fn MPI_Iexscan(
         MPI_Op,
         MPI_Comm,
         *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Iexscan\0");
-        std::mem::transmute(ptr)
-    });
-    f(sendbuf, recvbuf, count, datatype, op, comm, request)
-}
-
-pub unsafe fn MPI_Group_size(group: MPI_Group, size: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Group, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Group_size\0");
-        std::mem::transmute(ptr)
-    });
-    f(group, size)
-}
-
-pub unsafe fn MPI_Group_rank(group: MPI_Group, rank: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Group, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Group_rank\0");
-        std::mem::transmute(ptr)
-    });
-    f(group, rank)
-}
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Iexscan.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Group_size() -> unsafe extern "C" fn(MPI_Group, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Group_size.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Group_rank() -> unsafe extern "C" fn(MPI_Group, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Group_rank.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Group_translate_ranks(
+    ) -> unsafe extern "C" fn(MPI_Group, c_int, *const c_int, MPI_Group, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Group_translate_ranks.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Group_compare(
+    ) -> unsafe extern "C" fn(MPI_Group, MPI_Group, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Group_compare.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_group() -> unsafe extern "C" fn(MPI_Comm, *mut MPI_Group) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_group.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Group_union(
+    ) -> unsafe extern "C" fn(MPI_Group, MPI_Group, *mut MPI_Group) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Group_union.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Group_intersection(
+    ) -> unsafe extern "C" fn(MPI_Group, MPI_Group, *mut MPI_Group) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Group_intersection.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Group_difference(
+    ) -> unsafe extern "C" fn(MPI_Group, MPI_Group, *mut MPI_Group) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Group_difference.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Group_incl(
+    ) -> unsafe extern "C" fn(MPI_Group, c_int, *const c_int, *mut MPI_Group) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Group_incl.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Group_excl(
+    ) -> unsafe extern "C" fn(MPI_Group, c_int, *const c_int, *mut MPI_Group) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Group_excl.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Group_range_incl(
+    ) -> unsafe extern "C" fn(MPI_Group, c_int, *mut [c_int; 3], *mut MPI_Group) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Group_range_incl.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Group_range_excl(
+    ) -> unsafe extern "C" fn(MPI_Group, c_int, *mut [c_int; 3], *mut MPI_Group) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Group_range_excl.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Group_free() -> unsafe extern "C" fn(*mut MPI_Group) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Group_free.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_size() -> unsafe extern "C" fn(MPI_Comm, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_size.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_rank() -> unsafe extern "C" fn(MPI_Comm, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_rank.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_compare() -> unsafe extern "C" fn(MPI_Comm, MPI_Comm, *mut c_int) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Comm_compare.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_dup() -> unsafe extern "C" fn(MPI_Comm, *mut MPI_Comm) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_dup.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_dup_with_info(
+    ) -> unsafe extern "C" fn(MPI_Comm, MPI_Info, *mut MPI_Comm) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_dup_with_info.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_idup(
+    ) -> unsafe extern "C" fn(MPI_Comm, *mut MPI_Comm, *mut MPI_Request) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_idup.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_create(
+    ) -> unsafe extern "C" fn(MPI_Comm, MPI_Group, *mut MPI_Comm) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_create.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_create_group(
+    ) -> unsafe extern "C" fn(MPI_Comm, MPI_Group, c_int, *mut MPI_Comm) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_create_group.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_split(
+    ) -> unsafe extern "C" fn(MPI_Comm, c_int, c_int, *mut MPI_Comm) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_split.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_split_type(
+    ) -> unsafe extern "C" fn(MPI_Comm, c_int, c_int, MPI_Info, *mut MPI_Comm) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_split_type.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_free() -> unsafe extern "C" fn(*mut MPI_Comm) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_free.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_set_info() -> unsafe extern "C" fn(MPI_Comm, MPI_Info) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_set_info.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_get_info() -> unsafe extern "C" fn(MPI_Comm, *mut MPI_Info) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_get_info.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_test_inter() -> unsafe extern "C" fn(MPI_Comm, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_test_inter.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_remote_size() -> unsafe extern "C" fn(MPI_Comm, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_remote_size.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_remote_group() -> unsafe extern "C" fn(MPI_Comm, *mut MPI_Group) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Comm_remote_group.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Intercomm_create(
+    ) -> unsafe extern "C" fn(MPI_Comm, c_int, MPI_Comm, c_int, c_int, *mut MPI_Comm) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Intercomm_create.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Intercomm_merge(
+    ) -> unsafe extern "C" fn(MPI_Comm, c_int, *mut MPI_Comm) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Intercomm_merge.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_create_keyval() -> unsafe extern "C" fn(
+        MPI_Comm_copy_attr_function,
+        MPI_Comm_delete_attr_function,
+        *mut c_int,
+        *mut c_void,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_create_keyval.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_free_keyval() -> unsafe extern "C" fn(*mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_free_keyval.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_set_attr() -> unsafe extern "C" fn(MPI_Comm, c_int, *mut c_void) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Comm_set_attr.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_get_attr(
+    ) -> unsafe extern "C" fn(MPI_Comm, c_int, *mut c_void, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_get_attr.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_delete_attr() -> unsafe extern "C" fn(MPI_Comm, c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_delete_attr.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_create_keyval() -> unsafe extern "C" fn(
+        MPI_Win_copy_attr_function,
+        MPI_Win_delete_attr_function,
+        *mut c_int,
+        *mut c_void,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_create_keyval.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_free_keyval() -> unsafe extern "C" fn(*mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_free_keyval.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_set_attr() -> unsafe extern "C" fn(MPI_Win, c_int, *mut c_void) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_set_attr.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_get_attr(
+    ) -> unsafe extern "C" fn(MPI_Win, c_int, *mut c_void, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_get_attr.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_delete_attr() -> unsafe extern "C" fn(MPI_Win, c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_delete_attr.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_create_keyval() -> unsafe extern "C" fn(
+        MPI_Type_copy_attr_function,
+        MPI_Type_delete_attr_function,
+        *mut c_int,
+        *mut c_void,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_create_keyval.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_free_keyval() -> unsafe extern "C" fn(*mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_free_keyval.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_set_attr(
+    ) -> unsafe extern "C" fn(MPI_Datatype, c_int, *mut c_void) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_set_attr.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_get_attr(
+    ) -> unsafe extern "C" fn(MPI_Datatype, c_int, *mut c_void, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_get_attr.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_delete_attr() -> unsafe extern "C" fn(MPI_Datatype, c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_delete_attr.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_set_name() -> unsafe extern "C" fn(MPI_Comm, *const c_char) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_set_name.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_get_name(
+    ) -> unsafe extern "C" fn(MPI_Comm, *mut c_char, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_get_name.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_set_name() -> unsafe extern "C" fn(MPI_Datatype, *const c_char) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Type_set_name.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_get_name(
+    ) -> unsafe extern "C" fn(MPI_Datatype, *mut c_char, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_get_name.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_set_name() -> unsafe extern "C" fn(MPI_Win, *const c_char) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_set_name.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_get_name(
+    ) -> unsafe extern "C" fn(MPI_Win, *mut c_char, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_get_name.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Cart_create() -> unsafe extern "C" fn(
+        MPI_Comm,
+        c_int,
+        *const c_int,
+        *const c_int,
+        c_int,
+        *mut MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Cart_create.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Group_translate_ranks(
-    group1: MPI_Group,
-    n: c_int,
-    ranks1: *const c_int,
-    group2: MPI_Group,
-    ranks2: *mut c_int,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Group, c_int, *const c_int, MPI_Group, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Group_translate_ranks\0");
-        std::mem::transmute(ptr)
-    });
-    f(group1, n, ranks1, group2, ranks2)
-}
+    #[inline(always)]
+    pub(crate) fn MPI_Dims_create() -> unsafe extern "C" fn(c_int, c_int, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Dims_create.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Group_compare(group1: MPI_Group, group2: MPI_Group, result: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Group, MPI_Group, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Group_compare\0");
-        std::mem::transmute(ptr)
-    });
-    f(group1, group2, result)
-}
+    #[inline(always)]
+    pub(crate) fn MPI_Graph_create() -> unsafe extern "C" fn(
+        MPI_Comm,
+        c_int,
+        *const c_int,
+        *const c_int,
+        c_int,
+        *mut MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Graph_create.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Comm_group(comm: MPI_Comm, group: *mut MPI_Group) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *mut MPI_Group) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_group\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, group)
-}
+    #[inline(always)]
+    pub(crate) fn MPI_Dist_graph_create_adjacent() -> unsafe extern "C" fn(
+        MPI_Comm,
+        c_int,
+        *const c_int,
+        *const c_int,
+        c_int,
+        *const c_int,
+        *const c_int,
+        MPI_Info,
+        c_int,
+        *mut MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Dist_graph_create_adjacent.load(Ordering::Relaxed)) }
+    }
 
-pub unsafe fn MPI_Group_union(
-    group1: MPI_Group,
-    group2: MPI_Group,
-    newgroup: *mut MPI_Group,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Group, MPI_Group, *mut MPI_Group) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Group_union\0");
-        std::mem::transmute(ptr)
-    });
-    f(group1, group2, newgroup)
-}
+    #[inline(always)]
+    pub(crate) fn MPI_Dist_graph_create() -> unsafe extern "C" fn(
+        MPI_Comm,
+        c_int,
+        *const c_int,
+        *const c_int,
+        *const c_int,
+        *const c_int,
+        MPI_Info,
+        c_int,
+        *mut MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Dist_graph_create.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Topo_test() -> unsafe extern "C" fn(MPI_Comm, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Topo_test.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Graphdims_get(
+    ) -> unsafe extern "C" fn(MPI_Comm, *mut c_int, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Graphdims_get.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Graph_get(
+    ) -> unsafe extern "C" fn(MPI_Comm, c_int, c_int, *mut c_int, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Graph_get.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Cartdim_get() -> unsafe extern "C" fn(MPI_Comm, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Cartdim_get.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Cart_get(
+    ) -> unsafe extern "C" fn(MPI_Comm, c_int, *mut c_int, *mut c_int, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Cart_get.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Cart_rank(
+    ) -> unsafe extern "C" fn(MPI_Comm, *const c_int, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Cart_rank.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Cart_coords(
+    ) -> unsafe extern "C" fn(MPI_Comm, c_int, c_int, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Cart_coords.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Graph_neighbors_count(
+    ) -> unsafe extern "C" fn(MPI_Comm, c_int, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Graph_neighbors_count.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Graph_neighbors(
+    ) -> unsafe extern "C" fn(MPI_Comm, c_int, c_int, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Graph_neighbors.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Dist_graph_neighbors_count(
+    ) -> unsafe extern "C" fn(MPI_Comm, *mut c_int, *mut c_int, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Dist_graph_neighbors_count.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Dist_graph_neighbors() -> unsafe extern "C" fn(
+        MPI_Comm,
+        c_int,
+        *mut c_int,
+        *mut c_int,
+        c_int,
+        *mut c_int,
+        *mut c_int,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Dist_graph_neighbors.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Cart_shift(
+    ) -> unsafe extern "C" fn(MPI_Comm, c_int, c_int, *mut c_int, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Cart_shift.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Cart_sub(
+    ) -> unsafe extern "C" fn(MPI_Comm, *const c_int, *mut MPI_Comm) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Cart_sub.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Cart_map(
+    ) -> unsafe extern "C" fn(MPI_Comm, c_int, *const c_int, *const c_int, *mut c_int) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Cart_map.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Graph_map(
+    ) -> unsafe extern "C" fn(MPI_Comm, c_int, *const c_int, *const c_int, *mut c_int) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Graph_map.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_allgather() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_allgather.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_allgatherv() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut c_void,
+        *const c_int,
+        *const c_int,
+        MPI_Datatype,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_allgatherv.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_alltoall() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_alltoall.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_alltoallv() -> unsafe extern "C" fn(
+        *const c_void,
+        *const c_int,
+        *const c_int,
+        MPI_Datatype,
+        *mut c_void,
+        *const c_int,
+        *const c_int,
+        MPI_Datatype,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_alltoallv.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_alltoallw() -> unsafe extern "C" fn(
+        *const c_void,
+        *const c_int,
+        *const MPI_Aint,
+        *const MPI_Datatype,
+        *mut c_void,
+        *const c_int,
+        *const MPI_Aint,
+        *const MPI_Datatype,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_alltoallw.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ineighbor_allgather() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ineighbor_allgather.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ineighbor_allgatherv() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut c_void,
+        *const c_int,
+        *const c_int,
+        MPI_Datatype,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ineighbor_allgatherv.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ineighbor_alltoall() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ineighbor_alltoall.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ineighbor_alltoallv() -> unsafe extern "C" fn(
+        *const c_void,
+        *const c_int,
+        *const c_int,
+        MPI_Datatype,
+        *mut c_void,
+        *const c_int,
+        *const c_int,
+        MPI_Datatype,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ineighbor_alltoallv.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ineighbor_alltoallw() -> unsafe extern "C" fn(
+        *const c_void,
+        *const c_int,
+        *const MPI_Aint,
+        *const MPI_Datatype,
+        *mut c_void,
+        *const c_int,
+        *const MPI_Aint,
+        *const MPI_Datatype,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ineighbor_alltoallw.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Get_version() -> unsafe extern "C" fn(*mut c_int, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Get_version.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Get_library_version() -> unsafe extern "C" fn(*mut c_char, *mut c_int) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Get_library_version.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Get_processor_name() -> unsafe extern "C" fn(*mut c_char, *mut c_int) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Get_processor_name.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Alloc_mem() -> unsafe extern "C" fn(MPI_Aint, MPI_Info, *mut c_void) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Alloc_mem.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Free_mem() -> unsafe extern "C" fn(*mut c_void) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Free_mem.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_create_errhandler(
+    ) -> unsafe extern "C" fn(MPI_Comm_errhandler_function, *mut MPI_Errhandler) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_create_errhandler.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_set_errhandler(
+    ) -> unsafe extern "C" fn(MPI_Comm, MPI_Errhandler) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_set_errhandler.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_get_errhandler(
+    ) -> unsafe extern "C" fn(MPI_Comm, *mut MPI_Errhandler) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_get_errhandler.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_create_errhandler(
+    ) -> unsafe extern "C" fn(MPI_Win_errhandler_function, *mut MPI_Errhandler) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_create_errhandler.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_set_errhandler() -> unsafe extern "C" fn(MPI_Win, MPI_Errhandler) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Win_set_errhandler.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_get_errhandler(
+    ) -> unsafe extern "C" fn(MPI_Win, *mut MPI_Errhandler) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_get_errhandler.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_create_errhandler(
+    ) -> unsafe extern "C" fn(MPI_File_errhandler_function, *mut MPI_Errhandler) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_create_errhandler.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_set_errhandler(
+    ) -> unsafe extern "C" fn(MPI_File, MPI_Errhandler) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_set_errhandler.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_get_errhandler(
+    ) -> unsafe extern "C" fn(MPI_File, *mut MPI_Errhandler) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_get_errhandler.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Errhandler_free() -> unsafe extern "C" fn(*mut MPI_Errhandler) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Errhandler_free.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Error_string() -> unsafe extern "C" fn(c_int, *mut c_char, *mut c_int) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Error_string.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Error_class() -> unsafe extern "C" fn(c_int, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Error_class.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Add_error_class() -> unsafe extern "C" fn(*mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Add_error_class.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Add_error_code() -> unsafe extern "C" fn(c_int, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Add_error_code.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Add_error_string() -> unsafe extern "C" fn(c_int, *const c_char) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Add_error_string.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_call_errhandler() -> unsafe extern "C" fn(MPI_Comm, c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_call_errhandler.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_call_errhandler() -> unsafe extern "C" fn(MPI_Win, c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_call_errhandler.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_call_errhandler() -> unsafe extern "C" fn(MPI_File, c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_call_errhandler.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Wtime() -> unsafe extern "C" fn() -> c_double {
+        unsafe { mem::transmute(TABLE.MPI_Wtime.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Wtick() -> unsafe extern "C" fn() -> c_double {
+        unsafe { mem::transmute(TABLE.MPI_Wtick.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Init() -> unsafe extern "C" fn(*mut c_int, *mut *mut *mut c_char) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Finalize() -> unsafe extern "C" fn() -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Finalize.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Initialized() -> unsafe extern "C" fn(*mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Initialized.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Abort() -> unsafe extern "C" fn(MPI_Comm, c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Abort.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Finalized() -> unsafe extern "C" fn(*mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Finalized.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Info_create() -> unsafe extern "C" fn(*mut MPI_Info) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Info_create.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Info_set(
+    ) -> unsafe extern "C" fn(MPI_Info, *const c_char, *const c_char) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Info_set.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Info_delete() -> unsafe extern "C" fn(MPI_Info, *const c_char) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Info_delete.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Info_get(
+    ) -> unsafe extern "C" fn(MPI_Info, *const c_char, c_int, *mut c_char, *mut c_int) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Info_get.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Info_get_valuelen(
+    ) -> unsafe extern "C" fn(MPI_Info, *const c_char, *mut c_int, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Info_get_valuelen.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Info_get_nkeys() -> unsafe extern "C" fn(MPI_Info, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Info_get_nkeys.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Info_get_nthkey(
+    ) -> unsafe extern "C" fn(MPI_Info, c_int, *mut c_char) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Info_get_nthkey.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Info_dup() -> unsafe extern "C" fn(MPI_Info, *mut MPI_Info) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Info_dup.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Info_free() -> unsafe extern "C" fn(*mut MPI_Info) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Info_free.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_spawn() -> unsafe extern "C" fn(
+        *const c_char,
+        *mut *mut c_char,
+        c_int,
+        MPI_Info,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Comm,
+        *mut c_int,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_spawn.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_get_parent() -> unsafe extern "C" fn(*mut MPI_Comm) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_get_parent.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_spawn_multiple() -> unsafe extern "C" fn(
+        c_int,
+        *mut *mut c_char,
+        *mut *mut *mut c_char,
+        *const c_int,
+        *const MPI_Info,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Comm,
+        *mut c_int,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_spawn_multiple.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Open_port() -> unsafe extern "C" fn(MPI_Info, *mut c_char) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Open_port.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Close_port() -> unsafe extern "C" fn(*const c_char) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Close_port.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_accept(
+    ) -> unsafe extern "C" fn(*const c_char, MPI_Info, c_int, MPI_Comm, *mut MPI_Comm) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Comm_accept.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_connect(
+    ) -> unsafe extern "C" fn(*const c_char, MPI_Info, c_int, MPI_Comm, *mut MPI_Comm) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Comm_connect.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Publish_name(
+    ) -> unsafe extern "C" fn(*const c_char, MPI_Info, *const c_char) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Publish_name.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Unpublish_name(
+    ) -> unsafe extern "C" fn(*const c_char, MPI_Info, *const c_char) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Unpublish_name.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Lookup_name(
+    ) -> unsafe extern "C" fn(*const c_char, MPI_Info, *mut c_char) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Lookup_name.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_disconnect() -> unsafe extern "C" fn(*mut MPI_Comm) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_disconnect.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_join() -> unsafe extern "C" fn(c_int, *mut MPI_Comm) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Comm_join.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_create(
+    ) -> unsafe extern "C" fn(*mut c_void, MPI_Aint, c_int, MPI_Info, MPI_Comm, *mut MPI_Win) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Win_create.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_allocate(
+    ) -> unsafe extern "C" fn(MPI_Aint, c_int, MPI_Info, MPI_Comm, *mut c_void, *mut MPI_Win) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Win_allocate.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_allocate_shared(
+    ) -> unsafe extern "C" fn(MPI_Aint, c_int, MPI_Info, MPI_Comm, *mut c_void, *mut MPI_Win) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Win_allocate_shared.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_shared_query(
+    ) -> unsafe extern "C" fn(MPI_Win, c_int, *mut MPI_Aint, *mut c_int, *mut c_void) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_shared_query.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_create_dynamic(
+    ) -> unsafe extern "C" fn(MPI_Info, MPI_Comm, *mut MPI_Win) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_create_dynamic.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_attach() -> unsafe extern "C" fn(MPI_Win, *mut c_void, MPI_Aint) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Win_attach.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_detach() -> unsafe extern "C" fn(MPI_Win, *const c_void) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_detach.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_free() -> unsafe extern "C" fn(*mut MPI_Win) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_free.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_get_group() -> unsafe extern "C" fn(MPI_Win, *mut MPI_Group) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_get_group.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_set_info() -> unsafe extern "C" fn(MPI_Win, MPI_Info) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_set_info.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_get_info() -> unsafe extern "C" fn(MPI_Win, *mut MPI_Info) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_get_info.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Put() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        c_int,
+        MPI_Aint,
+        c_int,
+        MPI_Datatype,
+        MPI_Win,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Put.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Get() -> unsafe extern "C" fn(
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        c_int,
+        MPI_Aint,
+        c_int,
+        MPI_Datatype,
+        MPI_Win,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Get.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Accumulate() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        c_int,
+        MPI_Aint,
+        c_int,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Win,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Accumulate.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Get_accumulate() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        c_int,
+        MPI_Aint,
+        c_int,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Win,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Get_accumulate.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Fetch_and_op() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        MPI_Datatype,
+        c_int,
+        MPI_Aint,
+        MPI_Op,
+        MPI_Win,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Fetch_and_op.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Compare_and_swap() -> unsafe extern "C" fn(
+        *const c_void,
+        *const c_void,
+        *mut c_void,
+        MPI_Datatype,
+        c_int,
+        MPI_Aint,
+        MPI_Win,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Compare_and_swap.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Rput() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        c_int,
+        MPI_Aint,
+        c_int,
+        MPI_Datatype,
+        MPI_Win,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Rput.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Rget() -> unsafe extern "C" fn(
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        c_int,
+        MPI_Aint,
+        c_int,
+        MPI_Datatype,
+        MPI_Win,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Rget.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Raccumulate() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        c_int,
+        MPI_Aint,
+        c_int,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Win,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Raccumulate.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Rget_accumulate() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        c_int,
+        MPI_Aint,
+        c_int,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Win,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Rget_accumulate.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_fence() -> unsafe extern "C" fn(c_int, MPI_Win) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_fence.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_start() -> unsafe extern "C" fn(MPI_Group, c_int, MPI_Win) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_start.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_complete() -> unsafe extern "C" fn(MPI_Win) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_complete.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_post() -> unsafe extern "C" fn(MPI_Group, c_int, MPI_Win) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_post.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_wait() -> unsafe extern "C" fn(MPI_Win) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_wait.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_test() -> unsafe extern "C" fn(MPI_Win, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_test.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_lock() -> unsafe extern "C" fn(c_int, c_int, c_int, MPI_Win) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_lock.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_lock_all() -> unsafe extern "C" fn(c_int, MPI_Win) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_lock_all.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_unlock() -> unsafe extern "C" fn(c_int, MPI_Win) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_unlock.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_unlock_all() -> unsafe extern "C" fn(MPI_Win) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_unlock_all.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_flush() -> unsafe extern "C" fn(c_int, MPI_Win) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_flush.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_flush_all() -> unsafe extern "C" fn(MPI_Win) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_flush_all.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_flush_local() -> unsafe extern "C" fn(c_int, MPI_Win) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_flush_local.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_flush_local_all() -> unsafe extern "C" fn(MPI_Win) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_flush_local_all.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_sync() -> unsafe extern "C" fn(MPI_Win) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Win_sync.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Grequest_start() -> unsafe extern "C" fn(
+        MPI_Grequest_query_function,
+        MPI_Grequest_free_function,
+        MPI_Grequest_cancel_function,
+        *mut c_void,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Grequest_start.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Grequest_complete() -> unsafe extern "C" fn(MPI_Request) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Grequest_complete.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Status_set_elements(
+    ) -> unsafe extern "C" fn(*mut MPI_Status, MPI_Datatype, c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Status_set_elements.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Status_set_elements_x(
+    ) -> unsafe extern "C" fn(*mut MPI_Status, MPI_Datatype, MPI_Count) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Status_set_elements_x.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Status_set_cancelled() -> unsafe extern "C" fn(*mut MPI_Status, c_int) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Status_set_cancelled.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Init_thread(
+    ) -> unsafe extern "C" fn(*mut c_int, *mut *mut *mut c_char, c_int, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Init_thread.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Query_thread() -> unsafe extern "C" fn(*mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Query_thread.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Is_thread_main() -> unsafe extern "C" fn(*mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Is_thread_main.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_open(
+    ) -> unsafe extern "C" fn(MPI_Comm, *const c_char, c_int, MPI_Info, *mut MPI_File) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_File_open.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_close() -> unsafe extern "C" fn(*mut MPI_File) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_close.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_delete() -> unsafe extern "C" fn(*const c_char, MPI_Info) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_delete.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_set_size() -> unsafe extern "C" fn(MPI_File, MPI_Offset) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_set_size.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_preallocate() -> unsafe extern "C" fn(MPI_File, MPI_Offset) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_preallocate.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_get_size() -> unsafe extern "C" fn(MPI_File, *mut MPI_Offset) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_get_size.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_get_group() -> unsafe extern "C" fn(MPI_File, *mut MPI_Group) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_get_group.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_get_amode() -> unsafe extern "C" fn(MPI_File, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_get_amode.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_set_info() -> unsafe extern "C" fn(MPI_File, MPI_Info) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_set_info.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_get_info() -> unsafe extern "C" fn(MPI_File, *mut MPI_Info) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_get_info.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_set_view() -> unsafe extern "C" fn(
+        MPI_File,
+        MPI_Offset,
+        MPI_Datatype,
+        MPI_Datatype,
+        *const c_char,
+        MPI_Info,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_set_view.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_get_view() -> unsafe extern "C" fn(
+        MPI_File,
+        *mut MPI_Offset,
+        *mut MPI_Datatype,
+        *mut MPI_Datatype,
+        *mut c_char,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_get_view.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_read_at() -> unsafe extern "C" fn(
+        MPI_File,
+        MPI_Offset,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        *mut MPI_Status,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_read_at.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_read_at_all() -> unsafe extern "C" fn(
+        MPI_File,
+        MPI_Offset,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        *mut MPI_Status,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_read_at_all.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_write_at() -> unsafe extern "C" fn(
+        MPI_File,
+        MPI_Offset,
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut MPI_Status,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_write_at.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_write_at_all() -> unsafe extern "C" fn(
+        MPI_File,
+        MPI_Offset,
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut MPI_Status,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_write_at_all.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_iread_at() -> unsafe extern "C" fn(
+        MPI_File,
+        MPI_Offset,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_iread_at.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_iread_at_all() -> unsafe extern "C" fn(
+        MPI_File,
+        MPI_Offset,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_iread_at_all.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_iwrite_at() -> unsafe extern "C" fn(
+        MPI_File,
+        MPI_Offset,
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_iwrite_at.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_iwrite_at_all() -> unsafe extern "C" fn(
+        MPI_File,
+        MPI_Offset,
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_iwrite_at_all.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_read(
+    ) -> unsafe extern "C" fn(MPI_File, *mut c_void, c_int, MPI_Datatype, *mut MPI_Status) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_File_read.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_read_all(
+    ) -> unsafe extern "C" fn(MPI_File, *mut c_void, c_int, MPI_Datatype, *mut MPI_Status) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_File_read_all.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_write(
+    ) -> unsafe extern "C" fn(MPI_File, *const c_void, c_int, MPI_Datatype, *mut MPI_Status) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_File_write.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_write_all(
+    ) -> unsafe extern "C" fn(MPI_File, *const c_void, c_int, MPI_Datatype, *mut MPI_Status) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_File_write_all.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_iread(
+    ) -> unsafe extern "C" fn(MPI_File, *mut c_void, c_int, MPI_Datatype, *mut MPI_Request) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_File_iread.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_iread_all(
+    ) -> unsafe extern "C" fn(MPI_File, *mut c_void, c_int, MPI_Datatype, *mut MPI_Request) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_File_iread_all.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_iwrite(
+    ) -> unsafe extern "C" fn(MPI_File, *const c_void, c_int, MPI_Datatype, *mut MPI_Request) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_File_iwrite.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_iwrite_all(
+    ) -> unsafe extern "C" fn(MPI_File, *const c_void, c_int, MPI_Datatype, *mut MPI_Request) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_File_iwrite_all.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_seek() -> unsafe extern "C" fn(MPI_File, MPI_Offset, c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_seek.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_get_position() -> unsafe extern "C" fn(MPI_File, *mut MPI_Offset) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_File_get_position.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_get_byte_offset(
+    ) -> unsafe extern "C" fn(MPI_File, MPI_Offset, *mut MPI_Offset) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_get_byte_offset.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_read_shared(
+    ) -> unsafe extern "C" fn(MPI_File, *mut c_void, c_int, MPI_Datatype, *mut MPI_Status) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_File_read_shared.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_write_shared(
+    ) -> unsafe extern "C" fn(MPI_File, *const c_void, c_int, MPI_Datatype, *mut MPI_Status) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_File_write_shared.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_iread_shared(
+    ) -> unsafe extern "C" fn(MPI_File, *mut c_void, c_int, MPI_Datatype, *mut MPI_Request) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_File_iread_shared.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_iwrite_shared(
+    ) -> unsafe extern "C" fn(MPI_File, *const c_void, c_int, MPI_Datatype, *mut MPI_Request) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_File_iwrite_shared.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_read_ordered(
+    ) -> unsafe extern "C" fn(MPI_File, *mut c_void, c_int, MPI_Datatype, *mut MPI_Status) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_File_read_ordered.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_write_ordered(
+    ) -> unsafe extern "C" fn(MPI_File, *const c_void, c_int, MPI_Datatype, *mut MPI_Status) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_File_write_ordered.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_seek_shared(
+    ) -> unsafe extern "C" fn(MPI_File, MPI_Offset, c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_seek_shared.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_get_position_shared(
+    ) -> unsafe extern "C" fn(MPI_File, *mut MPI_Offset) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_get_position_shared.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_read_at_all_begin(
+    ) -> unsafe extern "C" fn(MPI_File, MPI_Offset, *mut c_void, c_int, MPI_Datatype) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_read_at_all_begin.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_read_at_all_end(
+    ) -> unsafe extern "C" fn(MPI_File, *mut c_void, *mut MPI_Status) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_read_at_all_end.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_write_at_all_begin(
+    ) -> unsafe extern "C" fn(MPI_File, MPI_Offset, *const c_void, c_int, MPI_Datatype) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_File_write_at_all_begin.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_write_at_all_end(
+    ) -> unsafe extern "C" fn(MPI_File, *const c_void, *mut MPI_Status) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_write_at_all_end.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_read_all_begin(
+    ) -> unsafe extern "C" fn(MPI_File, *mut c_void, c_int, MPI_Datatype) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_read_all_begin.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_read_all_end(
+    ) -> unsafe extern "C" fn(MPI_File, *mut c_void, *mut MPI_Status) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_read_all_end.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_write_all_begin(
+    ) -> unsafe extern "C" fn(MPI_File, *const c_void, c_int, MPI_Datatype) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_write_all_begin.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_write_all_end(
+    ) -> unsafe extern "C" fn(MPI_File, *const c_void, *mut MPI_Status) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_write_all_end.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_read_ordered_begin(
+    ) -> unsafe extern "C" fn(MPI_File, *mut c_void, c_int, MPI_Datatype) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_read_ordered_begin.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_read_ordered_end(
+    ) -> unsafe extern "C" fn(MPI_File, *mut c_void, *mut MPI_Status) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_read_ordered_end.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_write_ordered_begin(
+    ) -> unsafe extern "C" fn(MPI_File, *const c_void, c_int, MPI_Datatype) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_write_ordered_begin.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_write_ordered_end(
+    ) -> unsafe extern "C" fn(MPI_File, *const c_void, *mut MPI_Status) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_write_ordered_end.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_get_type_extent(
+    ) -> unsafe extern "C" fn(MPI_File, MPI_Datatype, *mut MPI_Aint) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_get_type_extent.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Register_datarep() -> unsafe extern "C" fn(
+        *const c_char,
+        MPI_Datarep_conversion_function,
+        MPI_Datarep_conversion_function,
+        MPI_Datarep_extent_function,
+        *mut c_void,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Register_datarep.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_set_atomicity() -> unsafe extern "C" fn(MPI_File, c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_set_atomicity.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_get_atomicity() -> unsafe extern "C" fn(MPI_File, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_get_atomicity.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_sync() -> unsafe extern "C" fn(MPI_File) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_File_sync.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_create_f90_real(
+    ) -> unsafe extern "C" fn(c_int, c_int, *mut MPI_Datatype) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_create_f90_real.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_create_f90_complex(
+    ) -> unsafe extern "C" fn(c_int, c_int, *mut MPI_Datatype) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_create_f90_complex.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_create_f90_integer(
+    ) -> unsafe extern "C" fn(c_int, *mut MPI_Datatype) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_create_f90_integer.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_match_size(
+    ) -> unsafe extern "C" fn(c_int, c_int, *mut MPI_Datatype) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_match_size.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_f2c() -> unsafe extern "C" fn(MPI_Fint) -> MPI_Comm {
+        unsafe { mem::transmute(TABLE.MPI_Comm_f2c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Comm_c2f() -> unsafe extern "C" fn(MPI_Comm) -> MPI_Fint {
+        unsafe { mem::transmute(TABLE.MPI_Comm_c2f.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_f2c() -> unsafe extern "C" fn(MPI_Fint) -> MPI_Datatype {
+        unsafe { mem::transmute(TABLE.MPI_Type_f2c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_c2f() -> unsafe extern "C" fn(MPI_Datatype) -> MPI_Fint {
+        unsafe { mem::transmute(TABLE.MPI_Type_c2f.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Group_f2c() -> unsafe extern "C" fn(MPI_Fint) -> MPI_Group {
+        unsafe { mem::transmute(TABLE.MPI_Group_f2c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Group_c2f() -> unsafe extern "C" fn(MPI_Group) -> MPI_Fint {
+        unsafe { mem::transmute(TABLE.MPI_Group_c2f.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Request_f2c() -> unsafe extern "C" fn(MPI_Fint) -> MPI_Request {
+        unsafe { mem::transmute(TABLE.MPI_Request_f2c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Request_c2f() -> unsafe extern "C" fn(MPI_Request) -> MPI_Fint {
+        unsafe { mem::transmute(TABLE.MPI_Request_c2f.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_f2c() -> unsafe extern "C" fn(MPI_Fint) -> MPI_File {
+        unsafe { mem::transmute(TABLE.MPI_File_f2c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_File_c2f() -> unsafe extern "C" fn(MPI_File) -> MPI_Fint {
+        unsafe { mem::transmute(TABLE.MPI_File_c2f.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_f2c() -> unsafe extern "C" fn(MPI_Fint) -> MPI_Win {
+        unsafe { mem::transmute(TABLE.MPI_Win_f2c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Win_c2f() -> unsafe extern "C" fn(MPI_Win) -> MPI_Fint {
+        unsafe { mem::transmute(TABLE.MPI_Win_c2f.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Op_f2c() -> unsafe extern "C" fn(MPI_Fint) -> MPI_Op {
+        unsafe { mem::transmute(TABLE.MPI_Op_f2c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Op_c2f() -> unsafe extern "C" fn(MPI_Op) -> MPI_Fint {
+        unsafe { mem::transmute(TABLE.MPI_Op_c2f.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Info_f2c() -> unsafe extern "C" fn(MPI_Fint) -> MPI_Info {
+        unsafe { mem::transmute(TABLE.MPI_Info_f2c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Info_c2f() -> unsafe extern "C" fn(MPI_Info) -> MPI_Fint {
+        unsafe { mem::transmute(TABLE.MPI_Info_c2f.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Errhandler_f2c() -> unsafe extern "C" fn(MPI_Fint) -> MPI_Errhandler {
+        unsafe { mem::transmute(TABLE.MPI_Errhandler_f2c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Errhandler_c2f() -> unsafe extern "C" fn(MPI_Errhandler) -> MPI_Fint {
+        unsafe { mem::transmute(TABLE.MPI_Errhandler_c2f.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Message_f2c() -> unsafe extern "C" fn(MPI_Fint) -> MPI_Message {
+        unsafe { mem::transmute(TABLE.MPI_Message_f2c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Message_c2f() -> unsafe extern "C" fn(MPI_Message) -> MPI_Fint {
+        unsafe { mem::transmute(TABLE.MPI_Message_c2f.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Status_f2c() -> unsafe extern "C" fn(*const MPI_Fint, *mut MPI_Status) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Status_f2c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Status_c2f() -> unsafe extern "C" fn(*const MPI_Status, *mut MPI_Fint) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Status_c2f.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Send_c(
+    ) -> unsafe extern "C" fn(*const c_void, MPI_Count, MPI_Datatype, c_int, c_int, MPI_Comm) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Send_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Recv_c() -> unsafe extern "C" fn(
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Status,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Recv_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Get_count_c(
+    ) -> unsafe extern "C" fn(*const MPI_Status, MPI_Datatype, *mut MPI_Count) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Get_count_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Bsend_c(
+    ) -> unsafe extern "C" fn(*const c_void, MPI_Count, MPI_Datatype, c_int, c_int, MPI_Comm) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Bsend_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ssend_c(
+    ) -> unsafe extern "C" fn(*const c_void, MPI_Count, MPI_Datatype, c_int, c_int, MPI_Comm) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Ssend_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Rsend_c(
+    ) -> unsafe extern "C" fn(*const c_void, MPI_Count, MPI_Datatype, c_int, c_int, MPI_Comm) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Rsend_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Isend_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Isend_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ibsend_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ibsend_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Issend_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Issend_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Irsend_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Irsend_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Irecv_c() -> unsafe extern "C" fn(
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Irecv_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Send_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Send_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Bsend_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Bsend_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ssend_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ssend_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Rsend_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Rsend_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Recv_init_c() -> unsafe extern "C" fn(
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Recv_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Sendrecv_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        c_int,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Status,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Sendrecv_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Sendrecv_replace_c() -> unsafe extern "C" fn(
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        c_int,
+        c_int,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Status,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Sendrecv_replace_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Mrecv_c() -> unsafe extern "C" fn(
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut MPI_Message,
+        *mut MPI_Status,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Mrecv_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Imrecv_c() -> unsafe extern "C" fn(
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut MPI_Message,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Imrecv_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Get_elements_c(
+    ) -> unsafe extern "C" fn(*const MPI_Status, MPI_Datatype, *mut MPI_Count) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Get_elements_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_size_c() -> unsafe extern "C" fn(MPI_Datatype, *mut MPI_Count) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_size_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_get_extent_c(
+    ) -> unsafe extern "C" fn(MPI_Datatype, *mut MPI_Count, *mut MPI_Count) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_get_extent_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Type_get_true_extent_c(
+    ) -> unsafe extern "C" fn(MPI_Datatype, *mut MPI_Count, *mut MPI_Count) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Type_get_true_extent_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Pack_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        *mut MPI_Count,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Pack_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Unpack_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        *mut MPI_Count,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Unpack_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Pack_size_c(
+    ) -> unsafe extern "C" fn(MPI_Count, MPI_Datatype, MPI_Comm, *mut MPI_Count) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Pack_size_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Bcast_c(
+    ) -> unsafe extern "C" fn(*mut c_void, MPI_Count, MPI_Datatype, c_int, MPI_Comm) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Bcast_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ibcast_c() -> unsafe extern "C" fn(
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ibcast_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Gather_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Gather_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Igather_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Igather_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Gatherv_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Gatherv_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Igatherv_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Igatherv_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Scatter_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Scatter_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Iscatter_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Iscatter_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Scatterv_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Scatterv_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Iscatterv_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Iscatterv_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Allgather_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Allgather_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Iallgather_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Iallgather_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Allgatherv_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Allgatherv_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Iallgatherv_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Iallgatherv_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Alltoall_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Alltoall_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ialltoall_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ialltoall_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Alltoallv_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Alltoallv_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ialltoallv_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ialltoallv_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Alltoallw_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        *const MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        *const MPI_Datatype,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Alltoallw_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ialltoallw_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        *const MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        *const MPI_Datatype,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ialltoallw_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Reduce_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Op,
+        c_int,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Reduce_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ireduce_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Op,
+        c_int,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ireduce_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Allreduce_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Allreduce_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Iallreduce_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Iallreduce_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Reduce_local_c(
+    ) -> unsafe extern "C" fn(*const c_void, *mut c_void, MPI_Count, MPI_Datatype, MPI_Op) -> c_int
+    {
+        unsafe { mem::transmute(TABLE.MPI_Reduce_local_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Reduce_scatter_block_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Reduce_scatter_block_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ireduce_scatter_block_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ireduce_scatter_block_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Reduce_scatter_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        *const MPI_Count,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Reduce_scatter_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ireduce_scatter_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        *const MPI_Count,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ireduce_scatter_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Scan_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Scan_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Iscan_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Iscan_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Exscan_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Exscan_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Iexscan_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Iexscan_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_allgather_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_allgather_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ineighbor_allgather_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ineighbor_allgather_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_allgatherv_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_allgatherv_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ineighbor_allgatherv_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ineighbor_allgatherv_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_alltoall_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_alltoall_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ineighbor_alltoall_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ineighbor_alltoall_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_alltoallv_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_alltoallv_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ineighbor_alltoallv_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ineighbor_alltoallv_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_alltoallw_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        *const MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        *const MPI_Datatype,
+        MPI_Comm,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_alltoallw_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Ineighbor_alltoallw_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        *const MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        *const MPI_Datatype,
+        MPI_Comm,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Ineighbor_alltoallw_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Psend_init() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        c_int,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Psend_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Precv_init() -> unsafe extern "C" fn(
+        *mut c_void,
+        c_int,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        c_int,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Precv_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Pready() -> unsafe extern "C" fn(c_int, MPI_Request) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Pready.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Pready_range() -> unsafe extern "C" fn(c_int, c_int, MPI_Request) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Pready_range.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Pready_list(
+    ) -> unsafe extern "C" fn(c_int, *const c_int, MPI_Request) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Pready_list.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Parrived() -> unsafe extern "C" fn(MPI_Request, c_int, *mut c_int) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Parrived.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Barrier_init(
+    ) -> unsafe extern "C" fn(MPI_Comm, MPI_Info, *mut MPI_Request) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Barrier_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Bcast_init() -> unsafe extern "C" fn(
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Bcast_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Gather_init() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Gather_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Gatherv_init() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut c_void,
+        *const c_int,
+        *const c_int,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Gatherv_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Scatter_init() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Scatter_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Scatterv_init() -> unsafe extern "C" fn(
+        *const c_void,
+        *const c_int,
+        *const c_int,
+        MPI_Datatype,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Scatterv_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Allgather_init() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Allgather_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Allgatherv_init() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut c_void,
+        *const c_int,
+        *const c_int,
+        MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Allgatherv_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Alltoall_init() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Alltoall_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Alltoallv_init() -> unsafe extern "C" fn(
+        *const c_void,
+        *const c_int,
+        *const c_int,
+        MPI_Datatype,
+        *mut c_void,
+        *const c_int,
+        *const c_int,
+        MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Alltoallv_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Alltoallw_init() -> unsafe extern "C" fn(
+        *const c_void,
+        *const c_int,
+        *const c_int,
+        *const MPI_Datatype,
+        *mut c_void,
+        *const c_int,
+        *const c_int,
+        *const MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Alltoallw_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Reduce_init() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        MPI_Op,
+        c_int,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Reduce_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Allreduce_init() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Allreduce_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Reduce_scatter_block_init() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Reduce_scatter_block_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Reduce_scatter_init() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        *const c_int,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Reduce_scatter_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Scan_init() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Scan_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Exscan_init() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Exscan_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Bcast_init_c() -> unsafe extern "C" fn(
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Bcast_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Gather_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Gather_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Gatherv_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Gatherv_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Scatter_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Scatter_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Scatterv_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        c_int,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Scatterv_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Allgather_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Allgather_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Allgatherv_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Allgatherv_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Alltoall_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Alltoall_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Alltoallv_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Alltoallv_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Alltoallw_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        *const MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        *const MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Alltoallw_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Reduce_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Op,
+        c_int,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Reduce_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Allreduce_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Allreduce_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Reduce_scatter_block_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe {
+            mem::transmute(
+                TABLE
+                    .MPI_Reduce_scatter_block_init_c
+                    .load(Ordering::Relaxed),
+            )
+        }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Reduce_scatter_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        *const MPI_Count,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Reduce_scatter_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Scan_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Scan_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Exscan_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Op,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Exscan_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_allgather_init() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_allgather_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_allgatherv_init() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut c_void,
+        *const c_int,
+        *const c_int,
+        MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_allgatherv_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_alltoall_init() -> unsafe extern "C" fn(
+        *const c_void,
+        c_int,
+        MPI_Datatype,
+        *mut c_void,
+        c_int,
+        MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_alltoall_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_alltoallv_init() -> unsafe extern "C" fn(
+        *const c_void,
+        *const c_int,
+        *const c_int,
+        MPI_Datatype,
+        *mut c_void,
+        *const c_int,
+        *const c_int,
+        MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_alltoallv_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_alltoallw_init() -> unsafe extern "C" fn(
+        *const c_void,
+        *const c_int,
+        *const MPI_Aint,
+        *const MPI_Datatype,
+        *mut c_void,
+        *const c_int,
+        *const MPI_Aint,
+        *const MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_alltoallw_init.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_allgather_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_allgather_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_allgatherv_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_allgatherv_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_alltoall_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        MPI_Count,
+        MPI_Datatype,
+        *mut c_void,
+        MPI_Count,
+        MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_alltoall_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_alltoallv_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_alltoallv_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPI_Neighbor_alltoallw_init_c() -> unsafe extern "C" fn(
+        *const c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        *const MPI_Datatype,
+        *mut c_void,
+        *const MPI_Count,
+        *const MPI_Aint,
+        *const MPI_Datatype,
+        MPI_Comm,
+        MPI_Info,
+        *mut MPI_Request,
+    ) -> c_int {
+        unsafe { mem::transmute(TABLE.MPI_Neighbor_alltoallw_init_c.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPIX_Query_cuda_support() -> unsafe extern "C" fn() -> c_int {
+        unsafe { mem::transmute(TABLE.MPIX_Query_cuda_support.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPIX_Query_hip_support() -> unsafe extern "C" fn() -> c_int {
+        unsafe { mem::transmute(TABLE.MPIX_Query_hip_support.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPIX_Query_rocm_support() -> unsafe extern "C" fn() -> c_int {
+        unsafe { mem::transmute(TABLE.MPIX_Query_rocm_support.load(Ordering::Relaxed)) }
+    }
+
+    #[inline(always)]
+    pub(crate) fn MPIX_Query_ze_support() -> unsafe extern "C" fn() -> c_int {
+        unsafe { mem::transmute(TABLE.MPIX_Query_ze_support.load(Ordering::Relaxed)) }
+    }
+}
+
+mod lazy {
+    use super::*;
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Send(
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Send())(buf, count, datatype, dest, tag, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Recv(
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        source: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Recv())(buf, count, datatype, source, tag, comm, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Get_count(
+        status: *const MPI_Status,
+        datatype: MPI_Datatype,
+        count: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Get_count())(status, datatype, count)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Bsend(
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Bsend())(buf, count, datatype, dest, tag, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ssend(
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ssend())(buf, count, datatype, dest, tag, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Rsend(
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Rsend())(buf, count, datatype, dest, tag, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Buffer_attach(buffer: *mut c_void, size: c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Buffer_attach())(buffer, size)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Buffer_detach(
+        buffer_addr: *mut c_void,
+        size: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Buffer_detach())(buffer_addr, size)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Isend(
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Isend())(buf, count, datatype, dest, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ibsend(
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ibsend())(buf, count, datatype, dest, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Issend(
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Issend())(buf, count, datatype, dest, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Irsend(
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Irsend())(buf, count, datatype, dest, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Irecv(
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        source: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Irecv())(buf, count, datatype, source, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Wait(
+        request: *mut MPI_Request,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Wait())(request, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Test(
+        request: *mut MPI_Request,
+        flag: *mut c_int,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Test())(request, flag, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Request_free(request: *mut MPI_Request) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Request_free())(request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Waitany(
+        count: c_int,
+        array_of_requests: *mut MPI_Request,
+        index: *mut c_int,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Waitany())(count, array_of_requests, index, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Testany(
+        count: c_int,
+        array_of_requests: *mut MPI_Request,
+        index: *mut c_int,
+        flag: *mut c_int,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Testany())(count, array_of_requests, index, flag, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Waitall(
+        count: c_int,
+        array_of_requests: *mut MPI_Request,
+        array_of_statuses: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Waitall())(count, array_of_requests, array_of_statuses)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Testall(
+        count: c_int,
+        array_of_requests: *mut MPI_Request,
+        flag: *mut c_int,
+        array_of_statuses: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Testall())(count, array_of_requests, flag, array_of_statuses)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Waitsome(
+        incount: c_int,
+        array_of_requests: *mut MPI_Request,
+        outcount: *mut c_int,
+        array_of_indices: *mut c_int,
+        array_of_statuses: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Waitsome())(
+            incount,
+            array_of_requests,
+            outcount,
+            array_of_indices,
+            array_of_statuses,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Testsome(
+        incount: c_int,
+        array_of_requests: *mut MPI_Request,
+        outcount: *mut c_int,
+        array_of_indices: *mut c_int,
+        array_of_statuses: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Testsome())(
+            incount,
+            array_of_requests,
+            outcount,
+            array_of_indices,
+            array_of_statuses,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Request_get_status(
+        request: MPI_Request,
+        flag: *mut c_int,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Request_get_status())(request, flag, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Iprobe(
+        source: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        flag: *mut c_int,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Iprobe())(source, tag, comm, flag, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Probe(
+        source: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Probe())(source, tag, comm, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Improbe(
+        source: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        flag: *mut c_int,
+        message: *mut MPI_Message,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Improbe())(source, tag, comm, flag, message, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Mprobe(
+        source: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        message: *mut MPI_Message,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Mprobe())(source, tag, comm, message, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Mrecv(
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        message: *mut MPI_Message,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Mrecv())(buf, count, datatype, message, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Imrecv(
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        message: *mut MPI_Message,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Imrecv())(buf, count, datatype, message, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Cancel(request: *mut MPI_Request) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Cancel())(request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Test_cancelled(
+        status: *const MPI_Status,
+        flag: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Test_cancelled())(status, flag)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Send_init(
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Send_init())(buf, count, datatype, dest, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Bsend_init(
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Bsend_init())(buf, count, datatype, dest, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ssend_init(
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ssend_init())(buf, count, datatype, dest, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Rsend_init(
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Rsend_init())(buf, count, datatype, dest, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Recv_init(
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        source: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Recv_init())(buf, count, datatype, source, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Start(request: *mut MPI_Request) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Start())(request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Startall(
+        count: c_int,
+        array_of_requests: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Startall())(count, array_of_requests)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Sendrecv(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        dest: c_int,
+        sendtag: c_int,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        source: c_int,
+        recvtag: c_int,
+        comm: MPI_Comm,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Sendrecv())(
+            sendbuf, sendcount, sendtype, dest, sendtag, recvbuf, recvcount, recvtype, source,
+            recvtag, comm, status,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Sendrecv_replace(
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        sendtag: c_int,
+        source: c_int,
+        recvtag: c_int,
+        comm: MPI_Comm,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Sendrecv_replace())(
+            buf, count, datatype, dest, sendtag, source, recvtag, comm, status,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_contiguous(
+        count: c_int,
+        oldtype: MPI_Datatype,
+        newtype: *mut MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_contiguous())(count, oldtype, newtype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_vector(
+        count: c_int,
+        blocklength: c_int,
+        stride: c_int,
+        oldtype: MPI_Datatype,
+        newtype: *mut MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_vector())(count, blocklength, stride, oldtype, newtype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_create_hvector(
+        count: c_int,
+        blocklength: c_int,
+        stride: MPI_Aint,
+        oldtype: MPI_Datatype,
+        newtype: *mut MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_create_hvector())(count, blocklength, stride, oldtype, newtype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_indexed(
+        count: c_int,
+        array_of_blocklengths: *const c_int,
+        array_of_displacements: *const c_int,
+        oldtype: MPI_Datatype,
+        newtype: *mut MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_indexed())(
+            count,
+            array_of_blocklengths,
+            array_of_displacements,
+            oldtype,
+            newtype,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_create_hindexed(
+        count: c_int,
+        array_of_blocklengths: *const c_int,
+        array_of_displacements: *const MPI_Aint,
+        oldtype: MPI_Datatype,
+        newtype: *mut MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_create_hindexed())(
+            count,
+            array_of_blocklengths,
+            array_of_displacements,
+            oldtype,
+            newtype,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_create_indexed_block(
+        count: c_int,
+        blocklength: c_int,
+        array_of_displacements: *const c_int,
+        oldtype: MPI_Datatype,
+        newtype: *mut MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_create_indexed_block())(
+            count,
+            blocklength,
+            array_of_displacements,
+            oldtype,
+            newtype,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_create_hindexed_block(
+        count: c_int,
+        blocklength: c_int,
+        array_of_displacements: *const MPI_Aint,
+        oldtype: MPI_Datatype,
+        newtype: *mut MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_create_hindexed_block())(
+            count,
+            blocklength,
+            array_of_displacements,
+            oldtype,
+            newtype,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_create_struct(
+        count: c_int,
+        array_of_blocklengths: *const c_int,
+        array_of_displacements: *const MPI_Aint,
+        array_of_types: *const MPI_Datatype,
+        newtype: *mut MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_create_struct())(
+            count,
+            array_of_blocklengths,
+            array_of_displacements,
+            array_of_types,
+            newtype,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_struct(
+        count: c_int,
+        array_of_blocklengths: *const c_int,
+        array_of_displacements: *const MPI_Aint,
+        array_of_types: *const MPI_Datatype,
+        newtype: *mut MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_struct())(
+            count,
+            array_of_blocklengths,
+            array_of_displacements,
+            array_of_types,
+            newtype,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_create_subarray(
+        ndims: c_int,
+        array_of_sizes: *const c_int,
+        array_of_subsizes: *const c_int,
+        array_of_starts: *const c_int,
+        ordder: c_int,
+        oldtype: MPI_Datatype,
+        newtype: *mut MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_create_subarray())(
+            ndims,
+            array_of_sizes,
+            array_of_subsizes,
+            array_of_starts,
+            ordder,
+            oldtype,
+            newtype,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_create_darray(
+        size: c_int,
+        rank: c_int,
+        ndims: c_int,
+        array_of_gsizes: *const c_int,
+        array_of_distribs: *const c_int,
+        array_of_dargs: *const c_int,
+        array_of_psizes: *const c_int,
+        order: c_int,
+        oldtype: MPI_Datatype,
+        newtype: *mut MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_create_darray())(
+            size,
+            rank,
+            ndims,
+            array_of_gsizes,
+            array_of_distribs,
+            array_of_dargs,
+            array_of_psizes,
+            order,
+            oldtype,
+            newtype,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Get_address(
+        location: *const c_void,
+        address: *mut MPI_Aint,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Get_address())(location, address)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Aint_add(base: MPI_Aint, disp: MPI_Aint) -> MPI_Aint {
+        resolve_function_table();
+        (entry::MPI_Aint_add())(base, disp)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Aint_diff(addr1: MPI_Aint, addr2: MPI_Aint) -> MPI_Aint {
+        resolve_function_table();
+        (entry::MPI_Aint_diff())(addr1, addr2)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_size(
+        datatype: MPI_Datatype,
+        size: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_size())(datatype, size)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_size_x(
+        datatype: MPI_Datatype,
+        size: *mut MPI_Count,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_size_x())(datatype, size)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_get_extent(
+        datatype: MPI_Datatype,
+        lb: *mut MPI_Aint,
+        extent: *mut MPI_Aint,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_get_extent())(datatype, lb, extent)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_get_extent_x(
+        datatype: MPI_Datatype,
+        lb: *mut MPI_Count,
+        extent: *mut MPI_Count,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_get_extent_x())(datatype, lb, extent)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_create_resized(
+        oldtype: MPI_Datatype,
+        lb: MPI_Aint,
+        extent: MPI_Aint,
+        newtype: *mut MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_create_resized())(oldtype, lb, extent, newtype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_get_true_extent(
+        datatype: MPI_Datatype,
+        true_lb: *mut MPI_Aint,
+        true_extent: *mut MPI_Aint,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_get_true_extent())(datatype, true_lb, true_extent)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_get_true_extent_x(
+        datatype: MPI_Datatype,
+        true_lb: *mut MPI_Count,
+        true_extent: *mut MPI_Count,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_get_true_extent_x())(datatype, true_lb, true_extent)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_commit(datatype: *mut MPI_Datatype) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_commit())(datatype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_free(datatype: *mut MPI_Datatype) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_free())(datatype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_dup(
+        oldtype: MPI_Datatype,
+        newtype: *mut MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_dup())(oldtype, newtype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Get_elements(
+        status: *const MPI_Status,
+        datatype: MPI_Datatype,
+        count: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Get_elements())(status, datatype, count)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Get_elements_x(
+        status: *const MPI_Status,
+        datatype: MPI_Datatype,
+        count: *mut MPI_Count,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Get_elements_x())(status, datatype, count)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_get_envelope(
+        datatype: MPI_Datatype,
+        num_integers: *mut c_int,
+        num_addresses: *mut c_int,
+        num_datatypes: *mut c_int,
+        combiner: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_get_envelope())(
+            datatype,
+            num_integers,
+            num_addresses,
+            num_datatypes,
+            combiner,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_get_contents(
+        datatype: MPI_Datatype,
+        max_integers: c_int,
+        max_addresses: c_int,
+        max_datatypes: c_int,
+        array_of_integers: *mut c_int,
+        array_of_addresses: *mut MPI_Aint,
+        array_of_datatypes: *mut MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_get_contents())(
+            datatype,
+            max_integers,
+            max_addresses,
+            max_datatypes,
+            array_of_integers,
+            array_of_addresses,
+            array_of_datatypes,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Pack(
+        inbuf: *const c_void,
+        incount: c_int,
+        datatype: MPI_Datatype,
+        outbuf: *mut c_void,
+        outsize: c_int,
+        position: *mut c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Pack())(inbuf, incount, datatype, outbuf, outsize, position, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Unpack(
+        inbuf: *const c_void,
+        insize: c_int,
+        position: *mut c_int,
+        outbuf: *mut c_void,
+        outcount: c_int,
+        datatype: MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Unpack())(inbuf, insize, position, outbuf, outcount, datatype, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Pack_size(
+        incount: c_int,
+        datatype: MPI_Datatype,
+        comm: MPI_Comm,
+        size: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Pack_size())(incount, datatype, comm, size)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Pack_external(
+        datarep: *const c_char,
+        inbuf: *const c_void,
+        incount: c_int,
+        datatype: MPI_Datatype,
+        outbuf: *mut c_void,
+        outsize: MPI_Aint,
+        position: *mut MPI_Aint,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Pack_external())(datarep, inbuf, incount, datatype, outbuf, outsize, position)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Unpack_external(
+        datarep: *const c_char,
+        inbuf: *const c_void,
+        insize: MPI_Aint,
+        position: *mut MPI_Aint,
+        outbuf: *mut c_void,
+        outcount: c_int,
+        datatype: MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Unpack_external())(datarep, inbuf, insize, position, outbuf, outcount, datatype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Pack_external_size(
+        datarep: *const c_char,
+        incount: c_int,
+        datatype: MPI_Datatype,
+        size: *mut MPI_Aint,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Pack_external_size())(datarep, incount, datatype, size)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Barrier(comm: MPI_Comm) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Barrier())(comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Bcast(
+        buffer: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Bcast())(buffer, count, datatype, root, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Gather(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Gather())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Gatherv(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        displs: *const c_int,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Gatherv())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, root, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Scatter(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Scatter())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Scatterv(
+        sendbuf: *const c_void,
+        sendcounts: *const c_int,
+        displs: *const c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Scatterv())(
+            sendbuf, sendcounts, displs, sendtype, recvbuf, recvcount, recvtype, root, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Allgather(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Allgather())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Allgatherv(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        displs: *const c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Allgatherv())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Alltoall(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Alltoall())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Alltoallv(
+        sendbuf: *const c_void,
+        sendcounts: *const c_int,
+        sdispls: *const c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        rdispls: *const c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Alltoallv())(
+            sendbuf, sendcounts, sdispls, sendtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Alltoallw(
+        sendbuf: *const c_void,
+        sendcounts: *const c_int,
+        sdispls: *const c_int,
+        sendtypes: *const MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        rdispls: *const c_int,
+        recvtypes: *const MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Alltoallw())(
+            sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Reduce(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        root: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Reduce())(sendbuf, recvbuf, count, datatype, op, root, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Op_create(
+        user_fn: MPI_User_function,
+        commute: c_int,
+        op: *mut MPI_Op,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Op_create())(user_fn, commute, op)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Op_free(op: *mut MPI_Op) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Op_free())(op)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Allreduce(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Allreduce())(sendbuf, recvbuf, count, datatype, op, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Op_commutative(op: MPI_Op, commute: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Op_commutative())(op, commute)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Reduce_local(
+        inbuf: *const c_void,
+        inoutbuf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Reduce_local())(inbuf, inoutbuf, count, datatype, op)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Reduce_scatter_block(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Reduce_scatter_block())(sendbuf, recvbuf, recvcount, datatype, op, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Reduce_scatter(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Reduce_scatter())(sendbuf, recvbuf, recvcounts, datatype, op, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Scan(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Scan())(sendbuf, recvbuf, count, datatype, op, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Exscan(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Exscan())(sendbuf, recvbuf, count, datatype, op, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ibarrier(
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ibarrier())(comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ibcast(
+        buffer: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ibcast())(buffer, count, datatype, root, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Igather(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Igather())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Igatherv(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        displs: *const c_int,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Igatherv())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, root, comm,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Iscatter(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Iscatter())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Iscatterv(
+        sendbuf: *const c_void,
+        sendcounts: *const c_int,
+        displs: *const c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Iscatterv())(
+            sendbuf, sendcounts, displs, sendtype, recvbuf, recvcount, recvtype, root, comm,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Iallgather(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Iallgather())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Iallgatherv(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        displs: *const c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Iallgatherv())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ialltoall(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ialltoall())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ialltoallv(
+        sendbuf: *const c_void,
+        sendcounts: *const c_int,
+        sdispls: *const c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        rdispls: *const c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ialltoallv())(
+            sendbuf, sendcounts, sdispls, sendtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ialltoallw(
+        sendbuf: *const c_void,
+        sendcounts: *const c_int,
+        sdispls: *const c_int,
+        sendtypes: *const MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        rdispls: *const c_int,
+        recvtypes: *const MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ialltoallw())(
+            sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ireduce(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        root: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ireduce())(sendbuf, recvbuf, count, datatype, op, root, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Iallreduce(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Iallreduce())(sendbuf, recvbuf, count, datatype, op, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ireduce_scatter_block(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ireduce_scatter_block())(
+            sendbuf, recvbuf, recvcount, datatype, op, comm, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ireduce_scatter(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ireduce_scatter())(sendbuf, recvbuf, recvcounts, datatype, op, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Iscan(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Iscan())(sendbuf, recvbuf, count, datatype, op, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Iexscan(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Iexscan())(sendbuf, recvbuf, count, datatype, op, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Group_size(group: MPI_Group, size: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Group_size())(group, size)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Group_rank(group: MPI_Group, rank: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Group_rank())(group, rank)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Group_translate_ranks(
+        group1: MPI_Group,
+        n: c_int,
+        ranks1: *const c_int,
+        group2: MPI_Group,
+        ranks2: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Group_translate_ranks())(group1, n, ranks1, group2, ranks2)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Group_compare(
+        group1: MPI_Group,
+        group2: MPI_Group,
+        result: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Group_compare())(group1, group2, result)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_group(comm: MPI_Comm, group: *mut MPI_Group) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_group())(comm, group)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Group_union(
+        group1: MPI_Group,
+        group2: MPI_Group,
+        newgroup: *mut MPI_Group,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Group_union())(group1, group2, newgroup)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Group_intersection(
+        group1: MPI_Group,
+        group2: MPI_Group,
+        newgroup: *mut MPI_Group,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Group_intersection())(group1, group2, newgroup)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Group_difference(
+        group1: MPI_Group,
+        group2: MPI_Group,
+        newgroup: *mut MPI_Group,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Group_difference())(group1, group2, newgroup)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Group_incl(
+        group: MPI_Group,
+        n: c_int,
+        ranks: *const c_int,
+        newgroup: *mut MPI_Group,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Group_incl())(group, n, ranks, newgroup)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Group_excl(
+        group: MPI_Group,
+        n: c_int,
+        ranks: *const c_int,
+        newgroup: *mut MPI_Group,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Group_excl())(group, n, ranks, newgroup)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Group_range_incl(
+        group: MPI_Group,
+        n: c_int,
+        ranges: *mut [c_int; 3],
+        newgroup: *mut MPI_Group,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Group_range_incl())(group, n, ranges, newgroup)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Group_range_excl(
+        group: MPI_Group,
+        n: c_int,
+        ranges: *mut [c_int; 3],
+        newgroup: *mut MPI_Group,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Group_range_excl())(group, n, ranges, newgroup)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Group_free(group: *mut MPI_Group) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Group_free())(group)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_size(comm: MPI_Comm, size: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_size())(comm, size)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_rank(comm: MPI_Comm, rank: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_rank())(comm, rank)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_compare(
+        comm1: MPI_Comm,
+        comm2: MPI_Comm,
+        result: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_compare())(comm1, comm2, result)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_dup(comm: MPI_Comm, newcomm: *mut MPI_Comm) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_dup())(comm, newcomm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_dup_with_info(
+        comm: MPI_Comm,
+        info: MPI_Info,
+        newcomm: *mut MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_dup_with_info())(comm, info, newcomm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_idup(
+        comm: MPI_Comm,
+        newcomm: *mut MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_idup())(comm, newcomm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_create(
+        comm: MPI_Comm,
+        group: MPI_Group,
+        newcomm: *mut MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_create())(comm, group, newcomm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_create_group(
+        comm: MPI_Comm,
+        group: MPI_Group,
+        tag: c_int,
+        newcomm: *mut MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_create_group())(comm, group, tag, newcomm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_split(
+        comm: MPI_Comm,
+        color: c_int,
+        key: c_int,
+        newcomm: *mut MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_split())(comm, color, key, newcomm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_split_type(
+        comm: MPI_Comm,
+        split_type: c_int,
+        key: c_int,
+        info: MPI_Info,
+        newcomm: *mut MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_split_type())(comm, split_type, key, info, newcomm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_free(comm: *mut MPI_Comm) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_free())(comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_set_info(comm: MPI_Comm, info: MPI_Info) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_set_info())(comm, info)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_get_info(
+        comm: MPI_Comm,
+        info: *mut MPI_Info,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_get_info())(comm, info)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_test_inter(comm: MPI_Comm, flag: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_test_inter())(comm, flag)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_remote_size(
+        comm: MPI_Comm,
+        size: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_remote_size())(comm, size)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_remote_group(
+        comm: MPI_Comm,
+        group: *mut MPI_Group,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_remote_group())(comm, group)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Intercomm_create(
+        local_comm: MPI_Comm,
+        local_leader: c_int,
+        peer_comm: MPI_Comm,
+        remote_leader: c_int,
+        tag: c_int,
+        newintercomm: *mut MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Intercomm_create())(
+            local_comm,
+            local_leader,
+            peer_comm,
+            remote_leader,
+            tag,
+            newintercomm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Intercomm_merge(
+        intercomm: MPI_Comm,
+        high: c_int,
+        newintracomm: *mut MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Intercomm_merge())(intercomm, high, newintracomm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_create_keyval(
+        comm_copy_attr_fn: MPI_Comm_copy_attr_function,
+        comm_delete_attr_fn: MPI_Comm_delete_attr_function,
+        comm_keyval: *mut c_int,
+        extra_state: *mut c_void,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_create_keyval())(
+            comm_copy_attr_fn,
+            comm_delete_attr_fn,
+            comm_keyval,
+            extra_state,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_free_keyval(comm_keyval: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_free_keyval())(comm_keyval)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_set_attr(
+        comm: MPI_Comm,
+        comm_keyval: c_int,
+        attribute_val: *mut c_void,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_set_attr())(comm, comm_keyval, attribute_val)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_get_attr(
+        comm: MPI_Comm,
+        comm_keyval: c_int,
+        attribute_val: *mut c_void,
+        flag: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_get_attr())(comm, comm_keyval, attribute_val, flag)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_delete_attr(
+        comm: MPI_Comm,
+        comm_keyval: c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_delete_attr())(comm, comm_keyval)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_create_keyval(
+        win_copy_attr_fn: MPI_Win_copy_attr_function,
+        win_delete_attr_fn: MPI_Win_delete_attr_function,
+        win_keyval: *mut c_int,
+        extra_state: *mut c_void,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_create_keyval())(
+            win_copy_attr_fn,
+            win_delete_attr_fn,
+            win_keyval,
+            extra_state,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_free_keyval(win_keyval: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_free_keyval())(win_keyval)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_set_attr(
+        win: MPI_Win,
+        win_keyval: c_int,
+        attribute_val: *mut c_void,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_set_attr())(win, win_keyval, attribute_val)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_get_attr(
+        win: MPI_Win,
+        win_keyval: c_int,
+        attribute_val: *mut c_void,
+        flag: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_get_attr())(win, win_keyval, attribute_val, flag)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_delete_attr(win: MPI_Win, win_keyval: c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_delete_attr())(win, win_keyval)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_create_keyval(
+        type_copy_attr_fn: MPI_Type_copy_attr_function,
+        type_delete_attr_fn: MPI_Type_delete_attr_function,
+        type_keyval: *mut c_int,
+        extra_state: *mut c_void,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_create_keyval())(
+            type_copy_attr_fn,
+            type_delete_attr_fn,
+            type_keyval,
+            extra_state,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_free_keyval(type_keyval: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_free_keyval())(type_keyval)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_set_attr(
+        type_: MPI_Datatype,
+        type_keyval: c_int,
+        attribute_val: *mut c_void,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_set_attr())(type_, type_keyval, attribute_val)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_get_attr(
+        type_: MPI_Datatype,
+        type_keyval: c_int,
+        attribute_val: *mut c_void,
+        flag: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_get_attr())(type_, type_keyval, attribute_val, flag)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_delete_attr(
+        type_: MPI_Datatype,
+        type_keyval: c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_delete_attr())(type_, type_keyval)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_set_name(
+        comm: MPI_Comm,
+        comm_name: *const c_char,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_set_name())(comm, comm_name)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_get_name(
+        comm: MPI_Comm,
+        comm_name: *mut c_char,
+        resultlen: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_get_name())(comm, comm_name, resultlen)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_set_name(
+        type_: MPI_Datatype,
+        type_name: *const c_char,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_set_name())(type_, type_name)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_get_name(
+        type_: MPI_Datatype,
+        type_name: *mut c_char,
+        resultlen: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_get_name())(type_, type_name, resultlen)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_set_name(
+        win: MPI_Win,
+        win_name: *const c_char,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_set_name())(win, win_name)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_get_name(
+        win: MPI_Win,
+        win_name: *mut c_char,
+        resultlen: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_get_name())(win, win_name, resultlen)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Cart_create(
+        comm_old: MPI_Comm,
+        ndims: c_int,
+        dims: *const c_int,
+        periods: *const c_int,
+        reorder: c_int,
+        comm_cart: *mut MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Cart_create())(comm_old, ndims, dims, periods, reorder, comm_cart)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Dims_create(
+        nnodes: c_int,
+        ndims: c_int,
+        dims: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Dims_create())(nnodes, ndims, dims)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Graph_create(
+        comm_old: MPI_Comm,
+        nnodes: c_int,
+        index: *const c_int,
+        edges: *const c_int,
+        reorder: c_int,
+        comm_graph: *mut MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Graph_create())(comm_old, nnodes, index, edges, reorder, comm_graph)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Dist_graph_create_adjacent(
+        comm_old: MPI_Comm,
+        indegree: c_int,
+        sources: *const c_int,
+        sourceweights: *const c_int,
+        outdegree: c_int,
+        destinations: *const c_int,
+        destweights: *const c_int,
+        info: MPI_Info,
+        reorder: c_int,
+        comm_dist_graph: *mut MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Dist_graph_create_adjacent())(
+            comm_old,
+            indegree,
+            sources,
+            sourceweights,
+            outdegree,
+            destinations,
+            destweights,
+            info,
+            reorder,
+            comm_dist_graph,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Dist_graph_create(
+        comm_old: MPI_Comm,
+        n: c_int,
+        sources: *const c_int,
+        degrees: *const c_int,
+        destinations: *const c_int,
+        weights: *const c_int,
+        info: MPI_Info,
+        reorder: c_int,
+        comm_dist_graph: *mut MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Dist_graph_create())(
+            comm_old,
+            n,
+            sources,
+            degrees,
+            destinations,
+            weights,
+            info,
+            reorder,
+            comm_dist_graph,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Topo_test(comm: MPI_Comm, status: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Topo_test())(comm, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Graphdims_get(
+        comm: MPI_Comm,
+        nnodes: *mut c_int,
+        nedges: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Graphdims_get())(comm, nnodes, nedges)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Graph_get(
+        comm: MPI_Comm,
+        maxindex: c_int,
+        maxedges: c_int,
+        index: *mut c_int,
+        edges: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Graph_get())(comm, maxindex, maxedges, index, edges)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Cartdim_get(comm: MPI_Comm, ndims: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Cartdim_get())(comm, ndims)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Cart_get(
+        comm: MPI_Comm,
+        maxdims: c_int,
+        dims: *mut c_int,
+        periods: *mut c_int,
+        coords: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Cart_get())(comm, maxdims, dims, periods, coords)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Cart_rank(
+        comm: MPI_Comm,
+        coords: *const c_int,
+        rank: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Cart_rank())(comm, coords, rank)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Cart_coords(
+        comm: MPI_Comm,
+        rank: c_int,
+        maxdims: c_int,
+        coords: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Cart_coords())(comm, rank, maxdims, coords)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Graph_neighbors_count(
+        comm: MPI_Comm,
+        rank: c_int,
+        nneighbors: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Graph_neighbors_count())(comm, rank, nneighbors)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Graph_neighbors(
+        comm: MPI_Comm,
+        rank: c_int,
+        maxneighbors: c_int,
+        neighbors: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Graph_neighbors())(comm, rank, maxneighbors, neighbors)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Dist_graph_neighbors_count(
+        comm: MPI_Comm,
+        indegree: *mut c_int,
+        outdegree: *mut c_int,
+        weighted: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Dist_graph_neighbors_count())(comm, indegree, outdegree, weighted)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Dist_graph_neighbors(
+        comm: MPI_Comm,
+        maxindeegree: c_int,
+        sources: *mut c_int,
+        wourceweights: *mut c_int,
+        maxoutdegree: c_int,
+        destinations: *mut c_int,
+        destweights: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Dist_graph_neighbors())(
+            comm,
+            maxindeegree,
+            sources,
+            wourceweights,
+            maxoutdegree,
+            destinations,
+            destweights,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Cart_shift(
+        comm: MPI_Comm,
+        direction: c_int,
+        disp: c_int,
+        rank_source: *mut c_int,
+        rank_dest: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Cart_shift())(comm, direction, disp, rank_source, rank_dest)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Cart_sub(
+        comm: MPI_Comm,
+        remain_dims: *const c_int,
+        newcomm: *mut MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Cart_sub())(comm, remain_dims, newcomm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Cart_map(
+        comm: MPI_Comm,
+        ndims: c_int,
+        dims: *const c_int,
+        periods: *const c_int,
+        newrank: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Cart_map())(comm, ndims, dims, periods, newrank)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Graph_map(
+        comm: MPI_Comm,
+        nnodes: c_int,
+        index: *const c_int,
+        edges: *const c_int,
+        newrank: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Graph_map())(comm, nnodes, index, edges, newrank)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_allgather(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_allgather())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_allgatherv(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        displs: *const c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_allgatherv())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoall(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        senddtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_alltoall())(
+            sendbuf, sendcount, senddtype, recvbuf, recvcount, recvtype, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoallv(
+        sendbuf: *const c_void,
+        sendcounts: *const c_int,
+        sdispls: *const c_int,
+        senddtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        rdispls: *const c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_alltoallv())(
+            sendbuf, sendcounts, sdispls, senddtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoallw(
+        sendbuf: *const c_void,
+        sendcounts: *const c_int,
+        sdispls: *const MPI_Aint,
+        sendtypes: *const MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        rdispls: *const MPI_Aint,
+        recvtypes: *const MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_alltoallw())(
+            sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_allgather(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ineighbor_allgather())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_allgatherv(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        displs: *const c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ineighbor_allgatherv())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_alltoall(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        senddtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ineighbor_alltoall())(
+            sendbuf, sendcount, senddtype, recvbuf, recvcount, recvtype, comm, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_alltoallv(
+        sendbuf: *const c_void,
+        sendcounts: *const c_int,
+        sdispls: *const c_int,
+        senddtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        rdispls: *const c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ineighbor_alltoallv())(
+            sendbuf, sendcounts, sdispls, senddtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_alltoallw(
+        sendbuf: *const c_void,
+        sendcounts: *const c_int,
+        sdispls: *const MPI_Aint,
+        sendtypes: *const MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        rdispls: *const MPI_Aint,
+        recvtypes: *const MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ineighbor_alltoallw())(
+            sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Get_version(
+        version: *mut c_int,
+        subversion: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Get_version())(version, subversion)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Get_library_version(
+        version: *mut c_char,
+        resultlen: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Get_library_version())(version, resultlen)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Get_processor_name(
+        name: *mut c_char,
+        resultlen: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Get_processor_name())(name, resultlen)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Alloc_mem(
+        size: MPI_Aint,
+        info: MPI_Info,
+        baseptr: *mut c_void,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Alloc_mem())(size, info, baseptr)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Free_mem(base: *mut c_void) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Free_mem())(base)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_create_errhandler(
+        comm_errhandler_fn: MPI_Comm_errhandler_function,
+        errhandler: *mut MPI_Errhandler,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_create_errhandler())(comm_errhandler_fn, errhandler)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_set_errhandler(
+        comm: MPI_Comm,
+        errhandler: MPI_Errhandler,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_set_errhandler())(comm, errhandler)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_get_errhandler(
+        comm: MPI_Comm,
+        errhandler: *mut MPI_Errhandler,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_get_errhandler())(comm, errhandler)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_create_errhandler(
+        win_errhandler_fn: MPI_Win_errhandler_function,
+        errhandler: *mut MPI_Errhandler,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_create_errhandler())(win_errhandler_fn, errhandler)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_set_errhandler(
+        win: MPI_Win,
+        errhandler: MPI_Errhandler,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_set_errhandler())(win, errhandler)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_get_errhandler(
+        win: MPI_Win,
+        errhandler: *mut MPI_Errhandler,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_get_errhandler())(win, errhandler)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_create_errhandler(
+        file_errhandler_fn: MPI_File_errhandler_function,
+        errhandler: *mut MPI_Errhandler,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_create_errhandler())(file_errhandler_fn, errhandler)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_set_errhandler(
+        file: MPI_File,
+        errhandler: MPI_Errhandler,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_set_errhandler())(file, errhandler)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_get_errhandler(
+        file: MPI_File,
+        errhandler: *mut MPI_Errhandler,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_get_errhandler())(file, errhandler)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Errhandler_free(errhandler: *mut MPI_Errhandler) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Errhandler_free())(errhandler)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Error_string(
+        errorcode: c_int,
+        string: *mut c_char,
+        resultlen: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Error_string())(errorcode, string, resultlen)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Error_class(
+        errorcode: c_int,
+        errorclass: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Error_class())(errorcode, errorclass)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Add_error_class(errorclass: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Add_error_class())(errorclass)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Add_error_code(
+        errorclass: c_int,
+        errorcode: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Add_error_code())(errorclass, errorcode)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Add_error_string(
+        errorcode: c_int,
+        string: *const c_char,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Add_error_string())(errorcode, string)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_call_errhandler(
+        comm: MPI_Comm,
+        errorcode: c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_call_errhandler())(comm, errorcode)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_call_errhandler(
+        win: MPI_Win,
+        errorcode: c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_call_errhandler())(win, errorcode)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_call_errhandler(
+        file: MPI_File,
+        errorcode: c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_call_errhandler())(file, errorcode)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Wtime() -> c_double {
+        resolve_function_table();
+        (entry::MPI_Wtime())()
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Wtick() -> c_double {
+        resolve_function_table();
+        (entry::MPI_Wtick())()
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Init(
+        argc: *mut c_int,
+        argv: *mut *mut *mut c_char,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Init())(argc, argv)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Finalize() -> c_int {
+        resolve_function_table();
+        (entry::MPI_Finalize())()
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Initialized(flag: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Initialized())(flag)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Abort(comm: MPI_Comm, errorcode: c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Abort())(comm, errorcode)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Finalized(flag: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Finalized())(flag)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Info_create(info: *mut MPI_Info) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Info_create())(info)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Info_set(
+        info: MPI_Info,
+        key: *const c_char,
+        value: *const c_char,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Info_set())(info, key, value)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Info_delete(info: MPI_Info, key: *const c_char) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Info_delete())(info, key)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Info_get(
+        info: MPI_Info,
+        key: *const c_char,
+        valuelen: c_int,
+        value: *mut c_char,
+        flag: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Info_get())(info, key, valuelen, value, flag)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Info_get_valuelen(
+        info: MPI_Info,
+        key: *const c_char,
+        valuelen: *mut c_int,
+        flag: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Info_get_valuelen())(info, key, valuelen, flag)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Info_get_nkeys(info: MPI_Info, nkeys: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Info_get_nkeys())(info, nkeys)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Info_get_nthkey(
+        info: MPI_Info,
+        n: c_int,
+        key: *mut c_char,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Info_get_nthkey())(info, n, key)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Info_dup(info: MPI_Info, newinfo: *mut MPI_Info) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Info_dup())(info, newinfo)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Info_free(info: *mut MPI_Info) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Info_free())(info)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_spawn(
+        command: *const c_char,
+        argv: *mut *mut c_char,
+        maxprocs: c_int,
+        info: MPI_Info,
+        root: c_int,
+        comm: MPI_Comm,
+        intercomm: *mut MPI_Comm,
+        array_off_errcodes: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_spawn())(
+            command,
+            argv,
+            maxprocs,
+            info,
+            root,
+            comm,
+            intercomm,
+            array_off_errcodes,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_get_parent(parent: *mut MPI_Comm) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_get_parent())(parent)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_spawn_multiple(
+        count: c_int,
+        array_of_commands: *mut *mut c_char,
+        array_of_argv: *mut *mut *mut c_char,
+        array_of_maxprocs: *const c_int,
+        array_of_info: *const MPI_Info,
+        root: c_int,
+        comm: MPI_Comm,
+        intercomm: *mut MPI_Comm,
+        array_of_errcodes: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_spawn_multiple())(
+            count,
+            array_of_commands,
+            array_of_argv,
+            array_of_maxprocs,
+            array_of_info,
+            root,
+            comm,
+            intercomm,
+            array_of_errcodes,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Open_port(info: MPI_Info, port_name: *mut c_char) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Open_port())(info, port_name)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Close_port(port_name: *const c_char) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Close_port())(port_name)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_accept(
+        port_name: *const c_char,
+        info: MPI_Info,
+        root: c_int,
+        comm: MPI_Comm,
+        newcomm: *mut MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_accept())(port_name, info, root, comm, newcomm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_connect(
+        port_name: *const c_char,
+        info: MPI_Info,
+        root: c_int,
+        comm: MPI_Comm,
+        newcomm: *mut MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_connect())(port_name, info, root, comm, newcomm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Publish_name(
+        service_name: *const c_char,
+        info: MPI_Info,
+        port_name: *const c_char,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Publish_name())(service_name, info, port_name)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Unpublish_name(
+        service_name: *const c_char,
+        info: MPI_Info,
+        port_name: *const c_char,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Unpublish_name())(service_name, info, port_name)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Lookup_name(
+        service_name: *const c_char,
+        info: MPI_Info,
+        port_name: *mut c_char,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Lookup_name())(service_name, info, port_name)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_disconnect(comm: *mut MPI_Comm) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_disconnect())(comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_join(fd: c_int, intercomm: *mut MPI_Comm) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Comm_join())(fd, intercomm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_create(
+        base: *mut c_void,
+        size: MPI_Aint,
+        disp_unit: c_int,
+        info: MPI_Info,
+        comm: MPI_Comm,
+        win: *mut MPI_Win,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_create())(base, size, disp_unit, info, comm, win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_allocate(
+        size: MPI_Aint,
+        disp_unit: c_int,
+        info: MPI_Info,
+        comm: MPI_Comm,
+        baseptr: *mut c_void,
+        win: *mut MPI_Win,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_allocate())(size, disp_unit, info, comm, baseptr, win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_allocate_shared(
+        size: MPI_Aint,
+        disp_unit: c_int,
+        info: MPI_Info,
+        comm: MPI_Comm,
+        baseptr: *mut c_void,
+        win: *mut MPI_Win,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_allocate_shared())(size, disp_unit, info, comm, baseptr, win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_shared_query(
+        win: MPI_Win,
+        rank: c_int,
+        size: *mut MPI_Aint,
+        disp_unit: *mut c_int,
+        baseptr: *mut c_void,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_shared_query())(win, rank, size, disp_unit, baseptr)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_create_dynamic(
+        info: MPI_Info,
+        comm: MPI_Comm,
+        win: *mut MPI_Win,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_create_dynamic())(info, comm, win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_attach(
+        win: MPI_Win,
+        base: *mut c_void,
+        size: MPI_Aint,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_attach())(win, base, size)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_detach(win: MPI_Win, base: *const c_void) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_detach())(win, base)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_free(win: *mut MPI_Win) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_free())(win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_get_group(
+        win: MPI_Win,
+        group: *mut MPI_Group,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_get_group())(win, group)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_set_info(win: MPI_Win, info: MPI_Info) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_set_info())(win, info)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_get_info(
+        win: MPI_Win,
+        info_used: *mut MPI_Info,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_get_info())(win, info_used)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Put(
+        origin_addr: *const c_void,
+        origin_count: c_int,
+        origin_datatype: MPI_Datatype,
+        target_rank: c_int,
+        target_disp: MPI_Aint,
+        target_count: c_int,
+        target_datatype: MPI_Datatype,
+        win: MPI_Win,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Put())(
+            origin_addr,
+            origin_count,
+            origin_datatype,
+            target_rank,
+            target_disp,
+            target_count,
+            target_datatype,
+            win,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Get(
+        origin_addr: *mut c_void,
+        origin_count: c_int,
+        origin_datatype: MPI_Datatype,
+        target_rank: c_int,
+        target_disp: MPI_Aint,
+        target_count: c_int,
+        target_datatype: MPI_Datatype,
+        win: MPI_Win,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Get())(
+            origin_addr,
+            origin_count,
+            origin_datatype,
+            target_rank,
+            target_disp,
+            target_count,
+            target_datatype,
+            win,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Accumulate(
+        origin_addr: *const c_void,
+        origin_count: c_int,
+        origin_datatype: MPI_Datatype,
+        target_rank: c_int,
+        target_disp: MPI_Aint,
+        target_count: c_int,
+        target_datatype: MPI_Datatype,
+        op: MPI_Op,
+        win: MPI_Win,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Accumulate())(
+            origin_addr,
+            origin_count,
+            origin_datatype,
+            target_rank,
+            target_disp,
+            target_count,
+            target_datatype,
+            op,
+            win,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Get_accumulate(
+        origin_addr: *const c_void,
+        origin_count: c_int,
+        origin_datatype: MPI_Datatype,
+        result_addr: *mut c_void,
+        result_count: c_int,
+        result_datatype: MPI_Datatype,
+        target_rank: c_int,
+        target_disp: MPI_Aint,
+        target_count: c_int,
+        target_datatype: MPI_Datatype,
+        op: MPI_Op,
+        win: MPI_Win,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Get_accumulate())(
+            origin_addr,
+            origin_count,
+            origin_datatype,
+            result_addr,
+            result_count,
+            result_datatype,
+            target_rank,
+            target_disp,
+            target_count,
+            target_datatype,
+            op,
+            win,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Fetch_and_op(
+        origin_addr: *const c_void,
+        result_addr: *mut c_void,
+        datatype: MPI_Datatype,
+        target_rank: c_int,
+        target_disp: MPI_Aint,
+        op: MPI_Op,
+        win: MPI_Win,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Fetch_and_op())(
+            origin_addr,
+            result_addr,
+            datatype,
+            target_rank,
+            target_disp,
+            op,
+            win,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Compare_and_swap(
+        origin_addr: *const c_void,
+        compare_addr: *const c_void,
+        result_addr: *mut c_void,
+        datatype: MPI_Datatype,
+        target_rank: c_int,
+        target_disp: MPI_Aint,
+        win: MPI_Win,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Compare_and_swap())(
+            origin_addr,
+            compare_addr,
+            result_addr,
+            datatype,
+            target_rank,
+            target_disp,
+            win,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Rput(
+        origin_addr: *const c_void,
+        origin_count: c_int,
+        origin_datatype: MPI_Datatype,
+        target_rank: c_int,
+        target_disp: MPI_Aint,
+        target_count: c_int,
+        target_datatype: MPI_Datatype,
+        win: MPI_Win,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Rput())(
+            origin_addr,
+            origin_count,
+            origin_datatype,
+            target_rank,
+            target_disp,
+            target_count,
+            target_datatype,
+            win,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Rget(
+        origin_addr: *mut c_void,
+        origin_count: c_int,
+        origin_datatype: MPI_Datatype,
+        target_rank: c_int,
+        target_disp: MPI_Aint,
+        target_count: c_int,
+        target_datatype: MPI_Datatype,
+        win: MPI_Win,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Rget())(
+            origin_addr,
+            origin_count,
+            origin_datatype,
+            target_rank,
+            target_disp,
+            target_count,
+            target_datatype,
+            win,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Raccumulate(
+        origin_addr: *const c_void,
+        origin_count: c_int,
+        origin_datatype: MPI_Datatype,
+        target_rank: c_int,
+        target_disp: MPI_Aint,
+        target_count: c_int,
+        target_datatype: MPI_Datatype,
+        op: MPI_Op,
+        win: MPI_Win,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Raccumulate())(
+            origin_addr,
+            origin_count,
+            origin_datatype,
+            target_rank,
+            target_disp,
+            target_count,
+            target_datatype,
+            op,
+            win,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Rget_accumulate(
+        origin_addr: *const c_void,
+        origin_count: c_int,
+        origin_datatype: MPI_Datatype,
+        result_addr: *mut c_void,
+        result_count: c_int,
+        result_datatype: MPI_Datatype,
+        target_rank: c_int,
+        target_disp: MPI_Aint,
+        target_count: c_int,
+        target_datatype: MPI_Datatype,
+        op: MPI_Op,
+        win: MPI_Win,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Rget_accumulate())(
+            origin_addr,
+            origin_count,
+            origin_datatype,
+            result_addr,
+            result_count,
+            result_datatype,
+            target_rank,
+            target_disp,
+            target_count,
+            target_datatype,
+            op,
+            win,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_fence(assert: c_int, win: MPI_Win) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_fence())(assert, win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_start(
+        group: MPI_Group,
+        assert: c_int,
+        win: MPI_Win,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_start())(group, assert, win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_complete(win: MPI_Win) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_complete())(win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_post(
+        group: MPI_Group,
+        assert: c_int,
+        win: MPI_Win,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_post())(group, assert, win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_wait(win: MPI_Win) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_wait())(win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_test(win: MPI_Win, flag: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_test())(win, flag)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_lock(
+        lock_type: c_int,
+        rank: c_int,
+        assert: c_int,
+        win: MPI_Win,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_lock())(lock_type, rank, assert, win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_lock_all(assert: c_int, win: MPI_Win) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_lock_all())(assert, win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_unlock(rank: c_int, win: MPI_Win) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_unlock())(rank, win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_unlock_all(win: MPI_Win) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_unlock_all())(win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_flush(rank: c_int, win: MPI_Win) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_flush())(rank, win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_flush_all(win: MPI_Win) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_flush_all())(win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_flush_local(rank: c_int, win: MPI_Win) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_flush_local())(rank, win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_flush_local_all(win: MPI_Win) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_flush_local_all())(win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_sync(win: MPI_Win) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Win_sync())(win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Grequest_start(
+        query_fn: MPI_Grequest_query_function,
+        free_fn: MPI_Grequest_free_function,
+        cancel_fn: MPI_Grequest_cancel_function,
+        extra_state: *mut c_void,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Grequest_start())(query_fn, free_fn, cancel_fn, extra_state, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Grequest_complete(request: MPI_Request) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Grequest_complete())(request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Status_set_elements(
+        status: *mut MPI_Status,
+        datatype: MPI_Datatype,
+        count: c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Status_set_elements())(status, datatype, count)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Status_set_elements_x(
+        status: *mut MPI_Status,
+        datatype: MPI_Datatype,
+        count: MPI_Count,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Status_set_elements_x())(status, datatype, count)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Status_set_cancelled(
+        status: *mut MPI_Status,
+        flag: c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Status_set_cancelled())(status, flag)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Init_thread(
+        argc: *mut c_int,
+        argv: *mut *mut *mut c_char,
+        required: c_int,
+        provided: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Init_thread())(argc, argv, required, provided)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Query_thread(provided: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Query_thread())(provided)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Is_thread_main(flag: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Is_thread_main())(flag)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_open(
+        comm: MPI_Comm,
+        filename: *const c_char,
+        amode: c_int,
+        info: MPI_Info,
+        fh: *mut MPI_File,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_open())(comm, filename, amode, info, fh)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_close(fh: *mut MPI_File) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_close())(fh)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_delete(
+        filename: *const c_char,
+        info: MPI_Info,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_delete())(filename, info)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_set_size(fh: MPI_File, size: MPI_Offset) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_set_size())(fh, size)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_preallocate(fh: MPI_File, size: MPI_Offset) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_preallocate())(fh, size)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_get_size(
+        fh: MPI_File,
+        size: *mut MPI_Offset,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_get_size())(fh, size)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_get_group(
+        fh: MPI_File,
+        group: *mut MPI_Group,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_get_group())(fh, group)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_get_amode(fh: MPI_File, amode: *mut c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_get_amode())(fh, amode)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_set_info(fh: MPI_File, info: MPI_Info) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_set_info())(fh, info)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_get_info(
+        fh: MPI_File,
+        info_used: *mut MPI_Info,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_get_info())(fh, info_used)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_set_view(
+        fh: MPI_File,
+        disp: MPI_Offset,
+        etype: MPI_Datatype,
+        filetype: MPI_Datatype,
+        datarep: *const c_char,
+        info: MPI_Info,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_set_view())(fh, disp, etype, filetype, datarep, info)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_get_view(
+        fh: MPI_File,
+        disp: *mut MPI_Offset,
+        etype: *mut MPI_Datatype,
+        filetype: *mut MPI_Datatype,
+        datarep: *mut c_char,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_get_view())(fh, disp, etype, filetype, datarep)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_read_at(
+        fh: MPI_File,
+        offset: MPI_Offset,
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_read_at())(fh, offset, buf, count, datatype, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_read_at_all(
+        fh: MPI_File,
+        offset: MPI_Offset,
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_read_at_all())(fh, offset, buf, count, datatype, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_write_at(
+        fh: MPI_File,
+        offset: MPI_Offset,
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_write_at())(fh, offset, buf, count, datatype, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_write_at_all(
+        fh: MPI_File,
+        offset: MPI_Offset,
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_write_at_all())(fh, offset, buf, count, datatype, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_iread_at(
+        fh: MPI_File,
+        offset: MPI_Offset,
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_iread_at())(fh, offset, buf, count, datatype, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_iread_at_all(
+        fh: MPI_File,
+        offset: MPI_Offset,
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_iread_at_all())(fh, offset, buf, count, datatype, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_iwrite_at(
+        fh: MPI_File,
+        offset: MPI_Offset,
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_iwrite_at())(fh, offset, buf, count, datatype, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_iwrite_at_all(
+        fh: MPI_File,
+        offset: MPI_Offset,
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_iwrite_at_all())(fh, offset, buf, count, datatype, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_read(
+        fh: MPI_File,
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_read())(fh, buf, count, datatype, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_read_all(
+        fh: MPI_File,
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_read_all())(fh, buf, count, datatype, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_write(
+        fh: MPI_File,
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_write())(fh, buf, count, datatype, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_write_all(
+        fh: MPI_File,
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_write_all())(fh, buf, count, datatype, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_iread(
+        fh: MPI_File,
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_iread())(fh, buf, count, datatype, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_iread_all(
+        fh: MPI_File,
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_iread_all())(fh, buf, count, datatype, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_iwrite(
+        fh: MPI_File,
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_iwrite())(fh, buf, count, datatype, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_iwrite_all(
+        fh: MPI_File,
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_iwrite_all())(fh, buf, count, datatype, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_seek(
+        fh: MPI_File,
+        offset: MPI_Offset,
+        whence: c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_seek())(fh, offset, whence)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_get_position(
+        fh: MPI_File,
+        offset: *mut MPI_Offset,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_get_position())(fh, offset)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_get_byte_offset(
+        fh: MPI_File,
+        offset: MPI_Offset,
+        disp: *mut MPI_Offset,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_get_byte_offset())(fh, offset, disp)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_read_shared(
+        fh: MPI_File,
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_read_shared())(fh, buf, count, datatype, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_write_shared(
+        fh: MPI_File,
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_write_shared())(fh, buf, count, datatype, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_iread_shared(
+        fh: MPI_File,
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_iread_shared())(fh, buf, count, datatype, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_iwrite_shared(
+        fh: MPI_File,
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_iwrite_shared())(fh, buf, count, datatype, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_read_ordered(
+        fh: MPI_File,
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_read_ordered())(fh, buf, count, datatype, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_write_ordered(
+        fh: MPI_File,
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_write_ordered())(fh, buf, count, datatype, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_seek_shared(
+        fh: MPI_File,
+        offset: MPI_Offset,
+        whence: c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_seek_shared())(fh, offset, whence)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_get_position_shared(
+        fh: MPI_File,
+        offset: *mut MPI_Offset,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_get_position_shared())(fh, offset)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_read_at_all_begin(
+        fh: MPI_File,
+        offset: MPI_Offset,
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_read_at_all_begin())(fh, offset, buf, count, datatype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_read_at_all_end(
+        fh: MPI_File,
+        buf: *mut c_void,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_read_at_all_end())(fh, buf, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_write_at_all_begin(
+        fh: MPI_File,
+        offset: MPI_Offset,
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_write_at_all_begin())(fh, offset, buf, count, datatype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_write_at_all_end(
+        fh: MPI_File,
+        buf: *const c_void,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_write_at_all_end())(fh, buf, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_read_all_begin(
+        fh: MPI_File,
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_read_all_begin())(fh, buf, count, datatype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_read_all_end(
+        fh: MPI_File,
+        buf: *mut c_void,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_read_all_end())(fh, buf, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_write_all_begin(
+        fh: MPI_File,
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_write_all_begin())(fh, buf, count, datatype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_write_all_end(
+        fh: MPI_File,
+        buf: *const c_void,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_write_all_end())(fh, buf, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_read_ordered_begin(
+        fh: MPI_File,
+        buf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_read_ordered_begin())(fh, buf, count, datatype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_read_ordered_end(
+        fh: MPI_File,
+        buf: *mut c_void,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_read_ordered_end())(fh, buf, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_write_ordered_begin(
+        fh: MPI_File,
+        buf: *const c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_write_ordered_begin())(fh, buf, count, datatype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_write_ordered_end(
+        fh: MPI_File,
+        buf: *const c_void,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_write_ordered_end())(fh, buf, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_get_type_extent(
+        fh: MPI_File,
+        datatype: MPI_Datatype,
+        extent: *mut MPI_Aint,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_get_type_extent())(fh, datatype, extent)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Register_datarep(
+        datarep: *const c_char,
+        read_conversion_fn: MPI_Datarep_conversion_function,
+        write_conversion_fn: MPI_Datarep_conversion_function,
+        dtype_file_extent_fn: MPI_Datarep_extent_function,
+        extra_state: *mut c_void,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Register_datarep())(
+            datarep,
+            read_conversion_fn,
+            write_conversion_fn,
+            dtype_file_extent_fn,
+            extra_state,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_set_atomicity(fh: MPI_File, flag: c_int) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_set_atomicity())(fh, flag)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_get_atomicity(
+        fh: MPI_File,
+        flag: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_get_atomicity())(fh, flag)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_sync(fh: MPI_File) -> c_int {
+        resolve_function_table();
+        (entry::MPI_File_sync())(fh)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_create_f90_real(
+        precision: c_int,
+        range: c_int,
+        newtype: *mut MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_create_f90_real())(precision, range, newtype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_create_f90_complex(
+        precision: c_int,
+        range: c_int,
+        newtype: *mut MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_create_f90_complex())(precision, range, newtype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_create_f90_integer(
+        range: c_int,
+        newtype: *mut MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_create_f90_integer())(range, newtype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_match_size(
+        typeclass: c_int,
+        size: c_int,
+        datatype: *mut MPI_Datatype,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_match_size())(typeclass, size, datatype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_f2c(comm: MPI_Fint) -> MPI_Comm {
+        resolve_function_table();
+        (entry::MPI_Comm_f2c())(comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Comm_c2f(comm: MPI_Comm) -> MPI_Fint {
+        resolve_function_table();
+        (entry::MPI_Comm_c2f())(comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_f2c(datatype: MPI_Fint) -> MPI_Datatype {
+        resolve_function_table();
+        (entry::MPI_Type_f2c())(datatype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_c2f(datatype: MPI_Datatype) -> MPI_Fint {
+        resolve_function_table();
+        (entry::MPI_Type_c2f())(datatype)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Group_f2c(group: MPI_Fint) -> MPI_Group {
+        resolve_function_table();
+        (entry::MPI_Group_f2c())(group)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Group_c2f(group: MPI_Group) -> MPI_Fint {
+        resolve_function_table();
+        (entry::MPI_Group_c2f())(group)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Request_f2c(request: MPI_Fint) -> MPI_Request {
+        resolve_function_table();
+        (entry::MPI_Request_f2c())(request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Request_c2f(request: MPI_Request) -> MPI_Fint {
+        resolve_function_table();
+        (entry::MPI_Request_c2f())(request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_f2c(file: MPI_Fint) -> MPI_File {
+        resolve_function_table();
+        (entry::MPI_File_f2c())(file)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_File_c2f(file: MPI_File) -> MPI_Fint {
+        resolve_function_table();
+        (entry::MPI_File_c2f())(file)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_f2c(win: MPI_Fint) -> MPI_Win {
+        resolve_function_table();
+        (entry::MPI_Win_f2c())(win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Win_c2f(win: MPI_Win) -> MPI_Fint {
+        resolve_function_table();
+        (entry::MPI_Win_c2f())(win)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Op_f2c(op: MPI_Fint) -> MPI_Op {
+        resolve_function_table();
+        (entry::MPI_Op_f2c())(op)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Op_c2f(op: MPI_Op) -> MPI_Fint {
+        resolve_function_table();
+        (entry::MPI_Op_c2f())(op)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Info_f2c(info: MPI_Fint) -> MPI_Info {
+        resolve_function_table();
+        (entry::MPI_Info_f2c())(info)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Info_c2f(info: MPI_Info) -> MPI_Fint {
+        resolve_function_table();
+        (entry::MPI_Info_c2f())(info)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Errhandler_f2c(info: MPI_Fint) -> MPI_Errhandler {
+        resolve_function_table();
+        (entry::MPI_Errhandler_f2c())(info)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Errhandler_c2f(info: MPI_Errhandler) -> MPI_Fint {
+        resolve_function_table();
+        (entry::MPI_Errhandler_c2f())(info)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Message_f2c(message: MPI_Fint) -> MPI_Message {
+        resolve_function_table();
+        (entry::MPI_Message_f2c())(message)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Message_c2f(message: MPI_Message) -> MPI_Fint {
+        resolve_function_table();
+        (entry::MPI_Message_c2f())(message)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Status_f2c(
+        f_status: *const MPI_Fint,
+        c_status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Status_f2c())(f_status, c_status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Status_c2f(
+        c_status: *const MPI_Status,
+        f_status: *mut MPI_Fint,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Status_c2f())(c_status, f_status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Send_c(
+        buf: *const c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Send_c())(buf, count, datatype, dest, tag, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Recv_c(
+        buf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        source: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Recv_c())(buf, count, datatype, source, tag, comm, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Get_count_c(
+        status: *const MPI_Status,
+        datatype: MPI_Datatype,
+        count: *mut MPI_Count,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Get_count_c())(status, datatype, count)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Bsend_c(
+        buf: *const c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Bsend_c())(buf, count, datatype, dest, tag, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ssend_c(
+        buf: *const c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ssend_c())(buf, count, datatype, dest, tag, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Rsend_c(
+        buf: *const c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Rsend_c())(buf, count, datatype, dest, tag, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Isend_c(
+        buf: *const c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Isend_c())(buf, count, datatype, dest, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ibsend_c(
+        buf: *const c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ibsend_c())(buf, count, datatype, dest, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Issend_c(
+        buf: *const c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Issend_c())(buf, count, datatype, dest, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Irsend_c(
+        buf: *const c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Irsend_c())(buf, count, datatype, dest, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Irecv_c(
+        buf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        source: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Irecv_c())(buf, count, datatype, source, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Send_init_c(
+        buf: *const c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Send_init_c())(buf, count, datatype, dest, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Bsend_init_c(
+        buf: *const c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Bsend_init_c())(buf, count, datatype, dest, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ssend_init_c(
+        buf: *const c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ssend_init_c())(buf, count, datatype, dest, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Rsend_init_c(
+        buf: *const c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Rsend_init_c())(buf, count, datatype, dest, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Recv_init_c(
+        buf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        source: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Recv_init_c())(buf, count, datatype, source, tag, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Sendrecv_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        dest: c_int,
+        sendtag: c_int,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        source: c_int,
+        recvtag: c_int,
+        comm: MPI_Comm,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Sendrecv_c())(
+            sendbuf, sendcount, sendtype, dest, sendtag, recvbuf, recvcount, recvtype, source,
+            recvtag, comm, status,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Sendrecv_replace_c(
+        buf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        sendtag: c_int,
+        source: c_int,
+        recvtag: c_int,
+        comm: MPI_Comm,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Sendrecv_replace_c())(
+            buf, count, datatype, dest, sendtag, source, recvtag, comm, status,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Mrecv_c(
+        buf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        message: *mut MPI_Message,
+        status: *mut MPI_Status,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Mrecv_c())(buf, count, datatype, message, status)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Imrecv_c(
+        buf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        message: *mut MPI_Message,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Imrecv_c())(buf, count, datatype, message, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Get_elements_c(
+        status: *const MPI_Status,
+        datatype: MPI_Datatype,
+        count: *mut MPI_Count,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Get_elements_c())(status, datatype, count)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_size_c(
+        datatype: MPI_Datatype,
+        size: *mut MPI_Count,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_size_c())(datatype, size)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_get_extent_c(
+        datatype: MPI_Datatype,
+        lb: *mut MPI_Count,
+        extent: *mut MPI_Count,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_get_extent_c())(datatype, lb, extent)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Type_get_true_extent_c(
+        datatype: MPI_Datatype,
+        true_lb: *mut MPI_Count,
+        true_extent: *mut MPI_Count,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Type_get_true_extent_c())(datatype, true_lb, true_extent)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Pack_c(
+        inbuf: *const c_void,
+        incount: MPI_Count,
+        datatype: MPI_Datatype,
+        outbuf: *mut c_void,
+        outsize: MPI_Count,
+        position: *mut MPI_Count,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Pack_c())(inbuf, incount, datatype, outbuf, outsize, position, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Unpack_c(
+        inbuf: *const c_void,
+        insize: MPI_Count,
+        position: *mut MPI_Count,
+        outbuf: *mut c_void,
+        outcount: MPI_Count,
+        datatype: MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Unpack_c())(inbuf, insize, position, outbuf, outcount, datatype, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Pack_size_c(
+        incount: MPI_Count,
+        datatype: MPI_Datatype,
+        comm: MPI_Comm,
+        size: *mut MPI_Count,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Pack_size_c())(incount, datatype, comm, size)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Bcast_c(
+        buffer: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Bcast_c())(buffer, count, datatype, root, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ibcast_c(
+        buffer: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ibcast_c())(buffer, count, datatype, root, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Gather_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Gather_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Igather_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Igather_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Gatherv_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        displs: *const MPI_Aint,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Gatherv_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, root, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Igatherv_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        displs: *const MPI_Aint,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Igatherv_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, root, comm,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Scatter_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Scatter_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Iscatter_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Iscatter_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Scatterv_c(
+        sendbuf: *const c_void,
+        sendcounts: *const MPI_Count,
+        displs: *const MPI_Aint,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Scatterv_c())(
+            sendbuf, sendcounts, displs, sendtype, recvbuf, recvcount, recvtype, root, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Iscatterv_c(
+        sendbuf: *const c_void,
+        sendcounts: *const MPI_Count,
+        displs: *const MPI_Aint,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Iscatterv_c())(
+            sendbuf, sendcounts, displs, sendtype, recvbuf, recvcount, recvtype, root, comm,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Allgather_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Allgather_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Iallgather_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Iallgather_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Allgatherv_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        displs: *const MPI_Aint,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Allgatherv_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Iallgatherv_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        displs: *const MPI_Aint,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Iallgatherv_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Alltoall_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Alltoall_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ialltoall_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ialltoall_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Alltoallv_c(
+        sendbuf: *const c_void,
+        sendcounts: *const MPI_Count,
+        sdispls: *const MPI_Aint,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        rdispls: *const MPI_Aint,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Alltoallv_c())(
+            sendbuf, sendcounts, sdispls, sendtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ialltoallv_c(
+        sendbuf: *const c_void,
+        sendcounts: *const MPI_Count,
+        sdispls: *const MPI_Aint,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        rdispls: *const MPI_Aint,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ialltoallv_c())(
+            sendbuf, sendcounts, sdispls, sendtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Alltoallw_c(
+        sendbuf: *const c_void,
+        sendcounts: *const MPI_Count,
+        sdispls: *const MPI_Aint,
+        sendtypes: *const MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        rdispls: *const MPI_Aint,
+        recvtypes: *const MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Alltoallw_c())(
+            sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ialltoallw_c(
+        sendbuf: *const c_void,
+        sendcounts: *const MPI_Count,
+        sdispls: *const MPI_Aint,
+        sendtypes: *const MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        rdispls: *const MPI_Aint,
+        recvtypes: *const MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ialltoallw_c())(
+            sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Reduce_c(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        root: c_int,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Reduce_c())(sendbuf, recvbuf, count, datatype, op, root, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ireduce_c(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        root: c_int,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ireduce_c())(sendbuf, recvbuf, count, datatype, op, root, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Allreduce_c(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Allreduce_c())(sendbuf, recvbuf, count, datatype, op, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Iallreduce_c(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Iallreduce_c())(sendbuf, recvbuf, count, datatype, op, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Reduce_local_c(
+        inbuf: *const c_void,
+        inoutbuf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Reduce_local_c())(inbuf, inoutbuf, count, datatype, op)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Reduce_scatter_block_c(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Reduce_scatter_block_c())(sendbuf, recvbuf, recvcount, datatype, op, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ireduce_scatter_block_c(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ireduce_scatter_block_c())(
+            sendbuf, recvbuf, recvcount, datatype, op, comm, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Reduce_scatter_c(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Reduce_scatter_c())(sendbuf, recvbuf, recvcounts, datatype, op, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ireduce_scatter_c(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ireduce_scatter_c())(sendbuf, recvbuf, recvcounts, datatype, op, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Scan_c(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Scan_c())(sendbuf, recvbuf, count, datatype, op, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Iscan_c(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Iscan_c())(sendbuf, recvbuf, count, datatype, op, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Exscan_c(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Exscan_c())(sendbuf, recvbuf, count, datatype, op, comm)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Iexscan_c(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Iexscan_c())(sendbuf, recvbuf, count, datatype, op, comm, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_allgather_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_allgather_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_allgather_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ineighbor_allgather_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_allgatherv_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        displs: *const MPI_Aint,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_allgatherv_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_allgatherv_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        displs: *const MPI_Aint,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ineighbor_allgatherv_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoall_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        senddtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_alltoall_c())(
+            sendbuf, sendcount, senddtype, recvbuf, recvcount, recvtype, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_alltoall_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        senddtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ineighbor_alltoall_c())(
+            sendbuf, sendcount, senddtype, recvbuf, recvcount, recvtype, comm, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoallv_c(
+        sendbuf: *const c_void,
+        sendcounts: *const MPI_Count,
+        sdispls: *const MPI_Aint,
+        senddtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        rdispls: *const MPI_Aint,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_alltoallv_c())(
+            sendbuf, sendcounts, sdispls, senddtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_alltoallv_c(
+        sendbuf: *const c_void,
+        sendcounts: *const MPI_Count,
+        sdispls: *const MPI_Aint,
+        senddtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        rdispls: *const MPI_Aint,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ineighbor_alltoallv_c())(
+            sendbuf, sendcounts, sdispls, senddtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoallw_c(
+        sendbuf: *const c_void,
+        sendcounts: *const MPI_Count,
+        sdispls: *const MPI_Aint,
+        sendtypes: *const MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        rdispls: *const MPI_Aint,
+        recvtypes: *const MPI_Datatype,
+        comm: MPI_Comm,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_alltoallw_c())(
+            sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_alltoallw_c(
+        sendbuf: *const c_void,
+        sendcounts: *const MPI_Count,
+        sdispls: *const MPI_Aint,
+        sendtypes: *const MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        rdispls: *const MPI_Aint,
+        recvtypes: *const MPI_Datatype,
+        comm: MPI_Comm,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Ineighbor_alltoallw_c())(
+            sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Psend_init(
+        buf: *const c_void,
+        partitions: c_int,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        dest: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Psend_init())(
+            buf, partitions, count, datatype, dest, tag, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Precv_init(
+        buf: *mut c_void,
+        partitions: c_int,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        source: c_int,
+        tag: c_int,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Precv_init())(
+            buf, partitions, count, datatype, source, tag, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Pready(partition: c_int, request: MPI_Request) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Pready())(partition, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Pready_range(
+        partition_low: c_int,
+        partition_high: c_int,
+        request: MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Pready_range())(partition_low, partition_high, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Pready_list(
+        length: c_int,
+        array_of_partitions: *const c_int,
+        request: MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Pready_list())(length, array_of_partitions, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Parrived(
+        request: MPI_Request,
+        partition: c_int,
+        flag: *mut c_int,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Parrived())(request, partition, flag)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Barrier_init(
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Barrier_init())(comm, info, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Bcast_init(
+        buffer: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Bcast_init())(buffer, count, datatype, root, comm, info, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Gather_init(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Gather_init())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Gatherv_init(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        displs: *const c_int,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Gatherv_init())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, root, comm, info,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Scatter_init(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Scatter_init())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Scatterv_init(
+        sendbuf: *const c_void,
+        sendcounts: *const c_int,
+        displs: *const c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Scatterv_init())(
+            sendbuf, sendcounts, displs, sendtype, recvbuf, recvcount, recvtype, root, comm, info,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Allgather_init(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Allgather_init())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Allgatherv_init(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        displs: *const c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Allgatherv_init())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm, info,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Alltoall_init(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Alltoall_init())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Alltoallv_init(
+        sendbuf: *const c_void,
+        sendcounts: *const c_int,
+        sdispls: *const c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        rdispls: *const c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Alltoallv_init())(
+            sendbuf, sendcounts, sdispls, sendtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+            info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Alltoallw_init(
+        sendbuf: *const c_void,
+        sendcounts: *const c_int,
+        sdispls: *const c_int,
+        sendtypes: *const MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        rdispls: *const c_int,
+        recvtypes: *const MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Alltoallw_init())(
+            sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+            info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Reduce_init(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        root: c_int,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Reduce_init())(
+            sendbuf, recvbuf, count, datatype, op, root, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Allreduce_init(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Allreduce_init())(sendbuf, recvbuf, count, datatype, op, comm, info, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Reduce_scatter_block_init(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Reduce_scatter_block_init())(
+            sendbuf, recvbuf, recvcount, datatype, op, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Reduce_scatter_init(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Reduce_scatter_init())(
+            sendbuf, recvbuf, recvcounts, datatype, op, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Scan_init(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Scan_init())(sendbuf, recvbuf, count, datatype, op, comm, info, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Exscan_init(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: c_int,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Exscan_init())(sendbuf, recvbuf, count, datatype, op, comm, info, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Bcast_init_c(
+        buffer: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Bcast_init_c())(buffer, count, datatype, root, comm, info, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Gather_init_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Gather_init_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Gatherv_init_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        displs: *const MPI_Aint,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Gatherv_init_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, root, comm, info,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Scatter_init_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Scatter_init_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Scatterv_init_c(
+        sendbuf: *const c_void,
+        sendcounts: *const MPI_Count,
+        displs: *const MPI_Aint,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        root: c_int,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Scatterv_init_c())(
+            sendbuf, sendcounts, displs, sendtype, recvbuf, recvcount, recvtype, root, comm, info,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Allgather_init_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Allgather_init_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Allgatherv_init_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        displs: *const MPI_Aint,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Allgatherv_init_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm, info,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Alltoall_init_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Alltoall_init_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Alltoallv_init_c(
+        sendbuf: *const c_void,
+        sendcounts: *const MPI_Count,
+        sdispls: *const MPI_Aint,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        rdispls: *const MPI_Aint,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Alltoallv_init_c())(
+            sendbuf, sendcounts, sdispls, sendtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+            info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Alltoallw_init_c(
+        sendbuf: *const c_void,
+        sendcounts: *const MPI_Count,
+        sdispls: *const MPI_Aint,
+        sendtypes: *const MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        rdispls: *const MPI_Aint,
+        recvtypes: *const MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Alltoallw_init_c())(
+            sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+            info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Reduce_init_c(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        root: c_int,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Reduce_init_c())(
+            sendbuf, recvbuf, count, datatype, op, root, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Allreduce_init_c(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Allreduce_init_c())(sendbuf, recvbuf, count, datatype, op, comm, info, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Reduce_scatter_block_init_c(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Reduce_scatter_block_init_c())(
+            sendbuf, recvbuf, recvcount, datatype, op, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Reduce_scatter_init_c(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Reduce_scatter_init_c())(
+            sendbuf, recvbuf, recvcounts, datatype, op, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Scan_init_c(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Scan_init_c())(sendbuf, recvbuf, count, datatype, op, comm, info, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Exscan_init_c(
+        sendbuf: *const c_void,
+        recvbuf: *mut c_void,
+        count: MPI_Count,
+        datatype: MPI_Datatype,
+        op: MPI_Op,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Exscan_init_c())(sendbuf, recvbuf, count, datatype, op, comm, info, request)
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_allgather_init(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_allgather_init())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_allgatherv_init(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        displs: *const c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_allgatherv_init())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm, info,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoall_init(
+        sendbuf: *const c_void,
+        sendcount: c_int,
+        senddtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_alltoall_init())(
+            sendbuf, sendcount, senddtype, recvbuf, recvcount, recvtype, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoallv_init(
+        sendbuf: *const c_void,
+        sendcounts: *const c_int,
+        sdispls: *const c_int,
+        senddtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        rdispls: *const c_int,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_alltoallv_init())(
+            sendbuf, sendcounts, sdispls, senddtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+            info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoallw_init(
+        sendbuf: *const c_void,
+        sendcounts: *const c_int,
+        sdispls: *const MPI_Aint,
+        sendtypes: *const MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const c_int,
+        rdispls: *const MPI_Aint,
+        recvtypes: *const MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_alltoallw_init())(
+            sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+            info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_allgather_init_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_allgather_init_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_allgatherv_init_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        sendtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        displs: *const MPI_Aint,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_allgatherv_init_c())(
+            sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm, info,
+            request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoall_init_c(
+        sendbuf: *const c_void,
+        sendcount: MPI_Count,
+        senddtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcount: MPI_Count,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_alltoall_init_c())(
+            sendbuf, sendcount, senddtype, recvbuf, recvcount, recvtype, comm, info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoallv_init_c(
+        sendbuf: *const c_void,
+        sendcounts: *const MPI_Count,
+        sdispls: *const MPI_Aint,
+        senddtype: MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        rdispls: *const MPI_Aint,
+        recvtype: MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_alltoallv_init_c())(
+            sendbuf, sendcounts, sdispls, senddtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+            info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoallw_init_c(
+        sendbuf: *const c_void,
+        sendcounts: *const MPI_Count,
+        sdispls: *const MPI_Aint,
+        sendtypes: *const MPI_Datatype,
+        recvbuf: *mut c_void,
+        recvcounts: *const MPI_Count,
+        rdispls: *const MPI_Aint,
+        recvtypes: *const MPI_Datatype,
+        comm: MPI_Comm,
+        info: MPI_Info,
+        request: *mut MPI_Request,
+    ) -> c_int {
+        resolve_function_table();
+        (entry::MPI_Neighbor_alltoallw_init_c())(
+            sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+            info, request,
+        )
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPIX_Query_cuda_support() -> c_int {
+        resolve_function_table();
+        (entry::MPIX_Query_cuda_support())()
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPIX_Query_hip_support() -> c_int {
+        resolve_function_table();
+        (entry::MPIX_Query_hip_support())()
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPIX_Query_rocm_support() -> c_int {
+        resolve_function_table();
+        (entry::MPIX_Query_rocm_support())()
+    }
+
+    #[cold]
+    pub(super) unsafe extern "C" fn MPIX_Query_ze_support() -> c_int {
+        resolve_function_table();
+        (entry::MPIX_Query_ze_support())()
+    }
+}
+
+mod missing {
+    use super::*;
+
+    pub(super) unsafe extern "C" fn MPI_Send(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Send")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Recv(
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Recv")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Get_count(
+        _: *const MPI_Status,
+        _: MPI_Datatype,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Get_count")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Bsend(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Bsend")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ssend(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ssend")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Rsend(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Rsend")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Buffer_attach(_: *mut c_void, _: c_int) -> c_int {
+        loader::missing_symbol("MPI_Buffer_attach")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Buffer_detach(_: *mut c_void, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Buffer_detach")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Isend(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Isend")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ibsend(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ibsend")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Issend(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Issend")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Irsend(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Irsend")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Irecv(
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Irecv")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Wait(_: *mut MPI_Request, _: *mut MPI_Status) -> c_int {
+        loader::missing_symbol("MPI_Wait")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Test(
+        _: *mut MPI_Request,
+        _: *mut c_int,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Test")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Request_free(_: *mut MPI_Request) -> c_int {
+        loader::missing_symbol("MPI_Request_free")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Waitany(
+        _: c_int,
+        _: *mut MPI_Request,
+        _: *mut c_int,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Waitany")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Testany(
+        _: c_int,
+        _: *mut MPI_Request,
+        _: *mut c_int,
+        _: *mut c_int,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Testany")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Waitall(
+        _: c_int,
+        _: *mut MPI_Request,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Waitall")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Testall(
+        _: c_int,
+        _: *mut MPI_Request,
+        _: *mut c_int,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Testall")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Waitsome(
+        _: c_int,
+        _: *mut MPI_Request,
+        _: *mut c_int,
+        _: *mut c_int,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Waitsome")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Testsome(
+        _: c_int,
+        _: *mut MPI_Request,
+        _: *mut c_int,
+        _: *mut c_int,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Testsome")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Request_get_status(
+        _: MPI_Request,
+        _: *mut c_int,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Request_get_status")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Iprobe(
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut c_int,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Iprobe")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Probe(
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Probe")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Improbe(
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut c_int,
+        _: *mut MPI_Message,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Improbe")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Mprobe(
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Message,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Mprobe")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Mrecv(
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Message,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Mrecv")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Imrecv(
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Message,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Imrecv")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Cancel(_: *mut MPI_Request) -> c_int {
+        loader::missing_symbol("MPI_Cancel")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Test_cancelled(
+        _: *const MPI_Status,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Test_cancelled")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Send_init(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Send_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Bsend_init(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Bsend_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ssend_init(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ssend_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Rsend_init(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Rsend_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Recv_init(
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Recv_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Start(_: *mut MPI_Request) -> c_int {
+        loader::missing_symbol("MPI_Start")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Startall(_: c_int, _: *mut MPI_Request) -> c_int {
+        loader::missing_symbol("MPI_Startall")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Sendrecv(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Sendrecv")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Sendrecv_replace(
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Sendrecv_replace")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_contiguous(
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_contiguous")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_vector(
+        _: c_int,
+        _: c_int,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_vector")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_create_hvector(
+        _: c_int,
+        _: c_int,
+        _: MPI_Aint,
+        _: MPI_Datatype,
+        _: *mut MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_create_hvector")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_indexed(
+        _: c_int,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_indexed")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_create_hindexed(
+        _: c_int,
+        _: *const c_int,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: *mut MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_create_hindexed")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_create_indexed_block(
+        _: c_int,
+        _: c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_create_indexed_block")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_create_hindexed_block(
+        _: c_int,
+        _: c_int,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: *mut MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_create_hindexed_block")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_create_struct(
+        _: c_int,
+        _: *const c_int,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: *mut MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_create_struct")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_struct(
+        _: c_int,
+        _: *const c_int,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: *mut MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_struct")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_create_subarray(
+        _: c_int,
+        _: *const c_int,
+        _: *const c_int,
+        _: *const c_int,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_create_subarray")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_create_darray(
+        _: c_int,
+        _: c_int,
+        _: c_int,
+        _: *const c_int,
+        _: *const c_int,
+        _: *const c_int,
+        _: *const c_int,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_create_darray")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Get_address(_: *const c_void, _: *mut MPI_Aint) -> c_int {
+        loader::missing_symbol("MPI_Get_address")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Aint_add(_: MPI_Aint, _: MPI_Aint) -> MPI_Aint {
+        loader::missing_symbol("MPI_Aint_add")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Aint_diff(_: MPI_Aint, _: MPI_Aint) -> MPI_Aint {
+        loader::missing_symbol("MPI_Aint_diff")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_size(_: MPI_Datatype, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Type_size")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_size_x(_: MPI_Datatype, _: *mut MPI_Count) -> c_int {
+        loader::missing_symbol("MPI_Type_size_x")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_get_extent(
+        _: MPI_Datatype,
+        _: *mut MPI_Aint,
+        _: *mut MPI_Aint,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_get_extent")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_get_extent_x(
+        _: MPI_Datatype,
+        _: *mut MPI_Count,
+        _: *mut MPI_Count,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_get_extent_x")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_create_resized(
+        _: MPI_Datatype,
+        _: MPI_Aint,
+        _: MPI_Aint,
+        _: *mut MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_create_resized")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_get_true_extent(
+        _: MPI_Datatype,
+        _: *mut MPI_Aint,
+        _: *mut MPI_Aint,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_get_true_extent")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_get_true_extent_x(
+        _: MPI_Datatype,
+        _: *mut MPI_Count,
+        _: *mut MPI_Count,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_get_true_extent_x")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_commit(_: *mut MPI_Datatype) -> c_int {
+        loader::missing_symbol("MPI_Type_commit")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_free(_: *mut MPI_Datatype) -> c_int {
+        loader::missing_symbol("MPI_Type_free")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_dup(_: MPI_Datatype, _: *mut MPI_Datatype) -> c_int {
+        loader::missing_symbol("MPI_Type_dup")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Get_elements(
+        _: *const MPI_Status,
+        _: MPI_Datatype,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Get_elements")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Get_elements_x(
+        _: *const MPI_Status,
+        _: MPI_Datatype,
+        _: *mut MPI_Count,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Get_elements_x")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_get_envelope(
+        _: MPI_Datatype,
+        _: *mut c_int,
+        _: *mut c_int,
+        _: *mut c_int,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_get_envelope")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_get_contents(
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: c_int,
+        _: *mut c_int,
+        _: *mut MPI_Aint,
+        _: *mut MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_get_contents")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Pack(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: *mut c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Pack")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Unpack(
+        _: *const c_void,
+        _: c_int,
+        _: *mut c_int,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Unpack")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Pack_size(
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Pack_size")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Pack_external(
+        _: *const c_char,
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Aint,
+        _: *mut MPI_Aint,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Pack_external")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Unpack_external(
+        _: *const c_char,
+        _: *const c_void,
+        _: MPI_Aint,
+        _: *mut MPI_Aint,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Unpack_external")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Pack_external_size(
+        _: *const c_char,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Aint,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Pack_external_size")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Barrier(_: MPI_Comm) -> c_int {
+        loader::missing_symbol("MPI_Barrier")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Bcast(
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Bcast")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Gather(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Gather")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Gatherv(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Gatherv")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Scatter(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Scatter")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Scatterv(
+        _: *const c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Scatterv")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Allgather(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Allgather")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Allgatherv(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Allgatherv")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Alltoall(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Alltoall")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Alltoallv(
+        _: *const c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Alltoallv")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Alltoallw(
+        _: *const c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: *const MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: *const MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Alltoallw")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Reduce(
+        _: *const c_void,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Reduce")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Op_create(
+        _: MPI_User_function,
+        _: c_int,
+        _: *mut MPI_Op,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Op_create")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Op_free(_: *mut MPI_Op) -> c_int {
+        loader::missing_symbol("MPI_Op_free")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Allreduce(
+        _: *const c_void,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Allreduce")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Op_commutative(_: MPI_Op, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Op_commutative")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Reduce_local(
+        _: *const c_void,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Reduce_local")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Reduce_scatter_block(
+        _: *const c_void,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Reduce_scatter_block")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Reduce_scatter(
+        _: *const c_void,
+        _: *mut c_void,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Reduce_scatter")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Scan(
+        _: *const c_void,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Scan")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Exscan(
+        _: *const c_void,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Exscan")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ibarrier(_: MPI_Comm, _: *mut MPI_Request) -> c_int {
+        loader::missing_symbol("MPI_Ibarrier")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ibcast(
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ibcast")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Igather(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Igather")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Igatherv(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Igatherv")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Iscatter(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Iscatter")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Iscatterv(
+        _: *const c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Iscatterv")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Iallgather(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Iallgather")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Iallgatherv(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Iallgatherv")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ialltoall(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ialltoall")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ialltoallv(
+        _: *const c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ialltoallv")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ialltoallw(
+        _: *const c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: *const MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: *const MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ialltoallw")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ireduce(
+        _: *const c_void,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ireduce")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Iallreduce(
+        _: *const c_void,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Iallreduce")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ireduce_scatter_block(
+        _: *const c_void,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ireduce_scatter_block")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ireduce_scatter(
+        _: *const c_void,
+        _: *mut c_void,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ireduce_scatter")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Iscan(
+        _: *const c_void,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Iscan")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Iexscan(
+        _: *const c_void,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Iexscan")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Group_size(_: MPI_Group, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Group_size")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Group_rank(_: MPI_Group, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Group_rank")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Group_translate_ranks(
+        _: MPI_Group,
+        _: c_int,
+        _: *const c_int,
+        _: MPI_Group,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Group_translate_ranks")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Group_compare(
+        _: MPI_Group,
+        _: MPI_Group,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Group_compare")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_group(_: MPI_Comm, _: *mut MPI_Group) -> c_int {
+        loader::missing_symbol("MPI_Comm_group")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Group_union(
+        _: MPI_Group,
+        _: MPI_Group,
+        _: *mut MPI_Group,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Group_union")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Group_intersection(
+        _: MPI_Group,
+        _: MPI_Group,
+        _: *mut MPI_Group,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Group_intersection")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Group_difference(
+        _: MPI_Group,
+        _: MPI_Group,
+        _: *mut MPI_Group,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Group_difference")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Group_incl(
+        _: MPI_Group,
+        _: c_int,
+        _: *const c_int,
+        _: *mut MPI_Group,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Group_incl")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Group_excl(
+        _: MPI_Group,
+        _: c_int,
+        _: *const c_int,
+        _: *mut MPI_Group,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Group_excl")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Group_range_incl(
+        _: MPI_Group,
+        _: c_int,
+        _: *mut [c_int; 3],
+        _: *mut MPI_Group,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Group_range_incl")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Group_range_excl(
+        _: MPI_Group,
+        _: c_int,
+        _: *mut [c_int; 3],
+        _: *mut MPI_Group,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Group_range_excl")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Group_free(_: *mut MPI_Group) -> c_int {
+        loader::missing_symbol("MPI_Group_free")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_size(_: MPI_Comm, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Comm_size")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_rank(_: MPI_Comm, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Comm_rank")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_compare(
+        _: MPI_Comm,
+        _: MPI_Comm,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Comm_compare")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_dup(_: MPI_Comm, _: *mut MPI_Comm) -> c_int {
+        loader::missing_symbol("MPI_Comm_dup")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_dup_with_info(
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Comm_dup_with_info")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_idup(
+        _: MPI_Comm,
+        _: *mut MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Comm_idup")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_create(
+        _: MPI_Comm,
+        _: MPI_Group,
+        _: *mut MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Comm_create")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_create_group(
+        _: MPI_Comm,
+        _: MPI_Group,
+        _: c_int,
+        _: *mut MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Comm_create_group")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_split(
+        _: MPI_Comm,
+        _: c_int,
+        _: c_int,
+        _: *mut MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Comm_split")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_split_type(
+        _: MPI_Comm,
+        _: c_int,
+        _: c_int,
+        _: MPI_Info,
+        _: *mut MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Comm_split_type")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_free(_: *mut MPI_Comm) -> c_int {
+        loader::missing_symbol("MPI_Comm_free")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_set_info(_: MPI_Comm, _: MPI_Info) -> c_int {
+        loader::missing_symbol("MPI_Comm_set_info")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_get_info(_: MPI_Comm, _: *mut MPI_Info) -> c_int {
+        loader::missing_symbol("MPI_Comm_get_info")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_test_inter(_: MPI_Comm, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Comm_test_inter")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_remote_size(_: MPI_Comm, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Comm_remote_size")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_remote_group(_: MPI_Comm, _: *mut MPI_Group) -> c_int {
+        loader::missing_symbol("MPI_Comm_remote_group")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Intercomm_create(
+        _: MPI_Comm,
+        _: c_int,
+        _: MPI_Comm,
+        _: c_int,
+        _: c_int,
+        _: *mut MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Intercomm_create")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Intercomm_merge(
+        _: MPI_Comm,
+        _: c_int,
+        _: *mut MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Intercomm_merge")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_create_keyval(
+        _: MPI_Comm_copy_attr_function,
+        _: MPI_Comm_delete_attr_function,
+        _: *mut c_int,
+        _: *mut c_void,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Comm_create_keyval")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_free_keyval(_: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Comm_free_keyval")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_set_attr(
+        _: MPI_Comm,
+        _: c_int,
+        _: *mut c_void,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Comm_set_attr")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_get_attr(
+        _: MPI_Comm,
+        _: c_int,
+        _: *mut c_void,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Comm_get_attr")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_delete_attr(_: MPI_Comm, _: c_int) -> c_int {
+        loader::missing_symbol("MPI_Comm_delete_attr")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_create_keyval(
+        _: MPI_Win_copy_attr_function,
+        _: MPI_Win_delete_attr_function,
+        _: *mut c_int,
+        _: *mut c_void,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Win_create_keyval")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_free_keyval(_: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Win_free_keyval")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_set_attr(
+        _: MPI_Win,
+        _: c_int,
+        _: *mut c_void,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Win_set_attr")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_get_attr(
+        _: MPI_Win,
+        _: c_int,
+        _: *mut c_void,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Win_get_attr")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_delete_attr(_: MPI_Win, _: c_int) -> c_int {
+        loader::missing_symbol("MPI_Win_delete_attr")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_create_keyval(
+        _: MPI_Type_copy_attr_function,
+        _: MPI_Type_delete_attr_function,
+        _: *mut c_int,
+        _: *mut c_void,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_create_keyval")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_free_keyval(_: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Type_free_keyval")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_set_attr(
+        _: MPI_Datatype,
+        _: c_int,
+        _: *mut c_void,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_set_attr")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_get_attr(
+        _: MPI_Datatype,
+        _: c_int,
+        _: *mut c_void,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_get_attr")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_delete_attr(_: MPI_Datatype, _: c_int) -> c_int {
+        loader::missing_symbol("MPI_Type_delete_attr")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_set_name(_: MPI_Comm, _: *const c_char) -> c_int {
+        loader::missing_symbol("MPI_Comm_set_name")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_get_name(
+        _: MPI_Comm,
+        _: *mut c_char,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Comm_get_name")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_set_name(_: MPI_Datatype, _: *const c_char) -> c_int {
+        loader::missing_symbol("MPI_Type_set_name")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_get_name(
+        _: MPI_Datatype,
+        _: *mut c_char,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_get_name")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_set_name(_: MPI_Win, _: *const c_char) -> c_int {
+        loader::missing_symbol("MPI_Win_set_name")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_get_name(
+        _: MPI_Win,
+        _: *mut c_char,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Win_get_name")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Cart_create(
+        _: MPI_Comm,
+        _: c_int,
+        _: *const c_int,
+        _: *const c_int,
+        _: c_int,
+        _: *mut MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Cart_create")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Dims_create(_: c_int, _: c_int, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Dims_create")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Graph_create(
+        _: MPI_Comm,
+        _: c_int,
+        _: *const c_int,
+        _: *const c_int,
+        _: c_int,
+        _: *mut MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Graph_create")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Dist_graph_create_adjacent(
+        _: MPI_Comm,
+        _: c_int,
+        _: *const c_int,
+        _: *const c_int,
+        _: c_int,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Info,
+        _: c_int,
+        _: *mut MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Dist_graph_create_adjacent")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Dist_graph_create(
+        _: MPI_Comm,
+        _: c_int,
+        _: *const c_int,
+        _: *const c_int,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Info,
+        _: c_int,
+        _: *mut MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Dist_graph_create")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Topo_test(_: MPI_Comm, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Topo_test")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Graphdims_get(
+        _: MPI_Comm,
+        _: *mut c_int,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Graphdims_get")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Graph_get(
+        _: MPI_Comm,
+        _: c_int,
+        _: c_int,
+        _: *mut c_int,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Graph_get")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Cartdim_get(_: MPI_Comm, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Cartdim_get")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Cart_get(
+        _: MPI_Comm,
+        _: c_int,
+        _: *mut c_int,
+        _: *mut c_int,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Cart_get")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Cart_rank(
+        _: MPI_Comm,
+        _: *const c_int,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Cart_rank")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Cart_coords(
+        _: MPI_Comm,
+        _: c_int,
+        _: c_int,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Cart_coords")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Graph_neighbors_count(
+        _: MPI_Comm,
+        _: c_int,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Graph_neighbors_count")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Graph_neighbors(
+        _: MPI_Comm,
+        _: c_int,
+        _: c_int,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Graph_neighbors")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Dist_graph_neighbors_count(
+        _: MPI_Comm,
+        _: *mut c_int,
+        _: *mut c_int,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Dist_graph_neighbors_count")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Dist_graph_neighbors(
+        _: MPI_Comm,
+        _: c_int,
+        _: *mut c_int,
+        _: *mut c_int,
+        _: c_int,
+        _: *mut c_int,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Dist_graph_neighbors")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Cart_shift(
+        _: MPI_Comm,
+        _: c_int,
+        _: c_int,
+        _: *mut c_int,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Cart_shift")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Cart_sub(
+        _: MPI_Comm,
+        _: *const c_int,
+        _: *mut MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Cart_sub")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Cart_map(
+        _: MPI_Comm,
+        _: c_int,
+        _: *const c_int,
+        _: *const c_int,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Cart_map")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Graph_map(
+        _: MPI_Comm,
+        _: c_int,
+        _: *const c_int,
+        _: *const c_int,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Graph_map")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_allgather(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_allgather")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_allgatherv(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_allgatherv")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoall(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_alltoall")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoallv(
+        _: *const c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_alltoallv")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoallw(
+        _: *const c_void,
+        _: *const c_int,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_alltoallw")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_allgather(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ineighbor_allgather")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_allgatherv(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ineighbor_allgatherv")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_alltoall(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ineighbor_alltoall")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_alltoallv(
+        _: *const c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ineighbor_alltoallv")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_alltoallw(
+        _: *const c_void,
+        _: *const c_int,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ineighbor_alltoallw")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Get_version(_: *mut c_int, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Get_version")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Get_library_version(
+        _: *mut c_char,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Get_library_version")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Get_processor_name(_: *mut c_char, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Get_processor_name")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Alloc_mem(
+        _: MPI_Aint,
+        _: MPI_Info,
+        _: *mut c_void,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Alloc_mem")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Free_mem(_: *mut c_void) -> c_int {
+        loader::missing_symbol("MPI_Free_mem")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_create_errhandler(
+        _: MPI_Comm_errhandler_function,
+        _: *mut MPI_Errhandler,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Comm_create_errhandler")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_set_errhandler(
+        _: MPI_Comm,
+        _: MPI_Errhandler,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Comm_set_errhandler")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_get_errhandler(
+        _: MPI_Comm,
+        _: *mut MPI_Errhandler,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Comm_get_errhandler")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_create_errhandler(
+        _: MPI_Win_errhandler_function,
+        _: *mut MPI_Errhandler,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Win_create_errhandler")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_set_errhandler(_: MPI_Win, _: MPI_Errhandler) -> c_int {
+        loader::missing_symbol("MPI_Win_set_errhandler")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_get_errhandler(
+        _: MPI_Win,
+        _: *mut MPI_Errhandler,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Win_get_errhandler")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_create_errhandler(
+        _: MPI_File_errhandler_function,
+        _: *mut MPI_Errhandler,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_create_errhandler")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_set_errhandler(
+        _: MPI_File,
+        _: MPI_Errhandler,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_set_errhandler")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_get_errhandler(
+        _: MPI_File,
+        _: *mut MPI_Errhandler,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_get_errhandler")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Errhandler_free(_: *mut MPI_Errhandler) -> c_int {
+        loader::missing_symbol("MPI_Errhandler_free")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Error_string(
+        _: c_int,
+        _: *mut c_char,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Error_string")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Error_class(_: c_int, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Error_class")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Add_error_class(_: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Add_error_class")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Add_error_code(_: c_int, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Add_error_code")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Add_error_string(_: c_int, _: *const c_char) -> c_int {
+        loader::missing_symbol("MPI_Add_error_string")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_call_errhandler(_: MPI_Comm, _: c_int) -> c_int {
+        loader::missing_symbol("MPI_Comm_call_errhandler")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_call_errhandler(_: MPI_Win, _: c_int) -> c_int {
+        loader::missing_symbol("MPI_Win_call_errhandler")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_call_errhandler(_: MPI_File, _: c_int) -> c_int {
+        loader::missing_symbol("MPI_File_call_errhandler")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Wtime() -> c_double {
+        loader::missing_symbol("MPI_Wtime")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Wtick() -> c_double {
+        loader::missing_symbol("MPI_Wtick")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Init(_: *mut c_int, _: *mut *mut *mut c_char) -> c_int {
+        loader::missing_symbol("MPI_Init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Finalize() -> c_int {
+        loader::missing_symbol("MPI_Finalize")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Initialized(_: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Initialized")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Abort(_: MPI_Comm, _: c_int) -> c_int {
+        loader::missing_symbol("MPI_Abort")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Finalized(_: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Finalized")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Info_create(_: *mut MPI_Info) -> c_int {
+        loader::missing_symbol("MPI_Info_create")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Info_set(
+        _: MPI_Info,
+        _: *const c_char,
+        _: *const c_char,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Info_set")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Info_delete(_: MPI_Info, _: *const c_char) -> c_int {
+        loader::missing_symbol("MPI_Info_delete")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Info_get(
+        _: MPI_Info,
+        _: *const c_char,
+        _: c_int,
+        _: *mut c_char,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Info_get")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Info_get_valuelen(
+        _: MPI_Info,
+        _: *const c_char,
+        _: *mut c_int,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Info_get_valuelen")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Info_get_nkeys(_: MPI_Info, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Info_get_nkeys")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Info_get_nthkey(
+        _: MPI_Info,
+        _: c_int,
+        _: *mut c_char,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Info_get_nthkey")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Info_dup(_: MPI_Info, _: *mut MPI_Info) -> c_int {
+        loader::missing_symbol("MPI_Info_dup")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Info_free(_: *mut MPI_Info) -> c_int {
+        loader::missing_symbol("MPI_Info_free")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_spawn(
+        _: *const c_char,
+        _: *mut *mut c_char,
+        _: c_int,
+        _: MPI_Info,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Comm,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Comm_spawn")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_get_parent(_: *mut MPI_Comm) -> c_int {
+        loader::missing_symbol("MPI_Comm_get_parent")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_spawn_multiple(
+        _: c_int,
+        _: *mut *mut c_char,
+        _: *mut *mut *mut c_char,
+        _: *const c_int,
+        _: *const MPI_Info,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Comm,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Comm_spawn_multiple")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Open_port(_: MPI_Info, _: *mut c_char) -> c_int {
+        loader::missing_symbol("MPI_Open_port")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Close_port(_: *const c_char) -> c_int {
+        loader::missing_symbol("MPI_Close_port")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_accept(
+        _: *const c_char,
+        _: MPI_Info,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Comm_accept")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_connect(
+        _: *const c_char,
+        _: MPI_Info,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Comm_connect")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Publish_name(
+        _: *const c_char,
+        _: MPI_Info,
+        _: *const c_char,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Publish_name")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Unpublish_name(
+        _: *const c_char,
+        _: MPI_Info,
+        _: *const c_char,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Unpublish_name")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Lookup_name(
+        _: *const c_char,
+        _: MPI_Info,
+        _: *mut c_char,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Lookup_name")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_disconnect(_: *mut MPI_Comm) -> c_int {
+        loader::missing_symbol("MPI_Comm_disconnect")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_join(_: c_int, _: *mut MPI_Comm) -> c_int {
+        loader::missing_symbol("MPI_Comm_join")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_create(
+        _: *mut c_void,
+        _: MPI_Aint,
+        _: c_int,
+        _: MPI_Info,
+        _: MPI_Comm,
+        _: *mut MPI_Win,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Win_create")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_allocate(
+        _: MPI_Aint,
+        _: c_int,
+        _: MPI_Info,
+        _: MPI_Comm,
+        _: *mut c_void,
+        _: *mut MPI_Win,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Win_allocate")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_allocate_shared(
+        _: MPI_Aint,
+        _: c_int,
+        _: MPI_Info,
+        _: MPI_Comm,
+        _: *mut c_void,
+        _: *mut MPI_Win,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Win_allocate_shared")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_shared_query(
+        _: MPI_Win,
+        _: c_int,
+        _: *mut MPI_Aint,
+        _: *mut c_int,
+        _: *mut c_void,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Win_shared_query")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_create_dynamic(
+        _: MPI_Info,
+        _: MPI_Comm,
+        _: *mut MPI_Win,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Win_create_dynamic")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_attach(
+        _: MPI_Win,
+        _: *mut c_void,
+        _: MPI_Aint,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Win_attach")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_detach(_: MPI_Win, _: *const c_void) -> c_int {
+        loader::missing_symbol("MPI_Win_detach")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_free(_: *mut MPI_Win) -> c_int {
+        loader::missing_symbol("MPI_Win_free")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_get_group(_: MPI_Win, _: *mut MPI_Group) -> c_int {
+        loader::missing_symbol("MPI_Win_get_group")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_set_info(_: MPI_Win, _: MPI_Info) -> c_int {
+        loader::missing_symbol("MPI_Win_set_info")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_get_info(_: MPI_Win, _: *mut MPI_Info) -> c_int {
+        loader::missing_symbol("MPI_Win_get_info")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Put(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Aint,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Win,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Put")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Get(
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Aint,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Win,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Get")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Accumulate(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Aint,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Win,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Accumulate")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Get_accumulate(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Aint,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Win,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Get_accumulate")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Fetch_and_op(
+        _: *const c_void,
+        _: *mut c_void,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Aint,
+        _: MPI_Op,
+        _: MPI_Win,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Fetch_and_op")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Compare_and_swap(
+        _: *const c_void,
+        _: *const c_void,
+        _: *mut c_void,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Aint,
+        _: MPI_Win,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Compare_and_swap")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Rput(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Aint,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Win,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Rput")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Rget(
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Aint,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Win,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Rget")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Raccumulate(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Aint,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Win,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Raccumulate")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Rget_accumulate(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Aint,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Win,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Rget_accumulate")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_fence(_: c_int, _: MPI_Win) -> c_int {
+        loader::missing_symbol("MPI_Win_fence")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_start(_: MPI_Group, _: c_int, _: MPI_Win) -> c_int {
+        loader::missing_symbol("MPI_Win_start")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_complete(_: MPI_Win) -> c_int {
+        loader::missing_symbol("MPI_Win_complete")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_post(_: MPI_Group, _: c_int, _: MPI_Win) -> c_int {
+        loader::missing_symbol("MPI_Win_post")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_wait(_: MPI_Win) -> c_int {
+        loader::missing_symbol("MPI_Win_wait")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_test(_: MPI_Win, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Win_test")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_lock(
+        _: c_int,
+        _: c_int,
+        _: c_int,
+        _: MPI_Win,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Win_lock")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_lock_all(_: c_int, _: MPI_Win) -> c_int {
+        loader::missing_symbol("MPI_Win_lock_all")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_unlock(_: c_int, _: MPI_Win) -> c_int {
+        loader::missing_symbol("MPI_Win_unlock")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_unlock_all(_: MPI_Win) -> c_int {
+        loader::missing_symbol("MPI_Win_unlock_all")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_flush(_: c_int, _: MPI_Win) -> c_int {
+        loader::missing_symbol("MPI_Win_flush")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_flush_all(_: MPI_Win) -> c_int {
+        loader::missing_symbol("MPI_Win_flush_all")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_flush_local(_: c_int, _: MPI_Win) -> c_int {
+        loader::missing_symbol("MPI_Win_flush_local")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_flush_local_all(_: MPI_Win) -> c_int {
+        loader::missing_symbol("MPI_Win_flush_local_all")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_sync(_: MPI_Win) -> c_int {
+        loader::missing_symbol("MPI_Win_sync")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Grequest_start(
+        _: MPI_Grequest_query_function,
+        _: MPI_Grequest_free_function,
+        _: MPI_Grequest_cancel_function,
+        _: *mut c_void,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Grequest_start")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Grequest_complete(_: MPI_Request) -> c_int {
+        loader::missing_symbol("MPI_Grequest_complete")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Status_set_elements(
+        _: *mut MPI_Status,
+        _: MPI_Datatype,
+        _: c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Status_set_elements")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Status_set_elements_x(
+        _: *mut MPI_Status,
+        _: MPI_Datatype,
+        _: MPI_Count,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Status_set_elements_x")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Status_set_cancelled(
+        _: *mut MPI_Status,
+        _: c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Status_set_cancelled")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Init_thread(
+        _: *mut c_int,
+        _: *mut *mut *mut c_char,
+        _: c_int,
+        _: *mut c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Init_thread")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Query_thread(_: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Query_thread")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Is_thread_main(_: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Is_thread_main")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_open(
+        _: MPI_Comm,
+        _: *const c_char,
+        _: c_int,
+        _: MPI_Info,
+        _: *mut MPI_File,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_open")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_close(_: *mut MPI_File) -> c_int {
+        loader::missing_symbol("MPI_File_close")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_delete(_: *const c_char, _: MPI_Info) -> c_int {
+        loader::missing_symbol("MPI_File_delete")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_set_size(_: MPI_File, _: MPI_Offset) -> c_int {
+        loader::missing_symbol("MPI_File_set_size")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_preallocate(_: MPI_File, _: MPI_Offset) -> c_int {
+        loader::missing_symbol("MPI_File_preallocate")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_get_size(_: MPI_File, _: *mut MPI_Offset) -> c_int {
+        loader::missing_symbol("MPI_File_get_size")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_get_group(_: MPI_File, _: *mut MPI_Group) -> c_int {
+        loader::missing_symbol("MPI_File_get_group")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_get_amode(_: MPI_File, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_File_get_amode")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_set_info(_: MPI_File, _: MPI_Info) -> c_int {
+        loader::missing_symbol("MPI_File_set_info")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_get_info(_: MPI_File, _: *mut MPI_Info) -> c_int {
+        loader::missing_symbol("MPI_File_get_info")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_set_view(
+        _: MPI_File,
+        _: MPI_Offset,
+        _: MPI_Datatype,
+        _: MPI_Datatype,
+        _: *const c_char,
+        _: MPI_Info,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_set_view")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_get_view(
+        _: MPI_File,
+        _: *mut MPI_Offset,
+        _: *mut MPI_Datatype,
+        _: *mut MPI_Datatype,
+        _: *mut c_char,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_get_view")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_read_at(
+        _: MPI_File,
+        _: MPI_Offset,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_read_at")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_read_at_all(
+        _: MPI_File,
+        _: MPI_Offset,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_read_at_all")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_write_at(
+        _: MPI_File,
+        _: MPI_Offset,
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_write_at")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_write_at_all(
+        _: MPI_File,
+        _: MPI_Offset,
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_write_at_all")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_iread_at(
+        _: MPI_File,
+        _: MPI_Offset,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_iread_at")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_iread_at_all(
+        _: MPI_File,
+        _: MPI_Offset,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_iread_at_all")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_iwrite_at(
+        _: MPI_File,
+        _: MPI_Offset,
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_iwrite_at")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_iwrite_at_all(
+        _: MPI_File,
+        _: MPI_Offset,
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_iwrite_at_all")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_read(
+        _: MPI_File,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_read")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_read_all(
+        _: MPI_File,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_read_all")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_write(
+        _: MPI_File,
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_write")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_write_all(
+        _: MPI_File,
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_write_all")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_iread(
+        _: MPI_File,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_iread")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_iread_all(
+        _: MPI_File,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_iread_all")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_iwrite(
+        _: MPI_File,
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_iwrite")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_iwrite_all(
+        _: MPI_File,
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_iwrite_all")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_seek(_: MPI_File, _: MPI_Offset, _: c_int) -> c_int {
+        loader::missing_symbol("MPI_File_seek")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_get_position(
+        _: MPI_File,
+        _: *mut MPI_Offset,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_get_position")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_get_byte_offset(
+        _: MPI_File,
+        _: MPI_Offset,
+        _: *mut MPI_Offset,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_get_byte_offset")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_read_shared(
+        _: MPI_File,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_read_shared")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_write_shared(
+        _: MPI_File,
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_write_shared")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_iread_shared(
+        _: MPI_File,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_iread_shared")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_iwrite_shared(
+        _: MPI_File,
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_iwrite_shared")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_read_ordered(
+        _: MPI_File,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_read_ordered")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_write_ordered(
+        _: MPI_File,
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_write_ordered")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_seek_shared(
+        _: MPI_File,
+        _: MPI_Offset,
+        _: c_int,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_seek_shared")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_get_position_shared(
+        _: MPI_File,
+        _: *mut MPI_Offset,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_get_position_shared")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_read_at_all_begin(
+        _: MPI_File,
+        _: MPI_Offset,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_read_at_all_begin")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_read_at_all_end(
+        _: MPI_File,
+        _: *mut c_void,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_read_at_all_end")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_write_at_all_begin(
+        _: MPI_File,
+        _: MPI_Offset,
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_write_at_all_begin")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_write_at_all_end(
+        _: MPI_File,
+        _: *const c_void,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_write_at_all_end")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_read_all_begin(
+        _: MPI_File,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_read_all_begin")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_read_all_end(
+        _: MPI_File,
+        _: *mut c_void,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_read_all_end")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_write_all_begin(
+        _: MPI_File,
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_write_all_begin")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_write_all_end(
+        _: MPI_File,
+        _: *const c_void,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_write_all_end")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_read_ordered_begin(
+        _: MPI_File,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_read_ordered_begin")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_read_ordered_end(
+        _: MPI_File,
+        _: *mut c_void,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_read_ordered_end")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_write_ordered_begin(
+        _: MPI_File,
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_write_ordered_begin")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_write_ordered_end(
+        _: MPI_File,
+        _: *const c_void,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_write_ordered_end")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_get_type_extent(
+        _: MPI_File,
+        _: MPI_Datatype,
+        _: *mut MPI_Aint,
+    ) -> c_int {
+        loader::missing_symbol("MPI_File_get_type_extent")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Register_datarep(
+        _: *const c_char,
+        _: MPI_Datarep_conversion_function,
+        _: MPI_Datarep_conversion_function,
+        _: MPI_Datarep_extent_function,
+        _: *mut c_void,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Register_datarep")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_set_atomicity(_: MPI_File, _: c_int) -> c_int {
+        loader::missing_symbol("MPI_File_set_atomicity")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_get_atomicity(_: MPI_File, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_File_get_atomicity")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_sync(_: MPI_File) -> c_int {
+        loader::missing_symbol("MPI_File_sync")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_create_f90_real(
+        _: c_int,
+        _: c_int,
+        _: *mut MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_create_f90_real")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_create_f90_complex(
+        _: c_int,
+        _: c_int,
+        _: *mut MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_create_f90_complex")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_create_f90_integer(
+        _: c_int,
+        _: *mut MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_create_f90_integer")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_match_size(
+        _: c_int,
+        _: c_int,
+        _: *mut MPI_Datatype,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_match_size")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_f2c(_: MPI_Fint) -> MPI_Comm {
+        loader::missing_symbol("MPI_Comm_f2c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Comm_c2f(_: MPI_Comm) -> MPI_Fint {
+        loader::missing_symbol("MPI_Comm_c2f")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_f2c(_: MPI_Fint) -> MPI_Datatype {
+        loader::missing_symbol("MPI_Type_f2c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_c2f(_: MPI_Datatype) -> MPI_Fint {
+        loader::missing_symbol("MPI_Type_c2f")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Group_f2c(_: MPI_Fint) -> MPI_Group {
+        loader::missing_symbol("MPI_Group_f2c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Group_c2f(_: MPI_Group) -> MPI_Fint {
+        loader::missing_symbol("MPI_Group_c2f")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Request_f2c(_: MPI_Fint) -> MPI_Request {
+        loader::missing_symbol("MPI_Request_f2c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Request_c2f(_: MPI_Request) -> MPI_Fint {
+        loader::missing_symbol("MPI_Request_c2f")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_f2c(_: MPI_Fint) -> MPI_File {
+        loader::missing_symbol("MPI_File_f2c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_File_c2f(_: MPI_File) -> MPI_Fint {
+        loader::missing_symbol("MPI_File_c2f")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_f2c(_: MPI_Fint) -> MPI_Win {
+        loader::missing_symbol("MPI_Win_f2c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Win_c2f(_: MPI_Win) -> MPI_Fint {
+        loader::missing_symbol("MPI_Win_c2f")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Op_f2c(_: MPI_Fint) -> MPI_Op {
+        loader::missing_symbol("MPI_Op_f2c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Op_c2f(_: MPI_Op) -> MPI_Fint {
+        loader::missing_symbol("MPI_Op_c2f")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Info_f2c(_: MPI_Fint) -> MPI_Info {
+        loader::missing_symbol("MPI_Info_f2c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Info_c2f(_: MPI_Info) -> MPI_Fint {
+        loader::missing_symbol("MPI_Info_c2f")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Errhandler_f2c(_: MPI_Fint) -> MPI_Errhandler {
+        loader::missing_symbol("MPI_Errhandler_f2c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Errhandler_c2f(_: MPI_Errhandler) -> MPI_Fint {
+        loader::missing_symbol("MPI_Errhandler_c2f")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Message_f2c(_: MPI_Fint) -> MPI_Message {
+        loader::missing_symbol("MPI_Message_f2c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Message_c2f(_: MPI_Message) -> MPI_Fint {
+        loader::missing_symbol("MPI_Message_c2f")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Status_f2c(
+        _: *const MPI_Fint,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Status_f2c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Status_c2f(
+        _: *const MPI_Status,
+        _: *mut MPI_Fint,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Status_c2f")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Send_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Send_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Recv_c(
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Recv_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Get_count_c(
+        _: *const MPI_Status,
+        _: MPI_Datatype,
+        _: *mut MPI_Count,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Get_count_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Bsend_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Bsend_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ssend_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ssend_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Rsend_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Rsend_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Isend_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Isend_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ibsend_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ibsend_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Issend_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Issend_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Irsend_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Irsend_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Irecv_c(
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Irecv_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Send_init_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Send_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Bsend_init_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Bsend_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ssend_init_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ssend_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Rsend_init_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Rsend_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Recv_init_c(
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Recv_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Sendrecv_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Sendrecv_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Sendrecv_replace_c(
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Sendrecv_replace_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Mrecv_c(
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut MPI_Message,
+        _: *mut MPI_Status,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Mrecv_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Imrecv_c(
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut MPI_Message,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Imrecv_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Get_elements_c(
+        _: *const MPI_Status,
+        _: MPI_Datatype,
+        _: *mut MPI_Count,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Get_elements_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_size_c(_: MPI_Datatype, _: *mut MPI_Count) -> c_int {
+        loader::missing_symbol("MPI_Type_size_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_get_extent_c(
+        _: MPI_Datatype,
+        _: *mut MPI_Count,
+        _: *mut MPI_Count,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_get_extent_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Type_get_true_extent_c(
+        _: MPI_Datatype,
+        _: *mut MPI_Count,
+        _: *mut MPI_Count,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Type_get_true_extent_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Pack_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: *mut MPI_Count,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Pack_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Unpack_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: *mut MPI_Count,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Unpack_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Pack_size_c(
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Count,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Pack_size_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Bcast_c(
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Bcast_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ibcast_c(
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ibcast_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Gather_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Gather_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Igather_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Igather_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Gatherv_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Gatherv_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Igatherv_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Igatherv_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Scatter_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Scatter_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Iscatter_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Iscatter_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Scatterv_c(
+        _: *const c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Scatterv_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Iscatterv_c(
+        _: *const c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Iscatterv_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Allgather_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Allgather_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Iallgather_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Iallgather_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Allgatherv_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Allgatherv_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Iallgatherv_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Iallgatherv_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Alltoall_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Alltoall_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ialltoall_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ialltoall_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Alltoallv_c(
+        _: *const c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Alltoallv_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ialltoallv_c(
+        _: *const c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ialltoallv_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Alltoallw_c(
+        _: *const c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Alltoallw_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ialltoallw_c(
+        _: *const c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ialltoallw_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Reduce_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: c_int,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Reduce_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ireduce_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: c_int,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ireduce_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Allreduce_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Allreduce_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Iallreduce_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Iallreduce_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Reduce_local_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Reduce_local_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Reduce_scatter_block_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Reduce_scatter_block_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ireduce_scatter_block_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ireduce_scatter_block_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Reduce_scatter_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Reduce_scatter_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ireduce_scatter_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ireduce_scatter_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Scan_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Scan_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Iscan_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Iscan_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Exscan_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Exscan_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Iexscan_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Iexscan_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_allgather_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_allgather_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_allgather_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ineighbor_allgather_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_allgatherv_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_allgatherv_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_allgatherv_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ineighbor_allgatherv_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoall_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_alltoall_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_alltoall_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ineighbor_alltoall_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoallv_c(
+        _: *const c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_alltoallv_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_alltoallv_c(
+        _: *const c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ineighbor_alltoallv_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoallw_c(
+        _: *const c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: MPI_Comm,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_alltoallw_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Ineighbor_alltoallw_c(
+        _: *const c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: MPI_Comm,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Ineighbor_alltoallw_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Psend_init(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Psend_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Precv_init(
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: c_int,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Precv_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Pready(_: c_int, _: MPI_Request) -> c_int {
+        loader::missing_symbol("MPI_Pready")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Pready_range(_: c_int, _: c_int, _: MPI_Request) -> c_int {
+        loader::missing_symbol("MPI_Pready_range")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Pready_list(
+        _: c_int,
+        _: *const c_int,
+        _: MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Pready_list")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Parrived(_: MPI_Request, _: c_int, _: *mut c_int) -> c_int {
+        loader::missing_symbol("MPI_Parrived")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Barrier_init(
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Barrier_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Bcast_init(
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Bcast_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Gather_init(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Gather_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Gatherv_init(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Gatherv_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Scatter_init(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Scatter_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Scatterv_init(
+        _: *const c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Scatterv_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Allgather_init(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Allgather_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Allgatherv_init(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Allgatherv_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Alltoall_init(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Alltoall_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Alltoallv_init(
+        _: *const c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Alltoallv_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Alltoallw_init(
+        _: *const c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: *const MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: *const MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Alltoallw_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Reduce_init(
+        _: *const c_void,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: c_int,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Reduce_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Allreduce_init(
+        _: *const c_void,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Allreduce_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Reduce_scatter_block_init(
+        _: *const c_void,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Reduce_scatter_block_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Reduce_scatter_init(
+        _: *const c_void,
+        _: *mut c_void,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Reduce_scatter_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Scan_init(
+        _: *const c_void,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Scan_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Exscan_init(
+        _: *const c_void,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Exscan_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Bcast_init_c(
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Bcast_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Gather_init_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Gather_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Gatherv_init_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Gatherv_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Scatter_init_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Scatter_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Scatterv_init_c(
+        _: *const c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: c_int,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Scatterv_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Allgather_init_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Allgather_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Allgatherv_init_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Allgatherv_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Alltoall_init_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Alltoall_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Alltoallv_init_c(
+        _: *const c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Alltoallv_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Alltoallw_init_c(
+        _: *const c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Alltoallw_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Reduce_init_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: c_int,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Reduce_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Allreduce_init_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Allreduce_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Reduce_scatter_block_init_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Reduce_scatter_block_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Reduce_scatter_init_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Reduce_scatter_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Scan_init_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Scan_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Exscan_init_c(
+        _: *const c_void,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Op,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Exscan_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_allgather_init(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_allgather_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_allgatherv_init(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_allgatherv_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoall_init(
+        _: *const c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_alltoall_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoallv_init(
+        _: *const c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const c_int,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_alltoallv_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoallw_init(
+        _: *const c_void,
+        _: *const c_int,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: *mut c_void,
+        _: *const c_int,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_alltoallw_init")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_allgather_init_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_allgather_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_allgatherv_init_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_allgatherv_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoall_init_c(
+        _: *const c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: MPI_Count,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_alltoall_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoallv_init_c(
+        _: *const c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_alltoallv_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPI_Neighbor_alltoallw_init_c(
+        _: *const c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: *mut c_void,
+        _: *const MPI_Count,
+        _: *const MPI_Aint,
+        _: *const MPI_Datatype,
+        _: MPI_Comm,
+        _: MPI_Info,
+        _: *mut MPI_Request,
+    ) -> c_int {
+        loader::missing_symbol("MPI_Neighbor_alltoallw_init_c")
+    }
+
+    pub(super) unsafe extern "C" fn MPIX_Query_cuda_support() -> c_int {
+        loader::missing_symbol("MPIX_Query_cuda_support")
+    }
+
+    pub(super) unsafe extern "C" fn MPIX_Query_hip_support() -> c_int {
+        loader::missing_symbol("MPIX_Query_hip_support")
+    }
+
+    pub(super) unsafe extern "C" fn MPIX_Query_rocm_support() -> c_int {
+        loader::missing_symbol("MPIX_Query_rocm_support")
+    }
+
+    pub(super) unsafe extern "C" fn MPIX_Query_ze_support() -> c_int {
+        loader::missing_symbol("MPIX_Query_ze_support")
+    }
+}
+
+/// Names of the MPI functions, in the order `trace` records them.
+#[cfg(feature = "trace")]
+pub(crate) static FUNCTION_NAMES: [&str; 494] = [
+    "MPI_Send",
+    "MPI_Recv",
+    "MPI_Get_count",
+    "MPI_Bsend",
+    "MPI_Ssend",
+    "MPI_Rsend",
+    "MPI_Buffer_attach",
+    "MPI_Buffer_detach",
+    "MPI_Isend",
+    "MPI_Ibsend",
+    "MPI_Issend",
+    "MPI_Irsend",
+    "MPI_Irecv",
+    "MPI_Wait",
+    "MPI_Test",
+    "MPI_Request_free",
+    "MPI_Waitany",
+    "MPI_Testany",
+    "MPI_Waitall",
+    "MPI_Testall",
+    "MPI_Waitsome",
+    "MPI_Testsome",
+    "MPI_Request_get_status",
+    "MPI_Iprobe",
+    "MPI_Probe",
+    "MPI_Improbe",
+    "MPI_Mprobe",
+    "MPI_Mrecv",
+    "MPI_Imrecv",
+    "MPI_Cancel",
+    "MPI_Test_cancelled",
+    "MPI_Send_init",
+    "MPI_Bsend_init",
+    "MPI_Ssend_init",
+    "MPI_Rsend_init",
+    "MPI_Recv_init",
+    "MPI_Start",
+    "MPI_Startall",
+    "MPI_Sendrecv",
+    "MPI_Sendrecv_replace",
+    "MPI_Type_contiguous",
+    "MPI_Type_vector",
+    "MPI_Type_create_hvector",
+    "MPI_Type_indexed",
+    "MPI_Type_create_hindexed",
+    "MPI_Type_create_indexed_block",
+    "MPI_Type_create_hindexed_block",
+    "MPI_Type_create_struct",
+    "MPI_Type_struct",
+    "MPI_Type_create_subarray",
+    "MPI_Type_create_darray",
+    "MPI_Get_address",
+    "MPI_Aint_add",
+    "MPI_Aint_diff",
+    "MPI_Type_size",
+    "MPI_Type_size_x",
+    "MPI_Type_get_extent",
+    "MPI_Type_get_extent_x",
+    "MPI_Type_create_resized",
+    "MPI_Type_get_true_extent",
+    "MPI_Type_get_true_extent_x",
+    "MPI_Type_commit",
+    "MPI_Type_free",
+    "MPI_Type_dup",
+    "MPI_Get_elements",
+    "MPI_Get_elements_x",
+    "MPI_Type_get_envelope",
+    "MPI_Type_get_contents",
+    "MPI_Pack",
+    "MPI_Unpack",
+    "MPI_Pack_size",
+    "MPI_Pack_external",
+    "MPI_Unpack_external",
+    "MPI_Pack_external_size",
+    "MPI_Barrier",
+    "MPI_Bcast",
+    "MPI_Gather",
+    "MPI_Gatherv",
+    "MPI_Scatter",
+    "MPI_Scatterv",
+    "MPI_Allgather",
+    "MPI_Allgatherv",
+    "MPI_Alltoall",
+    "MPI_Alltoallv",
+    "MPI_Alltoallw",
+    "MPI_Reduce",
+    "MPI_Op_create",
+    "MPI_Op_free",
+    "MPI_Allreduce",
+    "MPI_Op_commutative",
+    "MPI_Reduce_local",
+    "MPI_Reduce_scatter_block",
+    "MPI_Reduce_scatter",
+    "MPI_Scan",
+    "MPI_Exscan",
+    "MPI_Ibarrier",
+    "MPI_Ibcast",
+    "MPI_Igather",
+    "MPI_Igatherv",
+    "MPI_Iscatter",
+    "MPI_Iscatterv",
+    "MPI_Iallgather",
+    "MPI_Iallgatherv",
+    "MPI_Ialltoall",
+    "MPI_Ialltoallv",
+    "MPI_Ialltoallw",
+    "MPI_Ireduce",
+    "MPI_Iallreduce",
+    "MPI_Ireduce_scatter_block",
+    "MPI_Ireduce_scatter",
+    "MPI_Iscan",
+    "MPI_Iexscan",
+    "MPI_Group_size",
+    "MPI_Group_rank",
+    "MPI_Group_translate_ranks",
+    "MPI_Group_compare",
+    "MPI_Comm_group",
+    "MPI_Group_union",
+    "MPI_Group_intersection",
+    "MPI_Group_difference",
+    "MPI_Group_incl",
+    "MPI_Group_excl",
+    "MPI_Group_range_incl",
+    "MPI_Group_range_excl",
+    "MPI_Group_free",
+    "MPI_Comm_size",
+    "MPI_Comm_rank",
+    "MPI_Comm_compare",
+    "MPI_Comm_dup",
+    "MPI_Comm_dup_with_info",
+    "MPI_Comm_idup",
+    "MPI_Comm_create",
+    "MPI_Comm_create_group",
+    "MPI_Comm_split",
+    "MPI_Comm_split_type",
+    "MPI_Comm_free",
+    "MPI_Comm_set_info",
+    "MPI_Comm_get_info",
+    "MPI_Comm_test_inter",
+    "MPI_Comm_remote_size",
+    "MPI_Comm_remote_group",
+    "MPI_Intercomm_create",
+    "MPI_Intercomm_merge",
+    "MPI_Comm_create_keyval",
+    "MPI_Comm_free_keyval",
+    "MPI_Comm_set_attr",
+    "MPI_Comm_get_attr",
+    "MPI_Comm_delete_attr",
+    "MPI_Win_create_keyval",
+    "MPI_Win_free_keyval",
+    "MPI_Win_set_attr",
+    "MPI_Win_get_attr",
+    "MPI_Win_delete_attr",
+    "MPI_Type_create_keyval",
+    "MPI_Type_free_keyval",
+    "MPI_Type_set_attr",
+    "MPI_Type_get_attr",
+    "MPI_Type_delete_attr",
+    "MPI_Comm_set_name",
+    "MPI_Comm_get_name",
+    "MPI_Type_set_name",
+    "MPI_Type_get_name",
+    "MPI_Win_set_name",
+    "MPI_Win_get_name",
+    "MPI_Cart_create",
+    "MPI_Dims_create",
+    "MPI_Graph_create",
+    "MPI_Dist_graph_create_adjacent",
+    "MPI_Dist_graph_create",
+    "MPI_Topo_test",
+    "MPI_Graphdims_get",
+    "MPI_Graph_get",
+    "MPI_Cartdim_get",
+    "MPI_Cart_get",
+    "MPI_Cart_rank",
+    "MPI_Cart_coords",
+    "MPI_Graph_neighbors_count",
+    "MPI_Graph_neighbors",
+    "MPI_Dist_graph_neighbors_count",
+    "MPI_Dist_graph_neighbors",
+    "MPI_Cart_shift",
+    "MPI_Cart_sub",
+    "MPI_Cart_map",
+    "MPI_Graph_map",
+    "MPI_Neighbor_allgather",
+    "MPI_Neighbor_allgatherv",
+    "MPI_Neighbor_alltoall",
+    "MPI_Neighbor_alltoallv",
+    "MPI_Neighbor_alltoallw",
+    "MPI_Ineighbor_allgather",
+    "MPI_Ineighbor_allgatherv",
+    "MPI_Ineighbor_alltoall",
+    "MPI_Ineighbor_alltoallv",
+    "MPI_Ineighbor_alltoallw",
+    "MPI_Get_version",
+    "MPI_Get_library_version",
+    "MPI_Get_processor_name",
+    "MPI_Alloc_mem",
+    "MPI_Free_mem",
+    "MPI_Comm_create_errhandler",
+    "MPI_Comm_set_errhandler",
+    "MPI_Comm_get_errhandler",
+    "MPI_Win_create_errhandler",
+    "MPI_Win_set_errhandler",
+    "MPI_Win_get_errhandler",
+    "MPI_File_create_errhandler",
+    "MPI_File_set_errhandler",
+    "MPI_File_get_errhandler",
+    "MPI_Errhandler_free",
+    "MPI_Error_string",
+    "MPI_Error_class",
+    "MPI_Add_error_class",
+    "MPI_Add_error_code",
+    "MPI_Add_error_string",
+    "MPI_Comm_call_errhandler",
+    "MPI_Win_call_errhandler",
+    "MPI_File_call_errhandler",
+    "MPI_Wtime",
+    "MPI_Wtick",
+    "MPI_Init",
+    "MPI_Finalize",
+    "MPI_Initialized",
+    "MPI_Abort",
+    "MPI_Finalized",
+    "MPI_Info_create",
+    "MPI_Info_set",
+    "MPI_Info_delete",
+    "MPI_Info_get",
+    "MPI_Info_get_valuelen",
+    "MPI_Info_get_nkeys",
+    "MPI_Info_get_nthkey",
+    "MPI_Info_dup",
+    "MPI_Info_free",
+    "MPI_Comm_spawn",
+    "MPI_Comm_get_parent",
+    "MPI_Comm_spawn_multiple",
+    "MPI_Open_port",
+    "MPI_Close_port",
+    "MPI_Comm_accept",
+    "MPI_Comm_connect",
+    "MPI_Publish_name",
+    "MPI_Unpublish_name",
+    "MPI_Lookup_name",
+    "MPI_Comm_disconnect",
+    "MPI_Comm_join",
+    "MPI_Win_create",
+    "MPI_Win_allocate",
+    "MPI_Win_allocate_shared",
+    "MPI_Win_shared_query",
+    "MPI_Win_create_dynamic",
+    "MPI_Win_attach",
+    "MPI_Win_detach",
+    "MPI_Win_free",
+    "MPI_Win_get_group",
+    "MPI_Win_set_info",
+    "MPI_Win_get_info",
+    "MPI_Put",
+    "MPI_Get",
+    "MPI_Accumulate",
+    "MPI_Get_accumulate",
+    "MPI_Fetch_and_op",
+    "MPI_Compare_and_swap",
+    "MPI_Rput",
+    "MPI_Rget",
+    "MPI_Raccumulate",
+    "MPI_Rget_accumulate",
+    "MPI_Win_fence",
+    "MPI_Win_start",
+    "MPI_Win_complete",
+    "MPI_Win_post",
+    "MPI_Win_wait",
+    "MPI_Win_test",
+    "MPI_Win_lock",
+    "MPI_Win_lock_all",
+    "MPI_Win_unlock",
+    "MPI_Win_unlock_all",
+    "MPI_Win_flush",
+    "MPI_Win_flush_all",
+    "MPI_Win_flush_local",
+    "MPI_Win_flush_local_all",
+    "MPI_Win_sync",
+    "MPI_Grequest_start",
+    "MPI_Grequest_complete",
+    "MPI_Status_set_elements",
+    "MPI_Status_set_elements_x",
+    "MPI_Status_set_cancelled",
+    "MPI_Init_thread",
+    "MPI_Query_thread",
+    "MPI_Is_thread_main",
+    "MPI_File_open",
+    "MPI_File_close",
+    "MPI_File_delete",
+    "MPI_File_set_size",
+    "MPI_File_preallocate",
+    "MPI_File_get_size",
+    "MPI_File_get_group",
+    "MPI_File_get_amode",
+    "MPI_File_set_info",
+    "MPI_File_get_info",
+    "MPI_File_set_view",
+    "MPI_File_get_view",
+    "MPI_File_read_at",
+    "MPI_File_read_at_all",
+    "MPI_File_write_at",
+    "MPI_File_write_at_all",
+    "MPI_File_iread_at",
+    "MPI_File_iread_at_all",
+    "MPI_File_iwrite_at",
+    "MPI_File_iwrite_at_all",
+    "MPI_File_read",
+    "MPI_File_read_all",
+    "MPI_File_write",
+    "MPI_File_write_all",
+    "MPI_File_iread",
+    "MPI_File_iread_all",
+    "MPI_File_iwrite",
+    "MPI_File_iwrite_all",
+    "MPI_File_seek",
+    "MPI_File_get_position",
+    "MPI_File_get_byte_offset",
+    "MPI_File_read_shared",
+    "MPI_File_write_shared",
+    "MPI_File_iread_shared",
+    "MPI_File_iwrite_shared",
+    "MPI_File_read_ordered",
+    "MPI_File_write_ordered",
+    "MPI_File_seek_shared",
+    "MPI_File_get_position_shared",
+    "MPI_File_read_at_all_begin",
+    "MPI_File_read_at_all_end",
+    "MPI_File_write_at_all_begin",
+    "MPI_File_write_at_all_end",
+    "MPI_File_read_all_begin",
+    "MPI_File_read_all_end",
+    "MPI_File_write_all_begin",
+    "MPI_File_write_all_end",
+    "MPI_File_read_ordered_begin",
+    "MPI_File_read_ordered_end",
+    "MPI_File_write_ordered_begin",
+    "MPI_File_write_ordered_end",
+    "MPI_File_get_type_extent",
+    "MPI_Register_datarep",
+    "MPI_File_set_atomicity",
+    "MPI_File_get_atomicity",
+    "MPI_File_sync",
+    "MPI_Type_create_f90_real",
+    "MPI_Type_create_f90_complex",
+    "MPI_Type_create_f90_integer",
+    "MPI_Type_match_size",
+    "MPI_Comm_f2c",
+    "MPI_Comm_c2f",
+    "MPI_Type_f2c",
+    "MPI_Type_c2f",
+    "MPI_Group_f2c",
+    "MPI_Group_c2f",
+    "MPI_Request_f2c",
+    "MPI_Request_c2f",
+    "MPI_File_f2c",
+    "MPI_File_c2f",
+    "MPI_Win_f2c",
+    "MPI_Win_c2f",
+    "MPI_Op_f2c",
+    "MPI_Op_c2f",
+    "MPI_Info_f2c",
+    "MPI_Info_c2f",
+    "MPI_Errhandler_f2c",
+    "MPI_Errhandler_c2f",
+    "MPI_Message_f2c",
+    "MPI_Message_c2f",
+    "MPI_Status_f2c",
+    "MPI_Status_c2f",
+    "MPI_Send_c",
+    "MPI_Recv_c",
+    "MPI_Get_count_c",
+    "MPI_Bsend_c",
+    "MPI_Ssend_c",
+    "MPI_Rsend_c",
+    "MPI_Isend_c",
+    "MPI_Ibsend_c",
+    "MPI_Issend_c",
+    "MPI_Irsend_c",
+    "MPI_Irecv_c",
+    "MPI_Send_init_c",
+    "MPI_Bsend_init_c",
+    "MPI_Ssend_init_c",
+    "MPI_Rsend_init_c",
+    "MPI_Recv_init_c",
+    "MPI_Sendrecv_c",
+    "MPI_Sendrecv_replace_c",
+    "MPI_Mrecv_c",
+    "MPI_Imrecv_c",
+    "MPI_Get_elements_c",
+    "MPI_Type_size_c",
+    "MPI_Type_get_extent_c",
+    "MPI_Type_get_true_extent_c",
+    "MPI_Pack_c",
+    "MPI_Unpack_c",
+    "MPI_Pack_size_c",
+    "MPI_Bcast_c",
+    "MPI_Ibcast_c",
+    "MPI_Gather_c",
+    "MPI_Igather_c",
+    "MPI_Gatherv_c",
+    "MPI_Igatherv_c",
+    "MPI_Scatter_c",
+    "MPI_Iscatter_c",
+    "MPI_Scatterv_c",
+    "MPI_Iscatterv_c",
+    "MPI_Allgather_c",
+    "MPI_Iallgather_c",
+    "MPI_Allgatherv_c",
+    "MPI_Iallgatherv_c",
+    "MPI_Alltoall_c",
+    "MPI_Ialltoall_c",
+    "MPI_Alltoallv_c",
+    "MPI_Ialltoallv_c",
+    "MPI_Alltoallw_c",
+    "MPI_Ialltoallw_c",
+    "MPI_Reduce_c",
+    "MPI_Ireduce_c",
+    "MPI_Allreduce_c",
+    "MPI_Iallreduce_c",
+    "MPI_Reduce_local_c",
+    "MPI_Reduce_scatter_block_c",
+    "MPI_Ireduce_scatter_block_c",
+    "MPI_Reduce_scatter_c",
+    "MPI_Ireduce_scatter_c",
+    "MPI_Scan_c",
+    "MPI_Iscan_c",
+    "MPI_Exscan_c",
+    "MPI_Iexscan_c",
+    "MPI_Neighbor_allgather_c",
+    "MPI_Ineighbor_allgather_c",
+    "MPI_Neighbor_allgatherv_c",
+    "MPI_Ineighbor_allgatherv_c",
+    "MPI_Neighbor_alltoall_c",
+    "MPI_Ineighbor_alltoall_c",
+    "MPI_Neighbor_alltoallv_c",
+    "MPI_Ineighbor_alltoallv_c",
+    "MPI_Neighbor_alltoallw_c",
+    "MPI_Ineighbor_alltoallw_c",
+    "MPI_Psend_init",
+    "MPI_Precv_init",
+    "MPI_Pready",
+    "MPI_Pready_range",
+    "MPI_Pready_list",
+    "MPI_Parrived",
+    "MPI_Barrier_init",
+    "MPI_Bcast_init",
+    "MPI_Gather_init",
+    "MPI_Gatherv_init",
+    "MPI_Scatter_init",
+    "MPI_Scatterv_init",
+    "MPI_Allgather_init",
+    "MPI_Allgatherv_init",
+    "MPI_Alltoall_init",
+    "MPI_Alltoallv_init",
+    "MPI_Alltoallw_init",
+    "MPI_Reduce_init",
+    "MPI_Allreduce_init",
+    "MPI_Reduce_scatter_block_init",
+    "MPI_Reduce_scatter_init",
+    "MPI_Scan_init",
+    "MPI_Exscan_init",
+    "MPI_Bcast_init_c",
+    "MPI_Gather_init_c",
+    "MPI_Gatherv_init_c",
+    "MPI_Scatter_init_c",
+    "MPI_Scatterv_init_c",
+    "MPI_Allgather_init_c",
+    "MPI_Allgatherv_init_c",
+    "MPI_Alltoall_init_c",
+    "MPI_Alltoallv_init_c",
+    "MPI_Alltoallw_init_c",
+    "MPI_Reduce_init_c",
+    "MPI_Allreduce_init_c",
+    "MPI_Reduce_scatter_block_init_c",
+    "MPI_Reduce_scatter_init_c",
+    "MPI_Scan_init_c",
+    "MPI_Exscan_init_c",
+    "MPI_Neighbor_allgather_init",
+    "MPI_Neighbor_allgatherv_init",
+    "MPI_Neighbor_alltoall_init",
+    "MPI_Neighbor_alltoallv_init",
+    "MPI_Neighbor_alltoallw_init",
+    "MPI_Neighbor_allgather_init_c",
+    "MPI_Neighbor_allgatherv_init_c",
+    "MPI_Neighbor_alltoall_init_c",
+    "MPI_Neighbor_alltoallv_init_c",
+    "MPI_Neighbor_alltoallw_init_c",
+    "MPIX_Query_cuda_support",
+    "MPIX_Query_hip_support",
+    "MPIX_Query_rocm_support",
+    "MPIX_Query_ze_support",
+];
+
+#[inline]
+pub unsafe fn MPI_Send(
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(0, trace::volume(buf, count, datatype));
+    (entry::MPI_Send())(buf, count, datatype, dest, tag, comm)
+}
+
+#[inline]
+pub unsafe fn MPI_Recv(
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    source: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(1, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_Recv())(buf, count, datatype, source, tag, comm, status)
+}
+
+#[inline]
+pub unsafe fn MPI_Get_count(
+    status: *const MPI_Status,
+    datatype: MPI_Datatype,
+    count: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(2, 0);
+    (entry::MPI_Get_count())(status, datatype, count)
+}
+
+#[inline]
+pub unsafe fn MPI_Bsend(
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(3, trace::volume(buf, count, datatype));
+    (entry::MPI_Bsend())(buf, count, datatype, dest, tag, comm)
+}
+
+#[inline]
+pub unsafe fn MPI_Ssend(
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(4, trace::volume(buf, count, datatype));
+    (entry::MPI_Ssend())(buf, count, datatype, dest, tag, comm)
+}
+
+#[inline]
+pub unsafe fn MPI_Rsend(
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(5, trace::volume(buf, count, datatype));
+    (entry::MPI_Rsend())(buf, count, datatype, dest, tag, comm)
+}
+
+#[inline]
+pub unsafe fn MPI_Buffer_attach(buffer: *mut c_void, size: c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(6, 0);
+    (entry::MPI_Buffer_attach())(buffer, size)
+}
+
+#[inline]
+pub unsafe fn MPI_Buffer_detach(buffer_addr: *mut c_void, size: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(7, 0);
+    (entry::MPI_Buffer_detach())(buffer_addr, size)
+}
+
+#[inline]
+pub unsafe fn MPI_Isend(
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(8, trace::volume(buf, count, datatype));
+    (entry::MPI_Isend())(buf, count, datatype, dest, tag, comm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Ibsend(
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(9, trace::volume(buf, count, datatype));
+    (entry::MPI_Ibsend())(buf, count, datatype, dest, tag, comm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Issend(
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(10, trace::volume(buf, count, datatype));
+    (entry::MPI_Issend())(buf, count, datatype, dest, tag, comm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Irsend(
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(11, trace::volume(buf, count, datatype));
+    (entry::MPI_Irsend())(buf, count, datatype, dest, tag, comm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Irecv(
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    source: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(12, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_Irecv())(buf, count, datatype, source, tag, comm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Wait(request: *mut MPI_Request, status: *mut MPI_Status) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(13, 0);
+    (entry::MPI_Wait())(request, status)
+}
+
+#[inline]
+pub unsafe fn MPI_Test(
+    request: *mut MPI_Request,
+    flag: *mut c_int,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(14, 0);
+    (entry::MPI_Test())(request, flag, status)
+}
+
+#[inline]
+pub unsafe fn MPI_Request_free(request: *mut MPI_Request) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(15, 0);
+    (entry::MPI_Request_free())(request)
+}
+
+#[inline]
+pub unsafe fn MPI_Waitany(
+    count: c_int,
+    array_of_requests: *mut MPI_Request,
+    index: *mut c_int,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(16, 0);
+    (entry::MPI_Waitany())(count, array_of_requests, index, status)
+}
+
+#[inline]
+pub unsafe fn MPI_Testany(
+    count: c_int,
+    array_of_requests: *mut MPI_Request,
+    index: *mut c_int,
+    flag: *mut c_int,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(17, 0);
+    (entry::MPI_Testany())(count, array_of_requests, index, flag, status)
+}
+
+#[inline]
+pub unsafe fn MPI_Waitall(
+    count: c_int,
+    array_of_requests: *mut MPI_Request,
+    array_of_statuses: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(18, 0);
+    let ret = (entry::MPI_Waitall())(count, array_of_requests, array_of_statuses);
+    spread_statuses(array_of_statuses, count);
+    ret
+}
+
+#[inline]
+pub unsafe fn MPI_Testall(
+    count: c_int,
+    array_of_requests: *mut MPI_Request,
+    flag: *mut c_int,
+    array_of_statuses: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(19, 0);
+    let ret = (entry::MPI_Testall())(count, array_of_requests, flag, array_of_statuses);
+    spread_statuses(array_of_statuses, count);
+    ret
+}
+
+#[inline]
+pub unsafe fn MPI_Waitsome(
+    incount: c_int,
+    array_of_requests: *mut MPI_Request,
+    outcount: *mut c_int,
+    array_of_indices: *mut c_int,
+    array_of_statuses: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(20, 0);
+    let ret = (entry::MPI_Waitsome())(
+        incount,
+        array_of_requests,
+        outcount,
+        array_of_indices,
+        array_of_statuses,
+    );
+    spread_statuses(array_of_statuses, *outcount);
+    ret
+}
+
+#[inline]
+pub unsafe fn MPI_Testsome(
+    incount: c_int,
+    array_of_requests: *mut MPI_Request,
+    outcount: *mut c_int,
+    array_of_indices: *mut c_int,
+    array_of_statuses: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(21, 0);
+    let ret = (entry::MPI_Testsome())(
+        incount,
+        array_of_requests,
+        outcount,
+        array_of_indices,
+        array_of_statuses,
+    );
+    spread_statuses(array_of_statuses, *outcount);
+    ret
+}
+
+#[inline]
+pub unsafe fn MPI_Request_get_status(
+    request: MPI_Request,
+    flag: *mut c_int,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(22, 0);
+    (entry::MPI_Request_get_status())(request, flag, status)
+}
+
+#[inline]
+pub unsafe fn MPI_Iprobe(
+    source: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    flag: *mut c_int,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(23, 0);
+    (entry::MPI_Iprobe())(source, tag, comm, flag, status)
+}
+
+#[inline]
+pub unsafe fn MPI_Probe(
+    source: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(24, 0);
+    (entry::MPI_Probe())(source, tag, comm, status)
+}
+
+#[inline]
+pub unsafe fn MPI_Improbe(
+    source: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    flag: *mut c_int,
+    message: *mut MPI_Message,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(25, 0);
+    (entry::MPI_Improbe())(source, tag, comm, flag, message, status)
+}
+
+#[inline]
+pub unsafe fn MPI_Mprobe(
+    source: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    message: *mut MPI_Message,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(26, 0);
+    (entry::MPI_Mprobe())(source, tag, comm, message, status)
+}
+
+#[inline]
+pub unsafe fn MPI_Mrecv(
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    message: *mut MPI_Message,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(27, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_Mrecv())(buf, count, datatype, message, status)
+}
+
+#[inline]
+pub unsafe fn MPI_Imrecv(
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    message: *mut MPI_Message,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(28, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_Imrecv())(buf, count, datatype, message, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Cancel(request: *mut MPI_Request) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(29, 0);
+    (entry::MPI_Cancel())(request)
+}
+
+#[inline]
+pub unsafe fn MPI_Test_cancelled(status: *const MPI_Status, flag: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(30, 0);
+    (entry::MPI_Test_cancelled())(status, flag)
+}
+
+#[inline]
+pub unsafe fn MPI_Send_init(
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(31, trace::volume(buf, count, datatype));
+    (entry::MPI_Send_init())(buf, count, datatype, dest, tag, comm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Bsend_init(
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(32, trace::volume(buf, count, datatype));
+    (entry::MPI_Bsend_init())(buf, count, datatype, dest, tag, comm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Ssend_init(
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(33, trace::volume(buf, count, datatype));
+    (entry::MPI_Ssend_init())(buf, count, datatype, dest, tag, comm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Rsend_init(
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(34, trace::volume(buf, count, datatype));
+    (entry::MPI_Rsend_init())(buf, count, datatype, dest, tag, comm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Recv_init(
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    source: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(35, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_Recv_init())(buf, count, datatype, source, tag, comm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Start(request: *mut MPI_Request) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(36, 0);
+    (entry::MPI_Start())(request)
+}
+
+#[inline]
+pub unsafe fn MPI_Startall(count: c_int, array_of_requests: *mut MPI_Request) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(37, 0);
+    (entry::MPI_Startall())(count, array_of_requests)
+}
+
+#[inline]
+pub unsafe fn MPI_Sendrecv(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    dest: c_int,
+    sendtag: c_int,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    source: c_int,
+    recvtag: c_int,
+    comm: MPI_Comm,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        38,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Sendrecv())(
+        sendbuf, sendcount, sendtype, dest, sendtag, recvbuf, recvcount, recvtype, source, recvtag,
+        comm, status,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Sendrecv_replace(
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    sendtag: c_int,
+    source: c_int,
+    recvtag: c_int,
+    comm: MPI_Comm,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(39, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_Sendrecv_replace())(
+        buf, count, datatype, dest, sendtag, source, recvtag, comm, status,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Type_contiguous(
+    count: c_int,
+    oldtype: MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(40, 0);
+    (entry::MPI_Type_contiguous())(count, oldtype, newtype)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_vector(
+    count: c_int,
+    blocklength: c_int,
+    stride: c_int,
+    oldtype: MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(41, 0);
+    (entry::MPI_Type_vector())(count, blocklength, stride, oldtype, newtype)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_create_hvector(
+    count: c_int,
+    blocklength: c_int,
+    stride: MPI_Aint,
+    oldtype: MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(42, 0);
+    (entry::MPI_Type_create_hvector())(count, blocklength, stride, oldtype, newtype)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_indexed(
+    count: c_int,
+    array_of_blocklengths: *const c_int,
+    array_of_displacements: *const c_int,
+    oldtype: MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(43, 0);
+    (entry::MPI_Type_indexed())(
+        count,
+        array_of_blocklengths,
+        array_of_displacements,
+        oldtype,
+        newtype,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Type_create_hindexed(
+    count: c_int,
+    array_of_blocklengths: *const c_int,
+    array_of_displacements: *const MPI_Aint,
+    oldtype: MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(44, 0);
+    (entry::MPI_Type_create_hindexed())(
+        count,
+        array_of_blocklengths,
+        array_of_displacements,
+        oldtype,
+        newtype,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Type_create_indexed_block(
+    count: c_int,
+    blocklength: c_int,
+    array_of_displacements: *const c_int,
+    oldtype: MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(45, 0);
+    (entry::MPI_Type_create_indexed_block())(
+        count,
+        blocklength,
+        array_of_displacements,
+        oldtype,
+        newtype,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Type_create_hindexed_block(
+    count: c_int,
+    blocklength: c_int,
+    array_of_displacements: *const MPI_Aint,
+    oldtype: MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(46, 0);
+    (entry::MPI_Type_create_hindexed_block())(
+        count,
+        blocklength,
+        array_of_displacements,
+        oldtype,
+        newtype,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Type_create_struct(
+    count: c_int,
+    array_of_blocklengths: *const c_int,
+    array_of_displacements: *const MPI_Aint,
+    array_of_types: *const MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(47, 0);
+    (entry::MPI_Type_create_struct())(
+        count,
+        array_of_blocklengths,
+        array_of_displacements,
+        array_of_types,
+        newtype,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Type_struct(
+    count: c_int,
+    array_of_blocklengths: *const c_int,
+    array_of_displacements: *const MPI_Aint,
+    array_of_types: *const MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(48, 0);
+    (entry::MPI_Type_struct())(
+        count,
+        array_of_blocklengths,
+        array_of_displacements,
+        array_of_types,
+        newtype,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Type_create_subarray(
+    ndims: c_int,
+    array_of_sizes: *const c_int,
+    array_of_subsizes: *const c_int,
+    array_of_starts: *const c_int,
+    ordder: c_int,
+    oldtype: MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(49, 0);
+    (entry::MPI_Type_create_subarray())(
+        ndims,
+        array_of_sizes,
+        array_of_subsizes,
+        array_of_starts,
+        ordder,
+        oldtype,
+        newtype,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Type_create_darray(
+    size: c_int,
+    rank: c_int,
+    ndims: c_int,
+    array_of_gsizes: *const c_int,
+    array_of_distribs: *const c_int,
+    array_of_dargs: *const c_int,
+    array_of_psizes: *const c_int,
+    order: c_int,
+    oldtype: MPI_Datatype,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(50, 0);
+    (entry::MPI_Type_create_darray())(
+        size,
+        rank,
+        ndims,
+        array_of_gsizes,
+        array_of_distribs,
+        array_of_dargs,
+        array_of_psizes,
+        order,
+        oldtype,
+        newtype,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Get_address(location: *const c_void, address: *mut MPI_Aint) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(51, 0);
+    (entry::MPI_Get_address())(location, address)
+}
+
+#[inline]
+pub unsafe fn MPI_Aint_add(base: MPI_Aint, disp: MPI_Aint) -> MPI_Aint {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(52, 0);
+    (entry::MPI_Aint_add())(base, disp)
+}
+
+#[inline]
+pub unsafe fn MPI_Aint_diff(addr1: MPI_Aint, addr2: MPI_Aint) -> MPI_Aint {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(53, 0);
+    (entry::MPI_Aint_diff())(addr1, addr2)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_size(datatype: MPI_Datatype, size: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(54, 0);
+    (entry::MPI_Type_size())(datatype, size)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_size_x(datatype: MPI_Datatype, size: *mut MPI_Count) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(55, 0);
+    (entry::MPI_Type_size_x())(datatype, size)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_get_extent(
+    datatype: MPI_Datatype,
+    lb: *mut MPI_Aint,
+    extent: *mut MPI_Aint,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(56, 0);
+    (entry::MPI_Type_get_extent())(datatype, lb, extent)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_get_extent_x(
+    datatype: MPI_Datatype,
+    lb: *mut MPI_Count,
+    extent: *mut MPI_Count,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(57, 0);
+    (entry::MPI_Type_get_extent_x())(datatype, lb, extent)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_create_resized(
+    oldtype: MPI_Datatype,
+    lb: MPI_Aint,
+    extent: MPI_Aint,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(58, 0);
+    (entry::MPI_Type_create_resized())(oldtype, lb, extent, newtype)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_get_true_extent(
+    datatype: MPI_Datatype,
+    true_lb: *mut MPI_Aint,
+    true_extent: *mut MPI_Aint,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(59, 0);
+    (entry::MPI_Type_get_true_extent())(datatype, true_lb, true_extent)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_get_true_extent_x(
+    datatype: MPI_Datatype,
+    true_lb: *mut MPI_Count,
+    true_extent: *mut MPI_Count,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(60, 0);
+    (entry::MPI_Type_get_true_extent_x())(datatype, true_lb, true_extent)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_commit(datatype: *mut MPI_Datatype) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(61, 0);
+    (entry::MPI_Type_commit())(datatype)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_free(datatype: *mut MPI_Datatype) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(62, 0);
+    (entry::MPI_Type_free())(datatype)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_dup(oldtype: MPI_Datatype, newtype: *mut MPI_Datatype) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(63, 0);
+    (entry::MPI_Type_dup())(oldtype, newtype)
+}
+
+#[inline]
+pub unsafe fn MPI_Get_elements(
+    status: *const MPI_Status,
+    datatype: MPI_Datatype,
+    count: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(64, 0);
+    (entry::MPI_Get_elements())(status, datatype, count)
+}
+
+#[inline]
+pub unsafe fn MPI_Get_elements_x(
+    status: *const MPI_Status,
+    datatype: MPI_Datatype,
+    count: *mut MPI_Count,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(65, 0);
+    (entry::MPI_Get_elements_x())(status, datatype, count)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_get_envelope(
+    datatype: MPI_Datatype,
+    num_integers: *mut c_int,
+    num_addresses: *mut c_int,
+    num_datatypes: *mut c_int,
+    combiner: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(66, 0);
+    (entry::MPI_Type_get_envelope())(
+        datatype,
+        num_integers,
+        num_addresses,
+        num_datatypes,
+        combiner,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Type_get_contents(
+    datatype: MPI_Datatype,
+    max_integers: c_int,
+    max_addresses: c_int,
+    max_datatypes: c_int,
+    array_of_integers: *mut c_int,
+    array_of_addresses: *mut MPI_Aint,
+    array_of_datatypes: *mut MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(67, 0);
+    (entry::MPI_Type_get_contents())(
+        datatype,
+        max_integers,
+        max_addresses,
+        max_datatypes,
+        array_of_integers,
+        array_of_addresses,
+        array_of_datatypes,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Pack(
+    inbuf: *const c_void,
+    incount: c_int,
+    datatype: MPI_Datatype,
+    outbuf: *mut c_void,
+    outsize: c_int,
+    position: *mut c_int,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(68, 0);
+    (entry::MPI_Pack())(inbuf, incount, datatype, outbuf, outsize, position, comm)
+}
+
+#[inline]
+pub unsafe fn MPI_Unpack(
+    inbuf: *const c_void,
+    insize: c_int,
+    position: *mut c_int,
+    outbuf: *mut c_void,
+    outcount: c_int,
+    datatype: MPI_Datatype,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(69, 0);
+    (entry::MPI_Unpack())(inbuf, insize, position, outbuf, outcount, datatype, comm)
+}
+
+#[inline]
+pub unsafe fn MPI_Pack_size(
+    incount: c_int,
+    datatype: MPI_Datatype,
+    comm: MPI_Comm,
+    size: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(70, 0);
+    (entry::MPI_Pack_size())(incount, datatype, comm, size)
+}
+
+#[inline]
+pub unsafe fn MPI_Pack_external(
+    datarep: *const c_char,
+    inbuf: *const c_void,
+    incount: c_int,
+    datatype: MPI_Datatype,
+    outbuf: *mut c_void,
+    outsize: MPI_Aint,
+    position: *mut MPI_Aint,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(71, 0);
+    (entry::MPI_Pack_external())(datarep, inbuf, incount, datatype, outbuf, outsize, position)
+}
+
+#[inline]
+pub unsafe fn MPI_Unpack_external(
+    datarep: *const c_char,
+    inbuf: *const c_void,
+    insize: MPI_Aint,
+    position: *mut MPI_Aint,
+    outbuf: *mut c_void,
+    outcount: c_int,
+    datatype: MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(72, 0);
+    (entry::MPI_Unpack_external())(datarep, inbuf, insize, position, outbuf, outcount, datatype)
+}
+
+#[inline]
+pub unsafe fn MPI_Pack_external_size(
+    datarep: *const c_char,
+    incount: c_int,
+    datatype: MPI_Datatype,
+    size: *mut MPI_Aint,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(73, 0);
+    (entry::MPI_Pack_external_size())(datarep, incount, datatype, size)
+}
+
+#[inline]
+pub unsafe fn MPI_Barrier(comm: MPI_Comm) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(74, 0);
+    (entry::MPI_Barrier())(comm)
+}
+
+#[inline]
+pub unsafe fn MPI_Bcast(
+    buffer: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(75, trace::volume(buffer as *const c_void, count, datatype));
+    (entry::MPI_Bcast())(buffer, count, datatype, root, comm)
+}
+
+#[inline]
+pub unsafe fn MPI_Gather(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        76,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Gather())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Gatherv(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    displs: *const c_int,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(77, trace::volume(sendbuf, sendcount, sendtype));
+    (entry::MPI_Gatherv())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, root, comm,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Scatter(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        78,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Scatter())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Scatterv(
+    sendbuf: *const c_void,
+    sendcounts: *const c_int,
+    displs: *const c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        79,
+        trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Scatterv())(
+        sendbuf, sendcounts, displs, sendtype, recvbuf, recvcount, recvtype, root, comm,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Allgather(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        80,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Allgather())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Allgatherv(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    displs: *const c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(81, trace::volume(sendbuf, sendcount, sendtype));
+    (entry::MPI_Allgatherv())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Alltoall(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        82,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Alltoall())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Alltoallv(
+    sendbuf: *const c_void,
+    sendcounts: *const c_int,
+    sdispls: *const c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    rdispls: *const c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(83, 0);
+    (entry::MPI_Alltoallv())(
+        sendbuf, sendcounts, sdispls, sendtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Alltoallw(
+    sendbuf: *const c_void,
+    sendcounts: *const c_int,
+    sdispls: *const c_int,
+    sendtypes: *const MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    rdispls: *const c_int,
+    recvtypes: *const MPI_Datatype,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(84, 0);
+    (entry::MPI_Alltoallw())(
+        sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Reduce(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    root: c_int,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(85, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Reduce())(sendbuf, recvbuf, count, datatype, op, root, comm)
+}
+
+#[inline]
+pub unsafe fn MPI_Op_create(user_fn: MPI_User_function, commute: c_int, op: *mut MPI_Op) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(86, 0);
+    (entry::MPI_Op_create())(user_fn, commute, op)
+}
+
+#[inline]
+pub unsafe fn MPI_Op_free(op: *mut MPI_Op) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(87, 0);
+    (entry::MPI_Op_free())(op)
+}
+
+#[inline]
+pub unsafe fn MPI_Allreduce(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(88, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Allreduce())(sendbuf, recvbuf, count, datatype, op, comm)
+}
+
+#[inline]
+pub unsafe fn MPI_Op_commutative(op: MPI_Op, commute: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(89, 0);
+    (entry::MPI_Op_commutative())(op, commute)
+}
+
+#[inline]
+pub unsafe fn MPI_Reduce_local(
+    inbuf: *const c_void,
+    inoutbuf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(90, trace::volume(inbuf, count, datatype));
+    (entry::MPI_Reduce_local())(inbuf, inoutbuf, count, datatype, op)
+}
+
+#[inline]
+pub unsafe fn MPI_Reduce_scatter_block(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(91, 0);
+    (entry::MPI_Reduce_scatter_block())(sendbuf, recvbuf, recvcount, datatype, op, comm)
+}
+
+#[inline]
+pub unsafe fn MPI_Reduce_scatter(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(92, 0);
+    (entry::MPI_Reduce_scatter())(sendbuf, recvbuf, recvcounts, datatype, op, comm)
+}
+
+#[inline]
+pub unsafe fn MPI_Scan(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(93, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Scan())(sendbuf, recvbuf, count, datatype, op, comm)
+}
+
+#[inline]
+pub unsafe fn MPI_Exscan(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(94, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Exscan())(sendbuf, recvbuf, count, datatype, op, comm)
+}
+
+#[inline]
+pub unsafe fn MPI_Ibarrier(comm: MPI_Comm, request: *mut MPI_Request) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(95, 0);
+    (entry::MPI_Ibarrier())(comm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Ibcast(
+    buffer: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(96, trace::volume(buffer as *const c_void, count, datatype));
+    (entry::MPI_Ibcast())(buffer, count, datatype, root, comm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Igather(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        97,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Igather())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm, request,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Igatherv(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    displs: *const c_int,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(98, trace::volume(sendbuf, sendcount, sendtype));
+    (entry::MPI_Igatherv())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, root, comm, request,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Iscatter(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        99,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Iscatter())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm, request,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Iscatterv(
+    sendbuf: *const c_void,
+    sendcounts: *const c_int,
+    displs: *const c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        100,
+        trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Iscatterv())(
+        sendbuf, sendcounts, displs, sendtype, recvbuf, recvcount, recvtype, root, comm, request,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Iallgather(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        101,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Iallgather())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, request,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Iallgatherv(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    displs: *const c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(102, trace::volume(sendbuf, sendcount, sendtype));
+    (entry::MPI_Iallgatherv())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm, request,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Ialltoall(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        103,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Ialltoall())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, request,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Ialltoallv(
+    sendbuf: *const c_void,
+    sendcounts: *const c_int,
+    sdispls: *const c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    rdispls: *const c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(104, 0);
+    (entry::MPI_Ialltoallv())(
+        sendbuf, sendcounts, sdispls, sendtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+        request,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Ialltoallw(
+    sendbuf: *const c_void,
+    sendcounts: *const c_int,
+    sdispls: *const c_int,
+    sendtypes: *const MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    rdispls: *const c_int,
+    recvtypes: *const MPI_Datatype,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(105, 0);
+    (entry::MPI_Ialltoallw())(
+        sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+        request,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Ireduce(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    root: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(106, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Ireduce())(sendbuf, recvbuf, count, datatype, op, root, comm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Iallreduce(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(107, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Iallreduce())(sendbuf, recvbuf, count, datatype, op, comm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Ireduce_scatter_block(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(108, 0);
+    (entry::MPI_Ireduce_scatter_block())(sendbuf, recvbuf, recvcount, datatype, op, comm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Ireduce_scatter(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(109, 0);
+    (entry::MPI_Ireduce_scatter())(sendbuf, recvbuf, recvcounts, datatype, op, comm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Iscan(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(110, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Iscan())(sendbuf, recvbuf, count, datatype, op, comm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Iexscan(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(111, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Iexscan())(sendbuf, recvbuf, count, datatype, op, comm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Group_size(group: MPI_Group, size: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(112, 0);
+    (entry::MPI_Group_size())(group, size)
+}
+
+#[inline]
+pub unsafe fn MPI_Group_rank(group: MPI_Group, rank: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(113, 0);
+    (entry::MPI_Group_rank())(group, rank)
+}
+
+#[inline]
+pub unsafe fn MPI_Group_translate_ranks(
+    group1: MPI_Group,
+    n: c_int,
+    ranks1: *const c_int,
+    group2: MPI_Group,
+    ranks2: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(114, 0);
+    (entry::MPI_Group_translate_ranks())(group1, n, ranks1, group2, ranks2)
+}
+
+#[inline]
+pub unsafe fn MPI_Group_compare(group1: MPI_Group, group2: MPI_Group, result: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(115, 0);
+    (entry::MPI_Group_compare())(group1, group2, result)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_group(comm: MPI_Comm, group: *mut MPI_Group) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(116, 0);
+    (entry::MPI_Comm_group())(comm, group)
+}
+
+#[inline]
+pub unsafe fn MPI_Group_union(
+    group1: MPI_Group,
+    group2: MPI_Group,
+    newgroup: *mut MPI_Group,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(117, 0);
+    (entry::MPI_Group_union())(group1, group2, newgroup)
+}
+
+#[inline]
+pub unsafe fn MPI_Group_intersection(
+    group1: MPI_Group,
+    group2: MPI_Group,
+    newgroup: *mut MPI_Group,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(118, 0);
+    (entry::MPI_Group_intersection())(group1, group2, newgroup)
+}
+
+#[inline]
+pub unsafe fn MPI_Group_difference(
+    group1: MPI_Group,
+    group2: MPI_Group,
+    newgroup: *mut MPI_Group,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(119, 0);
+    (entry::MPI_Group_difference())(group1, group2, newgroup)
+}
+
+#[inline]
+pub unsafe fn MPI_Group_incl(
+    group: MPI_Group,
+    n: c_int,
+    ranks: *const c_int,
+    newgroup: *mut MPI_Group,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(120, 0);
+    (entry::MPI_Group_incl())(group, n, ranks, newgroup)
+}
+
+#[inline]
+pub unsafe fn MPI_Group_excl(
+    group: MPI_Group,
+    n: c_int,
+    ranks: *const c_int,
+    newgroup: *mut MPI_Group,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(121, 0);
+    (entry::MPI_Group_excl())(group, n, ranks, newgroup)
+}
+
+#[inline]
+pub unsafe fn MPI_Group_range_incl(
+    group: MPI_Group,
+    n: c_int,
+    ranges: *mut [c_int; 3],
+    newgroup: *mut MPI_Group,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(122, 0);
+    (entry::MPI_Group_range_incl())(group, n, ranges, newgroup)
+}
+
+#[inline]
+pub unsafe fn MPI_Group_range_excl(
+    group: MPI_Group,
+    n: c_int,
+    ranges: *mut [c_int; 3],
+    newgroup: *mut MPI_Group,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(123, 0);
+    (entry::MPI_Group_range_excl())(group, n, ranges, newgroup)
+}
+
+#[inline]
+pub unsafe fn MPI_Group_free(group: *mut MPI_Group) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(124, 0);
+    (entry::MPI_Group_free())(group)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_size(comm: MPI_Comm, size: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(125, 0);
+    (entry::MPI_Comm_size())(comm, size)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_rank(comm: MPI_Comm, rank: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(126, 0);
+    (entry::MPI_Comm_rank())(comm, rank)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_compare(comm1: MPI_Comm, comm2: MPI_Comm, result: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(127, 0);
+    (entry::MPI_Comm_compare())(comm1, comm2, result)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_dup(comm: MPI_Comm, newcomm: *mut MPI_Comm) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(128, 0);
+    (entry::MPI_Comm_dup())(comm, newcomm)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_dup_with_info(
+    comm: MPI_Comm,
+    info: MPI_Info,
+    newcomm: *mut MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(129, 0);
+    (entry::MPI_Comm_dup_with_info())(comm, info, newcomm)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_idup(
+    comm: MPI_Comm,
+    newcomm: *mut MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(130, 0);
+    (entry::MPI_Comm_idup())(comm, newcomm, request)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_create(comm: MPI_Comm, group: MPI_Group, newcomm: *mut MPI_Comm) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(131, 0);
+    (entry::MPI_Comm_create())(comm, group, newcomm)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_create_group(
+    comm: MPI_Comm,
+    group: MPI_Group,
+    tag: c_int,
+    newcomm: *mut MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(132, 0);
+    (entry::MPI_Comm_create_group())(comm, group, tag, newcomm)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_split(
+    comm: MPI_Comm,
+    color: c_int,
+    key: c_int,
+    newcomm: *mut MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(133, 0);
+    (entry::MPI_Comm_split())(comm, color, key, newcomm)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_split_type(
+    comm: MPI_Comm,
+    split_type: c_int,
+    key: c_int,
+    info: MPI_Info,
+    newcomm: *mut MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(134, 0);
+    (entry::MPI_Comm_split_type())(comm, split_type, key, info, newcomm)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_free(comm: *mut MPI_Comm) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(135, 0);
+    (entry::MPI_Comm_free())(comm)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_set_info(comm: MPI_Comm, info: MPI_Info) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(136, 0);
+    (entry::MPI_Comm_set_info())(comm, info)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_get_info(comm: MPI_Comm, info: *mut MPI_Info) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(137, 0);
+    (entry::MPI_Comm_get_info())(comm, info)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_test_inter(comm: MPI_Comm, flag: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(138, 0);
+    (entry::MPI_Comm_test_inter())(comm, flag)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_remote_size(comm: MPI_Comm, size: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(139, 0);
+    (entry::MPI_Comm_remote_size())(comm, size)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_remote_group(comm: MPI_Comm, group: *mut MPI_Group) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(140, 0);
+    (entry::MPI_Comm_remote_group())(comm, group)
+}
+
+#[inline]
+pub unsafe fn MPI_Intercomm_create(
+    local_comm: MPI_Comm,
+    local_leader: c_int,
+    peer_comm: MPI_Comm,
+    remote_leader: c_int,
+    tag: c_int,
+    newintercomm: *mut MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(141, 0);
+    (entry::MPI_Intercomm_create())(
+        local_comm,
+        local_leader,
+        peer_comm,
+        remote_leader,
+        tag,
+        newintercomm,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Intercomm_merge(
+    intercomm: MPI_Comm,
+    high: c_int,
+    newintracomm: *mut MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(142, 0);
+    (entry::MPI_Intercomm_merge())(intercomm, high, newintracomm)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_create_keyval(
+    comm_copy_attr_fn: MPI_Comm_copy_attr_function,
+    comm_delete_attr_fn: MPI_Comm_delete_attr_function,
+    comm_keyval: *mut c_int,
+    extra_state: *mut c_void,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(143, 0);
+    (entry::MPI_Comm_create_keyval())(
+        comm_copy_attr_fn,
+        comm_delete_attr_fn,
+        comm_keyval,
+        extra_state,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_free_keyval(comm_keyval: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(144, 0);
+    (entry::MPI_Comm_free_keyval())(comm_keyval)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_set_attr(
+    comm: MPI_Comm,
+    comm_keyval: c_int,
+    attribute_val: *mut c_void,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(145, 0);
+    (entry::MPI_Comm_set_attr())(comm, comm_keyval, attribute_val)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_get_attr(
+    comm: MPI_Comm,
+    comm_keyval: c_int,
+    attribute_val: *mut c_void,
+    flag: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(146, 0);
+    (entry::MPI_Comm_get_attr())(comm, comm_keyval, attribute_val, flag)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_delete_attr(comm: MPI_Comm, comm_keyval: c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(147, 0);
+    (entry::MPI_Comm_delete_attr())(comm, comm_keyval)
+}
+
+#[inline]
+pub unsafe fn MPI_Win_create_keyval(
+    win_copy_attr_fn: MPI_Win_copy_attr_function,
+    win_delete_attr_fn: MPI_Win_delete_attr_function,
+    win_keyval: *mut c_int,
+    extra_state: *mut c_void,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(148, 0);
+    (entry::MPI_Win_create_keyval())(
+        win_copy_attr_fn,
+        win_delete_attr_fn,
+        win_keyval,
+        extra_state,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Win_free_keyval(win_keyval: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(149, 0);
+    (entry::MPI_Win_free_keyval())(win_keyval)
+}
+
+#[inline]
+pub unsafe fn MPI_Win_set_attr(
+    win: MPI_Win,
+    win_keyval: c_int,
+    attribute_val: *mut c_void,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(150, 0);
+    (entry::MPI_Win_set_attr())(win, win_keyval, attribute_val)
+}
+
+#[inline]
+pub unsafe fn MPI_Win_get_attr(
+    win: MPI_Win,
+    win_keyval: c_int,
+    attribute_val: *mut c_void,
+    flag: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(151, 0);
+    (entry::MPI_Win_get_attr())(win, win_keyval, attribute_val, flag)
+}
+
+#[inline]
+pub unsafe fn MPI_Win_delete_attr(win: MPI_Win, win_keyval: c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(152, 0);
+    (entry::MPI_Win_delete_attr())(win, win_keyval)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_create_keyval(
+    type_copy_attr_fn: MPI_Type_copy_attr_function,
+    type_delete_attr_fn: MPI_Type_delete_attr_function,
+    type_keyval: *mut c_int,
+    extra_state: *mut c_void,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(153, 0);
+    (entry::MPI_Type_create_keyval())(
+        type_copy_attr_fn,
+        type_delete_attr_fn,
+        type_keyval,
+        extra_state,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Type_free_keyval(type_keyval: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(154, 0);
+    (entry::MPI_Type_free_keyval())(type_keyval)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_set_attr(
+    type_: MPI_Datatype,
+    type_keyval: c_int,
+    attribute_val: *mut c_void,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(155, 0);
+    (entry::MPI_Type_set_attr())(type_, type_keyval, attribute_val)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_get_attr(
+    type_: MPI_Datatype,
+    type_keyval: c_int,
+    attribute_val: *mut c_void,
+    flag: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(156, 0);
+    (entry::MPI_Type_get_attr())(type_, type_keyval, attribute_val, flag)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_delete_attr(type_: MPI_Datatype, type_keyval: c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(157, 0);
+    (entry::MPI_Type_delete_attr())(type_, type_keyval)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_set_name(comm: MPI_Comm, comm_name: *const c_char) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(158, 0);
+    (entry::MPI_Comm_set_name())(comm, comm_name)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_get_name(
+    comm: MPI_Comm,
+    comm_name: *mut c_char,
+    resultlen: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(159, 0);
+    (entry::MPI_Comm_get_name())(comm, comm_name, resultlen)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_set_name(type_: MPI_Datatype, type_name: *const c_char) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(160, 0);
+    (entry::MPI_Type_set_name())(type_, type_name)
+}
+
+#[inline]
+pub unsafe fn MPI_Type_get_name(
+    type_: MPI_Datatype,
+    type_name: *mut c_char,
+    resultlen: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(161, 0);
+    (entry::MPI_Type_get_name())(type_, type_name, resultlen)
+}
+
+#[inline]
+pub unsafe fn MPI_Win_set_name(win: MPI_Win, win_name: *const c_char) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(162, 0);
+    (entry::MPI_Win_set_name())(win, win_name)
+}
+
+#[inline]
+pub unsafe fn MPI_Win_get_name(
+    win: MPI_Win,
+    win_name: *mut c_char,
+    resultlen: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(163, 0);
+    (entry::MPI_Win_get_name())(win, win_name, resultlen)
+}
+
+#[inline]
+pub unsafe fn MPI_Cart_create(
+    comm_old: MPI_Comm,
+    ndims: c_int,
+    dims: *const c_int,
+    periods: *const c_int,
+    reorder: c_int,
+    comm_cart: *mut MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(164, 0);
+    (entry::MPI_Cart_create())(comm_old, ndims, dims, periods, reorder, comm_cart)
+}
+
+#[inline]
+pub unsafe fn MPI_Dims_create(nnodes: c_int, ndims: c_int, dims: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(165, 0);
+    (entry::MPI_Dims_create())(nnodes, ndims, dims)
+}
+
+#[inline]
+pub unsafe fn MPI_Graph_create(
+    comm_old: MPI_Comm,
+    nnodes: c_int,
+    index: *const c_int,
+    edges: *const c_int,
+    reorder: c_int,
+    comm_graph: *mut MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(166, 0);
+    (entry::MPI_Graph_create())(comm_old, nnodes, index, edges, reorder, comm_graph)
+}
+
+#[inline]
+pub unsafe fn MPI_Dist_graph_create_adjacent(
+    comm_old: MPI_Comm,
+    indegree: c_int,
+    sources: *const c_int,
+    sourceweights: *const c_int,
+    outdegree: c_int,
+    destinations: *const c_int,
+    destweights: *const c_int,
+    info: MPI_Info,
+    reorder: c_int,
+    comm_dist_graph: *mut MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(167, 0);
+    (entry::MPI_Dist_graph_create_adjacent())(
+        comm_old,
+        indegree,
+        sources,
+        sourceweights,
+        outdegree,
+        destinations,
+        destweights,
+        info,
+        reorder,
+        comm_dist_graph,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Dist_graph_create(
+    comm_old: MPI_Comm,
+    n: c_int,
+    sources: *const c_int,
+    degrees: *const c_int,
+    destinations: *const c_int,
+    weights: *const c_int,
+    info: MPI_Info,
+    reorder: c_int,
+    comm_dist_graph: *mut MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(168, 0);
+    (entry::MPI_Dist_graph_create())(
+        comm_old,
+        n,
+        sources,
+        degrees,
+        destinations,
+        weights,
+        info,
+        reorder,
+        comm_dist_graph,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Topo_test(comm: MPI_Comm, status: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(169, 0);
+    (entry::MPI_Topo_test())(comm, status)
+}
+
+#[inline]
+pub unsafe fn MPI_Graphdims_get(comm: MPI_Comm, nnodes: *mut c_int, nedges: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(170, 0);
+    (entry::MPI_Graphdims_get())(comm, nnodes, nedges)
+}
+
+#[inline]
+pub unsafe fn MPI_Graph_get(
+    comm: MPI_Comm,
+    maxindex: c_int,
+    maxedges: c_int,
+    index: *mut c_int,
+    edges: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(171, 0);
+    (entry::MPI_Graph_get())(comm, maxindex, maxedges, index, edges)
+}
+
+#[inline]
+pub unsafe fn MPI_Cartdim_get(comm: MPI_Comm, ndims: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(172, 0);
+    (entry::MPI_Cartdim_get())(comm, ndims)
+}
+
+#[inline]
+pub unsafe fn MPI_Cart_get(
+    comm: MPI_Comm,
+    maxdims: c_int,
+    dims: *mut c_int,
+    periods: *mut c_int,
+    coords: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(173, 0);
+    (entry::MPI_Cart_get())(comm, maxdims, dims, periods, coords)
+}
+
+#[inline]
+pub unsafe fn MPI_Cart_rank(comm: MPI_Comm, coords: *const c_int, rank: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(174, 0);
+    (entry::MPI_Cart_rank())(comm, coords, rank)
+}
+
+#[inline]
+pub unsafe fn MPI_Cart_coords(
+    comm: MPI_Comm,
+    rank: c_int,
+    maxdims: c_int,
+    coords: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(175, 0);
+    (entry::MPI_Cart_coords())(comm, rank, maxdims, coords)
+}
+
+#[inline]
+pub unsafe fn MPI_Graph_neighbors_count(
+    comm: MPI_Comm,
+    rank: c_int,
+    nneighbors: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(176, 0);
+    (entry::MPI_Graph_neighbors_count())(comm, rank, nneighbors)
+}
+
+#[inline]
+pub unsafe fn MPI_Graph_neighbors(
+    comm: MPI_Comm,
+    rank: c_int,
+    maxneighbors: c_int,
+    neighbors: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(177, 0);
+    (entry::MPI_Graph_neighbors())(comm, rank, maxneighbors, neighbors)
+}
+
+#[inline]
+pub unsafe fn MPI_Dist_graph_neighbors_count(
+    comm: MPI_Comm,
+    indegree: *mut c_int,
+    outdegree: *mut c_int,
+    weighted: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(178, 0);
+    (entry::MPI_Dist_graph_neighbors_count())(comm, indegree, outdegree, weighted)
+}
+
+#[inline]
+pub unsafe fn MPI_Dist_graph_neighbors(
+    comm: MPI_Comm,
+    maxindeegree: c_int,
+    sources: *mut c_int,
+    wourceweights: *mut c_int,
+    maxoutdegree: c_int,
+    destinations: *mut c_int,
+    destweights: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(179, 0);
+    (entry::MPI_Dist_graph_neighbors())(
+        comm,
+        maxindeegree,
+        sources,
+        wourceweights,
+        maxoutdegree,
+        destinations,
+        destweights,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Cart_shift(
+    comm: MPI_Comm,
+    direction: c_int,
+    disp: c_int,
+    rank_source: *mut c_int,
+    rank_dest: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(180, 0);
+    (entry::MPI_Cart_shift())(comm, direction, disp, rank_source, rank_dest)
+}
+
+#[inline]
+pub unsafe fn MPI_Cart_sub(
+    comm: MPI_Comm,
+    remain_dims: *const c_int,
+    newcomm: *mut MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(181, 0);
+    (entry::MPI_Cart_sub())(comm, remain_dims, newcomm)
+}
+
+#[inline]
+pub unsafe fn MPI_Cart_map(
+    comm: MPI_Comm,
+    ndims: c_int,
+    dims: *const c_int,
+    periods: *const c_int,
+    newrank: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(182, 0);
+    (entry::MPI_Cart_map())(comm, ndims, dims, periods, newrank)
+}
+
+#[inline]
+pub unsafe fn MPI_Graph_map(
+    comm: MPI_Comm,
+    nnodes: c_int,
+    index: *const c_int,
+    edges: *const c_int,
+    newrank: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(183, 0);
+    (entry::MPI_Graph_map())(comm, nnodes, index, edges, newrank)
+}
+
+#[inline]
+pub unsafe fn MPI_Neighbor_allgather(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        184,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Neighbor_allgather())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Neighbor_allgatherv(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    displs: *const c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(185, trace::volume(sendbuf, sendcount, sendtype));
+    (entry::MPI_Neighbor_allgatherv())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm,
+    )
+}
 
-pub unsafe fn MPI_Group_intersection(
-    group1: MPI_Group,
-    group2: MPI_Group,
-    newgroup: *mut MPI_Group,
+#[inline]
+pub unsafe fn MPI_Neighbor_alltoall(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    senddtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Group, MPI_Group, *mut MPI_Group) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Group_intersection\0");
-        std::mem::transmute(ptr)
-    });
-    f(group1, group2, newgroup)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        186,
+        trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Neighbor_alltoall())(
+        sendbuf, sendcount, senddtype, recvbuf, recvcount, recvtype, comm,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Neighbor_alltoallv(
+    sendbuf: *const c_void,
+    sendcounts: *const c_int,
+    sdispls: *const c_int,
+    senddtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    rdispls: *const c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(187, 0);
+    (entry::MPI_Neighbor_alltoallv())(
+        sendbuf, sendcounts, sdispls, senddtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Neighbor_alltoallw(
+    sendbuf: *const c_void,
+    sendcounts: *const c_int,
+    sdispls: *const MPI_Aint,
+    sendtypes: *const MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    rdispls: *const MPI_Aint,
+    recvtypes: *const MPI_Datatype,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(188, 0);
+    (entry::MPI_Neighbor_alltoallw())(
+        sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Ineighbor_allgather(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        189,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Ineighbor_allgather())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, request,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Ineighbor_allgatherv(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    displs: *const c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(190, trace::volume(sendbuf, sendcount, sendtype));
+    (entry::MPI_Ineighbor_allgatherv())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm, request,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Ineighbor_alltoall(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    senddtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        191,
+        trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Ineighbor_alltoall())(
+        sendbuf, sendcount, senddtype, recvbuf, recvcount, recvtype, comm, request,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Ineighbor_alltoallv(
+    sendbuf: *const c_void,
+    sendcounts: *const c_int,
+    sdispls: *const c_int,
+    senddtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    rdispls: *const c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(192, 0);
+    (entry::MPI_Ineighbor_alltoallv())(
+        sendbuf, sendcounts, sdispls, senddtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+        request,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Ineighbor_alltoallw(
+    sendbuf: *const c_void,
+    sendcounts: *const c_int,
+    sdispls: *const MPI_Aint,
+    sendtypes: *const MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    rdispls: *const MPI_Aint,
+    recvtypes: *const MPI_Datatype,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(193, 0);
+    (entry::MPI_Ineighbor_alltoallw())(
+        sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+        request,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Get_version(version: *mut c_int, subversion: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(194, 0);
+    (entry::MPI_Get_version())(version, subversion)
+}
+
+#[inline]
+pub unsafe fn MPI_Get_library_version(version: *mut c_char, resultlen: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(195, 0);
+    (entry::MPI_Get_library_version())(version, resultlen)
+}
+
+#[inline]
+pub unsafe fn MPI_Get_processor_name(name: *mut c_char, resultlen: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(196, 0);
+    (entry::MPI_Get_processor_name())(name, resultlen)
+}
+
+#[inline]
+pub unsafe fn MPI_Alloc_mem(size: MPI_Aint, info: MPI_Info, baseptr: *mut c_void) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(197, 0);
+    (entry::MPI_Alloc_mem())(size, info, baseptr)
+}
+
+#[inline]
+pub unsafe fn MPI_Free_mem(base: *mut c_void) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(198, 0);
+    (entry::MPI_Free_mem())(base)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_create_errhandler(
+    comm_errhandler_fn: MPI_Comm_errhandler_function,
+    errhandler: *mut MPI_Errhandler,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(199, 0);
+    (entry::MPI_Comm_create_errhandler())(comm_errhandler_fn, errhandler)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_set_errhandler(comm: MPI_Comm, errhandler: MPI_Errhandler) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(200, 0);
+    (entry::MPI_Comm_set_errhandler())(comm, errhandler)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_get_errhandler(comm: MPI_Comm, errhandler: *mut MPI_Errhandler) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(201, 0);
+    (entry::MPI_Comm_get_errhandler())(comm, errhandler)
+}
+
+#[inline]
+pub unsafe fn MPI_Win_create_errhandler(
+    win_errhandler_fn: MPI_Win_errhandler_function,
+    errhandler: *mut MPI_Errhandler,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(202, 0);
+    (entry::MPI_Win_create_errhandler())(win_errhandler_fn, errhandler)
+}
+
+#[inline]
+pub unsafe fn MPI_Win_set_errhandler(win: MPI_Win, errhandler: MPI_Errhandler) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(203, 0);
+    (entry::MPI_Win_set_errhandler())(win, errhandler)
+}
+
+#[inline]
+pub unsafe fn MPI_Win_get_errhandler(win: MPI_Win, errhandler: *mut MPI_Errhandler) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(204, 0);
+    (entry::MPI_Win_get_errhandler())(win, errhandler)
+}
+
+#[inline]
+pub unsafe fn MPI_File_create_errhandler(
+    file_errhandler_fn: MPI_File_errhandler_function,
+    errhandler: *mut MPI_Errhandler,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(205, 0);
+    (entry::MPI_File_create_errhandler())(file_errhandler_fn, errhandler)
+}
+
+#[inline]
+pub unsafe fn MPI_File_set_errhandler(file: MPI_File, errhandler: MPI_Errhandler) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(206, 0);
+    (entry::MPI_File_set_errhandler())(file, errhandler)
+}
+
+#[inline]
+pub unsafe fn MPI_File_get_errhandler(file: MPI_File, errhandler: *mut MPI_Errhandler) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(207, 0);
+    (entry::MPI_File_get_errhandler())(file, errhandler)
+}
+
+#[inline]
+pub unsafe fn MPI_Errhandler_free(errhandler: *mut MPI_Errhandler) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(208, 0);
+    (entry::MPI_Errhandler_free())(errhandler)
+}
+
+#[inline]
+pub unsafe fn MPI_Error_string(
+    errorcode: c_int,
+    string: *mut c_char,
+    resultlen: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(209, 0);
+    (entry::MPI_Error_string())(errorcode, string, resultlen)
+}
+
+#[inline]
+pub unsafe fn MPI_Error_class(errorcode: c_int, errorclass: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(210, 0);
+    (entry::MPI_Error_class())(errorcode, errorclass)
+}
+
+#[inline]
+pub unsafe fn MPI_Add_error_class(errorclass: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(211, 0);
+    (entry::MPI_Add_error_class())(errorclass)
+}
+
+#[inline]
+pub unsafe fn MPI_Add_error_code(errorclass: c_int, errorcode: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(212, 0);
+    (entry::MPI_Add_error_code())(errorclass, errorcode)
+}
+
+#[inline]
+pub unsafe fn MPI_Add_error_string(errorcode: c_int, string: *const c_char) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(213, 0);
+    (entry::MPI_Add_error_string())(errorcode, string)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_call_errhandler(comm: MPI_Comm, errorcode: c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(214, 0);
+    (entry::MPI_Comm_call_errhandler())(comm, errorcode)
+}
+
+#[inline]
+pub unsafe fn MPI_Win_call_errhandler(win: MPI_Win, errorcode: c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(215, 0);
+    (entry::MPI_Win_call_errhandler())(win, errorcode)
+}
+
+#[inline]
+pub unsafe fn MPI_File_call_errhandler(file: MPI_File, errorcode: c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(216, 0);
+    (entry::MPI_File_call_errhandler())(file, errorcode)
+}
+
+#[inline]
+pub unsafe fn MPI_Wtime() -> c_double {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(217, 0);
+    (entry::MPI_Wtime())()
+}
+
+#[inline]
+pub unsafe fn MPI_Wtick() -> c_double {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(218, 0);
+    (entry::MPI_Wtick())()
+}
+
+#[inline]
+pub unsafe fn MPI_Init(argc: *mut c_int, argv: *mut *mut *mut c_char) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(219, 0);
+    (entry::MPI_Init())(argc, argv)
+}
+
+#[inline]
+pub unsafe fn MPI_Finalize() -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(220, 0);
+    (entry::MPI_Finalize())()
+}
+
+#[inline]
+pub unsafe fn MPI_Initialized(flag: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(221, 0);
+    (entry::MPI_Initialized())(flag)
+}
+
+#[inline]
+pub unsafe fn MPI_Abort(comm: MPI_Comm, errorcode: c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(222, 0);
+    (entry::MPI_Abort())(comm, errorcode)
+}
+
+#[inline]
+pub unsafe fn MPI_Finalized(flag: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(223, 0);
+    (entry::MPI_Finalized())(flag)
+}
+
+#[inline]
+pub unsafe fn MPI_Info_create(info: *mut MPI_Info) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(224, 0);
+    (entry::MPI_Info_create())(info)
+}
+
+#[inline]
+pub unsafe fn MPI_Info_set(info: MPI_Info, key: *const c_char, value: *const c_char) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(225, 0);
+    (entry::MPI_Info_set())(info, key, value)
+}
+
+#[inline]
+pub unsafe fn MPI_Info_delete(info: MPI_Info, key: *const c_char) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(226, 0);
+    (entry::MPI_Info_delete())(info, key)
+}
+
+#[inline]
+pub unsafe fn MPI_Info_get(
+    info: MPI_Info,
+    key: *const c_char,
+    valuelen: c_int,
+    value: *mut c_char,
+    flag: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(227, 0);
+    (entry::MPI_Info_get())(info, key, valuelen, value, flag)
 }
 
-pub unsafe fn MPI_Group_difference(
-    group1: MPI_Group,
-    group2: MPI_Group,
-    newgroup: *mut MPI_Group,
+#[inline]
+pub unsafe fn MPI_Info_get_valuelen(
+    info: MPI_Info,
+    key: *const c_char,
+    valuelen: *mut c_int,
+    flag: *mut c_int,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Group, MPI_Group, *mut MPI_Group) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Group_difference\0");
-        std::mem::transmute(ptr)
-    });
-    f(group1, group2, newgroup)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(228, 0);
+    (entry::MPI_Info_get_valuelen())(info, key, valuelen, flag)
 }
 
-pub unsafe fn MPI_Group_incl(
-    group: MPI_Group,
-    n: c_int,
-    ranks: *const c_int,
-    newgroup: *mut MPI_Group,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Group, c_int, *const c_int, *mut MPI_Group) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Group_incl\0");
-        std::mem::transmute(ptr)
-    });
-    f(group, n, ranks, newgroup)
+#[inline]
+pub unsafe fn MPI_Info_get_nkeys(info: MPI_Info, nkeys: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(229, 0);
+    (entry::MPI_Info_get_nkeys())(info, nkeys)
 }
 
-pub unsafe fn MPI_Group_excl(
-    group: MPI_Group,
-    n: c_int,
-    ranks: *const c_int,
-    newgroup: *mut MPI_Group,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Group, c_int, *const c_int, *mut MPI_Group) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Group_excl\0");
-        std::mem::transmute(ptr)
-    });
-    f(group, n, ranks, newgroup)
+#[inline]
+pub unsafe fn MPI_Info_get_nthkey(info: MPI_Info, n: c_int, key: *mut c_char) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(230, 0);
+    (entry::MPI_Info_get_nthkey())(info, n, key)
 }
 
-pub unsafe fn MPI_Group_range_incl(
-    group: MPI_Group,
-    n: c_int,
-    ranges: *mut [c_int; 3],
-    newgroup: *mut MPI_Group,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Group, c_int, *mut [c_int; 3], *mut MPI_Group) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Group_range_incl\0");
-        std::mem::transmute(ptr)
-    });
-    f(group, n, ranges, newgroup)
+#[inline]
+pub unsafe fn MPI_Info_dup(info: MPI_Info, newinfo: *mut MPI_Info) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(231, 0);
+    (entry::MPI_Info_dup())(info, newinfo)
 }
 
-pub unsafe fn MPI_Group_range_excl(
-    group: MPI_Group,
-    n: c_int,
-    ranges: *mut [c_int; 3],
-    newgroup: *mut MPI_Group,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Group, c_int, *mut [c_int; 3], *mut MPI_Group) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Group_range_excl\0");
-        std::mem::transmute(ptr)
-    });
-    f(group, n, ranges, newgroup)
+#[inline]
+pub unsafe fn MPI_Info_free(info: *mut MPI_Info) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(232, 0);
+    (entry::MPI_Info_free())(info)
 }
 
-pub unsafe fn MPI_Group_free(group: *mut MPI_Group) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Group) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Group_free\0");
-        std::mem::transmute(ptr)
-    });
-    f(group)
+#[inline]
+pub unsafe fn MPI_Comm_spawn(
+    command: *const c_char,
+    argv: *mut *mut c_char,
+    maxprocs: c_int,
+    info: MPI_Info,
+    root: c_int,
+    comm: MPI_Comm,
+    intercomm: *mut MPI_Comm,
+    array_off_errcodes: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(233, 0);
+    (entry::MPI_Comm_spawn())(
+        command,
+        argv,
+        maxprocs,
+        info,
+        root,
+        comm,
+        intercomm,
+        array_off_errcodes,
+    )
 }
 
-pub unsafe fn MPI_Comm_size(comm: MPI_Comm, size: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_size\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, size)
+#[inline]
+pub unsafe fn MPI_Comm_get_parent(parent: *mut MPI_Comm) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(234, 0);
+    (entry::MPI_Comm_get_parent())(parent)
 }
 
-pub unsafe fn MPI_Comm_rank(comm: MPI_Comm, rank: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_rank\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, rank)
+#[inline]
+pub unsafe fn MPI_Comm_spawn_multiple(
+    count: c_int,
+    array_of_commands: *mut *mut c_char,
+    array_of_argv: *mut *mut *mut c_char,
+    array_of_maxprocs: *const c_int,
+    array_of_info: *const MPI_Info,
+    root: c_int,
+    comm: MPI_Comm,
+    intercomm: *mut MPI_Comm,
+    array_of_errcodes: *mut c_int,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(235, 0);
+    (entry::MPI_Comm_spawn_multiple())(
+        count,
+        array_of_commands,
+        array_of_argv,
+        array_of_maxprocs,
+        array_of_info,
+        root,
+        comm,
+        intercomm,
+        array_of_errcodes,
+    )
 }
 
-pub unsafe fn MPI_Comm_compare(comm1: MPI_Comm, comm2: MPI_Comm, result: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, MPI_Comm, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_compare\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm1, comm2, result)
+#[inline]
+pub unsafe fn MPI_Open_port(info: MPI_Info, port_name: *mut c_char) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(236, 0);
+    (entry::MPI_Open_port())(info, port_name)
 }
 
-pub unsafe fn MPI_Comm_dup(comm: MPI_Comm, newcomm: *mut MPI_Comm) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *mut MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_dup\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, newcomm)
+#[inline]
+pub unsafe fn MPI_Close_port(port_name: *const c_char) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(237, 0);
+    (entry::MPI_Close_port())(port_name)
 }
 
-pub unsafe fn MPI_Comm_dup_with_info(
-    comm: MPI_Comm,
+#[inline]
+pub unsafe fn MPI_Comm_accept(
+    port_name: *const c_char,
     info: MPI_Info,
+    root: c_int,
+    comm: MPI_Comm,
     newcomm: *mut MPI_Comm,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, MPI_Info, *mut MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_dup_with_info\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, info, newcomm)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(238, 0);
+    (entry::MPI_Comm_accept())(port_name, info, root, comm, newcomm)
 }
 
-pub unsafe fn MPI_Comm_idup(
+#[inline]
+pub unsafe fn MPI_Comm_connect(
+    port_name: *const c_char,
+    info: MPI_Info,
+    root: c_int,
     comm: MPI_Comm,
     newcomm: *mut MPI_Comm,
-    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *mut MPI_Comm, *mut MPI_Request) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_idup\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, newcomm, request)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(239, 0);
+    (entry::MPI_Comm_connect())(port_name, info, root, comm, newcomm)
 }
 
-pub unsafe fn MPI_Comm_create(comm: MPI_Comm, group: MPI_Group, newcomm: *mut MPI_Comm) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, MPI_Group, *mut MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_create\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, group, newcomm)
+#[inline]
+pub unsafe fn MPI_Publish_name(
+    service_name: *const c_char,
+    info: MPI_Info,
+    port_name: *const c_char,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(240, 0);
+    (entry::MPI_Publish_name())(service_name, info, port_name)
 }
 
-pub unsafe fn MPI_Comm_create_group(
-    comm: MPI_Comm,
-    group: MPI_Group,
-    tag: c_int,
-    newcomm: *mut MPI_Comm,
+#[inline]
+pub unsafe fn MPI_Unpublish_name(
+    service_name: *const c_char,
+    info: MPI_Info,
+    port_name: *const c_char,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, MPI_Group, c_int, *mut MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_create_group\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, group, tag, newcomm)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(241, 0);
+    (entry::MPI_Unpublish_name())(service_name, info, port_name)
 }
 
-pub unsafe fn MPI_Comm_split(
+#[inline]
+pub unsafe fn MPI_Lookup_name(
+    service_name: *const c_char,
+    info: MPI_Info,
+    port_name: *mut c_char,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(242, 0);
+    (entry::MPI_Lookup_name())(service_name, info, port_name)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_disconnect(comm: *mut MPI_Comm) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(243, 0);
+    (entry::MPI_Comm_disconnect())(comm)
+}
+
+#[inline]
+pub unsafe fn MPI_Comm_join(fd: c_int, intercomm: *mut MPI_Comm) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(244, 0);
+    (entry::MPI_Comm_join())(fd, intercomm)
+}
+
+#[inline]
+pub unsafe fn MPI_Win_create(
+    base: *mut c_void,
+    size: MPI_Aint,
+    disp_unit: c_int,
+    info: MPI_Info,
     comm: MPI_Comm,
-    color: c_int,
-    key: c_int,
-    newcomm: *mut MPI_Comm,
+    win: *mut MPI_Win,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, c_int, c_int, *mut MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_split\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, color, key, newcomm)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(245, 0);
+    (entry::MPI_Win_create())(base, size, disp_unit, info, comm, win)
 }
 
-pub unsafe fn MPI_Comm_split_type(
+#[inline]
+pub unsafe fn MPI_Win_allocate(
+    size: MPI_Aint,
+    disp_unit: c_int,
+    info: MPI_Info,
     comm: MPI_Comm,
-    split_type: c_int,
-    key: c_int,
+    baseptr: *mut c_void,
+    win: *mut MPI_Win,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(246, 0);
+    (entry::MPI_Win_allocate())(size, disp_unit, info, comm, baseptr, win)
+}
+
+#[inline]
+pub unsafe fn MPI_Win_allocate_shared(
+    size: MPI_Aint,
+    disp_unit: c_int,
     info: MPI_Info,
-    newcomm: *mut MPI_Comm,
+    comm: MPI_Comm,
+    baseptr: *mut c_void,
+    win: *mut MPI_Win,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, c_int, c_int, MPI_Info, *mut MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_split_type\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, split_type, key, info, newcomm)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(247, 0);
+    (entry::MPI_Win_allocate_shared())(size, disp_unit, info, comm, baseptr, win)
 }
 
-pub unsafe fn MPI_Comm_free(comm: *mut MPI_Comm) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_free\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm)
+#[inline]
+pub unsafe fn MPI_Win_shared_query(
+    win: MPI_Win,
+    rank: c_int,
+    size: *mut MPI_Aint,
+    disp_unit: *mut c_int,
+    baseptr: *mut c_void,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(248, 0);
+    (entry::MPI_Win_shared_query())(win, rank, size, disp_unit, baseptr)
 }
 
-pub unsafe fn MPI_Comm_set_info(comm: MPI_Comm, info: MPI_Info) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, MPI_Info) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_set_info\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, info)
+#[inline]
+pub unsafe fn MPI_Win_create_dynamic(info: MPI_Info, comm: MPI_Comm, win: *mut MPI_Win) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(249, 0);
+    (entry::MPI_Win_create_dynamic())(info, comm, win)
 }
 
-pub unsafe fn MPI_Comm_get_info(comm: MPI_Comm, info: *mut MPI_Info) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *mut MPI_Info) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_get_info\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, info)
+#[inline]
+pub unsafe fn MPI_Win_attach(win: MPI_Win, base: *mut c_void, size: MPI_Aint) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(250, 0);
+    (entry::MPI_Win_attach())(win, base, size)
 }
 
-pub unsafe fn MPI_Comm_test_inter(comm: MPI_Comm, flag: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_test_inter\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, flag)
+#[inline]
+pub unsafe fn MPI_Win_detach(win: MPI_Win, base: *const c_void) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(251, 0);
+    (entry::MPI_Win_detach())(win, base)
 }
 
-pub unsafe fn MPI_Comm_remote_size(comm: MPI_Comm, size: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_remote_size\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, size)
+#[inline]
+pub unsafe fn MPI_Win_free(win: *mut MPI_Win) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(252, 0);
+    (entry::MPI_Win_free())(win)
 }
 
-pub unsafe fn MPI_Comm_remote_group(comm: MPI_Comm, group: *mut MPI_Group) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *mut MPI_Group) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_remote_group\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, group)
+#[inline]
+pub unsafe fn MPI_Win_get_group(win: MPI_Win, group: *mut MPI_Group) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(253, 0);
+    (entry::MPI_Win_get_group())(win, group)
 }
 
-pub unsafe fn MPI_Intercomm_create(
-    local_comm: MPI_Comm,
-    local_leader: c_int,
-    peer_comm: MPI_Comm,
-    remote_leader: c_int,
-    tag: c_int,
-    newintercomm: *mut MPI_Comm,
+#[inline]
+pub unsafe fn MPI_Win_set_info(win: MPI_Win, info: MPI_Info) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(254, 0);
+    (entry::MPI_Win_set_info())(win, info)
+}
+
+#[inline]
+pub unsafe fn MPI_Win_get_info(win: MPI_Win, info_used: *mut MPI_Info) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(255, 0);
+    (entry::MPI_Win_get_info())(win, info_used)
+}
+
+#[inline]
+pub unsafe fn MPI_Put(
+    origin_addr: *const c_void,
+    origin_count: c_int,
+    origin_datatype: MPI_Datatype,
+    target_rank: c_int,
+    target_disp: MPI_Aint,
+    target_count: c_int,
+    target_datatype: MPI_Datatype,
+    win: MPI_Win,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        256,
+        trace::volume(origin_addr, origin_count, origin_datatype),
+    );
+    (entry::MPI_Put())(
+        origin_addr,
+        origin_count,
+        origin_datatype,
+        target_rank,
+        target_disp,
+        target_count,
+        target_datatype,
+        win,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Get(
+    origin_addr: *mut c_void,
+    origin_count: c_int,
+    origin_datatype: MPI_Datatype,
+    target_rank: c_int,
+    target_disp: MPI_Aint,
+    target_count: c_int,
+    target_datatype: MPI_Datatype,
+    win: MPI_Win,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        257,
+        trace::volume(origin_addr as *const c_void, origin_count, origin_datatype),
+    );
+    (entry::MPI_Get())(
+        origin_addr,
+        origin_count,
+        origin_datatype,
+        target_rank,
+        target_disp,
+        target_count,
+        target_datatype,
+        win,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Accumulate(
+    origin_addr: *const c_void,
+    origin_count: c_int,
+    origin_datatype: MPI_Datatype,
+    target_rank: c_int,
+    target_disp: MPI_Aint,
+    target_count: c_int,
+    target_datatype: MPI_Datatype,
+    op: MPI_Op,
+    win: MPI_Win,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, c_int, MPI_Comm, c_int, c_int, *mut MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Intercomm_create\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        local_comm,
-        local_leader,
-        peer_comm,
-        remote_leader,
-        tag,
-        newintercomm,
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        258,
+        trace::volume(origin_addr, origin_count, origin_datatype),
+    );
+    (entry::MPI_Accumulate())(
+        origin_addr,
+        origin_count,
+        origin_datatype,
+        target_rank,
+        target_disp,
+        target_count,
+        target_datatype,
+        op,
+        win,
     )
 }
 
-pub unsafe fn MPI_Intercomm_merge(
-    intercomm: MPI_Comm,
-    high: c_int,
-    newintracomm: *mut MPI_Comm,
+#[inline]
+pub unsafe fn MPI_Get_accumulate(
+    origin_addr: *const c_void,
+    origin_count: c_int,
+    origin_datatype: MPI_Datatype,
+    result_addr: *mut c_void,
+    result_count: c_int,
+    result_datatype: MPI_Datatype,
+    target_rank: c_int,
+    target_disp: MPI_Aint,
+    target_count: c_int,
+    target_datatype: MPI_Datatype,
+    op: MPI_Op,
+    win: MPI_Win,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, c_int, *mut MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Intercomm_merge\0");
-        std::mem::transmute(ptr)
-    });
-    f(intercomm, high, newintracomm)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        259,
+        trace::volume(origin_addr, origin_count, origin_datatype)
+            + trace::volume(result_addr as *const c_void, result_count, result_datatype),
+    );
+    (entry::MPI_Get_accumulate())(
+        origin_addr,
+        origin_count,
+        origin_datatype,
+        result_addr,
+        result_count,
+        result_datatype,
+        target_rank,
+        target_disp,
+        target_count,
+        target_datatype,
+        op,
+        win,
+    )
 }
 
-pub unsafe fn MPI_Comm_create_keyval(
-    comm_copy_attr_fn: MPI_Comm_copy_attr_function,
-    comm_delete_attr_fn: MPI_Comm_delete_attr_function,
-    comm_keyval: *mut c_int,
-    extra_state: *mut c_void,
+#[inline]
+pub unsafe fn MPI_Fetch_and_op(
+    origin_addr: *const c_void,
+    result_addr: *mut c_void,
+    datatype: MPI_Datatype,
+    target_rank: c_int,
+    target_disp: MPI_Aint,
+    op: MPI_Op,
+    win: MPI_Win,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_Comm_copy_attr_function,
-        MPI_Comm_delete_attr_function,
-        *mut c_int,
-        *mut c_void,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_create_keyval\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        comm_copy_attr_fn,
-        comm_delete_attr_fn,
-        comm_keyval,
-        extra_state,
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(260, 0);
+    (entry::MPI_Fetch_and_op())(
+        origin_addr,
+        result_addr,
+        datatype,
+        target_rank,
+        target_disp,
+        op,
+        win,
     )
 }
 
-pub unsafe fn MPI_Comm_free_keyval(comm_keyval: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(*mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_free_keyval\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm_keyval)
+#[inline]
+pub unsafe fn MPI_Compare_and_swap(
+    origin_addr: *const c_void,
+    compare_addr: *const c_void,
+    result_addr: *mut c_void,
+    datatype: MPI_Datatype,
+    target_rank: c_int,
+    target_disp: MPI_Aint,
+    win: MPI_Win,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(261, 0);
+    (entry::MPI_Compare_and_swap())(
+        origin_addr,
+        compare_addr,
+        result_addr,
+        datatype,
+        target_rank,
+        target_disp,
+        win,
+    )
 }
 
-pub unsafe fn MPI_Comm_set_attr(
-    comm: MPI_Comm,
-    comm_keyval: c_int,
-    attribute_val: *mut c_void,
+#[inline]
+pub unsafe fn MPI_Rput(
+    origin_addr: *const c_void,
+    origin_count: c_int,
+    origin_datatype: MPI_Datatype,
+    target_rank: c_int,
+    target_disp: MPI_Aint,
+    target_count: c_int,
+    target_datatype: MPI_Datatype,
+    win: MPI_Win,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, c_int, *mut c_void) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_set_attr\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, comm_keyval, attribute_val)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        262,
+        trace::volume(origin_addr, origin_count, origin_datatype),
+    );
+    (entry::MPI_Rput())(
+        origin_addr,
+        origin_count,
+        origin_datatype,
+        target_rank,
+        target_disp,
+        target_count,
+        target_datatype,
+        win,
+        request,
+    )
 }
 
-pub unsafe fn MPI_Comm_get_attr(
-    comm: MPI_Comm,
-    comm_keyval: c_int,
-    attribute_val: *mut c_void,
-    flag: *mut c_int,
+#[inline]
+pub unsafe fn MPI_Rget(
+    origin_addr: *mut c_void,
+    origin_count: c_int,
+    origin_datatype: MPI_Datatype,
+    target_rank: c_int,
+    target_disp: MPI_Aint,
+    target_count: c_int,
+    target_datatype: MPI_Datatype,
+    win: MPI_Win,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, c_int, *mut c_void, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_get_attr\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, comm_keyval, attribute_val, flag)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        263,
+        trace::volume(origin_addr as *const c_void, origin_count, origin_datatype),
+    );
+    (entry::MPI_Rget())(
+        origin_addr,
+        origin_count,
+        origin_datatype,
+        target_rank,
+        target_disp,
+        target_count,
+        target_datatype,
+        win,
+        request,
+    )
 }
 
-pub unsafe fn MPI_Comm_delete_attr(comm: MPI_Comm, comm_keyval: c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_delete_attr\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, comm_keyval)
+#[inline]
+pub unsafe fn MPI_Raccumulate(
+    origin_addr: *const c_void,
+    origin_count: c_int,
+    origin_datatype: MPI_Datatype,
+    target_rank: c_int,
+    target_disp: MPI_Aint,
+    target_count: c_int,
+    target_datatype: MPI_Datatype,
+    op: MPI_Op,
+    win: MPI_Win,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        264,
+        trace::volume(origin_addr, origin_count, origin_datatype),
+    );
+    (entry::MPI_Raccumulate())(
+        origin_addr,
+        origin_count,
+        origin_datatype,
+        target_rank,
+        target_disp,
+        target_count,
+        target_datatype,
+        op,
+        win,
+        request,
+    )
 }
 
-pub unsafe fn MPI_Win_create_keyval(
-    win_copy_attr_fn: MPI_Win_copy_attr_function,
-    win_delete_attr_fn: MPI_Win_delete_attr_function,
-    win_keyval: *mut c_int,
-    extra_state: *mut c_void,
+#[inline]
+pub unsafe fn MPI_Rget_accumulate(
+    origin_addr: *const c_void,
+    origin_count: c_int,
+    origin_datatype: MPI_Datatype,
+    result_addr: *mut c_void,
+    result_count: c_int,
+    result_datatype: MPI_Datatype,
+    target_rank: c_int,
+    target_disp: MPI_Aint,
+    target_count: c_int,
+    target_datatype: MPI_Datatype,
+    op: MPI_Op,
+    win: MPI_Win,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_Win_copy_attr_function,
-        MPI_Win_delete_attr_function,
-        *mut c_int,
-        *mut c_void,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_create_keyval\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        win_copy_attr_fn,
-        win_delete_attr_fn,
-        win_keyval,
-        extra_state,
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        265,
+        trace::volume(origin_addr, origin_count, origin_datatype)
+            + trace::volume(result_addr as *const c_void, result_count, result_datatype),
+    );
+    (entry::MPI_Rget_accumulate())(
+        origin_addr,
+        origin_count,
+        origin_datatype,
+        result_addr,
+        result_count,
+        result_datatype,
+        target_rank,
+        target_disp,
+        target_count,
+        target_datatype,
+        op,
+        win,
+        request,
     )
 }
 
-pub unsafe fn MPI_Win_free_keyval(win_keyval: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(*mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_free_keyval\0");
-        std::mem::transmute(ptr)
-    });
-    f(win_keyval)
+#[inline]
+pub unsafe fn MPI_Win_fence(assert: c_int, win: MPI_Win) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(266, 0);
+    (entry::MPI_Win_fence())(assert, win)
 }
 
-pub unsafe fn MPI_Win_set_attr(
-    win: MPI_Win,
-    win_keyval: c_int,
-    attribute_val: *mut c_void,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win, c_int, *mut c_void) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_set_attr\0");
-        std::mem::transmute(ptr)
-    });
-    f(win, win_keyval, attribute_val)
+#[inline]
+pub unsafe fn MPI_Win_start(group: MPI_Group, assert: c_int, win: MPI_Win) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(267, 0);
+    (entry::MPI_Win_start())(group, assert, win)
 }
 
-pub unsafe fn MPI_Win_get_attr(
-    win: MPI_Win,
-    win_keyval: c_int,
-    attribute_val: *mut c_void,
-    flag: *mut c_int,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win, c_int, *mut c_void, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_get_attr\0");
-        std::mem::transmute(ptr)
-    });
-    f(win, win_keyval, attribute_val, flag)
+#[inline]
+pub unsafe fn MPI_Win_complete(win: MPI_Win) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(268, 0);
+    (entry::MPI_Win_complete())(win)
 }
 
-pub unsafe fn MPI_Win_delete_attr(win: MPI_Win, win_keyval: c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win, c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_delete_attr\0");
-        std::mem::transmute(ptr)
-    });
-    f(win, win_keyval)
+#[inline]
+pub unsafe fn MPI_Win_post(group: MPI_Group, assert: c_int, win: MPI_Win) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(269, 0);
+    (entry::MPI_Win_post())(group, assert, win)
 }
 
-pub unsafe fn MPI_Type_create_keyval(
-    type_copy_attr_fn: MPI_Type_copy_attr_function,
-    type_delete_attr_fn: MPI_Type_delete_attr_function,
-    type_keyval: *mut c_int,
-    extra_state: *mut c_void,
-) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_Type_copy_attr_function,
-        MPI_Type_delete_attr_function,
-        *mut c_int,
-        *mut c_void,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_create_keyval\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        type_copy_attr_fn,
-        type_delete_attr_fn,
-        type_keyval,
-        extra_state,
-    )
+#[inline]
+pub unsafe fn MPI_Win_wait(win: MPI_Win) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(270, 0);
+    (entry::MPI_Win_wait())(win)
+}
+
+#[inline]
+pub unsafe fn MPI_Win_test(win: MPI_Win, flag: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(271, 0);
+    (entry::MPI_Win_test())(win, flag)
 }
 
-pub unsafe fn MPI_Type_free_keyval(type_keyval: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(*mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_free_keyval\0");
-        std::mem::transmute(ptr)
-    });
-    f(type_keyval)
+#[inline]
+pub unsafe fn MPI_Win_lock(lock_type: c_int, rank: c_int, assert: c_int, win: MPI_Win) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(272, 0);
+    (entry::MPI_Win_lock())(lock_type, rank, assert, win)
 }
 
-pub unsafe fn MPI_Type_set_attr(
-    type_: MPI_Datatype,
-    type_keyval: c_int,
-    attribute_val: *mut c_void,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Datatype, c_int, *mut c_void) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_set_attr\0");
-        std::mem::transmute(ptr)
-    });
-    f(type_, type_keyval, attribute_val)
+#[inline]
+pub unsafe fn MPI_Win_lock_all(assert: c_int, win: MPI_Win) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(273, 0);
+    (entry::MPI_Win_lock_all())(assert, win)
 }
 
-pub unsafe fn MPI_Type_get_attr(
-    type_: MPI_Datatype,
-    type_keyval: c_int,
-    attribute_val: *mut c_void,
-    flag: *mut c_int,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Datatype, c_int, *mut c_void, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_get_attr\0");
-        std::mem::transmute(ptr)
-    });
-    f(type_, type_keyval, attribute_val, flag)
+#[inline]
+pub unsafe fn MPI_Win_unlock(rank: c_int, win: MPI_Win) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(274, 0);
+    (entry::MPI_Win_unlock())(rank, win)
 }
 
-pub unsafe fn MPI_Type_delete_attr(type_: MPI_Datatype, type_keyval: c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Datatype, c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_delete_attr\0");
-        std::mem::transmute(ptr)
-    });
-    f(type_, type_keyval)
+#[inline]
+pub unsafe fn MPI_Win_unlock_all(win: MPI_Win) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(275, 0);
+    (entry::MPI_Win_unlock_all())(win)
 }
 
-pub unsafe fn MPI_Comm_set_name(comm: MPI_Comm, comm_name: *const c_char) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *const c_char) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_set_name\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, comm_name)
+#[inline]
+pub unsafe fn MPI_Win_flush(rank: c_int, win: MPI_Win) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(276, 0);
+    (entry::MPI_Win_flush())(rank, win)
 }
 
-pub unsafe fn MPI_Comm_get_name(
-    comm: MPI_Comm,
-    comm_name: *mut c_char,
-    resultlen: *mut c_int,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *mut c_char, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_get_name\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, comm_name, resultlen)
+#[inline]
+pub unsafe fn MPI_Win_flush_all(win: MPI_Win) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(277, 0);
+    (entry::MPI_Win_flush_all())(win)
 }
 
-pub unsafe fn MPI_Type_set_name(type_: MPI_Datatype, type_name: *const c_char) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Datatype, *const c_char) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_set_name\0");
-        std::mem::transmute(ptr)
-    });
-    f(type_, type_name)
+#[inline]
+pub unsafe fn MPI_Win_flush_local(rank: c_int, win: MPI_Win) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(278, 0);
+    (entry::MPI_Win_flush_local())(rank, win)
 }
 
-pub unsafe fn MPI_Type_get_name(
-    type_: MPI_Datatype,
-    type_name: *mut c_char,
-    resultlen: *mut c_int,
+#[inline]
+pub unsafe fn MPI_Win_flush_local_all(win: MPI_Win) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(279, 0);
+    (entry::MPI_Win_flush_local_all())(win)
+}
+
+#[inline]
+pub unsafe fn MPI_Win_sync(win: MPI_Win) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(280, 0);
+    (entry::MPI_Win_sync())(win)
+}
+
+#[inline]
+pub unsafe fn MPI_Grequest_start(
+    query_fn: MPI_Grequest_query_function,
+    free_fn: MPI_Grequest_free_function,
+    cancel_fn: MPI_Grequest_cancel_function,
+    extra_state: *mut c_void,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Datatype, *mut c_char, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_get_name\0");
-        std::mem::transmute(ptr)
-    });
-    f(type_, type_name, resultlen)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(281, 0);
+    (entry::MPI_Grequest_start())(query_fn, free_fn, cancel_fn, extra_state, request)
 }
 
-pub unsafe fn MPI_Win_set_name(win: MPI_Win, win_name: *const c_char) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win, *const c_char) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_set_name\0");
-        std::mem::transmute(ptr)
-    });
-    f(win, win_name)
+#[inline]
+pub unsafe fn MPI_Grequest_complete(request: MPI_Request) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(282, 0);
+    (entry::MPI_Grequest_complete())(request)
 }
 
-pub unsafe fn MPI_Win_get_name(
-    win: MPI_Win,
-    win_name: *mut c_char,
-    resultlen: *mut c_int,
+#[inline]
+pub unsafe fn MPI_Status_set_elements(
+    status: *mut MPI_Status,
+    datatype: MPI_Datatype,
+    count: c_int,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win, *mut c_char, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_get_name\0");
-        std::mem::transmute(ptr)
-    });
-    f(win, win_name, resultlen)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(283, trace::volume(std::ptr::null(), count, datatype));
+    (entry::MPI_Status_set_elements())(status, datatype, count)
 }
 
-pub unsafe fn MPI_Cart_create(
-    comm_old: MPI_Comm,
-    ndims: c_int,
-    dims: *const c_int,
-    periods: *const c_int,
-    reorder: c_int,
-    comm_cart: *mut MPI_Comm,
+#[inline]
+pub unsafe fn MPI_Status_set_elements_x(
+    status: *mut MPI_Status,
+    datatype: MPI_Datatype,
+    count: MPI_Count,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_Comm,
-        c_int,
-        *const c_int,
-        *const c_int,
-        c_int,
-        *mut MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Cart_create\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm_old, ndims, dims, periods, reorder, comm_cart)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(284, trace::volume(std::ptr::null(), count, datatype));
+    (entry::MPI_Status_set_elements_x())(status, datatype, count)
 }
 
-pub unsafe fn MPI_Dims_create(nnodes: c_int, ndims: c_int, dims: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(c_int, c_int, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Dims_create\0");
-        std::mem::transmute(ptr)
-    });
-    f(nnodes, ndims, dims)
+#[inline]
+pub unsafe fn MPI_Status_set_cancelled(status: *mut MPI_Status, flag: c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(285, 0);
+    (entry::MPI_Status_set_cancelled())(status, flag)
 }
 
-pub unsafe fn MPI_Graph_create(
-    comm_old: MPI_Comm,
-    nnodes: c_int,
-    index: *const c_int,
-    edges: *const c_int,
-    reorder: c_int,
-    comm_graph: *mut MPI_Comm,
+#[inline]
+pub unsafe fn MPI_Init_thread(
+    argc: *mut c_int,
+    argv: *mut *mut *mut c_char,
+    required: c_int,
+    provided: *mut c_int,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_Comm,
-        c_int,
-        *const c_int,
-        *const c_int,
-        c_int,
-        *mut MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Graph_create\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm_old, nnodes, index, edges, reorder, comm_graph)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(286, 0);
+    (entry::MPI_Init_thread())(argc, argv, required, provided)
 }
 
-pub unsafe fn MPI_Dist_graph_create_adjacent(
-    comm_old: MPI_Comm,
-    indegree: c_int,
-    sources: *const c_int,
-    sourceweights: *const c_int,
-    outdegree: c_int,
-    destinations: *const c_int,
-    destweights: *const c_int,
-    info: MPI_Info,
-    reorder: c_int,
-    comm_dist_graph: *mut MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_Comm,
-        c_int,
-        *const c_int,
-        *const c_int,
-        c_int,
-        *const c_int,
-        *const c_int,
-        MPI_Info,
-        c_int,
-        *mut MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Dist_graph_create_adjacent\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        comm_old,
-        indegree,
-        sources,
-        sourceweights,
-        outdegree,
-        destinations,
-        destweights,
-        info,
-        reorder,
-        comm_dist_graph,
-    )
+#[inline]
+pub unsafe fn MPI_Query_thread(provided: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(287, 0);
+    (entry::MPI_Query_thread())(provided)
 }
 
-pub unsafe fn MPI_Dist_graph_create(
-    comm_old: MPI_Comm,
-    n: c_int,
-    sources: *const c_int,
-    degrees: *const c_int,
-    destinations: *const c_int,
-    weights: *const c_int,
+#[inline]
+pub unsafe fn MPI_Is_thread_main(flag: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(288, 0);
+    (entry::MPI_Is_thread_main())(flag)
+}
+
+#[inline]
+pub unsafe fn MPI_File_open(
+    comm: MPI_Comm,
+    filename: *const c_char,
+    amode: c_int,
     info: MPI_Info,
-    reorder: c_int,
-    comm_dist_graph: *mut MPI_Comm,
+    fh: *mut MPI_File,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_Comm,
-        c_int,
-        *const c_int,
-        *const c_int,
-        *const c_int,
-        *const c_int,
-        MPI_Info,
-        c_int,
-        *mut MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Dist_graph_create\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        comm_old,
-        n,
-        sources,
-        degrees,
-        destinations,
-        weights,
-        info,
-        reorder,
-        comm_dist_graph,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(289, 0);
+    (entry::MPI_File_open())(comm, filename, amode, info, fh)
 }
 
-pub unsafe fn MPI_Topo_test(comm: MPI_Comm, status: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Topo_test\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, status)
+#[inline]
+pub unsafe fn MPI_File_close(fh: *mut MPI_File) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(290, 0);
+    (entry::MPI_File_close())(fh)
 }
 
-pub unsafe fn MPI_Graphdims_get(comm: MPI_Comm, nnodes: *mut c_int, nedges: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *mut c_int, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Graphdims_get\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, nnodes, nedges)
+#[inline]
+pub unsafe fn MPI_File_delete(filename: *const c_char, info: MPI_Info) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(291, 0);
+    (entry::MPI_File_delete())(filename, info)
 }
 
-pub unsafe fn MPI_Graph_get(
-    comm: MPI_Comm,
-    maxindex: c_int,
-    maxedges: c_int,
-    index: *mut c_int,
-    edges: *mut c_int,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, c_int, c_int, *mut c_int, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Graph_get\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, maxindex, maxedges, index, edges)
+#[inline]
+pub unsafe fn MPI_File_set_size(fh: MPI_File, size: MPI_Offset) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(292, 0);
+    (entry::MPI_File_set_size())(fh, size)
 }
 
-pub unsafe fn MPI_Cartdim_get(comm: MPI_Comm, ndims: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Cartdim_get\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, ndims)
+#[inline]
+pub unsafe fn MPI_File_preallocate(fh: MPI_File, size: MPI_Offset) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(293, 0);
+    (entry::MPI_File_preallocate())(fh, size)
 }
 
-pub unsafe fn MPI_Cart_get(
-    comm: MPI_Comm,
-    maxdims: c_int,
-    dims: *mut c_int,
-    periods: *mut c_int,
-    coords: *mut c_int,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, c_int, *mut c_int, *mut c_int, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Cart_get\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, maxdims, dims, periods, coords)
+#[inline]
+pub unsafe fn MPI_File_get_size(fh: MPI_File, size: *mut MPI_Offset) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(294, 0);
+    (entry::MPI_File_get_size())(fh, size)
 }
 
-pub unsafe fn MPI_Cart_rank(comm: MPI_Comm, coords: *const c_int, rank: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *const c_int, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Cart_rank\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, coords, rank)
+#[inline]
+pub unsafe fn MPI_File_get_group(fh: MPI_File, group: *mut MPI_Group) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(295, 0);
+    (entry::MPI_File_get_group())(fh, group)
 }
 
-pub unsafe fn MPI_Cart_coords(
-    comm: MPI_Comm,
-    rank: c_int,
-    maxdims: c_int,
-    coords: *mut c_int,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, c_int, c_int, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Cart_coords\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, rank, maxdims, coords)
+#[inline]
+pub unsafe fn MPI_File_get_amode(fh: MPI_File, amode: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(296, 0);
+    (entry::MPI_File_get_amode())(fh, amode)
 }
 
-pub unsafe fn MPI_Graph_neighbors_count(
-    comm: MPI_Comm,
-    rank: c_int,
-    nneighbors: *mut c_int,
+#[inline]
+pub unsafe fn MPI_File_set_info(fh: MPI_File, info: MPI_Info) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(297, 0);
+    (entry::MPI_File_set_info())(fh, info)
+}
+
+#[inline]
+pub unsafe fn MPI_File_get_info(fh: MPI_File, info_used: *mut MPI_Info) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(298, 0);
+    (entry::MPI_File_get_info())(fh, info_used)
+}
+
+#[inline]
+pub unsafe fn MPI_File_set_view(
+    fh: MPI_File,
+    disp: MPI_Offset,
+    etype: MPI_Datatype,
+    filetype: MPI_Datatype,
+    datarep: *const c_char,
+    info: MPI_Info,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, c_int, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Graph_neighbors_count\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, rank, nneighbors)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(299, 0);
+    (entry::MPI_File_set_view())(fh, disp, etype, filetype, datarep, info)
 }
 
-pub unsafe fn MPI_Graph_neighbors(
-    comm: MPI_Comm,
-    rank: c_int,
-    maxneighbors: c_int,
-    neighbors: *mut c_int,
+#[inline]
+pub unsafe fn MPI_File_get_view(
+    fh: MPI_File,
+    disp: *mut MPI_Offset,
+    etype: *mut MPI_Datatype,
+    filetype: *mut MPI_Datatype,
+    datarep: *mut c_char,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, c_int, c_int, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Graph_neighbors\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, rank, maxneighbors, neighbors)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(300, 0);
+    (entry::MPI_File_get_view())(fh, disp, etype, filetype, datarep)
 }
 
-pub unsafe fn MPI_Dist_graph_neighbors_count(
-    comm: MPI_Comm,
-    indegree: *mut c_int,
-    outdegree: *mut c_int,
-    weighted: *mut c_int,
+#[inline]
+pub unsafe fn MPI_File_read_at(
+    fh: MPI_File,
+    offset: MPI_Offset,
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    status: *mut MPI_Status,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *mut c_int, *mut c_int, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Dist_graph_neighbors_count\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, indegree, outdegree, weighted)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(301, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_File_read_at())(fh, offset, buf, count, datatype, status)
 }
 
-pub unsafe fn MPI_Dist_graph_neighbors(
-    comm: MPI_Comm,
-    maxindeegree: c_int,
-    sources: *mut c_int,
-    wourceweights: *mut c_int,
-    maxoutdegree: c_int,
-    destinations: *mut c_int,
-    destweights: *mut c_int,
+#[inline]
+pub unsafe fn MPI_File_read_at_all(
+    fh: MPI_File,
+    offset: MPI_Offset,
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    status: *mut MPI_Status,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_Comm,
-        c_int,
-        *mut c_int,
-        *mut c_int,
-        c_int,
-        *mut c_int,
-        *mut c_int,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Dist_graph_neighbors\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        comm,
-        maxindeegree,
-        sources,
-        wourceweights,
-        maxoutdegree,
-        destinations,
-        destweights,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(302, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_File_read_at_all())(fh, offset, buf, count, datatype, status)
 }
 
-pub unsafe fn MPI_Cart_shift(
-    comm: MPI_Comm,
-    direction: c_int,
-    disp: c_int,
-    rank_source: *mut c_int,
-    rank_dest: *mut c_int,
+#[inline]
+pub unsafe fn MPI_File_write_at(
+    fh: MPI_File,
+    offset: MPI_Offset,
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    status: *mut MPI_Status,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, c_int, c_int, *mut c_int, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Cart_shift\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, direction, disp, rank_source, rank_dest)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(303, trace::volume(buf, count, datatype));
+    (entry::MPI_File_write_at())(fh, offset, buf, count, datatype, status)
 }
 
-pub unsafe fn MPI_Cart_sub(
-    comm: MPI_Comm,
-    remain_dims: *const c_int,
-    newcomm: *mut MPI_Comm,
+#[inline]
+pub unsafe fn MPI_File_write_at_all(
+    fh: MPI_File,
+    offset: MPI_Offset,
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    status: *mut MPI_Status,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *const c_int, *mut MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Cart_sub\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, remain_dims, newcomm)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(304, trace::volume(buf, count, datatype));
+    (entry::MPI_File_write_at_all())(fh, offset, buf, count, datatype, status)
 }
 
-pub unsafe fn MPI_Cart_map(
-    comm: MPI_Comm,
-    ndims: c_int,
-    dims: *const c_int,
-    periods: *const c_int,
-    newrank: *mut c_int,
+#[inline]
+pub unsafe fn MPI_File_iread_at(
+    fh: MPI_File,
+    offset: MPI_Offset,
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, c_int, *const c_int, *const c_int, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Cart_map\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, ndims, dims, periods, newrank)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(305, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_File_iread_at())(fh, offset, buf, count, datatype, request)
 }
 
-pub unsafe fn MPI_Graph_map(
-    comm: MPI_Comm,
-    nnodes: c_int,
-    index: *const c_int,
-    edges: *const c_int,
-    newrank: *mut c_int,
+#[inline]
+pub unsafe fn MPI_File_iread_at_all(
+    fh: MPI_File,
+    offset: MPI_Offset,
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, c_int, *const c_int, *const c_int, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Graph_map\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, nnodes, index, edges, newrank)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(306, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_File_iread_at_all())(fh, offset, buf, count, datatype, request)
 }
 
-pub unsafe fn MPI_Neighbor_allgather(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcount: c_int,
-    recvtype: MPI_Datatype,
-    comm: MPI_Comm,
+#[inline]
+pub unsafe fn MPI_File_iwrite_at(
+    fh: MPI_File,
+    offset: MPI_Offset,
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut c_void,
-        c_int,
-        MPI_Datatype,
-        MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Neighbor_allgather\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(307, trace::volume(buf, count, datatype));
+    (entry::MPI_File_iwrite_at())(fh, offset, buf, count, datatype, request)
 }
 
-pub unsafe fn MPI_Neighbor_allgatherv(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcounts: *const c_int,
-    displs: *const c_int,
-    recvtype: MPI_Datatype,
-    comm: MPI_Comm,
+#[inline]
+pub unsafe fn MPI_File_iwrite_at_all(
+    fh: MPI_File,
+    offset: MPI_Offset,
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut c_void,
-        *const c_int,
-        *const c_int,
-        MPI_Datatype,
-        MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Neighbor_allgatherv\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(308, trace::volume(buf, count, datatype));
+    (entry::MPI_File_iwrite_at_all())(fh, offset, buf, count, datatype, request)
 }
 
-pub unsafe fn MPI_Neighbor_alltoall(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    senddtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcount: c_int,
-    recvtype: MPI_Datatype,
-    comm: MPI_Comm,
+#[inline]
+pub unsafe fn MPI_File_read(
+    fh: MPI_File,
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    status: *mut MPI_Status,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut c_void,
-        c_int,
-        MPI_Datatype,
-        MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Neighbor_alltoall\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, senddtype, recvbuf, recvcount, recvtype, comm,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(309, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_File_read())(fh, buf, count, datatype, status)
 }
 
-pub unsafe fn MPI_Neighbor_alltoallv(
-    sendbuf: *const c_void,
-    sendcounts: *const c_int,
-    sdispls: *const c_int,
-    senddtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcounts: *const c_int,
-    rdispls: *const c_int,
-    recvtype: MPI_Datatype,
-    comm: MPI_Comm,
+#[inline]
+pub unsafe fn MPI_File_read_all(
+    fh: MPI_File,
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    status: *mut MPI_Status,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        *const c_int,
-        *const c_int,
-        MPI_Datatype,
-        *mut c_void,
-        *const c_int,
-        *const c_int,
-        MPI_Datatype,
-        MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Neighbor_alltoallv\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcounts, sdispls, senddtype, recvbuf, recvcounts, rdispls, recvtype, comm,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(310, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_File_read_all())(fh, buf, count, datatype, status)
 }
 
-pub unsafe fn MPI_Neighbor_alltoallw(
-    sendbuf: *const c_void,
-    sendcounts: *const c_int,
-    sdispls: *const MPI_Aint,
-    sendtypes: *const MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcounts: *const c_int,
-    rdispls: *const MPI_Aint,
-    recvtypes: *const MPI_Datatype,
-    comm: MPI_Comm,
+#[inline]
+pub unsafe fn MPI_File_write(
+    fh: MPI_File,
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    status: *mut MPI_Status,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        *const c_int,
-        *const MPI_Aint,
-        *const MPI_Datatype,
-        *mut c_void,
-        *const c_int,
-        *const MPI_Aint,
-        *const MPI_Datatype,
-        MPI_Comm,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Neighbor_alltoallw\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(311, trace::volume(buf, count, datatype));
+    (entry::MPI_File_write())(fh, buf, count, datatype, status)
 }
 
-pub unsafe fn MPI_Ineighbor_allgather(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcount: c_int,
-    recvtype: MPI_Datatype,
-    comm: MPI_Comm,
-    request: *mut MPI_Request,
+#[inline]
+pub unsafe fn MPI_File_write_all(
+    fh: MPI_File,
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    status: *mut MPI_Status,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut c_void,
-        c_int,
-        MPI_Datatype,
-        MPI_Comm,
-        *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Ineighbor_allgather\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, request,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(312, trace::volume(buf, count, datatype));
+    (entry::MPI_File_write_all())(fh, buf, count, datatype, status)
 }
 
-pub unsafe fn MPI_Ineighbor_allgatherv(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    sendtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcounts: *const c_int,
-    displs: *const c_int,
-    recvtype: MPI_Datatype,
-    comm: MPI_Comm,
+#[inline]
+pub unsafe fn MPI_File_iread(
+    fh: MPI_File,
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
     request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut c_void,
-        *const c_int,
-        *const c_int,
-        MPI_Datatype,
-        MPI_Comm,
-        *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Ineighbor_allgatherv\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm, request,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(313, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_File_iread())(fh, buf, count, datatype, request)
 }
 
-pub unsafe fn MPI_Ineighbor_alltoall(
-    sendbuf: *const c_void,
-    sendcount: c_int,
-    senddtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcount: c_int,
-    recvtype: MPI_Datatype,
-    comm: MPI_Comm,
+#[inline]
+pub unsafe fn MPI_File_iread_all(
+    fh: MPI_File,
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
     request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut c_void,
-        c_int,
-        MPI_Datatype,
-        MPI_Comm,
-        *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Ineighbor_alltoall\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcount, senddtype, recvbuf, recvcount, recvtype, comm, request,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(314, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_File_iread_all())(fh, buf, count, datatype, request)
 }
 
-pub unsafe fn MPI_Ineighbor_alltoallv(
-    sendbuf: *const c_void,
-    sendcounts: *const c_int,
-    sdispls: *const c_int,
-    senddtype: MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcounts: *const c_int,
-    rdispls: *const c_int,
-    recvtype: MPI_Datatype,
-    comm: MPI_Comm,
+#[inline]
+pub unsafe fn MPI_File_iwrite(
+    fh: MPI_File,
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
     request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        *const c_int,
-        *const c_int,
-        MPI_Datatype,
-        *mut c_void,
-        *const c_int,
-        *const c_int,
-        MPI_Datatype,
-        MPI_Comm,
-        *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Ineighbor_alltoallv\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcounts, sdispls, senddtype, recvbuf, recvcounts, rdispls, recvtype, comm,
-        request,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(315, trace::volume(buf, count, datatype));
+    (entry::MPI_File_iwrite())(fh, buf, count, datatype, request)
 }
 
-pub unsafe fn MPI_Ineighbor_alltoallw(
-    sendbuf: *const c_void,
-    sendcounts: *const c_int,
-    sdispls: *const MPI_Aint,
-    sendtypes: *const MPI_Datatype,
-    recvbuf: *mut c_void,
-    recvcounts: *const c_int,
-    rdispls: *const MPI_Aint,
-    recvtypes: *const MPI_Datatype,
-    comm: MPI_Comm,
+#[inline]
+pub unsafe fn MPI_File_iwrite_all(
+    fh: MPI_File,
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
     request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        *const c_int,
-        *const MPI_Aint,
-        *const MPI_Datatype,
-        *mut c_void,
-        *const c_int,
-        *const MPI_Aint,
-        *const MPI_Datatype,
-        MPI_Comm,
-        *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Ineighbor_alltoallw\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
-        request,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(316, trace::volume(buf, count, datatype));
+    (entry::MPI_File_iwrite_all())(fh, buf, count, datatype, request)
 }
 
-pub unsafe fn MPI_Get_version(version: *mut c_int, subversion: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(*mut c_int, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Get_version\0");
-        std::mem::transmute(ptr)
-    });
-    f(version, subversion)
+#[inline]
+pub unsafe fn MPI_File_seek(fh: MPI_File, offset: MPI_Offset, whence: c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(317, 0);
+    (entry::MPI_File_seek())(fh, offset, whence)
 }
 
-pub unsafe fn MPI_Get_library_version(version: *mut c_char, resultlen: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(*mut c_char, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Get_library_version\0");
-        std::mem::transmute(ptr)
-    });
-    f(version, resultlen)
+#[inline]
+pub unsafe fn MPI_File_get_position(fh: MPI_File, offset: *mut MPI_Offset) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(318, 0);
+    (entry::MPI_File_get_position())(fh, offset)
 }
 
-pub unsafe fn MPI_Get_processor_name(name: *mut c_char, resultlen: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(*mut c_char, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Get_processor_name\0");
-        std::mem::transmute(ptr)
-    });
-    f(name, resultlen)
+#[inline]
+pub unsafe fn MPI_File_get_byte_offset(
+    fh: MPI_File,
+    offset: MPI_Offset,
+    disp: *mut MPI_Offset,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(319, 0);
+    (entry::MPI_File_get_byte_offset())(fh, offset, disp)
 }
 
-pub unsafe fn MPI_Alloc_mem(size: MPI_Aint, info: MPI_Info, baseptr: *mut c_void) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Aint, MPI_Info, *mut c_void) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Alloc_mem\0");
-        std::mem::transmute(ptr)
-    });
-    f(size, info, baseptr)
+#[inline]
+pub unsafe fn MPI_File_read_shared(
+    fh: MPI_File,
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(320, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_File_read_shared())(fh, buf, count, datatype, status)
 }
 
-pub unsafe fn MPI_Free_mem(base: *mut c_void) -> c_int {
-    type F = unsafe extern "C" fn(*mut c_void) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Free_mem\0");
-        std::mem::transmute(ptr)
-    });
-    f(base)
+#[inline]
+pub unsafe fn MPI_File_write_shared(
+    fh: MPI_File,
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(321, trace::volume(buf, count, datatype));
+    (entry::MPI_File_write_shared())(fh, buf, count, datatype, status)
 }
 
-pub unsafe fn MPI_Comm_create_errhandler(
-    comm_errhandler_fn: MPI_Comm_errhandler_function,
-    errhandler: *mut MPI_Errhandler,
+#[inline]
+pub unsafe fn MPI_File_iread_shared(
+    fh: MPI_File,
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm_errhandler_function, *mut MPI_Errhandler) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_create_errhandler\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm_errhandler_fn, errhandler)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(322, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_File_iread_shared())(fh, buf, count, datatype, request)
 }
 
-pub unsafe fn MPI_Comm_set_errhandler(comm: MPI_Comm, errhandler: MPI_Errhandler) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, MPI_Errhandler) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_set_errhandler\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, errhandler)
+#[inline]
+pub unsafe fn MPI_File_iwrite_shared(
+    fh: MPI_File,
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(323, trace::volume(buf, count, datatype));
+    (entry::MPI_File_iwrite_shared())(fh, buf, count, datatype, request)
 }
 
-pub unsafe fn MPI_Comm_get_errhandler(comm: MPI_Comm, errhandler: *mut MPI_Errhandler) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *mut MPI_Errhandler) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_get_errhandler\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, errhandler)
+#[inline]
+pub unsafe fn MPI_File_read_ordered(
+    fh: MPI_File,
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(324, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_File_read_ordered())(fh, buf, count, datatype, status)
 }
 
-pub unsafe fn MPI_Win_create_errhandler(
-    win_errhandler_fn: MPI_Win_errhandler_function,
-    errhandler: *mut MPI_Errhandler,
+#[inline]
+pub unsafe fn MPI_File_write_ordered(
+    fh: MPI_File,
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    status: *mut MPI_Status,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win_errhandler_function, *mut MPI_Errhandler) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_create_errhandler\0");
-        std::mem::transmute(ptr)
-    });
-    f(win_errhandler_fn, errhandler)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(325, trace::volume(buf, count, datatype));
+    (entry::MPI_File_write_ordered())(fh, buf, count, datatype, status)
 }
 
-pub unsafe fn MPI_Win_set_errhandler(win: MPI_Win, errhandler: MPI_Errhandler) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win, MPI_Errhandler) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_set_errhandler\0");
-        std::mem::transmute(ptr)
-    });
-    f(win, errhandler)
+#[inline]
+pub unsafe fn MPI_File_seek_shared(fh: MPI_File, offset: MPI_Offset, whence: c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(326, 0);
+    (entry::MPI_File_seek_shared())(fh, offset, whence)
 }
 
-pub unsafe fn MPI_Win_get_errhandler(win: MPI_Win, errhandler: *mut MPI_Errhandler) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win, *mut MPI_Errhandler) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_get_errhandler\0");
-        std::mem::transmute(ptr)
-    });
-    f(win, errhandler)
+#[inline]
+pub unsafe fn MPI_File_get_position_shared(fh: MPI_File, offset: *mut MPI_Offset) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(327, 0);
+    (entry::MPI_File_get_position_shared())(fh, offset)
 }
 
-pub unsafe fn MPI_File_create_errhandler(
-    file_errhandler_fn: MPI_File_errhandler_function,
-    errhandler: *mut MPI_Errhandler,
+#[inline]
+pub unsafe fn MPI_File_read_at_all_begin(
+    fh: MPI_File,
+    offset: MPI_Offset,
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File_errhandler_function, *mut MPI_Errhandler) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_create_errhandler\0");
-        std::mem::transmute(ptr)
-    });
-    f(file_errhandler_fn, errhandler)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(328, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_File_read_at_all_begin())(fh, offset, buf, count, datatype)
 }
 
-pub unsafe fn MPI_File_set_errhandler(file: MPI_File, errhandler: MPI_Errhandler) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, MPI_Errhandler) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_set_errhandler\0");
-        std::mem::transmute(ptr)
-    });
-    f(file, errhandler)
+#[inline]
+pub unsafe fn MPI_File_read_at_all_end(
+    fh: MPI_File,
+    buf: *mut c_void,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(329, 0);
+    (entry::MPI_File_read_at_all_end())(fh, buf, status)
 }
 
-pub unsafe fn MPI_File_get_errhandler(file: MPI_File, errhandler: *mut MPI_Errhandler) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, *mut MPI_Errhandler) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_get_errhandler\0");
-        std::mem::transmute(ptr)
-    });
-    f(file, errhandler)
+#[inline]
+pub unsafe fn MPI_File_write_at_all_begin(
+    fh: MPI_File,
+    offset: MPI_Offset,
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(330, trace::volume(buf, count, datatype));
+    (entry::MPI_File_write_at_all_begin())(fh, offset, buf, count, datatype)
 }
 
-pub unsafe fn MPI_Errhandler_free(errhandler: *mut MPI_Errhandler) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Errhandler) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Errhandler_free\0");
-        std::mem::transmute(ptr)
-    });
-    f(errhandler)
+#[inline]
+pub unsafe fn MPI_File_write_at_all_end(
+    fh: MPI_File,
+    buf: *const c_void,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(331, 0);
+    (entry::MPI_File_write_at_all_end())(fh, buf, status)
 }
 
-pub unsafe fn MPI_Error_string(
-    errorcode: c_int,
-    string: *mut c_char,
-    resultlen: *mut c_int,
+#[inline]
+pub unsafe fn MPI_File_read_all_begin(
+    fh: MPI_File,
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
 ) -> c_int {
-    type F = unsafe extern "C" fn(c_int, *mut c_char, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Error_string\0");
-        std::mem::transmute(ptr)
-    });
-    f(errorcode, string, resultlen)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(332, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_File_read_all_begin())(fh, buf, count, datatype)
 }
 
-pub unsafe fn MPI_Error_class(errorcode: c_int, errorclass: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(c_int, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Error_class\0");
-        std::mem::transmute(ptr)
-    });
-    f(errorcode, errorclass)
+#[inline]
+pub unsafe fn MPI_File_read_all_end(
+    fh: MPI_File,
+    buf: *mut c_void,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(333, 0);
+    (entry::MPI_File_read_all_end())(fh, buf, status)
 }
 
-pub unsafe fn MPI_Add_error_class(errorclass: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(*mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Add_error_class\0");
-        std::mem::transmute(ptr)
-    });
-    f(errorclass)
+#[inline]
+pub unsafe fn MPI_File_write_all_begin(
+    fh: MPI_File,
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(334, trace::volume(buf, count, datatype));
+    (entry::MPI_File_write_all_begin())(fh, buf, count, datatype)
 }
 
-pub unsafe fn MPI_Add_error_code(errorclass: c_int, errorcode: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(c_int, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Add_error_code\0");
-        std::mem::transmute(ptr)
-    });
-    f(errorclass, errorcode)
+#[inline]
+pub unsafe fn MPI_File_write_all_end(
+    fh: MPI_File,
+    buf: *const c_void,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(335, 0);
+    (entry::MPI_File_write_all_end())(fh, buf, status)
 }
 
-pub unsafe fn MPI_Add_error_string(errorcode: c_int, string: *const c_char) -> c_int {
-    type F = unsafe extern "C" fn(c_int, *const c_char) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Add_error_string\0");
-        std::mem::transmute(ptr)
-    });
-    f(errorcode, string)
+#[inline]
+pub unsafe fn MPI_File_read_ordered_begin(
+    fh: MPI_File,
+    buf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(336, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_File_read_ordered_begin())(fh, buf, count, datatype)
 }
 
-pub unsafe fn MPI_Comm_call_errhandler(comm: MPI_Comm, errorcode: c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_call_errhandler\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, errorcode)
+#[inline]
+pub unsafe fn MPI_File_read_ordered_end(
+    fh: MPI_File,
+    buf: *mut c_void,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(337, 0);
+    (entry::MPI_File_read_ordered_end())(fh, buf, status)
 }
 
-pub unsafe fn MPI_Win_call_errhandler(win: MPI_Win, errorcode: c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win, c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_call_errhandler\0");
-        std::mem::transmute(ptr)
-    });
-    f(win, errorcode)
+#[inline]
+pub unsafe fn MPI_File_write_ordered_begin(
+    fh: MPI_File,
+    buf: *const c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(338, trace::volume(buf, count, datatype));
+    (entry::MPI_File_write_ordered_begin())(fh, buf, count, datatype)
 }
 
-pub unsafe fn MPI_File_call_errhandler(file: MPI_File, errorcode: c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_call_errhandler\0");
-        std::mem::transmute(ptr)
-    });
-    f(file, errorcode)
+#[inline]
+pub unsafe fn MPI_File_write_ordered_end(
+    fh: MPI_File,
+    buf: *const c_void,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(339, 0);
+    (entry::MPI_File_write_ordered_end())(fh, buf, status)
 }
 
-pub unsafe fn MPI_Wtime() -> c_double {
-    type F = unsafe extern "C" fn() -> c_double;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Wtime\0");
-        std::mem::transmute(ptr)
-    });
-    f()
+#[inline]
+pub unsafe fn MPI_File_get_type_extent(
+    fh: MPI_File,
+    datatype: MPI_Datatype,
+    extent: *mut MPI_Aint,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(340, 0);
+    (entry::MPI_File_get_type_extent())(fh, datatype, extent)
 }
 
-pub unsafe fn MPI_Wtick() -> c_double {
-    type F = unsafe extern "C" fn() -> c_double;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Wtick\0");
-        std::mem::transmute(ptr)
-    });
-    f()
+#[inline]
+pub unsafe fn MPI_Register_datarep(
+    datarep: *const c_char,
+    read_conversion_fn: MPI_Datarep_conversion_function,
+    write_conversion_fn: MPI_Datarep_conversion_function,
+    dtype_file_extent_fn: MPI_Datarep_extent_function,
+    extra_state: *mut c_void,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(341, 0);
+    (entry::MPI_Register_datarep())(
+        datarep,
+        read_conversion_fn,
+        write_conversion_fn,
+        dtype_file_extent_fn,
+        extra_state,
+    )
 }
 
-pub unsafe fn MPI_Init(argc: *mut c_int, argv: *mut *mut *mut c_char) -> c_int {
-    type F = unsafe extern "C" fn(*mut c_int, *mut *mut *mut c_char) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Init\0");
-        std::mem::transmute(ptr)
-    });
-    f(argc, argv)
+#[inline]
+pub unsafe fn MPI_File_set_atomicity(fh: MPI_File, flag: c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(342, 0);
+    (entry::MPI_File_set_atomicity())(fh, flag)
 }
 
-pub unsafe fn MPI_Finalize() -> c_int {
-    type F = unsafe extern "C" fn() -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Finalize\0");
-        std::mem::transmute(ptr)
-    });
-    f()
+#[inline]
+pub unsafe fn MPI_File_get_atomicity(fh: MPI_File, flag: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(343, 0);
+    (entry::MPI_File_get_atomicity())(fh, flag)
 }
 
-pub unsafe fn MPI_Initialized(flag: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(*mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Initialized\0");
-        std::mem::transmute(ptr)
-    });
-    f(flag)
+#[inline]
+pub unsafe fn MPI_File_sync(fh: MPI_File) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(344, 0);
+    (entry::MPI_File_sync())(fh)
 }
 
-pub unsafe fn MPI_Abort(comm: MPI_Comm, errorcode: c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Abort\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, errorcode)
+#[inline]
+pub unsafe fn MPI_Type_create_f90_real(
+    precision: c_int,
+    range: c_int,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(345, 0);
+    (entry::MPI_Type_create_f90_real())(precision, range, newtype)
 }
 
-pub unsafe fn MPI_Finalized(flag: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(*mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Finalized\0");
-        std::mem::transmute(ptr)
-    });
-    f(flag)
+#[inline]
+pub unsafe fn MPI_Type_create_f90_complex(
+    precision: c_int,
+    range: c_int,
+    newtype: *mut MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(346, 0);
+    (entry::MPI_Type_create_f90_complex())(precision, range, newtype)
 }
 
-pub unsafe fn MPI_Info_create(info: *mut MPI_Info) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Info) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Info_create\0");
-        std::mem::transmute(ptr)
-    });
-    f(info)
+#[inline]
+pub unsafe fn MPI_Type_create_f90_integer(range: c_int, newtype: *mut MPI_Datatype) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(347, 0);
+    (entry::MPI_Type_create_f90_integer())(range, newtype)
 }
 
-pub unsafe fn MPI_Info_set(info: MPI_Info, key: *const c_char, value: *const c_char) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Info, *const c_char, *const c_char) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Info_set\0");
-        std::mem::transmute(ptr)
-    });
-    f(info, key, value)
+#[inline]
+pub unsafe fn MPI_Type_match_size(
+    typeclass: c_int,
+    size: c_int,
+    datatype: *mut MPI_Datatype,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(348, 0);
+    (entry::MPI_Type_match_size())(typeclass, size, datatype)
 }
 
-pub unsafe fn MPI_Info_delete(info: MPI_Info, key: *const c_char) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Info, *const c_char) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Info_delete\0");
-        std::mem::transmute(ptr)
-    });
-    f(info, key)
+#[inline]
+pub unsafe fn MPI_Comm_f2c(comm: MPI_Fint) -> MPI_Comm {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(349, 0);
+    (entry::MPI_Comm_f2c())(comm)
 }
 
-pub unsafe fn MPI_Info_get(
-    info: MPI_Info,
-    key: *const c_char,
-    valuelen: c_int,
-    value: *mut c_char,
-    flag: *mut c_int,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Info, *const c_char, c_int, *mut c_char, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Info_get\0");
-        std::mem::transmute(ptr)
-    });
-    f(info, key, valuelen, value, flag)
+#[inline]
+pub unsafe fn MPI_Comm_c2f(comm: MPI_Comm) -> MPI_Fint {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(350, 0);
+    (entry::MPI_Comm_c2f())(comm)
 }
 
-pub unsafe fn MPI_Info_get_valuelen(
-    info: MPI_Info,
-    key: *const c_char,
-    valuelen: *mut c_int,
-    flag: *mut c_int,
-) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Info, *const c_char, *mut c_int, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Info_get_valuelen\0");
-        std::mem::transmute(ptr)
-    });
-    f(info, key, valuelen, flag)
+#[inline]
+pub unsafe fn MPI_Type_f2c(datatype: MPI_Fint) -> MPI_Datatype {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(351, 0);
+    (entry::MPI_Type_f2c())(datatype)
 }
 
-pub unsafe fn MPI_Info_get_nkeys(info: MPI_Info, nkeys: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Info, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Info_get_nkeys\0");
-        std::mem::transmute(ptr)
-    });
-    f(info, nkeys)
+#[inline]
+pub unsafe fn MPI_Type_c2f(datatype: MPI_Datatype) -> MPI_Fint {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(352, 0);
+    (entry::MPI_Type_c2f())(datatype)
 }
 
-pub unsafe fn MPI_Info_get_nthkey(info: MPI_Info, n: c_int, key: *mut c_char) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Info, c_int, *mut c_char) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Info_get_nthkey\0");
-        std::mem::transmute(ptr)
-    });
-    f(info, n, key)
+#[inline]
+pub unsafe fn MPI_Group_f2c(group: MPI_Fint) -> MPI_Group {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(353, 0);
+    (entry::MPI_Group_f2c())(group)
 }
 
-pub unsafe fn MPI_Info_dup(info: MPI_Info, newinfo: *mut MPI_Info) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Info, *mut MPI_Info) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Info_dup\0");
-        std::mem::transmute(ptr)
-    });
-    f(info, newinfo)
+#[inline]
+pub unsafe fn MPI_Group_c2f(group: MPI_Group) -> MPI_Fint {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(354, 0);
+    (entry::MPI_Group_c2f())(group)
 }
 
-pub unsafe fn MPI_Info_free(info: *mut MPI_Info) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Info) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Info_free\0");
-        std::mem::transmute(ptr)
-    });
-    f(info)
+#[inline]
+pub unsafe fn MPI_Request_f2c(request: MPI_Fint) -> MPI_Request {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(355, 0);
+    (entry::MPI_Request_f2c())(request)
 }
 
-pub unsafe fn MPI_Comm_spawn(
-    command: *const c_char,
-    argv: *mut *mut c_char,
-    maxprocs: c_int,
-    info: MPI_Info,
-    root: c_int,
-    comm: MPI_Comm,
-    intercomm: *mut MPI_Comm,
-    array_off_errcodes: *mut c_int,
-) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_char,
-        *mut *mut c_char,
-        c_int,
-        MPI_Info,
-        c_int,
-        MPI_Comm,
-        *mut MPI_Comm,
-        *mut c_int,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_spawn\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        command,
-        argv,
-        maxprocs,
-        info,
-        root,
-        comm,
-        intercomm,
-        array_off_errcodes,
-    )
+#[inline]
+pub unsafe fn MPI_Request_c2f(request: MPI_Request) -> MPI_Fint {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(356, 0);
+    (entry::MPI_Request_c2f())(request)
 }
 
-pub unsafe fn MPI_Comm_get_parent(parent: *mut MPI_Comm) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_get_parent\0");
-        std::mem::transmute(ptr)
-    });
-    f(parent)
+#[inline]
+pub unsafe fn MPI_File_f2c(file: MPI_Fint) -> MPI_File {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(357, 0);
+    (entry::MPI_File_f2c())(file)
 }
 
-pub unsafe fn MPI_Comm_spawn_multiple(
-    count: c_int,
-    array_of_commands: *mut *mut c_char,
-    array_of_argv: *mut *mut *mut c_char,
-    array_of_maxprocs: *const c_int,
-    array_of_info: *const MPI_Info,
-    root: c_int,
-    comm: MPI_Comm,
-    intercomm: *mut MPI_Comm,
-    array_of_errcodes: *mut c_int,
-) -> c_int {
-    type F = unsafe extern "C" fn(
-        c_int,
-        *mut *mut c_char,
-        *mut *mut *mut c_char,
-        *const c_int,
-        *const MPI_Info,
-        c_int,
-        MPI_Comm,
-        *mut MPI_Comm,
-        *mut c_int,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_spawn_multiple\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        count,
-        array_of_commands,
-        array_of_argv,
-        array_of_maxprocs,
-        array_of_info,
-        root,
-        comm,
-        intercomm,
-        array_of_errcodes,
-    )
+#[inline]
+pub unsafe fn MPI_File_c2f(file: MPI_File) -> MPI_Fint {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(358, 0);
+    (entry::MPI_File_c2f())(file)
 }
 
-pub unsafe fn MPI_Open_port(info: MPI_Info, port_name: *mut c_char) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Info, *mut c_char) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Open_port\0");
-        std::mem::transmute(ptr)
-    });
-    f(info, port_name)
+#[inline]
+pub unsafe fn MPI_Win_f2c(win: MPI_Fint) -> MPI_Win {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(359, 0);
+    (entry::MPI_Win_f2c())(win)
 }
 
-pub unsafe fn MPI_Close_port(port_name: *const c_char) -> c_int {
-    type F = unsafe extern "C" fn(*const c_char) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Close_port\0");
-        std::mem::transmute(ptr)
-    });
-    f(port_name)
+#[inline]
+pub unsafe fn MPI_Win_c2f(win: MPI_Win) -> MPI_Fint {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(360, 0);
+    (entry::MPI_Win_c2f())(win)
 }
 
-pub unsafe fn MPI_Comm_accept(
-    port_name: *const c_char,
-    info: MPI_Info,
-    root: c_int,
-    comm: MPI_Comm,
-    newcomm: *mut MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(*const c_char, MPI_Info, c_int, MPI_Comm, *mut MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_accept\0");
-        std::mem::transmute(ptr)
-    });
-    f(port_name, info, root, comm, newcomm)
+#[inline]
+pub unsafe fn MPI_Op_f2c(op: MPI_Fint) -> MPI_Op {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(361, 0);
+    (entry::MPI_Op_f2c())(op)
 }
 
-pub unsafe fn MPI_Comm_connect(
-    port_name: *const c_char,
-    info: MPI_Info,
-    root: c_int,
-    comm: MPI_Comm,
-    newcomm: *mut MPI_Comm,
-) -> c_int {
-    type F = unsafe extern "C" fn(*const c_char, MPI_Info, c_int, MPI_Comm, *mut MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_connect\0");
-        std::mem::transmute(ptr)
-    });
-    f(port_name, info, root, comm, newcomm)
+#[inline]
+pub unsafe fn MPI_Op_c2f(op: MPI_Op) -> MPI_Fint {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(362, 0);
+    (entry::MPI_Op_c2f())(op)
 }
 
-pub unsafe fn MPI_Publish_name(
-    service_name: *const c_char,
-    info: MPI_Info,
-    port_name: *const c_char,
-) -> c_int {
-    type F = unsafe extern "C" fn(*const c_char, MPI_Info, *const c_char) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Publish_name\0");
-        std::mem::transmute(ptr)
-    });
-    f(service_name, info, port_name)
+#[inline]
+pub unsafe fn MPI_Info_f2c(info: MPI_Fint) -> MPI_Info {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(363, 0);
+    (entry::MPI_Info_f2c())(info)
 }
 
-pub unsafe fn MPI_Unpublish_name(
-    service_name: *const c_char,
-    info: MPI_Info,
-    port_name: *const c_char,
-) -> c_int {
-    type F = unsafe extern "C" fn(*const c_char, MPI_Info, *const c_char) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Unpublish_name\0");
-        std::mem::transmute(ptr)
-    });
-    f(service_name, info, port_name)
+#[inline]
+pub unsafe fn MPI_Info_c2f(info: MPI_Info) -> MPI_Fint {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(364, 0);
+    (entry::MPI_Info_c2f())(info)
 }
 
-pub unsafe fn MPI_Lookup_name(
-    service_name: *const c_char,
-    info: MPI_Info,
-    port_name: *mut c_char,
-) -> c_int {
-    type F = unsafe extern "C" fn(*const c_char, MPI_Info, *mut c_char) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Lookup_name\0");
-        std::mem::transmute(ptr)
-    });
-    f(service_name, info, port_name)
+#[inline]
+pub unsafe fn MPI_Errhandler_f2c(info: MPI_Fint) -> MPI_Errhandler {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(365, 0);
+    (entry::MPI_Errhandler_f2c())(info)
 }
 
-pub unsafe fn MPI_Comm_disconnect(comm: *mut MPI_Comm) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_disconnect\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm)
+#[inline]
+pub unsafe fn MPI_Errhandler_c2f(info: MPI_Errhandler) -> MPI_Fint {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(366, 0);
+    (entry::MPI_Errhandler_c2f())(info)
 }
 
-pub unsafe fn MPI_Comm_join(fd: c_int, intercomm: *mut MPI_Comm) -> c_int {
-    type F = unsafe extern "C" fn(c_int, *mut MPI_Comm) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_join\0");
-        std::mem::transmute(ptr)
-    });
-    f(fd, intercomm)
+#[inline]
+pub unsafe fn MPI_Message_f2c(message: MPI_Fint) -> MPI_Message {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(367, 0);
+    (entry::MPI_Message_f2c())(message)
 }
 
-pub unsafe fn MPI_Win_create(
-    base: *mut c_void,
-    size: MPI_Aint,
-    disp_unit: c_int,
-    info: MPI_Info,
-    comm: MPI_Comm,
-    win: *mut MPI_Win,
-) -> c_int {
-    type F = unsafe extern "C" fn(
-        *mut c_void,
-        MPI_Aint,
-        c_int,
-        MPI_Info,
-        MPI_Comm,
-        *mut MPI_Win,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_create\0");
-        std::mem::transmute(ptr)
-    });
-    f(base, size, disp_unit, info, comm, win)
+#[inline]
+pub unsafe fn MPI_Message_c2f(message: MPI_Message) -> MPI_Fint {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(368, 0);
+    (entry::MPI_Message_c2f())(message)
 }
 
-pub unsafe fn MPI_Win_allocate(
-    size: MPI_Aint,
-    disp_unit: c_int,
-    info: MPI_Info,
-    comm: MPI_Comm,
-    baseptr: *mut c_void,
-    win: *mut MPI_Win,
-) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_Aint,
-        c_int,
-        MPI_Info,
-        MPI_Comm,
-        *mut c_void,
-        *mut MPI_Win,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_allocate\0");
-        std::mem::transmute(ptr)
-    });
-    f(size, disp_unit, info, comm, baseptr, win)
+#[inline]
+pub unsafe fn MPI_Status_f2c(f_status: *const MPI_Fint, c_status: *mut MPI_Status) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(369, 0);
+    (entry::MPI_Status_f2c())(f_status, c_status)
 }
 
-pub unsafe fn MPI_Win_allocate_shared(
-    size: MPI_Aint,
-    disp_unit: c_int,
-    info: MPI_Info,
-    comm: MPI_Comm,
-    baseptr: *mut c_void,
-    win: *mut MPI_Win,
-) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_Aint,
-        c_int,
-        MPI_Info,
-        MPI_Comm,
-        *mut c_void,
-        *mut MPI_Win,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_allocate_shared\0");
-        std::mem::transmute(ptr)
-    });
-    f(size, disp_unit, info, comm, baseptr, win)
+#[inline]
+pub unsafe fn MPI_Status_c2f(c_status: *const MPI_Status, f_status: *mut MPI_Fint) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(370, 0);
+    (entry::MPI_Status_c2f())(c_status, f_status)
 }
 
-pub unsafe fn MPI_Win_shared_query(
-    win: MPI_Win,
-    rank: c_int,
-    size: *mut MPI_Aint,
-    disp_unit: *mut c_int,
-    baseptr: *mut c_void,
+#[inline]
+pub unsafe fn MPI_Send_c(
+    buf: *const c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win, c_int, *mut MPI_Aint, *mut c_int, *mut c_void) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_shared_query\0");
-        std::mem::transmute(ptr)
-    });
-    f(win, rank, size, disp_unit, baseptr)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(371, trace::volume(buf, count, datatype));
+    (entry::MPI_Send_c())(buf, count, datatype, dest, tag, comm)
 }
 
-pub unsafe fn MPI_Win_create_dynamic(info: MPI_Info, comm: MPI_Comm, win: *mut MPI_Win) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Info, MPI_Comm, *mut MPI_Win) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_create_dynamic\0");
-        std::mem::transmute(ptr)
-    });
-    f(info, comm, win)
+#[inline]
+pub unsafe fn MPI_Recv_c(
+    buf: *mut c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    source: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(372, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_Recv_c())(buf, count, datatype, source, tag, comm, status)
 }
 
-pub unsafe fn MPI_Win_attach(win: MPI_Win, base: *mut c_void, size: MPI_Aint) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win, *mut c_void, MPI_Aint) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_attach\0");
-        std::mem::transmute(ptr)
-    });
-    f(win, base, size)
+#[inline]
+pub unsafe fn MPI_Get_count_c(
+    status: *const MPI_Status,
+    datatype: MPI_Datatype,
+    count: *mut MPI_Count,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(373, 0);
+    (entry::MPI_Get_count_c())(status, datatype, count)
 }
 
-pub unsafe fn MPI_Win_detach(win: MPI_Win, base: *const c_void) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win, *const c_void) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_detach\0");
-        std::mem::transmute(ptr)
-    });
-    f(win, base)
+#[inline]
+pub unsafe fn MPI_Bsend_c(
+    buf: *const c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(374, trace::volume(buf, count, datatype));
+    (entry::MPI_Bsend_c())(buf, count, datatype, dest, tag, comm)
 }
 
-pub unsafe fn MPI_Win_free(win: *mut MPI_Win) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Win) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_free\0");
-        std::mem::transmute(ptr)
-    });
-    f(win)
+#[inline]
+pub unsafe fn MPI_Ssend_c(
+    buf: *const c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(375, trace::volume(buf, count, datatype));
+    (entry::MPI_Ssend_c())(buf, count, datatype, dest, tag, comm)
 }
 
-pub unsafe fn MPI_Win_get_group(win: MPI_Win, group: *mut MPI_Group) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win, *mut MPI_Group) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_get_group\0");
-        std::mem::transmute(ptr)
-    });
-    f(win, group)
+#[inline]
+pub unsafe fn MPI_Rsend_c(
+    buf: *const c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(376, trace::volume(buf, count, datatype));
+    (entry::MPI_Rsend_c())(buf, count, datatype, dest, tag, comm)
 }
 
-pub unsafe fn MPI_Win_set_info(win: MPI_Win, info: MPI_Info) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win, MPI_Info) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_set_info\0");
-        std::mem::transmute(ptr)
-    });
-    f(win, info)
+#[inline]
+pub unsafe fn MPI_Isend_c(
+    buf: *const c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(377, trace::volume(buf, count, datatype));
+    (entry::MPI_Isend_c())(buf, count, datatype, dest, tag, comm, request)
 }
 
-pub unsafe fn MPI_Win_get_info(win: MPI_Win, info_used: *mut MPI_Info) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win, *mut MPI_Info) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_get_info\0");
-        std::mem::transmute(ptr)
-    });
-    f(win, info_used)
+#[inline]
+pub unsafe fn MPI_Ibsend_c(
+    buf: *const c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(378, trace::volume(buf, count, datatype));
+    (entry::MPI_Ibsend_c())(buf, count, datatype, dest, tag, comm, request)
 }
 
-pub unsafe fn MPI_Put(
-    origin_addr: *const c_void,
-    origin_count: c_int,
-    origin_datatype: MPI_Datatype,
-    target_rank: c_int,
-    target_disp: MPI_Aint,
-    target_count: c_int,
-    target_datatype: MPI_Datatype,
-    win: MPI_Win,
+#[inline]
+pub unsafe fn MPI_Issend_c(
+    buf: *const c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        c_int,
-        MPI_Aint,
-        c_int,
-        MPI_Datatype,
-        MPI_Win,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Put\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        origin_addr,
-        origin_count,
-        origin_datatype,
-        target_rank,
-        target_disp,
-        target_count,
-        target_datatype,
-        win,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(379, trace::volume(buf, count, datatype));
+    (entry::MPI_Issend_c())(buf, count, datatype, dest, tag, comm, request)
 }
 
-pub unsafe fn MPI_Get(
-    origin_addr: *mut c_void,
-    origin_count: c_int,
-    origin_datatype: MPI_Datatype,
-    target_rank: c_int,
-    target_disp: MPI_Aint,
-    target_count: c_int,
-    target_datatype: MPI_Datatype,
-    win: MPI_Win,
+#[inline]
+pub unsafe fn MPI_Irsend_c(
+    buf: *const c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *mut c_void,
-        c_int,
-        MPI_Datatype,
-        c_int,
-        MPI_Aint,
-        c_int,
-        MPI_Datatype,
-        MPI_Win,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Get\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        origin_addr,
-        origin_count,
-        origin_datatype,
-        target_rank,
-        target_disp,
-        target_count,
-        target_datatype,
-        win,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(380, trace::volume(buf, count, datatype));
+    (entry::MPI_Irsend_c())(buf, count, datatype, dest, tag, comm, request)
 }
 
-pub unsafe fn MPI_Accumulate(
-    origin_addr: *const c_void,
-    origin_count: c_int,
-    origin_datatype: MPI_Datatype,
-    target_rank: c_int,
-    target_disp: MPI_Aint,
-    target_count: c_int,
-    target_datatype: MPI_Datatype,
-    op: MPI_Op,
-    win: MPI_Win,
+#[inline]
+pub unsafe fn MPI_Irecv_c(
+    buf: *mut c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    source: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        c_int,
-        MPI_Aint,
-        c_int,
-        MPI_Datatype,
-        MPI_Op,
-        MPI_Win,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Accumulate\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        origin_addr,
-        origin_count,
-        origin_datatype,
-        target_rank,
-        target_disp,
-        target_count,
-        target_datatype,
-        op,
-        win,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(381, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_Irecv_c())(buf, count, datatype, source, tag, comm, request)
 }
 
-pub unsafe fn MPI_Get_accumulate(
-    origin_addr: *const c_void,
-    origin_count: c_int,
-    origin_datatype: MPI_Datatype,
-    result_addr: *mut c_void,
-    result_count: c_int,
-    result_datatype: MPI_Datatype,
-    target_rank: c_int,
-    target_disp: MPI_Aint,
-    target_count: c_int,
-    target_datatype: MPI_Datatype,
-    op: MPI_Op,
-    win: MPI_Win,
+#[inline]
+pub unsafe fn MPI_Send_init_c(
+    buf: *const c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut c_void,
-        c_int,
-        MPI_Datatype,
-        c_int,
-        MPI_Aint,
-        c_int,
-        MPI_Datatype,
-        MPI_Op,
-        MPI_Win,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Get_accumulate\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        origin_addr,
-        origin_count,
-        origin_datatype,
-        result_addr,
-        result_count,
-        result_datatype,
-        target_rank,
-        target_disp,
-        target_count,
-        target_datatype,
-        op,
-        win,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(382, trace::volume(buf, count, datatype));
+    (entry::MPI_Send_init_c())(buf, count, datatype, dest, tag, comm, request)
 }
 
-pub unsafe fn MPI_Fetch_and_op(
-    origin_addr: *const c_void,
-    result_addr: *mut c_void,
+#[inline]
+pub unsafe fn MPI_Bsend_init_c(
+    buf: *const c_void,
+    count: MPI_Count,
     datatype: MPI_Datatype,
-    target_rank: c_int,
-    target_disp: MPI_Aint,
-    op: MPI_Op,
-    win: MPI_Win,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        *mut c_void,
-        MPI_Datatype,
-        c_int,
-        MPI_Aint,
-        MPI_Op,
-        MPI_Win,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Fetch_and_op\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        origin_addr,
-        result_addr,
-        datatype,
-        target_rank,
-        target_disp,
-        op,
-        win,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(383, trace::volume(buf, count, datatype));
+    (entry::MPI_Bsend_init_c())(buf, count, datatype, dest, tag, comm, request)
 }
 
-pub unsafe fn MPI_Compare_and_swap(
-    origin_addr: *const c_void,
-    compare_addr: *const c_void,
-    result_addr: *mut c_void,
+#[inline]
+pub unsafe fn MPI_Ssend_init_c(
+    buf: *const c_void,
+    count: MPI_Count,
     datatype: MPI_Datatype,
-    target_rank: c_int,
-    target_disp: MPI_Aint,
-    win: MPI_Win,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        *const c_void,
-        *mut c_void,
-        MPI_Datatype,
-        c_int,
-        MPI_Aint,
-        MPI_Win,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Compare_and_swap\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        origin_addr,
-        compare_addr,
-        result_addr,
-        datatype,
-        target_rank,
-        target_disp,
-        win,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(384, trace::volume(buf, count, datatype));
+    (entry::MPI_Ssend_init_c())(buf, count, datatype, dest, tag, comm, request)
 }
 
-pub unsafe fn MPI_Rput(
-    origin_addr: *const c_void,
-    origin_count: c_int,
-    origin_datatype: MPI_Datatype,
-    target_rank: c_int,
-    target_disp: MPI_Aint,
-    target_count: c_int,
-    target_datatype: MPI_Datatype,
-    win: MPI_Win,
+#[inline]
+pub unsafe fn MPI_Rsend_init_c(
+    buf: *const c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
     request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        c_int,
-        MPI_Aint,
-        c_int,
-        MPI_Datatype,
-        MPI_Win,
-        *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Rput\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        origin_addr,
-        origin_count,
-        origin_datatype,
-        target_rank,
-        target_disp,
-        target_count,
-        target_datatype,
-        win,
-        request,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(385, trace::volume(buf, count, datatype));
+    (entry::MPI_Rsend_init_c())(buf, count, datatype, dest, tag, comm, request)
 }
 
-pub unsafe fn MPI_Rget(
-    origin_addr: *mut c_void,
-    origin_count: c_int,
-    origin_datatype: MPI_Datatype,
-    target_rank: c_int,
-    target_disp: MPI_Aint,
-    target_count: c_int,
-    target_datatype: MPI_Datatype,
-    win: MPI_Win,
+#[inline]
+pub unsafe fn MPI_Recv_init_c(
+    buf: *mut c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    source: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
     request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *mut c_void,
-        c_int,
-        MPI_Datatype,
-        c_int,
-        MPI_Aint,
-        c_int,
-        MPI_Datatype,
-        MPI_Win,
-        *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Rget\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        origin_addr,
-        origin_count,
-        origin_datatype,
-        target_rank,
-        target_disp,
-        target_count,
-        target_datatype,
-        win,
-        request,
-    )
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(386, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_Recv_init_c())(buf, count, datatype, source, tag, comm, request)
 }
 
-pub unsafe fn MPI_Raccumulate(
-    origin_addr: *const c_void,
-    origin_count: c_int,
-    origin_datatype: MPI_Datatype,
-    target_rank: c_int,
-    target_disp: MPI_Aint,
-    target_count: c_int,
-    target_datatype: MPI_Datatype,
-    op: MPI_Op,
-    win: MPI_Win,
-    request: *mut MPI_Request,
+#[inline]
+pub unsafe fn MPI_Sendrecv_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    dest: c_int,
+    sendtag: c_int,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    source: c_int,
+    recvtag: c_int,
+    comm: MPI_Comm,
+    status: *mut MPI_Status,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        c_int,
-        MPI_Aint,
-        c_int,
-        MPI_Datatype,
-        MPI_Op,
-        MPI_Win,
-        *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Raccumulate\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        origin_addr,
-        origin_count,
-        origin_datatype,
-        target_rank,
-        target_disp,
-        target_count,
-        target_datatype,
-        op,
-        win,
-        request,
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        387,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Sendrecv_c())(
+        sendbuf, sendcount, sendtype, dest, sendtag, recvbuf, recvcount, recvtype, source, recvtag,
+        comm, status,
     )
 }
 
-pub unsafe fn MPI_Rget_accumulate(
-    origin_addr: *const c_void,
-    origin_count: c_int,
-    origin_datatype: MPI_Datatype,
-    result_addr: *mut c_void,
-    result_count: c_int,
-    result_datatype: MPI_Datatype,
-    target_rank: c_int,
-    target_disp: MPI_Aint,
-    target_count: c_int,
-    target_datatype: MPI_Datatype,
-    op: MPI_Op,
-    win: MPI_Win,
-    request: *mut MPI_Request,
+#[inline]
+pub unsafe fn MPI_Sendrecv_replace_c(
+    buf: *mut c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    dest: c_int,
+    sendtag: c_int,
+    source: c_int,
+    recvtag: c_int,
+    comm: MPI_Comm,
+    status: *mut MPI_Status,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut c_void,
-        c_int,
-        MPI_Datatype,
-        c_int,
-        MPI_Aint,
-        c_int,
-        MPI_Datatype,
-        MPI_Op,
-        MPI_Win,
-        *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Rget_accumulate\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        origin_addr,
-        origin_count,
-        origin_datatype,
-        result_addr,
-        result_count,
-        result_datatype,
-        target_rank,
-        target_disp,
-        target_count,
-        target_datatype,
-        op,
-        win,
-        request,
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(388, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_Sendrecv_replace_c())(
+        buf, count, datatype, dest, sendtag, source, recvtag, comm, status,
     )
 }
 
-pub unsafe fn MPI_Win_fence(assert: c_int, win: MPI_Win) -> c_int {
-    type F = unsafe extern "C" fn(c_int, MPI_Win) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_fence\0");
-        std::mem::transmute(ptr)
-    });
-    f(assert, win)
+#[inline]
+pub unsafe fn MPI_Mrecv_c(
+    buf: *mut c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    message: *mut MPI_Message,
+    status: *mut MPI_Status,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(389, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_Mrecv_c())(buf, count, datatype, message, status)
 }
 
-pub unsafe fn MPI_Win_start(group: MPI_Group, assert: c_int, win: MPI_Win) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Group, c_int, MPI_Win) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_start\0");
-        std::mem::transmute(ptr)
-    });
-    f(group, assert, win)
+#[inline]
+pub unsafe fn MPI_Imrecv_c(
+    buf: *mut c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    message: *mut MPI_Message,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(390, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_Imrecv_c())(buf, count, datatype, message, request)
 }
 
-pub unsafe fn MPI_Win_complete(win: MPI_Win) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_complete\0");
-        std::mem::transmute(ptr)
-    });
-    f(win)
+#[inline]
+pub unsafe fn MPI_Get_elements_c(
+    status: *const MPI_Status,
+    datatype: MPI_Datatype,
+    count: *mut MPI_Count,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(391, 0);
+    (entry::MPI_Get_elements_c())(status, datatype, count)
 }
 
-pub unsafe fn MPI_Win_post(group: MPI_Group, assert: c_int, win: MPI_Win) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Group, c_int, MPI_Win) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_post\0");
-        std::mem::transmute(ptr)
-    });
-    f(group, assert, win)
+#[inline]
+pub unsafe fn MPI_Type_size_c(datatype: MPI_Datatype, size: *mut MPI_Count) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(392, 0);
+    (entry::MPI_Type_size_c())(datatype, size)
 }
 
-pub unsafe fn MPI_Win_wait(win: MPI_Win) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_wait\0");
-        std::mem::transmute(ptr)
-    });
-    f(win)
+#[inline]
+pub unsafe fn MPI_Type_get_extent_c(
+    datatype: MPI_Datatype,
+    lb: *mut MPI_Count,
+    extent: *mut MPI_Count,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(393, 0);
+    (entry::MPI_Type_get_extent_c())(datatype, lb, extent)
 }
 
-pub unsafe fn MPI_Win_test(win: MPI_Win, flag: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_test\0");
-        std::mem::transmute(ptr)
-    });
-    f(win, flag)
+#[inline]
+pub unsafe fn MPI_Type_get_true_extent_c(
+    datatype: MPI_Datatype,
+    true_lb: *mut MPI_Count,
+    true_extent: *mut MPI_Count,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(394, 0);
+    (entry::MPI_Type_get_true_extent_c())(datatype, true_lb, true_extent)
 }
 
-pub unsafe fn MPI_Win_lock(lock_type: c_int, rank: c_int, assert: c_int, win: MPI_Win) -> c_int {
-    type F = unsafe extern "C" fn(c_int, c_int, c_int, MPI_Win) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_lock\0");
-        std::mem::transmute(ptr)
-    });
-    f(lock_type, rank, assert, win)
+#[inline]
+pub unsafe fn MPI_Pack_c(
+    inbuf: *const c_void,
+    incount: MPI_Count,
+    datatype: MPI_Datatype,
+    outbuf: *mut c_void,
+    outsize: MPI_Count,
+    position: *mut MPI_Count,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(395, 0);
+    (entry::MPI_Pack_c())(inbuf, incount, datatype, outbuf, outsize, position, comm)
 }
 
-pub unsafe fn MPI_Win_lock_all(assert: c_int, win: MPI_Win) -> c_int {
-    type F = unsafe extern "C" fn(c_int, MPI_Win) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_lock_all\0");
-        std::mem::transmute(ptr)
-    });
-    f(assert, win)
+#[inline]
+pub unsafe fn MPI_Unpack_c(
+    inbuf: *const c_void,
+    insize: MPI_Count,
+    position: *mut MPI_Count,
+    outbuf: *mut c_void,
+    outcount: MPI_Count,
+    datatype: MPI_Datatype,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(396, 0);
+    (entry::MPI_Unpack_c())(inbuf, insize, position, outbuf, outcount, datatype, comm)
 }
 
-pub unsafe fn MPI_Win_unlock(rank: c_int, win: MPI_Win) -> c_int {
-    type F = unsafe extern "C" fn(c_int, MPI_Win) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_unlock\0");
-        std::mem::transmute(ptr)
-    });
-    f(rank, win)
+#[inline]
+pub unsafe fn MPI_Pack_size_c(
+    incount: MPI_Count,
+    datatype: MPI_Datatype,
+    comm: MPI_Comm,
+    size: *mut MPI_Count,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(397, 0);
+    (entry::MPI_Pack_size_c())(incount, datatype, comm, size)
 }
 
-pub unsafe fn MPI_Win_unlock_all(win: MPI_Win) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_unlock_all\0");
-        std::mem::transmute(ptr)
-    });
-    f(win)
+#[inline]
+pub unsafe fn MPI_Bcast_c(
+    buffer: *mut c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(398, trace::volume(buffer as *const c_void, count, datatype));
+    (entry::MPI_Bcast_c())(buffer, count, datatype, root, comm)
 }
 
-pub unsafe fn MPI_Win_flush(rank: c_int, win: MPI_Win) -> c_int {
-    type F = unsafe extern "C" fn(c_int, MPI_Win) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_flush\0");
-        std::mem::transmute(ptr)
-    });
-    f(rank, win)
+#[inline]
+pub unsafe fn MPI_Ibcast_c(
+    buffer: *mut c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(399, trace::volume(buffer as *const c_void, count, datatype));
+    (entry::MPI_Ibcast_c())(buffer, count, datatype, root, comm, request)
 }
 
-pub unsafe fn MPI_Win_flush_all(win: MPI_Win) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_flush_all\0");
-        std::mem::transmute(ptr)
-    });
-    f(win)
+#[inline]
+pub unsafe fn MPI_Gather_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        400,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Gather_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm,
+    )
 }
 
-pub unsafe fn MPI_Win_flush_local(rank: c_int, win: MPI_Win) -> c_int {
-    type F = unsafe extern "C" fn(c_int, MPI_Win) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_flush_local\0");
-        std::mem::transmute(ptr)
-    });
-    f(rank, win)
+#[inline]
+pub unsafe fn MPI_Igather_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        401,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Igather_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm, request,
+    )
 }
 
-pub unsafe fn MPI_Win_flush_local_all(win: MPI_Win) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_flush_local_all\0");
-        std::mem::transmute(ptr)
-    });
-    f(win)
+#[inline]
+pub unsafe fn MPI_Gatherv_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    displs: *const MPI_Aint,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(402, trace::volume(sendbuf, sendcount, sendtype));
+    (entry::MPI_Gatherv_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, root, comm,
+    )
 }
 
-pub unsafe fn MPI_Win_sync(win: MPI_Win) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Win) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_sync\0");
-        std::mem::transmute(ptr)
-    });
-    f(win)
+#[inline]
+pub unsafe fn MPI_Igatherv_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    displs: *const MPI_Aint,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(403, trace::volume(sendbuf, sendcount, sendtype));
+    (entry::MPI_Igatherv_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, root, comm, request,
+    )
 }
 
-pub unsafe fn MPI_Grequest_start(
-    query_fn: MPI_Grequest_query_function,
-    free_fn: MPI_Grequest_free_function,
-    cancel_fn: MPI_Grequest_cancel_function,
-    extra_state: *mut c_void,
-    request: *mut MPI_Request,
+#[inline]
+pub unsafe fn MPI_Scatter_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_Grequest_query_function,
-        MPI_Grequest_free_function,
-        MPI_Grequest_cancel_function,
-        *mut c_void,
-        *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Grequest_start\0");
-        std::mem::transmute(ptr)
-    });
-    f(query_fn, free_fn, cancel_fn, extra_state, request)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        404,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Scatter_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm,
+    )
 }
 
-pub unsafe fn MPI_Grequest_complete(request: MPI_Request) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Request) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Grequest_complete\0");
-        std::mem::transmute(ptr)
-    });
-    f(request)
+#[inline]
+pub unsafe fn MPI_Iscatter_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        405,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Iscatter_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm, request,
+    )
 }
 
-pub unsafe fn MPI_Status_set_elements(
-    status: *mut MPI_Status,
-    datatype: MPI_Datatype,
-    count: c_int,
+#[inline]
+pub unsafe fn MPI_Scatterv_c(
+    sendbuf: *const c_void,
+    sendcounts: *const MPI_Count,
+    displs: *const MPI_Aint,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
 ) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Status, MPI_Datatype, c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Status_set_elements\0");
-        std::mem::transmute(ptr)
-    });
-    f(status, datatype, count)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        406,
+        trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Scatterv_c())(
+        sendbuf, sendcounts, displs, sendtype, recvbuf, recvcount, recvtype, root, comm,
+    )
 }
 
-pub unsafe fn MPI_Status_set_elements_x(
-    status: *mut MPI_Status,
-    datatype: MPI_Datatype,
-    count: MPI_Count,
+#[inline]
+pub unsafe fn MPI_Iscatterv_c(
+    sendbuf: *const c_void,
+    sendcounts: *const MPI_Count,
+    displs: *const MPI_Aint,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Status, MPI_Datatype, MPI_Count) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Status_set_elements_x\0");
-        std::mem::transmute(ptr)
-    });
-    f(status, datatype, count)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        407,
+        trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Iscatterv_c())(
+        sendbuf, sendcounts, displs, sendtype, recvbuf, recvcount, recvtype, root, comm, request,
+    )
 }
 
-pub unsafe fn MPI_Status_set_cancelled(status: *mut MPI_Status, flag: c_int) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_Status, c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Status_set_cancelled\0");
-        std::mem::transmute(ptr)
-    });
-    f(status, flag)
+#[inline]
+pub unsafe fn MPI_Allgather_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        408,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Allgather_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm,
+    )
 }
 
-pub unsafe fn MPI_Init_thread(
-    argc: *mut c_int,
-    argv: *mut *mut *mut c_char,
-    required: c_int,
-    provided: *mut c_int,
+#[inline]
+pub unsafe fn MPI_Iallgather_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(*mut c_int, *mut *mut *mut c_char, c_int, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Init_thread\0");
-        std::mem::transmute(ptr)
-    });
-    f(argc, argv, required, provided)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        409,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Iallgather_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, request,
+    )
 }
 
-pub unsafe fn MPI_Query_thread(provided: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(*mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Query_thread\0");
-        std::mem::transmute(ptr)
-    });
-    f(provided)
+#[inline]
+pub unsafe fn MPI_Allgatherv_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    displs: *const MPI_Aint,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(410, trace::volume(sendbuf, sendcount, sendtype));
+    (entry::MPI_Allgatherv_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm,
+    )
 }
 
-pub unsafe fn MPI_Is_thread_main(flag: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(*mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Is_thread_main\0");
-        std::mem::transmute(ptr)
-    });
-    f(flag)
+#[inline]
+pub unsafe fn MPI_Iallgatherv_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    displs: *const MPI_Aint,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(411, trace::volume(sendbuf, sendcount, sendtype));
+    (entry::MPI_Iallgatherv_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm, request,
+    )
 }
 
-pub unsafe fn MPI_File_open(
+#[inline]
+pub unsafe fn MPI_Alltoall_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
     comm: MPI_Comm,
-    filename: *const c_char,
-    amode: c_int,
-    info: MPI_Info,
-    fh: *mut MPI_File,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_Comm, *const c_char, c_int, MPI_Info, *mut MPI_File) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_open\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm, filename, amode, info, fh)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        412,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Alltoall_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm,
+    )
 }
 
-pub unsafe fn MPI_File_close(fh: *mut MPI_File) -> c_int {
-    type F = unsafe extern "C" fn(*mut MPI_File) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_close\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh)
+#[inline]
+pub unsafe fn MPI_Ialltoall_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        413,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Ialltoall_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, request,
+    )
 }
 
-pub unsafe fn MPI_File_delete(filename: *const c_char, info: MPI_Info) -> c_int {
-    type F = unsafe extern "C" fn(*const c_char, MPI_Info) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_delete\0");
-        std::mem::transmute(ptr)
-    });
-    f(filename, info)
+#[inline]
+pub unsafe fn MPI_Alltoallv_c(
+    sendbuf: *const c_void,
+    sendcounts: *const MPI_Count,
+    sdispls: *const MPI_Aint,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    rdispls: *const MPI_Aint,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(414, 0);
+    (entry::MPI_Alltoallv_c())(
+        sendbuf, sendcounts, sdispls, sendtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+    )
 }
 
-pub unsafe fn MPI_File_set_size(fh: MPI_File, size: MPI_Offset) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, MPI_Offset) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_set_size\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, size)
+#[inline]
+pub unsafe fn MPI_Ialltoallv_c(
+    sendbuf: *const c_void,
+    sendcounts: *const MPI_Count,
+    sdispls: *const MPI_Aint,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    rdispls: *const MPI_Aint,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(415, 0);
+    (entry::MPI_Ialltoallv_c())(
+        sendbuf, sendcounts, sdispls, sendtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+        request,
+    )
 }
 
-pub unsafe fn MPI_File_preallocate(fh: MPI_File, size: MPI_Offset) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, MPI_Offset) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_preallocate\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, size)
+#[inline]
+pub unsafe fn MPI_Alltoallw_c(
+    sendbuf: *const c_void,
+    sendcounts: *const MPI_Count,
+    sdispls: *const MPI_Aint,
+    sendtypes: *const MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    rdispls: *const MPI_Aint,
+    recvtypes: *const MPI_Datatype,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(416, 0);
+    (entry::MPI_Alltoallw_c())(
+        sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+    )
 }
 
-pub unsafe fn MPI_File_get_size(fh: MPI_File, size: *mut MPI_Offset) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, *mut MPI_Offset) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_get_size\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, size)
+#[inline]
+pub unsafe fn MPI_Ialltoallw_c(
+    sendbuf: *const c_void,
+    sendcounts: *const MPI_Count,
+    sdispls: *const MPI_Aint,
+    sendtypes: *const MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    rdispls: *const MPI_Aint,
+    recvtypes: *const MPI_Datatype,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(417, 0);
+    (entry::MPI_Ialltoallw_c())(
+        sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+        request,
+    )
 }
 
-pub unsafe fn MPI_File_get_group(fh: MPI_File, group: *mut MPI_Group) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, *mut MPI_Group) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_get_group\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, group)
+#[inline]
+pub unsafe fn MPI_Reduce_c(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    root: c_int,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(418, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Reduce_c())(sendbuf, recvbuf, count, datatype, op, root, comm)
 }
 
-pub unsafe fn MPI_File_get_amode(fh: MPI_File, amode: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_get_amode\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, amode)
+#[inline]
+pub unsafe fn MPI_Ireduce_c(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    root: c_int,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(419, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Ireduce_c())(sendbuf, recvbuf, count, datatype, op, root, comm, request)
 }
 
-pub unsafe fn MPI_File_set_info(fh: MPI_File, info: MPI_Info) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, MPI_Info) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_set_info\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, info)
+#[inline]
+pub unsafe fn MPI_Allreduce_c(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(420, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Allreduce_c())(sendbuf, recvbuf, count, datatype, op, comm)
 }
 
-pub unsafe fn MPI_File_get_info(fh: MPI_File, info_used: *mut MPI_Info) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, *mut MPI_Info) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_get_info\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, info_used)
+#[inline]
+pub unsafe fn MPI_Iallreduce_c(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(421, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Iallreduce_c())(sendbuf, recvbuf, count, datatype, op, comm, request)
 }
 
-pub unsafe fn MPI_File_set_view(
-    fh: MPI_File,
-    disp: MPI_Offset,
-    etype: MPI_Datatype,
-    filetype: MPI_Datatype,
-    datarep: *const c_char,
-    info: MPI_Info,
+#[inline]
+pub unsafe fn MPI_Reduce_local_c(
+    inbuf: *const c_void,
+    inoutbuf: *mut c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_File,
-        MPI_Offset,
-        MPI_Datatype,
-        MPI_Datatype,
-        *const c_char,
-        MPI_Info,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_set_view\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, disp, etype, filetype, datarep, info)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(422, trace::volume(inbuf, count, datatype));
+    (entry::MPI_Reduce_local_c())(inbuf, inoutbuf, count, datatype, op)
 }
 
-pub unsafe fn MPI_File_get_view(
-    fh: MPI_File,
-    disp: *mut MPI_Offset,
-    etype: *mut MPI_Datatype,
-    filetype: *mut MPI_Datatype,
-    datarep: *mut c_char,
+#[inline]
+pub unsafe fn MPI_Reduce_scatter_block_c(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_File,
-        *mut MPI_Offset,
-        *mut MPI_Datatype,
-        *mut MPI_Datatype,
-        *mut c_char,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_get_view\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, disp, etype, filetype, datarep)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(423, 0);
+    (entry::MPI_Reduce_scatter_block_c())(sendbuf, recvbuf, recvcount, datatype, op, comm)
 }
 
-pub unsafe fn MPI_File_read_at(
-    fh: MPI_File,
-    offset: MPI_Offset,
-    buf: *mut c_void,
-    count: c_int,
+#[inline]
+pub unsafe fn MPI_Ireduce_scatter_block_c(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
     datatype: MPI_Datatype,
-    status: *mut MPI_Status,
+    op: MPI_Op,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_File,
-        MPI_Offset,
-        *mut c_void,
-        c_int,
-        MPI_Datatype,
-        *mut MPI_Status,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_read_at\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, offset, buf, count, datatype, status)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(424, 0);
+    (entry::MPI_Ireduce_scatter_block_c())(sendbuf, recvbuf, recvcount, datatype, op, comm, request)
 }
 
-pub unsafe fn MPI_File_read_at_all(
-    fh: MPI_File,
-    offset: MPI_Offset,
-    buf: *mut c_void,
-    count: c_int,
+#[inline]
+pub unsafe fn MPI_Reduce_scatter_c(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
     datatype: MPI_Datatype,
-    status: *mut MPI_Status,
+    op: MPI_Op,
+    comm: MPI_Comm,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_File,
-        MPI_Offset,
-        *mut c_void,
-        c_int,
-        MPI_Datatype,
-        *mut MPI_Status,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_read_at_all\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, offset, buf, count, datatype, status)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(425, 0);
+    (entry::MPI_Reduce_scatter_c())(sendbuf, recvbuf, recvcounts, datatype, op, comm)
 }
 
-pub unsafe fn MPI_File_write_at(
-    fh: MPI_File,
-    offset: MPI_Offset,
-    buf: *const c_void,
-    count: c_int,
+#[inline]
+pub unsafe fn MPI_Ireduce_scatter_c(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
     datatype: MPI_Datatype,
-    status: *mut MPI_Status,
+    op: MPI_Op,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_File,
-        MPI_Offset,
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut MPI_Status,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_write_at\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, offset, buf, count, datatype, status)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(426, 0);
+    (entry::MPI_Ireduce_scatter_c())(sendbuf, recvbuf, recvcounts, datatype, op, comm, request)
 }
 
-pub unsafe fn MPI_File_write_at_all(
-    fh: MPI_File,
-    offset: MPI_Offset,
-    buf: *const c_void,
-    count: c_int,
+#[inline]
+pub unsafe fn MPI_Scan_c(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: MPI_Count,
     datatype: MPI_Datatype,
-    status: *mut MPI_Status,
+    op: MPI_Op,
+    comm: MPI_Comm,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_File,
-        MPI_Offset,
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut MPI_Status,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_write_at_all\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, offset, buf, count, datatype, status)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(427, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Scan_c())(sendbuf, recvbuf, count, datatype, op, comm)
 }
 
-pub unsafe fn MPI_File_iread_at(
-    fh: MPI_File,
-    offset: MPI_Offset,
-    buf: *mut c_void,
-    count: c_int,
+#[inline]
+pub unsafe fn MPI_Iscan_c(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: MPI_Count,
     datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
     request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_File,
-        MPI_Offset,
-        *mut c_void,
-        c_int,
-        MPI_Datatype,
-        *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_iread_at\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, offset, buf, count, datatype, request)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(428, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Iscan_c())(sendbuf, recvbuf, count, datatype, op, comm, request)
 }
 
-pub unsafe fn MPI_File_iread_at_all(
-    fh: MPI_File,
-    offset: MPI_Offset,
-    buf: *mut c_void,
-    count: c_int,
+#[inline]
+pub unsafe fn MPI_Exscan_c(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: MPI_Count,
     datatype: MPI_Datatype,
-    request: *mut MPI_Request,
+    op: MPI_Op,
+    comm: MPI_Comm,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_File,
-        MPI_Offset,
-        *mut c_void,
-        c_int,
-        MPI_Datatype,
-        *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_iread_at_all\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, offset, buf, count, datatype, request)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(429, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Exscan_c())(sendbuf, recvbuf, count, datatype, op, comm)
 }
 
-pub unsafe fn MPI_File_iwrite_at(
-    fh: MPI_File,
-    offset: MPI_Offset,
-    buf: *const c_void,
-    count: c_int,
+#[inline]
+pub unsafe fn MPI_Iexscan_c(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: MPI_Count,
     datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
     request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_File,
-        MPI_Offset,
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_iwrite_at\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, offset, buf, count, datatype, request)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(430, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Iexscan_c())(sendbuf, recvbuf, count, datatype, op, comm, request)
 }
 
-pub unsafe fn MPI_File_iwrite_at_all(
-    fh: MPI_File,
-    offset: MPI_Offset,
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
+#[inline]
+pub unsafe fn MPI_Neighbor_allgather_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        431,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Neighbor_allgather_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Ineighbor_allgather_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
     request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_File,
-        MPI_Offset,
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_iwrite_at_all\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, offset, buf, count, datatype, request)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        432,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Ineighbor_allgather_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, request,
+    )
 }
 
-pub unsafe fn MPI_File_read(
-    fh: MPI_File,
-    buf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    status: *mut MPI_Status,
+#[inline]
+pub unsafe fn MPI_Neighbor_allgatherv_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    displs: *const MPI_Aint,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
 ) -> c_int {
-    type F =
-        unsafe extern "C" fn(MPI_File, *mut c_void, c_int, MPI_Datatype, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_read\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, count, datatype, status)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(433, trace::volume(sendbuf, sendcount, sendtype));
+    (entry::MPI_Neighbor_allgatherv_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm,
+    )
 }
 
-pub unsafe fn MPI_File_read_all(
-    fh: MPI_File,
-    buf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    status: *mut MPI_Status,
+#[inline]
+pub unsafe fn MPI_Ineighbor_allgatherv_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    displs: *const MPI_Aint,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F =
-        unsafe extern "C" fn(MPI_File, *mut c_void, c_int, MPI_Datatype, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_read_all\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, count, datatype, status)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(434, trace::volume(sendbuf, sendcount, sendtype));
+    (entry::MPI_Ineighbor_allgatherv_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm, request,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Neighbor_alltoall_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    senddtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        435,
+        trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Neighbor_alltoall_c())(
+        sendbuf, sendcount, senddtype, recvbuf, recvcount, recvtype, comm,
+    )
+}
+
+#[inline]
+pub unsafe fn MPI_Ineighbor_alltoall_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    senddtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        436,
+        trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Ineighbor_alltoall_c())(
+        sendbuf, sendcount, senddtype, recvbuf, recvcount, recvtype, comm, request,
+    )
 }
 
-pub unsafe fn MPI_File_write(
-    fh: MPI_File,
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    status: *mut MPI_Status,
+#[inline]
+pub unsafe fn MPI_Neighbor_alltoallv_c(
+    sendbuf: *const c_void,
+    sendcounts: *const MPI_Count,
+    sdispls: *const MPI_Aint,
+    senddtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    rdispls: *const MPI_Aint,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_File,
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut MPI_Status,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_write\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, count, datatype, status)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(437, 0);
+    (entry::MPI_Neighbor_alltoallv_c())(
+        sendbuf, sendcounts, sdispls, senddtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+    )
 }
 
-pub unsafe fn MPI_File_write_all(
-    fh: MPI_File,
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    status: *mut MPI_Status,
+#[inline]
+pub unsafe fn MPI_Ineighbor_alltoallv_c(
+    sendbuf: *const c_void,
+    sendcounts: *const MPI_Count,
+    sdispls: *const MPI_Aint,
+    senddtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    rdispls: *const MPI_Aint,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_File,
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut MPI_Status,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_write_all\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, count, datatype, status)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(438, 0);
+    (entry::MPI_Ineighbor_alltoallv_c())(
+        sendbuf, sendcounts, sdispls, senddtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+        request,
+    )
 }
 
-pub unsafe fn MPI_File_iread(
-    fh: MPI_File,
-    buf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    request: *mut MPI_Request,
+#[inline]
+pub unsafe fn MPI_Neighbor_alltoallw_c(
+    sendbuf: *const c_void,
+    sendcounts: *const MPI_Count,
+    sdispls: *const MPI_Aint,
+    sendtypes: *const MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    rdispls: *const MPI_Aint,
+    recvtypes: *const MPI_Datatype,
+    comm: MPI_Comm,
 ) -> c_int {
-    type F =
-        unsafe extern "C" fn(MPI_File, *mut c_void, c_int, MPI_Datatype, *mut MPI_Request) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_iread\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, count, datatype, request)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(439, 0);
+    (entry::MPI_Neighbor_alltoallw_c())(
+        sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+    )
 }
 
-pub unsafe fn MPI_File_iread_all(
-    fh: MPI_File,
-    buf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
+#[inline]
+pub unsafe fn MPI_Ineighbor_alltoallw_c(
+    sendbuf: *const c_void,
+    sendcounts: *const MPI_Count,
+    sdispls: *const MPI_Aint,
+    sendtypes: *const MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    rdispls: *const MPI_Aint,
+    recvtypes: *const MPI_Datatype,
+    comm: MPI_Comm,
     request: *mut MPI_Request,
 ) -> c_int {
-    type F =
-        unsafe extern "C" fn(MPI_File, *mut c_void, c_int, MPI_Datatype, *mut MPI_Request) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_iread_all\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, count, datatype, request)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(440, 0);
+    (entry::MPI_Ineighbor_alltoallw_c())(
+        sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+        request,
+    )
 }
 
-pub unsafe fn MPI_File_iwrite(
-    fh: MPI_File,
+#[inline]
+pub unsafe fn MPI_Psend_init(
     buf: *const c_void,
-    count: c_int,
+    partitions: c_int,
+    count: MPI_Count,
     datatype: MPI_Datatype,
+    dest: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    info: MPI_Info,
     request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_File,
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_iwrite\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, count, datatype, request)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(441, trace::volume(buf, count, datatype));
+    (entry::MPI_Psend_init())(
+        buf, partitions, count, datatype, dest, tag, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_File_iwrite_all(
-    fh: MPI_File,
-    buf: *const c_void,
-    count: c_int,
+#[inline]
+pub unsafe fn MPI_Precv_init(
+    buf: *mut c_void,
+    partitions: c_int,
+    count: MPI_Count,
     datatype: MPI_Datatype,
+    source: c_int,
+    tag: c_int,
+    comm: MPI_Comm,
+    info: MPI_Info,
     request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_File,
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_iwrite_all\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, count, datatype, request)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(442, trace::volume(buf as *const c_void, count, datatype));
+    (entry::MPI_Precv_init())(
+        buf, partitions, count, datatype, source, tag, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_File_seek(fh: MPI_File, offset: MPI_Offset, whence: c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, MPI_Offset, c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_seek\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, offset, whence)
+#[inline]
+pub unsafe fn MPI_Pready(partition: c_int, request: MPI_Request) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(443, 0);
+    (entry::MPI_Pready())(partition, request)
 }
 
-pub unsafe fn MPI_File_get_position(fh: MPI_File, offset: *mut MPI_Offset) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, *mut MPI_Offset) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_get_position\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, offset)
+#[inline]
+pub unsafe fn MPI_Pready_range(
+    partition_low: c_int,
+    partition_high: c_int,
+    request: MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(444, 0);
+    (entry::MPI_Pready_range())(partition_low, partition_high, request)
 }
 
-pub unsafe fn MPI_File_get_byte_offset(
-    fh: MPI_File,
-    offset: MPI_Offset,
-    disp: *mut MPI_Offset,
+#[inline]
+pub unsafe fn MPI_Pready_list(
+    length: c_int,
+    array_of_partitions: *const c_int,
+    request: MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, MPI_Offset, *mut MPI_Offset) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_get_byte_offset\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, offset, disp)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(445, 0);
+    (entry::MPI_Pready_list())(length, array_of_partitions, request)
 }
 
-pub unsafe fn MPI_File_read_shared(
-    fh: MPI_File,
-    buf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    status: *mut MPI_Status,
-) -> c_int {
-    type F =
-        unsafe extern "C" fn(MPI_File, *mut c_void, c_int, MPI_Datatype, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_read_shared\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, count, datatype, status)
+#[inline]
+pub unsafe fn MPI_Parrived(request: MPI_Request, partition: c_int, flag: *mut c_int) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(446, 0);
+    (entry::MPI_Parrived())(request, partition, flag)
 }
 
-pub unsafe fn MPI_File_write_shared(
-    fh: MPI_File,
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    status: *mut MPI_Status,
-) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_File,
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut MPI_Status,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_write_shared\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, count, datatype, status)
+#[inline]
+pub unsafe fn MPI_Barrier_init(comm: MPI_Comm, info: MPI_Info, request: *mut MPI_Request) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(447, 0);
+    (entry::MPI_Barrier_init())(comm, info, request)
 }
 
-pub unsafe fn MPI_File_iread_shared(
-    fh: MPI_File,
-    buf: *mut c_void,
+#[inline]
+pub unsafe fn MPI_Bcast_init(
+    buffer: *mut c_void,
     count: c_int,
     datatype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    info: MPI_Info,
     request: *mut MPI_Request,
 ) -> c_int {
-    type F =
-        unsafe extern "C" fn(MPI_File, *mut c_void, c_int, MPI_Datatype, *mut MPI_Request) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_iread_shared\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, count, datatype, request)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(448, trace::volume(buffer as *const c_void, count, datatype));
+    (entry::MPI_Bcast_init())(buffer, count, datatype, root, comm, info, request)
 }
 
-pub unsafe fn MPI_File_iwrite_shared(
-    fh: MPI_File,
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
+#[inline]
+pub unsafe fn MPI_Gather_init(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    info: MPI_Info,
     request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_File,
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut MPI_Request,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_iwrite_shared\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, count, datatype, request)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        449,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Gather_init())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_File_read_ordered(
-    fh: MPI_File,
-    buf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    status: *mut MPI_Status,
+#[inline]
+pub unsafe fn MPI_Gatherv_init(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    displs: *const c_int,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F =
-        unsafe extern "C" fn(MPI_File, *mut c_void, c_int, MPI_Datatype, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_read_ordered\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, count, datatype, status)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(450, trace::volume(sendbuf, sendcount, sendtype));
+    (entry::MPI_Gatherv_init())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, root, comm, info,
+        request,
+    )
 }
 
-pub unsafe fn MPI_File_write_ordered(
-    fh: MPI_File,
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
-    status: *mut MPI_Status,
+#[inline]
+pub unsafe fn MPI_Scatter_init(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        MPI_File,
-        *const c_void,
-        c_int,
-        MPI_Datatype,
-        *mut MPI_Status,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_write_ordered\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, count, datatype, status)
-}
-
-pub unsafe fn MPI_File_seek_shared(fh: MPI_File, offset: MPI_Offset, whence: c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, MPI_Offset, c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_seek_shared\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, offset, whence)
-}
-
-pub unsafe fn MPI_File_get_position_shared(fh: MPI_File, offset: *mut MPI_Offset) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, *mut MPI_Offset) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_get_position_shared\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, offset)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        451,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Scatter_init())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_File_read_at_all_begin(
-    fh: MPI_File,
-    offset: MPI_Offset,
-    buf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
+#[inline]
+pub unsafe fn MPI_Scatterv_init(
+    sendbuf: *const c_void,
+    sendcounts: *const c_int,
+    displs: *const c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, MPI_Offset, *mut c_void, c_int, MPI_Datatype) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_read_at_all_begin\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, offset, buf, count, datatype)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        452,
+        trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Scatterv_init())(
+        sendbuf, sendcounts, displs, sendtype, recvbuf, recvcount, recvtype, root, comm, info,
+        request,
+    )
 }
 
-pub unsafe fn MPI_File_read_at_all_end(
-    fh: MPI_File,
-    buf: *mut c_void,
-    status: *mut MPI_Status,
+#[inline]
+pub unsafe fn MPI_Allgather_init(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, *mut c_void, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_read_at_all_end\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, status)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        453,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Allgather_init())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_File_write_at_all_begin(
-    fh: MPI_File,
-    offset: MPI_Offset,
-    buf: *const c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
+#[inline]
+pub unsafe fn MPI_Allgatherv_init(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    displs: *const c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F =
-        unsafe extern "C" fn(MPI_File, MPI_Offset, *const c_void, c_int, MPI_Datatype) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_write_at_all_begin\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, offset, buf, count, datatype)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(454, trace::volume(sendbuf, sendcount, sendtype));
+    (entry::MPI_Allgatherv_init())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_File_write_at_all_end(
-    fh: MPI_File,
-    buf: *const c_void,
-    status: *mut MPI_Status,
+#[inline]
+pub unsafe fn MPI_Alltoall_init(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, *const c_void, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_write_at_all_end\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, status)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        455,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Alltoall_init())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_File_read_all_begin(
-    fh: MPI_File,
-    buf: *mut c_void,
-    count: c_int,
-    datatype: MPI_Datatype,
+#[inline]
+pub unsafe fn MPI_Alltoallv_init(
+    sendbuf: *const c_void,
+    sendcounts: *const c_int,
+    sdispls: *const c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    rdispls: *const c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, *mut c_void, c_int, MPI_Datatype) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_read_all_begin\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, count, datatype)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(456, 0);
+    (entry::MPI_Alltoallv_init())(
+        sendbuf, sendcounts, sdispls, sendtype, recvbuf, recvcounts, rdispls, recvtype, comm, info,
+        request,
+    )
 }
 
-pub unsafe fn MPI_File_read_all_end(
-    fh: MPI_File,
-    buf: *mut c_void,
-    status: *mut MPI_Status,
+#[inline]
+pub unsafe fn MPI_Alltoallw_init(
+    sendbuf: *const c_void,
+    sendcounts: *const c_int,
+    sdispls: *const c_int,
+    sendtypes: *const MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    rdispls: *const c_int,
+    recvtypes: *const MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, *mut c_void, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_read_all_end\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, status)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(457, 0);
+    (entry::MPI_Alltoallw_init())(
+        sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+        info, request,
+    )
 }
 
-pub unsafe fn MPI_File_write_all_begin(
-    fh: MPI_File,
-    buf: *const c_void,
+#[inline]
+pub unsafe fn MPI_Reduce_init(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
     count: c_int,
     datatype: MPI_Datatype,
+    op: MPI_Op,
+    root: c_int,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, *const c_void, c_int, MPI_Datatype) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_write_all_begin\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, count, datatype)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(458, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Reduce_init())(
+        sendbuf, recvbuf, count, datatype, op, root, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_File_write_all_end(
-    fh: MPI_File,
-    buf: *const c_void,
-    status: *mut MPI_Status,
+#[inline]
+pub unsafe fn MPI_Allreduce_init(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, *const c_void, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_write_all_end\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, status)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(459, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Allreduce_init())(sendbuf, recvbuf, count, datatype, op, comm, info, request)
 }
 
-pub unsafe fn MPI_File_read_ordered_begin(
-    fh: MPI_File,
-    buf: *mut c_void,
-    count: c_int,
+#[inline]
+pub unsafe fn MPI_Reduce_scatter_block_init(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
     datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, *mut c_void, c_int, MPI_Datatype) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_read_ordered_begin\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, count, datatype)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(460, 0);
+    (entry::MPI_Reduce_scatter_block_init())(
+        sendbuf, recvbuf, recvcount, datatype, op, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_File_read_ordered_end(
-    fh: MPI_File,
-    buf: *mut c_void,
-    status: *mut MPI_Status,
+#[inline]
+pub unsafe fn MPI_Reduce_scatter_init(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, *mut c_void, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_read_ordered_end\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, status)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(461, 0);
+    (entry::MPI_Reduce_scatter_init())(
+        sendbuf, recvbuf, recvcounts, datatype, op, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_File_write_ordered_begin(
-    fh: MPI_File,
-    buf: *const c_void,
+#[inline]
+pub unsafe fn MPI_Scan_init(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
     count: c_int,
     datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, *const c_void, c_int, MPI_Datatype) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_write_ordered_begin\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, count, datatype)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(462, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Scan_init())(sendbuf, recvbuf, count, datatype, op, comm, info, request)
 }
 
-pub unsafe fn MPI_File_write_ordered_end(
-    fh: MPI_File,
-    buf: *const c_void,
-    status: *mut MPI_Status,
+#[inline]
+pub unsafe fn MPI_Exscan_init(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: c_int,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, *const c_void, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_write_ordered_end\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, buf, status)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(463, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Exscan_init())(sendbuf, recvbuf, count, datatype, op, comm, info, request)
 }
 
-pub unsafe fn MPI_File_get_type_extent(
-    fh: MPI_File,
+#[inline]
+pub unsafe fn MPI_Bcast_init_c(
+    buffer: *mut c_void,
+    count: MPI_Count,
     datatype: MPI_Datatype,
-    extent: *mut MPI_Aint,
+    root: c_int,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, MPI_Datatype, *mut MPI_Aint) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_get_type_extent\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, datatype, extent)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(464, trace::volume(buffer as *const c_void, count, datatype));
+    (entry::MPI_Bcast_init_c())(buffer, count, datatype, root, comm, info, request)
 }
 
-pub unsafe fn MPI_Register_datarep(
-    datarep: *const c_char,
-    read_conversion_fn: MPI_Datarep_conversion_function,
-    write_conversion_fn: MPI_Datarep_conversion_function,
-    dtype_file_extent_fn: MPI_Datarep_extent_function,
-    extra_state: *mut c_void,
+#[inline]
+pub unsafe fn MPI_Gather_init_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(
-        *const c_char,
-        MPI_Datarep_conversion_function,
-        MPI_Datarep_conversion_function,
-        MPI_Datarep_extent_function,
-        *mut c_void,
-    ) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Register_datarep\0");
-        std::mem::transmute(ptr)
-    });
-    f(
-        datarep,
-        read_conversion_fn,
-        write_conversion_fn,
-        dtype_file_extent_fn,
-        extra_state,
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        465,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Gather_init_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm, info, request,
     )
 }
 
-pub unsafe fn MPI_File_set_atomicity(fh: MPI_File, flag: c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_set_atomicity\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, flag)
-}
-
-pub unsafe fn MPI_File_get_atomicity(fh: MPI_File, flag: *mut c_int) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File, *mut c_int) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_get_atomicity\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh, flag)
-}
-
-pub unsafe fn MPI_File_sync(fh: MPI_File) -> c_int {
-    type F = unsafe extern "C" fn(MPI_File) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_sync\0");
-        std::mem::transmute(ptr)
-    });
-    f(fh)
-}
-
-pub unsafe fn MPI_Type_create_f90_real(
-    precision: c_int,
-    range: c_int,
-    newtype: *mut MPI_Datatype,
+#[inline]
+pub unsafe fn MPI_Gatherv_init_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    displs: *const MPI_Aint,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(c_int, c_int, *mut MPI_Datatype) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_create_f90_real\0");
-        std::mem::transmute(ptr)
-    });
-    f(precision, range, newtype)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(466, trace::volume(sendbuf, sendcount, sendtype));
+    (entry::MPI_Gatherv_init_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, root, comm, info,
+        request,
+    )
 }
 
-pub unsafe fn MPI_Type_create_f90_complex(
-    precision: c_int,
-    range: c_int,
-    newtype: *mut MPI_Datatype,
+#[inline]
+pub unsafe fn MPI_Scatter_init_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(c_int, c_int, *mut MPI_Datatype) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_create_f90_complex\0");
-        std::mem::transmute(ptr)
-    });
-    f(precision, range, newtype)
-}
-
-pub unsafe fn MPI_Type_create_f90_integer(range: c_int, newtype: *mut MPI_Datatype) -> c_int {
-    type F = unsafe extern "C" fn(c_int, *mut MPI_Datatype) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_create_f90_integer\0");
-        std::mem::transmute(ptr)
-    });
-    f(range, newtype)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        467,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Scatter_init_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, root, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_Type_match_size(
-    typeclass: c_int,
-    size: c_int,
-    datatype: *mut MPI_Datatype,
+#[inline]
+pub unsafe fn MPI_Scatterv_init_c(
+    sendbuf: *const c_void,
+    sendcounts: *const MPI_Count,
+    displs: *const MPI_Aint,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    root: c_int,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
 ) -> c_int {
-    type F = unsafe extern "C" fn(c_int, c_int, *mut MPI_Datatype) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_match_size\0");
-        std::mem::transmute(ptr)
-    });
-    f(typeclass, size, datatype)
-}
-
-pub unsafe fn MPI_Comm_f2c(comm: MPI_Fint) -> MPI_Comm {
-    type F = unsafe extern "C" fn(MPI_Fint) -> MPI_Comm;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_f2c\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm)
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        468,
+        trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Scatterv_init_c())(
+        sendbuf, sendcounts, displs, sendtype, recvbuf, recvcount, recvtype, root, comm, info,
+        request,
+    )
 }
 
-pub unsafe fn MPI_Comm_c2f(comm: MPI_Comm) -> MPI_Fint {
-    type F = unsafe extern "C" fn(MPI_Comm) -> MPI_Fint;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Comm_c2f\0");
-        std::mem::transmute(ptr)
-    });
-    f(comm)
+#[inline]
+pub unsafe fn MPI_Allgather_init_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        469,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Allgather_init_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_Type_f2c(datatype: MPI_Fint) -> MPI_Datatype {
-    type F = unsafe extern "C" fn(MPI_Fint) -> MPI_Datatype;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_f2c\0");
-        std::mem::transmute(ptr)
-    });
-    f(datatype)
+#[inline]
+pub unsafe fn MPI_Allgatherv_init_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    displs: *const MPI_Aint,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(470, trace::volume(sendbuf, sendcount, sendtype));
+    (entry::MPI_Allgatherv_init_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_Type_c2f(datatype: MPI_Datatype) -> MPI_Fint {
-    type F = unsafe extern "C" fn(MPI_Datatype) -> MPI_Fint;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Type_c2f\0");
-        std::mem::transmute(ptr)
-    });
-    f(datatype)
+#[inline]
+pub unsafe fn MPI_Alltoall_init_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        471,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Alltoall_init_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_Group_f2c(group: MPI_Fint) -> MPI_Group {
-    type F = unsafe extern "C" fn(MPI_Fint) -> MPI_Group;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Group_f2c\0");
-        std::mem::transmute(ptr)
-    });
-    f(group)
+#[inline]
+pub unsafe fn MPI_Alltoallv_init_c(
+    sendbuf: *const c_void,
+    sendcounts: *const MPI_Count,
+    sdispls: *const MPI_Aint,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    rdispls: *const MPI_Aint,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(472, 0);
+    (entry::MPI_Alltoallv_init_c())(
+        sendbuf, sendcounts, sdispls, sendtype, recvbuf, recvcounts, rdispls, recvtype, comm, info,
+        request,
+    )
 }
 
-pub unsafe fn MPI_Group_c2f(group: MPI_Group) -> MPI_Fint {
-    type F = unsafe extern "C" fn(MPI_Group) -> MPI_Fint;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Group_c2f\0");
-        std::mem::transmute(ptr)
-    });
-    f(group)
+#[inline]
+pub unsafe fn MPI_Alltoallw_init_c(
+    sendbuf: *const c_void,
+    sendcounts: *const MPI_Count,
+    sdispls: *const MPI_Aint,
+    sendtypes: *const MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    rdispls: *const MPI_Aint,
+    recvtypes: *const MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(473, 0);
+    (entry::MPI_Alltoallw_init_c())(
+        sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+        info, request,
+    )
 }
 
-pub unsafe fn MPI_Request_f2c(request: MPI_Fint) -> MPI_Request {
-    type F = unsafe extern "C" fn(MPI_Fint) -> MPI_Request;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Request_f2c\0");
-        std::mem::transmute(ptr)
-    });
-    f(request)
+#[inline]
+pub unsafe fn MPI_Reduce_init_c(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    root: c_int,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(474, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Reduce_init_c())(
+        sendbuf, recvbuf, count, datatype, op, root, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_Request_c2f(request: MPI_Request) -> MPI_Fint {
-    type F = unsafe extern "C" fn(MPI_Request) -> MPI_Fint;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Request_c2f\0");
-        std::mem::transmute(ptr)
-    });
-    f(request)
+#[inline]
+pub unsafe fn MPI_Allreduce_init_c(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(475, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Allreduce_init_c())(sendbuf, recvbuf, count, datatype, op, comm, info, request)
 }
 
-pub unsafe fn MPI_File_f2c(file: MPI_Fint) -> MPI_File {
-    type F = unsafe extern "C" fn(MPI_Fint) -> MPI_File;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_f2c\0");
-        std::mem::transmute(ptr)
-    });
-    f(file)
+#[inline]
+pub unsafe fn MPI_Reduce_scatter_block_init_c(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(476, 0);
+    (entry::MPI_Reduce_scatter_block_init_c())(
+        sendbuf, recvbuf, recvcount, datatype, op, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_File_c2f(file: MPI_File) -> MPI_Fint {
-    type F = unsafe extern "C" fn(MPI_File) -> MPI_Fint;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_File_c2f\0");
-        std::mem::transmute(ptr)
-    });
-    f(file)
+#[inline]
+pub unsafe fn MPI_Reduce_scatter_init_c(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(477, 0);
+    (entry::MPI_Reduce_scatter_init_c())(
+        sendbuf, recvbuf, recvcounts, datatype, op, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_Win_f2c(win: MPI_Fint) -> MPI_Win {
-    type F = unsafe extern "C" fn(MPI_Fint) -> MPI_Win;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_f2c\0");
-        std::mem::transmute(ptr)
-    });
-    f(win)
+#[inline]
+pub unsafe fn MPI_Scan_init_c(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(478, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Scan_init_c())(sendbuf, recvbuf, count, datatype, op, comm, info, request)
 }
 
-pub unsafe fn MPI_Win_c2f(win: MPI_Win) -> MPI_Fint {
-    type F = unsafe extern "C" fn(MPI_Win) -> MPI_Fint;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Win_c2f\0");
-        std::mem::transmute(ptr)
-    });
-    f(win)
+#[inline]
+pub unsafe fn MPI_Exscan_init_c(
+    sendbuf: *const c_void,
+    recvbuf: *mut c_void,
+    count: MPI_Count,
+    datatype: MPI_Datatype,
+    op: MPI_Op,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(479, trace::volume(sendbuf, count, datatype));
+    (entry::MPI_Exscan_init_c())(sendbuf, recvbuf, count, datatype, op, comm, info, request)
 }
 
-pub unsafe fn MPI_Op_f2c(op: MPI_Fint) -> MPI_Op {
-    type F = unsafe extern "C" fn(MPI_Fint) -> MPI_Op;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Op_f2c\0");
-        std::mem::transmute(ptr)
-    });
-    f(op)
+#[inline]
+pub unsafe fn MPI_Neighbor_allgather_init(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        480,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Neighbor_allgather_init())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_Op_c2f(op: MPI_Op) -> MPI_Fint {
-    type F = unsafe extern "C" fn(MPI_Op) -> MPI_Fint;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Op_c2f\0");
-        std::mem::transmute(ptr)
-    });
-    f(op)
+#[inline]
+pub unsafe fn MPI_Neighbor_allgatherv_init(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    displs: *const c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(481, trace::volume(sendbuf, sendcount, sendtype));
+    (entry::MPI_Neighbor_allgatherv_init())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_Info_f2c(info: MPI_Fint) -> MPI_Info {
-    type F = unsafe extern "C" fn(MPI_Fint) -> MPI_Info;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Info_f2c\0");
-        std::mem::transmute(ptr)
-    });
-    f(info)
+#[inline]
+pub unsafe fn MPI_Neighbor_alltoall_init(
+    sendbuf: *const c_void,
+    sendcount: c_int,
+    senddtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        482,
+        trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Neighbor_alltoall_init())(
+        sendbuf, sendcount, senddtype, recvbuf, recvcount, recvtype, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_Info_c2f(info: MPI_Info) -> MPI_Fint {
-    type F = unsafe extern "C" fn(MPI_Info) -> MPI_Fint;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Info_c2f\0");
-        std::mem::transmute(ptr)
-    });
-    f(info)
+#[inline]
+pub unsafe fn MPI_Neighbor_alltoallv_init(
+    sendbuf: *const c_void,
+    sendcounts: *const c_int,
+    sdispls: *const c_int,
+    senddtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    rdispls: *const c_int,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(483, 0);
+    (entry::MPI_Neighbor_alltoallv_init())(
+        sendbuf, sendcounts, sdispls, senddtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+        info, request,
+    )
 }
 
-pub unsafe fn MPI_Errhandler_f2c(info: MPI_Fint) -> MPI_Errhandler {
-    type F = unsafe extern "C" fn(MPI_Fint) -> MPI_Errhandler;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Errhandler_f2c\0");
-        std::mem::transmute(ptr)
-    });
-    f(info)
+#[inline]
+pub unsafe fn MPI_Neighbor_alltoallw_init(
+    sendbuf: *const c_void,
+    sendcounts: *const c_int,
+    sdispls: *const MPI_Aint,
+    sendtypes: *const MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const c_int,
+    rdispls: *const MPI_Aint,
+    recvtypes: *const MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(484, 0);
+    (entry::MPI_Neighbor_alltoallw_init())(
+        sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+        info, request,
+    )
 }
 
-pub unsafe fn MPI_Errhandler_c2f(info: MPI_Errhandler) -> MPI_Fint {
-    type F = unsafe extern "C" fn(MPI_Errhandler) -> MPI_Fint;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Errhandler_c2f\0");
-        std::mem::transmute(ptr)
-    });
-    f(info)
+#[inline]
+pub unsafe fn MPI_Neighbor_allgather_init_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        485,
+        trace::volume(sendbuf, sendcount, sendtype)
+            + trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Neighbor_allgather_init_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcount, recvtype, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_Message_f2c(message: MPI_Fint) -> MPI_Message {
-    type F = unsafe extern "C" fn(MPI_Fint) -> MPI_Message;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Message_f2c\0");
-        std::mem::transmute(ptr)
-    });
-    f(message)
+#[inline]
+pub unsafe fn MPI_Neighbor_allgatherv_init_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    sendtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    displs: *const MPI_Aint,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(486, trace::volume(sendbuf, sendcount, sendtype));
+    (entry::MPI_Neighbor_allgatherv_init_c())(
+        sendbuf, sendcount, sendtype, recvbuf, recvcounts, displs, recvtype, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_Message_c2f(message: MPI_Message) -> MPI_Fint {
-    type F = unsafe extern "C" fn(MPI_Message) -> MPI_Fint;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Message_c2f\0");
-        std::mem::transmute(ptr)
-    });
-    f(message)
+#[inline]
+pub unsafe fn MPI_Neighbor_alltoall_init_c(
+    sendbuf: *const c_void,
+    sendcount: MPI_Count,
+    senddtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcount: MPI_Count,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(
+        487,
+        trace::volume(recvbuf as *const c_void, recvcount, recvtype),
+    );
+    (entry::MPI_Neighbor_alltoall_init_c())(
+        sendbuf, sendcount, senddtype, recvbuf, recvcount, recvtype, comm, info, request,
+    )
 }
 
-pub unsafe fn MPI_Status_f2c(f_status: *const MPI_Fint, c_status: *mut MPI_Status) -> c_int {
-    type F = unsafe extern "C" fn(*const MPI_Fint, *mut MPI_Status) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Status_f2c\0");
-        std::mem::transmute(ptr)
-    });
-    f(f_status, c_status)
+#[inline]
+pub unsafe fn MPI_Neighbor_alltoallv_init_c(
+    sendbuf: *const c_void,
+    sendcounts: *const MPI_Count,
+    sdispls: *const MPI_Aint,
+    senddtype: MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    rdispls: *const MPI_Aint,
+    recvtype: MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(488, 0);
+    (entry::MPI_Neighbor_alltoallv_init_c())(
+        sendbuf, sendcounts, sdispls, senddtype, recvbuf, recvcounts, rdispls, recvtype, comm,
+        info, request,
+    )
 }
 
-pub unsafe fn MPI_Status_c2f(c_status: *const MPI_Status, f_status: *mut MPI_Fint) -> c_int {
-    type F = unsafe extern "C" fn(*const MPI_Status, *mut MPI_Fint) -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPI_Status_c2f\0");
-        std::mem::transmute(ptr)
-    });
-    f(c_status, f_status)
+#[inline]
+pub unsafe fn MPI_Neighbor_alltoallw_init_c(
+    sendbuf: *const c_void,
+    sendcounts: *const MPI_Count,
+    sdispls: *const MPI_Aint,
+    sendtypes: *const MPI_Datatype,
+    recvbuf: *mut c_void,
+    recvcounts: *const MPI_Count,
+    rdispls: *const MPI_Aint,
+    recvtypes: *const MPI_Datatype,
+    comm: MPI_Comm,
+    info: MPI_Info,
+    request: *mut MPI_Request,
+) -> c_int {
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(489, 0);
+    (entry::MPI_Neighbor_alltoallw_init_c())(
+        sendbuf, sendcounts, sdispls, sendtypes, recvbuf, recvcounts, rdispls, recvtypes, comm,
+        info, request,
+    )
 }
 
+#[inline]
 pub unsafe fn MPIX_Query_cuda_support() -> c_int {
-    type F = unsafe extern "C" fn() -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPIX_Query_cuda_support\0");
-        std::mem::transmute(ptr)
-    });
-    f()
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(490, 0);
+    (entry::MPIX_Query_cuda_support())()
 }
 
+#[inline]
 pub unsafe fn MPIX_Query_hip_support() -> c_int {
-    type F = unsafe extern "C" fn() -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPIX_Query_hip_support\0");
-        std::mem::transmute(ptr)
-    });
-    f()
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(491, 0);
+    (entry::MPIX_Query_hip_support())()
 }
 
+#[inline]
 pub unsafe fn MPIX_Query_rocm_support() -> c_int {
-    type F = unsafe extern "C" fn() -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPIX_Query_rocm_support\0");
-        std::mem::transmute(ptr)
-    });
-    f()
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(492, 0);
+    (entry::MPIX_Query_rocm_support())()
 }
 
+#[inline]
 pub unsafe fn MPIX_Query_ze_support() -> c_int {
-    type F = unsafe extern "C" fn() -> c_int;
-    static FN: OnceLock<F> = OnceLock::new();
-    let f = FN.get_or_init(|| {
-        let ptr = loader::get_symbol::<F>(b"MPIX_Query_ze_support\0");
-        std::mem::transmute(ptr)
-    });
-    f()
+    #[cfg(feature = "trace")]
+    let _call = trace::Call::new(493, 0);
+    (entry::MPIX_Query_ze_support())()
 }
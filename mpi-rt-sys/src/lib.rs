@@ -21,13 +21,27 @@
 //! export MPI_RT_LIB=/path/to/libmpiwrapper.so
 //! ```
 //!
+//! Libraries implementing the MPI standard ABI of MPI 5.0 (e.g. MPICH's `libmpi_abi.so`) work
+//! as well. Which ABI the library implements is detected from its exported symbols, see
+//! [`abi()`].
+//!
 //! # Architecture
 //!
 //! - **`loader`**: Loads the shared library via `libloading`
-//! - **`functions`**: MPI function wrappers with lazy symbol resolution
-//! - **`constants`**: MPI constant accessors loaded from MPIABI symbols
+//! - **`functions`**: MPI function wrappers calling through a single function table
+//!   that is resolved in one pass on first use
+//! - **`constants`**: MPI constant accessors loaded from MPIABI symbols, or `const` values
+//!   for constants that every supported MPI implementation agrees on
 //! - **`types`**: MPI type definitions (all handles are `usize` per MPIABI)
 //! - **`callback_types`**: MPI callback function pointer type aliases
+//! - **`trace`**: Per-function call counts, time and data volume (with the `trace` feature)
+//!
+//! # Link-time mode
+//!
+//! With the `link` feature, `functions` and `constants` are plain `extern "C"`
+//! declarations resolved by the linker against the library that `MPI_RT_LIB` names
+//! at build time. The API is the same, but there is no `loader` and no
+//! runtime switching of the MPI library.
 
 #![allow(non_camel_case_types)]
 #![allow(non_snake_case)]
@@ -35,16 +49,60 @@
 #![allow(
     clippy::missing_safety_doc,
     clippy::crosspointer_transmute,
+    clippy::missing_transmute_annotations,
     clippy::too_many_arguments
 )]
 
 pub mod callback_types;
+#[cfg(not(feature = "link"))]
 pub mod constants;
+#[cfg(not(feature = "link"))]
 pub mod functions;
+#[cfg(not(feature = "link"))]
 pub mod loader;
+#[cfg(feature = "trace")]
+pub mod trace;
 pub mod types;
 
+#[cfg(all(feature = "trace", feature = "link"))]
+compile_error!("Feature `trace` requires the function table and is not available with `link`.");
+
+#[cfg(feature = "link")]
+#[path = "linked_constants.rs"]
+pub mod constants;
+#[cfg(feature = "link")]
+#[path = "linked_functions.rs"]
+pub mod functions;
+
 pub use callback_types::*;
 pub use constants::*;
 pub use functions::*;
 pub use types::*;
+
+/// The ABI implemented by the MPI library.
+///
+/// With the `link` feature this is always [`Abi::Mpiabi`].
+#[inline]
+pub fn abi() -> Abi {
+    #[cfg(not(feature = "link"))]
+    return loader::abi();
+    #[cfg(feature = "link")]
+    return Abi::Mpiabi;
+}
+
+/// Load the MPI library and resolve all functions and constants now.
+///
+/// Otherwise this happens on the first call into the library. Calling it ahead of
+/// time keeps symbol lookups out of the first communication call. Also runs
+/// [`verify_constants`].
+///
+/// With the `link` feature, symbols are resolved by the dynamic linker and only the
+/// constants are verified.
+pub fn preload() {
+    #[cfg(not(feature = "link"))]
+    {
+        functions::resolve_function_table();
+        constants::resolve_constants();
+    }
+    constants::verify_constants();
+}
@@ -0,0 +1,2953 @@
+//! MPI constant accessors linked against an MPIABI library at build time.
+//!
+//! Auto-generated by gen_rust.py. Do not edit manually.
+
+use std::{
+    os::raw::{c_char, c_double, c_int, c_void},
+    sync::Once,
+};
+
+use crate::{callback_types::*, types::*};
+
+extern "C" {
+    static MPIABI_ANY_SOURCE: c_int;
+    static MPIABI_ANY_TAG: c_int;
+    static MPIABI_PROC_NULL: c_int;
+    static MPIABI_ROOT: c_int;
+    static MPIABI_CART: c_int;
+    static MPIABI_DIST_GRAPH: c_int;
+    static MPIABI_GRAPH: c_int;
+    static MPIABI_CONGRUENT: c_int;
+    static MPIABI_IDENT: c_int;
+    static MPIABI_SIMILAR: c_int;
+    static MPIABI_UNEQUAL: c_int;
+    static MPIABI_BSEND_OVERHEAD: c_int;
+    static MPIABI_KEYVAL_INVALID: c_int;
+    static MPIABI_APPNUM: c_int;
+    static MPIABI_HOST: c_int;
+    static MPIABI_IO: c_int;
+    static MPIABI_LASTUSEDCODE: c_int;
+    static MPIABI_TAG_UB: c_int;
+    static MPIABI_UNIVERSE_SIZE: c_int;
+    static MPIABI_WIN_BASE: c_int;
+    static MPIABI_WIN_CREATE_FLAVOR: c_int;
+    static MPIABI_WIN_DISP_UNIT: c_int;
+    static MPIABI_WIN_MODEL: c_int;
+    static MPIABI_WIN_SIZE: c_int;
+    static MPIABI_WTIME_IS_GLOBAL: c_int;
+    static MPIABI_COMBINER_CONTIGUOUS: c_int;
+    static MPIABI_COMBINER_DARRAY: c_int;
+    static MPIABI_COMBINER_DUP: c_int;
+    static MPIABI_COMBINER_F90_COMPLEX: c_int;
+    static MPIABI_COMBINER_F90_INTEGER: c_int;
+    static MPIABI_COMBINER_F90_REAL: c_int;
+    static MPIABI_COMBINER_HINDEXED: c_int;
+    static MPIABI_COMBINER_HINDEXED_BLOCK: c_int;
+    static MPIABI_COMBINER_HVECTOR: c_int;
+    static MPIABI_COMBINER_INDEXED: c_int;
+    static MPIABI_COMBINER_INDEXED_BLOCK: c_int;
+    static MPIABI_COMBINER_NAMED: c_int;
+    static MPIABI_COMBINER_RESIZED: c_int;
+    static MPIABI_COMBINER_STRUCT: c_int;
+    static MPIABI_COMBINER_SUBARRAY: c_int;
+    static MPIABI_COMBINER_VECTOR: c_int;
+    static MPIABI_COMM_TYPE_SHARED: c_int;
+    static MPIABI_DISTRIBUTE_BLOCK: c_int;
+    static MPIABI_DISTRIBUTE_CYCLIC: c_int;
+    static MPIABI_DISTRIBUTE_DFLT_DARG: c_int;
+    static MPIABI_DISTRIBUTE_NONE: c_int;
+    static MPIABI_ERR_ACCESS: c_int;
+    static MPIABI_ERR_AMODE: c_int;
+    static MPIABI_ERR_ARG: c_int;
+    static MPIABI_ERR_ASSERT: c_int;
+    static MPIABI_ERR_BAD_FILE: c_int;
+    static MPIABI_ERR_BASE: c_int;
+    static MPIABI_ERR_BUFFER: c_int;
+    static MPIABI_ERR_COMM: c_int;
+    static MPIABI_ERR_CONVERSION: c_int;
+    static MPIABI_ERR_COUNT: c_int;
+    static MPIABI_ERR_DIMS: c_int;
+    static MPIABI_ERR_DISP: c_int;
+    static MPIABI_ERR_DUP_DATAREP: c_int;
+    static MPIABI_ERR_FILE: c_int;
+    static MPIABI_ERR_FILE_EXISTS: c_int;
+    static MPIABI_ERR_FILE_IN_USE: c_int;
+    static MPIABI_ERR_GROUP: c_int;
+    static MPIABI_ERR_INFO: c_int;
+    static MPIABI_ERR_INFO_KEY: c_int;
+    static MPIABI_ERR_INFO_NOKEY: c_int;
+    static MPIABI_ERR_INFO_VALUE: c_int;
+    static MPIABI_ERR_INTERN: c_int;
+    static MPIABI_ERR_IN_STATUS: c_int;
+    static MPIABI_ERR_IO: c_int;
+    static MPIABI_ERR_KEYVAL: c_int;
+    static MPIABI_ERR_LASTCODE: c_int;
+    static MPIABI_ERR_LOCKTYPE: c_int;
+    static MPIABI_ERR_NAME: c_int;
+    static MPIABI_ERR_NOT_SAME: c_int;
+    static MPIABI_ERR_NO_MEM: c_int;
+    static MPIABI_ERR_NO_SPACE: c_int;
+    static MPIABI_ERR_NO_SUCH_FILE: c_int;
+    static MPIABI_ERR_OP: c_int;
+    static MPIABI_ERR_OTHER: c_int;
+    static MPIABI_ERR_PENDING: c_int;
+    static MPIABI_ERR_PORT: c_int;
+    static MPIABI_ERR_QUOTA: c_int;
+    static MPIABI_ERR_RANK: c_int;
+    static MPIABI_ERR_READ_ONLY: c_int;
+    static MPIABI_ERR_REQUEST: c_int;
+    static MPIABI_ERR_RMA_ATTACH: c_int;
+    static MPIABI_ERR_RMA_CONFLICT: c_int;
+    static MPIABI_ERR_RMA_FLAVOR: c_int;
+    static MPIABI_ERR_RMA_RANGE: c_int;
+    static MPIABI_ERR_RMA_SHARED: c_int;
+    static MPIABI_ERR_RMA_SYNC: c_int;
+    static MPIABI_ERR_ROOT: c_int;
+    static MPIABI_ERR_SERVICE: c_int;
+    static MPIABI_ERR_SIZE: c_int;
+    static MPIABI_ERR_SPAWN: c_int;
+    static MPIABI_ERR_TAG: c_int;
+    static MPIABI_ERR_TOPOLOGY: c_int;
+    static MPIABI_ERR_TRUNCATE: c_int;
+    static MPIABI_ERR_TYPE: c_int;
+    static MPIABI_ERR_UNKNOWN: c_int;
+    static MPIABI_ERR_UNSUPPORTED_DATAREP: c_int;
+    static MPIABI_ERR_UNSUPPORTED_OPERATION: c_int;
+    static MPIABI_ERR_WIN: c_int;
+    static MPIABI_LOCK_EXCLUSIVE: c_int;
+    static MPIABI_LOCK_SHARED: c_int;
+    static MPIABI_MODE_APPEND: c_int;
+    static MPIABI_MODE_CREATE: c_int;
+    static MPIABI_MODE_DELETE_ON_CLOSE: c_int;
+    static MPIABI_MODE_EXCL: c_int;
+    static MPIABI_MODE_NOCHECK: c_int;
+    static MPIABI_MODE_NOPRECEDE: c_int;
+    static MPIABI_MODE_NOPUT: c_int;
+    static MPIABI_MODE_NOSTORE: c_int;
+    static MPIABI_MODE_NOSUCCEED: c_int;
+    static MPIABI_MODE_RDONLY: c_int;
+    static MPIABI_MODE_RDWR: c_int;
+    static MPIABI_MODE_SEQUENTIAL: c_int;
+    static MPIABI_MODE_UNIQUE_OPEN: c_int;
+    static MPIABI_MODE_WRONLY: c_int;
+    static MPIABI_ORDER_C: c_int;
+    static MPIABI_ORDER_FORTRAN: c_int;
+    static MPIABI_SEEK_CUR: c_int;
+    static MPIABI_SEEK_END: c_int;
+    static MPIABI_SEEK_SET: c_int;
+    static MPIABI_THREAD_FUNNELED: c_int;
+    static MPIABI_THREAD_MULTIPLE: c_int;
+    static MPIABI_THREAD_SERIALIZED: c_int;
+    static MPIABI_TYPECLASS_COMPLEX: c_int;
+    static MPIABI_TYPECLASS_INTEGER: c_int;
+    static MPIABI_TYPECLASS_REAL: c_int;
+    static MPIABI_WIN_FLAVOR_ALLOCATE: c_int;
+    static MPIABI_WIN_FLAVOR_CREATE: c_int;
+    static MPIABI_WIN_FLAVOR_DYNAMIC: c_int;
+    static MPIABI_WIN_FLAVOR_SHARED: c_int;
+    static MPIABI_WIN_SEPARATE: c_int;
+    static MPIABI_WIN_UNIFIED: c_int;
+    static MPIABI_ARGV_NULL: *mut *mut c_char;
+    static MPIABI_ARGVS_NULL: *mut *mut *mut c_char;
+    static MPIABI_ERRCODES_IGNORE: *mut c_int;
+    static MPIABI_UNWEIGHTED: *mut c_int;
+    static MPIABI_WEIGHTS_EMPTY: *mut c_int;
+    static MPIABI_BOTTOM: *mut c_void;
+    static MPIABI_IN_PLACE: *mut c_void;
+    static MPIABI_COMM_NULL: MPI_Comm;
+    static MPIABI_COMM_SELF: MPI_Comm;
+    static MPIABI_COMM_WORLD: MPI_Comm;
+    static MPIABI_COMM_DUP_FN: MPI_Comm_copy_attr_function;
+    static MPIABI_COMM_NULL_COPY_FN: MPI_Comm_copy_attr_function;
+    static MPIABI_COMM_NULL_DELETE_FN: MPI_Comm_delete_attr_function;
+    static MPIABI_DUP_FN: MPI_Copy_function;
+    static MPIABI_NULL_COPY_FN: MPI_Copy_function;
+    static MPIABI_CONVERSION_FN_NULL: MPI_Datarep_conversion_function;
+    static MPIABI_2DOUBLE_PRECISION: MPI_Datatype;
+    static MPIABI_2INT: MPI_Datatype;
+    static MPIABI_2INTEGER: MPI_Datatype;
+    static MPIABI_2REAL: MPI_Datatype;
+    static MPIABI_AINT: MPI_Datatype;
+    static MPIABI_BYTE: MPI_Datatype;
+    static MPIABI_CHAR: MPI_Datatype;
+    static MPIABI_CHARACTER: MPI_Datatype;
+    static MPIABI_COMPLEX: MPI_Datatype;
+    static MPIABI_COMPLEX16: MPI_Datatype;
+    static MPIABI_COMPLEX32: MPI_Datatype;
+    static MPIABI_COMPLEX8: MPI_Datatype;
+    static MPIABI_COUNT: MPI_Datatype;
+    static MPIABI_CXX_BOOL: MPI_Datatype;
+    static MPIABI_CXX_DOUBLE_COMPLEX: MPI_Datatype;
+    static MPIABI_CXX_FLOAT_COMPLEX: MPI_Datatype;
+    static MPIABI_CXX_LONG_DOUBLE_COMPLEX: MPI_Datatype;
+    static MPIABI_C_BOOL: MPI_Datatype;
+    static MPIABI_C_COMPLEX: MPI_Datatype;
+    static MPIABI_C_DOUBLE_COMPLEX: MPI_Datatype;
+    static MPIABI_C_FLOAT_COMPLEX: MPI_Datatype;
+    static MPIABI_C_LONG_DOUBLE_COMPLEX: MPI_Datatype;
+    static MPIABI_DATATYPE_NULL: MPI_Datatype;
+    static MPIABI_DOUBLE: MPI_Datatype;
+    static MPIABI_DOUBLE_COMPLEX: MPI_Datatype;
+    static MPIABI_DOUBLE_INT: MPI_Datatype;
+    static MPIABI_DOUBLE_PRECISION: MPI_Datatype;
+    static MPIABI_FLOAT: MPI_Datatype;
+    static MPIABI_FLOAT_INT: MPI_Datatype;
+    static MPIABI_INT: MPI_Datatype;
+    static MPIABI_INT16_T: MPI_Datatype;
+    static MPIABI_INT32_T: MPI_Datatype;
+    static MPIABI_INT64_T: MPI_Datatype;
+    static MPIABI_INT8_T: MPI_Datatype;
+    static MPIABI_INTEGER: MPI_Datatype;
+    static MPIABI_INTEGER1: MPI_Datatype;
+    static MPIABI_INTEGER2: MPI_Datatype;
+    static MPIABI_INTEGER4: MPI_Datatype;
+    static MPIABI_INTEGER8: MPI_Datatype;
+    static MPIABI_LOGICAL: MPI_Datatype;
+    static MPIABI_LONG: MPI_Datatype;
+    static MPIABI_LONG_DOUBLE: MPI_Datatype;
+    static MPIABI_LONG_DOUBLE_INT: MPI_Datatype;
+    static MPIABI_LONG_INT: MPI_Datatype;
+    static MPIABI_LONG_LONG: MPI_Datatype;
+    static MPIABI_LONG_LONG_INT: MPI_Datatype;
+    static MPIABI_OFFSET: MPI_Datatype;
+    static MPIABI_PACKED: MPI_Datatype;
+    static MPIABI_REAL: MPI_Datatype;
+    static MPIABI_REAL16: MPI_Datatype;
+    static MPIABI_REAL4: MPI_Datatype;
+    static MPIABI_REAL8: MPI_Datatype;
+    static MPIABI_SHORT: MPI_Datatype;
+    static MPIABI_SHORT_INT: MPI_Datatype;
+    static MPIABI_SIGNED_CHAR: MPI_Datatype;
+    static MPIABI_UINT16_T: MPI_Datatype;
+    static MPIABI_UINT32_T: MPI_Datatype;
+    static MPIABI_UINT64_T: MPI_Datatype;
+    static MPIABI_UINT8_T: MPI_Datatype;
+    static MPIABI_UNSIGNED: MPI_Datatype;
+    static MPIABI_UNSIGNED_CHAR: MPI_Datatype;
+    static MPIABI_UNSIGNED_LONG: MPI_Datatype;
+    static MPIABI_UNSIGNED_LONG_LONG: MPI_Datatype;
+    static MPIABI_UNSIGNED_SHORT: MPI_Datatype;
+    static MPIABI_WCHAR: MPI_Datatype;
+    static MPIABI_NULL_DELETE_FN: MPI_Delete_function;
+    static MPIABI_ERRHANDLER_NULL: MPI_Errhandler;
+    static MPIABI_ERRORS_ARE_FATAL: MPI_Errhandler;
+    static MPIABI_ERRORS_RETURN: MPI_Errhandler;
+    static MPIABI_FILE_NULL: MPI_File;
+    static MPIABI_F_STATUS_IGNORE: *mut MPI_Fint;
+    static MPIABI_F_STATUSES_IGNORE: *mut MPI_Fint;
+    static MPIABI_GROUP_EMPTY: MPI_Group;
+    static MPIABI_GROUP_NULL: MPI_Group;
+    static MPIABI_INFO_ENV: MPI_Info;
+    static MPIABI_INFO_NULL: MPI_Info;
+    static MPIABI_MESSAGE_NO_PROC: MPI_Message;
+    static MPIABI_MESSAGE_NULL: MPI_Message;
+    static MPIABI_DISPLACEMENT_CURRENT: MPI_Offset;
+    static MPIABI_BAND: MPI_Op;
+    static MPIABI_BOR: MPI_Op;
+    static MPIABI_BXOR: MPI_Op;
+    static MPIABI_LAND: MPI_Op;
+    static MPIABI_LOR: MPI_Op;
+    static MPIABI_LXOR: MPI_Op;
+    static MPIABI_MAX: MPI_Op;
+    static MPIABI_MAXLOC: MPI_Op;
+    static MPIABI_MIN: MPI_Op;
+    static MPIABI_MINLOC: MPI_Op;
+    static MPIABI_NO_OP: MPI_Op;
+    static MPIABI_OP_NULL: MPI_Op;
+    static MPIABI_PROD: MPI_Op;
+    static MPIABI_REPLACE: MPI_Op;
+    static MPIABI_SUM: MPI_Op;
+    static MPIABI_REQUEST_NULL: MPI_Request;
+    static MPIABI_STATUS_IGNORE: *mut MPI_Status;
+    static MPIABI_STATUSES_IGNORE: *mut MPI_Status;
+    static MPIABI_TYPE_DUP_FN: MPI_Type_copy_attr_function;
+    static MPIABI_TYPE_NULL_COPY_FN: MPI_Type_copy_attr_function;
+    static MPIABI_TYPE_NULL_DELETE_FN: MPI_Type_delete_attr_function;
+    static MPIABI_WIN_NULL: MPI_Win;
+    static MPIABI_WIN_DUP_FN: MPI_Win_copy_attr_function;
+    static MPIABI_WIN_NULL_COPY_FN: MPI_Win_copy_attr_function;
+    static MPIABI_WIN_NULL_DELETE_FN: MPI_Win_delete_attr_function;
+    static MPIABI_UNDEFINED: c_int;
+    static MPIABI_SUCCESS: c_int;
+    static MPIABI_THREAD_SINGLE: c_int;
+    static MPIABI_MAX_LIBRARY_VERSION_STRING: c_int;
+    static MPIABI_MAX_PROCESSOR_NAME: c_int;
+}
+
+#[inline]
+pub fn RSMPI_ANY_SOURCE_fn() -> c_int {
+    unsafe { MPIABI_ANY_SOURCE }
+}
+
+#[inline]
+pub fn RSMPI_ANY_TAG_fn() -> c_int {
+    unsafe { MPIABI_ANY_TAG }
+}
+
+#[inline]
+pub fn RSMPI_PROC_NULL_fn() -> c_int {
+    unsafe { MPIABI_PROC_NULL }
+}
+
+#[inline]
+pub fn RSMPI_ROOT_fn() -> c_int {
+    unsafe { MPIABI_ROOT }
+}
+
+#[inline]
+pub fn RSMPI_CART_fn() -> c_int {
+    unsafe { MPIABI_CART }
+}
+
+#[inline]
+pub fn RSMPI_DIST_GRAPH_fn() -> c_int {
+    unsafe { MPIABI_DIST_GRAPH }
+}
+
+#[inline]
+pub fn RSMPI_GRAPH_fn() -> c_int {
+    unsafe { MPIABI_GRAPH }
+}
+
+#[inline]
+pub fn RSMPI_CONGRUENT_fn() -> c_int {
+    unsafe { MPIABI_CONGRUENT }
+}
+
+#[inline]
+pub fn RSMPI_IDENT_fn() -> c_int {
+    unsafe { MPIABI_IDENT }
+}
+
+#[inline]
+pub fn RSMPI_SIMILAR_fn() -> c_int {
+    unsafe { MPIABI_SIMILAR }
+}
+
+#[inline]
+pub fn RSMPI_UNEQUAL_fn() -> c_int {
+    unsafe { MPIABI_UNEQUAL }
+}
+
+#[inline]
+pub fn RSMPI_BSEND_OVERHEAD_fn() -> c_int {
+    unsafe { MPIABI_BSEND_OVERHEAD }
+}
+
+#[inline]
+pub fn RSMPI_KEYVAL_INVALID_fn() -> c_int {
+    unsafe { MPIABI_KEYVAL_INVALID }
+}
+
+#[inline]
+pub fn RSMPI_APPNUM_fn() -> c_int {
+    unsafe { MPIABI_APPNUM }
+}
+
+#[inline]
+pub fn RSMPI_HOST_fn() -> c_int {
+    unsafe { MPIABI_HOST }
+}
+
+#[inline]
+pub fn RSMPI_IO_fn() -> c_int {
+    unsafe { MPIABI_IO }
+}
+
+#[inline]
+pub fn RSMPI_LASTUSEDCODE_fn() -> c_int {
+    unsafe { MPIABI_LASTUSEDCODE }
+}
+
+#[inline]
+pub fn RSMPI_TAG_UB_fn() -> c_int {
+    unsafe { MPIABI_TAG_UB }
+}
+
+#[inline]
+pub fn RSMPI_UNIVERSE_SIZE_fn() -> c_int {
+    unsafe { MPIABI_UNIVERSE_SIZE }
+}
+
+#[inline]
+pub fn RSMPI_WIN_BASE_fn() -> c_int {
+    unsafe { MPIABI_WIN_BASE }
+}
+
+#[inline]
+pub fn RSMPI_WIN_CREATE_FLAVOR_fn() -> c_int {
+    unsafe { MPIABI_WIN_CREATE_FLAVOR }
+}
+
+#[inline]
+pub fn RSMPI_WIN_DISP_UNIT_fn() -> c_int {
+    unsafe { MPIABI_WIN_DISP_UNIT }
+}
+
+#[inline]
+pub fn RSMPI_WIN_MODEL_fn() -> c_int {
+    unsafe { MPIABI_WIN_MODEL }
+}
+
+#[inline]
+pub fn RSMPI_WIN_SIZE_fn() -> c_int {
+    unsafe { MPIABI_WIN_SIZE }
+}
+
+#[inline]
+pub fn RSMPI_WTIME_IS_GLOBAL_fn() -> c_int {
+    unsafe { MPIABI_WTIME_IS_GLOBAL }
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_CONTIGUOUS_fn() -> c_int {
+    unsafe { MPIABI_COMBINER_CONTIGUOUS }
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_DARRAY_fn() -> c_int {
+    unsafe { MPIABI_COMBINER_DARRAY }
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_DUP_fn() -> c_int {
+    unsafe { MPIABI_COMBINER_DUP }
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_F90_COMPLEX_fn() -> c_int {
+    unsafe { MPIABI_COMBINER_F90_COMPLEX }
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_F90_INTEGER_fn() -> c_int {
+    unsafe { MPIABI_COMBINER_F90_INTEGER }
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_F90_REAL_fn() -> c_int {
+    unsafe { MPIABI_COMBINER_F90_REAL }
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_HINDEXED_fn() -> c_int {
+    unsafe { MPIABI_COMBINER_HINDEXED }
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_HINDEXED_BLOCK_fn() -> c_int {
+    unsafe { MPIABI_COMBINER_HINDEXED_BLOCK }
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_HVECTOR_fn() -> c_int {
+    unsafe { MPIABI_COMBINER_HVECTOR }
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_INDEXED_fn() -> c_int {
+    unsafe { MPIABI_COMBINER_INDEXED }
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_INDEXED_BLOCK_fn() -> c_int {
+    unsafe { MPIABI_COMBINER_INDEXED_BLOCK }
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_NAMED_fn() -> c_int {
+    unsafe { MPIABI_COMBINER_NAMED }
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_RESIZED_fn() -> c_int {
+    unsafe { MPIABI_COMBINER_RESIZED }
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_STRUCT_fn() -> c_int {
+    unsafe { MPIABI_COMBINER_STRUCT }
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_SUBARRAY_fn() -> c_int {
+    unsafe { MPIABI_COMBINER_SUBARRAY }
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_VECTOR_fn() -> c_int {
+    unsafe { MPIABI_COMBINER_VECTOR }
+}
+
+#[inline]
+pub fn RSMPI_COMM_TYPE_SHARED_fn() -> c_int {
+    unsafe { MPIABI_COMM_TYPE_SHARED }
+}
+
+#[inline]
+pub fn RSMPI_DISTRIBUTE_BLOCK_fn() -> c_int {
+    unsafe { MPIABI_DISTRIBUTE_BLOCK }
+}
+
+#[inline]
+pub fn RSMPI_DISTRIBUTE_CYCLIC_fn() -> c_int {
+    unsafe { MPIABI_DISTRIBUTE_CYCLIC }
+}
+
+#[inline]
+pub fn RSMPI_DISTRIBUTE_DFLT_DARG_fn() -> c_int {
+    unsafe { MPIABI_DISTRIBUTE_DFLT_DARG }
+}
+
+#[inline]
+pub fn RSMPI_DISTRIBUTE_NONE_fn() -> c_int {
+    unsafe { MPIABI_DISTRIBUTE_NONE }
+}
+
+#[inline]
+pub fn RSMPI_ERR_ACCESS_fn() -> c_int {
+    unsafe { MPIABI_ERR_ACCESS }
+}
+
+#[inline]
+pub fn RSMPI_ERR_AMODE_fn() -> c_int {
+    unsafe { MPIABI_ERR_AMODE }
+}
+
+#[inline]
+pub fn RSMPI_ERR_ARG_fn() -> c_int {
+    unsafe { MPIABI_ERR_ARG }
+}
+
+#[inline]
+pub fn RSMPI_ERR_ASSERT_fn() -> c_int {
+    unsafe { MPIABI_ERR_ASSERT }
+}
+
+#[inline]
+pub fn RSMPI_ERR_BAD_FILE_fn() -> c_int {
+    unsafe { MPIABI_ERR_BAD_FILE }
+}
+
+#[inline]
+pub fn RSMPI_ERR_BASE_fn() -> c_int {
+    unsafe { MPIABI_ERR_BASE }
+}
+
+#[inline]
+pub fn RSMPI_ERR_BUFFER_fn() -> c_int {
+    unsafe { MPIABI_ERR_BUFFER }
+}
+
+#[inline]
+pub fn RSMPI_ERR_COMM_fn() -> c_int {
+    unsafe { MPIABI_ERR_COMM }
+}
+
+#[inline]
+pub fn RSMPI_ERR_CONVERSION_fn() -> c_int {
+    unsafe { MPIABI_ERR_CONVERSION }
+}
+
+#[inline]
+pub fn RSMPI_ERR_COUNT_fn() -> c_int {
+    unsafe { MPIABI_ERR_COUNT }
+}
+
+#[inline]
+pub fn RSMPI_ERR_DIMS_fn() -> c_int {
+    unsafe { MPIABI_ERR_DIMS }
+}
+
+#[inline]
+pub fn RSMPI_ERR_DISP_fn() -> c_int {
+    unsafe { MPIABI_ERR_DISP }
+}
+
+#[inline]
+pub fn RSMPI_ERR_DUP_DATAREP_fn() -> c_int {
+    unsafe { MPIABI_ERR_DUP_DATAREP }
+}
+
+#[inline]
+pub fn RSMPI_ERR_FILE_fn() -> c_int {
+    unsafe { MPIABI_ERR_FILE }
+}
+
+#[inline]
+pub fn RSMPI_ERR_FILE_EXISTS_fn() -> c_int {
+    unsafe { MPIABI_ERR_FILE_EXISTS }
+}
+
+#[inline]
+pub fn RSMPI_ERR_FILE_IN_USE_fn() -> c_int {
+    unsafe { MPIABI_ERR_FILE_IN_USE }
+}
+
+#[inline]
+pub fn RSMPI_ERR_GROUP_fn() -> c_int {
+    unsafe { MPIABI_ERR_GROUP }
+}
+
+#[inline]
+pub fn RSMPI_ERR_INFO_fn() -> c_int {
+    unsafe { MPIABI_ERR_INFO }
+}
+
+#[inline]
+pub fn RSMPI_ERR_INFO_KEY_fn() -> c_int {
+    unsafe { MPIABI_ERR_INFO_KEY }
+}
+
+#[inline]
+pub fn RSMPI_ERR_INFO_NOKEY_fn() -> c_int {
+    unsafe { MPIABI_ERR_INFO_NOKEY }
+}
+
+#[inline]
+pub fn RSMPI_ERR_INFO_VALUE_fn() -> c_int {
+    unsafe { MPIABI_ERR_INFO_VALUE }
+}
+
+#[inline]
+pub fn RSMPI_ERR_INTERN_fn() -> c_int {
+    unsafe { MPIABI_ERR_INTERN }
+}
+
+#[inline]
+pub fn RSMPI_ERR_IN_STATUS_fn() -> c_int {
+    unsafe { MPIABI_ERR_IN_STATUS }
+}
+
+#[inline]
+pub fn RSMPI_ERR_IO_fn() -> c_int {
+    unsafe { MPIABI_ERR_IO }
+}
+
+#[inline]
+pub fn RSMPI_ERR_KEYVAL_fn() -> c_int {
+    unsafe { MPIABI_ERR_KEYVAL }
+}
+
+#[inline]
+pub fn RSMPI_ERR_LASTCODE_fn() -> c_int {
+    unsafe { MPIABI_ERR_LASTCODE }
+}
+
+#[inline]
+pub fn RSMPI_ERR_LOCKTYPE_fn() -> c_int {
+    unsafe { MPIABI_ERR_LOCKTYPE }
+}
+
+#[inline]
+pub fn RSMPI_ERR_NAME_fn() -> c_int {
+    unsafe { MPIABI_ERR_NAME }
+}
+
+#[inline]
+pub fn RSMPI_ERR_NOT_SAME_fn() -> c_int {
+    unsafe { MPIABI_ERR_NOT_SAME }
+}
+
+#[inline]
+pub fn RSMPI_ERR_NO_MEM_fn() -> c_int {
+    unsafe { MPIABI_ERR_NO_MEM }
+}
+
+#[inline]
+pub fn RSMPI_ERR_NO_SPACE_fn() -> c_int {
+    unsafe { MPIABI_ERR_NO_SPACE }
+}
+
+#[inline]
+pub fn RSMPI_ERR_NO_SUCH_FILE_fn() -> c_int {
+    unsafe { MPIABI_ERR_NO_SUCH_FILE }
+}
+
+#[inline]
+pub fn RSMPI_ERR_OP_fn() -> c_int {
+    unsafe { MPIABI_ERR_OP }
+}
+
+#[inline]
+pub fn RSMPI_ERR_OTHER_fn() -> c_int {
+    unsafe { MPIABI_ERR_OTHER }
+}
+
+#[inline]
+pub fn RSMPI_ERR_PENDING_fn() -> c_int {
+    unsafe { MPIABI_ERR_PENDING }
+}
+
+#[inline]
+pub fn RSMPI_ERR_PORT_fn() -> c_int {
+    unsafe { MPIABI_ERR_PORT }
+}
+
+#[inline]
+pub fn RSMPI_ERR_QUOTA_fn() -> c_int {
+    unsafe { MPIABI_ERR_QUOTA }
+}
+
+#[inline]
+pub fn RSMPI_ERR_RANK_fn() -> c_int {
+    unsafe { MPIABI_ERR_RANK }
+}
+
+#[inline]
+pub fn RSMPI_ERR_READ_ONLY_fn() -> c_int {
+    unsafe { MPIABI_ERR_READ_ONLY }
+}
+
+#[inline]
+pub fn RSMPI_ERR_REQUEST_fn() -> c_int {
+    unsafe { MPIABI_ERR_REQUEST }
+}
+
+#[inline]
+pub fn RSMPI_ERR_RMA_ATTACH_fn() -> c_int {
+    unsafe { MPIABI_ERR_RMA_ATTACH }
+}
+
+#[inline]
+pub fn RSMPI_ERR_RMA_CONFLICT_fn() -> c_int {
+    unsafe { MPIABI_ERR_RMA_CONFLICT }
+}
+
+#[inline]
+pub fn RSMPI_ERR_RMA_FLAVOR_fn() -> c_int {
+    unsafe { MPIABI_ERR_RMA_FLAVOR }
+}
+
+#[inline]
+pub fn RSMPI_ERR_RMA_RANGE_fn() -> c_int {
+    unsafe { MPIABI_ERR_RMA_RANGE }
+}
+
+#[inline]
+pub fn RSMPI_ERR_RMA_SHARED_fn() -> c_int {
+    unsafe { MPIABI_ERR_RMA_SHARED }
+}
+
+#[inline]
+pub fn RSMPI_ERR_RMA_SYNC_fn() -> c_int {
+    unsafe { MPIABI_ERR_RMA_SYNC }
+}
+
+#[inline]
+pub fn RSMPI_ERR_ROOT_fn() -> c_int {
+    unsafe { MPIABI_ERR_ROOT }
+}
+
+#[inline]
+pub fn RSMPI_ERR_SERVICE_fn() -> c_int {
+    unsafe { MPIABI_ERR_SERVICE }
+}
+
+#[inline]
+pub fn RSMPI_ERR_SIZE_fn() -> c_int {
+    unsafe { MPIABI_ERR_SIZE }
+}
+
+#[inline]
+pub fn RSMPI_ERR_SPAWN_fn() -> c_int {
+    unsafe { MPIABI_ERR_SPAWN }
+}
+
+#[inline]
+pub fn RSMPI_ERR_TAG_fn() -> c_int {
+    unsafe { MPIABI_ERR_TAG }
+}
+
+#[inline]
+pub fn RSMPI_ERR_TOPOLOGY_fn() -> c_int {
+    unsafe { MPIABI_ERR_TOPOLOGY }
+}
+
+#[inline]
+pub fn RSMPI_ERR_TRUNCATE_fn() -> c_int {
+    unsafe { MPIABI_ERR_TRUNCATE }
+}
+
+#[inline]
+pub fn RSMPI_ERR_TYPE_fn() -> c_int {
+    unsafe { MPIABI_ERR_TYPE }
+}
+
+#[inline]
+pub fn RSMPI_ERR_UNKNOWN_fn() -> c_int {
+    unsafe { MPIABI_ERR_UNKNOWN }
+}
+
+#[inline]
+pub fn RSMPI_ERR_UNSUPPORTED_DATAREP_fn() -> c_int {
+    unsafe { MPIABI_ERR_UNSUPPORTED_DATAREP }
+}
+
+#[inline]
+pub fn RSMPI_ERR_UNSUPPORTED_OPERATION_fn() -> c_int {
+    unsafe { MPIABI_ERR_UNSUPPORTED_OPERATION }
+}
+
+#[inline]
+pub fn RSMPI_ERR_WIN_fn() -> c_int {
+    unsafe { MPIABI_ERR_WIN }
+}
+
+#[inline]
+pub fn RSMPI_LOCK_EXCLUSIVE_fn() -> c_int {
+    unsafe { MPIABI_LOCK_EXCLUSIVE }
+}
+
+#[inline]
+pub fn RSMPI_LOCK_SHARED_fn() -> c_int {
+    unsafe { MPIABI_LOCK_SHARED }
+}
+
+#[inline]
+pub fn RSMPI_MODE_APPEND_fn() -> c_int {
+    unsafe { MPIABI_MODE_APPEND }
+}
+
+#[inline]
+pub fn RSMPI_MODE_CREATE_fn() -> c_int {
+    unsafe { MPIABI_MODE_CREATE }
+}
+
+#[inline]
+pub fn RSMPI_MODE_DELETE_ON_CLOSE_fn() -> c_int {
+    unsafe { MPIABI_MODE_DELETE_ON_CLOSE }
+}
+
+#[inline]
+pub fn RSMPI_MODE_EXCL_fn() -> c_int {
+    unsafe { MPIABI_MODE_EXCL }
+}
+
+#[inline]
+pub fn RSMPI_MODE_NOCHECK_fn() -> c_int {
+    unsafe { MPIABI_MODE_NOCHECK }
+}
+
+#[inline]
+pub fn RSMPI_MODE_NOPRECEDE_fn() -> c_int {
+    unsafe { MPIABI_MODE_NOPRECEDE }
+}
+
+#[inline]
+pub fn RSMPI_MODE_NOPUT_fn() -> c_int {
+    unsafe { MPIABI_MODE_NOPUT }
+}
+
+#[inline]
+pub fn RSMPI_MODE_NOSTORE_fn() -> c_int {
+    unsafe { MPIABI_MODE_NOSTORE }
+}
+
+#[inline]
+pub fn RSMPI_MODE_NOSUCCEED_fn() -> c_int {
+    unsafe { MPIABI_MODE_NOSUCCEED }
+}
+
+#[inline]
+pub fn RSMPI_MODE_RDONLY_fn() -> c_int {
+    unsafe { MPIABI_MODE_RDONLY }
+}
+
+#[inline]
+pub fn RSMPI_MODE_RDWR_fn() -> c_int {
+    unsafe { MPIABI_MODE_RDWR }
+}
+
+#[inline]
+pub fn RSMPI_MODE_SEQUENTIAL_fn() -> c_int {
+    unsafe { MPIABI_MODE_SEQUENTIAL }
+}
+
+#[inline]
+pub fn RSMPI_MODE_UNIQUE_OPEN_fn() -> c_int {
+    unsafe { MPIABI_MODE_UNIQUE_OPEN }
+}
+
+#[inline]
+pub fn RSMPI_MODE_WRONLY_fn() -> c_int {
+    unsafe { MPIABI_MODE_WRONLY }
+}
+
+#[inline]
+pub fn RSMPI_ORDER_C_fn() -> c_int {
+    unsafe { MPIABI_ORDER_C }
+}
+
+#[inline]
+pub fn RSMPI_ORDER_FORTRAN_fn() -> c_int {
+    unsafe { MPIABI_ORDER_FORTRAN }
+}
+
+#[inline]
+pub fn RSMPI_SEEK_CUR_fn() -> c_int {
+    unsafe { MPIABI_SEEK_CUR }
+}
+
+#[inline]
+pub fn RSMPI_SEEK_END_fn() -> c_int {
+    unsafe { MPIABI_SEEK_END }
+}
+
+#[inline]
+pub fn RSMPI_SEEK_SET_fn() -> c_int {
+    unsafe { MPIABI_SEEK_SET }
+}
+
+#[inline]
+pub fn RSMPI_THREAD_FUNNELED_fn() -> c_int {
+    unsafe { MPIABI_THREAD_FUNNELED }
+}
+
+#[inline]
+pub fn RSMPI_THREAD_MULTIPLE_fn() -> c_int {
+    unsafe { MPIABI_THREAD_MULTIPLE }
+}
+
+#[inline]
+pub fn RSMPI_THREAD_SERIALIZED_fn() -> c_int {
+    unsafe { MPIABI_THREAD_SERIALIZED }
+}
+
+#[inline]
+pub fn RSMPI_TYPECLASS_COMPLEX_fn() -> c_int {
+    unsafe { MPIABI_TYPECLASS_COMPLEX }
+}
+
+#[inline]
+pub fn RSMPI_TYPECLASS_INTEGER_fn() -> c_int {
+    unsafe { MPIABI_TYPECLASS_INTEGER }
+}
+
+#[inline]
+pub fn RSMPI_TYPECLASS_REAL_fn() -> c_int {
+    unsafe { MPIABI_TYPECLASS_REAL }
+}
+
+#[inline]
+pub fn RSMPI_WIN_FLAVOR_ALLOCATE_fn() -> c_int {
+    unsafe { MPIABI_WIN_FLAVOR_ALLOCATE }
+}
+
+#[inline]
+pub fn RSMPI_WIN_FLAVOR_CREATE_fn() -> c_int {
+    unsafe { MPIABI_WIN_FLAVOR_CREATE }
+}
+
+#[inline]
+pub fn RSMPI_WIN_FLAVOR_DYNAMIC_fn() -> c_int {
+    unsafe { MPIABI_WIN_FLAVOR_DYNAMIC }
+}
+
+#[inline]
+pub fn RSMPI_WIN_FLAVOR_SHARED_fn() -> c_int {
+    unsafe { MPIABI_WIN_FLAVOR_SHARED }
+}
+
+#[inline]
+pub fn RSMPI_WIN_SEPARATE_fn() -> c_int {
+    unsafe { MPIABI_WIN_SEPARATE }
+}
+
+#[inline]
+pub fn RSMPI_WIN_UNIFIED_fn() -> c_int {
+    unsafe { MPIABI_WIN_UNIFIED }
+}
+
+#[inline]
+pub fn RSMPI_ARGV_NULL_fn() -> *mut *mut c_char {
+    unsafe { MPIABI_ARGV_NULL }
+}
+
+#[inline]
+pub fn RSMPI_ARGVS_NULL_fn() -> *mut *mut *mut c_char {
+    unsafe { MPIABI_ARGVS_NULL }
+}
+
+#[inline]
+pub fn RSMPI_ERRCODES_IGNORE_fn() -> *mut c_int {
+    unsafe { MPIABI_ERRCODES_IGNORE }
+}
+
+#[inline]
+pub fn RSMPI_UNWEIGHTED_fn() -> *mut c_int {
+    unsafe { MPIABI_UNWEIGHTED }
+}
+
+#[inline]
+pub fn RSMPI_WEIGHTS_EMPTY_fn() -> *mut c_int {
+    unsafe { MPIABI_WEIGHTS_EMPTY }
+}
+
+#[inline]
+pub fn RSMPI_BOTTOM_fn() -> *mut c_void {
+    unsafe { MPIABI_BOTTOM }
+}
+
+#[inline]
+pub fn RSMPI_IN_PLACE_fn() -> *mut c_void {
+    unsafe { MPIABI_IN_PLACE }
+}
+
+#[inline]
+pub fn RSMPI_COMM_NULL_fn() -> MPI_Comm {
+    unsafe { MPIABI_COMM_NULL }
+}
+
+#[inline]
+pub fn RSMPI_COMM_SELF_fn() -> MPI_Comm {
+    unsafe { MPIABI_COMM_SELF }
+}
+
+#[inline]
+pub fn RSMPI_COMM_WORLD_fn() -> MPI_Comm {
+    unsafe { MPIABI_COMM_WORLD }
+}
+
+#[inline]
+pub fn RSMPI_COMM_DUP_FN_fn() -> MPI_Comm_copy_attr_function {
+    unsafe { MPIABI_COMM_DUP_FN }
+}
+
+#[inline]
+pub fn RSMPI_COMM_NULL_COPY_FN_fn() -> MPI_Comm_copy_attr_function {
+    unsafe { MPIABI_COMM_NULL_COPY_FN }
+}
+
+#[inline]
+pub fn RSMPI_COMM_NULL_DELETE_FN_fn() -> MPI_Comm_delete_attr_function {
+    unsafe { MPIABI_COMM_NULL_DELETE_FN }
+}
+
+#[inline]
+pub fn RSMPI_DUP_FN_fn() -> MPI_Copy_function {
+    unsafe { MPIABI_DUP_FN }
+}
+
+#[inline]
+pub fn RSMPI_NULL_COPY_FN_fn() -> MPI_Copy_function {
+    unsafe { MPIABI_NULL_COPY_FN }
+}
+
+#[inline]
+pub fn RSMPI_CONVERSION_FN_NULL_fn() -> MPI_Datarep_conversion_function {
+    unsafe { MPIABI_CONVERSION_FN_NULL }
+}
+
+#[inline]
+pub fn RSMPI_2DOUBLE_PRECISION_fn() -> MPI_Datatype {
+    unsafe { MPIABI_2DOUBLE_PRECISION }
+}
+
+#[inline]
+pub fn RSMPI_2INT_fn() -> MPI_Datatype {
+    unsafe { MPIABI_2INT }
+}
+
+#[inline]
+pub fn RSMPI_2INTEGER_fn() -> MPI_Datatype {
+    unsafe { MPIABI_2INTEGER }
+}
+
+#[inline]
+pub fn RSMPI_2REAL_fn() -> MPI_Datatype {
+    unsafe { MPIABI_2REAL }
+}
+
+#[inline]
+pub fn RSMPI_AINT_fn() -> MPI_Datatype {
+    unsafe { MPIABI_AINT }
+}
+
+#[inline]
+pub fn RSMPI_BYTE_fn() -> MPI_Datatype {
+    unsafe { MPIABI_BYTE }
+}
+
+#[inline]
+pub fn RSMPI_CHAR_fn() -> MPI_Datatype {
+    unsafe { MPIABI_CHAR }
+}
+
+#[inline]
+pub fn RSMPI_CHARACTER_fn() -> MPI_Datatype {
+    unsafe { MPIABI_CHARACTER }
+}
+
+#[inline]
+pub fn RSMPI_COMPLEX_fn() -> MPI_Datatype {
+    unsafe { MPIABI_COMPLEX }
+}
+
+#[inline]
+pub fn RSMPI_COMPLEX16_fn() -> MPI_Datatype {
+    unsafe { MPIABI_COMPLEX16 }
+}
+
+#[inline]
+pub fn RSMPI_COMPLEX32_fn() -> MPI_Datatype {
+    unsafe { MPIABI_COMPLEX32 }
+}
+
+#[inline]
+pub fn RSMPI_COMPLEX8_fn() -> MPI_Datatype {
+    unsafe { MPIABI_COMPLEX8 }
+}
+
+#[inline]
+pub fn RSMPI_COUNT_fn() -> MPI_Datatype {
+    unsafe { MPIABI_COUNT }
+}
+
+#[inline]
+pub fn RSMPI_CXX_BOOL_fn() -> MPI_Datatype {
+    unsafe { MPIABI_CXX_BOOL }
+}
+
+#[inline]
+pub fn RSMPI_CXX_DOUBLE_COMPLEX_fn() -> MPI_Datatype {
+    unsafe { MPIABI_CXX_DOUBLE_COMPLEX }
+}
+
+#[inline]
+pub fn RSMPI_CXX_FLOAT_COMPLEX_fn() -> MPI_Datatype {
+    unsafe { MPIABI_CXX_FLOAT_COMPLEX }
+}
+
+#[inline]
+pub fn RSMPI_CXX_LONG_DOUBLE_COMPLEX_fn() -> MPI_Datatype {
+    unsafe { MPIABI_CXX_LONG_DOUBLE_COMPLEX }
+}
+
+#[inline]
+pub fn RSMPI_C_BOOL_fn() -> MPI_Datatype {
+    unsafe { MPIABI_C_BOOL }
+}
+
+#[inline]
+pub fn RSMPI_C_COMPLEX_fn() -> MPI_Datatype {
+    unsafe { MPIABI_C_COMPLEX }
+}
+
+#[inline]
+pub fn RSMPI_C_DOUBLE_COMPLEX_fn() -> MPI_Datatype {
+    unsafe { MPIABI_C_DOUBLE_COMPLEX }
+}
+
+#[inline]
+pub fn RSMPI_C_FLOAT_COMPLEX_fn() -> MPI_Datatype {
+    unsafe { MPIABI_C_FLOAT_COMPLEX }
+}
+
+#[inline]
+pub fn RSMPI_C_LONG_DOUBLE_COMPLEX_fn() -> MPI_Datatype {
+    unsafe { MPIABI_C_LONG_DOUBLE_COMPLEX }
+}
+
+#[inline]
+pub fn RSMPI_DATATYPE_NULL_fn() -> MPI_Datatype {
+    unsafe { MPIABI_DATATYPE_NULL }
+}
+
+#[inline]
+pub fn RSMPI_DOUBLE_fn() -> MPI_Datatype {
+    unsafe { MPIABI_DOUBLE }
+}
+
+#[inline]
+pub fn RSMPI_DOUBLE_COMPLEX_fn() -> MPI_Datatype {
+    unsafe { MPIABI_DOUBLE_COMPLEX }
+}
+
+#[inline]
+pub fn RSMPI_DOUBLE_INT_fn() -> MPI_Datatype {
+    unsafe { MPIABI_DOUBLE_INT }
+}
+
+#[inline]
+pub fn RSMPI_DOUBLE_PRECISION_fn() -> MPI_Datatype {
+    unsafe { MPIABI_DOUBLE_PRECISION }
+}
+
+#[inline]
+pub fn RSMPI_FLOAT_fn() -> MPI_Datatype {
+    unsafe { MPIABI_FLOAT }
+}
+
+#[inline]
+pub fn RSMPI_FLOAT_INT_fn() -> MPI_Datatype {
+    unsafe { MPIABI_FLOAT_INT }
+}
+
+#[inline]
+pub fn RSMPI_INT_fn() -> MPI_Datatype {
+    unsafe { MPIABI_INT }
+}
+
+#[inline]
+pub fn RSMPI_INT16_T_fn() -> MPI_Datatype {
+    unsafe { MPIABI_INT16_T }
+}
+
+#[inline]
+pub fn RSMPI_INT32_T_fn() -> MPI_Datatype {
+    unsafe { MPIABI_INT32_T }
+}
+
+#[inline]
+pub fn RSMPI_INT64_T_fn() -> MPI_Datatype {
+    unsafe { MPIABI_INT64_T }
+}
+
+#[inline]
+pub fn RSMPI_INT8_T_fn() -> MPI_Datatype {
+    unsafe { MPIABI_INT8_T }
+}
+
+#[inline]
+pub fn RSMPI_INTEGER_fn() -> MPI_Datatype {
+    unsafe { MPIABI_INTEGER }
+}
+
+#[inline]
+pub fn RSMPI_INTEGER1_fn() -> MPI_Datatype {
+    unsafe { MPIABI_INTEGER1 }
+}
+
+#[inline]
+pub fn RSMPI_INTEGER2_fn() -> MPI_Datatype {
+    unsafe { MPIABI_INTEGER2 }
+}
+
+#[inline]
+pub fn RSMPI_INTEGER4_fn() -> MPI_Datatype {
+    unsafe { MPIABI_INTEGER4 }
+}
+
+#[inline]
+pub fn RSMPI_INTEGER8_fn() -> MPI_Datatype {
+    unsafe { MPIABI_INTEGER8 }
+}
+
+#[inline]
+pub fn RSMPI_LOGICAL_fn() -> MPI_Datatype {
+    unsafe { MPIABI_LOGICAL }
+}
+
+#[inline]
+pub fn RSMPI_LONG_fn() -> MPI_Datatype {
+    unsafe { MPIABI_LONG }
+}
+
+#[inline]
+pub fn RSMPI_LONG_DOUBLE_fn() -> MPI_Datatype {
+    unsafe { MPIABI_LONG_DOUBLE }
+}
+
+#[inline]
+pub fn RSMPI_LONG_DOUBLE_INT_fn() -> MPI_Datatype {
+    unsafe { MPIABI_LONG_DOUBLE_INT }
+}
+
+#[inline]
+pub fn RSMPI_LONG_INT_fn() -> MPI_Datatype {
+    unsafe { MPIABI_LONG_INT }
+}
+
+#[inline]
+pub fn RSMPI_LONG_LONG_fn() -> MPI_Datatype {
+    unsafe { MPIABI_LONG_LONG }
+}
+
+#[inline]
+pub fn RSMPI_LONG_LONG_INT_fn() -> MPI_Datatype {
+    unsafe { MPIABI_LONG_LONG_INT }
+}
+
+#[inline]
+pub fn RSMPI_OFFSET_fn() -> MPI_Datatype {
+    unsafe { MPIABI_OFFSET }
+}
+
+#[inline]
+pub fn RSMPI_PACKED_fn() -> MPI_Datatype {
+    unsafe { MPIABI_PACKED }
+}
+
+#[inline]
+pub fn RSMPI_REAL_fn() -> MPI_Datatype {
+    unsafe { MPIABI_REAL }
+}
+
+#[inline]
+pub fn RSMPI_REAL16_fn() -> MPI_Datatype {
+    unsafe { MPIABI_REAL16 }
+}
+
+#[inline]
+pub fn RSMPI_REAL4_fn() -> MPI_Datatype {
+    unsafe { MPIABI_REAL4 }
+}
+
+#[inline]
+pub fn RSMPI_REAL8_fn() -> MPI_Datatype {
+    unsafe { MPIABI_REAL8 }
+}
+
+#[inline]
+pub fn RSMPI_SHORT_fn() -> MPI_Datatype {
+    unsafe { MPIABI_SHORT }
+}
+
+#[inline]
+pub fn RSMPI_SHORT_INT_fn() -> MPI_Datatype {
+    unsafe { MPIABI_SHORT_INT }
+}
+
+#[inline]
+pub fn RSMPI_SIGNED_CHAR_fn() -> MPI_Datatype {
+    unsafe { MPIABI_SIGNED_CHAR }
+}
+
+#[inline]
+pub fn RSMPI_UINT16_T_fn() -> MPI_Datatype {
+    unsafe { MPIABI_UINT16_T }
+}
+
+#[inline]
+pub fn RSMPI_UINT32_T_fn() -> MPI_Datatype {
+    unsafe { MPIABI_UINT32_T }
+}
+
+#[inline]
+pub fn RSMPI_UINT64_T_fn() -> MPI_Datatype {
+    unsafe { MPIABI_UINT64_T }
+}
+
+#[inline]
+pub fn RSMPI_UINT8_T_fn() -> MPI_Datatype {
+    unsafe { MPIABI_UINT8_T }
+}
+
+#[inline]
+pub fn RSMPI_UNSIGNED_fn() -> MPI_Datatype {
+    unsafe { MPIABI_UNSIGNED }
+}
+
+#[inline]
+pub fn RSMPI_UNSIGNED_CHAR_fn() -> MPI_Datatype {
+    unsafe { MPIABI_UNSIGNED_CHAR }
+}
+
+#[inline]
+pub fn RSMPI_UNSIGNED_LONG_fn() -> MPI_Datatype {
+    unsafe { MPIABI_UNSIGNED_LONG }
+}
+
+#[inline]
+pub fn RSMPI_UNSIGNED_LONG_LONG_fn() -> MPI_Datatype {
+    unsafe { MPIABI_UNSIGNED_LONG_LONG }
+}
+
+#[inline]
+pub fn RSMPI_UNSIGNED_SHORT_fn() -> MPI_Datatype {
+    unsafe { MPIABI_UNSIGNED_SHORT }
+}
+
+#[inline]
+pub fn RSMPI_WCHAR_fn() -> MPI_Datatype {
+    unsafe { MPIABI_WCHAR }
+}
+
+#[inline]
+pub fn RSMPI_NULL_DELETE_FN_fn() -> MPI_Delete_function {
+    unsafe { MPIABI_NULL_DELETE_FN }
+}
+
+#[inline]
+pub fn RSMPI_ERRHANDLER_NULL_fn() -> MPI_Errhandler {
+    unsafe { MPIABI_ERRHANDLER_NULL }
+}
+
+#[inline]
+pub fn RSMPI_ERRORS_ARE_FATAL_fn() -> MPI_Errhandler {
+    unsafe { MPIABI_ERRORS_ARE_FATAL }
+}
+
+#[inline]
+pub fn RSMPI_ERRORS_RETURN_fn() -> MPI_Errhandler {
+    unsafe { MPIABI_ERRORS_RETURN }
+}
+
+#[inline]
+pub fn RSMPI_FILE_NULL_fn() -> MPI_File {
+    unsafe { MPIABI_FILE_NULL }
+}
+
+#[inline]
+pub fn RSMPI_F_STATUS_IGNORE_fn() -> *mut MPI_Fint {
+    unsafe { MPIABI_F_STATUS_IGNORE }
+}
+
+#[inline]
+pub fn RSMPI_F_STATUSES_IGNORE_fn() -> *mut MPI_Fint {
+    unsafe { MPIABI_F_STATUSES_IGNORE }
+}
+
+#[inline]
+pub fn RSMPI_GROUP_EMPTY_fn() -> MPI_Group {
+    unsafe { MPIABI_GROUP_EMPTY }
+}
+
+#[inline]
+pub fn RSMPI_GROUP_NULL_fn() -> MPI_Group {
+    unsafe { MPIABI_GROUP_NULL }
+}
+
+#[inline]
+pub fn RSMPI_INFO_ENV_fn() -> MPI_Info {
+    unsafe { MPIABI_INFO_ENV }
+}
+
+#[inline]
+pub fn RSMPI_INFO_NULL_fn() -> MPI_Info {
+    unsafe { MPIABI_INFO_NULL }
+}
+
+#[inline]
+pub fn RSMPI_MESSAGE_NO_PROC_fn() -> MPI_Message {
+    unsafe { MPIABI_MESSAGE_NO_PROC }
+}
+
+#[inline]
+pub fn RSMPI_MESSAGE_NULL_fn() -> MPI_Message {
+    unsafe { MPIABI_MESSAGE_NULL }
+}
+
+#[inline]
+pub fn RSMPI_DISPLACEMENT_CURRENT_fn() -> MPI_Offset {
+    unsafe { MPIABI_DISPLACEMENT_CURRENT }
+}
+
+#[inline]
+pub fn RSMPI_BAND_fn() -> MPI_Op {
+    unsafe { MPIABI_BAND }
+}
+
+#[inline]
+pub fn RSMPI_BOR_fn() -> MPI_Op {
+    unsafe { MPIABI_BOR }
+}
+
+#[inline]
+pub fn RSMPI_BXOR_fn() -> MPI_Op {
+    unsafe { MPIABI_BXOR }
+}
+
+#[inline]
+pub fn RSMPI_LAND_fn() -> MPI_Op {
+    unsafe { MPIABI_LAND }
+}
+
+#[inline]
+pub fn RSMPI_LOR_fn() -> MPI_Op {
+    unsafe { MPIABI_LOR }
+}
+
+#[inline]
+pub fn RSMPI_LXOR_fn() -> MPI_Op {
+    unsafe { MPIABI_LXOR }
+}
+
+#[inline]
+pub fn RSMPI_MAX_fn() -> MPI_Op {
+    unsafe { MPIABI_MAX }
+}
+
+#[inline]
+pub fn RSMPI_MAXLOC_fn() -> MPI_Op {
+    unsafe { MPIABI_MAXLOC }
+}
+
+#[inline]
+pub fn RSMPI_MIN_fn() -> MPI_Op {
+    unsafe { MPIABI_MIN }
+}
+
+#[inline]
+pub fn RSMPI_MINLOC_fn() -> MPI_Op {
+    unsafe { MPIABI_MINLOC }
+}
+
+#[inline]
+pub fn RSMPI_NO_OP_fn() -> MPI_Op {
+    unsafe { MPIABI_NO_OP }
+}
+
+#[inline]
+pub fn RSMPI_OP_NULL_fn() -> MPI_Op {
+    unsafe { MPIABI_OP_NULL }
+}
+
+#[inline]
+pub fn RSMPI_PROD_fn() -> MPI_Op {
+    unsafe { MPIABI_PROD }
+}
+
+#[inline]
+pub fn RSMPI_REPLACE_fn() -> MPI_Op {
+    unsafe { MPIABI_REPLACE }
+}
+
+#[inline]
+pub fn RSMPI_SUM_fn() -> MPI_Op {
+    unsafe { MPIABI_SUM }
+}
+
+#[inline]
+pub fn RSMPI_REQUEST_NULL_fn() -> MPI_Request {
+    unsafe { MPIABI_REQUEST_NULL }
+}
+
+#[inline]
+pub fn RSMPI_STATUS_IGNORE_fn() -> *mut MPI_Status {
+    unsafe { MPIABI_STATUS_IGNORE }
+}
+
+#[inline]
+pub fn RSMPI_STATUSES_IGNORE_fn() -> *mut MPI_Status {
+    unsafe { MPIABI_STATUSES_IGNORE }
+}
+
+#[inline]
+pub fn RSMPI_TYPE_DUP_FN_fn() -> MPI_Type_copy_attr_function {
+    unsafe { MPIABI_TYPE_DUP_FN }
+}
+
+#[inline]
+pub fn RSMPI_TYPE_NULL_COPY_FN_fn() -> MPI_Type_copy_attr_function {
+    unsafe { MPIABI_TYPE_NULL_COPY_FN }
+}
+
+#[inline]
+pub fn RSMPI_TYPE_NULL_DELETE_FN_fn() -> MPI_Type_delete_attr_function {
+    unsafe { MPIABI_TYPE_NULL_DELETE_FN }
+}
+
+#[inline]
+pub fn RSMPI_WIN_NULL_fn() -> MPI_Win {
+    unsafe { MPIABI_WIN_NULL }
+}
+
+#[inline]
+pub fn RSMPI_WIN_DUP_FN_fn() -> MPI_Win_copy_attr_function {
+    unsafe { MPIABI_WIN_DUP_FN }
+}
+
+#[inline]
+pub fn RSMPI_WIN_NULL_COPY_FN_fn() -> MPI_Win_copy_attr_function {
+    unsafe { MPIABI_WIN_NULL_COPY_FN }
+}
+
+#[inline]
+pub fn RSMPI_WIN_NULL_DELETE_FN_fn() -> MPI_Win_delete_attr_function {
+    unsafe { MPIABI_WIN_NULL_DELETE_FN }
+}
+
+#[inline]
+pub fn RSMPI_ANY_SOURCE() -> c_int {
+    RSMPI_ANY_SOURCE_fn()
+}
+
+#[inline]
+pub fn RSMPI_ANY_TAG() -> c_int {
+    RSMPI_ANY_TAG_fn()
+}
+
+#[inline]
+pub fn RSMPI_PROC_NULL() -> c_int {
+    RSMPI_PROC_NULL_fn()
+}
+
+#[inline]
+pub fn RSMPI_ROOT() -> c_int {
+    RSMPI_ROOT_fn()
+}
+
+#[inline]
+pub fn RSMPI_CART() -> c_int {
+    RSMPI_CART_fn()
+}
+
+#[inline]
+pub fn RSMPI_DIST_GRAPH() -> c_int {
+    RSMPI_DIST_GRAPH_fn()
+}
+
+#[inline]
+pub fn RSMPI_GRAPH() -> c_int {
+    RSMPI_GRAPH_fn()
+}
+
+#[inline]
+pub fn RSMPI_CONGRUENT() -> c_int {
+    RSMPI_CONGRUENT_fn()
+}
+
+#[inline]
+pub fn RSMPI_IDENT() -> c_int {
+    RSMPI_IDENT_fn()
+}
+
+#[inline]
+pub fn RSMPI_SIMILAR() -> c_int {
+    RSMPI_SIMILAR_fn()
+}
+
+#[inline]
+pub fn RSMPI_UNEQUAL() -> c_int {
+    RSMPI_UNEQUAL_fn()
+}
+
+#[inline]
+pub fn RSMPI_BSEND_OVERHEAD() -> c_int {
+    RSMPI_BSEND_OVERHEAD_fn()
+}
+
+#[inline]
+pub fn RSMPI_KEYVAL_INVALID() -> c_int {
+    RSMPI_KEYVAL_INVALID_fn()
+}
+
+#[inline]
+pub fn RSMPI_APPNUM() -> c_int {
+    RSMPI_APPNUM_fn()
+}
+
+#[inline]
+pub fn RSMPI_HOST() -> c_int {
+    RSMPI_HOST_fn()
+}
+
+#[inline]
+pub fn RSMPI_IO() -> c_int {
+    RSMPI_IO_fn()
+}
+
+#[inline]
+pub fn RSMPI_LASTUSEDCODE() -> c_int {
+    RSMPI_LASTUSEDCODE_fn()
+}
+
+#[inline]
+pub fn RSMPI_TAG_UB() -> c_int {
+    RSMPI_TAG_UB_fn()
+}
+
+#[inline]
+pub fn RSMPI_UNIVERSE_SIZE() -> c_int {
+    RSMPI_UNIVERSE_SIZE_fn()
+}
+
+#[inline]
+pub fn RSMPI_WIN_BASE() -> c_int {
+    RSMPI_WIN_BASE_fn()
+}
+
+#[inline]
+pub fn RSMPI_WIN_CREATE_FLAVOR() -> c_int {
+    RSMPI_WIN_CREATE_FLAVOR_fn()
+}
+
+#[inline]
+pub fn RSMPI_WIN_DISP_UNIT() -> c_int {
+    RSMPI_WIN_DISP_UNIT_fn()
+}
+
+#[inline]
+pub fn RSMPI_WIN_MODEL() -> c_int {
+    RSMPI_WIN_MODEL_fn()
+}
+
+#[inline]
+pub fn RSMPI_WIN_SIZE() -> c_int {
+    RSMPI_WIN_SIZE_fn()
+}
+
+#[inline]
+pub fn RSMPI_WTIME_IS_GLOBAL() -> c_int {
+    RSMPI_WTIME_IS_GLOBAL_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_CONTIGUOUS() -> c_int {
+    RSMPI_COMBINER_CONTIGUOUS_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_DARRAY() -> c_int {
+    RSMPI_COMBINER_DARRAY_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_DUP() -> c_int {
+    RSMPI_COMBINER_DUP_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_F90_COMPLEX() -> c_int {
+    RSMPI_COMBINER_F90_COMPLEX_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_F90_INTEGER() -> c_int {
+    RSMPI_COMBINER_F90_INTEGER_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_F90_REAL() -> c_int {
+    RSMPI_COMBINER_F90_REAL_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_HINDEXED() -> c_int {
+    RSMPI_COMBINER_HINDEXED_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_HINDEXED_BLOCK() -> c_int {
+    RSMPI_COMBINER_HINDEXED_BLOCK_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_HVECTOR() -> c_int {
+    RSMPI_COMBINER_HVECTOR_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_INDEXED() -> c_int {
+    RSMPI_COMBINER_INDEXED_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_INDEXED_BLOCK() -> c_int {
+    RSMPI_COMBINER_INDEXED_BLOCK_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_NAMED() -> c_int {
+    RSMPI_COMBINER_NAMED_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_RESIZED() -> c_int {
+    RSMPI_COMBINER_RESIZED_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_STRUCT() -> c_int {
+    RSMPI_COMBINER_STRUCT_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_SUBARRAY() -> c_int {
+    RSMPI_COMBINER_SUBARRAY_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMBINER_VECTOR() -> c_int {
+    RSMPI_COMBINER_VECTOR_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMM_TYPE_SHARED() -> c_int {
+    RSMPI_COMM_TYPE_SHARED_fn()
+}
+
+#[inline]
+pub fn RSMPI_DISTRIBUTE_BLOCK() -> c_int {
+    RSMPI_DISTRIBUTE_BLOCK_fn()
+}
+
+#[inline]
+pub fn RSMPI_DISTRIBUTE_CYCLIC() -> c_int {
+    RSMPI_DISTRIBUTE_CYCLIC_fn()
+}
+
+#[inline]
+pub fn RSMPI_DISTRIBUTE_DFLT_DARG() -> c_int {
+    RSMPI_DISTRIBUTE_DFLT_DARG_fn()
+}
+
+#[inline]
+pub fn RSMPI_DISTRIBUTE_NONE() -> c_int {
+    RSMPI_DISTRIBUTE_NONE_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_ACCESS() -> c_int {
+    RSMPI_ERR_ACCESS_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_AMODE() -> c_int {
+    RSMPI_ERR_AMODE_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_ARG() -> c_int {
+    RSMPI_ERR_ARG_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_ASSERT() -> c_int {
+    RSMPI_ERR_ASSERT_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_BAD_FILE() -> c_int {
+    RSMPI_ERR_BAD_FILE_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_BASE() -> c_int {
+    RSMPI_ERR_BASE_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_BUFFER() -> c_int {
+    RSMPI_ERR_BUFFER_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_COMM() -> c_int {
+    RSMPI_ERR_COMM_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_CONVERSION() -> c_int {
+    RSMPI_ERR_CONVERSION_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_COUNT() -> c_int {
+    RSMPI_ERR_COUNT_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_DIMS() -> c_int {
+    RSMPI_ERR_DIMS_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_DISP() -> c_int {
+    RSMPI_ERR_DISP_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_DUP_DATAREP() -> c_int {
+    RSMPI_ERR_DUP_DATAREP_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_FILE() -> c_int {
+    RSMPI_ERR_FILE_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_FILE_EXISTS() -> c_int {
+    RSMPI_ERR_FILE_EXISTS_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_FILE_IN_USE() -> c_int {
+    RSMPI_ERR_FILE_IN_USE_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_GROUP() -> c_int {
+    RSMPI_ERR_GROUP_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_INFO() -> c_int {
+    RSMPI_ERR_INFO_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_INFO_KEY() -> c_int {
+    RSMPI_ERR_INFO_KEY_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_INFO_NOKEY() -> c_int {
+    RSMPI_ERR_INFO_NOKEY_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_INFO_VALUE() -> c_int {
+    RSMPI_ERR_INFO_VALUE_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_INTERN() -> c_int {
+    RSMPI_ERR_INTERN_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_IN_STATUS() -> c_int {
+    RSMPI_ERR_IN_STATUS_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_IO() -> c_int {
+    RSMPI_ERR_IO_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_KEYVAL() -> c_int {
+    RSMPI_ERR_KEYVAL_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_LASTCODE() -> c_int {
+    RSMPI_ERR_LASTCODE_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_LOCKTYPE() -> c_int {
+    RSMPI_ERR_LOCKTYPE_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_NAME() -> c_int {
+    RSMPI_ERR_NAME_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_NOT_SAME() -> c_int {
+    RSMPI_ERR_NOT_SAME_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_NO_MEM() -> c_int {
+    RSMPI_ERR_NO_MEM_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_NO_SPACE() -> c_int {
+    RSMPI_ERR_NO_SPACE_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_NO_SUCH_FILE() -> c_int {
+    RSMPI_ERR_NO_SUCH_FILE_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_OP() -> c_int {
+    RSMPI_ERR_OP_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_OTHER() -> c_int {
+    RSMPI_ERR_OTHER_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_PENDING() -> c_int {
+    RSMPI_ERR_PENDING_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_PORT() -> c_int {
+    RSMPI_ERR_PORT_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_QUOTA() -> c_int {
+    RSMPI_ERR_QUOTA_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_RANK() -> c_int {
+    RSMPI_ERR_RANK_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_READ_ONLY() -> c_int {
+    RSMPI_ERR_READ_ONLY_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_REQUEST() -> c_int {
+    RSMPI_ERR_REQUEST_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_RMA_ATTACH() -> c_int {
+    RSMPI_ERR_RMA_ATTACH_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_RMA_CONFLICT() -> c_int {
+    RSMPI_ERR_RMA_CONFLICT_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_RMA_FLAVOR() -> c_int {
+    RSMPI_ERR_RMA_FLAVOR_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_RMA_RANGE() -> c_int {
+    RSMPI_ERR_RMA_RANGE_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_RMA_SHARED() -> c_int {
+    RSMPI_ERR_RMA_SHARED_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_RMA_SYNC() -> c_int {
+    RSMPI_ERR_RMA_SYNC_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_ROOT() -> c_int {
+    RSMPI_ERR_ROOT_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_SERVICE() -> c_int {
+    RSMPI_ERR_SERVICE_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_SIZE() -> c_int {
+    RSMPI_ERR_SIZE_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_SPAWN() -> c_int {
+    RSMPI_ERR_SPAWN_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_TAG() -> c_int {
+    RSMPI_ERR_TAG_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_TOPOLOGY() -> c_int {
+    RSMPI_ERR_TOPOLOGY_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_TRUNCATE() -> c_int {
+    RSMPI_ERR_TRUNCATE_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_TYPE() -> c_int {
+    RSMPI_ERR_TYPE_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_UNKNOWN() -> c_int {
+    RSMPI_ERR_UNKNOWN_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_UNSUPPORTED_DATAREP() -> c_int {
+    RSMPI_ERR_UNSUPPORTED_DATAREP_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_UNSUPPORTED_OPERATION() -> c_int {
+    RSMPI_ERR_UNSUPPORTED_OPERATION_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERR_WIN() -> c_int {
+    RSMPI_ERR_WIN_fn()
+}
+
+#[inline]
+pub fn RSMPI_LOCK_EXCLUSIVE() -> c_int {
+    RSMPI_LOCK_EXCLUSIVE_fn()
+}
+
+#[inline]
+pub fn RSMPI_LOCK_SHARED() -> c_int {
+    RSMPI_LOCK_SHARED_fn()
+}
+
+#[inline]
+pub fn RSMPI_MODE_APPEND() -> c_int {
+    RSMPI_MODE_APPEND_fn()
+}
+
+#[inline]
+pub fn RSMPI_MODE_CREATE() -> c_int {
+    RSMPI_MODE_CREATE_fn()
+}
+
+#[inline]
+pub fn RSMPI_MODE_DELETE_ON_CLOSE() -> c_int {
+    RSMPI_MODE_DELETE_ON_CLOSE_fn()
+}
+
+#[inline]
+pub fn RSMPI_MODE_EXCL() -> c_int {
+    RSMPI_MODE_EXCL_fn()
+}
+
+#[inline]
+pub fn RSMPI_MODE_NOCHECK() -> c_int {
+    RSMPI_MODE_NOCHECK_fn()
+}
+
+#[inline]
+pub fn RSMPI_MODE_NOPRECEDE() -> c_int {
+    RSMPI_MODE_NOPRECEDE_fn()
+}
+
+#[inline]
+pub fn RSMPI_MODE_NOPUT() -> c_int {
+    RSMPI_MODE_NOPUT_fn()
+}
+
+#[inline]
+pub fn RSMPI_MODE_NOSTORE() -> c_int {
+    RSMPI_MODE_NOSTORE_fn()
+}
+
+#[inline]
+pub fn RSMPI_MODE_NOSUCCEED() -> c_int {
+    RSMPI_MODE_NOSUCCEED_fn()
+}
+
+#[inline]
+pub fn RSMPI_MODE_RDONLY() -> c_int {
+    RSMPI_MODE_RDONLY_fn()
+}
+
+#[inline]
+pub fn RSMPI_MODE_RDWR() -> c_int {
+    RSMPI_MODE_RDWR_fn()
+}
+
+#[inline]
+pub fn RSMPI_MODE_SEQUENTIAL() -> c_int {
+    RSMPI_MODE_SEQUENTIAL_fn()
+}
+
+#[inline]
+pub fn RSMPI_MODE_UNIQUE_OPEN() -> c_int {
+    RSMPI_MODE_UNIQUE_OPEN_fn()
+}
+
+#[inline]
+pub fn RSMPI_MODE_WRONLY() -> c_int {
+    RSMPI_MODE_WRONLY_fn()
+}
+
+#[inline]
+pub fn RSMPI_ORDER_C() -> c_int {
+    RSMPI_ORDER_C_fn()
+}
+
+#[inline]
+pub fn RSMPI_ORDER_FORTRAN() -> c_int {
+    RSMPI_ORDER_FORTRAN_fn()
+}
+
+#[inline]
+pub fn RSMPI_SEEK_CUR() -> c_int {
+    RSMPI_SEEK_CUR_fn()
+}
+
+#[inline]
+pub fn RSMPI_SEEK_END() -> c_int {
+    RSMPI_SEEK_END_fn()
+}
+
+#[inline]
+pub fn RSMPI_SEEK_SET() -> c_int {
+    RSMPI_SEEK_SET_fn()
+}
+
+#[inline]
+pub fn RSMPI_THREAD_FUNNELED() -> c_int {
+    RSMPI_THREAD_FUNNELED_fn()
+}
+
+#[inline]
+pub fn RSMPI_THREAD_MULTIPLE() -> c_int {
+    RSMPI_THREAD_MULTIPLE_fn()
+}
+
+#[inline]
+pub fn RSMPI_THREAD_SERIALIZED() -> c_int {
+    RSMPI_THREAD_SERIALIZED_fn()
+}
+
+#[inline]
+pub fn RSMPI_TYPECLASS_COMPLEX() -> c_int {
+    RSMPI_TYPECLASS_COMPLEX_fn()
+}
+
+#[inline]
+pub fn RSMPI_TYPECLASS_INTEGER() -> c_int {
+    RSMPI_TYPECLASS_INTEGER_fn()
+}
+
+#[inline]
+pub fn RSMPI_TYPECLASS_REAL() -> c_int {
+    RSMPI_TYPECLASS_REAL_fn()
+}
+
+#[inline]
+pub fn RSMPI_WIN_FLAVOR_ALLOCATE() -> c_int {
+    RSMPI_WIN_FLAVOR_ALLOCATE_fn()
+}
+
+#[inline]
+pub fn RSMPI_WIN_FLAVOR_CREATE() -> c_int {
+    RSMPI_WIN_FLAVOR_CREATE_fn()
+}
+
+#[inline]
+pub fn RSMPI_WIN_FLAVOR_DYNAMIC() -> c_int {
+    RSMPI_WIN_FLAVOR_DYNAMIC_fn()
+}
+
+#[inline]
+pub fn RSMPI_WIN_FLAVOR_SHARED() -> c_int {
+    RSMPI_WIN_FLAVOR_SHARED_fn()
+}
+
+#[inline]
+pub fn RSMPI_WIN_SEPARATE() -> c_int {
+    RSMPI_WIN_SEPARATE_fn()
+}
+
+#[inline]
+pub fn RSMPI_WIN_UNIFIED() -> c_int {
+    RSMPI_WIN_UNIFIED_fn()
+}
+
+#[inline]
+pub fn RSMPI_ARGV_NULL() -> *mut *mut c_char {
+    RSMPI_ARGV_NULL_fn()
+}
+
+#[inline]
+pub fn RSMPI_ARGVS_NULL() -> *mut *mut *mut c_char {
+    RSMPI_ARGVS_NULL_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERRCODES_IGNORE() -> *mut c_int {
+    RSMPI_ERRCODES_IGNORE_fn()
+}
+
+#[inline]
+pub fn RSMPI_UNWEIGHTED() -> *mut c_int {
+    RSMPI_UNWEIGHTED_fn()
+}
+
+#[inline]
+pub fn RSMPI_WEIGHTS_EMPTY() -> *mut c_int {
+    RSMPI_WEIGHTS_EMPTY_fn()
+}
+
+#[inline]
+pub fn RSMPI_BOTTOM() -> *mut c_void {
+    RSMPI_BOTTOM_fn()
+}
+
+#[inline]
+pub fn RSMPI_IN_PLACE() -> *mut c_void {
+    RSMPI_IN_PLACE_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMM_NULL() -> MPI_Comm {
+    RSMPI_COMM_NULL_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMM_SELF() -> MPI_Comm {
+    RSMPI_COMM_SELF_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMM_WORLD() -> MPI_Comm {
+    RSMPI_COMM_WORLD_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMM_DUP_FN() -> MPI_Comm_copy_attr_function {
+    RSMPI_COMM_DUP_FN_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMM_NULL_COPY_FN() -> MPI_Comm_copy_attr_function {
+    RSMPI_COMM_NULL_COPY_FN_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMM_NULL_DELETE_FN() -> MPI_Comm_delete_attr_function {
+    RSMPI_COMM_NULL_DELETE_FN_fn()
+}
+
+#[inline]
+pub fn RSMPI_DUP_FN() -> MPI_Copy_function {
+    RSMPI_DUP_FN_fn()
+}
+
+#[inline]
+pub fn RSMPI_NULL_COPY_FN() -> MPI_Copy_function {
+    RSMPI_NULL_COPY_FN_fn()
+}
+
+#[inline]
+pub fn RSMPI_CONVERSION_FN_NULL() -> MPI_Datarep_conversion_function {
+    RSMPI_CONVERSION_FN_NULL_fn()
+}
+
+#[inline]
+pub fn RSMPI_2DOUBLE_PRECISION() -> MPI_Datatype {
+    RSMPI_2DOUBLE_PRECISION_fn()
+}
+
+#[inline]
+pub fn RSMPI_2INT() -> MPI_Datatype {
+    RSMPI_2INT_fn()
+}
+
+#[inline]
+pub fn RSMPI_2INTEGER() -> MPI_Datatype {
+    RSMPI_2INTEGER_fn()
+}
+
+#[inline]
+pub fn RSMPI_2REAL() -> MPI_Datatype {
+    RSMPI_2REAL_fn()
+}
+
+#[inline]
+pub fn RSMPI_AINT() -> MPI_Datatype {
+    RSMPI_AINT_fn()
+}
+
+#[inline]
+pub fn RSMPI_BYTE() -> MPI_Datatype {
+    RSMPI_BYTE_fn()
+}
+
+#[inline]
+pub fn RSMPI_CHAR() -> MPI_Datatype {
+    RSMPI_CHAR_fn()
+}
+
+#[inline]
+pub fn RSMPI_CHARACTER() -> MPI_Datatype {
+    RSMPI_CHARACTER_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMPLEX() -> MPI_Datatype {
+    RSMPI_COMPLEX_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMPLEX16() -> MPI_Datatype {
+    RSMPI_COMPLEX16_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMPLEX32() -> MPI_Datatype {
+    RSMPI_COMPLEX32_fn()
+}
+
+#[inline]
+pub fn RSMPI_COMPLEX8() -> MPI_Datatype {
+    RSMPI_COMPLEX8_fn()
+}
+
+#[inline]
+pub fn RSMPI_COUNT() -> MPI_Datatype {
+    RSMPI_COUNT_fn()
+}
+
+#[inline]
+pub fn RSMPI_CXX_BOOL() -> MPI_Datatype {
+    RSMPI_CXX_BOOL_fn()
+}
+
+#[inline]
+pub fn RSMPI_CXX_DOUBLE_COMPLEX() -> MPI_Datatype {
+    RSMPI_CXX_DOUBLE_COMPLEX_fn()
+}
+
+#[inline]
+pub fn RSMPI_CXX_FLOAT_COMPLEX() -> MPI_Datatype {
+    RSMPI_CXX_FLOAT_COMPLEX_fn()
+}
+
+#[inline]
+pub fn RSMPI_CXX_LONG_DOUBLE_COMPLEX() -> MPI_Datatype {
+    RSMPI_CXX_LONG_DOUBLE_COMPLEX_fn()
+}
+
+#[inline]
+pub fn RSMPI_C_BOOL() -> MPI_Datatype {
+    RSMPI_C_BOOL_fn()
+}
+
+#[inline]
+pub fn RSMPI_C_COMPLEX() -> MPI_Datatype {
+    RSMPI_C_COMPLEX_fn()
+}
+
+#[inline]
+pub fn RSMPI_C_DOUBLE_COMPLEX() -> MPI_Datatype {
+    RSMPI_C_DOUBLE_COMPLEX_fn()
+}
+
+#[inline]
+pub fn RSMPI_C_FLOAT_COMPLEX() -> MPI_Datatype {
+    RSMPI_C_FLOAT_COMPLEX_fn()
+}
+
+#[inline]
+pub fn RSMPI_C_LONG_DOUBLE_COMPLEX() -> MPI_Datatype {
+    RSMPI_C_LONG_DOUBLE_COMPLEX_fn()
+}
+
+#[inline]
+pub fn RSMPI_DATATYPE_NULL() -> MPI_Datatype {
+    RSMPI_DATATYPE_NULL_fn()
+}
+
+#[inline]
+pub fn RSMPI_DOUBLE() -> MPI_Datatype {
+    RSMPI_DOUBLE_fn()
+}
+
+#[inline]
+pub fn RSMPI_DOUBLE_COMPLEX() -> MPI_Datatype {
+    RSMPI_DOUBLE_COMPLEX_fn()
+}
+
+#[inline]
+pub fn RSMPI_DOUBLE_INT() -> MPI_Datatype {
+    RSMPI_DOUBLE_INT_fn()
+}
+
+#[inline]
+pub fn RSMPI_DOUBLE_PRECISION() -> MPI_Datatype {
+    RSMPI_DOUBLE_PRECISION_fn()
+}
+
+#[inline]
+pub fn RSMPI_FLOAT() -> MPI_Datatype {
+    RSMPI_FLOAT_fn()
+}
+
+#[inline]
+pub fn RSMPI_FLOAT_INT() -> MPI_Datatype {
+    RSMPI_FLOAT_INT_fn()
+}
+
+#[inline]
+pub fn RSMPI_INT() -> MPI_Datatype {
+    RSMPI_INT_fn()
+}
+
+#[inline]
+pub fn RSMPI_INT16_T() -> MPI_Datatype {
+    RSMPI_INT16_T_fn()
+}
+
+#[inline]
+pub fn RSMPI_INT32_T() -> MPI_Datatype {
+    RSMPI_INT32_T_fn()
+}
+
+#[inline]
+pub fn RSMPI_INT64_T() -> MPI_Datatype {
+    RSMPI_INT64_T_fn()
+}
+
+#[inline]
+pub fn RSMPI_INT8_T() -> MPI_Datatype {
+    RSMPI_INT8_T_fn()
+}
+
+#[inline]
+pub fn RSMPI_INTEGER() -> MPI_Datatype {
+    RSMPI_INTEGER_fn()
+}
+
+#[inline]
+pub fn RSMPI_INTEGER1() -> MPI_Datatype {
+    RSMPI_INTEGER1_fn()
+}
+
+#[inline]
+pub fn RSMPI_INTEGER2() -> MPI_Datatype {
+    RSMPI_INTEGER2_fn()
+}
+
+#[inline]
+pub fn RSMPI_INTEGER4() -> MPI_Datatype {
+    RSMPI_INTEGER4_fn()
+}
+
+#[inline]
+pub fn RSMPI_INTEGER8() -> MPI_Datatype {
+    RSMPI_INTEGER8_fn()
+}
+
+#[inline]
+pub fn RSMPI_LOGICAL() -> MPI_Datatype {
+    RSMPI_LOGICAL_fn()
+}
+
+#[inline]
+pub fn RSMPI_LONG() -> MPI_Datatype {
+    RSMPI_LONG_fn()
+}
+
+#[inline]
+pub fn RSMPI_LONG_DOUBLE() -> MPI_Datatype {
+    RSMPI_LONG_DOUBLE_fn()
+}
+
+#[inline]
+pub fn RSMPI_LONG_DOUBLE_INT() -> MPI_Datatype {
+    RSMPI_LONG_DOUBLE_INT_fn()
+}
+
+#[inline]
+pub fn RSMPI_LONG_INT() -> MPI_Datatype {
+    RSMPI_LONG_INT_fn()
+}
+
+#[inline]
+pub fn RSMPI_LONG_LONG() -> MPI_Datatype {
+    RSMPI_LONG_LONG_fn()
+}
+
+#[inline]
+pub fn RSMPI_LONG_LONG_INT() -> MPI_Datatype {
+    RSMPI_LONG_LONG_INT_fn()
+}
+
+#[inline]
+pub fn RSMPI_OFFSET() -> MPI_Datatype {
+    RSMPI_OFFSET_fn()
+}
+
+#[inline]
+pub fn RSMPI_PACKED() -> MPI_Datatype {
+    RSMPI_PACKED_fn()
+}
+
+#[inline]
+pub fn RSMPI_REAL() -> MPI_Datatype {
+    RSMPI_REAL_fn()
+}
+
+#[inline]
+pub fn RSMPI_REAL16() -> MPI_Datatype {
+    RSMPI_REAL16_fn()
+}
+
+#[inline]
+pub fn RSMPI_REAL4() -> MPI_Datatype {
+    RSMPI_REAL4_fn()
+}
+
+#[inline]
+pub fn RSMPI_REAL8() -> MPI_Datatype {
+    RSMPI_REAL8_fn()
+}
+
+#[inline]
+pub fn RSMPI_SHORT() -> MPI_Datatype {
+    RSMPI_SHORT_fn()
+}
+
+#[inline]
+pub fn RSMPI_SHORT_INT() -> MPI_Datatype {
+    RSMPI_SHORT_INT_fn()
+}
+
+#[inline]
+pub fn RSMPI_SIGNED_CHAR() -> MPI_Datatype {
+    RSMPI_SIGNED_CHAR_fn()
+}
+
+#[inline]
+pub fn RSMPI_UINT16_T() -> MPI_Datatype {
+    RSMPI_UINT16_T_fn()
+}
+
+#[inline]
+pub fn RSMPI_UINT32_T() -> MPI_Datatype {
+    RSMPI_UINT32_T_fn()
+}
+
+#[inline]
+pub fn RSMPI_UINT64_T() -> MPI_Datatype {
+    RSMPI_UINT64_T_fn()
+}
+
+#[inline]
+pub fn RSMPI_UINT8_T() -> MPI_Datatype {
+    RSMPI_UINT8_T_fn()
+}
+
+#[inline]
+pub fn RSMPI_UNSIGNED() -> MPI_Datatype {
+    RSMPI_UNSIGNED_fn()
+}
+
+#[inline]
+pub fn RSMPI_UNSIGNED_CHAR() -> MPI_Datatype {
+    RSMPI_UNSIGNED_CHAR_fn()
+}
+
+#[inline]
+pub fn RSMPI_UNSIGNED_LONG() -> MPI_Datatype {
+    RSMPI_UNSIGNED_LONG_fn()
+}
+
+#[inline]
+pub fn RSMPI_UNSIGNED_LONG_LONG() -> MPI_Datatype {
+    RSMPI_UNSIGNED_LONG_LONG_fn()
+}
+
+#[inline]
+pub fn RSMPI_UNSIGNED_SHORT() -> MPI_Datatype {
+    RSMPI_UNSIGNED_SHORT_fn()
+}
+
+#[inline]
+pub fn RSMPI_WCHAR() -> MPI_Datatype {
+    RSMPI_WCHAR_fn()
+}
+
+#[inline]
+pub fn RSMPI_NULL_DELETE_FN() -> MPI_Delete_function {
+    RSMPI_NULL_DELETE_FN_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERRHANDLER_NULL() -> MPI_Errhandler {
+    RSMPI_ERRHANDLER_NULL_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERRORS_ARE_FATAL() -> MPI_Errhandler {
+    RSMPI_ERRORS_ARE_FATAL_fn()
+}
+
+#[inline]
+pub fn RSMPI_ERRORS_RETURN() -> MPI_Errhandler {
+    RSMPI_ERRORS_RETURN_fn()
+}
+
+#[inline]
+pub fn RSMPI_FILE_NULL() -> MPI_File {
+    RSMPI_FILE_NULL_fn()
+}
+
+#[inline]
+pub fn RSMPI_F_STATUS_IGNORE() -> *mut MPI_Fint {
+    RSMPI_F_STATUS_IGNORE_fn()
+}
+
+#[inline]
+pub fn RSMPI_F_STATUSES_IGNORE() -> *mut MPI_Fint {
+    RSMPI_F_STATUSES_IGNORE_fn()
+}
+
+#[inline]
+pub fn RSMPI_GROUP_EMPTY() -> MPI_Group {
+    RSMPI_GROUP_EMPTY_fn()
+}
+
+#[inline]
+pub fn RSMPI_GROUP_NULL() -> MPI_Group {
+    RSMPI_GROUP_NULL_fn()
+}
+
+#[inline]
+pub fn RSMPI_INFO_ENV() -> MPI_Info {
+    RSMPI_INFO_ENV_fn()
+}
+
+#[inline]
+pub fn RSMPI_INFO_NULL() -> MPI_Info {
+    RSMPI_INFO_NULL_fn()
+}
+
+#[inline]
+pub fn RSMPI_MESSAGE_NO_PROC() -> MPI_Message {
+    RSMPI_MESSAGE_NO_PROC_fn()
+}
+
+#[inline]
+pub fn RSMPI_MESSAGE_NULL() -> MPI_Message {
+    RSMPI_MESSAGE_NULL_fn()
+}
+
+#[inline]
+pub fn RSMPI_DISPLACEMENT_CURRENT() -> MPI_Offset {
+    RSMPI_DISPLACEMENT_CURRENT_fn()
+}
+
+#[inline]
+pub fn RSMPI_BAND() -> MPI_Op {
+    RSMPI_BAND_fn()
+}
+
+#[inline]
+pub fn RSMPI_BOR() -> MPI_Op {
+    RSMPI_BOR_fn()
+}
+
+#[inline]
+pub fn RSMPI_BXOR() -> MPI_Op {
+    RSMPI_BXOR_fn()
+}
+
+#[inline]
+pub fn RSMPI_LAND() -> MPI_Op {
+    RSMPI_LAND_fn()
+}
+
+#[inline]
+pub fn RSMPI_LOR() -> MPI_Op {
+    RSMPI_LOR_fn()
+}
+
+#[inline]
+pub fn RSMPI_LXOR() -> MPI_Op {
+    RSMPI_LXOR_fn()
+}
+
+#[inline]
+pub fn RSMPI_MAX() -> MPI_Op {
+    RSMPI_MAX_fn()
+}
+
+#[inline]
+pub fn RSMPI_MAXLOC() -> MPI_Op {
+    RSMPI_MAXLOC_fn()
+}
+
+#[inline]
+pub fn RSMPI_MIN() -> MPI_Op {
+    RSMPI_MIN_fn()
+}
+
+#[inline]
+pub fn RSMPI_MINLOC() -> MPI_Op {
+    RSMPI_MINLOC_fn()
+}
+
+#[inline]
+pub fn RSMPI_NO_OP() -> MPI_Op {
+    RSMPI_NO_OP_fn()
+}
+
+#[inline]
+pub fn RSMPI_OP_NULL() -> MPI_Op {
+    RSMPI_OP_NULL_fn()
+}
+
+#[inline]
+pub fn RSMPI_PROD() -> MPI_Op {
+    RSMPI_PROD_fn()
+}
+
+#[inline]
+pub fn RSMPI_REPLACE() -> MPI_Op {
+    RSMPI_REPLACE_fn()
+}
+
+#[inline]
+pub fn RSMPI_SUM() -> MPI_Op {
+    RSMPI_SUM_fn()
+}
+
+#[inline]
+pub fn RSMPI_REQUEST_NULL() -> MPI_Request {
+    RSMPI_REQUEST_NULL_fn()
+}
+
+#[inline]
+pub fn RSMPI_STATUS_IGNORE() -> *mut MPI_Status {
+    RSMPI_STATUS_IGNORE_fn()
+}
+
+#[inline]
+pub fn RSMPI_STATUSES_IGNORE() -> *mut MPI_Status {
+    RSMPI_STATUSES_IGNORE_fn()
+}
+
+#[inline]
+pub fn RSMPI_TYPE_DUP_FN() -> MPI_Type_copy_attr_function {
+    RSMPI_TYPE_DUP_FN_fn()
+}
+
+#[inline]
+pub fn RSMPI_TYPE_NULL_COPY_FN() -> MPI_Type_copy_attr_function {
+    RSMPI_TYPE_NULL_COPY_FN_fn()
+}
+
+#[inline]
+pub fn RSMPI_TYPE_NULL_DELETE_FN() -> MPI_Type_delete_attr_function {
+    RSMPI_TYPE_NULL_DELETE_FN_fn()
+}
+
+#[inline]
+pub fn RSMPI_WIN_NULL() -> MPI_Win {
+    RSMPI_WIN_NULL_fn()
+}
+
+#[inline]
+pub fn RSMPI_WIN_DUP_FN() -> MPI_Win_copy_attr_function {
+    RSMPI_WIN_DUP_FN_fn()
+}
+
+#[inline]
+pub fn RSMPI_WIN_NULL_COPY_FN() -> MPI_Win_copy_attr_function {
+    RSMPI_WIN_NULL_COPY_FN_fn()
+}
+
+#[inline]
+pub fn RSMPI_WIN_NULL_DELETE_FN() -> MPI_Win_delete_attr_function {
+    RSMPI_WIN_NULL_DELETE_FN_fn()
+}
+
+// Constants with the same value in every supported MPI implementation,
+// checked against the library by `verify_constants()`
+pub const MPI_UNDEFINED: c_int = -32766;
+
+#[inline(always)]
+pub const fn RSMPI_UNDEFINED_fn() -> c_int {
+    MPI_UNDEFINED
+}
+
+#[inline(always)]
+pub const fn RSMPI_UNDEFINED() -> c_int {
+    MPI_UNDEFINED
+}
+
+pub const MPI_SUCCESS: c_int = 0;
+
+#[inline(always)]
+pub const fn RSMPI_SUCCESS_fn() -> c_int {
+    MPI_SUCCESS
+}
+
+#[inline(always)]
+pub const fn RSMPI_SUCCESS() -> c_int {
+    MPI_SUCCESS
+}
+
+pub const MPI_THREAD_SINGLE: c_int = 0;
+
+#[inline(always)]
+pub const fn RSMPI_THREAD_SINGLE_fn() -> c_int {
+    MPI_THREAD_SINGLE
+}
+
+#[inline(always)]
+pub const fn RSMPI_THREAD_SINGLE() -> c_int {
+    MPI_THREAD_SINGLE
+}
+
+/// Check the constants that are compiled in as `const` against the MPI library.
+///
+/// Panics if the library disagrees about any of them. The check only runs once.
+pub fn verify_constants() {
+    static VERIFIED: Once = Once::new();
+    VERIFIED.call_once(|| {
+        let mut mismatches = Vec::new();
+        let value = unsafe { MPIABI_UNDEFINED };
+        if value != MPI_UNDEFINED {
+            mismatches.push(format!(
+                "MPI_UNDEFINED: expected {}, found {}",
+                MPI_UNDEFINED, value
+            ));
+        }
+        let value = unsafe { MPIABI_SUCCESS };
+        if value != MPI_SUCCESS {
+            mismatches.push(format!(
+                "MPI_SUCCESS: expected {}, found {}",
+                MPI_SUCCESS, value
+            ));
+        }
+        let value = unsafe { MPIABI_THREAD_SINGLE };
+        if value != MPI_THREAD_SINGLE {
+            mismatches.push(format!(
+                "MPI_THREAD_SINGLE: expected {}, found {}",
+                MPI_THREAD_SINGLE, value
+            ));
+        }
+        assert!(
+            mismatches.is_empty(),
+            "MPI library does not match the constants compiled into mpi-rt-sys:\n{}",
+            mismatches.join("\n")
+        );
+    });
+}
+
+pub fn RSMPI_MAX_LIBRARY_VERSION_STRING_fn() -> c_int {
+    unsafe { MPIABI_MAX_LIBRARY_VERSION_STRING }
+}
+
+pub fn RSMPI_MAX_LIBRARY_VERSION_STRING() -> c_int {
+    RSMPI_MAX_LIBRARY_VERSION_STRING_fn()
+}
+
+pub fn RSMPI_MAX_PROCESSOR_NAME_fn() -> c_int {
+    unsafe { MPIABI_MAX_PROCESSOR_NAME }
+}
+
+pub fn RSMPI_MAX_PROCESSOR_NAME() -> c_int {
+    RSMPI_MAX_PROCESSOR_NAME_fn()
+}
+
+/// MPI_MAX_OBJECT_NAME from MPIABI spec (MPIABI_MAX_OBJECT_NAME = 128)
+pub const MPI_MAX_OBJECT_NAME: usize = 128;
+pub const RSMPI_MAX_OBJECT_NAME: usize = MPI_MAX_OBJECT_NAME;
+
+pub unsafe fn RSMPI_Wtime() -> c_double {
+    crate::functions::MPI_Wtime()
+}
+
+pub unsafe fn RSMPI_Wtick() -> c_double {
+    crate::functions::MPI_Wtick()
+}
+
+// Aliases matching mpi-sys naming convention
+// mpi-sys: RSMPI_FLOAT_COMPLEX = MPI_C_FLOAT_COMPLEX
+pub fn RSMPI_FLOAT_COMPLEX_fn() -> MPI_Datatype {
+    RSMPI_C_FLOAT_COMPLEX_fn()
+}
@@ -1,10 +1,16 @@
 //! Dynamic loading of MPIwrapper library via MPI_RT_LIB
+//!
+//! The library may implement either MPItrampoline's MPIABI (MPIwrapper) or the MPI standard ABI
+//! (e.g. MPICH's `libmpi_abi.so`). [`abi()`] tells them apart by their exported symbols.
 
-use std::sync::OnceLock;
+use std::{ffi::c_void, sync::OnceLock};
 
 use libloading::Library;
 
+use crate::types::Abi;
+
 static LIBRARY: OnceLock<Library> = OnceLock::new();
+static ABI: OnceLock<Abi> = OnceLock::new();
 
 /// Get or load the MPIwrapper library.
 ///
@@ -19,6 +25,27 @@ pub fn library() -> &'static Library {
     })
 }
 
+/// The ABI implemented by the library in `MPI_RT_LIB`.
+///
+/// MPIwrapper exports its constants as `MPIABI_*` symbols, while standard ABI libraries define
+/// them in `mpi_abi.h` only and export `MPI_Abi_get_version` instead.
+/// Panics if the library exports neither.
+#[inline]
+pub fn abi() -> Abi {
+    *ABI.get_or_init(|| {
+        if find_symbol(b"MPIABI_COMM_WORLD\0").is_some() {
+            Abi::Mpiabi
+        } else if find_symbol(b"MPI_Abi_get_version\0").is_some() {
+            Abi::Standard
+        } else {
+            panic!(
+                "The library in MPI_RT_LIB implements neither MPIABI (no MPIABI_COMM_WORLD) nor \
+                 the MPI standard ABI (no MPI_Abi_get_version)"
+            )
+        }
+    })
+}
+
 /// Load a symbol from the MPIwrapper library.
 ///
 /// # Safety
@@ -34,3 +61,22 @@ pub unsafe fn get_symbol<T>(name: &[u8]) -> *const T {
     });
     *sym
 }
+
+/// Look up a symbol address in the MPIwrapper library.
+///
+/// Returns `None` if the library does not export `name`.
+pub fn find_symbol(name: &[u8]) -> Option<*const c_void> {
+    let lib = library();
+    unsafe { lib.get::<*const c_void>(name) }
+        .ok()
+        .map(|sym| *sym)
+}
+
+/// Report a call to an MPI function that the MPIwrapper library does not export.
+#[cold]
+pub fn missing_symbol(name: &str) -> ! {
+    panic!(
+        "MPI function '{}' is not exported by the library in MPI_RT_LIB",
+        name
+    )
+}
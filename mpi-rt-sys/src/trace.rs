@@ -0,0 +1,186 @@
+//! Per-function call statistics for the MPI function wrappers.
+//!
+//! With the `trace` feature, every wrapper in `functions` records how often it was called, how
+//! much time was spent inside the MPI library and how many bytes its buffer arguments describe.
+//! The byte volume is `count * size of datatype` for each count/datatype pair of the function;
+//! the count arrays of the `v` and `w` variants are not included.
+//!
+//! Counters are kept per thread, so recording a call does not synchronize with other threads.
+//! [`report()`] adds up the counters of all threads that have made MPI calls so far.
+
+use std::{
+    fmt::Write as _,
+    io::Write as _,
+    os::raw::{c_int, c_void},
+    sync::{
+        atomic::{AtomicU64, Ordering},
+        Arc, Mutex,
+    },
+    time::{Duration, Instant},
+};
+
+use crate::{
+    constants::{RSMPI_DATATYPE_NULL_fn, RSMPI_IN_PLACE_fn},
+    functions::{entry, FUNCTION_NAMES},
+    types::MPI_Datatype,
+};
+
+#[derive(Default)]
+struct Counter {
+    calls: AtomicU64,
+    nanos: AtomicU64,
+    bytes: AtomicU64,
+}
+
+impl Counter {
+    // Only the owning thread writes to its counters, so a load followed by a store does not
+    // lose updates. `report()` may read concurrently and sees each value either before or after.
+    #[inline]
+    fn add(value: &AtomicU64, delta: u64) {
+        value.store(
+            value.load(Ordering::Relaxed).wrapping_add(delta),
+            Ordering::Relaxed,
+        );
+    }
+}
+
+type Counters = Arc<[Counter]>;
+
+static THREADS: Mutex<Vec<Counters>> = Mutex::new(Vec::new());
+
+thread_local! {
+    static COUNTERS: Counters = {
+        let counters: Counters = FUNCTION_NAMES.iter().map(|_| Counter::default()).collect();
+        THREADS
+            .lock()
+            .unwrap_or_else(|e| e.into_inner())
+            .push(counters.clone());
+        counters
+    };
+}
+
+/// A call of an MPI function in progress, recorded when dropped.
+pub struct Call {
+    index: usize,
+    bytes: u64,
+    start: Instant,
+}
+
+impl Call {
+    /// Starts timing a call of the function at `index` in the function table.
+    #[inline]
+    pub fn new(index: usize, bytes: u64) -> Self {
+        Call {
+            index,
+            bytes,
+            start: Instant::now(),
+        }
+    }
+}
+
+impl Drop for Call {
+    #[inline]
+    fn drop(&mut self) {
+        let nanos = u64::try_from(self.start.elapsed().as_nanos()).unwrap_or(u64::MAX);
+        // The thread-local is gone while threads shut down; calls made then are not recorded.
+        let _ = COUNTERS.try_with(|counters| {
+            let counter = &counters[self.index];
+            Counter::add(&counter.calls, 1);
+            Counter::add(&counter.nanos, nanos);
+            Counter::add(&counter.bytes, self.bytes);
+        });
+    }
+}
+
+/// The number of bytes described by `count` elements of `datatype` at `buf`.
+///
+/// Returns 0 for `MPI_IN_PLACE` buffers, `MPI_DATATYPE_NULL` and non-positive counts.
+#[inline]
+pub fn volume(buf: *const c_void, count: impl Into<i64>, datatype: MPI_Datatype) -> u64 {
+    let count = count.into();
+    if count <= 0 || datatype == RSMPI_DATATYPE_NULL_fn() || std::ptr::eq(buf, RSMPI_IN_PLACE_fn())
+    {
+        return 0;
+    }
+    let mut size: c_int = 0;
+    // Called through the table directly so that the query itself is not recorded.
+    unsafe { (entry::MPI_Type_size())(datatype, &mut size) };
+    count.unsigned_abs() * u64::from(size.unsigned_abs())
+}
+
+/// Statistics of one MPI function.
+#[derive(Clone, Debug, PartialEq, Eq)]
+pub struct FunctionStats {
+    /// Name of the MPI function
+    pub name: &'static str,
+    /// Number of calls
+    pub calls: u64,
+    /// Time spent inside the MPI library
+    pub time: Duration,
+    /// Bytes described by the buffer arguments
+    pub bytes: u64,
+}
+
+/// Statistics of every MPI function called so far on any thread, most time consuming first.
+pub fn report() -> Vec<FunctionStats> {
+    let threads = THREADS.lock().unwrap_or_else(|e| e.into_inner());
+    let mut stats: Vec<_> = FUNCTION_NAMES
+        .iter()
+        .enumerate()
+        .map(|(i, &name)| {
+            let (calls, nanos, bytes) = threads.iter().fold((0, 0, 0), |(c, n, b), counters| {
+                let counter = &counters[i];
+                (
+                    c + counter.calls.load(Ordering::Relaxed),
+                    n + counter.nanos.load(Ordering::Relaxed),
+                    b + counter.bytes.load(Ordering::Relaxed),
+                )
+            });
+            FunctionStats {
+                name,
+                calls,
+                time: Duration::from_nanos(nanos),
+                bytes,
+            }
+        })
+        .filter(|s| s.calls > 0)
+        .collect();
+    stats.sort_by(|a, b| b.time.cmp(&a.time).then(a.name.cmp(b.name)));
+    stats
+}
+
+/// Resets the statistics of all threads to zero.
+///
+/// Calls in progress on other threads are recorded after the reset.
+pub fn reset() {
+    let threads = THREADS.lock().unwrap_or_else(|e| e.into_inner());
+    for counter in threads.iter().flat_map(|counters| counters.iter()) {
+        counter.calls.store(0, Ordering::Relaxed);
+        counter.nanos.store(0, Ordering::Relaxed);
+        counter.bytes.store(0, Ordering::Relaxed);
+    }
+}
+
+/// Writes the statistics of [`report()`] as a table to standard error.
+///
+/// `rank` labels the table so that the output of several processes can be told apart.
+pub fn dump(rank: c_int) {
+    let stats = report();
+    let mut out = format!(
+        "[rank {}] {:<32} {:>12} {:>14} {:>16}\n",
+        rank, "function", "calls", "time [s]", "bytes"
+    );
+    for s in &stats {
+        let _ = writeln!(
+            out,
+            "[rank {}] {:<32} {:>12} {:>14.6} {:>16}",
+            rank,
+            s.name,
+            s.calls,
+            s.time.as_secs_f64(),
+            s.bytes
+        );
+    }
+    // A single write keeps the lines of a process together.
+    let _ = std::io::stderr().lock().write_all(out.as_bytes());
+}
@@ -1,4 +1,4 @@
-//! MPIABI type definitions, translated from mpiabi/mpiabi.h
+//! MPIABI type definitions, translated from mpiabi/mpiabi.h and mpi_abi.h
 
 use std::os::raw::c_int;
 
@@ -8,7 +8,8 @@ pub type MPI_Count = i64; // int64_t
 pub type MPI_Fint = c_int; // int
 pub type MPI_Offset = i64; // int64_t
 
-// All handles are integer types (MPItrampoline ABI design)
+// All handles are integer types (MPItrampoline ABI design). The standard ABI uses
+// pointer-sized opaque handles, which have the same representation.
 pub type MPI_Comm = usize;
 pub type MPI_Datatype = usize;
 pub type MPI_Errhandler = usize;
@@ -20,27 +21,100 @@ pub type MPI_Op = usize;
 pub type MPI_Request = usize;
 pub type MPI_Win = usize;
 
-/// MPI_Status structure compatible with MPIABI spec.
-/// The internal union accommodates both OpenMPI and MPICH layouts.
+/// The binary interface implemented by the loaded MPI library.
+#[derive(Copy, Clone, Debug, PartialEq, Eq)]
+pub enum Abi {
+    /// MPItrampoline's MPIABI, as implemented by MPIwrapper. Constants are exported as
+    /// `MPIABI_*` symbols.
+    Mpiabi,
+    /// The MPI standard ABI of MPI 5.0 (`mpi_abi.h`, e.g. MPICH's `libmpi_abi.so`). Constants
+    /// have fixed values and are not exported.
+    Standard,
+}
+
+/// MPI_Status structure compatible with both supported ABIs.
+///
+/// MPIABI places an internal union first and `MPI_SOURCE`, `MPI_TAG` and `MPI_ERROR` last,
+/// while the MPI standard ABI places those three first, followed by five internal `int`s.
+/// The storage is large enough for either layout and the public fields are read through
+/// accessors that check which ABI the library uses.
 #[repr(C)]
 #[derive(Copy, Clone)]
 pub struct MPI_Status {
-    // Internal fields (union of OpenMPI/MPICH layouts)
-    _internal: [u8; MPIABI_STATUS_INTERNAL_SIZE],
-    pub MPI_SOURCE: c_int,
-    pub MPI_TAG: c_int,
-    pub MPI_ERROR: c_int,
+    storage: [c_int; MPI_STATUS_STORAGE_INTS],
+}
+
+impl MPI_Status {
+    #[inline]
+    fn public_fields(&self) -> &[c_int] {
+        match crate::abi() {
+            Abi::Mpiabi => &self.storage[MPIABI_STATUS_INTERNAL_INTS..],
+            Abi::Standard => &self.storage[..3],
+        }
+    }
+
+    /// The `MPI_SOURCE` field
+    #[inline]
+    pub fn source(&self) -> c_int {
+        self.public_fields()[0]
+    }
+
+    /// The `MPI_TAG` field
+    #[inline]
+    pub fn tag(&self) -> c_int {
+        self.public_fields()[1]
+    }
+
+    /// The `MPI_ERROR` field
+    #[inline]
+    pub fn error(&self) -> c_int {
+        self.public_fields()[2]
+    }
 }
 
-// Size of the internal union (max of OpenMPI: 4*int + size_t, MPICH: 5*int)
+// Size of the MPIABI internal union (max of OpenMPI: 4*int + size_t, MPICH: 5*int)
 // On 64-bit: OpenMPI = 4*4 + 8 = 24, MPICH = 5*4 = 20 => 24
 // On 32-bit: OpenMPI = 4*4 + 4 = 20, MPICH = 5*4 = 20 => 20
 #[cfg(target_pointer_width = "64")]
-const MPIABI_STATUS_INTERNAL_SIZE: usize = 24;
+const MPIABI_STATUS_INTERNAL_INTS: usize = 6;
 #[cfg(target_pointer_width = "32")]
-const MPIABI_STATUS_INTERNAL_SIZE: usize = 20;
+const MPIABI_STATUS_INTERNAL_INTS: usize = 5;
+
+// MPIABI: internal union + 3 public fields; standard ABI: 3 public fields + 5 internal ints
+const MPIABI_STATUS_INTS: usize = MPIABI_STATUS_INTERNAL_INTS + 3;
+const STANDARD_STATUS_INTS: usize = 8;
+const MPI_STATUS_STORAGE_INTS: usize = if MPIABI_STATUS_INTS > STANDARD_STATUS_INTS {
+    MPIABI_STATUS_INTS
+} else {
+    STANDARD_STATUS_INTS
+};
 
 const _: () = assert!(
-    std::mem::size_of::<MPI_Status>()
-        == MPIABI_STATUS_INTERNAL_SIZE + 3 * std::mem::size_of::<c_int>()
+    std::mem::size_of::<MPI_Status>() == MPI_STATUS_STORAGE_INTS * std::mem::size_of::<c_int>()
 );
+
+/// Move statuses written by the library with its own stride into `MPI_Status` slots.
+///
+/// A standard ABI library writes `MPI_Status` arrays with a stride of 8 `int`s, which is
+/// shorter than `MPI_Status` on 64-bit targets. Spreading the first `count` elements from the
+/// back keeps every element at the index the caller expects.
+///
+/// # Safety
+/// `statuses` must be null or point to at least `count` `MPI_Status` values.
+#[inline]
+pub unsafe fn spread_statuses(statuses: *mut MPI_Status, count: c_int) {
+    if STANDARD_STATUS_INTS == MPI_STATUS_STORAGE_INTS
+        || crate::abi() != Abi::Standard
+        || statuses.is_null()
+    {
+        return;
+    }
+    let base = statuses as *mut c_int;
+    for i in (1..count.max(0) as usize).rev() {
+        std::ptr::copy(
+            base.add(i * STANDARD_STATUS_INTS),
+            base.add(i * MPI_STATUS_STORAGE_INTS),
+            STANDARD_STATUS_INTS,
+        );
+    }
+}
@@ -0,0 +1,455 @@
+//! Aggregation of small messages
+//!
+//! Sending many small records to the same process one message at a time pays the full message
+//! latency for every record. An [`Aggregator`](struct.Aggregator.html) collects the records for
+//! each destination into a batch and sends the batch as a single message when it reaches the
+//! limits of its [`FlushPolicy`](struct.FlushPolicy.html), when it is flushed explicitly, or when
+//! the epoch ends.
+//!
+//! Ending an epoch with `end_epoch()` is collective: every process flushes its batches and learns
+//! how many batches were sent to it during the epoch. The returned iterator yields the batches
+//! that have not been received with `poll()` yet. A received [`Batch`](struct.Batch.html) is a
+//! view of its receive buffer, so records are read in place; the buffers of sent and received
+//! batches are recycled through a [`BufferPool`](../buffer_pool/struct.BufferPool.html).
+//!
+//! # Examples
+//!
+//! See `examples/aggregation.rs`
+
+use std::{
+    fmt,
+    mem::{self, size_of},
+    ops::Deref,
+    os::raw::c_int,
+    slice,
+};
+
+use crate::{
+    buffer_pool::BufferPool,
+    collective::CommunicatorCollectives,
+    datatype::traits::*,
+    ffi,
+    ffi::MPI_Request,
+    point_to_point::{MatchedReceiveVec, Source, Status},
+    raw::traits::*,
+    request::is_null,
+    topology::{Communicator, Rank},
+    with_uninitialized, Count, Tag,
+};
+
+/// Default size limit of the buffer pool of an `Aggregator`
+const DEFAULT_POOL_BYTES: usize = 16 * 1024 * 1024;
+
+/// The index of `rank` in per-rank vectors
+#[allow(clippy::cast_sign_loss)]
+fn index(rank: Rank) -> usize {
+    debug_assert!(rank >= 0, "rank must not be negative");
+    rank as usize
+}
+
+/// When an [`Aggregator`](struct.Aggregator.html) sends the batch of a destination
+#[derive(Copy, Clone, Debug, PartialEq, Eq)]
+pub struct FlushPolicy {
+    /// Send a batch once it holds this many records.
+    pub max_records: usize,
+    /// Send a batch once its records occupy this many bytes.
+    pub max_bytes: usize,
+}
+
+impl FlushPolicy {
+    /// The number of records after which a batch of `T` is sent
+    fn batch_len<T>(&self) -> usize {
+        let by_bytes = self
+            .max_bytes
+            .checked_div(size_of::<T>())
+            .unwrap_or(usize::MAX);
+        self.max_records.min(by_bytes).max(1)
+    }
+}
+
+impl Default for FlushPolicy {
+    /// Batches of up to 8 KiB with any number of records
+    fn default() -> Self {
+        FlushPolicy {
+            max_records: usize::MAX,
+            max_bytes: 8 * 1024,
+        }
+    }
+}
+
+/// Collects small records per destination and sends them in batches
+///
+/// Batches are sent with nonblocking standard mode sends tagged with the tag of the aggregator,
+/// alternating with the next tag between epochs, so the two tags must not be used for other
+/// messages on the communicator. Every process of the communicator has to create its
+/// aggregator with the same tag and call `end_epoch()` the same number of times.
+///
+/// Records that have not been flushed when the aggregator is dropped are discarded; batches that
+/// are still being sent are waited for.
+///
+/// # Examples
+///
+/// See `examples/aggregation.rs`
+pub struct Aggregator<'c, C, T>
+where
+    C: Communicator + ?Sized,
+    T: Equivalence,
+{
+    comm: &'c C,
+    tag: Tag,
+    epoch: u64,
+    batch_len: usize,
+    pool: BufferPool,
+    /// Batches being filled, indexed by destination rank
+    batches: Vec<Vec<T>>,
+    /// Number of batches sent to each rank during this epoch
+    sent: Vec<Count>,
+    /// Number of batches received with `poll()` during this epoch
+    received: usize,
+    /// Sends in flight and the batches they send
+    requests: Vec<MPI_Request>,
+    in_flight: Vec<Vec<T>>,
+    indices: Vec<c_int>,
+}
+
+impl<'c, C, T> Aggregator<'c, C, T>
+where
+    C: Communicator + ?Sized,
+    T: Equivalence,
+{
+    /// Create an aggregator for records sent to processes of `comm` with tags `tag` and
+    /// `tag + 1`.
+    pub fn new(comm: &'c C, tag: Tag, policy: FlushPolicy) -> Self {
+        Self::with_pool(comm, tag, policy, BufferPool::new(DEFAULT_POOL_BYTES))
+    }
+
+    /// Create an aggregator that takes its buffers from `pool`.
+    pub fn with_pool(comm: &'c C, tag: Tag, policy: FlushPolicy, pool: BufferPool) -> Self {
+        let size = index(comm.size());
+        Aggregator {
+            comm,
+            tag,
+            epoch: 0,
+            batch_len: policy.batch_len::<T>(),
+            pool,
+            batches: (0..size).map(|_| Vec::new()).collect(),
+            sent: vec![0; size],
+            received: 0,
+            requests: Vec::new(),
+            in_flight: Vec::new(),
+            indices: Vec::new(),
+        }
+    }
+
+    /// The pool the buffers of batches are taken from
+    pub fn pool(&self) -> &BufferPool {
+        &self.pool
+    }
+
+    /// The number of epochs ended so far
+    pub fn epoch(&self) -> u64 {
+        self.epoch
+    }
+
+    /// The number of batches that are being sent
+    pub fn sends_in_flight(&self) -> usize {
+        self.requests.len()
+    }
+
+    fn epoch_tag(&self) -> Tag {
+        // A process cannot be more than one epoch ahead of another, so two tags suffice.
+        self.tag + (self.epoch % 2) as Tag
+    }
+
+    /// Add `record` to the batch for `destination` and send the batch if it is full.
+    pub fn push(&mut self, destination: Rank, record: T) {
+        let batch = &mut self.batches[index(destination)];
+        if batch.capacity() == 0 {
+            *batch = self.pool.get(self.batch_len);
+        }
+        batch.push(record);
+        if batch.len() >= self.batch_len {
+            self.flush_to(destination);
+        }
+    }
+
+    /// Send the batch for `destination`, if it is not empty.
+    pub fn flush_to(&mut self, destination: Rank) {
+        if self.batches[index(destination)].is_empty() {
+            return;
+        }
+        self.reclaim();
+        let batch = mem::take(&mut self.batches[index(destination)]);
+        let tag = self.epoch_tag();
+        let request = unsafe {
+            let count = batch[..].large_count();
+            with_uninitialized(|request| {
+                large_count_call!(
+                    MPI_Isend / MPI_Isend_c,
+                    [count],
+                    (
+                        batch[..].pointer(),
+                        count,
+                        batch[..].as_datatype().as_raw(),
+                        destination,
+                        tag,
+                        self.comm.as_raw(),
+                        request
+                    )
+                )
+            })
+            .1
+        };
+        // Moving the `Vec` does not move the records being sent.
+        self.requests.push(request);
+        self.in_flight.push(batch);
+        self.sent[index(destination)] += 1;
+    }
+
+    /// Send the batches for all destinations that are not empty.
+    pub fn flush(&mut self) {
+        for destination in 0..self.batches.len() {
+            self.flush_to(destination as Rank);
+        }
+    }
+
+    /// Receive a batch of the current epoch if one has arrived.
+    pub fn poll(&mut self) -> Option<Batch<T>> {
+        self.reclaim();
+        let (message, status) = self
+            .comm
+            .any_process()
+            .immediate_matched_probe_with_tag(self.epoch_tag())?;
+        self.received += 1;
+        Some(Batch::receive(
+            (message, status).matched_receive_vec_pooled(&self.pool),
+            &self.pool,
+        ))
+    }
+
+    /// End the current epoch.
+    ///
+    /// Flushes all batches and exchanges the number of batches sent to each process. The
+    /// returned iterator yields the batches sent to this process during the epoch that have not
+    /// been received with `poll()`; dropping it receives and discards the remaining batches.
+    ///
+    /// This is a collective operation.
+    pub fn end_epoch(&mut self) -> EpochBatches<'_, 'c, C, T> {
+        self.flush();
+        let mut expected: Vec<Count> = vec![0; self.sent.len()];
+        self.comm.all_to_all_into(&self.sent[..], &mut expected[..]);
+        let expected: usize = expected.iter().map(|&n| index(n)).sum();
+        let remaining = expected - self.received;
+        let tag = self.epoch_tag();
+        self.sent.iter_mut().for_each(|n| *n = 0);
+        self.received = 0;
+        self.epoch += 1;
+        EpochBatches {
+            aggregator: self,
+            tag,
+            remaining,
+        }
+    }
+
+    /// Return the buffers of completed sends to the pool.
+    fn reclaim(&mut self) {
+        if self.requests.is_empty() {
+            return;
+        }
+        self.indices.resize(self.requests.len(), 0);
+        let mut completed: c_int = 0;
+        unsafe {
+            ffi::MPI_Testsome(
+                self.requests.len() as c_int,
+                self.requests.as_mut_ptr(),
+                &mut completed,
+                self.indices.as_mut_ptr(),
+                ffi::RSMPI_STATUSES_IGNORE_fn(),
+            );
+        }
+        if completed <= 0 {
+            return;
+        }
+        let mut i = 0;
+        while i < self.requests.len() {
+            if is_null(self.requests[i]) {
+                self.requests.swap_remove(i);
+                self.pool.put(self.in_flight.swap_remove(i));
+            } else {
+                i += 1;
+            }
+        }
+    }
+
+    /// Wait for all sends to complete and return their buffers to the pool.
+    fn wait_sends(&mut self) {
+        if self.requests.is_empty() {
+            return;
+        }
+        unsafe {
+            ffi::MPI_Waitall(
+                self.requests.len() as c_int,
+                self.requests.as_mut_ptr(),
+                ffi::RSMPI_STATUSES_IGNORE_fn(),
+            );
+        }
+        self.requests.clear();
+        for batch in self.in_flight.drain(..) {
+            self.pool.put(batch);
+        }
+    }
+}
+
+impl<'c, C, T> Drop for Aggregator<'c, C, T>
+where
+    C: Communicator + ?Sized,
+    T: Equivalence,
+{
+    fn drop(&mut self) {
+        self.wait_sends();
+        for batch in self.batches.drain(..) {
+            self.pool.put(batch);
+        }
+    }
+}
+
+impl<'c, C, T> fmt::Debug for Aggregator<'c, C, T>
+where
+    C: Communicator + ?Sized,
+    T: Equivalence,
+{
+    fn fmt(&self, f: &mut fmt::Formatter) -> fmt::Result {
+        f.debug_struct("Aggregator")
+            .field("tag", &self.tag)
+            .field("epoch", &self.epoch)
+            .field("batch_len", &self.batch_len)
+            .field("sends_in_flight", &self.requests.len())
+            .finish()
+    }
+}
+
+/// A batch of records received by an [`Aggregator`](struct.Aggregator.html)
+///
+/// Dereferences to the records. The buffer is returned to the pool of the aggregator when the
+/// batch is dropped.
+pub struct Batch<T> {
+    records: Vec<T>,
+    source: Rank,
+    pool: BufferPool,
+}
+
+impl<T> Batch<T> {
+    fn receive((records, status): (Vec<T>, Status), pool: &BufferPool) -> Self {
+        Batch {
+            records,
+            source: status.source_rank(),
+            pool: pool.clone(),
+        }
+    }
+
+    /// The rank of the process that sent the batch
+    pub fn source(&self) -> Rank {
+        self.source
+    }
+}
+
+impl<T> Deref for Batch<T> {
+    type Target = [T];
+
+    fn deref(&self) -> &[T] {
+        &self.records
+    }
+}
+
+impl<'b, T> IntoIterator for &'b Batch<T> {
+    type Item = &'b T;
+    type IntoIter = slice::Iter<'b, T>;
+
+    fn into_iter(self) -> Self::IntoIter {
+        self.records.iter()
+    }
+}
+
+impl<T> Drop for Batch<T> {
+    fn drop(&mut self) {
+        self.pool.put(mem::take(&mut self.records));
+    }
+}
+
+impl<T: fmt::Debug> fmt::Debug for Batch<T> {
+    fn fmt(&self, f: &mut fmt::Formatter) -> fmt::Result {
+        f.debug_struct("Batch")
+            .field("source", &self.source)
+            .field("records", &&self.records[..])
+            .finish()
+    }
+}
+
+/// The batches of an epoch that remain to be received, see
+/// [`Aggregator::end_epoch()`](struct.Aggregator.html#method.end_epoch)
+pub struct EpochBatches<'a, 'c, C, T>
+where
+    C: Communicator + ?Sized,
+    T: Equivalence,
+{
+    aggregator: &'a mut Aggregator<'c, C, T>,
+    tag: Tag,
+    remaining: usize,
+}
+
+impl<'a, 'c, C, T> EpochBatches<'a, 'c, C, T>
+where
+    C: Communicator + ?Sized,
+    T: Equivalence,
+{
+    /// The number of batches that remain to be received
+    pub fn remaining(&self) -> usize {
+        self.remaining
+    }
+}
+
+impl<'a, 'c, C, T> Iterator for EpochBatches<'a, 'c, C, T>
+where
+    C: Communicator + ?Sized,
+    T: Equivalence,
+{
+    type Item = Batch<T>;
+
+    fn next(&mut self) -> Option<Batch<T>> {
+        if self.remaining == 0 {
+            self.aggregator.wait_sends();
+            return None;
+        }
+        self.remaining -= 1;
+        let aggregator = &mut *self.aggregator;
+        aggregator.reclaim();
+        let received = aggregator
+            .comm
+            .any_process()
+            .matched_probe_with_tag(self.tag)
+            .matched_receive_vec_pooled(&aggregator.pool);
+        Some(Batch::receive(received, &aggregator.pool))
+    }
+
+    fn size_hint(&self) -> (usize, Option<usize>) {
+        (self.remaining, Some(self.remaining))
+    }
+}
+
+impl<'a, 'c, C, T> ExactSizeIterator for EpochBatches<'a, 'c, C, T>
+where
+    C: Communicator + ?Sized,
+    T: Equivalence,
+{
+}
+
+impl<'a, 'c, C, T> Drop for EpochBatches<'a, 'c, C, T>
+where
+    C: Communicator + ?Sized,
+    T: Equivalence,
+{
+    fn drop(&mut self) {
+        for _ in self.by_ref() {}
+        self.aggregator.wait_sends();
+    }
+}
@@ -0,0 +1,259 @@
+//! Reusable receive buffers
+//!
+//! Receiving a message whose size is only known when it arrives, e.g. with `receive_vec()`,
+//! allocates a new `Vec` for every message. A [`BufferPool`](struct.BufferPool.html) keeps the
+//! allocations of vectors that are given back to it with `put()` and hands them out again to
+//! later receives through `receive_vec_pooled()`, `matched_receive_vec_pooled()` and
+//! `immediate_receive_pooled()`. Buffers taken from a pool are not zeroed.
+//!
+//! Buffers are kept in size classes of powers of two elements, separately for each element size
+//! and alignment, so a buffer returned from a `Vec<f64>` can be reused for a `Vec<u64>`. A pool
+//! holds at most a fixed number of bytes; when a returned buffer does not fit, the buffers that
+//! were returned least recently are freed first.
+//!
+//! # Examples
+//!
+//! See `examples/buffer_pool.rs`
+
+use std::{
+    alloc::{self, Layout},
+    collections::{HashMap, VecDeque},
+    fmt,
+    mem::{align_of, size_of, ManuallyDrop},
+    ptr::NonNull,
+    sync::{Arc, Mutex, MutexGuard},
+};
+
+/// Element size, element alignment and capacity in elements of the buffers in one bin
+#[derive(Copy, Clone, Debug, PartialEq, Eq, Hash)]
+struct SizeClass {
+    size: usize,
+    align: usize,
+    capacity: usize,
+}
+
+impl SizeClass {
+    fn of<T>(capacity: usize) -> SizeClass {
+        SizeClass {
+            size: size_of::<T>(),
+            align: align_of::<T>(),
+            capacity,
+        }
+    }
+}
+
+/// An allocation given back to the pool, with the exact capacity needed to rebuild its `Vec`
+struct Allocation {
+    ptr: NonNull<u8>,
+    capacity: usize,
+    returned: u64,
+}
+
+struct Inner {
+    bins: HashMap<SizeClass, VecDeque<Allocation>>,
+    max_bytes: usize,
+    bytes: usize,
+    buffers: usize,
+    clock: u64,
+    hits: u64,
+    misses: u64,
+    evictions: u64,
+}
+
+// The allocations are owned by the pool and not aliased.
+unsafe impl Send for Inner {}
+
+impl Inner {
+    fn free(class: SizeClass, allocation: Allocation) {
+        unsafe {
+            alloc::dealloc(
+                allocation.ptr.as_ptr(),
+                Layout::from_size_align_unchecked(class.size * allocation.capacity, class.align),
+            );
+        }
+    }
+
+    /// Free the buffer that was returned least recently.
+    fn evict(&mut self) {
+        let class = *self
+            .bins
+            .iter()
+            .filter_map(|(class, bin)| bin.front().map(|a| (class, a.returned)))
+            .min_by_key(|&(_, returned)| returned)
+            .expect("rsmpi internal error: evicting from an empty buffer pool")
+            .0;
+        let bin = self
+            .bins
+            .get_mut(&class)
+            .expect("rsmpi internal error: buffer pool bin vanished");
+        let allocation = bin
+            .pop_front()
+            .expect("rsmpi internal error: empty buffer pool bin");
+        if bin.is_empty() {
+            self.bins.remove(&class);
+        }
+        self.bytes -= class.size * allocation.capacity;
+        self.buffers -= 1;
+        self.evictions += 1;
+        Inner::free(class, allocation);
+    }
+}
+
+impl Drop for Inner {
+    fn drop(&mut self) {
+        for (class, bin) in self.bins.drain() {
+            for allocation in bin {
+                Inner::free(class, allocation);
+            }
+        }
+    }
+}
+
+/// A pool of reusable buffers for receiving messages
+///
+/// Cloning a `BufferPool` yields another handle to the same pool, which can be used from other
+/// threads.
+///
+/// # Examples
+///
+/// See `examples/buffer_pool.rs`
+#[derive(Clone)]
+pub struct BufferPool(Arc<Mutex<Inner>>);
+
+impl BufferPool {
+    /// Create an empty pool that holds at most `max_bytes` bytes of buffers.
+    pub fn new(max_bytes: usize) -> BufferPool {
+        BufferPool(Arc::new(Mutex::new(Inner {
+            bins: HashMap::new(),
+            max_bytes,
+            bytes: 0,
+            buffers: 0,
+            clock: 0,
+            hits: 0,
+            misses: 0,
+            evictions: 0,
+        })))
+    }
+
+    fn lock(&self) -> MutexGuard<'_, Inner> {
+        self.0
+            .lock()
+            .expect("rsmpi internal error: buffer pool lock poisoned")
+    }
+
+    /// Take an empty `Vec` with room for at least `len` elements from the pool, or allocate one if
+    /// the pool has none.
+    pub fn get<T>(&self, len: usize) -> Vec<T> {
+        if size_of::<T>() == 0 || len == 0 {
+            return Vec::with_capacity(len);
+        }
+        let class = SizeClass::of::<T>(len.next_power_of_two());
+        let mut inner = self.lock();
+        if let Some(allocation) = inner.bins.get_mut(&class).and_then(|bin| bin.pop_back()) {
+            inner.hits += 1;
+            inner.bytes -= class.size * allocation.capacity;
+            inner.buffers -= 1;
+            // The allocation was made by a `Vec` of elements with the same size and alignment.
+            unsafe { Vec::from_raw_parts(allocation.ptr.as_ptr().cast(), 0, allocation.capacity) }
+        } else {
+            inner.misses += 1;
+            drop(inner);
+            Vec::with_capacity(class.capacity)
+        }
+    }
+
+    /// Give the allocation of `buf` to the pool for reuse. The elements of `buf` are dropped.
+    ///
+    /// If the buffer is larger than the pool, it is freed; otherwise the least recently returned
+    /// buffers are freed until it fits.
+    pub fn put<T>(&self, mut buf: Vec<T>) {
+        buf.clear();
+        let capacity = buf.capacity();
+        let bytes = capacity * size_of::<T>();
+        if bytes == 0 {
+            return;
+        }
+        let mut inner = self.lock();
+        if bytes > inner.max_bytes {
+            inner.evictions += 1;
+            return;
+        }
+        while inner.bytes + bytes > inner.max_bytes {
+            inner.evict();
+        }
+        // Round the capacity down, so every buffer in a class holds at least its capacity.
+        let class = SizeClass::of::<T>(1 << (usize::BITS - 1 - capacity.leading_zeros()));
+        let mut buf = ManuallyDrop::new(buf);
+        let ptr = NonNull::new(buf.as_mut_ptr().cast())
+            .expect("rsmpi internal error: allocated Vec with a null pointer");
+        inner.clock += 1;
+        let returned = inner.clock;
+        inner.bytes += bytes;
+        inner.buffers += 1;
+        inner.bins.entry(class).or_default().push_back(Allocation {
+            ptr,
+            capacity,
+            returned,
+        });
+    }
+
+    /// Free all buffers held by the pool. The statistics are kept.
+    pub fn clear(&self) {
+        let mut inner = self.lock();
+        let evictions = inner.evictions;
+        while inner.buffers > 0 {
+            inner.evict();
+        }
+        inner.evictions = evictions;
+    }
+
+    /// Statistics of the use of the pool.
+    pub fn stats(&self) -> PoolStats {
+        let inner = self.lock();
+        PoolStats {
+            hits: inner.hits,
+            misses: inner.misses,
+            evictions: inner.evictions,
+            buffers_held: inner.buffers,
+            bytes_held: inner.bytes,
+        }
+    }
+}
+
+impl fmt::Debug for BufferPool {
+    fn fmt(&self, f: &mut fmt::Formatter) -> fmt::Result {
+        let max_bytes = self.lock().max_bytes;
+        f.debug_struct("BufferPool")
+            .field("max_bytes", &max_bytes)
+            .field("stats", &self.stats())
+            .finish()
+    }
+}
+
+/// Statistics of a [`BufferPool`](struct.BufferPool.html)
+#[derive(Copy, Clone, Debug, Default, PartialEq, Eq)]
+pub struct PoolStats {
+    /// Requests for a buffer that were served from the pool
+    pub hits: u64,
+    /// Requests for a buffer that needed a new allocation
+    pub misses: u64,
+    /// Buffers freed to stay within the size limit of the pool
+    pub evictions: u64,
+    /// Buffers currently held by the pool
+    pub buffers_held: usize,
+    /// Bytes currently held by the pool
+    pub bytes_held: usize,
+}
+
+impl PoolStats {
+    /// The fraction of requests for a buffer that were served from the pool.
+    #[allow(clippy::cast_precision_loss)]
+    pub fn hit_rate(&self) -> f64 {
+        let requests = self.hits + self.misses;
+        if requests == 0 {
+            0.0
+        } else {
+            self.hits as f64 / requests as f64
+        }
+    }
+}
@@ -2,18 +2,20 @@
 //!
 //! Developing...
 //!
+//! Collectives with varying counts can be planned: a plan exchanges the counts once, caches the
+//! counts and displacements and is then executed as often as the data changes.
+//!
 //! # Unfinished features
 //!
-//! - **5.8**: All-to-all, `MPI_Alltoallw()`
-//! - **5.10**: Reduce-scatter, `MPI_Reduce_scatter()`
-//! - **5.12**: Nonblocking collective operations,
-//! `MPI_Ialltoallw()`, `MPI_Ireduce_scatter()`
+//! - **5.12**: Nonblocking collective operations, `MPI_Ialltoallw()`
+//! - **7.6**, **7.7**: Neighborhood collectives with per-neighbor datatypes,
+//!   `MPI_Neighbor_alltoallw()`, `MPI_Ineighbor_alltoallw()`
 
-#[cfg(feature = "user-operations")]
-use std::mem;
 use std::{
     ffi::{CString, NulError},
     fmt,
+    marker::PhantomData,
+    mem::{self, size_of},
     os::raw::{c_char, c_int, c_void},
     process::Command,
     ptr,
@@ -24,20 +26,23 @@ use conv::ConvUtil;
 use libffi::middle::{Cif, Closure, Type};
 
 #[cfg(feature = "user-operations")]
-use crate::datatype::{DatatypeRef, DynBuffer, DynBufferMut};
+use crate::datatype::{DynBuffer, DynBufferMut};
+#[cfg(feature = "mpi-rt-sys-backend")]
+use crate::request::{PersistentCollectiveRequest, PersistentRequest};
 use crate::{
-    datatype::traits::*,
+    datatype::{traits::*, DatatypeRef, Partition, PartitionMut},
     ffi,
     ffi::MPI_Op,
+    point_to_point::traits::*,
     raw::traits::*,
-    request::{Request, Scope, StaticScope},
-    topology::{traits::*, InterCommunicator, Process, Rank},
-    with_uninitialized, MpiError,
+    request::{self, Request, Scope, StaticScope},
+    topology::{sealed::CommunicatorHandle, traits::*, InterCommunicator, Process, Rank},
+    with_uninitialized, Count, LargeCount, MpiError, Tag,
 };
 
 /// Collective communication traits
 pub mod traits {
-    pub use super::{CommunicatorCollectives, Operation, Root};
+    pub use super::{CommunicatorCollectives, NeighborhoodCollectives, Operation, Root};
 }
 
 /// Collective communication patterns defined on `Communicator`s
@@ -82,14 +87,20 @@ pub trait CommunicatorCollectives: Communicator {
         R: BufferMut,
     {
         unsafe {
-            ffi::MPI_Allgather(
-                sendbuf.pointer(),
-                sendbuf.count(),
-                sendbuf.as_datatype().as_raw(),
-                recvbuf.pointer_mut(),
-                recvbuf.count() / self.target_size(),
-                recvbuf.as_datatype().as_raw(),
-                self.as_raw(),
+            let sendcount = sendbuf.large_count();
+            let recvcount = recvbuf.large_count() / LargeCount::from(self.target_size());
+            large_count_call!(
+                MPI_Allgather / MPI_Allgather_c,
+                [sendcount, recvcount],
+                (
+                    sendbuf.pointer(),
+                    sendcount,
+                    sendbuf.as_datatype().as_raw(),
+                    recvbuf.pointer_mut(),
+                    recvcount,
+                    recvbuf.as_datatype().as_raw(),
+                    self.as_raw()
+                )
             );
         }
     }
@@ -115,19 +126,47 @@ pub trait CommunicatorCollectives: Communicator {
         R: PartitionedBufferMut,
     {
         unsafe {
-            ffi::MPI_Allgatherv(
-                sendbuf.pointer(),
-                sendbuf.count(),
-                sendbuf.as_datatype().as_raw(),
-                recvbuf.pointer_mut(),
-                recvbuf.counts().as_ptr(),
-                recvbuf.displs().as_ptr(),
-                recvbuf.as_datatype().as_raw(),
-                self.as_raw(),
+            let recvbuf_ptr = recvbuf.pointer_mut();
+            let sendcount = sendbuf.large_count();
+            let recvcounts = recvbuf.counts();
+            let displs = recvbuf.displs();
+            large_count_call!(
+                MPI_Allgatherv / MPI_Allgatherv_c,
+                [sendcount],
+                [(recvcounts, displs)],
+                (
+                    sendbuf.pointer(),
+                    sendcount,
+                    sendbuf.as_datatype().as_raw(),
+                    recvbuf_ptr,
+                    recvcounts.as_ptr(),
+                    displs.as_ptr(),
+                    recvbuf.as_datatype().as_raw(),
+                    self.as_raw()
+                )
             );
         }
     }
 
+    /// Exchange the `count` of elements every process contributes to an all-gather and lay out
+    /// the receive buffer accordingly.
+    ///
+    /// The returned `Layout` partitions the receive buffer of `all_gather_varcount_into()` for as
+    /// long as the counts stay the same.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/all_to_all_plan.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.7
+    fn all_gather_layout(&self, count: Count) -> Layout {
+        let mut counts: Vec<Count> = vec![0; block_count(self)];
+        self.all_gather_into(&count, &mut counts[..]);
+        Layout::contiguous(counts)
+    }
+
     /// Distribute the send `Buffer`s from all processes to the receive `Buffer`s on all processes.
     ///
     /// Each process sends and receives the same count of elements to and from each process.
@@ -146,14 +185,20 @@ pub trait CommunicatorCollectives: Communicator {
     {
         let c_size = self.target_size();
         unsafe {
-            ffi::MPI_Alltoall(
-                sendbuf.pointer(),
-                sendbuf.count() / c_size,
-                sendbuf.as_datatype().as_raw(),
-                recvbuf.pointer_mut(),
-                recvbuf.count() / c_size,
-                recvbuf.as_datatype().as_raw(),
-                self.as_raw(),
+            let sendcount = sendbuf.large_count() / LargeCount::from(c_size);
+            let recvcount = recvbuf.large_count() / LargeCount::from(c_size);
+            large_count_call!(
+                MPI_Alltoall / MPI_Alltoall_c,
+                [sendcount, recvcount],
+                (
+                    sendbuf.pointer(),
+                    sendcount,
+                    sendbuf.as_datatype().as_raw(),
+                    recvbuf.pointer_mut(),
+                    recvcount,
+                    recvbuf.as_datatype().as_raw(),
+                    self.as_raw()
+                )
             );
         }
     }
@@ -172,20 +217,89 @@ pub trait CommunicatorCollectives: Communicator {
         R: PartitionedBufferMut,
     {
         unsafe {
-            ffi::MPI_Alltoallv(
-                sendbuf.pointer(),
-                sendbuf.counts().as_ptr(),
-                sendbuf.displs().as_ptr(),
-                sendbuf.as_datatype().as_raw(),
-                recvbuf.pointer_mut(),
-                recvbuf.counts().as_ptr(),
-                recvbuf.displs().as_ptr(),
-                recvbuf.as_datatype().as_raw(),
-                self.as_raw(),
+            let recvbuf_ptr = recvbuf.pointer_mut();
+            let sendcounts = sendbuf.counts();
+            let sdispls = sendbuf.displs();
+            let recvcounts = recvbuf.counts();
+            let rdispls = recvbuf.displs();
+            large_count_call!(
+                MPI_Alltoallv / MPI_Alltoallv_c,
+                [],
+                [(sendcounts, sdispls), (recvcounts, rdispls)],
+                (
+                    sendbuf.pointer(),
+                    sendcounts.as_ptr(),
+                    sdispls.as_ptr(),
+                    sendbuf.as_datatype().as_raw(),
+                    recvbuf_ptr,
+                    recvcounts.as_ptr(),
+                    rdispls.as_ptr(),
+                    recvbuf.as_datatype().as_raw(),
+                    self.as_raw()
+                )
             );
         }
     }
 
+    /// Plan repeated all-to-all exchanges in which this process sends `send_counts[i]` elements
+    /// to process `i`.
+    ///
+    /// The counts are exchanged once with `all_to_all_into()` and the displacements on both sides
+    /// are computed and cached, so that the plan can be executed again whenever only the data
+    /// changes. Blocks are laid out contiguously in rank order in both buffers.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/all_to_all_plan.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.8
+    fn all_to_all_plan(&self, send_counts: &[Count]) -> AllToAllPlan<'_, Self>
+    where
+        Self: Sized,
+    {
+        assert_eq!(send_counts.len(), block_count(self));
+        let mut recv_counts: Vec<Count> = vec![0; send_counts.len()];
+        self.all_to_all_into(send_counts, &mut recv_counts[..]);
+        AllToAllPlan {
+            comm: self,
+            send: Layout::contiguous(send_counts.to_vec()),
+            recv: Layout::contiguous(recv_counts),
+        }
+    }
+
+    /// Plan repeated all-to-all exchanges in which every block has its own datatype.
+    ///
+    /// `sends[i]` describes the block sent to process `i` and `recvs[i]` the block received from
+    /// it. Their displacements are in bytes. Unlike in `all_to_all_plan()` no counts are exchanged:
+    /// the receiver has to describe every block it receives, as it chooses the datatype.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/all_to_all_w.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.8
+    fn all_to_all_w_plan<'d>(
+        &self,
+        sends: &[TypedBlock<'d>],
+        recvs: &[TypedBlock<'d>],
+    ) -> AllToAllWPlan<'_, 'd, Self>
+    where
+        Self: Sized,
+    {
+        assert_eq!(sends.len(), block_count(self));
+        assert_eq!(recvs.len(), block_count(self));
+        AllToAllWPlan {
+            comm: self,
+            send: TypedLayout::new(sends),
+            recv: TypedLayout::new(recvs),
+            phantom: PhantomData,
+        }
+    }
+
     /// Performs a global reduction under the operation `op` of the input data in `sendbuf` and
     /// stores the result in `recvbuf` on all processes.
     ///
@@ -203,17 +317,90 @@ pub trait CommunicatorCollectives: Communicator {
         O: Operation,
     {
         unsafe {
-            ffi::MPI_Allreduce(
-                sendbuf.pointer(),
-                recvbuf.pointer_mut(),
-                sendbuf.count(),
-                sendbuf.as_datatype().as_raw(),
-                op.as_raw(),
-                self.as_raw(),
+            let count = sendbuf.large_count();
+            large_count_call!(
+                MPI_Allreduce / MPI_Allreduce_c,
+                [count],
+                (
+                    sendbuf.pointer(),
+                    recvbuf.pointer_mut(),
+                    count,
+                    sendbuf.as_datatype().as_raw(),
+                    op.as_raw(),
+                    self.as_raw()
+                )
             );
         }
     }
 
+    /// Performs a global reduction of a large buffer in segments and hands every reduced segment
+    /// to `consume` as soon as it is complete.
+    ///
+    /// `sendbuf` and `recvbuf` are split into segments of `segment_len` elements, the last one
+    /// possibly shorter. A non-blocking all-reduce is started for each segment, with up to `depth`
+    /// of them in flight at a time, and a new one is started whenever one completes. `consume` is
+    /// called with the offset of each reduced segment in `recvbuf` and its contents, in the order
+    /// in which the segments complete. The caller can thus process the first results while the
+    /// rest of the buffer is still being reduced, and every process keeps only `depth` segments
+    /// of the reduction in the MPI library at a time.
+    ///
+    /// All processes must pass the same `segment_len`.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/segmented_all_reduce.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.12.8
+    fn segmented_all_reduce_into<T, O, F>(
+        &self,
+        sendbuf: &[T],
+        recvbuf: &mut [T],
+        op: O,
+        segment_len: usize,
+        depth: usize,
+        mut consume: F,
+    ) where
+        T: Equivalence,
+        O: Operation,
+        F: FnMut(usize, &[T]),
+        Self: Sized,
+    {
+        assert_eq!(
+            sendbuf.len(),
+            recvbuf.len(),
+            "sendbuf and recvbuf must have the same length"
+        );
+        assert!(segment_len > 0, "segment_len must be positive");
+        assert!(depth > 0, "depth must be positive");
+
+        let mut segments = sendbuf
+            .chunks(segment_len)
+            .zip(recvbuf.chunks_mut(segment_len))
+            .enumerate();
+        request::multiple_scope(depth, |scope, coll| {
+            // Offset of the segment in each slot of the collection
+            let mut offsets = Vec::with_capacity(depth);
+            loop {
+                while coll.incomplete() < depth {
+                    let Some((i, (send, recv))) = segments.next() else {
+                        break;
+                    };
+                    let slot = coll.add(self.immediate_all_reduce_into(scope, send, recv, &op));
+                    if slot == offsets.len() {
+                        offsets.push(0);
+                    }
+                    offsets[slot] = i * segment_len;
+                }
+                match coll.wait_any_without_status() {
+                    Some((slot, segment)) => consume(offsets[slot], segment),
+                    None => break,
+                }
+            }
+        });
+    }
+
     /// Performs an element-wise global reduction under the operation `op` of the input data in
     /// `sendbuf` and scatters the result into equal sized blocks in the receive buffers on all
     /// processes.
@@ -235,19 +422,58 @@ pub trait CommunicatorCollectives: Communicator {
         R: BufferMut,
         O: Operation,
     {
-        assert_eq!(recvbuf.count() * self.target_size(), sendbuf.count());
+        assert_eq!(
+            recvbuf.large_count() * LargeCount::from(self.target_size()),
+            sendbuf.large_count()
+        );
         unsafe {
-            ffi::MPI_Reduce_scatter_block(
-                sendbuf.pointer(),
-                recvbuf.pointer_mut(),
-                recvbuf.count(),
-                sendbuf.as_datatype().as_raw(),
-                op.as_raw(),
-                self.as_raw(),
+            let recvcount = recvbuf.large_count();
+            large_count_call!(
+                MPI_Reduce_scatter_block / MPI_Reduce_scatter_block_c,
+                [recvcount],
+                (
+                    sendbuf.pointer(),
+                    recvbuf.pointer_mut(),
+                    recvcount,
+                    sendbuf.as_datatype().as_raw(),
+                    op.as_raw(),
+                    self.as_raw()
+                )
             );
         }
     }
 
+    /// Plan repeated reductions whose result is scattered in blocks of `recv_counts[i]` elements
+    /// to process `i`.
+    ///
+    /// All processes have to pass the same `recv_counts`. Inter-communicators are not supported,
+    /// as the send buffers there hold the blocks of the other group.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/all_to_all_plan.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.10.2
+    fn reduce_scatter_plan(&self, recv_counts: &[Count]) -> ReduceScatterPlan<'_, Self>
+    where
+        Self: Sized,
+    {
+        assert!(
+            !matches!(
+                self.as_handle(),
+                CommunicatorHandle::InterComm(_) | CommunicatorHandle::Parent(_)
+            ),
+            "reduce_scatter_plan() does not support inter-communicators"
+        );
+        assert_eq!(recv_counts.count(), self.size());
+        ReduceScatterPlan {
+            comm: self,
+            layout: Layout::contiguous(recv_counts.to_vec()),
+        }
+    }
+
     /// Performs a global inclusive prefix reduction of the data in `sendbuf` into `recvbuf` under
     /// operation `op`.
     ///
@@ -265,13 +491,18 @@ pub trait CommunicatorCollectives: Communicator {
         O: Operation,
     {
         unsafe {
-            ffi::MPI_Scan(
-                sendbuf.pointer(),
-                recvbuf.pointer_mut(),
-                sendbuf.count(),
-                sendbuf.as_datatype().as_raw(),
-                op.as_raw(),
-                self.as_raw(),
+            let count = sendbuf.large_count();
+            large_count_call!(
+                MPI_Scan / MPI_Scan_c,
+                [count],
+                (
+                    sendbuf.pointer(),
+                    recvbuf.pointer_mut(),
+                    count,
+                    sendbuf.as_datatype().as_raw(),
+                    op.as_raw(),
+                    self.as_raw()
+                )
             );
         }
     }
@@ -293,17 +524,81 @@ pub trait CommunicatorCollectives: Communicator {
         O: Operation,
     {
         unsafe {
-            ffi::MPI_Exscan(
-                sendbuf.pointer(),
-                recvbuf.pointer_mut(),
-                sendbuf.count(),
-                sendbuf.as_datatype().as_raw(),
-                op.as_raw(),
-                self.as_raw(),
+            let count = sendbuf.large_count();
+            large_count_call!(
+                MPI_Exscan / MPI_Exscan_c,
+                [count],
+                (
+                    sendbuf.pointer(),
+                    recvbuf.pointer_mut(),
+                    count,
+                    sendbuf.as_datatype().as_raw(),
+                    op.as_raw(),
+                    self.as_raw()
+                )
             );
         }
     }
 
+    /// Exchange messages along a sparse pattern that only the senders know.
+    ///
+    /// Every process sends each message in `sends` to the process of `&self` at the given rank.
+    /// It gets back the messages sent to it as `(source rank, message)` pairs, in order of arrival.
+    /// No process has to know how many messages it will receive or from where. Exchanging the
+    /// counts with `all_to_all_into()` first costs memory and time in proportion to the size of
+    /// the communicator. Here the cost scales with the number of messages a process sends and
+    /// receives, plus a barrier.
+    ///
+    /// This uses the nonblocking consensus (NBX) algorithm of Hoefler, Siebert and Lumsdaine.
+    /// Messages are sent with synchronous sends, so a send completes only once its message has
+    /// been matched. While waiting, a process receives whatever has arrived for it. Once all of
+    /// its sends are done, it enters a nonblocking barrier. When the barrier completes, every
+    /// message has been received.
+    ///
+    /// Messages are sent with tag `tag`, which must not be in use by other point to point
+    /// communication on `&self` at the same time. A process can return from the exchange and
+    /// start the next while other processes are still receiving, so consecutive exchanges need
+    /// different tags; alternating between two is enough.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/sparse_exchange.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.7.2, 3.8.2, 5.12.1
+    fn sparse_exchange<Msg>(&self, sends: &[(Rank, &[Msg])], tag: Tag) -> Vec<(Rank, Vec<Msg>)>
+    where
+        Msg: Equivalence,
+    {
+        let any = self.any_process();
+        let mut received = Vec::new();
+        request::multiple_scope(sends.len(), |scope, coll| {
+            for &(rank, msg) in sends {
+                coll.add(
+                    self.process_at_rank(rank)
+                        .immediate_synchronous_send_with_tag(scope, msg, tag),
+                );
+            }
+            let mut barrier = None;
+            loop {
+                while let Some(matched) = any.immediate_matched_probe_with_tag(tag) {
+                    let (msg, status) = matched.matched_receive_vec();
+                    received.push((status.source_rank(), msg));
+                }
+                barrier = match barrier {
+                    None if coll.test_all_without_status() => Some(self.immediate_barrier()),
+                    None => None,
+                    Some(barrier) => match barrier.test() {
+                        Ok(_) => break,
+                        Err(barrier) => Some(barrier),
+                    },
+                };
+            }
+        });
+        received
+    }
+
     /// Non-blocking barrier synchronization among all processes in a `Communicator`
     ///
     /// Calling processes (or threads within the calling processes) enter the barrier. Completion
@@ -348,18 +643,23 @@ pub trait CommunicatorCollectives: Communicator {
         Sc: Scope<'a>,
     {
         unsafe {
-            let recvcount = recvbuf.count() / self.target_size();
+            let recvcount = recvbuf.large_count() / LargeCount::from(self.target_size());
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Iallgather(
-                        sendbuf.pointer(),
-                        sendbuf.count(),
-                        sendbuf.as_datatype().as_raw(),
-                        recvbuf.pointer_mut(),
-                        recvcount,
-                        recvbuf.as_datatype().as_raw(),
-                        self.as_raw(),
-                        request,
+                    let sendcount = sendbuf.large_count();
+                    large_count_call!(
+                        MPI_Iallgather / MPI_Iallgather_c,
+                        [sendcount, recvcount],
+                        (
+                            sendbuf.pointer(),
+                            sendcount,
+                            sendbuf.as_datatype().as_raw(),
+                            recvbuf.pointer_mut(),
+                            recvcount,
+                            recvbuf.as_datatype().as_raw(),
+                            self.as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -393,16 +693,25 @@ pub trait CommunicatorCollectives: Communicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Iallgatherv(
-                        sendbuf.pointer(),
-                        sendbuf.count(),
-                        sendbuf.as_datatype().as_raw(),
-                        recvbuf.pointer_mut(),
-                        recvbuf.counts().as_ptr(),
-                        recvbuf.displs().as_ptr(),
-                        recvbuf.as_datatype().as_raw(),
-                        self.as_raw(),
-                        request,
+                    let recvbuf_ptr = recvbuf.pointer_mut();
+                    let sendcount = sendbuf.large_count();
+                    let recvcounts = recvbuf.counts();
+                    let displs = recvbuf.displs();
+                    large_count_call!(
+                        MPI_Iallgatherv / MPI_Iallgatherv_c,
+                        [sendcount],
+                        [(recvcounts, displs)],
+                        (
+                            sendbuf.pointer(),
+                            sendcount,
+                            sendbuf.as_datatype().as_raw(),
+                            recvbuf_ptr,
+                            recvcounts.as_ptr(),
+                            displs.as_ptr(),
+                            recvbuf.as_datatype().as_raw(),
+                            self.as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -436,15 +745,21 @@ pub trait CommunicatorCollectives: Communicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Ialltoall(
-                        sendbuf.pointer(),
-                        sendbuf.count() / c_size,
-                        sendbuf.as_datatype().as_raw(),
-                        recvbuf.pointer_mut(),
-                        recvbuf.count() / c_size,
-                        recvbuf.as_datatype().as_raw(),
-                        self.as_raw(),
-                        request,
+                    let sendcount = sendbuf.large_count() / LargeCount::from(c_size);
+                    let recvcount = recvbuf.large_count() / LargeCount::from(c_size);
+                    large_count_call!(
+                        MPI_Ialltoall / MPI_Ialltoall_c,
+                        [sendcount, recvcount],
+                        (
+                            sendbuf.pointer(),
+                            sendcount,
+                            sendbuf.as_datatype().as_raw(),
+                            recvbuf.pointer_mut(),
+                            recvcount,
+                            recvbuf.as_datatype().as_raw(),
+                            self.as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -473,17 +788,27 @@ pub trait CommunicatorCollectives: Communicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Ialltoallv(
-                        sendbuf.pointer(),
-                        sendbuf.counts().as_ptr(),
-                        sendbuf.displs().as_ptr(),
-                        sendbuf.as_datatype().as_raw(),
-                        recvbuf.pointer_mut(),
-                        recvbuf.counts().as_ptr(),
-                        recvbuf.displs().as_ptr(),
-                        recvbuf.as_datatype().as_raw(),
-                        self.as_raw(),
-                        request,
+                    let recvbuf_ptr = recvbuf.pointer_mut();
+                    let sendcounts = sendbuf.counts();
+                    let sdispls = sendbuf.displs();
+                    let recvcounts = recvbuf.counts();
+                    let rdispls = recvbuf.displs();
+                    large_count_call!(
+                        MPI_Ialltoallv / MPI_Ialltoallv_c,
+                        [],
+                        [(sendcounts, sdispls), (recvcounts, rdispls)],
+                        (
+                            sendbuf.pointer(),
+                            sendcounts.as_ptr(),
+                            sdispls.as_ptr(),
+                            sendbuf.as_datatype().as_raw(),
+                            recvbuf_ptr,
+                            recvcounts.as_ptr(),
+                            rdispls.as_ptr(),
+                            recvbuf.as_datatype().as_raw(),
+                            self.as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -519,14 +844,19 @@ pub trait CommunicatorCollectives: Communicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Iallreduce(
-                        sendbuf.pointer(),
-                        recvbuf.pointer_mut(),
-                        sendbuf.count(),
-                        sendbuf.as_datatype().as_raw(),
-                        op.as_raw(),
-                        self.as_raw(),
-                        request,
+                    let count = sendbuf.large_count();
+                    large_count_call!(
+                        MPI_Iallreduce / MPI_Iallreduce_c,
+                        [count],
+                        (
+                            sendbuf.pointer(),
+                            recvbuf.pointer_mut(),
+                            count,
+                            sendbuf.as_datatype().as_raw(),
+                            op.as_raw(),
+                            self.as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -560,18 +890,26 @@ pub trait CommunicatorCollectives: Communicator {
         O: 'a + Operation,
         Sc: Scope<'a>,
     {
-        assert_eq!(recvbuf.count() * self.target_size(), sendbuf.count());
+        assert_eq!(
+            recvbuf.large_count() * LargeCount::from(self.target_size()),
+            sendbuf.large_count()
+        );
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Ireduce_scatter_block(
-                        sendbuf.pointer(),
-                        recvbuf.pointer_mut(),
-                        recvbuf.count(),
-                        sendbuf.as_datatype().as_raw(),
-                        op.as_raw(),
-                        self.as_raw(),
-                        request,
+                    let recvcount = recvbuf.large_count();
+                    large_count_call!(
+                        MPI_Ireduce_scatter_block / MPI_Ireduce_scatter_block_c,
+                        [recvcount],
+                        (
+                            sendbuf.pointer(),
+                            recvbuf.pointer_mut(),
+                            recvcount,
+                            sendbuf.as_datatype().as_raw(),
+                            op.as_raw(),
+                            self.as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -607,14 +945,19 @@ pub trait CommunicatorCollectives: Communicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Iscan(
-                        sendbuf.pointer(),
-                        recvbuf.pointer_mut(),
-                        sendbuf.count(),
-                        sendbuf.as_datatype().as_raw(),
-                        op.as_raw(),
-                        self.as_raw(),
-                        request,
+                    let count = sendbuf.large_count();
+                    large_count_call!(
+                        MPI_Iscan / MPI_Iscan_c,
+                        [count],
+                        (
+                            sendbuf.pointer(),
+                            recvbuf.pointer_mut(),
+                            count,
+                            sendbuf.as_datatype().as_raw(),
+                            op.as_raw(),
+                            self.as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -650,14 +993,19 @@ pub trait CommunicatorCollectives: Communicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Iexscan(
-                        sendbuf.pointer(),
-                        recvbuf.pointer_mut(),
-                        sendbuf.count(),
-                        sendbuf.as_datatype().as_raw(),
-                        op.as_raw(),
-                        self.as_raw(),
-                        request,
+                    let count = sendbuf.large_count();
+                    large_count_call!(
+                        MPI_Iexscan / MPI_Iexscan_c,
+                        [count],
+                        (
+                            sendbuf.pointer(),
+                            recvbuf.pointer_mut(),
+                            count,
+                            sendbuf.as_datatype().as_raw(),
+                            op.as_raw(),
+                            self.as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -666,92 +1014,419 @@ pub trait CommunicatorCollectives: Communicator {
             )
         }
     }
-}
 
-impl<C: Communicator + ?Sized> CommunicatorCollectives for C {}
-
-/// Something that can take the role of 'root' in a collective operation.
-///
-/// Many collective operations define a 'root' process that takes a special role in the
-/// communication. These collective operations are implemented as default methods of this trait.
-pub trait Root: AsCommunicator {
-    /// Rank of the root process
-    fn root_rank(&self) -> Rank;
+    /// Create a persistent request for barrier synchronization among all processes in the
+    /// `Communicator`.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/persistent_collectives.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 6.13 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn barrier_init(&self) -> PersistentRequest<'static, ()> {
+        unsafe {
+            let request = with_uninitialized(|request| {
+                ffi::MPI_Barrier_init(self.as_raw(), ffi::RSMPI_INFO_NULL_fn(), request)
+            })
+            .1;
+            // A barrier has no buffer; leaking a box of `()` does not allocate.
+            PersistentRequest::from_raw(request, Box::leak(Box::new(())), StaticScope)
+        }
+    }
 
-    /// Broadcast of the contents of a buffer
+    /// Create a persistent request that gathers the contents of all `sendbuf`s into all `recvbuf`s
+    /// on all processes in the communicator.
     ///
-    /// After the call completes, the `Buffer` on all processes in the `Communicator` of the `Root`
-    /// `&self` will contain what it contains on the `Root`.
+    /// The request is created inactive; each `start()` gathers the current contents of `sendbuf`.
     ///
     /// # Examples
     ///
-    /// See `examples/broadcast.rs`
+    /// See `examples/persistent_collectives.rs`
     ///
     /// # Standard section(s)
     ///
-    /// 5.4
-    fn broadcast_into<Buf: ?Sized>(&self, buffer: &mut Buf)
+    /// 6.13 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn all_gather_init<'a, S: ?Sized, R: ?Sized, Sc>(
+        &self,
+        scope: Sc,
+        sendbuf: &'a mut S,
+        recvbuf: &'a mut R,
+    ) -> PersistentCollectiveRequest<'a, S, R, Sc>
     where
-        Buf: BufferMut,
+        S: 'a + Buffer,
+        R: 'a + BufferMut,
+        Sc: Scope<'a>,
     {
+        let recvcount = recvbuf.large_count() / LargeCount::from(self.target_size());
         unsafe {
-            ffi::MPI_Bcast(
-                buffer.pointer_mut(),
-                buffer.count(),
-                buffer.as_datatype().as_raw(),
-                self.root_rank(),
-                self.as_communicator().as_raw(),
-            );
+            let request = with_uninitialized(|request| {
+                let sendcount = sendbuf.large_count();
+                large_count_call!(
+                    MPI_Allgather_init / MPI_Allgather_init_c,
+                    [sendcount, recvcount],
+                    (
+                        sendbuf.pointer(),
+                        sendcount,
+                        sendbuf.as_datatype().as_raw(),
+                        recvbuf.pointer_mut(),
+                        recvcount,
+                        recvbuf.as_datatype().as_raw(),
+                        self.as_raw(),
+                        ffi::RSMPI_INFO_NULL_fn(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentCollectiveRequest::from_raw(request, sendbuf, recvbuf, scope)
         }
     }
 
-    /// Gather contents of buffers on `Root`.
-    ///
-    /// After the call completes, the contents of the `Buffer`s on all ranks will be
-    /// concatenated into the `Buffer` on `Root`.
-    ///
-    /// All send `Buffer`s must have the same count of elements.
+    /// Create a persistent request that distributes the send `Buffer`s from all processes to the
+    /// receive `Buffer`s on all processes.
     ///
-    /// This function must be called on all non-root processes.
+    /// Each process sends and receives the same count of elements to and from each process.
     ///
     /// # Examples
     ///
-    /// See `examples/gather.rs`
+    /// See `examples/persistent_collectives.rs`
     ///
     /// # Standard section(s)
     ///
-    /// 5.5
-    fn gather_into<S: ?Sized>(&self, sendbuf: &S)
+    /// 6.13 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn all_to_all_init<'a, S: ?Sized, R: ?Sized, Sc>(
+        &self,
+        scope: Sc,
+        sendbuf: &'a mut S,
+        recvbuf: &'a mut R,
+    ) -> PersistentCollectiveRequest<'a, S, R, Sc>
     where
-        S: Buffer,
+        S: 'a + Buffer,
+        R: 'a + BufferMut,
+        Sc: Scope<'a>,
     {
-        assert_ne!(self.as_communicator().rank(), self.root_rank());
+        let c_size = LargeCount::from(self.target_size());
+        let sendcount = sendbuf.large_count() / c_size;
+        let recvcount = recvbuf.large_count() / c_size;
         unsafe {
-            ffi::MPI_Gather(
-                sendbuf.pointer(),
-                sendbuf.count(),
-                sendbuf.as_datatype().as_raw(),
-                ptr::null_mut(),
-                0,
-                u8::equivalent_datatype().as_raw(),
-                self.root_rank(),
-                self.as_communicator().as_raw(),
-            );
+            let request = with_uninitialized(|request| {
+                large_count_call!(
+                    MPI_Alltoall_init / MPI_Alltoall_init_c,
+                    [sendcount, recvcount],
+                    (
+                        sendbuf.pointer(),
+                        sendcount,
+                        sendbuf.as_datatype().as_raw(),
+                        recvbuf.pointer_mut(),
+                        recvcount,
+                        recvbuf.as_datatype().as_raw(),
+                        self.as_raw(),
+                        ffi::RSMPI_INFO_NULL_fn(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentCollectiveRequest::from_raw(request, sendbuf, recvbuf, scope)
         }
     }
 
-    /// Gather contents of buffers on `Root`.
-    ///
-    /// After the call completes, the contents of the `Buffer`s on all ranks will be
-    /// concatenated into the `Buffer` on `Root`.
+    /// Create a persistent request for a global reduction under the operation `op` of the input
+    /// data in `sendbuf`, storing the result in `recvbuf` on all processes.
     ///
-    /// All send `Buffer`s must have the same count of elements.
-    ///
-    /// This function must be called on the root process.
+    /// Solvers that reduce the same buffers every iteration can set the reduction up once and
+    /// then only `start()` and `wait()` it.
     ///
     /// # Examples
     ///
-    /// See `examples/gather.rs`
+    /// See `examples/persistent_collectives.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 6.13 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn all_reduce_init<'a, S: ?Sized, R: ?Sized, O, Sc>(
+        &self,
+        scope: Sc,
+        sendbuf: &'a mut S,
+        recvbuf: &'a mut R,
+        op: O,
+    ) -> PersistentCollectiveRequest<'a, S, R, Sc>
+    where
+        S: 'a + Buffer,
+        R: 'a + BufferMut,
+        O: 'a + Operation,
+        Sc: Scope<'a>,
+    {
+        unsafe {
+            let request = with_uninitialized(|request| {
+                let count = sendbuf.large_count();
+                large_count_call!(
+                    MPI_Allreduce_init / MPI_Allreduce_init_c,
+                    [count],
+                    (
+                        sendbuf.pointer(),
+                        recvbuf.pointer_mut(),
+                        count,
+                        sendbuf.as_datatype().as_raw(),
+                        op.as_raw(),
+                        self.as_raw(),
+                        ffi::RSMPI_INFO_NULL_fn(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentCollectiveRequest::from_raw(request, sendbuf, recvbuf, scope)
+        }
+    }
+
+    /// Create a persistent request for a global inclusive prefix reduction of the data in
+    /// `sendbuf` into `recvbuf` under operation `op`.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/persistent_collectives.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 6.13 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn scan_init<'a, S: ?Sized, R: ?Sized, O, Sc>(
+        &self,
+        scope: Sc,
+        sendbuf: &'a mut S,
+        recvbuf: &'a mut R,
+        op: O,
+    ) -> PersistentCollectiveRequest<'a, S, R, Sc>
+    where
+        S: 'a + Buffer,
+        R: 'a + BufferMut,
+        O: 'a + Operation,
+        Sc: Scope<'a>,
+    {
+        unsafe {
+            let request = with_uninitialized(|request| {
+                let count = sendbuf.large_count();
+                large_count_call!(
+                    MPI_Scan_init / MPI_Scan_init_c,
+                    [count],
+                    (
+                        sendbuf.pointer(),
+                        recvbuf.pointer_mut(),
+                        count,
+                        sendbuf.as_datatype().as_raw(),
+                        op.as_raw(),
+                        self.as_raw(),
+                        ffi::RSMPI_INFO_NULL_fn(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentCollectiveRequest::from_raw(request, sendbuf, recvbuf, scope)
+        }
+    }
+
+    /// Create a persistent request for a global exclusive prefix reduction of the data in
+    /// `sendbuf` into `recvbuf` under operation `op`.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/persistent_collectives.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 6.13 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn exclusive_scan_init<'a, S: ?Sized, R: ?Sized, O, Sc>(
+        &self,
+        scope: Sc,
+        sendbuf: &'a mut S,
+        recvbuf: &'a mut R,
+        op: O,
+    ) -> PersistentCollectiveRequest<'a, S, R, Sc>
+    where
+        S: 'a + Buffer,
+        R: 'a + BufferMut,
+        O: 'a + Operation,
+        Sc: Scope<'a>,
+    {
+        unsafe {
+            let request = with_uninitialized(|request| {
+                let count = sendbuf.large_count();
+                large_count_call!(
+                    MPI_Exscan_init / MPI_Exscan_init_c,
+                    [count],
+                    (
+                        sendbuf.pointer(),
+                        recvbuf.pointer_mut(),
+                        count,
+                        sendbuf.as_datatype().as_raw(),
+                        op.as_raw(),
+                        self.as_raw(),
+                        ffi::RSMPI_INFO_NULL_fn(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentCollectiveRequest::from_raw(request, sendbuf, recvbuf, scope)
+        }
+    }
+
+    /// Create a persistent request for a global reduction under the operation `op` of the input
+    /// data in `sendbuf`, scattering the result into equal sized blocks in the receive buffers on
+    /// all processes.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/persistent_collectives.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 6.13 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn reduce_scatter_block_init<'a, S: ?Sized, R: ?Sized, O, Sc>(
+        &self,
+        scope: Sc,
+        sendbuf: &'a mut S,
+        recvbuf: &'a mut R,
+        op: O,
+    ) -> PersistentCollectiveRequest<'a, S, R, Sc>
+    where
+        S: 'a + Buffer,
+        R: 'a + BufferMut,
+        O: 'a + Operation,
+        Sc: Scope<'a>,
+    {
+        assert_eq!(
+            recvbuf.large_count() * LargeCount::from(self.target_size()),
+            sendbuf.large_count()
+        );
+        unsafe {
+            let request = with_uninitialized(|request| {
+                let recvcount = recvbuf.large_count();
+                large_count_call!(
+                    MPI_Reduce_scatter_block_init / MPI_Reduce_scatter_block_init_c,
+                    [recvcount],
+                    (
+                        sendbuf.pointer(),
+                        recvbuf.pointer_mut(),
+                        recvcount,
+                        sendbuf.as_datatype().as_raw(),
+                        op.as_raw(),
+                        self.as_raw(),
+                        ffi::RSMPI_INFO_NULL_fn(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentCollectiveRequest::from_raw(request, sendbuf, recvbuf, scope)
+        }
+    }
+}
+
+impl<C: Communicator + ?Sized> CommunicatorCollectives for C {}
+
+/// Something that can take the role of 'root' in a collective operation.
+///
+/// Many collective operations define a 'root' process that takes a special role in the
+/// communication. These collective operations are implemented as default methods of this trait.
+pub trait Root: AsCommunicator {
+    /// Rank of the root process
+    fn root_rank(&self) -> Rank;
+
+    /// Broadcast of the contents of a buffer
+    ///
+    /// After the call completes, the `Buffer` on all processes in the `Communicator` of the `Root`
+    /// `&self` will contain what it contains on the `Root`.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/broadcast.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.4
+    fn broadcast_into<Buf: ?Sized>(&self, buffer: &mut Buf)
+    where
+        Buf: BufferMut,
+    {
+        unsafe {
+            let count = buffer.large_count();
+            large_count_call!(
+                MPI_Bcast / MPI_Bcast_c,
+                [count],
+                (
+                    buffer.pointer_mut(),
+                    count,
+                    buffer.as_datatype().as_raw(),
+                    self.root_rank(),
+                    self.as_communicator().as_raw()
+                )
+            );
+        }
+    }
+
+    /// Gather contents of buffers on `Root`.
+    ///
+    /// After the call completes, the contents of the `Buffer`s on all ranks will be
+    /// concatenated into the `Buffer` on `Root`.
+    ///
+    /// All send `Buffer`s must have the same count of elements.
+    ///
+    /// This function must be called on all non-root processes.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/gather.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.5
+    fn gather_into<S: ?Sized>(&self, sendbuf: &S)
+    where
+        S: Buffer,
+    {
+        assert_ne!(self.as_communicator().rank(), self.root_rank());
+        unsafe {
+            let sendcount = sendbuf.large_count();
+            large_count_call!(
+                MPI_Gather / MPI_Gather_c,
+                [sendcount],
+                (
+                    sendbuf.pointer(),
+                    sendcount,
+                    sendbuf.as_datatype().as_raw(),
+                    ptr::null_mut(),
+                    0,
+                    u8::equivalent_datatype().as_raw(),
+                    self.root_rank(),
+                    self.as_communicator().as_raw()
+                )
+            );
+        }
+    }
+
+    /// Gather contents of buffers on `Root`.
+    ///
+    /// After the call completes, the contents of the `Buffer`s on all ranks will be
+    /// concatenated into the `Buffer` on `Root`.
+    ///
+    /// All send `Buffer`s must have the same count of elements.
+    ///
+    /// This function must be called on the root process.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/gather.rs`
     ///
     /// # Standard section(s)
     ///
@@ -763,16 +1438,22 @@ pub trait Root: AsCommunicator {
     {
         assert_eq!(self.as_communicator().rank(), self.root_rank());
         unsafe {
-            let recvcount = recvbuf.count() / self.as_communicator().target_size();
-            ffi::MPI_Gather(
-                sendbuf.pointer(),
-                sendbuf.count(),
-                sendbuf.as_datatype().as_raw(),
-                recvbuf.pointer_mut(),
-                recvcount,
-                recvbuf.as_datatype().as_raw(),
-                self.root_rank(),
-                self.as_communicator().as_raw(),
+            let recvcount =
+                recvbuf.large_count() / LargeCount::from(self.as_communicator().target_size());
+            let sendcount = sendbuf.large_count();
+            large_count_call!(
+                MPI_Gather / MPI_Gather_c,
+                [sendcount, recvcount],
+                (
+                    sendbuf.pointer(),
+                    sendcount,
+                    sendbuf.as_datatype().as_raw(),
+                    recvbuf.pointer_mut(),
+                    recvcount,
+                    recvbuf.as_datatype().as_raw(),
+                    self.root_rank(),
+                    self.as_communicator().as_raw()
+                )
             );
         }
     }
@@ -800,16 +1481,21 @@ pub trait Root: AsCommunicator {
     {
         assert_ne!(self.as_communicator().rank(), self.root_rank());
         unsafe {
-            ffi::MPI_Gatherv(
-                sendbuf.pointer(),
-                sendbuf.count(),
-                sendbuf.as_datatype().as_raw(),
-                ptr::null_mut(),
-                ptr::null(),
-                ptr::null(),
-                u8::equivalent_datatype().as_raw(),
-                self.root_rank(),
-                self.as_communicator().as_raw(),
+            let sendcount = sendbuf.large_count();
+            large_count_call!(
+                MPI_Gatherv / MPI_Gatherv_c,
+                [sendcount],
+                (
+                    sendbuf.pointer(),
+                    sendcount,
+                    sendbuf.as_datatype().as_raw(),
+                    ptr::null_mut(),
+                    ptr::null(),
+                    ptr::null(),
+                    u8::equivalent_datatype().as_raw(),
+                    self.root_rank(),
+                    self.as_communicator().as_raw()
+                )
             );
         }
     }
@@ -838,20 +1524,65 @@ pub trait Root: AsCommunicator {
     {
         assert_eq!(self.as_communicator().rank(), self.root_rank());
         unsafe {
-            ffi::MPI_Gatherv(
-                sendbuf.pointer(),
-                sendbuf.count(),
-                sendbuf.as_datatype().as_raw(),
-                recvbuf.pointer_mut(),
-                recvbuf.counts().as_ptr(),
-                recvbuf.displs().as_ptr(),
-                recvbuf.as_datatype().as_raw(),
-                self.root_rank(),
-                self.as_communicator().as_raw(),
+            let recvbuf_ptr = recvbuf.pointer_mut();
+            let sendcount = sendbuf.large_count();
+            let recvcounts = recvbuf.counts();
+            let displs = recvbuf.displs();
+            large_count_call!(
+                MPI_Gatherv / MPI_Gatherv_c,
+                [sendcount],
+                [(recvcounts, displs)],
+                (
+                    sendbuf.pointer(),
+                    sendcount,
+                    sendbuf.as_datatype().as_raw(),
+                    recvbuf_ptr,
+                    recvcounts.as_ptr(),
+                    displs.as_ptr(),
+                    recvbuf.as_datatype().as_raw(),
+                    self.root_rank(),
+                    self.as_communicator().as_raw()
+                )
             );
         }
     }
 
+    /// Send the `count` of elements this process contributes to a gather to the root.
+    ///
+    /// This function must be called on all non-root processes.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/all_to_all_plan.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.5
+    fn gather_layout(&self, count: Count) {
+        self.gather_into(&count);
+    }
+
+    /// Gather the counts of elements all processes contribute to a gather and lay out the receive
+    /// buffer accordingly.
+    ///
+    /// The returned `Layout` partitions the receive buffer of `gather_varcount_into_root()` and
+    /// the send buffer of `scatter_varcount_into_root()` for as long as the counts stay the same.
+    ///
+    /// This function must be called on the root process.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/all_to_all_plan.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.5
+    fn gather_layout_root(&self, count: Count) -> Layout {
+        let mut counts: Vec<Count> = vec![0; block_count(self.as_communicator())];
+        self.gather_into_root(&count, &mut counts[..]);
+        Layout::contiguous(counts)
+    }
+
     /// Scatter contents of a buffer on the root process to all processes.
     ///
     /// After the call completes each participating process will have received a part of the send
@@ -874,15 +1605,20 @@ pub trait Root: AsCommunicator {
     {
         assert_ne!(self.as_communicator().rank(), self.root_rank());
         unsafe {
-            ffi::MPI_Scatter(
-                ptr::null(),
-                0,
-                u8::equivalent_datatype().as_raw(),
-                recvbuf.pointer_mut(),
-                recvbuf.count(),
-                recvbuf.as_datatype().as_raw(),
-                self.root_rank(),
-                self.as_communicator().as_raw(),
+            let recvcount = recvbuf.large_count();
+            large_count_call!(
+                MPI_Scatter / MPI_Scatter_c,
+                [recvcount],
+                (
+                    ptr::null(),
+                    0,
+                    u8::equivalent_datatype().as_raw(),
+                    recvbuf.pointer_mut(),
+                    recvcount,
+                    recvbuf.as_datatype().as_raw(),
+                    self.root_rank(),
+                    self.as_communicator().as_raw()
+                )
             );
         }
     }
@@ -909,17 +1645,23 @@ pub trait Root: AsCommunicator {
         R: BufferMut,
     {
         assert_eq!(self.as_communicator().rank(), self.root_rank());
-        let sendcount = sendbuf.count() / self.as_communicator().target_size();
+        let sendcount =
+            sendbuf.large_count() / LargeCount::from(self.as_communicator().target_size());
         unsafe {
-            ffi::MPI_Scatter(
-                sendbuf.pointer(),
-                sendcount,
-                sendbuf.as_datatype().as_raw(),
-                recvbuf.pointer_mut(),
-                recvbuf.count(),
-                recvbuf.as_datatype().as_raw(),
-                self.root_rank(),
-                self.as_communicator().as_raw(),
+            let recvcount = recvbuf.large_count();
+            large_count_call!(
+                MPI_Scatter / MPI_Scatter_c,
+                [sendcount, recvcount],
+                (
+                    sendbuf.pointer(),
+                    sendcount,
+                    sendbuf.as_datatype().as_raw(),
+                    recvbuf.pointer_mut(),
+                    recvcount,
+                    recvbuf.as_datatype().as_raw(),
+                    self.root_rank(),
+                    self.as_communicator().as_raw()
+                )
             );
         }
     }
@@ -947,16 +1689,21 @@ pub trait Root: AsCommunicator {
     {
         assert_ne!(self.as_communicator().rank(), self.root_rank());
         unsafe {
-            ffi::MPI_Scatterv(
-                ptr::null(),
-                ptr::null(),
-                ptr::null(),
-                u8::equivalent_datatype().as_raw(),
-                recvbuf.pointer_mut(),
-                recvbuf.count(),
-                recvbuf.as_datatype().as_raw(),
-                self.root_rank(),
-                self.as_communicator().as_raw(),
+            let recvcount = recvbuf.large_count();
+            large_count_call!(
+                MPI_Scatterv / MPI_Scatterv_c,
+                [recvcount],
+                (
+                    ptr::null(),
+                    ptr::null(),
+                    ptr::null(),
+                    u8::equivalent_datatype().as_raw(),
+                    recvbuf.pointer_mut(),
+                    recvcount,
+                    recvbuf.as_datatype().as_raw(),
+                    self.root_rank(),
+                    self.as_communicator().as_raw()
+                )
             );
         }
     }
@@ -985,16 +1732,24 @@ pub trait Root: AsCommunicator {
     {
         assert_eq!(self.as_communicator().rank(), self.root_rank());
         unsafe {
-            ffi::MPI_Scatterv(
-                sendbuf.pointer(),
-                sendbuf.counts().as_ptr(),
-                sendbuf.displs().as_ptr(),
-                sendbuf.as_datatype().as_raw(),
-                recvbuf.pointer_mut(),
-                recvbuf.count(),
-                recvbuf.as_datatype().as_raw(),
-                self.root_rank(),
-                self.as_communicator().as_raw(),
+            let sendcounts = sendbuf.counts();
+            let displs = sendbuf.displs();
+            let recvcount = recvbuf.large_count();
+            large_count_call!(
+                MPI_Scatterv / MPI_Scatterv_c,
+                [recvcount],
+                [(sendcounts, displs)],
+                (
+                    sendbuf.pointer(),
+                    sendcounts.as_ptr(),
+                    displs.as_ptr(),
+                    sendbuf.as_datatype().as_raw(),
+                    recvbuf.pointer_mut(),
+                    recvcount,
+                    recvbuf.as_datatype().as_raw(),
+                    self.root_rank(),
+                    self.as_communicator().as_raw()
+                )
             );
         }
     }
@@ -1018,14 +1773,19 @@ pub trait Root: AsCommunicator {
     {
         assert_ne!(self.as_communicator().rank(), self.root_rank());
         unsafe {
-            ffi::MPI_Reduce(
-                sendbuf.pointer(),
-                ptr::null_mut(),
-                sendbuf.count(),
-                sendbuf.as_datatype().as_raw(),
-                op.as_raw(),
-                self.root_rank(),
-                self.as_communicator().as_raw(),
+            let count = sendbuf.large_count();
+            large_count_call!(
+                MPI_Reduce / MPI_Reduce_c,
+                [count],
+                (
+                    sendbuf.pointer(),
+                    ptr::null_mut(),
+                    count,
+                    sendbuf.as_datatype().as_raw(),
+                    op.as_raw(),
+                    self.root_rank(),
+                    self.as_communicator().as_raw()
+                )
             );
         }
     }
@@ -1050,14 +1810,19 @@ pub trait Root: AsCommunicator {
     {
         assert_eq!(self.as_communicator().rank(), self.root_rank());
         unsafe {
-            ffi::MPI_Reduce(
-                sendbuf.pointer(),
-                recvbuf.pointer_mut(),
-                sendbuf.count(),
-                sendbuf.as_datatype().as_raw(),
-                op.as_raw(),
-                self.root_rank(),
-                self.as_communicator().as_raw(),
+            let count = sendbuf.large_count();
+            large_count_call!(
+                MPI_Reduce / MPI_Reduce_c,
+                [count],
+                (
+                    sendbuf.pointer(),
+                    recvbuf.pointer_mut(),
+                    count,
+                    sendbuf.as_datatype().as_raw(),
+                    op.as_raw(),
+                    self.root_rank(),
+                    self.as_communicator().as_raw()
+                )
             );
         }
     }
@@ -1083,13 +1848,18 @@ pub trait Root: AsCommunicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Ibcast(
-                        buf.pointer_mut(),
-                        buf.count(),
-                        buf.as_datatype().as_raw(),
-                        self.root_rank(),
-                        self.as_communicator().as_raw(),
-                        request,
+                    let count = buf.large_count();
+                    large_count_call!(
+                        MPI_Ibcast / MPI_Ibcast_c,
+                        [count],
+                        (
+                            buf.pointer_mut(),
+                            count,
+                            buf.as_datatype().as_raw(),
+                            self.root_rank(),
+                            self.as_communicator().as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -1123,16 +1893,21 @@ pub trait Root: AsCommunicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Igather(
-                        sendbuf.pointer(),
-                        sendbuf.count(),
-                        sendbuf.as_datatype().as_raw(),
-                        ptr::null_mut(),
-                        0,
-                        u8::equivalent_datatype().as_raw(),
-                        self.root_rank(),
-                        self.as_communicator().as_raw(),
-                        request,
+                    let sendcount = sendbuf.large_count();
+                    large_count_call!(
+                        MPI_Igather / MPI_Igather_c,
+                        [sendcount],
+                        (
+                            sendbuf.pointer(),
+                            sendcount,
+                            sendbuf.as_datatype().as_raw(),
+                            ptr::null_mut(),
+                            0,
+                            u8::equivalent_datatype().as_raw(),
+                            self.root_rank(),
+                            self.as_communicator().as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -1166,19 +1941,25 @@ pub trait Root: AsCommunicator {
     {
         assert_eq!(self.as_communicator().rank(), self.root_rank());
         unsafe {
-            let recvcount = recvbuf.count() / self.as_communicator().target_size();
+            let recvcount =
+                recvbuf.large_count() / LargeCount::from(self.as_communicator().target_size());
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Igather(
-                        sendbuf.pointer(),
-                        sendbuf.count(),
-                        sendbuf.as_datatype().as_raw(),
-                        recvbuf.pointer_mut(),
-                        recvcount,
-                        recvbuf.as_datatype().as_raw(),
-                        self.root_rank(),
-                        self.as_communicator().as_raw(),
-                        request,
+                    let sendcount = sendbuf.large_count();
+                    large_count_call!(
+                        MPI_Igather / MPI_Igather_c,
+                        [sendcount, recvcount],
+                        (
+                            sendbuf.pointer(),
+                            sendcount,
+                            sendbuf.as_datatype().as_raw(),
+                            recvbuf.pointer_mut(),
+                            recvcount,
+                            recvbuf.as_datatype().as_raw(),
+                            self.root_rank(),
+                            self.as_communicator().as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -1212,17 +1993,22 @@ pub trait Root: AsCommunicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Igatherv(
-                        sendbuf.pointer(),
-                        sendbuf.count(),
-                        sendbuf.as_datatype().as_raw(),
-                        ptr::null_mut(),
-                        ptr::null(),
-                        ptr::null(),
-                        u8::equivalent_datatype().as_raw(),
-                        self.root_rank(),
-                        self.as_communicator().as_raw(),
-                        request,
+                    let sendcount = sendbuf.large_count();
+                    large_count_call!(
+                        MPI_Igatherv / MPI_Igatherv_c,
+                        [sendcount],
+                        (
+                            sendbuf.pointer(),
+                            sendcount,
+                            sendbuf.as_datatype().as_raw(),
+                            ptr::null_mut(),
+                            ptr::null(),
+                            ptr::null(),
+                            u8::equivalent_datatype().as_raw(),
+                            self.root_rank(),
+                            self.as_communicator().as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -1258,17 +2044,26 @@ pub trait Root: AsCommunicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Igatherv(
-                        sendbuf.pointer(),
-                        sendbuf.count(),
-                        sendbuf.as_datatype().as_raw(),
-                        recvbuf.pointer_mut(),
-                        recvbuf.counts().as_ptr(),
-                        recvbuf.displs().as_ptr(),
-                        recvbuf.as_datatype().as_raw(),
-                        self.root_rank(),
-                        self.as_communicator().as_raw(),
-                        request,
+                    let recvbuf_ptr = recvbuf.pointer_mut();
+                    let sendcount = sendbuf.large_count();
+                    let recvcounts = recvbuf.counts();
+                    let displs = recvbuf.displs();
+                    large_count_call!(
+                        MPI_Igatherv / MPI_Igatherv_c,
+                        [sendcount],
+                        [(recvcounts, displs)],
+                        (
+                            sendbuf.pointer(),
+                            sendcount,
+                            sendbuf.as_datatype().as_raw(),
+                            recvbuf_ptr,
+                            recvcounts.as_ptr(),
+                            displs.as_ptr(),
+                            recvbuf.as_datatype().as_raw(),
+                            self.root_rank(),
+                            self.as_communicator().as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -1302,16 +2097,21 @@ pub trait Root: AsCommunicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Iscatter(
-                        ptr::null(),
-                        0,
-                        u8::equivalent_datatype().as_raw(),
-                        recvbuf.pointer_mut(),
-                        recvbuf.count(),
-                        recvbuf.as_datatype().as_raw(),
-                        self.root_rank(),
-                        self.as_communicator().as_raw(),
-                        request,
+                    let recvcount = recvbuf.large_count();
+                    large_count_call!(
+                        MPI_Iscatter / MPI_Iscatter_c,
+                        [recvcount],
+                        (
+                            ptr::null(),
+                            0,
+                            u8::equivalent_datatype().as_raw(),
+                            recvbuf.pointer_mut(),
+                            recvcount,
+                            recvbuf.as_datatype().as_raw(),
+                            self.root_rank(),
+                            self.as_communicator().as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -1345,19 +2145,25 @@ pub trait Root: AsCommunicator {
     {
         assert_eq!(self.as_communicator().rank(), self.root_rank());
         unsafe {
-            let sendcount = sendbuf.count() / self.as_communicator().target_size();
+            let sendcount =
+                sendbuf.large_count() / LargeCount::from(self.as_communicator().target_size());
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Iscatter(
-                        sendbuf.pointer(),
-                        sendcount,
-                        sendbuf.as_datatype().as_raw(),
-                        recvbuf.pointer_mut(),
-                        recvbuf.count(),
-                        recvbuf.as_datatype().as_raw(),
-                        self.root_rank(),
-                        self.as_communicator().as_raw(),
-                        request,
+                    let recvcount = recvbuf.large_count();
+                    large_count_call!(
+                        MPI_Iscatter / MPI_Iscatter_c,
+                        [sendcount, recvcount],
+                        (
+                            sendbuf.pointer(),
+                            sendcount,
+                            sendbuf.as_datatype().as_raw(),
+                            recvbuf.pointer_mut(),
+                            recvcount,
+                            recvbuf.as_datatype().as_raw(),
+                            self.root_rank(),
+                            self.as_communicator().as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -1391,17 +2197,22 @@ pub trait Root: AsCommunicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Iscatterv(
-                        ptr::null(),
-                        ptr::null(),
-                        ptr::null(),
-                        u8::equivalent_datatype().as_raw(),
-                        recvbuf.pointer_mut(),
-                        recvbuf.count(),
-                        recvbuf.as_datatype().as_raw(),
-                        self.root_rank(),
-                        self.as_communicator().as_raw(),
-                        request,
+                    let recvcount = recvbuf.large_count();
+                    large_count_call!(
+                        MPI_Iscatterv / MPI_Iscatterv_c,
+                        [recvcount],
+                        (
+                            ptr::null(),
+                            ptr::null(),
+                            ptr::null(),
+                            u8::equivalent_datatype().as_raw(),
+                            recvbuf.pointer_mut(),
+                            recvcount,
+                            recvbuf.as_datatype().as_raw(),
+                            self.root_rank(),
+                            self.as_communicator().as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -1437,17 +2248,25 @@ pub trait Root: AsCommunicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Iscatterv(
-                        sendbuf.pointer(),
-                        sendbuf.counts().as_ptr(),
-                        sendbuf.displs().as_ptr(),
-                        sendbuf.as_datatype().as_raw(),
-                        recvbuf.pointer_mut(),
-                        recvbuf.count(),
-                        recvbuf.as_datatype().as_raw(),
-                        self.root_rank(),
-                        self.as_communicator().as_raw(),
-                        request,
+                    let sendcounts = sendbuf.counts();
+                    let displs = sendbuf.displs();
+                    let recvcount = recvbuf.large_count();
+                    large_count_call!(
+                        MPI_Iscatterv / MPI_Iscatterv_c,
+                        [recvcount],
+                        [(sendcounts, displs)],
+                        (
+                            sendbuf.pointer(),
+                            sendcounts.as_ptr(),
+                            displs.as_ptr(),
+                            sendbuf.as_datatype().as_raw(),
+                            recvbuf.pointer_mut(),
+                            recvcount,
+                            recvbuf.as_datatype().as_raw(),
+                            self.root_rank(),
+                            self.as_communicator().as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -1484,15 +2303,20 @@ pub trait Root: AsCommunicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Ireduce(
-                        sendbuf.pointer(),
-                        ptr::null_mut(),
-                        sendbuf.count(),
-                        sendbuf.as_datatype().as_raw(),
-                        op.as_raw(),
-                        self.root_rank(),
-                        self.as_communicator().as_raw(),
-                        request,
+                    let count = sendbuf.large_count();
+                    large_count_call!(
+                        MPI_Ireduce / MPI_Ireduce_c,
+                        [count],
+                        (
+                            sendbuf.pointer(),
+                            ptr::null_mut(),
+                            count,
+                            sendbuf.as_datatype().as_raw(),
+                            op.as_raw(),
+                            self.root_rank(),
+                            self.as_communicator().as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -1531,15 +2355,20 @@ pub trait Root: AsCommunicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Ireduce(
-                        sendbuf.pointer(),
-                        recvbuf.pointer_mut(),
-                        sendbuf.count(),
-                        sendbuf.as_datatype().as_raw(),
-                        op.as_raw(),
-                        self.root_rank(),
-                        self.as_communicator().as_raw(),
-                        request,
+                    let count = sendbuf.large_count();
+                    large_count_call!(
+                        MPI_Ireduce / MPI_Ireduce_c,
+                        [count],
+                        (
+                            sendbuf.pointer(),
+                            recvbuf.pointer_mut(),
+                            count,
+                            sendbuf.as_datatype().as_raw(),
+                            op.as_raw(),
+                            self.root_rank(),
+                            self.as_communicator().as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -1549,157 +2378,1006 @@ pub trait Root: AsCommunicator {
         }
     }
 
-    /// Spawns child processes
+    /// Create a persistent request that broadcasts the contents of `buf` from `Root` `&self` to
+    /// `buf` on all other processes.
     ///
-    /// # Standard sections
-    /// 10.3.2, see MPI_Comm_spawn
-    fn spawn(&self, command: &Command, maxprocs: Rank) -> Result<InterCommunicator, MpiError> {
-        // Environment variables can be handled using the info key
-        assert_eq!(
-            command.get_envs().len(),
-            0,
-            "Support for environment variables not yet implemented"
-        );
-
-        // The Microsoft-MPI implementation treats the char* arguments as being
-        // encoded in utf8, and are internally converted to Windows wide
-        // characters. See ConvertArgs() using
-        // [`MultiByteToWideChar`](https://learn.microsoft.com/en-us/windows/win32/api/stringapiset/nf-stringapiset-multibytetowidechar)
-        // with `CP_UTF8` when called from MPIDI_Comm_spawn_multiple().
-        // https://github.com/microsoft/Microsoft-MPI/blob/7ff6bdcdb1d5dc7b791e47457ee2686cd6b3d355/src/mpi/msmpi/mpid/dynamic.cpp#L2074
-        //
-        // Since Windows wide-char strings are allowed to contain invalid
-        // UTF-16, such characters cannot be preserved. We'll choose lossy
-        // conversion, but returning an error is an option to consider.
-        let prog = CString::new(command.get_program().to_string_lossy().as_bytes())?;
-        let mut args: Vec<CString> = command
-            .get_args()
-            .map(|os| CString::new(os.to_string_lossy().as_bytes()))
-            .collect::<Result<Vec<CString>, NulError>>()?;
-        // We must retain args above so that the strings are not dropped while
-        // being used. An alternative that seems to be recommended any time the
-        // function takes mutable C strings is to use CString::into_raw to give
-        // ownership to the *mut c_char for the function call, then reclaim
-        // using CString::from_raw.
-        let mut argv: Vec<*mut c_char> = args
-            .iter_mut()
-            .map(|s| s.as_ptr() as *mut c_char)
-            .chain(std::iter::once(ptr::null_mut()))
-            .collect();
-
-        let mut result = ffi::RSMPI_COMM_NULL_fn();
-        let mut errcodes: Vec<c_int> =
-            vec![0; maxprocs.value_as().expect("maxprocs should be positive")];
-
+    /// The request is created inactive; each `start()` broadcasts the current contents of `buf` on
+    /// the root.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/persistent_collectives.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 6.13 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn broadcast_init<'a, Buf: ?Sized, Sc>(
+        &self,
+        scope: Sc,
+        buf: &'a mut Buf,
+    ) -> PersistentRequest<'a, Buf, Sc>
+    where
+        Buf: 'a + BufferMut,
+        Sc: Scope<'a>,
+    {
         unsafe {
-            ffi::MPI_Comm_spawn(
-                prog.as_ptr(),
-                argv.as_mut_ptr(),
-                maxprocs,
-                ffi::RSMPI_INFO_NULL_fn(),
-                self.root_rank(),
-                self.as_communicator().as_raw(),
-                &mut result,
-                errcodes.as_mut_ptr(),
-            );
-        }
-        let fails = errcodes
-            .into_iter()
-            .filter(|&c| c != ffi::RSMPI_SUCCESS_fn())
-            .count();
-        if fails > 0 {
-            Err(MpiError::Spawn(Rank::try_from(fails).unwrap(), maxprocs))
-        } else {
-            Ok(unsafe { InterCommunicator::from_raw(result) })
+            let request = with_uninitialized(|request| {
+                let count = buf.large_count();
+                large_count_call!(
+                    MPI_Bcast_init / MPI_Bcast_init_c,
+                    [count],
+                    (
+                        buf.pointer_mut(),
+                        count,
+                        buf.as_datatype().as_raw(),
+                        self.root_rank(),
+                        self.as_communicator().as_raw(),
+                        ffi::RSMPI_INFO_NULL_fn(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentRequest::from_raw(request, buf, scope)
         }
     }
 
-    /// Spawns child processes
+    /// Create a persistent request that gathers the contents of all `sendbuf`s on `Root` `&self`.
     ///
-    /// # Standard sections
-    /// 10.3.3, see MPI_Comm_spawn_multiple
-    fn spawn_multiple(
+    /// This function must be called on all non-root processes.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/persistent_collectives.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 6.13 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn gather_init<'a, S: ?Sized, Sc>(
         &self,
-        commands: &[Command],
-        maxprocs: &[Rank],
-    ) -> Result<InterCommunicator, MpiError> {
-        assert_eq!(commands.len(), maxprocs.len());
-
-        let progs = commands
-            .iter()
-            .map(|c| CString::new(c.get_program().to_string_lossy().as_bytes()))
-            .collect::<Result<Vec<CString>, NulError>>()?;
-        let mut progp: Vec<*mut c_char> = progs.iter().map(|p| p.as_ptr() as *mut c_char).collect();
-        let mut argss = commands
-            .iter()
-            .map(|c| {
-                c.get_args()
-                    .map(|os| CString::new(os.to_string_lossy().as_bytes()))
-                    .collect::<Result<Vec<CString>, NulError>>()
-            })
-            .collect::<Result<Vec<Vec<CString>>, NulError>>()?;
-        let mut argvs: Vec<Vec<*mut c_char>> = argss
-            .iter_mut()
-            .map(|args| {
-                args.iter_mut()
-                    .map(|a| a.as_ptr() as *mut c_char)
-                    .chain(std::iter::once(ptr::null_mut()))
-                    .collect()
-            })
-            .collect();
-
-        let mut argvv: Vec<*mut *mut c_char> =
-            argvs.iter_mut().map(|argv| argv.as_mut_ptr()).collect();
-
-        let infos: Vec<_> = (0..commands.len())
-            .map(|_| ffi::RSMPI_INFO_NULL_fn())
-            .collect();
-
-        let mut result = ffi::RSMPI_COMM_NULL_fn();
-        let sum_maxprocs: Rank = maxprocs.iter().sum();
-        let mut errcodes = vec![0; usize::try_from(sum_maxprocs).unwrap()];
-
+        scope: Sc,
+        sendbuf: &'a mut S,
+    ) -> PersistentRequest<'a, S, Sc>
+    where
+        S: 'a + Buffer,
+        Sc: Scope<'a>,
+    {
+        assert_ne!(self.as_communicator().rank(), self.root_rank());
         unsafe {
-            ffi::MPI_Comm_spawn_multiple(
-                progs.len().value_as().unwrap(),
-                progp.as_mut_ptr(),
-                argvv.as_mut_ptr(),
-                maxprocs.as_ptr(),
-                infos.as_ptr(),
-                self.root_rank(),
-                self.as_communicator().as_raw(),
-                &mut result,
-                errcodes.as_mut_ptr(),
-            );
-        }
-        let fails = errcodes
-            .into_iter()
-            .filter(|&c| c != ffi::RSMPI_SUCCESS_fn())
-            .count();
-        if fails > 0 {
-            Err(MpiError::Spawn(
-                Rank::try_from(fails).unwrap(),
-                sum_maxprocs,
-            ))
-        } else {
-            Ok(unsafe { InterCommunicator::from_raw(result) })
+            let request = with_uninitialized(|request| {
+                let sendcount = sendbuf.large_count();
+                large_count_call!(
+                    MPI_Gather_init / MPI_Gather_init_c,
+                    [sendcount],
+                    (
+                        sendbuf.pointer(),
+                        sendcount,
+                        sendbuf.as_datatype().as_raw(),
+                        ptr::null_mut(),
+                        0,
+                        u8::equivalent_datatype().as_raw(),
+                        self.root_rank(),
+                        self.as_communicator().as_raw(),
+                        ffi::RSMPI_INFO_NULL_fn(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentRequest::from_raw(request, sendbuf, scope)
         }
     }
-}
-
-impl<'a> Root for Process<'a> {
-    fn root_rank(&self) -> Rank {
-        self.rank()
-    }
-}
 
-/// An operation to be used in a reduction or scan type operation, e.g. `MPI_SUM`
-pub trait Operation: AsRaw<Raw = MPI_Op> {
-    /// Returns whether the operation is commutative.
+    /// Create a persistent request that gathers the contents of all `sendbuf`s into `recvbuf` on
+    /// `Root` `&self`.
     ///
-    /// # Standard section(s)
+    /// This function must be called on the root process.
     ///
-    /// 5.9.7
+    /// # Examples
+    ///
+    /// See `examples/persistent_collectives.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 6.13 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn gather_init_root<'a, S: ?Sized, R: ?Sized, Sc>(
+        &self,
+        scope: Sc,
+        sendbuf: &'a mut S,
+        recvbuf: &'a mut R,
+    ) -> PersistentCollectiveRequest<'a, S, R, Sc>
+    where
+        S: 'a + Buffer,
+        R: 'a + BufferMut,
+        Sc: Scope<'a>,
+    {
+        assert_eq!(self.as_communicator().rank(), self.root_rank());
+        let recvcount =
+            recvbuf.large_count() / LargeCount::from(self.as_communicator().target_size());
+        unsafe {
+            let request = with_uninitialized(|request| {
+                let sendcount = sendbuf.large_count();
+                large_count_call!(
+                    MPI_Gather_init / MPI_Gather_init_c,
+                    [sendcount, recvcount],
+                    (
+                        sendbuf.pointer(),
+                        sendcount,
+                        sendbuf.as_datatype().as_raw(),
+                        recvbuf.pointer_mut(),
+                        recvcount,
+                        recvbuf.as_datatype().as_raw(),
+                        self.root_rank(),
+                        self.as_communicator().as_raw(),
+                        ffi::RSMPI_INFO_NULL_fn(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentCollectiveRequest::from_raw(request, sendbuf, recvbuf, scope)
+        }
+    }
+
+    /// Create a persistent request that scatters the contents of `sendbuf` on `Root` `&self` into
+    /// `recvbuf`.
+    ///
+    /// This function must be called on all non-root processes.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/persistent_collectives.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 6.13 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn scatter_init<'a, R: ?Sized, Sc>(
+        &self,
+        scope: Sc,
+        recvbuf: &'a mut R,
+    ) -> PersistentRequest<'a, R, Sc>
+    where
+        R: 'a + BufferMut,
+        Sc: Scope<'a>,
+    {
+        assert_ne!(self.as_communicator().rank(), self.root_rank());
+        unsafe {
+            let request = with_uninitialized(|request| {
+                let recvcount = recvbuf.large_count();
+                large_count_call!(
+                    MPI_Scatter_init / MPI_Scatter_init_c,
+                    [recvcount],
+                    (
+                        ptr::null(),
+                        0,
+                        u8::equivalent_datatype().as_raw(),
+                        recvbuf.pointer_mut(),
+                        recvcount,
+                        recvbuf.as_datatype().as_raw(),
+                        self.root_rank(),
+                        self.as_communicator().as_raw(),
+                        ffi::RSMPI_INFO_NULL_fn(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentRequest::from_raw(request, recvbuf, scope)
+        }
+    }
+
+    /// Create a persistent request that scatters the contents of `sendbuf` on `Root` `&self`.
+    ///
+    /// This function must be called on the root process.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/persistent_collectives.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 6.13 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn scatter_init_root<'a, S: ?Sized, R: ?Sized, Sc>(
+        &self,
+        scope: Sc,
+        sendbuf: &'a mut S,
+        recvbuf: &'a mut R,
+    ) -> PersistentCollectiveRequest<'a, S, R, Sc>
+    where
+        S: 'a + Buffer,
+        R: 'a + BufferMut,
+        Sc: Scope<'a>,
+    {
+        assert_eq!(self.as_communicator().rank(), self.root_rank());
+        let sendcount =
+            sendbuf.large_count() / LargeCount::from(self.as_communicator().target_size());
+        unsafe {
+            let request = with_uninitialized(|request| {
+                let recvcount = recvbuf.large_count();
+                large_count_call!(
+                    MPI_Scatter_init / MPI_Scatter_init_c,
+                    [sendcount, recvcount],
+                    (
+                        sendbuf.pointer(),
+                        sendcount,
+                        sendbuf.as_datatype().as_raw(),
+                        recvbuf.pointer_mut(),
+                        recvcount,
+                        recvbuf.as_datatype().as_raw(),
+                        self.root_rank(),
+                        self.as_communicator().as_raw(),
+                        ffi::RSMPI_INFO_NULL_fn(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentCollectiveRequest::from_raw(request, sendbuf, recvbuf, scope)
+        }
+    }
+
+    /// Create a persistent request for a global reduction under the operation `op` of the input
+    /// data in `sendbuf`, storing the result on the `Root` process.
+    ///
+    /// This function must be called on all non-root processes.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/persistent_collectives.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 6.13 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn reduce_init<'a, S: ?Sized, O, Sc>(
+        &self,
+        scope: Sc,
+        sendbuf: &'a mut S,
+        op: O,
+    ) -> PersistentRequest<'a, S, Sc>
+    where
+        S: 'a + Buffer,
+        O: 'a + Operation,
+        Sc: Scope<'a>,
+    {
+        assert_ne!(self.as_communicator().rank(), self.root_rank());
+        unsafe {
+            let request = with_uninitialized(|request| {
+                let count = sendbuf.large_count();
+                large_count_call!(
+                    MPI_Reduce_init / MPI_Reduce_init_c,
+                    [count],
+                    (
+                        sendbuf.pointer(),
+                        ptr::null_mut(),
+                        count,
+                        sendbuf.as_datatype().as_raw(),
+                        op.as_raw(),
+                        self.root_rank(),
+                        self.as_communicator().as_raw(),
+                        ffi::RSMPI_INFO_NULL_fn(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentRequest::from_raw(request, sendbuf, scope)
+        }
+    }
+
+    /// Create a persistent request for a global reduction under the operation `op` of the input
+    /// data in `sendbuf`, storing the result in `recvbuf` on the `Root` process.
+    ///
+    /// This function must be called on the root process.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/persistent_collectives.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 6.13 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn reduce_init_root<'a, S: ?Sized, R: ?Sized, O, Sc>(
+        &self,
+        scope: Sc,
+        sendbuf: &'a mut S,
+        recvbuf: &'a mut R,
+        op: O,
+    ) -> PersistentCollectiveRequest<'a, S, R, Sc>
+    where
+        S: 'a + Buffer,
+        R: 'a + BufferMut,
+        O: 'a + Operation,
+        Sc: Scope<'a>,
+    {
+        assert_eq!(self.as_communicator().rank(), self.root_rank());
+        unsafe {
+            let request = with_uninitialized(|request| {
+                let count = sendbuf.large_count();
+                large_count_call!(
+                    MPI_Reduce_init / MPI_Reduce_init_c,
+                    [count],
+                    (
+                        sendbuf.pointer(),
+                        recvbuf.pointer_mut(),
+                        count,
+                        sendbuf.as_datatype().as_raw(),
+                        op.as_raw(),
+                        self.root_rank(),
+                        self.as_communicator().as_raw(),
+                        ffi::RSMPI_INFO_NULL_fn(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentCollectiveRequest::from_raw(request, sendbuf, recvbuf, scope)
+        }
+    }
+
+    /// Spawns child processes
+    ///
+    /// # Standard sections
+    /// 10.3.2, see MPI_Comm_spawn
+    fn spawn(&self, command: &Command, maxprocs: Rank) -> Result<InterCommunicator, MpiError> {
+        // Environment variables can be handled using the info key
+        assert_eq!(
+            command.get_envs().len(),
+            0,
+            "Support for environment variables not yet implemented"
+        );
+
+        // The Microsoft-MPI implementation treats the char* arguments as being
+        // encoded in utf8, and are internally converted to Windows wide
+        // characters. See ConvertArgs() using
+        // [`MultiByteToWideChar`](https://learn.microsoft.com/en-us/windows/win32/api/stringapiset/nf-stringapiset-multibytetowidechar)
+        // with `CP_UTF8` when called from MPIDI_Comm_spawn_multiple().
+        // https://github.com/microsoft/Microsoft-MPI/blob/7ff6bdcdb1d5dc7b791e47457ee2686cd6b3d355/src/mpi/msmpi/mpid/dynamic.cpp#L2074
+        //
+        // Since Windows wide-char strings are allowed to contain invalid
+        // UTF-16, such characters cannot be preserved. We'll choose lossy
+        // conversion, but returning an error is an option to consider.
+        let prog = CString::new(command.get_program().to_string_lossy().as_bytes())?;
+        let mut args: Vec<CString> = command
+            .get_args()
+            .map(|os| CString::new(os.to_string_lossy().as_bytes()))
+            .collect::<Result<Vec<CString>, NulError>>()?;
+        // We must retain args above so that the strings are not dropped while
+        // being used. An alternative that seems to be recommended any time the
+        // function takes mutable C strings is to use CString::into_raw to give
+        // ownership to the *mut c_char for the function call, then reclaim
+        // using CString::from_raw.
+        let mut argv: Vec<*mut c_char> = args
+            .iter_mut()
+            .map(|s| s.as_ptr() as *mut c_char)
+            .chain(std::iter::once(ptr::null_mut()))
+            .collect();
+
+        let mut result = ffi::RSMPI_COMM_NULL_fn();
+        let mut errcodes: Vec<c_int> =
+            vec![0; maxprocs.value_as().expect("maxprocs should be positive")];
+
+        unsafe {
+            ffi::MPI_Comm_spawn(
+                prog.as_ptr(),
+                argv.as_mut_ptr(),
+                maxprocs,
+                ffi::RSMPI_INFO_NULL_fn(),
+                self.root_rank(),
+                self.as_communicator().as_raw(),
+                &mut result,
+                errcodes.as_mut_ptr(),
+            );
+        }
+        let fails = errcodes
+            .into_iter()
+            .filter(|&c| c != ffi::RSMPI_SUCCESS_fn())
+            .count();
+        if fails > 0 {
+            Err(MpiError::Spawn(Rank::try_from(fails).unwrap(), maxprocs))
+        } else {
+            Ok(unsafe { InterCommunicator::from_raw(result) })
+        }
+    }
+
+    /// Spawns child processes
+    ///
+    /// # Standard sections
+    /// 10.3.3, see MPI_Comm_spawn_multiple
+    fn spawn_multiple(
+        &self,
+        commands: &[Command],
+        maxprocs: &[Rank],
+    ) -> Result<InterCommunicator, MpiError> {
+        assert_eq!(commands.len(), maxprocs.len());
+
+        let progs = commands
+            .iter()
+            .map(|c| CString::new(c.get_program().to_string_lossy().as_bytes()))
+            .collect::<Result<Vec<CString>, NulError>>()?;
+        let mut progp: Vec<*mut c_char> = progs.iter().map(|p| p.as_ptr() as *mut c_char).collect();
+        let mut argss = commands
+            .iter()
+            .map(|c| {
+                c.get_args()
+                    .map(|os| CString::new(os.to_string_lossy().as_bytes()))
+                    .collect::<Result<Vec<CString>, NulError>>()
+            })
+            .collect::<Result<Vec<Vec<CString>>, NulError>>()?;
+        let mut argvs: Vec<Vec<*mut c_char>> = argss
+            .iter_mut()
+            .map(|args| {
+                args.iter_mut()
+                    .map(|a| a.as_ptr() as *mut c_char)
+                    .chain(std::iter::once(ptr::null_mut()))
+                    .collect()
+            })
+            .collect();
+
+        let mut argvv: Vec<*mut *mut c_char> =
+            argvs.iter_mut().map(|argv| argv.as_mut_ptr()).collect();
+
+        let infos: Vec<_> = (0..commands.len())
+            .map(|_| ffi::RSMPI_INFO_NULL_fn())
+            .collect();
+
+        let mut result = ffi::RSMPI_COMM_NULL_fn();
+        let sum_maxprocs: Rank = maxprocs.iter().sum();
+        let mut errcodes = vec![0; usize::try_from(sum_maxprocs).unwrap()];
+
+        unsafe {
+            ffi::MPI_Comm_spawn_multiple(
+                progs.len().value_as().unwrap(),
+                progp.as_mut_ptr(),
+                argvv.as_mut_ptr(),
+                maxprocs.as_ptr(),
+                infos.as_ptr(),
+                self.root_rank(),
+                self.as_communicator().as_raw(),
+                &mut result,
+                errcodes.as_mut_ptr(),
+            );
+        }
+        let fails = errcodes
+            .into_iter()
+            .filter(|&c| c != ffi::RSMPI_SUCCESS_fn())
+            .count();
+        if fails > 0 {
+            Err(MpiError::Spawn(
+                Rank::try_from(fails).unwrap(),
+                sum_maxprocs,
+            ))
+        } else {
+            Ok(unsafe { InterCommunicator::from_raw(result) })
+        }
+    }
+}
+
+impl<'a> Root for Process<'a> {
+    fn root_rank(&self) -> Rank {
+        self.rank()
+    }
+}
+
+/// Collective communication with the neighbors of a process in a process topology
+///
+/// Each process exchanges data only with the processes adjacent to it in the topology of the
+/// communicator. The send `Buffer` is split into one block per outgoing neighbor and the receive
+/// `Buffer` into one block per incoming neighbor, in the order in which the topology lists the
+/// neighbors. On a `CartesianCommunicator` that is, for every dimension, the neighbor in the
+/// negative and then in the positive direction, so a halo exchange needs one call instead of a
+/// `send_receive` per direction and dimension. Blocks for neighbors that do not exist at the
+/// boundary of a non-periodic dimension are neither sent nor written.
+///
+/// # Standard section(s)
+///
+/// 7.6, 7.7
+pub trait NeighborhoodCollectives: Communicator {
+    /// Returns the number of neighbors this process receives from and sends to, in that order.
+    fn neighbor_degrees(&self) -> (Count, Count);
+
+    /// Gather contents of buffers from all incoming neighbors.
+    ///
+    /// The contents of `sendbuf` are sent to every outgoing neighbor and the receive `Buffer` is
+    /// filled with one block of the same count per incoming neighbor.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/neighbor_collectives.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 7.6.1
+    fn neighbor_all_gather_into<S: ?Sized, R: ?Sized>(&self, sendbuf: &S, recvbuf: &mut R)
+    where
+        S: Buffer,
+        R: BufferMut,
+    {
+        let (indegree, _) = self.neighbor_degrees();
+        unsafe {
+            let sendcount = sendbuf.large_count();
+            let recvcount = neighbor_block_count(recvbuf.large_count(), indegree);
+            large_count_call!(
+                MPI_Neighbor_allgather / MPI_Neighbor_allgather_c,
+                [sendcount, recvcount],
+                (
+                    sendbuf.pointer(),
+                    sendcount,
+                    sendbuf.as_datatype().as_raw(),
+                    recvbuf.pointer_mut(),
+                    recvcount,
+                    recvbuf.as_datatype().as_raw(),
+                    self.as_raw()
+                )
+            );
+        }
+    }
+
+    /// Gather contents of buffers from all incoming neighbors.
+    ///
+    /// The send `Buffer`s may contain different counts of elements on different processes. The
+    /// distribution of elements in the receive `Buffer` is specified via `Partitioned`, with one
+    /// block per incoming neighbor.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 7.6.1
+    fn neighbor_all_gather_varcount_into<S: ?Sized, R: ?Sized>(&self, sendbuf: &S, recvbuf: &mut R)
+    where
+        S: Buffer,
+        R: PartitionedBufferMut,
+    {
+        unsafe {
+            let sendcount = sendbuf.large_count();
+            let recvbuf_ptr = recvbuf.pointer_mut();
+            let recvcounts = recvbuf.counts();
+            let displs = recvbuf.displs();
+            large_count_call!(
+                MPI_Neighbor_allgatherv / MPI_Neighbor_allgatherv_c,
+                [sendcount],
+                [(recvcounts, displs)],
+                (
+                    sendbuf.pointer(),
+                    sendcount,
+                    sendbuf.as_datatype().as_raw(),
+                    recvbuf_ptr,
+                    recvcounts.as_ptr(),
+                    displs.as_ptr(),
+                    recvbuf.as_datatype().as_raw(),
+                    self.as_raw()
+                )
+            );
+        }
+    }
+
+    /// Exchange blocks of the send `Buffer` with all neighbors.
+    ///
+    /// Block `i` of `sendbuf` is sent to outgoing neighbor `i` and block `j` of `recvbuf` is
+    /// received from incoming neighbor `j`. All blocks have the same count of elements.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/neighbor_collectives.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 7.6.2
+    fn neighbor_all_to_all_into<S: ?Sized, R: ?Sized>(&self, sendbuf: &S, recvbuf: &mut R)
+    where
+        S: Buffer,
+        R: BufferMut,
+    {
+        let (indegree, outdegree) = self.neighbor_degrees();
+        unsafe {
+            let sendcount = neighbor_block_count(sendbuf.large_count(), outdegree);
+            let recvcount = neighbor_block_count(recvbuf.large_count(), indegree);
+            large_count_call!(
+                MPI_Neighbor_alltoall / MPI_Neighbor_alltoall_c,
+                [sendcount, recvcount],
+                (
+                    sendbuf.pointer(),
+                    sendcount,
+                    sendbuf.as_datatype().as_raw(),
+                    recvbuf.pointer_mut(),
+                    recvcount,
+                    recvbuf.as_datatype().as_raw(),
+                    self.as_raw()
+                )
+            );
+        }
+    }
+
+    /// Exchange blocks of the send `Buffer` with all neighbors.
+    ///
+    /// The count of elements to send and receive to and from each neighbor can vary and is
+    /// specified using `Partitioned`, with one block per outgoing neighbor in `sendbuf` and one
+    /// block per incoming neighbor in `recvbuf`.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 7.6.2
+    fn neighbor_all_to_all_varcount_into<S: ?Sized, R: ?Sized>(&self, sendbuf: &S, recvbuf: &mut R)
+    where
+        S: PartitionedBuffer,
+        R: PartitionedBufferMut,
+    {
+        unsafe {
+            let recvbuf_ptr = recvbuf.pointer_mut();
+            let sendcounts = sendbuf.counts();
+            let sdispls = sendbuf.displs();
+            let recvcounts = recvbuf.counts();
+            let rdispls = recvbuf.displs();
+            large_count_call!(
+                MPI_Neighbor_alltoallv / MPI_Neighbor_alltoallv_c,
+                [],
+                [(sendcounts, sdispls), (recvcounts, rdispls)],
+                (
+                    sendbuf.pointer(),
+                    sendcounts.as_ptr(),
+                    sdispls.as_ptr(),
+                    sendbuf.as_datatype().as_raw(),
+                    recvbuf_ptr,
+                    recvcounts.as_ptr(),
+                    rdispls.as_ptr(),
+                    recvbuf.as_datatype().as_raw(),
+                    self.as_raw()
+                )
+            );
+        }
+    }
+
+    /// Initiate a non-blocking gather of the contents of buffers from all incoming neighbors.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/neighbor_collectives.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 7.7.1
+    fn immediate_neighbor_all_gather_into<'a, S: ?Sized, R: ?Sized, Sc>(
+        &self,
+        scope: Sc,
+        sendbuf: &'a S,
+        recvbuf: &'a mut R,
+    ) -> Request<'a, R, Sc>
+    where
+        S: 'a + Buffer,
+        R: 'a + BufferMut,
+        Sc: Scope<'a>,
+    {
+        let (indegree, _) = self.neighbor_degrees();
+        unsafe {
+            Request::from_raw(
+                with_uninitialized(|request| {
+                    let sendcount = sendbuf.large_count();
+                    let recvcount = neighbor_block_count(recvbuf.large_count(), indegree);
+                    large_count_call!(
+                        MPI_Ineighbor_allgather / MPI_Ineighbor_allgather_c,
+                        [sendcount, recvcount],
+                        (
+                            sendbuf.pointer(),
+                            sendcount,
+                            sendbuf.as_datatype().as_raw(),
+                            recvbuf.pointer_mut(),
+                            recvcount,
+                            recvbuf.as_datatype().as_raw(),
+                            self.as_raw(),
+                            request
+                        )
+                    )
+                })
+                .1,
+                recvbuf,
+                scope,
+            )
+        }
+    }
+
+    /// Initiate a non-blocking gather of the contents of buffers from all incoming neighbors.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 7.7.1
+    fn immediate_neighbor_all_gather_varcount_into<'a, S: ?Sized, R: ?Sized, Sc>(
+        &self,
+        scope: Sc,
+        sendbuf: &'a S,
+        recvbuf: &'a mut R,
+    ) -> Request<'a, R, Sc>
+    where
+        S: 'a + Buffer,
+        R: 'a + PartitionedBufferMut,
+        Sc: Scope<'a>,
+    {
+        unsafe {
+            Request::from_raw(
+                with_uninitialized(|request| {
+                    let sendcount = sendbuf.large_count();
+                    let recvbuf_ptr = recvbuf.pointer_mut();
+                    let recvcounts = recvbuf.counts();
+                    let displs = recvbuf.displs();
+                    large_count_call!(
+                        MPI_Ineighbor_allgatherv / MPI_Ineighbor_allgatherv_c,
+                        [sendcount],
+                        [(recvcounts, displs)],
+                        (
+                            sendbuf.pointer(),
+                            sendcount,
+                            sendbuf.as_datatype().as_raw(),
+                            recvbuf_ptr,
+                            recvcounts.as_ptr(),
+                            displs.as_ptr(),
+                            recvbuf.as_datatype().as_raw(),
+                            self.as_raw(),
+                            request
+                        )
+                    )
+                })
+                .1,
+                recvbuf,
+                scope,
+            )
+        }
+    }
+
+    /// Initiate a non-blocking exchange of blocks of the send `Buffer` with all neighbors.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/neighbor_collectives.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 7.7.2
+    fn immediate_neighbor_all_to_all_into<'a, S: ?Sized, R: ?Sized, Sc>(
+        &self,
+        scope: Sc,
+        sendbuf: &'a S,
+        recvbuf: &'a mut R,
+    ) -> Request<'a, R, Sc>
+    where
+        S: 'a + Buffer,
+        R: 'a + BufferMut,
+        Sc: Scope<'a>,
+    {
+        let (indegree, outdegree) = self.neighbor_degrees();
+        unsafe {
+            Request::from_raw(
+                with_uninitialized(|request| {
+                    let sendcount = neighbor_block_count(sendbuf.large_count(), outdegree);
+                    let recvcount = neighbor_block_count(recvbuf.large_count(), indegree);
+                    large_count_call!(
+                        MPI_Ineighbor_alltoall / MPI_Ineighbor_alltoall_c,
+                        [sendcount, recvcount],
+                        (
+                            sendbuf.pointer(),
+                            sendcount,
+                            sendbuf.as_datatype().as_raw(),
+                            recvbuf.pointer_mut(),
+                            recvcount,
+                            recvbuf.as_datatype().as_raw(),
+                            self.as_raw(),
+                            request
+                        )
+                    )
+                })
+                .1,
+                recvbuf,
+                scope,
+            )
+        }
+    }
+
+    /// Initiate a non-blocking exchange of blocks of the send `Buffer` with all neighbors.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 7.7.2
+    fn immediate_neighbor_all_to_all_varcount_into<'a, S: ?Sized, R: ?Sized, Sc>(
+        &self,
+        scope: Sc,
+        sendbuf: &'a S,
+        recvbuf: &'a mut R,
+    ) -> Request<'a, R, Sc>
+    where
+        S: 'a + PartitionedBuffer,
+        R: 'a + PartitionedBufferMut,
+        Sc: Scope<'a>,
+    {
+        unsafe {
+            Request::from_raw(
+                with_uninitialized(|request| {
+                    let recvbuf_ptr = recvbuf.pointer_mut();
+                    let sendcounts = sendbuf.counts();
+                    let sdispls = sendbuf.displs();
+                    let recvcounts = recvbuf.counts();
+                    let rdispls = recvbuf.displs();
+                    large_count_call!(
+                        MPI_Ineighbor_alltoallv / MPI_Ineighbor_alltoallv_c,
+                        [],
+                        [(sendcounts, sdispls), (recvcounts, rdispls)],
+                        (
+                            sendbuf.pointer(),
+                            sendcounts.as_ptr(),
+                            sdispls.as_ptr(),
+                            sendbuf.as_datatype().as_raw(),
+                            recvbuf_ptr,
+                            recvcounts.as_ptr(),
+                            rdispls.as_ptr(),
+                            recvbuf.as_datatype().as_raw(),
+                            self.as_raw(),
+                            request
+                        )
+                    )
+                })
+                .1,
+                recvbuf,
+                scope,
+            )
+        }
+    }
+
+    /// Create a persistent request that gathers the contents of buffers from all incoming
+    /// neighbors.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/persistent_collectives.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 7.8 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn neighbor_all_gather_init<'a, S: ?Sized, R: ?Sized, Sc>(
+        &self,
+        scope: Sc,
+        sendbuf: &'a mut S,
+        recvbuf: &'a mut R,
+    ) -> PersistentCollectiveRequest<'a, S, R, Sc>
+    where
+        S: 'a + Buffer,
+        R: 'a + BufferMut,
+        Sc: Scope<'a>,
+    {
+        let (indegree, _) = self.neighbor_degrees();
+        let sendcount = sendbuf.large_count();
+        let recvcount = neighbor_block_count(recvbuf.large_count(), indegree);
+        unsafe {
+            let request = with_uninitialized(|request| {
+                large_count_call!(
+                    MPI_Neighbor_allgather_init / MPI_Neighbor_allgather_init_c,
+                    [sendcount, recvcount],
+                    (
+                        sendbuf.pointer(),
+                        sendcount,
+                        sendbuf.as_datatype().as_raw(),
+                        recvbuf.pointer_mut(),
+                        recvcount,
+                        recvbuf.as_datatype().as_raw(),
+                        self.as_raw(),
+                        ffi::RSMPI_INFO_NULL_fn(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentCollectiveRequest::from_raw(request, sendbuf, recvbuf, scope)
+        }
+    }
+
+    /// Create a persistent request that exchanges blocks of the send `Buffer` with all neighbors.
+    ///
+    /// A halo exchange that runs every time step with the same buffers can be set up once and
+    /// then only be started and completed.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/persistent_collectives.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 7.8 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn neighbor_all_to_all_init<'a, S: ?Sized, R: ?Sized, Sc>(
+        &self,
+        scope: Sc,
+        sendbuf: &'a mut S,
+        recvbuf: &'a mut R,
+    ) -> PersistentCollectiveRequest<'a, S, R, Sc>
+    where
+        S: 'a + Buffer,
+        R: 'a + BufferMut,
+        Sc: Scope<'a>,
+    {
+        let (indegree, outdegree) = self.neighbor_degrees();
+        let sendcount = neighbor_block_count(sendbuf.large_count(), outdegree);
+        let recvcount = neighbor_block_count(recvbuf.large_count(), indegree);
+        unsafe {
+            let request = with_uninitialized(|request| {
+                large_count_call!(
+                    MPI_Neighbor_alltoall_init / MPI_Neighbor_alltoall_init_c,
+                    [sendcount, recvcount],
+                    (
+                        sendbuf.pointer(),
+                        sendcount,
+                        sendbuf.as_datatype().as_raw(),
+                        recvbuf.pointer_mut(),
+                        recvcount,
+                        recvbuf.as_datatype().as_raw(),
+                        self.as_raw(),
+                        ffi::RSMPI_INFO_NULL_fn(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentCollectiveRequest::from_raw(request, sendbuf, recvbuf, scope)
+        }
+    }
+
+    /// Create a persistent request that exchanges blocks of varying counts with all neighbors.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 7.8 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn neighbor_all_to_all_varcount_init<'a, S: ?Sized, R: ?Sized, Sc>(
+        &self,
+        scope: Sc,
+        sendbuf: &'a mut S,
+        recvbuf: &'a mut R,
+    ) -> PersistentCollectiveRequest<'a, S, R, Sc>
+    where
+        S: 'a + PartitionedBuffer,
+        R: 'a + PartitionedBufferMut,
+        Sc: Scope<'a>,
+    {
+        unsafe {
+            let request = with_uninitialized(|request| {
+                let recvbuf_ptr = recvbuf.pointer_mut();
+                let sendcounts = sendbuf.counts();
+                let sdispls = sendbuf.displs();
+                let recvcounts = recvbuf.counts();
+                let rdispls = recvbuf.displs();
+                large_count_call!(
+                    MPI_Neighbor_alltoallv_init / MPI_Neighbor_alltoallv_init_c,
+                    [],
+                    [(sendcounts, sdispls), (recvcounts, rdispls)],
+                    (
+                        sendbuf.pointer(),
+                        sendcounts.as_ptr(),
+                        sdispls.as_ptr(),
+                        sendbuf.as_datatype().as_raw(),
+                        recvbuf_ptr,
+                        recvcounts.as_ptr(),
+                        rdispls.as_ptr(),
+                        recvbuf.as_datatype().as_raw(),
+                        self.as_raw(),
+                        ffi::RSMPI_INFO_NULL_fn(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentCollectiveRequest::from_raw(request, sendbuf, recvbuf, scope)
+        }
+    }
+}
+
+/// An operation to be used in a reduction or scan type operation, e.g. `MPI_SUM`
+pub trait Operation: AsRaw<Raw = MPI_Op> {
+    /// Returns whether the operation is commutative.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.9.7
     fn is_commutative(&self) -> bool {
         unsafe {
             let mut commute = 0;
@@ -1943,7 +3621,8 @@ impl<'a> UserOperation<'a> {
 ///
 /// The recommended way to create user-defined operations is through the safer `UserOperation`
 /// type. This type can be used as a work-around in situations where the `libffi` dependency is not
-/// available.
+/// available, although `TypedUserOperation` needs no `libffi` either if the operation is a closure
+/// that captures nothing.
 pub struct UnsafeUserOperation {
     op: MPI_Op,
 }
@@ -1971,72 +3650,244 @@ unsafe impl AsRaw for UnsafeUserOperation {
     }
 }
 
-impl<'a> Operation for &'a UnsafeUserOperation {}
-
-/// A raw pointer to a function that can be used to define an `UnsafeUserOperation`.
-#[cfg(not(all(msmpi, target_arch = "x86")))]
-pub type UnsafeUserFunction =
-    unsafe extern "C" fn(*mut c_void, *mut c_void, *mut c_int, *mut ffi::MPI_Datatype);
-
-/// A raw pointer to a function that can be used to define an `UnsafeUserOperation`.
-///
-/// MS-MPI uses "stdcall" rather than "C" calling convention. "stdcall" is ignored on x86_64
-/// Windows and the default calling convention is used instead.
-#[cfg(all(msmpi, target_arch = "x86"))]
-pub type UnsafeUserFunction =
-    unsafe extern "stdcall" fn(*mut c_void, *mut c_void, *mut c_int, *mut ffi::MPI_Datatype);
+impl<'a> Operation for &'a UnsafeUserOperation {}
+
+/// A raw pointer to a function that can be used to define an `UnsafeUserOperation`.
+#[cfg(not(all(msmpi, target_arch = "x86")))]
+pub type UnsafeUserFunction =
+    unsafe extern "C" fn(*mut c_void, *mut c_void, *mut c_int, *mut ffi::MPI_Datatype);
+
+/// A raw pointer to a function that can be used to define an `UnsafeUserOperation`.
+///
+/// MS-MPI uses "stdcall" rather than "C" calling convention. "stdcall" is ignored on x86_64
+/// Windows and the default calling convention is used instead.
+#[cfg(all(msmpi, target_arch = "x86"))]
+pub type UnsafeUserFunction =
+    unsafe extern "stdcall" fn(*mut c_void, *mut c_void, *mut c_int, *mut ffi::MPI_Datatype);
+
+impl UnsafeUserOperation {
+    /// Define an unsafe operation using a function pointer. The operation must be associative.
+    ///
+    /// This is a more readable shorthand for the `new` method.  Refer to [`new`](#method.new) for
+    /// more information.
+    ///
+    /// # Safety
+    /// The construction of an `UnsafeUserOperation` asserts that `function` is safe to be called
+    /// in all reductions that this `UnsafeUserOperation` is used in.
+    pub unsafe fn associative(function: UnsafeUserFunction) -> Self {
+        Self::new(false, function)
+    }
+
+    /// Define an unsafe operation using a function pointer.  The operation must be both associative
+    /// and commutative.
+    ///
+    /// This is a more readable shorthand for the `new` method.  Refer to [`new`](#method.new) for
+    /// more information.
+    ///
+    /// # Safety
+    /// The construction of an `UnsafeUserOperation` asserts that `function` is safe to be called
+    /// in all reductions that this `UnsafeUserOperation` is used in.
+    pub unsafe fn commutative(function: UnsafeUserFunction) -> Self {
+        Self::new(true, function)
+    }
+
+    /// Creates an associative and possibly commutative unsafe operation using a function pointer.
+    ///
+    /// The function receives raw `*mut c_void` as `invec` and `inoutvec` and the number of elemnts
+    /// of those two vectors as a `*mut c_int` `len`. It shall set `inoutvec`
+    /// to the value of `f(invec, inoutvec)`, where `f` is a binary associative operation.
+    ///
+    /// If the operation is also commutative, setting `commute` to `true` may yield performance
+    /// benefits.
+    ///
+    /// **Note:** The user function is not allowed to panic.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.9.5
+    ///
+    /// # Safety
+    /// The construction of an `UnsafeUserOperation` asserts that `function` is safe to be called
+    /// in all reductions that this `UnsafeUserOperation` is used in.
+    pub unsafe fn new(commute: bool, function: UnsafeUserFunction) -> Self {
+        UnsafeUserOperation {
+            op: with_uninitialized(|op| ffi::MPI_Op_create(Some(function), commute as _, op)).1,
+        }
+    }
+}
+
+/// A user-defined operation on buffers of a single element type `T`.
+///
+/// The operation is a closure that does not capture anything, e.g. `|x: &[f64], y: &mut [f64]|
+/// ...`. Its type is a distinct, zero-sized type, so every pair of `T` and closure gets its own
+/// statically generated user function that calls the closure directly on typed slices. Unlike
+/// `UserOperation`, no closure is created with `libffi` at run time and no buffer is type-erased,
+/// so the compiler can inline and vectorize the closure and the `user-operations` feature is not
+/// needed.
+///
+/// The operation must only be used in reductions on buffers of `T`. The datatype MPI passes to
+/// the user function is compared with that of `T` and the program aborts if they differ.
+///
+/// # Examples
+///
+/// See `examples/typed_user_operation.rs`
+pub struct TypedUserOperation<T> {
+    op: MPI_Op,
+    phantom: PhantomData<fn(&[T])>,
+}
+
+impl<T> fmt::Debug for TypedUserOperation<T> {
+    fn fmt(&self, f: &mut fmt::Formatter) -> fmt::Result {
+        f.debug_tuple("TypedUserOperation").field(&self.op).finish()
+    }
+}
+
+impl<T> Drop for TypedUserOperation<T> {
+    fn drop(&mut self) {
+        unsafe {
+            ffi::MPI_Op_free(&mut self.op);
+        }
+    }
+}
+
+unsafe impl<T> AsRaw for TypedUserOperation<T> {
+    type Raw = MPI_Op;
+    fn as_raw(&self) -> Self::Raw {
+        self.op
+    }
+}
+
+impl<'a, T> Operation for &'a TypedUserOperation<T> {}
 
-impl UnsafeUserOperation {
-    /// Define an unsafe operation using a function pointer. The operation must be associative.
+impl<T: Equivalence> TypedUserOperation<T> {
+    /// Define an operation using a closure that captures nothing.  The operation must be
+    /// associative.
     ///
     /// This is a more readable shorthand for the `new` method.  Refer to [`new`](#method.new) for
     /// more information.
-    ///
-    /// # Safety
-    /// The construction of an `UnsafeUserOperation` asserts that `function` is safe to be called
-    /// in all reductions that this `UnsafeUserOperation` is used in.
-    pub unsafe fn associative(function: UnsafeUserFunction) -> Self {
+    pub fn associative<F>(function: F) -> Self
+    where
+        F: Fn(&[T], &mut [T]) + Copy,
+    {
         Self::new(false, function)
     }
 
-    /// Define an unsafe operation using a function pointer.  The operation must be both associative
-    /// and commutative.
+    /// Define an operation using a closure that captures nothing.  The operation must be both
+    /// associative and commutative.
     ///
     /// This is a more readable shorthand for the `new` method.  Refer to [`new`](#method.new) for
     /// more information.
-    ///
-    /// # Safety
-    /// The construction of an `UnsafeUserOperation` asserts that `function` is safe to be called
-    /// in all reductions that this `UnsafeUserOperation` is used in.
-    pub unsafe fn commutative(function: UnsafeUserFunction) -> Self {
+    pub fn commutative<F>(function: F) -> Self
+    where
+        F: Fn(&[T], &mut [T]) + Copy,
+    {
         Self::new(true, function)
     }
 
-    /// Creates an associative and possibly commutative unsafe operation using a function pointer.
+    /// Creates an associative and possibly commutative operation using a closure that captures
+    /// nothing.
     ///
-    /// The function receives raw `*mut c_void` as `invec` and `inoutvec` and the number of elemnts
-    /// of those two vectors as a `*mut c_int` `len`. It shall set `inoutvec`
-    /// to the value of `f(invec, inoutvec)`, where `f` is a binary associative operation.
+    /// The closure receives two slices `invec` and `inoutvec` of equal length.  It shall set
+    /// `inoutvec` to the value of `f(invec, inoutvec)`, where `f` is a binary associative
+    /// operation.
     ///
     /// If the operation is also commutative, setting `commute` to `true` may yield performance
     /// benefits.
     ///
-    /// **Note:** The user function is not allowed to panic.
+    /// Closures that capture variables cannot be called from a plain user function; passing one
+    /// is a compile-time error.
+    ///
+    /// **Note:** If the closure panics, the entire program will abort.
     ///
     /// # Standard section(s)
     ///
     /// 5.9.5
-    ///
-    /// # Safety
-    /// The construction of an `UnsafeUserOperation` asserts that `function` is safe to be called
-    /// in all reductions that this `UnsafeUserOperation` is used in.
-    pub unsafe fn new(commute: bool, function: UnsafeUserFunction) -> Self {
-        UnsafeUserOperation {
-            op: with_uninitialized(|op| ffi::MPI_Op_create(Some(function), commute as _, op)).1,
+    pub fn new<F>(commute: bool, function: F) -> Self
+    where
+        F: Fn(&[T], &mut [T]) + Copy,
+    {
+        #[allow(clippy::let_unit_value)]
+        let () = CapturesNothing::<F>::ASSERT;
+        // The closure is zero-sized and `Copy`, so the user function can make its own copy.
+        let _ = function;
+        TypedUserOperation {
+            op: unsafe {
+                with_uninitialized(|op| {
+                    ffi::MPI_Op_create(Some(typed_user_function::<T, F>), commute as _, op)
+                })
+                .1
+            },
+            phantom: PhantomData,
         }
     }
 }
 
+/// Fails to compile for closures that capture variables
+struct CapturesNothing<F>(PhantomData<F>);
+
+impl<F> CapturesNothing<F> {
+    const ASSERT: () = assert!(
+        size_of::<F>() == 0,
+        "the closure of a TypedUserOperation must not capture anything"
+    );
+}
+
+/// Applies the closure of a `TypedUserOperation` to the raw arguments of a user function.
+///
+/// # Safety
+/// `F` must be zero-sized and the arguments must be those MPI passes to a user function.
+unsafe fn apply_typed<T, F>(
+    invec: *mut c_void,
+    inoutvec: *mut c_void,
+    len: *mut c_int,
+    datatype: *mut ffi::MPI_Datatype,
+) where
+    T: Equivalence,
+    F: Fn(&[T], &mut [T]) + Copy,
+{
+    if *datatype != T::equivalent_datatype().as_raw() {
+        std::process::abort();
+    }
+    let len: usize = (*len).try_into().unwrap_or(0);
+    if len == 0 {
+        return;
+    }
+    let invec = std::slice::from_raw_parts(invec as *const T, len);
+    let inoutvec = std::slice::from_raw_parts_mut(inoutvec as *mut T, len);
+    // A zero-sized value has no bytes, so the zeroed value is the closure.
+    let function: F = mem::zeroed();
+    if std::panic::catch_unwind(std::panic::AssertUnwindSafe(|| function(invec, inoutvec))).is_err()
+    {
+        std::process::abort();
+    }
+}
+
+#[cfg(not(all(msmpi, target_arch = "x86")))]
+unsafe extern "C" fn typed_user_function<T, F>(
+    invec: *mut c_void,
+    inoutvec: *mut c_void,
+    len: *mut c_int,
+    datatype: *mut ffi::MPI_Datatype,
+) where
+    T: Equivalence,
+    F: Fn(&[T], &mut [T]) + Copy,
+{
+    apply_typed::<T, F>(invec, inoutvec, len, datatype)
+}
+
+#[cfg(all(msmpi, target_arch = "x86"))]
+unsafe extern "stdcall" fn typed_user_function<T, F>(
+    invec: *mut c_void,
+    inoutvec: *mut c_void,
+    len: *mut c_int,
+    datatype: *mut ffi::MPI_Datatype,
+) where
+    T: Equivalence,
+    F: Fn(&[T], &mut [T]) + Copy,
+{
+    apply_typed::<T, F>(invec, inoutvec, len, datatype)
+}
+
 /// Perform a local reduction.
 ///
 /// # Examples
@@ -2054,12 +3905,404 @@ where
     O: Operation,
 {
     unsafe {
-        ffi::MPI_Reduce_local(
-            inbuf.pointer(),
-            inoutbuf.pointer_mut(),
-            inbuf.count(),
-            inbuf.as_datatype().as_raw(),
-            op.as_raw(),
+        let count = inbuf.large_count();
+        large_count_call!(
+            MPI_Reduce_local / MPI_Reduce_local_c,
+            [count],
+            (
+                inbuf.pointer(),
+                inoutbuf.pointer_mut(),
+                count,
+                inbuf.as_datatype().as_raw(),
+                op.as_raw()
+            )
+        );
+    }
+}
+
+/// The number of blocks in a collective with varying counts on `comm`
+fn block_count<C: Communicator + ?Sized>(comm: &C) -> usize {
+    comm.target_size()
+        .try_into()
+        .expect("could not cast c_int to usize")
+}
+
+/// The count of elements per neighbor when `count` elements are split evenly among `degree`
+/// neighbors
+fn neighbor_block_count(count: LargeCount, degree: Count) -> LargeCount {
+    if degree == 0 {
+        0
+    } else {
+        count / LargeCount::from(degree)
+    }
+}
+
+/// The counts and displacements of the blocks a buffer is split into in a collective with varying
+/// counts
+///
+/// A `Layout` is computed once, e.g. by `all_gather_layout()`, and then partitions buffers for as
+/// many calls as the counts stay the same.
+///
+/// # Examples
+///
+/// See `examples/all_to_all_plan.rs`
+#[derive(Clone, Debug, PartialEq, Eq)]
+pub struct Layout {
+    counts: Vec<Count>,
+    displs: Vec<Count>,
+}
+
+impl Layout {
+    /// Lay out blocks of `counts[i]` elements one after another.
+    pub fn contiguous(counts: Vec<Count>) -> Layout {
+        let mut displs = Vec::with_capacity(counts.len());
+        let mut displ: Count = 0;
+        for &count in &counts {
+            displs.push(displ);
+            displ = displ
+                .checked_add(count)
+                .expect("Displacement cannot be expressed as an MPI Count.");
+        }
+        Layout { counts, displs }
+    }
+
+    /// The count of elements in each block
+    pub fn counts(&self) -> &[Count] {
+        &self.counts
+    }
+
+    /// The displacement of each block in elements
+    pub fn displs(&self) -> &[Count] {
+        &self.displs
+    }
+
+    /// The number of elements a buffer needs to hold all blocks
+    pub fn len(&self) -> usize {
+        self.extent()
+            .value_as()
+            .expect("Layout length cannot be expressed as a usize.")
+    }
+
+    /// The number of elements a buffer needs to hold all blocks, as a `LargeCount`
+    fn extent(&self) -> LargeCount {
+        self.counts
+            .iter()
+            .zip(&self.displs)
+            .map(|(&count, &displ)| LargeCount::from(count) + LargeCount::from(displ))
+            .max()
+            .unwrap_or(0)
+    }
+
+    /// Whether the blocks are all empty
+    pub fn is_empty(&self) -> bool {
+        self.len() == 0
+    }
+
+    /// Partition `buf` according to this layout.
+    pub fn partition<'b, B: ?Sized>(
+        &'b self,
+        buf: &'b B,
+    ) -> Partition<'b, B, &'b [Count], &'b [Count]>
+    where
+        B: Buffer,
+    {
+        Partition::new(buf, &self.counts[..], &self.displs[..])
+    }
+
+    /// Partition `buf` according to this layout.
+    pub fn partition_mut<'b, B: ?Sized>(
+        &'b self,
+        buf: &'b mut B,
+    ) -> PartitionMut<'b, B, &'b [Count], &'b [Count]>
+    where
+        B: BufferMut,
+    {
+        PartitionMut::new(buf, &self.counts[..], &self.displs[..])
+    }
+}
+
+/// A reusable plan for all-to-all exchanges with varying counts
+///
+/// Created by `CommunicatorCollectives::all_to_all_plan()`, which exchanges the counts once.
+///
+/// # Examples
+///
+/// See `examples/all_to_all_plan.rs`
+///
+/// # Standard section(s)
+///
+/// 5.8
+#[derive(Debug)]
+pub struct AllToAllPlan<'c, C: ?Sized> {
+    comm: &'c C,
+    send: Layout,
+    recv: Layout,
+}
+
+impl<'c, C> AllToAllPlan<'c, C>
+where
+    C: Communicator + ?Sized,
+{
+    /// The layout of the send buffer
+    pub fn send_layout(&self) -> &Layout {
+        &self.send
+    }
+
+    /// The layout of the receive buffer
+    pub fn recv_layout(&self) -> &Layout {
+        &self.recv
+    }
+
+    /// Send the blocks of `sendbuf` and receive into the blocks of `recvbuf`.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.8
+    pub fn all_to_all_into<S: ?Sized, R: ?Sized>(&self, sendbuf: &S, recvbuf: &mut R)
+    where
+        S: Buffer,
+        R: BufferMut,
+    {
+        self.comm.all_to_all_varcount_into(
+            &self.send.partition(sendbuf),
+            &mut self.recv.partition_mut(recvbuf),
+        );
+    }
+
+    /// Initiate sending the blocks of `sendbuf` and receiving into the blocks of `recvbuf`.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.12.6
+    pub fn immediate_all_to_all_into<'a, S: ?Sized, R: ?Sized, Sc>(
+        &'a self,
+        scope: Sc,
+        sendbuf: &'a S,
+        recvbuf: &'a mut R,
+    ) -> Request<'a, R, Sc>
+    where
+        S: 'a + Buffer,
+        R: 'a + BufferMut,
+        Sc: Scope<'a>,
+    {
+        assert!(self.send.extent() <= sendbuf.large_count());
+        assert!(self.recv.extent() <= recvbuf.large_count());
+        unsafe {
+            Request::from_raw(
+                with_uninitialized(|request| {
+                    let recvbuf_ptr = recvbuf.pointer_mut();
+                    let sendcounts = self.send.counts();
+                    let sdispls = self.send.displs();
+                    let recvcounts = self.recv.counts();
+                    let rdispls = self.recv.displs();
+                    large_count_call!(
+                        MPI_Ialltoallv / MPI_Ialltoallv_c,
+                        [],
+                        [(sendcounts, sdispls), (recvcounts, rdispls)],
+                        (
+                            sendbuf.pointer(),
+                            sendcounts.as_ptr(),
+                            sdispls.as_ptr(),
+                            sendbuf.as_datatype().as_raw(),
+                            recvbuf_ptr,
+                            recvcounts.as_ptr(),
+                            rdispls.as_ptr(),
+                            recvbuf.as_datatype().as_raw(),
+                            self.comm.as_raw(),
+                            request
+                        )
+                    )
+                })
+                .1,
+                recvbuf,
+                scope,
+            )
+        }
+    }
+}
+
+/// A reusable plan for reductions whose result is scattered in blocks of varying counts
+///
+/// Created by `CommunicatorCollectives::reduce_scatter_plan()`.
+///
+/// # Examples
+///
+/// See `examples/all_to_all_plan.rs`
+///
+/// # Standard section(s)
+///
+/// 5.10.2
+#[derive(Debug)]
+pub struct ReduceScatterPlan<'c, C: ?Sized> {
+    comm: &'c C,
+    layout: Layout,
+}
+
+impl<'c, C> ReduceScatterPlan<'c, C>
+where
+    C: Communicator + ?Sized,
+{
+    /// The blocks the result is scattered in
+    pub fn layout(&self) -> &Layout {
+        &self.layout
+    }
+
+    /// The count of elements of the result that this process receives
+    fn recv_count(&self) -> LargeCount {
+        let rank: usize = self
+            .comm
+            .rank()
+            .try_into()
+            .expect("could not cast c_int to usize");
+        LargeCount::from(self.layout.counts[rank])
+    }
+
+    /// Reduce `sendbuf` under the operation `op` on all processes and receive this process's block
+    /// of the result into `recvbuf`.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.10.2
+    pub fn reduce_scatter_into<S: ?Sized, R: ?Sized, O>(&self, sendbuf: &S, recvbuf: &mut R, op: O)
+    where
+        S: Buffer,
+        R: BufferMut,
+        O: Operation,
+    {
+        assert_eq!(self.layout.extent(), sendbuf.large_count());
+        assert_eq!(self.recv_count(), recvbuf.large_count());
+        unsafe {
+            ffi::MPI_Reduce_scatter(
+                sendbuf.pointer(),
+                recvbuf.pointer_mut(),
+                self.layout.counts.as_ptr(),
+                sendbuf.as_datatype().as_raw(),
+                op.as_raw(),
+                self.comm.as_raw(),
+            );
+        }
+    }
+
+    /// Initiate the reduction of `sendbuf` under the operation `op` on all processes and the
+    /// scattering of the result, receiving this process's block into `recvbuf`.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.12.9
+    pub fn immediate_reduce_scatter_into<'a, S: ?Sized, R: ?Sized, O, Sc>(
+        &'a self,
+        scope: Sc,
+        sendbuf: &'a S,
+        recvbuf: &'a mut R,
+        op: O,
+    ) -> Request<'a, R, Sc>
+    where
+        S: 'a + Buffer,
+        R: 'a + BufferMut,
+        O: 'a + Operation,
+        Sc: Scope<'a>,
+    {
+        assert_eq!(self.layout.extent(), sendbuf.large_count());
+        assert_eq!(self.recv_count(), recvbuf.large_count());
+        unsafe {
+            Request::from_raw(
+                with_uninitialized(|request| {
+                    ffi::MPI_Ireduce_scatter(
+                        sendbuf.pointer(),
+                        recvbuf.pointer_mut(),
+                        self.layout.counts.as_ptr(),
+                        sendbuf.as_datatype().as_raw(),
+                        op.as_raw(),
+                        self.comm.as_raw(),
+                        request,
+                    )
+                })
+                .1,
+                recvbuf,
+                scope,
+            )
+        }
+    }
+}
+
+/// A block of an all-to-all exchange with a datatype per block: `count` elements of `datatype`,
+/// starting `displ` bytes into the buffer
+#[derive(Copy, Clone, Debug)]
+pub struct TypedBlock<'d> {
+    /// The count of elements
+    pub count: Count,
+    /// The displacement in bytes
+    pub displ: Count,
+    /// The datatype of the elements
+    pub datatype: DatatypeRef<'d>,
+}
+
+/// The blocks of one side of an `MPI_Alltoallw()`, as the arrays it takes
+#[derive(Debug)]
+struct TypedLayout {
+    counts: Vec<Count>,
+    displs: Vec<Count>,
+    datatypes: Vec<ffi::MPI_Datatype>,
+}
+
+impl TypedLayout {
+    fn new(blocks: &[TypedBlock<'_>]) -> TypedLayout {
+        TypedLayout {
+            counts: blocks.iter().map(|block| block.count).collect(),
+            displs: blocks.iter().map(|block| block.displ).collect(),
+            datatypes: blocks.iter().map(|block| block.datatype.as_raw()).collect(),
+        }
+    }
+}
+
+/// A reusable plan for all-to-all exchanges with a datatype per block
+///
+/// Created by `CommunicatorCollectives::all_to_all_w_plan()`.
+///
+/// # Examples
+///
+/// See `examples/all_to_all_w.rs`
+///
+/// # Standard section(s)
+///
+/// 5.8
+#[derive(Debug)]
+pub struct AllToAllWPlan<'c, 'd, C: ?Sized> {
+    comm: &'c C,
+    send: TypedLayout,
+    recv: TypedLayout,
+    phantom: PhantomData<DatatypeRef<'d>>,
+}
+
+impl<'c, 'd, C> AllToAllWPlan<'c, 'd, C>
+where
+    C: Communicator + ?Sized,
+{
+    /// Send the blocks of `sendbuf` and receive into the blocks of `recvbuf`.
+    ///
+    /// # Safety
+    ///
+    /// The blocks of the plan, which are described by arbitrary datatypes and byte
+    /// displacements, must lie within `sendbuf` and `recvbuf`.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.8
+    pub unsafe fn all_to_all_w_into<S: ?Sized, R: ?Sized>(&self, sendbuf: &S, recvbuf: &mut R)
+    where
+        S: Pointer,
+        R: PointerMut,
+    {
+        ffi::MPI_Alltoallw(
+            sendbuf.pointer(),
+            self.send.counts.as_ptr(),
+            self.send.displs.as_ptr(),
+            self.send.datatypes.as_ptr(),
+            recvbuf.pointer_mut(),
+            self.recv.counts.as_ptr(),
+            self.recv.displs.as_ptr(),
+            self.recv.datatypes.as_ptr(),
+            self.comm.as_raw(),
         );
     }
 }
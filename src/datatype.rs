@@ -50,6 +50,13 @@
 //! provided. However, since it can be used to instruct the underlying MPI implementation to
 //! rummage around arbitrary parts of memory, its constructors are currently marked unsafe.
 //!
+//! ## Large counts
+//! Slices, vectors and arrays report their length as a `LargeCount`. Operations on buffers
+//! holding more elements than fit into a `Count` call the large-count (`_c`) variants of the MPI
+//! functions introduced in MPI 4.0. `LargePartition` and `LargePartitionMut` describe partitions
+//! whose counts or displacements exceed the range of `Count`. Large-count functions are only
+//! available with the `mpi-rt-sys-backend` feature.
+//!
 //! # Unfinished features
 //!
 //! - **4.1.3**: Subarray datatype constructors, `MPI_Type_create_subarray()`,
@@ -65,18 +72,25 @@
 //! - **4.3**: Canonical pack and unpack, `MPI_Pack_external()`, `MPI_Unpack_external()`,
 //! `MPI_Pack_external_size()`
 
-use std::{borrow::Borrow, marker::PhantomData, mem, os::raw::c_void, slice};
+use std::{
+    borrow::{Borrow, Cow},
+    marker::PhantomData,
+    mem,
+    os::raw::c_void,
+    slice,
+};
 
 use conv::ConvUtil;
 
-use super::{Address, Count};
+use super::{Address, Count, LargeCount};
 use crate::{ffi, ffi::MPI_Datatype, raw::traits::*, with_uninitialized};
 
 /// Datatype traits
 pub mod traits {
     pub use super::{
-        AsDatatype, Buffer, BufferMut, Collection, Datatype, Equivalence, Partitioned,
-        PartitionedBuffer, PartitionedBufferMut, Pointer, PointerMut, UncommittedDatatype,
+        AsDatatype, Buffer, BufferMut, Collection, Datatype, Equivalence, PartitionCount,
+        Partitioned, PartitionedBuffer, PartitionedBufferMut, Pointer, PointerMut,
+        UncommittedDatatype,
     };
 }
 
@@ -894,6 +908,14 @@ pub mod internal {
 pub unsafe trait Collection {
     /// How many things are in this collection.
     fn count(&self) -> Count;
+
+    /// How many things are in this collection, as a `LargeCount`.
+    ///
+    /// Collections that can hold more than `Count::MAX` things override this. Communication
+    /// operations use it to decide whether to call the large-count variant of an MPI function.
+    fn large_count(&self) -> LargeCount {
+        self.count().into()
+    }
 }
 
 unsafe impl<T> Collection for T
@@ -914,6 +936,12 @@ where
             .value_as()
             .expect("Length of slice cannot be expressed as an MPI Count.")
     }
+
+    fn large_count(&self) -> LargeCount {
+        self.len()
+            .value_as()
+            .expect("Length of slice cannot be expressed as an MPI LargeCount.")
+    }
 }
 
 unsafe impl<T> Collection for Vec<T>
@@ -925,6 +953,12 @@ where
             .value_as()
             .expect("Length of slice cannot be expressed as an MPI Count.")
     }
+
+    fn large_count(&self) -> LargeCount {
+        self.len()
+            .value_as()
+            .expect("Length of slice cannot be expressed as an MPI LargeCount.")
+    }
 }
 
 unsafe impl<T, const D: usize> Collection for [T; D]
@@ -936,6 +970,11 @@ where
         D.value_as()
             .expect("Length of slice cannot be expressed as an MPI Count.")
     }
+
+    fn large_count(&self) -> LargeCount {
+        D.value_as()
+            .expect("Length of slice cannot be expressed as an MPI LargeCount.")
+    }
 }
 
 /// Provides a pointer to the starting address in memory.
@@ -1427,10 +1466,79 @@ where
 /// Describes how a `Buffer` is partitioned by specifying the count of elements and displacement
 /// from the start of the buffer for each partition.
 pub trait Partitioned {
+    /// The type of the counts, either `Count` or `LargeCount`.
+    type Count: PartitionCount;
     /// The count of elements in each partition.
-    fn counts(&self) -> &[Count];
+    fn counts(&self) -> &[Self::Count];
     /// The displacement from the start of the buffer for each partition.
-    fn displs(&self) -> &[Count];
+    fn displs(&self) -> &[<Self::Count as PartitionCount>::Displ];
+}
+
+/// The types in which the counts of a `Partitioned` buffer can be given.
+///
+/// `Count` partitions use `Count` displacements and are passed to the classic MPI functions.
+/// `LargeCount` partitions use `Address` displacements and are passed to the large-count (`_c`)
+/// variants.
+pub trait PartitionCount: Copy {
+    /// The type of the displacements that accompany counts of this type.
+    type Displ: Copy;
+
+    /// The counts and displacements as `Count`s, if they can be passed to the classic functions.
+    fn as_counts<'a>(
+        counts: &'a [Self],
+        displs: &'a [Self::Displ],
+    ) -> Option<(&'a [Count], &'a [Count])>;
+
+    /// The counts as `LargeCount`s and the displacements as `Address`es.
+    fn to_large<'a>(
+        counts: &'a [Self],
+        displs: &'a [Self::Displ],
+    ) -> (Cow<'a, [LargeCount]>, Cow<'a, [Address]>);
+}
+
+impl PartitionCount for Count {
+    type Displ = Count;
+
+    fn as_counts<'a>(
+        counts: &'a [Self],
+        displs: &'a [Self::Displ],
+    ) -> Option<(&'a [Count], &'a [Count])> {
+        Some((counts, displs))
+    }
+
+    fn to_large<'a>(
+        counts: &'a [Self],
+        displs: &'a [Self::Displ],
+    ) -> (Cow<'a, [LargeCount]>, Cow<'a, [Address]>) {
+        (
+            counts.iter().map(|&c| LargeCount::from(c)).collect(),
+            displs
+                .iter()
+                .map(|&d| {
+                    d.value_as()
+                        .expect("Displacement cannot be expressed as an MPI Address.")
+                })
+                .collect(),
+        )
+    }
+}
+
+impl PartitionCount for LargeCount {
+    type Displ = Address;
+
+    fn as_counts<'a>(
+        _counts: &'a [Self],
+        _displs: &'a [Self::Displ],
+    ) -> Option<(&'a [Count], &'a [Count])> {
+        None
+    }
+
+    fn to_large<'a>(
+        counts: &'a [Self],
+        displs: &'a [Self::Displ],
+    ) -> (Cow<'a, [LargeCount]>, Cow<'a, [Address]>) {
+        (Cow::Borrowed(counts), Cow::Borrowed(displs))
+    }
 }
 
 /// A buffer that is `Partitioned`
@@ -1454,12 +1562,12 @@ where
 {
     /// Partition `buf` using `counts` and `displs`
     pub fn new(buf: &'b B, counts: C, displs: D) -> Self {
-        let n = buf.count();
+        let n = buf.large_count();
         assert!(counts
             .borrow()
             .iter()
             .zip(displs.borrow().iter())
-            .all(|(&c, &d)| c + d <= n));
+            .all(|(&c, &d)| LargeCount::from(c) + LargeCount::from(d) <= n));
 
         Partition {
             buf,
@@ -1494,6 +1602,8 @@ where
     C: Borrow<[Count]>,
     D: Borrow<[Count]>,
 {
+    type Count = Count;
+
     fn counts(&self) -> &[Count] {
         self.counts.borrow()
     }
@@ -1525,12 +1635,12 @@ where
 {
     /// Partition `buf` using `counts` and `displs`
     pub fn new(buf: &'b mut B, counts: C, displs: D) -> Self {
-        let n = buf.count();
+        let n = buf.large_count();
         assert!(counts
             .borrow()
             .iter()
             .zip(displs.borrow().iter())
-            .all(|(&c, &d)| c + d <= n));
+            .all(|(&c, &d)| LargeCount::from(c) + LargeCount::from(d) <= n));
 
         PartitionMut {
             buf,
@@ -1565,6 +1675,8 @@ where
     C: Borrow<[Count]>,
     D: Borrow<[Count]>,
 {
+    type Count = Count;
+
     fn counts(&self) -> &[Count] {
         self.counts.borrow()
     }
@@ -1581,6 +1693,163 @@ where
 {
 }
 
+/// Adds a partitioning with `LargeCount` counts and `Address` displacements to an existing
+/// `Buffer` so that it becomes `Partitioned`
+///
+/// Collective operations on a `LargePartition` use the large-count (`_c`) variants of the MPI
+/// functions.
+///
+/// # Examples
+/// See `examples/large_count.rs`
+pub struct LargePartition<'b, B: 'b + ?Sized, C, D> {
+    buf: &'b B,
+    counts: C,
+    displs: D,
+}
+
+impl<'b, B: ?Sized, C, D> LargePartition<'b, B, C, D>
+where
+    B: 'b + Buffer,
+    C: Borrow<[LargeCount]>,
+    D: Borrow<[Address]>,
+{
+    /// Partition `buf` using `counts` and `displs`
+    pub fn new(buf: &'b B, counts: C, displs: D) -> Self {
+        let n = buf.large_count();
+        assert!(counts
+            .borrow()
+            .iter()
+            .zip(displs.borrow().iter())
+            .all(|(&c, &d)| LargeCount::try_from(d).is_ok_and(|d| c + d <= n)));
+
+        LargePartition {
+            buf,
+            counts,
+            displs,
+        }
+    }
+}
+
+unsafe impl<'b, B: ?Sized, C, D> AsDatatype for LargePartition<'b, B, C, D>
+where
+    B: 'b + AsDatatype,
+{
+    type Out = <B as AsDatatype>::Out;
+    fn as_datatype(&self) -> Self::Out {
+        self.buf.as_datatype()
+    }
+}
+
+unsafe impl<'b, B: ?Sized, C, D> Pointer for LargePartition<'b, B, C, D>
+where
+    B: 'b + Pointer,
+{
+    fn pointer(&self) -> *const c_void {
+        self.buf.pointer()
+    }
+}
+
+impl<'b, B: ?Sized, C, D> Partitioned for LargePartition<'b, B, C, D>
+where
+    B: 'b,
+    C: Borrow<[LargeCount]>,
+    D: Borrow<[Address]>,
+{
+    type Count = LargeCount;
+
+    fn counts(&self) -> &[LargeCount] {
+        self.counts.borrow()
+    }
+    fn displs(&self) -> &[Address] {
+        self.displs.borrow()
+    }
+}
+
+impl<'b, B: ?Sized, C, D> PartitionedBuffer for LargePartition<'b, B, C, D>
+where
+    B: 'b + Pointer + AsDatatype,
+    C: Borrow<[LargeCount]>,
+    D: Borrow<[Address]>,
+{
+}
+
+/// Adds a partitioning with `LargeCount` counts and `Address` displacements to an existing
+/// `BufferMut` so that it becomes `Partitioned`
+///
+/// # Examples
+/// See `examples/large_count.rs`
+pub struct LargePartitionMut<'b, B: 'b + ?Sized, C, D> {
+    buf: &'b mut B,
+    counts: C,
+    displs: D,
+}
+
+impl<'b, B: ?Sized, C, D> LargePartitionMut<'b, B, C, D>
+where
+    B: 'b + BufferMut,
+    C: Borrow<[LargeCount]>,
+    D: Borrow<[Address]>,
+{
+    /// Partition `buf` using `counts` and `displs`
+    pub fn new(buf: &'b mut B, counts: C, displs: D) -> Self {
+        let n = buf.large_count();
+        assert!(counts
+            .borrow()
+            .iter()
+            .zip(displs.borrow().iter())
+            .all(|(&c, &d)| LargeCount::try_from(d).is_ok_and(|d| c + d <= n)));
+
+        LargePartitionMut {
+            buf,
+            counts,
+            displs,
+        }
+    }
+}
+
+unsafe impl<'b, B: ?Sized, C, D> AsDatatype for LargePartitionMut<'b, B, C, D>
+where
+    B: 'b + AsDatatype,
+{
+    type Out = <B as AsDatatype>::Out;
+    fn as_datatype(&self) -> Self::Out {
+        self.buf.as_datatype()
+    }
+}
+
+unsafe impl<'b, B: ?Sized, C, D> PointerMut for LargePartitionMut<'b, B, C, D>
+where
+    B: 'b + PointerMut,
+{
+    fn pointer_mut(&mut self) -> *mut c_void {
+        self.buf.pointer_mut()
+    }
+}
+
+impl<'b, B: ?Sized, C, D> Partitioned for LargePartitionMut<'b, B, C, D>
+where
+    B: 'b,
+    C: Borrow<[LargeCount]>,
+    D: Borrow<[Address]>,
+{
+    type Count = LargeCount;
+
+    fn counts(&self) -> &[LargeCount] {
+        self.counts.borrow()
+    }
+    fn displs(&self) -> &[Address] {
+        self.displs.borrow()
+    }
+}
+
+impl<'b, B: ?Sized, C, D> PartitionedBufferMut for LargePartitionMut<'b, B, C, D>
+where
+    B: 'b + PointerMut + AsDatatype,
+    C: Borrow<[LargeCount]>,
+    D: Borrow<[Address]>,
+{
+}
+
 /// Returns the address of the argument in a format suitable for use with datatype constructors
 ///
 /// # Examples
@@ -23,6 +23,7 @@ use once_cell::sync::Lazy;
 use crate::{
     attribute::{AppNum, UniverseSize},
     ffi,
+    progress::{Backoff, ProgressDriver, ProgressThread},
     topology::{traits::AnyCommunicator, Communicator, InterCommunicator, SimpleCommunicator},
     traits::{AsRaw, FromRaw},
     with_uninitialized, with_uninitialized2,
@@ -41,6 +42,7 @@ pub(crate) static UNIVERSE_STATE: Lazy<RwLock<Option<UniverseState>>> =
 /// Global context
 pub struct Universe {
     buffer: Option<Vec<u8>>,
+    progress: Option<ProgressThread>,
 }
 
 impl Universe {
@@ -149,6 +151,31 @@ impl Universe {
         }
     }
 
+    /// Start a thread that progresses nonblocking operations in the background until MPI is
+    /// finalized and return the driver whose requests it tests.
+    ///
+    /// Requests awaited through the returned driver, e.g. with
+    /// `driver.wait(request).wait()`, complete while the calling thread computes without calling
+    /// MPI. Calling this again returns the driver of the running thread.
+    ///
+    /// # Panics
+    ///
+    /// Panics if MPI was not initialized with `Threading::Multiple`.
+    ///
+    /// # Examples
+    /// See `examples/progress_thread.rs`
+    pub fn start_progress_thread(&mut self, backoff: Backoff) -> ProgressDriver {
+        self.progress
+            .get_or_insert_with(|| ProgressDriver::new().spawn_progress_thread(backoff))
+            .driver()
+            .clone()
+    }
+
+    /// The driver of the progress thread, if one was started with `start_progress_thread()`
+    pub fn progress_driver(&self) -> Option<&ProgressDriver> {
+        self.progress.as_ref().map(ProgressThread::driver)
+    }
+
     fn free_attribute_keys(&mut self) {
         let mut comm_attrs = crate::attribute::COMM_ATTRS.write().unwrap();
         for (_, v) in comm_attrs.drain() {
@@ -168,9 +195,13 @@ impl Drop for Universe {
             .write()
             .expect("rsmpi internal error: UNIVERSE_STATE lock poisoned");
 
+        // The progress thread calls MPI, so it has to stop before MPI is finalized.
+        self.progress = None;
         self.detach_buffer();
         self.disconnect_parent();
         self.free_attribute_keys();
+        #[cfg(feature = "mpi-rt-sys-trace")]
+        ffi::trace::dump(self.world().rank());
         unsafe {
             ffi::MPI_Finalize();
         }
@@ -292,6 +323,15 @@ pub fn initialize_with_threading(threading: Threading) -> Option<(Universe, Thre
         .write()
         .expect("rsmpi internal error: UNIVERSE_STATE lock poisoned");
 
+    // Resolve every symbol of the runtime-loaded library up front so that the first
+    // communication call does not pay for symbol lookups.
+    #[cfg(feature = "mpi-rt-sys-preload")]
+    ffi::preload();
+
+    // Constants folded into mpi-rt-sys at compile time must match the library loaded at runtime.
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    ffi::verify_constants();
+
     if is_initialized() {
         return None;
     }
@@ -313,7 +353,13 @@ pub fn initialize_with_threading(threading: Threading) -> Option<(Universe, Thre
         main_thread: thread::current().id(),
     });
 
-    Some((Universe { buffer: None }, provided.into()))
+    Some((
+        Universe {
+            buffer: None,
+            progress: None,
+        },
+        provided.into(),
+    ))
 }
 
 /// Level of multithreading supported by this MPI universe
@@ -0,0 +1,294 @@
+//! Node-aware hierarchical collectives
+//!
+//! On machines with many processes per node, a flat collective sends most of its messages between
+//! processes that share memory, and the few messages that cross the network wait for them. A
+//! [`HierarchicalCommunicator`](struct.HierarchicalCommunicator.html) splits a communicator into
+//! one communicator per shared-memory node and a communicator of node leaders, the lowest rank on
+//! each node. Its collectives run in two levels: within the nodes, and among the leaders.
+//!
+//! The sub-communicators are created once per communicator and cached on it as an attribute, so
+//! wrapping the same communicator again is cheap and does not communicate.
+//!
+//! # Examples
+//!
+//! See `examples/hierarchical.rs`
+
+use std::rc::Rc;
+
+use crate::{
+    attribute::CommAttribute,
+    collective::{CommunicatorCollectives, Operation, Root},
+    datatype::{traits::*, PartitionMut},
+    topology::{AnyCommunicator, Color, Communicator, Rank, SimpleCommunicator},
+    Count,
+};
+
+/// The index of `rank` in per-rank vectors
+fn index(rank: Rank) -> usize {
+    rank.try_into().expect("could not cast c_int to usize")
+}
+
+/// The sub-communicators of a communicator and where its processes are placed on them
+struct Levels {
+    /// The processes on the same node
+    node: SimpleCommunicator,
+    /// The node leaders, only on leaders
+    leaders: Option<SimpleCommunicator>,
+    /// The rank among the leaders of the leader of each process, by rank in the communicator
+    leader_of: Vec<Rank>,
+    /// The rank on its node of each process, by rank in the communicator
+    node_rank_of: Vec<Rank>,
+    /// The ranks in the communicator ordered by node and then by rank on the node
+    node_order: Vec<Rank>,
+    /// The number of processes on each node, by rank of its leader
+    node_sizes: Vec<Count>,
+}
+
+impl Levels {
+    fn new<C: Communicator + ?Sized>(comm: &C) -> Levels {
+        let node = comm.split_shared(comm.rank());
+        let color = if node.rank() == 0 {
+            Color::with_value(0)
+        } else {
+            Color::undefined()
+        };
+        let leaders = comm.split_by_color_with_key(color, comm.rank());
+
+        let mut leader = leaders.as_ref().map_or(0, |l| l.rank());
+        node.process_at_rank(0).broadcast_into(&mut leader);
+        let placement = [leader, node.rank()];
+        let mut placements = vec![0; 2 * index(comm.size())];
+        comm.all_gather_into(&placement[..], &mut placements[..]);
+
+        let leader_of: Vec<Rank> = placements.chunks(2).map(|p| p[0]).collect();
+        let node_rank_of: Vec<Rank> = placements.chunks(2).map(|p| p[1]).collect();
+        let mut node_order: Vec<Rank> = (0..comm.size()).collect();
+        node_order.sort_by_key(|&r| (placements[2 * index(r)], placements[2 * index(r) + 1]));
+        let mut node_sizes = vec![0; leader_of.iter().max().map_or(0, |&l| index(l) + 1)];
+        for &l in &leader_of {
+            node_sizes[index(l)] += 1;
+        }
+
+        Levels {
+            node,
+            leaders,
+            leader_of,
+            node_rank_of,
+            node_order,
+            node_sizes,
+        }
+    }
+
+    /// Whether every node holds consecutive ranks and the nodes are ordered like their ranks
+    fn is_blocked(&self) -> bool {
+        self.node_order.iter().zip(0..).all(|(&r, i)| r == i)
+    }
+}
+
+/// Caches the `Levels` of a communicator
+#[derive(Clone)]
+struct CachedLevels(Rc<Levels>);
+
+impl CommAttribute for CachedLevels {}
+
+/// A communicator whose collectives run within shared-memory nodes and among node leaders
+///
+/// A reduction is first reduced on every node, then among the leaders, and the result is then
+/// broadcast on every node. Only the leaders communicate across nodes.
+///
+/// # Examples
+///
+/// See `examples/hierarchical.rs`
+pub struct HierarchicalCommunicator<'c, C: ?Sized> {
+    comm: &'c C,
+    levels: Rc<Levels>,
+}
+
+impl<'c, C: Communicator + ?Sized> HierarchicalCommunicator<'c, C> {
+    /// Wraps `comm`.
+    ///
+    /// The first time a communicator is wrapped, it is split into node and leader communicators,
+    /// which is collective on `comm`. The split is cached as an attribute of `comm`, which is why
+    /// it is borrowed mutably here, and reused by later wrappers. Duplicates of `comm` do not
+    /// inherit it.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 6.4.2, 6.7.2
+    pub fn new(comm: &'c mut C) -> HierarchicalCommunicator<'c, C> {
+        let levels = if let Some(cached) = comm.get_attr::<CachedLevels>() {
+            cached.0.clone()
+        } else {
+            let levels = Rc::new(Levels::new(comm));
+            comm.set_attr(CachedLevels(levels.clone()));
+            levels
+        };
+        HierarchicalCommunicator { comm, levels }
+    }
+
+    /// The wrapped communicator
+    pub fn communicator(&self) -> &'c C {
+        self.comm
+    }
+
+    /// The communicator of the processes on the same node as this process
+    pub fn node(&self) -> &SimpleCommunicator {
+        &self.levels.node
+    }
+
+    /// The communicator of the node leaders if this process is a leader, otherwise `None`
+    pub fn leaders(&self) -> Option<&SimpleCommunicator> {
+        self.levels.leaders.as_ref()
+    }
+
+    /// The number of nodes
+    pub fn num_nodes(&self) -> usize {
+        self.levels.node_sizes.len()
+    }
+
+    /// Barrier synchronization among all processes of the communicator.
+    ///
+    /// The nodes enter the barrier first, then their leaders synchronize and release them.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.3
+    pub fn barrier(&self) {
+        self.levels.node.barrier();
+        if let Some(leaders) = &self.levels.leaders {
+            leaders.barrier();
+        }
+        self.levels.node.barrier();
+    }
+
+    /// Broadcasts `buffer` from the process with rank `root` in the communicator to all others.
+    ///
+    /// The root passes the data to its leader on its node, the leaders broadcast it among
+    /// themselves and then on their nodes.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.4
+    pub fn broadcast_into<Buf: ?Sized>(&self, root: Rank, buffer: &mut Buf)
+    where
+        Buf: BufferMut,
+    {
+        let levels = &*self.levels;
+        let root_leader = levels.leader_of[index(root)];
+        let on_root_node = levels.leader_of[index(self.comm.rank())] == root_leader;
+        let root_on_node = levels.node_rank_of[index(root)];
+
+        if on_root_node && root_on_node != 0 {
+            levels
+                .node
+                .process_at_rank(root_on_node)
+                .broadcast_into(buffer);
+        }
+        if let Some(leaders) = &levels.leaders {
+            leaders.process_at_rank(root_leader).broadcast_into(buffer);
+        }
+        if !on_root_node || root_on_node == 0 {
+            levels.node.process_at_rank(0).broadcast_into(buffer);
+        }
+    }
+
+    /// Performs a global reduction under the operation `op` of the input data in `sendbuf` and
+    /// stores the result in `recvbuf` on all processes.
+    ///
+    /// The data is reduced on every node to its leader, reduced among the leaders and broadcast
+    /// on every node. As that changes the order in which the contributions are combined, a
+    /// non-commutative `op` falls back to a flat reduction unless the nodes hold consecutive
+    /// ranks. The leaders copy their partial result once, which is why `recvbuf` has to be
+    /// `ToOwned`.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.9.6
+    pub fn all_reduce_into<S: ?Sized, R: ?Sized, O>(&self, sendbuf: &S, recvbuf: &mut R, op: O)
+    where
+        S: Buffer,
+        R: BufferMut + ToOwned,
+        R::Owned: Buffer,
+        O: Operation,
+    {
+        let levels = &*self.levels;
+        if !op.is_commutative() && !levels.is_blocked() {
+            self.comm.all_reduce_into(sendbuf, recvbuf, op);
+            return;
+        }
+
+        let node_leader = levels.node.process_at_rank(0);
+        match &levels.leaders {
+            Some(leaders) => {
+                node_leader.reduce_into_root(sendbuf, recvbuf, &op);
+                if leaders.size() > 1 {
+                    let partial = recvbuf.to_owned();
+                    leaders.all_reduce_into(&partial, recvbuf, &op);
+                }
+            }
+            None => node_leader.reduce_into(sendbuf, &op),
+        }
+        node_leader.broadcast_into(recvbuf);
+    }
+
+    /// Gathers the contents of `sendbuf` on all processes into `recvbuf` on all processes, in
+    /// rank order.
+    ///
+    /// Every node gathers its blocks at its leader, the leaders exchange the blocks of their
+    /// nodes and then broadcast all blocks on their nodes. If the nodes do not hold consecutive
+    /// ranks, the leaders move the blocks from node order into rank order, which is why the
+    /// elements have to be `Copy`.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 5.7
+    pub fn all_gather_into<T>(&self, sendbuf: &[T], recvbuf: &mut [T])
+    where
+        T: Equivalence + Copy,
+    {
+        let levels = &*self.levels;
+        let block = sendbuf.len();
+        assert_eq!(
+            recvbuf.len(),
+            block * levels.node_order.len(),
+            "recvbuf must hold one block of sendbuf.len() elements per process"
+        );
+        if block == 0 {
+            return;
+        }
+
+        let node_leader = levels.node.process_at_rank(0);
+        match &levels.leaders {
+            Some(leaders) => {
+                let mut node_blocks = sendbuf.repeat(index(levels.node.size()));
+                node_leader.gather_into_root(sendbuf, &mut node_blocks[..]);
+
+                let block_count: Count = block.try_into().expect("block too large for a Count");
+                let counts: Vec<Count> =
+                    levels.node_sizes.iter().map(|&n| n * block_count).collect();
+                let displs: Vec<Count> = counts
+                    .iter()
+                    .scan(0, |acc, &c| {
+                        let d = *acc;
+                        *acc += c;
+                        Some(d)
+                    })
+                    .collect();
+                if levels.is_blocked() {
+                    let mut partition = PartitionMut::new(recvbuf, &counts[..], &displs[..]);
+                    leaders.all_gather_varcount_into(&node_blocks[..], &mut partition);
+                } else {
+                    let mut in_node_order = recvbuf.to_vec();
+                    let mut partition =
+                        PartitionMut::new(&mut in_node_order[..], &counts[..], &displs[..]);
+                    leaders.all_gather_varcount_into(&node_blocks[..], &mut partition);
+                    for (blocks, &r) in in_node_order.chunks(block).zip(&levels.node_order) {
+                        recvbuf[index(r) * block..][..block].copy_from_slice(blocks);
+                    }
+                }
+            }
+            None => node_leader.gather_into(sendbuf),
+        }
+        node_leader.broadcast_into(recvbuf);
+    }
+}
@@ -105,6 +105,8 @@
 //!   - blocking and non-blocking variants
 //! - **Datatypes**: Bridging between Rust types and MPI basic types as well as custom MPI datatypes
 //! which can act as views into buffers.
+//! - **Large counts**: buffers with more than `Count::MAX` elements use the MPI 4.0 large-count
+//! (`_c`) functions (requires the `mpi-rt-sys-backend` feature)
 //!
 //! Not supported (yet):
 //!
@@ -149,11 +151,58 @@ pub mod ffi {
     pub use mpi_sys::*;
 }
 
+/// Calls an MPI function whose counts are given as `LargeCount`s.
+///
+/// If all scalar counts fit into a `Count` and all partitions are given in `Count`s, the classic
+/// function `$f` is called. Otherwise, the counts and partitions are widened and the large-count
+/// variant `$f_c` is called. Inside the argument list, the count identifiers refer to the values
+/// passed to whichever function is called.
+macro_rules! large_count_call {
+    (
+        $f:ident / $f_c:ident,
+        [$($count:ident),* $(,)?],
+        $([$(($counts:ident, $displs:ident)),+ $(,)?],)?
+        ($($arg:expr),* $(,)?) $(,)?
+    ) => {
+        match (
+            $($crate::Count::try_from($count).ok(),)*
+            $($(<_ as $crate::datatype::PartitionCount>::as_counts($counts, $displs),)+)?
+        ) {
+            ($(Some($count),)* $($(Some(($counts, $displs)),)+)?) => $crate::ffi::$f($($arg),*),
+            #[cfg(feature = "mpi-rt-sys-backend")]
+            _ => {
+                $($(
+                    let ($counts, $displs) =
+                        <_ as $crate::datatype::PartitionCount>::to_large($counts, $displs);
+                )+)?
+                $crate::ffi::$f_c($($arg),*)
+            }
+            #[cfg(not(feature = "mpi-rt-sys-backend"))]
+            _ => $crate::large_count_unsupported(stringify!($f_c)),
+        }
+    };
+}
+
+#[cfg(not(feature = "mpi-rt-sys-backend"))]
+#[cold]
+#[inline(never)]
+fn large_count_unsupported(name: &str) -> ! {
+    panic!(
+        "{} is required for counts that do not fit into an MPI Count, but large-count functions \
+         are only available with the `mpi-rt-sys-backend` feature",
+        name
+    )
+}
+
+pub mod aggregation;
 pub mod attribute;
+pub mod buffer_pool;
 pub mod collective;
 pub mod datatype;
 pub mod environment;
+pub mod hierarchy;
 pub mod point_to_point;
+pub mod progress;
 pub mod raw;
 pub mod request;
 pub mod topology;
@@ -189,6 +238,8 @@ use crate::ffi::MPI_Aint;
 pub type Error = c_int;
 /// Encodes number of values in multi-value messages.
 pub type Count = c_int;
+/// Encodes number of values in multi-value messages that may exceed the range of `Count`.
+pub type LargeCount = ffi::MPI_Count;
 /// Can be used to tag messages on the sender side and match on the receiver side.
 pub type Tag = c_int;
 /// An address in memory
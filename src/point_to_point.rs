@@ -8,25 +8,28 @@
 //!
 //! - **3.2.6**: `MPI_STATUS_IGNORE`
 //! - **3.6**: Buffer usage, `MPI_Buffer_attach()`, `MPI_Buffer_detach()`
-//! - **3.9**: Persistent requests, `MPI_Send_init()`, `MPI_Bsend_init()`, `MPI_Ssend_init()`,
-//! `MPI_Rsend_init()`, `MPI_Recv_init()`, `MPI_Start()`, `MPI_Startall()`
 
 use std::{
-    alloc::{self, Layout},
     fmt,
-    mem::{transmute, MaybeUninit},
-    ptr,
+    mem::{ManuallyDrop, MaybeUninit},
+    os::raw::c_int,
+    pin::Pin,
+    ptr, slice,
+    task::{Context, Poll},
 };
 
 use conv::ConvUtil;
 
-use super::{Count, Tag};
+use super::{Count, LargeCount, Tag};
+#[cfg(feature = "mpi-rt-sys-backend")]
+use crate::request::{PartitionedReceiveRequest, PartitionedSendRequest};
 use crate::{
+    buffer_pool::BufferPool,
     datatype::traits::*,
     ffi,
     ffi::{MPI_Message, MPI_Status},
     raw::traits::*,
-    request::{Request, Scope, StaticScope},
+    request::{PersistentRequest, Request, Scope, StaticScope},
     topology::{traits::*, AnyProcess, CommunicatorRelation, Process, Rank},
     with_uninitialized, with_uninitialized2,
 };
@@ -209,14 +212,19 @@ pub unsafe trait Source: AsCommunicator {
         unsafe {
             Status(
                 with_uninitialized(|status| {
-                    ffi::MPI_Recv(
-                        buf.pointer_mut(),
-                        buf.count(),
-                        buf.as_datatype().as_raw(),
-                        self.source_rank(),
-                        tag,
-                        self.as_communicator().as_raw(),
-                        status,
+                    let count = buf.large_count();
+                    large_count_call!(
+                        MPI_Recv / MPI_Recv_c,
+                        [count],
+                        (
+                            buf.pointer_mut(),
+                            count,
+                            buf.as_datatype().as_raw(),
+                            self.source_rank(),
+                            tag,
+                            self.as_communicator().as_raw(),
+                            status
+                        )
                     )
                 })
                 .1,
@@ -271,6 +279,42 @@ pub unsafe trait Source: AsCommunicator {
         self.receive_vec_with_tag(ffi::RSMPI_ANY_TAG_fn())
     }
 
+    /// Receive a message matching `tag` containing multiple instances of type `Msg` into a `Vec`
+    /// taken from `pool`.
+    ///
+    /// Give the `Vec` back with `pool.put()` once it is no longer needed, so that later receives
+    /// can reuse it.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.2.4
+    fn receive_vec_pooled_with_tag<Msg>(&self, pool: &BufferPool, tag: Tag) -> (Vec<Msg>, Status)
+    where
+        Msg: Equivalence,
+    {
+        self.matched_probe_with_tag(tag)
+            .matched_receive_vec_pooled(pool)
+    }
+
+    /// Receive a message containing multiple instances of type `Msg` into a `Vec` taken from
+    /// `pool`.
+    ///
+    /// Give the `Vec` back with `pool.put()` once it is no longer needed, so that later receives
+    /// can reuse it.
+    ///
+    /// # Examples
+    /// See `examples/buffer_pool.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.2.4
+    fn receive_vec_pooled<Msg>(&self, pool: &BufferPool) -> (Vec<Msg>, Status)
+    where
+        Msg: Equivalence,
+    {
+        self.receive_vec_pooled_with_tag(pool, ffi::RSMPI_ANY_TAG_fn())
+    }
+
     /// Initiate an immediate (non-blocking) receive operation.
     ///
     /// Initiate receiving a message matching `tag` into `buf`.
@@ -291,14 +335,19 @@ pub unsafe trait Source: AsCommunicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Irecv(
-                        buf.pointer_mut(),
-                        buf.count(),
-                        buf.as_datatype().as_raw(),
-                        self.source_rank(),
-                        tag,
-                        self.as_communicator().as_raw(),
-                        request,
+                    let count = buf.large_count();
+                    large_count_call!(
+                        MPI_Irecv / MPI_Irecv_c,
+                        [count],
+                        (
+                            buf.pointer_mut(),
+                            count,
+                            buf.as_datatype().as_raw(),
+                            self.source_rank(),
+                            tag,
+                            self.as_communicator().as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -330,35 +379,161 @@ pub unsafe trait Source: AsCommunicator {
         self.immediate_receive_into_with_tag(scope, buf, ffi::RSMPI_ANY_TAG_fn())
     }
 
-    /// Initiate a non-blocking receive operation for messages matching tag `tag`.
+    /// Create a persistent request for receiving messages matching `tag` into `buf`.
+    ///
+    /// The request is created inactive; each `start()` receives one message.
     ///
     /// # Standard section(s)
     ///
-    /// 3.7.2
-    fn immediate_receive_with_tag<Msg>(&self, tag: Tag) -> ReceiveFuture<Msg>
+    /// 3.9
+    fn receive_init_with_tag<'a, Sc, Buf: ?Sized>(
+        &self,
+        scope: Sc,
+        buf: &'a mut Buf,
+        tag: Tag,
+    ) -> PersistentRequest<'a, Buf, Sc>
     where
-        Msg: Equivalence,
+        Buf: 'a + BufferMut,
+        Sc: Scope<'a>,
     {
         unsafe {
-            let val = alloc::alloc(Layout::new::<Msg>()) as *mut Msg;
-            let (_, request) = with_uninitialized(|request| {
-                ffi::MPI_Irecv(
-                    val as _,
-                    1,
-                    Msg::equivalent_datatype().as_raw(),
+            let request = with_uninitialized(|request| {
+                let count = buf.large_count();
+                large_count_call!(
+                    MPI_Recv_init / MPI_Recv_init_c,
+                    [count],
+                    (
+                        buf.pointer_mut(),
+                        count,
+                        buf.as_datatype().as_raw(),
+                        self.source_rank(),
+                        tag,
+                        self.as_communicator().as_raw(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentRequest::from_raw(request, buf, scope)
+        }
+    }
+
+    /// Create a persistent request for receiving messages into `buf`.
+    ///
+    /// The request is created inactive; each `start()` receives one message.
+    ///
+    /// # Examples
+    /// See `examples/persistent.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.9
+    fn receive_init<'a, Sc, Buf: ?Sized>(
+        &self,
+        scope: Sc,
+        buf: &'a mut Buf,
+    ) -> PersistentRequest<'a, Buf, Sc>
+    where
+        Buf: 'a + BufferMut,
+        Sc: Scope<'a>,
+    {
+        self.receive_init_with_tag(scope, buf, ffi::RSMPI_ANY_TAG_fn())
+    }
+
+    /// Create a partitioned request for receiving a message of `partitions` equally sized
+    /// partitions into `buf`, matching tag `tag`.
+    ///
+    /// Partitioned receives cannot use wildcards, so the source must be a specific process and
+    /// `tag` cannot be `MPI_ANY_TAG`.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the length of `buf` is not a multiple of `partitions` or if the source is not a
+    /// specific process.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 4.2.1 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn partitioned_receive_init_with_tag<'a, Sc, T>(
+        &self,
+        scope: Sc,
+        buf: &'a mut [T],
+        partitions: usize,
+        tag: Tag,
+    ) -> PartitionedReceiveRequest<'a, T, Sc>
+    where
+        T: 'a + Equivalence,
+        Sc: Scope<'a>,
+    {
+        assert_ne!(
+            self.source_rank(),
+            ffi::RSMPI_ANY_SOURCE_fn(),
+            "partitioned receives need a specific source process"
+        );
+        let (count, c_partitions) = partition_counts(buf.len(), partitions);
+        unsafe {
+            let request = with_uninitialized(|request| {
+                ffi::MPI_Precv_init(
+                    buf.pointer_mut(),
+                    c_partitions,
+                    count,
+                    buf.as_datatype().as_raw(),
                     self.source_rank(),
                     tag,
                     self.as_communicator().as_raw(),
+                    ffi::RSMPI_INFO_NULL_fn(),
                     request,
                 )
-            });
-            ReceiveFuture {
-                val,
-                req: Request::from_raw(request, &(), StaticScope),
-            }
+            })
+            .1;
+            PartitionedReceiveRequest::from_persistent(
+                PersistentRequest::from_raw(request, buf, scope),
+                partitions,
+            )
         }
     }
 
+    /// Create a partitioned request for receiving a message of `partitions` equally sized
+    /// partitions into `buf`, sent with the default tag.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the length of `buf` is not a multiple of `partitions` or if the source is not a
+    /// specific process.
+    ///
+    /// # Examples
+    /// See `examples/partitioned.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 4.2.1 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn partitioned_receive_init<'a, Sc, T>(
+        &self,
+        scope: Sc,
+        buf: &'a mut [T],
+        partitions: usize,
+    ) -> PartitionedReceiveRequest<'a, T, Sc>
+    where
+        T: 'a + Equivalence,
+        Sc: Scope<'a>,
+    {
+        self.partitioned_receive_init_with_tag(scope, buf, partitions, Tag::default())
+    }
+
+    /// Initiate a non-blocking receive operation for messages matching tag `tag`.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.7.2
+    fn immediate_receive_with_tag<Msg>(&self, tag: Tag) -> ReceiveFuture<Msg>
+    where
+        Msg: Equivalence,
+    {
+        ReceiveFuture::new(self, tag, Vec::with_capacity(1), None)
+    }
+
     /// Initiate a non-blocking receive operation.
     ///
     /// # Examples
@@ -374,6 +549,42 @@ pub unsafe trait Source: AsCommunicator {
         self.immediate_receive_with_tag(ffi::RSMPI_ANY_TAG_fn())
     }
 
+    /// Initiate a non-blocking receive operation for messages matching tag `tag` into a buffer
+    /// taken from `pool`.
+    ///
+    /// The buffer is given back to the pool when the received value is returned.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.7.2
+    fn immediate_receive_pooled_with_tag<Msg>(
+        &self,
+        pool: &BufferPool,
+        tag: Tag,
+    ) -> ReceiveFuture<Msg>
+    where
+        Msg: Equivalence,
+    {
+        ReceiveFuture::new(self, tag, pool.get(1), Some(pool.clone()))
+    }
+
+    /// Initiate a non-blocking receive operation into a buffer taken from `pool`.
+    ///
+    /// The buffer is given back to the pool when the received value is returned.
+    ///
+    /// # Examples
+    /// See `examples/buffer_pool.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.7.2
+    fn immediate_receive_pooled<Msg>(&self, pool: &BufferPool) -> ReceiveFuture<Msg>
+    where
+        Msg: Equivalence,
+    {
+        self.immediate_receive_pooled_with_tag(pool, ffi::RSMPI_ANY_TAG_fn())
+    }
+
     /// Asynchronously probe a source for incoming messages.
     ///
     /// Asynchronously probe `Source` `&self` for incoming messages with a certain tag.
@@ -465,6 +676,40 @@ pub unsafe trait Source: AsCommunicator {
     fn immediate_matched_probe(&self) -> Option<(Message, Status)> {
         self.immediate_matched_probe_with_tag(ffi::RSMPI_ANY_TAG_fn())
     }
+
+    /// Stream the messages matching tag `tag` from `&self`, keeping up to `depth` receives in
+    /// flight.
+    ///
+    /// See [`MessageStream`](struct.MessageStream.html).
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.8.2, 3.8.3
+    fn message_stream_with_tag<Msg>(&self, depth: usize, tag: Tag) -> MessageStream<'_, Self, Msg>
+    where
+        Self: Sized,
+        Msg: Equivalence,
+    {
+        MessageStream::new(self, depth, tag)
+    }
+
+    /// Stream the messages with any tag from `&self`, keeping up to `depth` receives in flight.
+    ///
+    /// See [`MessageStream`](struct.MessageStream.html).
+    ///
+    /// # Examples
+    /// See `examples/message_stream.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.8.2, 3.8.3
+    fn message_stream<Msg>(&self, depth: usize) -> MessageStream<'_, Self, Msg>
+    where
+        Self: Sized,
+        Msg: Equivalence,
+    {
+        self.message_stream_with_tag(depth, ffi::RSMPI_ANY_TAG_fn())
+    }
 }
 
 unsafe impl<'a> Source for AnyProcess<'a> {
@@ -503,13 +748,18 @@ pub trait Destination: AsCommunicator {
         Buf: Buffer,
     {
         unsafe {
-            ffi::MPI_Send(
-                buf.pointer(),
-                buf.count(),
-                buf.as_datatype().as_raw(),
-                self.destination_rank(),
-                tag,
-                self.as_communicator().as_raw(),
+            let count = buf.large_count();
+            large_count_call!(
+                MPI_Send / MPI_Send_c,
+                [count],
+                (
+                    buf.pointer(),
+                    count,
+                    buf.as_datatype().as_raw(),
+                    self.destination_rank(),
+                    tag,
+                    self.as_communicator().as_raw()
+                )
             );
         }
     }
@@ -554,13 +804,18 @@ pub trait Destination: AsCommunicator {
         Buf: Buffer,
     {
         unsafe {
-            ffi::MPI_Bsend(
-                buf.pointer(),
-                buf.count(),
-                buf.as_datatype().as_raw(),
-                self.destination_rank(),
-                tag,
-                self.as_communicator().as_raw(),
+            let count = buf.large_count();
+            large_count_call!(
+                MPI_Bsend / MPI_Bsend_c,
+                [count],
+                (
+                    buf.pointer(),
+                    count,
+                    buf.as_datatype().as_raw(),
+                    self.destination_rank(),
+                    tag,
+                    self.as_communicator().as_raw()
+                )
             );
         }
     }
@@ -593,13 +848,18 @@ pub trait Destination: AsCommunicator {
         Buf: Buffer,
     {
         unsafe {
-            ffi::MPI_Ssend(
-                buf.pointer(),
-                buf.count(),
-                buf.as_datatype().as_raw(),
-                self.destination_rank(),
-                tag,
-                self.as_communicator().as_raw(),
+            let count = buf.large_count();
+            large_count_call!(
+                MPI_Ssend / MPI_Ssend_c,
+                [count],
+                (
+                    buf.pointer(),
+                    count,
+                    buf.as_datatype().as_raw(),
+                    self.destination_rank(),
+                    tag,
+                    self.as_communicator().as_raw()
+                )
             );
         }
     }
@@ -651,13 +911,18 @@ pub trait Destination: AsCommunicator {
         Buf: Buffer,
     {
         unsafe {
-            ffi::MPI_Rsend(
-                buf.pointer(),
-                buf.count(),
-                buf.as_datatype().as_raw(),
-                self.destination_rank(),
-                tag,
-                self.as_communicator().as_raw(),
+            let count = buf.large_count();
+            large_count_call!(
+                MPI_Rsend / MPI_Rsend_c,
+                [count],
+                (
+                    buf.pointer(),
+                    count,
+                    buf.as_datatype().as_raw(),
+                    self.destination_rank(),
+                    tag,
+                    self.as_communicator().as_raw()
+                )
             );
         }
     }
@@ -715,14 +980,19 @@ pub trait Destination: AsCommunicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Isend(
-                        buf.pointer(),
-                        buf.count(),
-                        buf.as_datatype().as_raw(),
-                        self.destination_rank(),
-                        tag,
-                        self.as_communicator().as_raw(),
-                        request,
+                    let count = buf.large_count();
+                    large_count_call!(
+                        MPI_Isend / MPI_Isend_c,
+                        [count],
+                        (
+                            buf.pointer(),
+                            count,
+                            buf.as_datatype().as_raw(),
+                            self.destination_rank(),
+                            tag,
+                            self.as_communicator().as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -770,14 +1040,19 @@ pub trait Destination: AsCommunicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Ibsend(
-                        buf.pointer(),
-                        buf.count(),
-                        buf.as_datatype().as_raw(),
-                        self.destination_rank(),
-                        tag,
-                        self.as_communicator().as_raw(),
-                        request,
+                    let count = buf.large_count();
+                    large_count_call!(
+                        MPI_Ibsend / MPI_Ibsend_c,
+                        [count],
+                        (
+                            buf.pointer(),
+                            count,
+                            buf.as_datatype().as_raw(),
+                            self.destination_rank(),
+                            tag,
+                            self.as_communicator().as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -826,14 +1101,19 @@ pub trait Destination: AsCommunicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Issend(
-                        buf.pointer(),
-                        buf.count(),
-                        buf.as_datatype().as_raw(),
-                        self.destination_rank(),
-                        tag,
-                        self.as_communicator().as_raw(),
-                        request,
+                    let count = buf.large_count();
+                    large_count_call!(
+                        MPI_Issend / MPI_Issend_c,
+                        [count],
+                        (
+                            buf.pointer(),
+                            count,
+                            buf.as_datatype().as_raw(),
+                            self.destination_rank(),
+                            tag,
+                            self.as_communicator().as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -901,14 +1181,19 @@ pub trait Destination: AsCommunicator {
         unsafe {
             Request::from_raw(
                 with_uninitialized(|request| {
-                    ffi::MPI_Irsend(
-                        buf.pointer(),
-                        buf.count(),
-                        buf.as_datatype().as_raw(),
-                        self.destination_rank(),
-                        tag,
-                        self.as_communicator().as_raw(),
-                        request,
+                    let count = buf.large_count();
+                    large_count_call!(
+                        MPI_Irsend / MPI_Irsend_c,
+                        [count],
+                        (
+                            buf.pointer(),
+                            count,
+                            buf.as_datatype().as_raw(),
+                            self.destination_rank(),
+                            tag,
+                            self.as_communicator().as_raw(),
+                            request
+                        )
                     )
                 })
                 .1,
@@ -959,42 +1244,407 @@ pub trait Destination: AsCommunicator {
     {
         self.immediate_ready_send_with_tag(scope, buf, Tag::default())
     }
-}
 
-impl<'a> Destination for Process<'a> {
-    fn destination_rank(&self) -> Rank {
-        self.rank()
+    /// Create a persistent request for standard mode sends of the data in `buf` with tag `tag`.
+    ///
+    /// The request is created inactive; each `start()` sends the current contents of `buf`.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.9
+    fn send_init_with_tag<'a, Sc, Buf: ?Sized>(
+        &self,
+        scope: Sc,
+        buf: &'a mut Buf,
+        tag: Tag,
+    ) -> PersistentRequest<'a, Buf, Sc>
+    where
+        Buf: 'a + Buffer,
+        Sc: Scope<'a>,
+    {
+        unsafe {
+            let request = with_uninitialized(|request| {
+                let count = buf.large_count();
+                large_count_call!(
+                    MPI_Send_init / MPI_Send_init_c,
+                    [count],
+                    (
+                        buf.pointer(),
+                        count,
+                        buf.as_datatype().as_raw(),
+                        self.destination_rank(),
+                        tag,
+                        self.as_communicator().as_raw(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentRequest::from_raw(request, buf, scope)
+        }
     }
-}
-
-/// Describes the result of a point to point receive operation.
-///
-/// # Standard section(s)
-///
-/// 3.2.5
-#[derive(Copy, Clone)]
-pub struct Status(MPI_Status);
 
-impl Status {
-    /// Construct a `Status` value from the raw MPI type
-    pub fn from_raw(status: MPI_Status) -> Status {
-        Status(status)
+    /// Create a persistent request for standard mode sends of the data in `buf`.
+    ///
+    /// The request is created inactive; each `start()` sends the current contents of `buf`.
+    ///
+    /// # Examples
+    /// See `examples/persistent.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.9
+    fn send_init<'a, Sc, Buf: ?Sized>(
+        &self,
+        scope: Sc,
+        buf: &'a mut Buf,
+    ) -> PersistentRequest<'a, Buf, Sc>
+    where
+        Buf: 'a + Buffer,
+        Sc: Scope<'a>,
+    {
+        self.send_init_with_tag(scope, buf, Tag::default())
+    }
+
+    /// Create a persistent request for buffered mode sends of the data in `buf` with tag `tag`.
+    ///
+    /// The request is created inactive; each `start()` sends the current contents of `buf`.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.4, 3.9
+    fn buffered_send_init_with_tag<'a, Sc, Buf: ?Sized>(
+        &self,
+        scope: Sc,
+        buf: &'a mut Buf,
+        tag: Tag,
+    ) -> PersistentRequest<'a, Buf, Sc>
+    where
+        Buf: 'a + Buffer,
+        Sc: Scope<'a>,
+    {
+        unsafe {
+            let request = with_uninitialized(|request| {
+                let count = buf.large_count();
+                large_count_call!(
+                    MPI_Bsend_init / MPI_Bsend_init_c,
+                    [count],
+                    (
+                        buf.pointer(),
+                        count,
+                        buf.as_datatype().as_raw(),
+                        self.destination_rank(),
+                        tag,
+                        self.as_communicator().as_raw(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentRequest::from_raw(request, buf, scope)
+        }
+    }
+
+    /// Create a persistent request for buffered mode sends of the data in `buf`.
+    ///
+    /// The request is created inactive; each `start()` sends the current contents of `buf`.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.4, 3.9
+    fn buffered_send_init<'a, Sc, Buf: ?Sized>(
+        &self,
+        scope: Sc,
+        buf: &'a mut Buf,
+    ) -> PersistentRequest<'a, Buf, Sc>
+    where
+        Buf: 'a + Buffer,
+        Sc: Scope<'a>,
+    {
+        self.buffered_send_init_with_tag(scope, buf, Tag::default())
+    }
+
+    /// Create a persistent request for synchronous mode sends of the data in `buf` with tag `tag`.
+    ///
+    /// The request is created inactive; each `start()` sends the current contents of `buf`.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.4, 3.9
+    fn synchronous_send_init_with_tag<'a, Sc, Buf: ?Sized>(
+        &self,
+        scope: Sc,
+        buf: &'a mut Buf,
+        tag: Tag,
+    ) -> PersistentRequest<'a, Buf, Sc>
+    where
+        Buf: 'a + Buffer,
+        Sc: Scope<'a>,
+    {
+        unsafe {
+            let request = with_uninitialized(|request| {
+                let count = buf.large_count();
+                large_count_call!(
+                    MPI_Ssend_init / MPI_Ssend_init_c,
+                    [count],
+                    (
+                        buf.pointer(),
+                        count,
+                        buf.as_datatype().as_raw(),
+                        self.destination_rank(),
+                        tag,
+                        self.as_communicator().as_raw(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentRequest::from_raw(request, buf, scope)
+        }
+    }
+
+    /// Create a persistent request for synchronous mode sends of the data in `buf`.
+    ///
+    /// The request is created inactive; each `start()` sends the current contents of `buf`.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.4, 3.9
+    fn synchronous_send_init<'a, Sc, Buf: ?Sized>(
+        &self,
+        scope: Sc,
+        buf: &'a mut Buf,
+    ) -> PersistentRequest<'a, Buf, Sc>
+    where
+        Buf: 'a + Buffer,
+        Sc: Scope<'a>,
+    {
+        self.synchronous_send_init_with_tag(scope, buf, Tag::default())
+    }
+
+    /// Create a persistent request for ready mode sends of the data in `buf` with tag `tag`.
+    ///
+    /// The request is created inactive; each `start()` sends the current contents of `buf`.
+    ///
+    /// # Safety
+    ///
+    /// Every start of the request is subject to the requirement of
+    /// [`immediate_ready_send_with_tag()`](#method.immediate_ready_send_with_tag): the matching
+    /// receive operation must already have been started.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.4, 3.9
+    unsafe fn ready_send_init_with_tag<'a, Sc, Buf: ?Sized>(
+        &self,
+        scope: Sc,
+        buf: &'a mut Buf,
+        tag: Tag,
+    ) -> PersistentRequest<'a, Buf, Sc>
+    where
+        Buf: 'a + Buffer,
+        Sc: Scope<'a>,
+    {
+        unsafe {
+            let request = with_uninitialized(|request| {
+                let count = buf.large_count();
+                large_count_call!(
+                    MPI_Rsend_init / MPI_Rsend_init_c,
+                    [count],
+                    (
+                        buf.pointer(),
+                        count,
+                        buf.as_datatype().as_raw(),
+                        self.destination_rank(),
+                        tag,
+                        self.as_communicator().as_raw(),
+                        request
+                    )
+                )
+            })
+            .1;
+            PersistentRequest::from_raw(request, buf, scope)
+        }
+    }
+
+    /// Create a persistent request for ready mode sends of the data in `buf`.
+    ///
+    /// The request is created inactive; each `start()` sends the current contents of `buf`.
+    ///
+    /// # Safety
+    ///
+    /// Every start of the request is subject to the requirement of
+    /// [`immediate_ready_send_with_tag()`](#method.immediate_ready_send_with_tag): the matching
+    /// receive operation must already have been started.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.4, 3.9
+    unsafe fn ready_send_init<'a, Sc, Buf: ?Sized>(
+        &self,
+        scope: Sc,
+        buf: &'a mut Buf,
+    ) -> PersistentRequest<'a, Buf, Sc>
+    where
+        Buf: 'a + Buffer,
+        Sc: Scope<'a>,
+    {
+        self.ready_send_init_with_tag(scope, buf, Tag::default())
+    }
+
+    /// Create a partitioned request for sending the data in `buf` as one message of `partitions`
+    /// equally sized partitions with tag `tag`.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the length of `buf` is not a multiple of `partitions`.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 4.2.1 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn partitioned_send_init_with_tag<'a, Sc, T>(
+        &self,
+        scope: Sc,
+        buf: &'a mut [T],
+        partitions: usize,
+        tag: Tag,
+    ) -> PartitionedSendRequest<'a, T, Sc>
+    where
+        T: 'a + Equivalence,
+        Sc: Scope<'a>,
+    {
+        let (count, c_partitions) = partition_counts(buf.len(), partitions);
+        unsafe {
+            let request = with_uninitialized(|request| {
+                ffi::MPI_Psend_init(
+                    buf.pointer(),
+                    c_partitions,
+                    count,
+                    buf.as_datatype().as_raw(),
+                    self.destination_rank(),
+                    tag,
+                    self.as_communicator().as_raw(),
+                    ffi::RSMPI_INFO_NULL_fn(),
+                    request,
+                )
+            })
+            .1;
+            PartitionedSendRequest::from_persistent(
+                PersistentRequest::from_raw(request, buf, scope),
+                partitions,
+            )
+        }
+    }
+
+    /// Create a partitioned request for sending the data in `buf` as one message of `partitions`
+    /// equally sized partitions.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the length of `buf` is not a multiple of `partitions`.
+    ///
+    /// # Examples
+    /// See `examples/partitioned.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 4.2.1 (MPI 4.0)
+    #[cfg(feature = "mpi-rt-sys-backend")]
+    fn partitioned_send_init<'a, Sc, T>(
+        &self,
+        scope: Sc,
+        buf: &'a mut [T],
+        partitions: usize,
+    ) -> PartitionedSendRequest<'a, T, Sc>
+    where
+        T: 'a + Equivalence,
+        Sc: Scope<'a>,
+    {
+        self.partitioned_send_init_with_tag(scope, buf, partitions, Tag::default())
+    }
+}
+
+/// The `MPI_Count` elements per partition and the `c_int` number of partitions for partitioning
+/// `len` elements into `partitions` partitions.
+#[cfg(feature = "mpi-rt-sys-backend")]
+fn partition_counts(len: usize, partitions: usize) -> (LargeCount, Count) {
+    assert!(
+        partitions > 0 && len % partitions == 0,
+        "buffer of {} elements cannot be split into {} equally sized partitions",
+        len,
+        partitions
+    );
+    (
+        (len / partitions)
+            .try_into()
+            .expect("partition size exceeds the range of MPI_Count"),
+        partitions
+            .try_into()
+            .expect("number of partitions exceeds the range of c_int"),
+    )
+}
+
+impl<'a> Destination for Process<'a> {
+    fn destination_rank(&self) -> Rank {
+        self.rank()
+    }
+}
+
+/// Describes the result of a point to point receive operation.
+///
+/// # Standard section(s)
+///
+/// 3.2.5
+#[derive(Copy, Clone)]
+pub struct Status(MPI_Status);
+
+impl Status {
+    /// Construct a `Status` value from the raw MPI type
+    pub fn from_raw(status: MPI_Status) -> Status {
+        Status(status)
     }
 
     /// The rank of the message source
     pub fn source_rank(&self) -> Rank {
-        self.0.MPI_SOURCE
+        #[cfg(feature = "mpi-sys-backend")]
+        return self.0.MPI_SOURCE;
+        // The field layout depends on the ABI of the library loaded at runtime.
+        #[cfg(feature = "mpi-rt-sys-backend")]
+        return self.0.source();
     }
 
     /// The message tag
     pub fn tag(&self) -> Tag {
-        self.0.MPI_TAG
+        #[cfg(feature = "mpi-sys-backend")]
+        return self.0.MPI_TAG;
+        #[cfg(feature = "mpi-rt-sys-backend")]
+        return self.0.tag();
     }
 
     /// Number of instances of the type contained in the message
     pub fn count<D: Datatype>(&self, d: D) -> Count {
         unsafe { with_uninitialized(|count| ffi::MPI_Get_count(&self.0, d.as_raw(), count)).1 }
     }
+
+    /// Number of instances of the type contained in the message, which may exceed the range of
+    /// `Count`
+    ///
+    /// This asks `MPI_Get_count` first and only falls back to `MPI_Get_count_c` if that returns
+    /// `MPI_UNDEFINED`, so messages that fit into `Count` can be received from libraries without
+    /// the large-count functions. With the `mpi-sys-backend`, this is the same as `count()`.
+    pub fn large_count<D: Datatype>(&self, d: D) -> LargeCount {
+        let datatype = d.as_raw();
+        let count =
+            unsafe { with_uninitialized(|count| ffi::MPI_Get_count(&self.0, datatype, count)).1 };
+        #[cfg(feature = "mpi-rt-sys-backend")]
+        if count == ffi::RSMPI_UNDEFINED_fn() {
+            return unsafe {
+                with_uninitialized(|count| ffi::MPI_Get_count_c(&self.0, datatype, count)).1
+            };
+        }
+        count.into()
+    }
 }
 
 impl fmt::Debug for Status {
@@ -1065,12 +1715,17 @@ impl Message {
         let status;
         unsafe {
             status = with_uninitialized(|status| {
-                ffi::MPI_Mrecv(
-                    buf.pointer_mut(),
-                    buf.count(),
-                    buf.as_datatype().as_raw(),
-                    self.as_raw_mut(),
-                    status,
+                let count = buf.large_count();
+                large_count_call!(
+                    MPI_Mrecv / MPI_Mrecv_c,
+                    [count],
+                    (
+                        buf.pointer_mut(),
+                        count,
+                        buf.as_datatype().as_raw(),
+                        self.as_raw_mut(),
+                        status
+                    )
                 )
             })
             .1;
@@ -1097,12 +1752,17 @@ impl Message {
     {
         unsafe {
             let request = with_uninitialized(|request| {
-                ffi::MPI_Imrecv(
-                    buf.pointer_mut(),
-                    buf.count(),
-                    buf.as_datatype().as_raw(),
-                    self.as_raw_mut(),
-                    request,
+                let count = buf.large_count();
+                large_count_call!(
+                    MPI_Imrecv / MPI_Imrecv_c,
+                    [count],
+                    (
+                        buf.pointer_mut(),
+                        count,
+                        buf.as_datatype().as_raw(),
+                        self.as_raw_mut(),
+                        request
+                    )
                 )
             })
             .1;
@@ -1145,6 +1805,53 @@ pub trait MatchedReceiveVec {
     fn matched_receive_vec<Msg>(self) -> (Vec<Msg>, Status)
     where
         Msg: Equivalence;
+
+    /// Receives the message `&self` which contains multiple instances of type `Msg` into a `Vec`
+    /// taken from `pool`.
+    fn matched_receive_vec_pooled<Msg>(self, pool: &BufferPool) -> (Vec<Msg>, Status)
+    where
+        Msg: Equivalence;
+}
+
+/// An element of a receive buffer that has not been received yet
+#[repr(transparent)]
+struct UninitMsg<M>(MaybeUninit<M>);
+
+unsafe impl<M: Equivalence> Equivalence for UninitMsg<M> {
+    type Out = M::Out;
+
+    fn equivalent_datatype() -> Self::Out {
+        M::equivalent_datatype()
+    }
+}
+
+/// Receive `message` into the spare capacity of the empty `buf` and set its length to the
+/// number of elements received.
+fn matched_receive_into_vec<Msg>(
+    (message, status): (Message, Status),
+    mut buf: Vec<Msg>,
+) -> (Vec<Msg>, Status)
+where
+    Msg: Equivalence,
+{
+    let count: usize = status
+        .large_count(Msg::equivalent_datatype())
+        .value_as()
+        .expect("Message element count cannot be expressed as a usize.");
+    buf.clear();
+    buf.reserve(count);
+    // UninitMsg<Msg> is a transparent wrapper around MaybeUninit<Msg>.
+    let spare = unsafe {
+        slice::from_raw_parts_mut(
+            buf.spare_capacity_mut()
+                .as_mut_ptr()
+                .cast::<UninitMsg<Msg>>(),
+            count,
+        )
+    };
+    let status = message.matched_receive_into(spare);
+    unsafe { buf.set_len(count) };
+    (buf, status)
 }
 
 impl MatchedReceiveVec for (Message, Status) {
@@ -1152,32 +1859,19 @@ impl MatchedReceiveVec for (Message, Status) {
     where
         Msg: Equivalence,
     {
-        let (message, status) = self;
-        let count = status
-            .count(Msg::equivalent_datatype())
+        matched_receive_into_vec(self, Vec::new())
+    }
+
+    fn matched_receive_vec_pooled<Msg>(self, pool: &BufferPool) -> (Vec<Msg>, Status)
+    where
+        Msg: Equivalence,
+    {
+        let count: usize = self
+            .1
+            .large_count(Msg::equivalent_datatype())
             .value_as()
             .expect("Message element count cannot be expressed as a usize.");
-
-        #[repr(transparent)]
-        struct UninitMsg<M>(MaybeUninit<M>);
-
-        unsafe impl<M: Equivalence> Equivalence for UninitMsg<M> {
-            type Out = M::Out;
-
-            fn equivalent_datatype() -> Self::Out {
-                M::equivalent_datatype()
-            }
-        }
-
-        let mut res = (0..count)
-            .map(|_| UninitMsg::<Msg>(MaybeUninit::uninit()))
-            .collect::<Vec<_>>();
-
-        let status = message.matched_receive_into(&mut res[..]);
-
-        let res = unsafe { transmute(res) };
-
-        (res, status)
+        matched_receive_into_vec(self, pool.get(count))
     }
 }
 
@@ -1208,19 +1902,24 @@ where
     );
     unsafe {
         let (_, res, status) = with_uninitialized2(|res, status| {
-            ffi::MPI_Sendrecv(
-                msg.pointer(),
-                msg.count(),
-                msg.as_datatype().as_raw(),
-                destination.destination_rank(),
-                sendtag,
-                res as _,
-                1,
-                R::equivalent_datatype().as_raw(),
-                source.source_rank(),
-                receivetag,
-                source.as_communicator().as_raw(),
-                status,
+            let sendcount = msg.large_count();
+            large_count_call!(
+                MPI_Sendrecv / MPI_Sendrecv_c,
+                [sendcount],
+                (
+                    msg.pointer(),
+                    sendcount,
+                    msg.as_datatype().as_raw(),
+                    destination.destination_rank(),
+                    sendtag,
+                    res as _,
+                    1,
+                    R::equivalent_datatype().as_raw(),
+                    source.source_rank(),
+                    receivetag,
+                    source.as_communicator().as_raw(),
+                    status
+                )
             )
         });
         let status = Status(status);
@@ -1283,19 +1982,25 @@ where
     unsafe {
         Status(
             with_uninitialized(|status| {
-                ffi::MPI_Sendrecv(
-                    msg.pointer(),
-                    msg.count(),
-                    msg.as_datatype().as_raw(),
-                    destination.destination_rank(),
-                    sendtag,
-                    buf.pointer_mut(),
-                    buf.count(),
-                    buf.as_datatype().as_raw(),
-                    source.source_rank(),
-                    receivetag,
-                    source.as_communicator().as_raw(),
-                    status,
+                let sendcount = msg.large_count();
+                let recvcount = buf.large_count();
+                large_count_call!(
+                    MPI_Sendrecv / MPI_Sendrecv_c,
+                    [sendcount, recvcount],
+                    (
+                        msg.pointer(),
+                        sendcount,
+                        msg.as_datatype().as_raw(),
+                        destination.destination_rank(),
+                        sendtag,
+                        buf.pointer_mut(),
+                        recvcount,
+                        buf.as_datatype().as_raw(),
+                        source.source_rank(),
+                        receivetag,
+                        source.as_communicator().as_raw(),
+                        status
+                    )
                 )
             })
             .1,
@@ -1360,16 +2065,21 @@ where
     unsafe {
         Status(
             with_uninitialized(|status| {
-                ffi::MPI_Sendrecv_replace(
-                    buf.pointer_mut(),
-                    buf.count(),
-                    buf.as_datatype().as_raw(),
-                    destination.destination_rank(),
-                    sendtag,
-                    source.source_rank(),
-                    receivetag,
-                    source.as_communicator().as_raw(),
-                    status,
+                let count = buf.large_count();
+                large_count_call!(
+                    MPI_Sendrecv_replace / MPI_Sendrecv_replace_c,
+                    [count],
+                    (
+                        buf.pointer_mut(),
+                        count,
+                        buf.as_datatype().as_raw(),
+                        destination.destination_rank(),
+                        sendtag,
+                        source.source_rank(),
+                        receivetag,
+                        source.as_communicator().as_raw(),
+                        status
+                    )
                 )
             })
             .1,
@@ -1406,7 +2116,9 @@ where
 /// Will contain a value of type `T` received via a non-blocking receive operation.
 #[must_use]
 pub struct ReceiveFuture<T> {
-    val: *mut T,
+    // Leaked if the future is dropped before the receive has completed
+    buf: ManuallyDrop<Vec<T>>,
+    pool: Option<BufferPool>,
     req: Request<'static, ()>,
 }
 
@@ -1414,30 +2126,317 @@ impl<T> ReceiveFuture<T>
 where
     T: Equivalence,
 {
-    /// Wait for the receive operation to finish and return the received data.
-    pub fn get(self) -> (T, Status) {
-        let status = self.req.wait();
+    /// Start receiving a `T` from `source` into the empty `buf`, whose allocation is given to
+    /// `pool`, if any, once the value has been read.
+    fn new<S: Source + ?Sized>(
+        source: &S,
+        tag: Tag,
+        mut buf: Vec<T>,
+        pool: Option<BufferPool>,
+    ) -> ReceiveFuture<T> {
+        buf.reserve(1);
+        unsafe {
+            let (_, request) = with_uninitialized(|request| {
+                ffi::MPI_Irecv(
+                    buf.as_mut_ptr() as _,
+                    1,
+                    T::equivalent_datatype().as_raw(),
+                    source.source_rank(),
+                    tag,
+                    source.as_communicator().as_raw(),
+                    request,
+                )
+            });
+            ReceiveFuture {
+                buf: ManuallyDrop::new(buf),
+                pool,
+                req: Request::from_raw(request, &(), StaticScope),
+            }
+        }
+    }
+
+    /// Read the received value and release the buffer.
+    fn complete(
+        buf: ManuallyDrop<Vec<T>>,
+        pool: Option<BufferPool>,
+        status: Status,
+    ) -> (T, Status) {
         if status.count(T::equivalent_datatype()) == 0 {
             panic!("Received an empty message into a ReceiveFuture.");
         }
-        unsafe { (ptr::read(self.val), status) }
+        let val = unsafe { ptr::read(buf.as_ptr()) };
+        let buf = ManuallyDrop::into_inner(buf);
+        if let Some(pool) = pool {
+            pool.put(buf);
+        }
+        (val, status)
+    }
+
+    /// Wait for the receive operation to finish and return the received data.
+    pub fn get(self) -> (T, Status) {
+        let ReceiveFuture { buf, pool, req } = self;
+        let status = req.wait();
+        Self::complete(buf, pool, status)
     }
 
     /// Check whether the receive operation has finished.
     ///
     /// If the operation has finished, the data received is returned. Otherwise the future itself
     /// is returned.
-    pub fn r#try(mut self) -> Result<(T, Status), Self> {
-        match self.req.test() {
-            Ok(status) => {
-                if status.count(T::equivalent_datatype()) == 0 {
-                    panic!("Received an empty message into a ReceiveFuture.");
-                }
-                unsafe { Ok((ptr::read(self.val), status)) }
+    pub fn r#try(self) -> Result<(T, Status), Self> {
+        let ReceiveFuture { buf, pool, req } = self;
+        match req.test() {
+            Ok(status) => Ok(Self::complete(buf, pool, status)),
+            Err(req) => Err(ReceiveFuture { buf, pool, req }),
+        }
+    }
+}
+
+/// A stream of incoming messages that keeps several receives in flight
+///
+/// Created by [`Source::message_stream()`](trait.Source.html#method.message_stream). Receiving
+/// each message with a blocking `matched_probe()` followed by a receive pays the full latency of
+/// every message in turn. A `MessageStream` instead matches up to `depth` pending messages with
+/// `MPI_Improbe()`, starts an `MPI_Imrecv()` for each of them and yields the messages in the
+/// order in which their receives complete. Like `receive_vec()`, every message is returned as a
+/// `Vec<Msg>` together with its `Status`.
+///
+/// The stream never ends on its own: iterating blocks until the next message has arrived,
+/// `try_next()` returns `None` if none has been received yet and `poll_next()` has the signature
+/// of `Stream::poll_next()` from the `futures` crate, for use from asynchronous code.
+///
+/// Messages that have been matched but not yet yielded are still received when the stream is
+/// dropped and then discarded; `finish()` returns them instead.
+///
+/// # Examples
+/// See `examples/message_stream.rs`
+///
+/// # Standard section(s)
+///
+/// 3.8.2, 3.8.3
+pub struct MessageStream<'s, S: Source + ?Sized, Msg> {
+    source: &'s S,
+    tag: Tag,
+    depth: usize,
+    pool: Option<BufferPool>,
+    // Receives in flight, in the same order as their buffers and element counts
+    requests: Vec<ffi::MPI_Request>,
+    buffers: Vec<(Vec<Msg>, usize)>,
+}
+
+impl<'s, S, Msg> MessageStream<'s, S, Msg>
+where
+    S: Source + ?Sized,
+    Msg: Equivalence,
+{
+    fn new(source: &'s S, depth: usize, tag: Tag) -> Self {
+        assert!(depth > 0, "A MessageStream needs a depth of at least one.");
+        MessageStream {
+            source,
+            tag,
+            depth,
+            pool: None,
+            requests: Vec::with_capacity(depth),
+            buffers: Vec::with_capacity(depth),
+        }
+    }
+
+    /// Receive into buffers taken from `pool`. Buffers of messages that are dropped by the stream
+    /// are given back to the pool.
+    pub fn with_pool(mut self, pool: &BufferPool) -> Self {
+        self.pool = Some(pool.clone());
+        self
+    }
+
+    /// The maximum number of receives kept in flight
+    pub fn depth(&self) -> usize {
+        self.depth
+    }
+
+    /// The number of messages that have been matched but not yet yielded
+    pub fn in_flight(&self) -> usize {
+        self.requests.len()
+    }
+
+    /// Start receiving a matched message into the spare capacity of a new buffer.
+    fn post(&mut self, (mut message, status): (Message, Status)) {
+        let count: usize = status
+            .large_count(Msg::equivalent_datatype())
+            .value_as()
+            .expect("Message element count cannot be expressed as a usize.");
+        let mut buf = match self.pool {
+            Some(ref pool) => pool.get(count),
+            None => Vec::with_capacity(count),
+        };
+        buf.reserve(count);
+        unsafe {
+            // UninitMsg<Msg> is a transparent wrapper around MaybeUninit<Msg>.
+            let spare = slice::from_raw_parts_mut(
+                buf.spare_capacity_mut()
+                    .as_mut_ptr()
+                    .cast::<UninitMsg<Msg>>(),
+                count,
+            );
+            let request = with_uninitialized(|request| {
+                let count = spare.large_count();
+                large_count_call!(
+                    MPI_Imrecv / MPI_Imrecv_c,
+                    [count],
+                    (
+                        spare.pointer_mut(),
+                        count,
+                        spare.as_datatype().as_raw(),
+                        message.as_raw_mut(),
+                        request
+                    )
+                )
+            })
+            .1;
+            assert_eq!(message.as_raw(), ffi::RSMPI_MESSAGE_NULL_fn());
+            self.requests.push(request);
+        }
+        self.buffers.push((buf, count));
+    }
+
+    /// Match pending messages until `depth` receives are in flight.
+    fn fill(&mut self) {
+        while self.requests.len() < self.depth {
+            match self.source.immediate_matched_probe_with_tag(self.tag) {
+                Some(matched) => self.post(matched),
+                None => break,
+            }
+        }
+    }
+
+    /// Take the buffer of the completed receive at `index`.
+    fn complete(&mut self, index: c_int, status: MPI_Status) -> (Vec<Msg>, Status) {
+        let index: usize = index.try_into().expect("could not cast c_int to usize");
+        self.requests.swap_remove(index);
+        let (mut buf, count) = self.buffers.swap_remove(index);
+        // The receive has initialized the first `count` elements.
+        unsafe { buf.set_len(count) };
+        (buf, Status(status))
+    }
+
+    /// Block until the next message has been received and return it.
+    ///
+    /// If no receive is in flight, this blocks in `MPI_Mprobe()` until a message is matched.
+    pub fn next_message(&mut self) -> (Vec<Msg>, Status) {
+        self.fill();
+        if self.requests.is_empty() {
+            let matched = self.source.matched_probe_with_tag(self.tag);
+            self.post(matched);
+            self.fill();
+        }
+        let count = self.requests.len() as c_int;
+        let mut index: c_int = 0;
+        let (_, status) = unsafe {
+            with_uninitialized(|status| {
+                ffi::MPI_Waitany(count, self.requests.as_mut_ptr(), &mut index, status)
+            })
+        };
+        self.complete(index, status)
+    }
+
+    /// Return the next message if one has been received, without blocking.
+    pub fn try_next(&mut self) -> Option<(Vec<Msg>, Status)> {
+        self.fill();
+        if self.requests.is_empty() {
+            return None;
+        }
+        let count = self.requests.len() as c_int;
+        let mut index: c_int = 0;
+        let mut flag: c_int = 0;
+        let (_, status) = unsafe {
+            with_uninitialized(|status| {
+                ffi::MPI_Testany(
+                    count,
+                    self.requests.as_mut_ptr(),
+                    &mut index,
+                    &mut flag,
+                    status,
+                )
+            })
+        };
+        if flag != 0 && index != ffi::RSMPI_UNDEFINED_fn() {
+            Some(self.complete(index, status))
+        } else {
+            None
+        }
+    }
+
+    /// Poll for the next message, like `Stream::poll_next()`.
+    ///
+    /// MPI offers no notification of incoming messages, so a pending stream asks to be polled
+    /// again right away.
+    pub fn poll_next(
+        self: Pin<&mut Self>,
+        cx: &mut Context<'_>,
+    ) -> Poll<Option<(Vec<Msg>, Status)>> {
+        match self.get_mut().try_next() {
+            Some(received) => Poll::Ready(Some(received)),
+            None => {
+                cx.waker().wake_by_ref();
+                Poll::Pending
             }
-            Err(request) => {
-                self.req = request;
-                Err(self)
+        }
+    }
+
+    /// Wait for the receives in flight and return their messages, without matching any more.
+    pub fn finish(mut self) -> Vec<(Vec<Msg>, Status)> {
+        let count = self.requests.len() as c_int;
+        let mut statuses: Vec<MPI_Status> = Vec::with_capacity(self.requests.len());
+        unsafe {
+            ffi::MPI_Waitall(
+                count,
+                self.requests.as_mut_ptr(),
+                statuses.spare_capacity_mut().as_mut_ptr().cast(),
+            );
+            statuses.set_len(self.requests.len());
+        }
+        self.requests.clear();
+        self.buffers
+            .drain(..)
+            .zip(statuses)
+            .map(|((mut buf, count), status)| {
+                // The receive has initialized the first `count` elements.
+                unsafe { buf.set_len(count) };
+                (buf, Status(status))
+            })
+            .collect()
+    }
+}
+
+// Messages are received into heap buffers, so the stream itself may move while it is polled.
+impl<'s, S: Source + ?Sized, Msg> Unpin for MessageStream<'s, S, Msg> {}
+
+impl<'s, S, Msg> Iterator for MessageStream<'s, S, Msg>
+where
+    S: Source + ?Sized,
+    Msg: Equivalence,
+{
+    type Item = (Vec<Msg>, Status);
+
+    fn next(&mut self) -> Option<Self::Item> {
+        Some(self.next_message())
+    }
+}
+
+impl<'s, S: Source + ?Sized, Msg> Drop for MessageStream<'s, S, Msg> {
+    fn drop(&mut self) {
+        if !self.requests.is_empty() {
+            unsafe {
+                ffi::MPI_Waitall(
+                    self.requests.len() as c_int,
+                    self.requests.as_mut_ptr(),
+                    ffi::RSMPI_STATUSES_IGNORE_fn(),
+                );
+            }
+        }
+        // The received elements are not dropped, their buffers are still empty.
+        for (buf, _) in self.buffers.drain(..) {
+            if let Some(ref pool) = self.pool {
+                pool.put(buf);
             }
         }
     }
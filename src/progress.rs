@@ -0,0 +1,766 @@
+//! Completion of requests from asynchronous code
+//!
+//! A [`ProgressDriver`](struct.ProgressDriver.html) turns requests into futures that can be
+//! awaited on any executor. The driver holds the raw handles of all requests that are being
+//! awaited through it in one array, and every poll of one of its futures completes as many of
+//! them as possible with a single call to `MPI_Testsome()`, waking the tasks of all requests that
+//! completed. Awaiting many requests therefore costs one MPI call per poll instead of one per
+//! request.
+//!
+//! The futures of a driver do not need a thread of their own: while a future is pending, it asks
+//! the executor to poll it again, so MPI progresses whenever the executor gets to run it. Since
+//! futures may be polled from any thread of the executor, MPI has to be initialized with
+//! `Threading::Multiple` unless the executor runs on a single thread.
+//!
+//! Many MPI libraries only progress nonblocking operations, e.g. large sends or
+//! `immediate_all_reduce_into()`, while the application is inside an MPI call. A
+//! [`ProgressThread`](struct.ProgressThread.html) tests the requests of a driver in the background
+//! instead, backing off from spinning to yielding to sleeping while nothing completes, so that
+//! communication overlaps with computation that does not call MPI. The statistics of the driver
+//! tell how many requests had already completed when they were awaited. The thread is started
+//! with [`ProgressDriver::spawn_progress_thread()`](struct.ProgressDriver.html#method.spawn_progress_thread)
+//! or, for the lifetime of the MPI environment, with
+//! [`Universe::start_progress_thread()`](../environment/struct.Universe.html#method.start_progress_thread).
+//! Both require `Threading::Multiple`.
+//!
+//! # Examples
+//!
+//! See `examples/progress.rs` and `examples/progress_thread.rs`
+
+use std::{
+    fmt,
+    future::Future,
+    hint,
+    marker::PhantomData,
+    mem::{self, MaybeUninit},
+    os::raw::c_int,
+    pin::{pin, Pin},
+    sync::{Arc, Condvar, Mutex, MutexGuard},
+    task::{Context, Poll, Wake, Waker},
+    thread::{self, JoinHandle, Thread},
+    time::Duration,
+};
+
+use crate::{
+    environment::{threading_support, Threading},
+    ffi,
+    ffi::{MPI_Request, MPI_Status},
+    point_to_point::Status,
+    request::{is_null, Request, RequestCollection, Scope},
+};
+
+/// The state of a request added to a driver
+enum Slot {
+    /// The slot is free for reuse.
+    Vacant,
+    /// The request is incomplete; its handle is at `position` in the array of handles.
+    Pending {
+        position: usize,
+        waker: Option<Waker>,
+    },
+    /// The request has completed, but the future has not taken the status yet. `awaited` tells
+    /// whether the future had been polled before.
+    Complete { status: MPI_Status, awaited: bool },
+}
+
+struct Inner {
+    /// Handles of the incomplete requests
+    requests: Vec<MPI_Request>,
+    /// The slot of every handle in `requests`
+    owners: Vec<usize>,
+    slots: Vec<Slot>,
+    vacant: Vec<usize>,
+    indices: Vec<c_int>,
+    statuses: Vec<MaybeUninit<MPI_Status>>,
+    /// Wakers of completed requests, to be woken once the driver is unlocked
+    woken: Vec<Waker>,
+    /// Whether a progress thread is running
+    background: bool,
+    /// Whether the progress thread should stop
+    stop: bool,
+    stats: ProgressStats,
+}
+
+// The request handles are owned by the driver and are only passed to MPI while it is locked.
+unsafe impl Send for Inner {}
+
+impl Inner {
+    /// Take over the handle of an active request and return its slot.
+    fn insert(&mut self, request: MPI_Request) -> usize {
+        debug_assert!(!is_null(request));
+        let slot = Slot::Pending {
+            position: self.requests.len(),
+            waker: None,
+        };
+        let id = if let Some(id) = self.vacant.pop() {
+            self.slots[id] = slot;
+            id
+        } else {
+            self.slots.push(slot);
+            self.slots.len() - 1
+        };
+        self.requests.push(request);
+        self.owners.push(id);
+        id
+    }
+
+    /// Remove the handle at `position` from the array of handles, moving the last handle into
+    /// its place.
+    fn remove_handle(&mut self, position: usize) -> MPI_Request {
+        let request = self.requests.swap_remove(position);
+        self.owners.swap_remove(position);
+        if let Some(&moved) = self.owners.get(position) {
+            if let Slot::Pending { position: p, .. } = &mut self.slots[moved] {
+                *p = position;
+            }
+        }
+        request
+    }
+
+    /// Test all incomplete requests with one `MPI_Testsome()` and collect the wakers of the ones
+    /// that completed.
+    fn progress(&mut self) -> usize {
+        if self.requests.is_empty() {
+            return 0;
+        }
+        let n = self.requests.len();
+        self.indices.resize(n, 0);
+        self.statuses.resize(n, MaybeUninit::uninit());
+        let mut count: c_int = 0;
+        unsafe {
+            ffi::MPI_Testsome(
+                n as c_int,
+                self.requests.as_mut_ptr(),
+                &mut count,
+                self.indices.as_mut_ptr(),
+                self.statuses.as_mut_ptr() as *mut MPI_Status,
+            );
+        }
+        self.stats.polls += 1;
+        let count = usize::try_from(count).unwrap_or(0);
+        if count == 0 {
+            return 0;
+        }
+        self.stats.completed += count as u64;
+
+        for i in 0..count {
+            let position: usize = self.indices[i]
+                .try_into()
+                .expect("could not cast c_int to usize");
+            assert!(is_null(self.requests[position])); // persistent requests are not supported
+            let status = unsafe { self.statuses[i].assume_init() };
+            let id = self.owners[position];
+            let waker = match mem::replace(&mut self.slots[id], Slot::Vacant) {
+                Slot::Pending { waker, .. } => waker,
+                _ => panic!("rsmpi internal error: completed request is not pending"),
+            };
+            self.slots[id] = Slot::Complete {
+                status,
+                awaited: waker.is_some(),
+            };
+            self.woken.extend(waker);
+        }
+        // Remove completed handles from the back, so that swapping does not move a completed
+        // handle that is still to be removed.
+        self.indices[..count].sort_unstable_by(|a, b| b.cmp(a));
+        for i in 0..count {
+            let position = self.indices[i].try_into();
+            self.remove_handle(position.expect("could not cast c_int to usize"));
+        }
+        count
+    }
+
+    /// Take the status of the request in slot `id` if it has completed, otherwise remember
+    /// `waker` to wake when it does.
+    fn take(&mut self, id: usize, waker: &Waker) -> Option<MPI_Status> {
+        match &mut self.slots[id] {
+            &mut Slot::Complete { status, awaited } => {
+                self.slots[id] = Slot::Vacant;
+                self.vacant.push(id);
+                self.stats.awaited += 1;
+                if !awaited {
+                    self.stats.ready_when_awaited += 1;
+                }
+                Some(status)
+            }
+            Slot::Pending { waker: w, .. } => {
+                if !w.as_ref().is_some_and(|w| w.will_wake(waker)) {
+                    *w = Some(waker.clone());
+                }
+                None
+            }
+            Slot::Vacant => panic!("rsmpi internal error: request slot is vacant"),
+        }
+    }
+
+    /// Take the status of the request in slot `id`, testing all requests first if it has not
+    /// completed yet.
+    fn poll(&mut self, id: usize, waker: &Waker) -> Option<MPI_Status> {
+        self.take(id, waker).or_else(|| {
+            self.progress();
+            self.take(id, waker)
+        })
+    }
+
+    /// Give up slot `id`. Returns the handle of the request if it is incomplete, or its status if
+    /// it has completed.
+    fn withdraw(&mut self, id: usize) -> Result<MPI_Request, MPI_Status> {
+        let result = match self.slots[id] {
+            Slot::Pending { position, .. } => Ok(self.remove_handle(position)),
+            Slot::Complete { status, .. } => Err(status),
+            Slot::Vacant => panic!("rsmpi internal error: request slot is vacant"),
+        };
+        self.slots[id] = Slot::Vacant;
+        self.vacant.push(id);
+        result
+    }
+}
+
+/// Drives the completion of requests awaited as futures
+///
+/// Cloning a `ProgressDriver` yields another handle to the same driver. All futures created
+/// through the handles of one driver are completed together.
+///
+/// # Examples
+///
+/// See `examples/progress.rs`
+///
+/// # Standard section(s)
+///
+/// 3.7.5
+#[derive(Clone)]
+pub struct ProgressDriver(Arc<Shared>);
+
+struct Shared {
+    inner: Mutex<Inner>,
+    /// Signalled when a request is added or the progress thread should stop
+    work: Condvar,
+}
+
+impl ProgressDriver {
+    /// Create a driver without any requests.
+    pub fn new() -> ProgressDriver {
+        ProgressDriver(Arc::new(Shared {
+            inner: Mutex::new(Inner {
+                requests: Vec::new(),
+                owners: Vec::new(),
+                slots: Vec::new(),
+                vacant: Vec::new(),
+                indices: Vec::new(),
+                statuses: Vec::new(),
+                woken: Vec::new(),
+                background: false,
+                stop: false,
+                stats: ProgressStats::default(),
+            }),
+            work: Condvar::new(),
+        }))
+    }
+
+    fn lock(&self) -> MutexGuard<'_, Inner> {
+        self.0
+            .inner
+            .lock()
+            .expect("rsmpi internal error: progress driver lock poisoned")
+    }
+
+    /// Add the handle of an active request to the driver and return its slot.
+    fn insert(&self, request: MPI_Request) -> usize {
+        let mut inner = self.lock();
+        let slot = inner.insert(request);
+        if inner.background && inner.requests.len() == 1 {
+            self.0.work.notify_one();
+        }
+        slot
+    }
+
+    /// Unlock the driver and wake the tasks of the requests that completed.
+    fn unlock(mut inner: MutexGuard<'_, Inner>) {
+        let woken = mem::take(&mut inner.woken);
+        drop(inner);
+        for waker in woken {
+            waker.wake();
+        }
+    }
+
+    /// Test all requests awaited through the driver with one call to `MPI_Testsome()`, wake the
+    /// tasks of the ones that completed and return their number.
+    ///
+    /// Polling a future of the driver does this, so it does not usually have to be called.
+    pub fn progress(&self) -> usize {
+        let mut inner = self.lock();
+        let completed = inner.progress();
+        ProgressDriver::unlock(inner);
+        completed
+    }
+
+    /// The number of incomplete requests awaited through the driver
+    pub fn outstanding(&self) -> usize {
+        self.lock().requests.len()
+    }
+
+    /// Statistics of the driver
+    pub fn stats(&self) -> ProgressStats {
+        let inner = self.lock();
+        ProgressStats {
+            outstanding: inner.requests.len(),
+            ..inner.stats
+        }
+    }
+
+    /// Start a thread that tests the requests of the driver in the background until the
+    /// returned `ProgressThread` is dropped.
+    ///
+    /// While the thread runs, pending futures of the driver are woken by the thread instead of
+    /// being polled again right away.
+    ///
+    /// # Panics
+    ///
+    /// Panics if MPI does not support `Threading::Multiple` or if the driver already has a
+    /// progress thread.
+    pub fn spawn_progress_thread(&self, backoff: Backoff) -> ProgressThread {
+        assert_eq!(
+            threading_support(),
+            Threading::Multiple,
+            "a progress thread requires Threading::Multiple"
+        );
+        {
+            let mut inner = self.lock();
+            assert!(
+                !inner.background,
+                "the driver already has a progress thread"
+            );
+            inner.background = true;
+            inner.stop = false;
+        }
+        let driver = self.clone();
+        let handle = thread::Builder::new()
+            .name("mpi-progress".into())
+            .spawn(move || driver.run(backoff))
+            .expect("rsmpi internal error: could not spawn the progress thread");
+        ProgressThread {
+            driver: self.clone(),
+            handle: Some(handle),
+        }
+    }
+
+    /// The loop of the progress thread
+    fn run(&self, backoff: Backoff) {
+        let mut idle: u32 = 0;
+        let mut sleep = backoff.min_sleep;
+        let mut inner = self.lock();
+        loop {
+            if inner.stop {
+                break;
+            }
+            if inner.requests.is_empty() {
+                inner = self
+                    .0
+                    .work
+                    .wait_while(inner, |inner| inner.requests.is_empty() && !inner.stop)
+                    .expect("rsmpi internal error: progress driver lock poisoned");
+                continue;
+            }
+            let completed = inner.progress();
+            inner.stats.background_polls += 1;
+            inner.stats.background_completed += completed as u64;
+            if completed > 0 {
+                idle = 0;
+                sleep = backoff.min_sleep;
+            } else {
+                idle = idle.saturating_add(1);
+            }
+            ProgressDriver::unlock(inner);
+
+            if idle > backoff.spins.saturating_add(backoff.yields) {
+                thread::sleep(sleep);
+                sleep = (sleep * 2).min(backoff.max_sleep);
+                self.lock().stats.sleeps += 1;
+            } else if idle > backoff.spins {
+                thread::yield_now();
+            } else if idle > 0 {
+                hint::spin_loop();
+            }
+            inner = self.lock();
+        }
+    }
+
+    /// A future that completes when `request` completes.
+    ///
+    /// If the future is dropped before it completes, it waits for the request like a
+    /// [`WaitGuard`](../request/struct.WaitGuard.html).
+    pub fn wait<'a, D: ?Sized, S: Scope<'a>>(
+        &self,
+        request: Request<'a, D, S>,
+    ) -> RequestFuture<'a, D, S> {
+        let (raw, data, scope) = unsafe { request.into_raw() };
+        // The future keeps the request registered with its scope until it completes.
+        scope.register();
+        let slot = self.insert(raw);
+        RequestFuture {
+            driver: self.clone(),
+            slot,
+            data: Some(data),
+            scope,
+            phantom: PhantomData,
+        }
+    }
+
+    /// A future that completes when at least one incomplete request of `collection` completes.
+    ///
+    /// The output lists (request_index, status, saved_data) for every request that completed; it
+    /// is empty if `collection` has no incomplete requests. If the future is dropped before it
+    /// completes, the collection takes back its incomplete requests.
+    pub fn wait_some<'c, 'a, D: ?Sized>(
+        &self,
+        collection: &'c mut RequestCollection<'a, D>,
+    ) -> CollectionFuture<'c, 'a, D> {
+        CollectionFuture::new(self, collection, false)
+    }
+
+    /// A future that completes when all requests of `collection` have completed.
+    ///
+    /// The output lists (request_index, status, saved_data) for every request that completed. If
+    /// the future is dropped before it completes, the collection takes back its incomplete
+    /// requests; requests that completed in the meantime are complete in the collection, too.
+    pub fn wait_all<'c, 'a, D: ?Sized>(
+        &self,
+        collection: &'c mut RequestCollection<'a, D>,
+    ) -> CollectionFuture<'c, 'a, D> {
+        CollectionFuture::new(self, collection, true)
+    }
+}
+
+impl Default for ProgressDriver {
+    fn default() -> Self {
+        ProgressDriver::new()
+    }
+}
+
+impl fmt::Debug for ProgressDriver {
+    fn fmt(&self, f: &mut fmt::Formatter) -> fmt::Result {
+        f.debug_struct("ProgressDriver")
+            .field("stats", &self.stats())
+            .finish()
+    }
+}
+
+/// Statistics of a [`ProgressDriver`](struct.ProgressDriver.html)
+#[derive(Copy, Clone, Debug, Default, PartialEq, Eq)]
+pub struct ProgressStats {
+    /// Calls to `MPI_Testsome()`
+    pub polls: u64,
+    /// Requests completed
+    pub completed: u64,
+    /// Requests currently incomplete
+    pub outstanding: usize,
+    /// Calls to `MPI_Testsome()` made by the progress thread
+    pub background_polls: u64,
+    /// Requests completed by the progress thread
+    pub background_completed: u64,
+    /// Times the progress thread went to sleep
+    pub sleeps: u64,
+    /// Requests whose completion was taken by a future
+    pub awaited: u64,
+    /// Requests that had already completed when their future was first polled
+    pub ready_when_awaited: u64,
+}
+
+impl ProgressStats {
+    /// The fraction of awaited requests that had completed before they were awaited, i.e. whose
+    /// communication overlapped completely with other work.
+    #[allow(clippy::cast_precision_loss)]
+    pub fn overlap(&self) -> f64 {
+        if self.awaited == 0 {
+            0.0
+        } else {
+            self.ready_when_awaited as f64 / self.awaited as f64
+        }
+    }
+}
+
+/// How the progress thread waits while no request completes
+///
+/// After a test that completes nothing, the thread spins `spins` times, then yields its time
+/// slice `yields` times and then sleeps, starting with `min_sleep` and doubling the time up to
+/// `max_sleep`. A completion starts over with spinning. While the driver has no requests, the
+/// thread blocks until one is added.
+#[derive(Copy, Clone, Debug, PartialEq, Eq)]
+pub struct Backoff {
+    /// Tests to repeat immediately
+    pub spins: u32,
+    /// Tests to repeat after yielding
+    pub yields: u32,
+    /// The first time to sleep between tests
+    pub min_sleep: Duration,
+    /// The longest time to sleep between tests
+    pub max_sleep: Duration,
+}
+
+impl Default for Backoff {
+    fn default() -> Self {
+        Backoff {
+            spins: 100,
+            yields: 100,
+            min_sleep: Duration::from_micros(10),
+            max_sleep: Duration::from_millis(1),
+        }
+    }
+}
+
+/// A thread that tests the requests of a [`ProgressDriver`](struct.ProgressDriver.html) in the
+/// background, see
+/// [`ProgressDriver::spawn_progress_thread()`](struct.ProgressDriver.html#method.spawn_progress_thread)
+///
+/// The thread is stopped and joined when the `ProgressThread` is dropped.
+pub struct ProgressThread {
+    driver: ProgressDriver,
+    handle: Option<JoinHandle<()>>,
+}
+
+impl ProgressThread {
+    /// The driver of the thread
+    pub fn driver(&self) -> &ProgressDriver {
+        &self.driver
+    }
+}
+
+impl Drop for ProgressThread {
+    fn drop(&mut self) {
+        self.driver.lock().stop = true;
+        self.driver.0.work.notify_all();
+        if let Some(handle) = self.handle.take() {
+            let _ = handle.join();
+        }
+        let mut inner = self.driver.lock();
+        inner.background = false;
+        inner.stop = false;
+    }
+}
+
+impl fmt::Debug for ProgressThread {
+    fn fmt(&self, f: &mut fmt::Formatter) -> fmt::Result {
+        f.debug_struct("ProgressThread")
+            .field("driver", &self.driver)
+            .finish()
+    }
+}
+
+/// Wakes a thread blocked in `block_on()`
+struct ThreadWaker(Thread);
+
+impl Wake for ThreadWaker {
+    fn wake(self: Arc<Self>) {
+        self.0.unpark();
+    }
+}
+
+/// Poll `future` on the current thread until it completes.
+fn block_on<F: Future>(future: F) -> F::Output {
+    let mut future = pin!(future);
+    let waker = Arc::new(ThreadWaker(thread::current())).into();
+    let mut cx = Context::from_waker(&waker);
+    loop {
+        if let Poll::Ready(output) = future.as_mut().poll(&mut cx) {
+            return output;
+        }
+        thread::park();
+    }
+}
+
+/// A future that completes when a request completes, see
+/// [`ProgressDriver::wait()`](struct.ProgressDriver.html#method.wait)
+#[must_use = "futures do nothing unless polled"]
+pub struct RequestFuture<'a, D: ?Sized, S: Scope<'a>> {
+    driver: ProgressDriver,
+    slot: usize,
+    /// The buffers of the request; `None` once it has completed
+    data: Option<&'a D>,
+    scope: S,
+    phantom: PhantomData<std::cell::Cell<&'a ()>>,
+}
+
+// The future is never pinned structurally.
+impl<'a, D: ?Sized, S: Scope<'a>> Unpin for RequestFuture<'a, D, S> {}
+
+impl<'a, D: ?Sized, S: Scope<'a>> RequestFuture<'a, D, S> {
+    /// Block the calling thread until the request completes.
+    ///
+    /// With a progress thread, the calling thread sleeps until it is woken by the progress
+    /// thread; otherwise it tests the requests of the driver in a loop.
+    pub fn wait(self) -> Status {
+        block_on(self)
+    }
+}
+
+impl<'a, D: ?Sized, S: Scope<'a>> Future for RequestFuture<'a, D, S> {
+    type Output = Status;
+
+    fn poll(self: Pin<&mut Self>, cx: &mut Context<'_>) -> Poll<Status> {
+        let this = self.get_mut();
+        assert!(
+            this.data.is_some(),
+            "request future polled after completion"
+        );
+        let mut inner = this.driver.lock();
+        let status = inner.poll(this.slot, cx.waker());
+        let background = inner.background;
+        ProgressDriver::unlock(inner);
+        if let Some(status) = status {
+            this.data = None;
+            unsafe { this.scope.unregister() };
+            Poll::Ready(Status::from_raw(status))
+        } else {
+            if !background {
+                cx.waker().wake_by_ref();
+            }
+            Poll::Pending
+        }
+    }
+}
+
+impl<'a, D: ?Sized, S: Scope<'a>> Drop for RequestFuture<'a, D, S> {
+    fn drop(&mut self) {
+        if self.data.take().is_none() {
+            return;
+        }
+        let withdrawn = self.driver.lock().withdraw(self.slot);
+        if let Ok(mut request) = withdrawn {
+            unsafe {
+                ffi::MPI_Wait(&mut request, ffi::RSMPI_STATUS_IGNORE_fn());
+            }
+        }
+        unsafe { self.scope.unregister() };
+    }
+}
+
+impl<'a, D: ?Sized, S: Scope<'a>> fmt::Debug for RequestFuture<'a, D, S> {
+    fn fmt(&self, f: &mut fmt::Formatter) -> fmt::Result {
+        f.debug_struct("RequestFuture")
+            .field("complete", &self.data.is_none())
+            .finish()
+    }
+}
+
+/// A future that completes when some or all requests of a
+/// [`RequestCollection`](../request/struct.RequestCollection.html) complete, see
+/// [`ProgressDriver::wait_some()`](struct.ProgressDriver.html#method.wait_some) and
+/// [`ProgressDriver::wait_all()`](struct.ProgressDriver.html#method.wait_all)
+#[must_use = "futures do nothing unless polled"]
+pub struct CollectionFuture<'c, 'a, D: ?Sized> {
+    driver: ProgressDriver,
+    collection: &'c mut RequestCollection<'a, D>,
+    all: bool,
+    /// (request_index, slot) of the requests handed to the driver
+    pending: Vec<(usize, usize)>,
+    result: Vec<(usize, Status, &'a D)>,
+    started: bool,
+}
+
+impl<'c, 'a, D: ?Sized> CollectionFuture<'c, 'a, D> {
+    /// Block the calling thread until the future completes, see
+    /// [`RequestFuture::wait()`](struct.RequestFuture.html#method.wait).
+    pub fn wait(self) -> Vec<(usize, Status, &'a D)> {
+        block_on(self)
+    }
+
+    /// Take the statuses of the completed requests and return whether the future is complete.
+    fn collect(&mut self, inner: &mut Inner, waker: &Waker) -> bool {
+        let collection = &mut *self.collection;
+        let result = &mut self.result;
+        self.pending.retain(|&(i, slot)| {
+            if let Some(status) = inner.take(slot, waker) {
+                result.push(collection.release(i, status));
+                false
+            } else {
+                true
+            }
+        });
+        self.pending.is_empty() || (!self.all && !self.result.is_empty())
+    }
+
+    fn new(
+        driver: &ProgressDriver,
+        collection: &'c mut RequestCollection<'a, D>,
+        all: bool,
+    ) -> Self {
+        CollectionFuture {
+            driver: driver.clone(),
+            collection,
+            all,
+            pending: Vec::new(),
+            result: Vec::new(),
+            started: false,
+        }
+    }
+}
+
+impl<'c, 'a, D: ?Sized> Future for CollectionFuture<'c, 'a, D> {
+    type Output = Vec<(usize, Status, &'a D)>;
+
+    fn poll(self: Pin<&mut Self>, cx: &mut Context<'_>) -> Poll<Self::Output> {
+        let this = self.get_mut();
+        let driver = this.driver.clone();
+        let mut inner = driver.lock();
+        if !this.started {
+            this.started = true;
+            for (i, request) in this.collection.take_requests() {
+                this.pending.push((i, inner.insert(request)));
+            }
+            if inner.background && !this.pending.is_empty() {
+                driver.0.work.notify_one();
+            }
+        }
+
+        let complete = this.collect(&mut inner, cx.waker()) || {
+            inner.progress();
+            this.collect(&mut inner, cx.waker())
+        };
+        if complete {
+            // Give the requests that are still incomplete back to the collection.
+            for (i, slot) in this.pending.drain(..) {
+                let request = inner.withdraw(slot).unwrap_or_else(|_| {
+                    panic!("rsmpi internal error: request completed without being tested")
+                });
+                this.collection.restore(i, request);
+            }
+            ProgressDriver::unlock(inner);
+            Poll::Ready(mem::take(&mut this.result))
+        } else {
+            let background = inner.background;
+            ProgressDriver::unlock(inner);
+            if !background {
+                cx.waker().wake_by_ref();
+            }
+            Poll::Pending
+        }
+    }
+}
+
+impl<'c, 'a, D: ?Sized> Drop for CollectionFuture<'c, 'a, D> {
+    fn drop(&mut self) {
+        if self.pending.is_empty() {
+            return;
+        }
+        let mut inner = self.driver.lock();
+        for (i, slot) in self.pending.drain(..) {
+            match inner.withdraw(slot) {
+                Ok(request) => self.collection.restore(i, request),
+                // The request completed, but its status is not reported to anyone.
+                Err(status) => {
+                    self.collection.release(i, status);
+                }
+            }
+        }
+    }
+}
+
+impl<'c, 'a, D: ?Sized> fmt::Debug for CollectionFuture<'c, 'a, D> {
+    fn fmt(&self, f: &mut fmt::Formatter) -> fmt::Result {
+        f.debug_struct("CollectionFuture")
+            .field("all", &self.all)
+            .field("pending", &self.pending.len())
+            .field("completed", &self.result.len())
+            .finish()
+    }
+}
@@ -19,6 +19,16 @@
 //! follow the respective policy for completing the operation.  When the guard is dropped, the
 //! request will be automatically unregistered from its `Scope`.
 //!
+//! Operations that are repeated many times with the same arguments can use a
+//! [`PersistentRequest`](struct.PersistentRequest.html), which is set up once and then started and
+//! completed any number of times, alone or together with others in a
+//! [`PersistentRequestCollection`](struct.PersistentRequestCollection.html).  Persistent requests
+//! are registered with a `Scope` like other requests and are freed when they are dropped.
+//! Partitioned requests (MPI 4.0, `mpi-rt-sys-backend` only) extend persistent sends so that
+//! partitions of one message can be marked ready independently, e.g. from several threads.
+//! Persistent collectives (MPI 4.0, `mpi-rt-sys-backend` only) return a `PersistentRequest` or,
+//! if they have separate send and receive buffers, a `PersistentCollectiveRequest`.
+//!
 //! # Unfinished features
 //!
 //! - **3.7**: Nonblocking mode:
@@ -45,7 +55,7 @@ use crate::{
 };
 
 /// Check if the request is `MPI_REQUEST_NULL`.
-fn is_null(request: MPI_Request) -> bool {
+pub(crate) fn is_null(request: MPI_Request) -> bool {
     request == ffi::RSMPI_REQUEST_NULL_fn()
 }
 
@@ -545,11 +555,23 @@ where
 }
 
 /// Request collection for managing multiple requests at the same time.
+///
+/// Every request is kept in a slot, whose index is returned by `add()` and reported by the
+/// completion methods. The slot of a request is freed when it completes and reused by later calls
+/// to `add()`, so a collection whose requests are continuously replaced only grows to the largest
+/// number of requests that were incomplete at the same time. Only the incomplete requests are
+/// passed to MPI, in one compact array.
 pub struct RequestCollection<'a, D: ?Sized> {
-    /// Array of requests
+    /// Array of incomplete requests
     requests: Vec<MPI_Request>,
-    /// List of data buffers attached to each request
+    /// Slot of each request in `requests`
+    owners: Vec<usize>,
+    /// Data buffers attached to the request in each slot, `None` for free slots
     data: Vec<Option<&'a D>>,
+    /// Free slots
+    free: Vec<usize>,
+    /// Number of incomplete requests
+    live: usize,
     /// Request statuses
     statuses: Vec<MaybeUninit<MPI_Status>>,
     /// Pre-allocated indices buffer for use with testsome(), waitsome(), etc.
@@ -559,70 +581,195 @@ pub struct RequestCollection<'a, D: ?Sized> {
 impl<'a, D: ?Sized> RequestCollection<'a, D> {
     /// Create a new RequestBuffer with a reserved size.
     fn new(reserve: usize) -> RequestCollection<'a, D> {
-        let mut requests = vec![];
-        let mut data = vec![];
-        let mut statuses = vec![];
-        let mut indices = vec![];
-        requests.reserve(reserve);
-        data.reserve(reserve);
-        statuses.reserve(reserve);
-        indices.reserve(reserve);
         RequestCollection {
-            requests,
-            data,
-            statuses,
-            indices,
+            requests: Vec::with_capacity(reserve),
+            owners: Vec::with_capacity(reserve),
+            data: Vec::with_capacity(reserve),
+            free: Vec::new(),
+            live: 0,
+            statuses: Vec::with_capacity(reserve),
+            indices: Vec::with_capacity(reserve),
         }
     }
 
     /// Return the total number of requests that are incomplete.
     pub fn incomplete(&self) -> usize {
-        self.data
-            .iter()
-            .map(|data| if data.is_some() { 1 } else { 0 })
-            .sum()
+        self.live
     }
 
     /// Add the request to the collection. This unregisters the request from the
     /// scope. The collection then ensures that the request has completed.
+    ///
+    /// Returns the index of the slot of the request, which may be the slot of a request that has
+    /// already completed.
     pub fn add<S>(&mut self, req: Request<'a, D, S>) -> usize
     where
         S: Scope<'a>,
     {
-        let i = self.requests.len();
         let (req, data, _) = unsafe { req.into_raw() };
-        self.requests.push(req);
-        self.data.push(Some(data));
-        self.statuses.push(MaybeUninit::<MPI_Status>::uninit());
-        self.indices.push(0);
-        i
+        let slot = if let Some(slot) = self.free.pop() {
+            self.data[slot] = Some(data);
+            slot
+        } else {
+            self.data.push(Some(data));
+            self.data.len() - 1
+        };
+        self.live += 1;
+        self.restore(slot, req);
+        slot
+    }
+
+    /// Put the handle of the incomplete request in `slot` into the array of requests.
+    pub(crate) fn restore(&mut self, slot: usize, request: MPI_Request) {
+        self.requests.push(request);
+        self.owners.push(slot);
+    }
+
+    /// Take the handles of all incomplete requests out of the array of requests, e.g. to complete
+    /// them elsewhere with `restore()` and `release()`.
+    pub(crate) fn take_requests(&mut self) -> Vec<(usize, MPI_Request)> {
+        self.owners.drain(..).zip(self.requests.drain(..)).collect()
+    }
+
+    /// Free the slot of a request that has completed and return its (slot, status, saved_data).
+    pub(crate) fn release(&mut self, slot: usize, status: MPI_Status) -> (usize, Status, &'a D) {
+        (slot, Status::from_raw(status), self.free_slot(slot))
+    }
+
+    /// Free the slot of a request that has completed and return its saved data.
+    fn free_slot(&mut self, slot: usize) -> &'a D {
+        let data = self.data[slot]
+            .take()
+            .expect("rsmpi internal error: completed request slot is free");
+        self.free.push(slot);
+        self.live -= 1;
+        data
+    }
+
+    /// Remove the request at `position` from the array of requests, moving the last request into
+    /// its place.
+    fn remove(&mut self, position: usize) {
+        assert!(is_null(self.requests[position])); // persistent requests are not supported
+        self.requests.swap_remove(position);
+        self.owners.swap_remove(position);
+    }
+
+    /// The number of incomplete requests as a `c_int`, after making room for as many indices and
+    /// statuses
+    fn prepare(&mut self) -> c_int {
+        let n = self.requests.len();
+        self.statuses.resize(n, MaybeUninit::uninit());
+        self.indices.resize(n, 0);
+        n.try_into().expect("could not cast usize to c_int")
+    }
+
+    /// Complete the request at array position `index` and return its slot and saved data, unless
+    /// `index` is `MPI_UNDEFINED` because there was no incomplete request.
+    fn complete_one(&mut self, index: c_int) -> Option<(usize, &'a D)> {
+        if index == ffi::RSMPI_UNDEFINED_fn() {
+            return None;
+        }
+        let position: usize = index.try_into().expect("could not cast c_int to usize");
+        let slot = self.owners[position];
+        self.remove(position);
+        Some((slot, self.free_slot(slot)))
+    }
+
+    /// Complete the first `count` requests in `indices` and pass their slot, saved data and, if
+    /// `with_status`, status to `f`. The statuses are the first `count` statuses. Returns the
+    /// number of completed requests.
+    fn complete_some<F>(&mut self, count: c_int, with_status: bool, mut f: F) -> usize
+    where
+        F: FnMut(usize, &'a D, Option<MPI_Status>),
+    {
+        if count == ffi::RSMPI_UNDEFINED_fn() {
+            return 0;
+        }
+        let count: usize = count.try_into().expect("could not cast c_int to usize");
+        for i in 0..count {
+            let position: usize = self.indices[i]
+                .try_into()
+                .expect("could not cast c_int to usize");
+            let slot = self.owners[position];
+            let status = with_status.then(|| unsafe { self.statuses[i].assume_init() });
+            f(slot, self.free_slot(slot), status);
+        }
+        // Remove from the back, so that no completed request is moved before it is removed.
+        self.indices[..count].sort_unstable_by(|a, b| b.cmp(a));
+        for i in 0..count {
+            let position = self.indices[i].try_into();
+            self.remove(position.expect("could not cast c_int to usize"));
+        }
+        count
+    }
+
+    /// Complete all requests and pass their slot, saved data and, if `with_status`, status to
+    /// `f`. The statuses are in `statuses`. Returns the number of completed requests.
+    fn complete_all<F>(&mut self, with_status: bool, mut f: F) -> usize
+    where
+        F: FnMut(usize, &'a D, Option<MPI_Status>),
+    {
+        let count = self.requests.len();
+        for position in 0..count {
+            assert!(is_null(self.requests[position])); // persistent requests are not supported
+            let slot = self.owners[position];
+            let status = with_status.then(|| unsafe { self.statuses[position].assume_init() });
+            f(slot, self.free_slot(slot), status);
+        }
+        self.requests.clear();
+        self.owners.clear();
+        count
+    }
+
+    /// Complete some requests with `complete_some()` and put their (slot, status, saved_data) into
+    /// `result`.
+    fn complete_some_into(&mut self, count: c_int, result: &mut Vec<(usize, Status, &'a D)>) {
+        result.clear();
+        self.complete_some(count, true, |slot, data, status| {
+            let status = status.expect("rsmpi internal error: status was not requested");
+            result.push((slot, Status::from_raw(status), data));
+        });
+    }
+
+    /// Complete all requests with `complete_all()` and put their (slot, status, saved_data) into
+    /// `result`.
+    fn complete_all_into(&mut self, result: &mut Vec<(usize, Status, &'a D)>) {
+        result.clear();
+        result.reserve(self.requests.len());
+        self.complete_all(true, |slot, data, status| {
+            let status = status.expect("rsmpi internal error: status was not requested");
+            result.push((slot, Status::from_raw(status), data));
+        });
     }
 
     /// Wait for any request to complete, and return an option containing
     /// (request_index, status, saved_data).
     pub fn wait_any(&mut self) -> Option<(usize, Status, &'a D)> {
+        if self.requests.is_empty() {
+            return None;
+        }
         let mut i: c_int = 0;
         let (_res, status) = unsafe {
-            let count = self.requests.len() as c_int;
+            let count = self.prepare();
             with_uninitialized(|status| {
                 ffi::MPI_Waitany(count, self.requests.as_mut_ptr(), &mut i, status)
             })
         };
-
-        let i: usize = i.try_into().expect("could not cast c_int to usize");
-        self.data[i]
-            .take()
-            .map(|data| (i, Status::from_raw(status), data))
+        self.complete_one(i)
+            .map(|(slot, data)| (slot, Status::from_raw(status), data))
     }
 
     /// Wait for some of the requests to complete, fill result with references
     /// to the (request_index, status, saved_data) for each completed request
     /// and return the total number of completed requests.
     pub fn wait_some(&mut self, result: &mut Vec<(usize, Status, &'a D)>) {
-        result.clear();
+        if self.requests.is_empty() {
+            result.clear();
+            return;
+        }
         let mut count = 0;
         unsafe {
-            let n = self.requests.len() as c_int;
+            let n = self.prepare();
             // NOTE: not using the return value here
             ffi::MPI_Waitsome(
                 n,
@@ -632,52 +779,30 @@ impl<'a, D: ?Sized> RequestCollection<'a, D> {
                 self.statuses.as_mut_ptr() as *mut MPI_Status,
             );
         };
-
-        let count: usize = count.try_into().expect("could not cast c_int to usize");
-        result.reserve(count);
-        for i in 0..count {
-            let idx: usize = self.indices[i]
-                .try_into()
-                .expect("could not cast c_int to usize");
-            // Persistent requests check
-            assert!(is_null(self.requests[idx]));
-            if let Some(data) = self.data[idx].take() {
-                let status = unsafe { self.statuses[idx].assume_init() };
-                let status = Status::from_raw(status);
-                result.push((idx, status, data));
-            }
-        }
+        self.complete_some_into(count, result);
     }
 
     /// Wait for all requests to complete, putting (request_index, status, saved_data)
     /// into result for every completed request.
     pub fn wait_all(&mut self, result: &mut Vec<(usize, Status, &'a D)>) {
         let _res = unsafe {
+            let n = self.prepare();
             ffi::MPI_Waitall(
-                self.requests
-                    .len()
-                    .try_into()
-                    .expect("could not cast usize to c_int"),
+                n,
                 self.requests.as_mut_ptr(),
                 self.statuses.as_mut_ptr() as *mut MPI_Status,
             )
         };
-
-        result.clear();
-        result.reserve(self.requests.len());
-        for i in 0..self.requests.len() {
-            if let Some(data) = self.data[i].take() {
-                let status = unsafe { self.statuses[i].assume_init() };
-                let status = Status::from_raw(status);
-                result.push((i, status, data));
-            }
-        }
+        self.complete_all_into(result);
     }
 
     /// Test for the completion of any requests. Returns an option containing
     /// (request_index, status, saved_data).
     pub fn test_any(&mut self) -> Option<(usize, Status, &'a D)> {
-        let n = self.requests.len() as c_int;
+        if self.requests.is_empty() {
+            return None;
+        }
+        let n = self.prepare();
         let mut i = 0;
         let mut flag = 0;
         let (_, status) = unsafe {
@@ -687,11 +812,8 @@ impl<'a, D: ?Sized> RequestCollection<'a, D> {
         };
 
         if flag != 0 {
-            let i: usize = i.try_into().expect("could not cast c_int to usize");
-            assert!(is_null(self.requests[i]));
-            self.data[i]
-                .take()
-                .map(|data| (i, Status::from_raw(status), data))
+            self.complete_one(i)
+                .map(|(slot, data)| (slot, Status::from_raw(status), data))
         } else {
             None
         }
@@ -700,8 +822,11 @@ impl<'a, D: ?Sized> RequestCollection<'a, D> {
     /// Test for the completion of some requests. Completed request data will be
     /// stored in the result buffer in a tuple (request_index, status, saved_data).
     pub fn test_some(&mut self, result: &mut Vec<(usize, Status, &'a D)>) {
-        result.clear();
-        let n = self.requests.len() as c_int;
+        if self.requests.is_empty() {
+            result.clear();
+            return;
+        }
+        let n = self.prepare();
         let mut count = 0;
         unsafe {
             ffi::MPI_Testsome(
@@ -712,25 +837,13 @@ impl<'a, D: ?Sized> RequestCollection<'a, D> {
                 self.statuses.as_mut_ptr() as *mut MPI_Status,
             );
         }
-
-        let count: usize = count.try_into().expect("could not cast c_int to usize");
-        result.reserve(count);
-        for i in 0..count {
-            let idx: usize = self.indices[i]
-                .try_into()
-                .expect("could not cast c_int to usize");
-            assert!(is_null(self.requests[idx]));
-            let status = unsafe { self.statuses[idx].assume_init() };
-            if let Some(data) = self.data[idx].take() {
-                result.push((idx, Status::from_raw(status), data));
-            }
-        }
+        self.complete_some_into(count, result);
     }
 
     /// Test for the completion of all requests. Saved data used by the
     /// completed requests is stored in the result buffer.
     pub fn test_all(&mut self, result: &mut Vec<(usize, Status, &'a D)>) -> bool {
-        let n = self.requests.len() as c_int;
+        let n = self.prepare();
         let mut flag = 0;
         unsafe {
             ffi::MPI_Testall(
@@ -741,15 +854,135 @@ impl<'a, D: ?Sized> RequestCollection<'a, D> {
             );
         }
 
-        result.clear();
-        result.reserve(self.requests.len());
         if flag != 0 {
-            for i in 0..self.requests.len() {
-                if let Some(data) = self.data[i].take() {
-                    let status = unsafe { self.statuses[i].assume_init() };
-                    result.push((i, Status::from_raw(status), data));
-                }
-            }
+            self.complete_all_into(result);
+            true
+        } else {
+            result.clear();
+            false
+        }
+    }
+
+    /// Wait for any request to complete, but don’t bother retrieving its `Status`. Returns an
+    /// option containing (request_index, saved_data).
+    pub fn wait_any_without_status(&mut self) -> Option<(usize, &'a D)> {
+        if self.requests.is_empty() {
+            return None;
+        }
+        let mut i: c_int = 0;
+        unsafe {
+            let count = self.prepare();
+            ffi::MPI_Waitany(
+                count,
+                self.requests.as_mut_ptr(),
+                &mut i,
+                ffi::RSMPI_STATUS_IGNORE_fn(),
+            );
+        }
+        self.complete_one(i)
+    }
+
+    /// Wait for some of the requests to complete, but don’t bother retrieving their `Status`.
+    /// Calls `f` with (request_index, saved_data) for each completed request and returns the
+    /// number of completed requests.
+    pub fn wait_some_without_status<F>(&mut self, mut f: F) -> usize
+    where
+        F: FnMut(usize, &'a D),
+    {
+        if self.requests.is_empty() {
+            return 0;
+        }
+        let mut count = 0;
+        unsafe {
+            let n = self.prepare();
+            ffi::MPI_Waitsome(
+                n,
+                self.requests.as_mut_ptr(),
+                &mut count,
+                self.indices.as_mut_ptr(),
+                ffi::RSMPI_STATUSES_IGNORE_fn(),
+            );
+        }
+        self.complete_some(count, false, |slot, data, _| f(slot, data))
+    }
+
+    /// Wait for all requests to complete, but don’t bother retrieving their `Status`.
+    pub fn wait_all_without_status(&mut self) {
+        unsafe {
+            let n = self.prepare();
+            ffi::MPI_Waitall(
+                n,
+                self.requests.as_mut_ptr(),
+                ffi::RSMPI_STATUSES_IGNORE_fn(),
+            );
+        }
+        self.complete_all(false, |_, _, _| ());
+    }
+
+    /// Test for the completion of any request, but don’t bother retrieving its `Status`. Returns
+    /// an option containing (request_index, saved_data).
+    pub fn test_any_without_status(&mut self) -> Option<(usize, &'a D)> {
+        if self.requests.is_empty() {
+            return None;
+        }
+        let n = self.prepare();
+        let mut i = 0;
+        let mut flag = 0;
+        unsafe {
+            ffi::MPI_Testany(
+                n,
+                self.requests.as_mut_ptr(),
+                &mut i,
+                &mut flag,
+                ffi::RSMPI_STATUS_IGNORE_fn(),
+            );
+        }
+        if flag != 0 {
+            self.complete_one(i)
+        } else {
+            None
+        }
+    }
+
+    /// Test for the completion of some requests, but don’t bother retrieving their `Status`.
+    /// Calls `f` with (request_index, saved_data) for each completed request and returns the
+    /// number of completed requests.
+    pub fn test_some_without_status<F>(&mut self, mut f: F) -> usize
+    where
+        F: FnMut(usize, &'a D),
+    {
+        if self.requests.is_empty() {
+            return 0;
+        }
+        let n = self.prepare();
+        let mut count = 0;
+        unsafe {
+            ffi::MPI_Testsome(
+                n,
+                self.requests.as_mut_ptr(),
+                &mut count,
+                self.indices.as_mut_ptr(),
+                ffi::RSMPI_STATUSES_IGNORE_fn(),
+            );
+        }
+        self.complete_some(count, false, |slot, data, _| f(slot, data))
+    }
+
+    /// Test for the completion of all requests, but don’t bother retrieving their `Status`.
+    /// Returns `true` if all requests have completed.
+    pub fn test_all_without_status(&mut self) -> bool {
+        let n = self.prepare();
+        let mut flag = 0;
+        unsafe {
+            ffi::MPI_Testall(
+                n,
+                self.requests.as_mut_ptr(),
+                &mut flag,
+                ffi::RSMPI_STATUSES_IGNORE_fn(),
+            );
+        }
+        if flag != 0 {
+            self.complete_all(false, |_, _, _| ());
             true
         } else {
             false
@@ -760,8 +993,1053 @@ impl<'a, D: ?Sized> RequestCollection<'a, D> {
 /// Drop implementation to ensure that all requests have actually completed.
 impl<'a, D: ?Sized> Drop for RequestCollection<'a, D> {
     fn drop(&mut self) {
-        if !self.data.iter().all(|c| c.is_none()) {
+        if self.live != 0 {
             panic!("some requests have not completed");
         }
     }
 }
+
+/// A persistent request for a point-to-point operation registered with a `Scope` of lifetime `'a`
+///
+/// A persistent request binds the arguments of an operation once, so that the operation can be
+/// started and completed any number of times without setting it up again. Persistent requests
+/// are created inactive by methods such as `send_init()` and `receive_init()`, are activated by
+/// `start()` and become inactive again when a completion operation such as `wait()` or `test()`
+/// finds them complete.
+///
+/// The request borrows its buffer mutably for its whole lifetime. While the request is inactive,
+/// `buffer()` and `buffer_mut()` give access to it, e.g. to fill in the next message or to read
+/// the last one received.
+///
+/// When dropped, the request is waited for if it is active and then freed.
+///
+/// # Examples
+///
+/// See `examples/persistent.rs`
+///
+/// # Standard section(s)
+///
+/// 3.9
+#[must_use]
+pub struct PersistentRequest<'a, D: ?Sized, S: Scope<'a> = StaticScope> {
+    request: MPI_Request,
+    data: &'a mut D,
+    active: bool,
+    scope: S,
+    phantom: PhantomData<Cell<&'a ()>>,
+}
+
+impl<'a, D: ?Sized, S: Scope<'a>> fmt::Debug for PersistentRequest<'a, D, S>
+where
+    D: fmt::Debug,
+{
+    fn fmt(&self, formatter: &mut fmt::Formatter) -> fmt::Result {
+        formatter
+            .debug_struct("PersistentRequest")
+            .field("request", &self.request)
+            .field("active", &self.active)
+            .finish()
+    }
+}
+
+unsafe impl<'a, D: ?Sized, S: Scope<'a>> AsRaw for PersistentRequest<'a, D, S> {
+    type Raw = MPI_Request;
+    fn as_raw(&self) -> Self::Raw {
+        self.request
+    }
+}
+
+impl<'a, D: ?Sized, S: Scope<'a>> Drop for PersistentRequest<'a, D, S> {
+    fn drop(&mut self) {
+        unsafe {
+            if self.active {
+                ffi::MPI_Wait(&mut self.request, ffi::RSMPI_STATUS_IGNORE_fn());
+            }
+            ffi::MPI_Request_free(&mut self.request);
+            self.scope.unregister();
+        }
+    }
+}
+
+impl<'a, D: ?Sized, S: Scope<'a>> PersistentRequest<'a, D, S> {
+    /// Construct a persistent request object from the raw MPI type.
+    ///
+    /// # Requirements
+    ///
+    /// - The request is a valid, inactive persistent request.
+    /// - All buffers associated with the request must outlive `'a`.
+    /// - The request must not be registered with the given scope.
+    ///
+    /// # Safety
+    /// - `request` must be a live MPI object.
+    /// - `request` must not be used after calling `from_raw`.
+    /// - Any buffers owned by `request` must live longer than `scope`.
+    pub unsafe fn from_raw(request: MPI_Request, data: &'a mut D, scope: S) -> Self {
+        debug_assert!(!is_null(request));
+        scope.register();
+        Self {
+            request,
+            data,
+            active: false,
+            scope,
+            phantom: Default::default(),
+        }
+    }
+
+    /// Unregister the request object from its scope and deconstruct it into its raw parts,
+    /// without freeing the request.
+    ///
+    /// This is unsafe because the request may outlive its associated buffers.
+    ///
+    /// # Safety
+    /// - If the returned `MPI_Request` is active, it must be completed within the lifetime of the
+    ///   returned scope.
+    pub unsafe fn into_raw(self) -> (MPI_Request, &'a mut D, S) {
+        let request = ptr::read(&self.request);
+        let data = ptr::read(&self.data);
+        let scope = ptr::read(&self.scope);
+        let _ = ptr::read(&self.phantom);
+        mem::forget(self);
+        scope.unregister();
+        (request, data, scope)
+    }
+
+    /// Whether the request has been started and not yet completed.
+    pub fn is_active(&self) -> bool {
+        self.active
+    }
+
+    /// Start the operation.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the request is already active.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/persistent.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.9
+    pub fn start(&mut self) {
+        assert!(!self.active, "persistent request started while active");
+        unsafe {
+            ffi::MPI_Start(&mut self.request);
+        }
+        self.active = true;
+    }
+
+    fn wait_with(&mut self, status: *mut MPI_Status) {
+        unsafe {
+            ffi::MPI_Wait(&mut self.request, status);
+        }
+        self.active = false;
+    }
+
+    /// Wait for the operation to finish, leaving the request inactive.
+    ///
+    /// If the request is inactive, returns an empty status immediately.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/persistent.rs`
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.7.3
+    pub fn wait(&mut self) -> Status {
+        unsafe { Status::from_raw(with_uninitialized(|status| self.wait_with(status)).1) }
+    }
+
+    /// Wait for the operation to finish, but don’t bother retrieving the `Status` information.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.7.3
+    pub fn wait_without_status(&mut self) {
+        self.wait_with(ffi::RSMPI_STATUS_IGNORE_fn());
+    }
+
+    /// Test whether the operation has finished.
+    ///
+    /// If it has, the request becomes inactive and its `Status` is returned. If the request is
+    /// inactive, returns an empty status.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.7.3
+    pub fn test(&mut self) -> Option<Status> {
+        unsafe {
+            let mut status = MaybeUninit::uninit();
+            let (_, flag) = with_uninitialized(|flag| {
+                ffi::MPI_Test(&mut self.request, flag, status.as_mut_ptr())
+            });
+            if flag != 0 {
+                self.active = false;
+                Some(Status::from_raw(status.assume_init()))
+            } else {
+                None
+            }
+        }
+    }
+
+    /// Initiate cancellation of the active operation.
+    ///
+    /// The request still needs to be completed with `wait()` or `test()` before it can be started
+    /// again.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.8.4
+    pub fn cancel(&self) {
+        let mut request = self.as_raw();
+        unsafe {
+            ffi::MPI_Cancel(&mut request);
+        }
+    }
+
+    /// The buffer of the operation.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the request is active.
+    pub fn buffer(&self) -> &D {
+        assert!(
+            !self.active,
+            "buffer of an active persistent request accessed"
+        );
+        self.data
+    }
+
+    /// The buffer of the operation.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the request is active.
+    pub fn buffer_mut(&mut self) -> &mut D {
+        assert!(
+            !self.active,
+            "buffer of an active persistent request accessed"
+        );
+        self.data
+    }
+}
+
+/// A persistent collective operation with separate send and receive buffers
+///
+/// Created by methods such as `all_reduce_init()`. Like a
+/// [`PersistentRequest`](struct.PersistentRequest.html), it binds the arguments of the
+/// operation once and can be started and completed any number of times. That lets the MPI
+/// library select algorithms and register memory once. Both buffers are borrowed mutably for the
+/// lifetime of the request: `send_buffer_mut()` fills in the next contribution and
+/// `recv_buffer()` reads the last result while the request is inactive.
+///
+/// When dropped, the request is waited for if it is active and then freed.
+///
+/// # Examples
+///
+/// See `examples/persistent_collectives.rs`
+///
+/// # Standard section(s)
+///
+/// 6.13 (MPI 4.0)
+#[cfg(feature = "mpi-rt-sys-backend")]
+#[must_use]
+#[derive(Debug)]
+pub struct PersistentCollectiveRequest<'a, S: ?Sized, R: ?Sized, Sc: Scope<'a> = StaticScope> {
+    request: PersistentRequest<'a, R, Sc>,
+    sendbuf: &'a mut S,
+}
+
+#[cfg(feature = "mpi-rt-sys-backend")]
+impl<'a, S: ?Sized, R: ?Sized, Sc: Scope<'a>> PersistentCollectiveRequest<'a, S, R, Sc> {
+    /// Construct a persistent collective request object from the raw MPI type.
+    ///
+    /// # Safety
+    /// - `request` must be a live, inactive persistent request that is not used after calling
+    ///   `from_raw`.
+    /// - `sendbuf` and `recvbuf` must be the buffers of `request`.
+    /// - The request must not be registered with the given scope.
+    pub unsafe fn from_raw(
+        request: MPI_Request,
+        sendbuf: &'a mut S,
+        recvbuf: &'a mut R,
+        scope: Sc,
+    ) -> Self {
+        PersistentCollectiveRequest {
+            request: PersistentRequest::from_raw(request, recvbuf, scope),
+            sendbuf,
+        }
+    }
+
+    /// Whether the request has been started and not yet completed.
+    pub fn is_active(&self) -> bool {
+        self.request.is_active()
+    }
+
+    /// Start the operation.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the request is already active.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.9
+    pub fn start(&mut self) {
+        self.request.start();
+    }
+
+    /// Wait for the operation to finish, leaving the request inactive.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.7.3
+    pub fn wait(&mut self) -> Status {
+        self.request.wait()
+    }
+
+    /// Wait for the operation to finish, but don’t bother retrieving the `Status` information.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.7.3
+    pub fn wait_without_status(&mut self) {
+        self.request.wait_without_status();
+    }
+
+    /// Test whether the operation has finished.
+    ///
+    /// If it has, the request becomes inactive and its `Status` is returned.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.7.3
+    pub fn test(&mut self) -> Option<Status> {
+        self.request.test()
+    }
+
+    /// The send buffer of the operation.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the request is active.
+    pub fn send_buffer(&self) -> &S {
+        assert!(
+            !self.is_active(),
+            "buffer of an active persistent request accessed"
+        );
+        self.sendbuf
+    }
+
+    /// The send buffer of the operation.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the request is active.
+    pub fn send_buffer_mut(&mut self) -> &mut S {
+        assert!(
+            !self.is_active(),
+            "buffer of an active persistent request accessed"
+        );
+        self.sendbuf
+    }
+
+    /// The receive buffer of the operation.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the request is active.
+    pub fn recv_buffer(&self) -> &R {
+        self.request.buffer()
+    }
+
+    /// The receive buffer of the operation.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the request is active.
+    pub fn recv_buffer_mut(&mut self) -> &mut R {
+        self.request.buffer_mut()
+    }
+}
+
+#[cfg(feature = "mpi-rt-sys-backend")]
+unsafe impl<'a, S: ?Sized, R: ?Sized, Sc: Scope<'a>> AsRaw
+    for PersistentCollectiveRequest<'a, S, R, Sc>
+{
+    type Raw = MPI_Request;
+    fn as_raw(&self) -> Self::Raw {
+        self.request.as_raw()
+    }
+}
+
+/// Collection of persistent requests that are started and completed together
+///
+/// Requests added to the collection stay in it until it is dropped, which waits for active
+/// requests and frees all of them. `start_all()` starts every request with one call to
+/// `MPI_Startall()`; the completion operations mirror those of
+/// [`RequestCollection`](struct.RequestCollection.html), but leave completed requests in the
+/// collection, inactive and ready to be started again.
+///
+/// # Examples
+///
+/// See `examples/persistent.rs`
+///
+/// # Standard section(s)
+///
+/// 3.7.5, 3.9
+pub struct PersistentRequestCollection<'a, D: ?Sized, S: Scope<'a> = StaticScope> {
+    /// Array of requests
+    requests: Vec<MPI_Request>,
+    /// Buffers of the requests
+    data: Vec<&'a mut D>,
+    /// Which requests are active
+    active: Vec<bool>,
+    /// Request statuses
+    statuses: Vec<MaybeUninit<MPI_Status>>,
+    /// Pre-allocated indices buffer for use with testsome(), waitsome(), etc.
+    indices: Vec<c_int>,
+    scope: S,
+    phantom: PhantomData<Cell<&'a ()>>,
+}
+
+impl<'a, D: ?Sized, S: Scope<'a>> PersistentRequestCollection<'a, D, S> {
+    /// Create an empty collection registered with `scope`.
+    pub fn new(scope: S) -> Self {
+        scope.register();
+        PersistentRequestCollection {
+            requests: vec![],
+            data: vec![],
+            active: vec![],
+            statuses: vec![],
+            indices: vec![],
+            scope,
+            phantom: Default::default(),
+        }
+    }
+
+    /// Add the request to the collection and return its index. This unregisters the request from
+    /// its scope; the collection frees the request when it is dropped.
+    pub fn add<S2>(&mut self, req: PersistentRequest<'a, D, S2>) -> usize
+    where
+        S2: Scope<'a>,
+    {
+        let i = self.requests.len();
+        let active = req.is_active();
+        let (req, data, _) = unsafe { req.into_raw() };
+        self.requests.push(req);
+        self.data.push(data);
+        self.active.push(active);
+        self.statuses.push(MaybeUninit::<MPI_Status>::uninit());
+        self.indices.push(0);
+        i
+    }
+
+    /// Return the number of requests in the collection.
+    pub fn len(&self) -> usize {
+        self.requests.len()
+    }
+
+    /// Return whether the collection has no requests.
+    pub fn is_empty(&self) -> bool {
+        self.requests.is_empty()
+    }
+
+    /// Return the number of active requests.
+    pub fn active(&self) -> usize {
+        self.active.iter().filter(|&&active| active).count()
+    }
+
+    /// Return whether the request at index `i` is active.
+    pub fn is_active(&self, i: usize) -> bool {
+        self.active[i]
+    }
+
+    /// Start all requests.
+    ///
+    /// # Panics
+    ///
+    /// Panics if any request is active.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.9
+    pub fn start_all(&mut self) {
+        assert!(
+            self.active.iter().all(|&active| !active),
+            "persistent request started while active"
+        );
+        unsafe {
+            ffi::MPI_Startall(
+                self.requests
+                    .len()
+                    .try_into()
+                    .expect("could not cast usize to c_int"),
+                self.requests.as_mut_ptr(),
+            );
+        }
+        self.active.iter_mut().for_each(|active| *active = true);
+    }
+
+    /// Start the request at index `i`.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the request is active.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.9
+    pub fn start(&mut self, i: usize) {
+        assert!(!self.active[i], "persistent request started while active");
+        unsafe {
+            ffi::MPI_Start(&mut self.requests[i]);
+        }
+        self.active[i] = true;
+    }
+
+    /// Mark the request at `index` as complete and return its index and status, or return `None`
+    /// if `index` is `MPI_UNDEFINED` because no request was active.
+    fn complete_one(&mut self, index: c_int, status: MPI_Status) -> Option<(usize, Status)> {
+        if index == ffi::RSMPI_UNDEFINED_fn() {
+            return None;
+        }
+        let i: usize = index.try_into().expect("could not cast c_int to usize");
+        self.active[i] = false;
+        Some((i, Status::from_raw(status)))
+    }
+
+    /// Mark the first `count` requests in `indices` as complete and put their (request_index,
+    /// status) into `result`.
+    fn complete_some(&mut self, count: c_int, result: &mut Vec<(usize, Status)>) {
+        result.clear();
+        if count == ffi::RSMPI_UNDEFINED_fn() {
+            return;
+        }
+        let count: usize = count.try_into().expect("could not cast c_int to usize");
+        result.reserve(count);
+        for i in 0..count {
+            let idx: usize = self.indices[i]
+                .try_into()
+                .expect("could not cast c_int to usize");
+            self.active[idx] = false;
+            let status = unsafe { self.statuses[i].assume_init() };
+            result.push((idx, Status::from_raw(status)));
+        }
+    }
+
+    /// Mark all active requests as complete and put their (request_index, status) into `result`.
+    fn complete_all(&mut self, result: &mut Vec<(usize, Status)>) {
+        result.clear();
+        result.reserve(self.requests.len());
+        for i in 0..self.requests.len() {
+            if mem::replace(&mut self.active[i], false) {
+                let status = unsafe { self.statuses[i].assume_init() };
+                result.push((i, Status::from_raw(status)));
+            }
+        }
+    }
+
+    /// Wait for any active request to complete, and return an option containing
+    /// (request_index, status). Returns `None` if no request is active.
+    pub fn wait_any(&mut self) -> Option<(usize, Status)> {
+        let mut i: c_int = 0;
+        let (_res, status) = unsafe {
+            let count = self.requests.len() as c_int;
+            with_uninitialized(|status| {
+                ffi::MPI_Waitany(count, self.requests.as_mut_ptr(), &mut i, status)
+            })
+        };
+        self.complete_one(i, status)
+    }
+
+    /// Wait for some of the active requests to complete and fill result with the
+    /// (request_index, status) of each completed request. Leaves result empty if no request is
+    /// active.
+    pub fn wait_some(&mut self, result: &mut Vec<(usize, Status)>) {
+        let mut count = 0;
+        unsafe {
+            ffi::MPI_Waitsome(
+                self.requests.len() as c_int,
+                self.requests.as_mut_ptr(),
+                &mut count,
+                self.indices.as_mut_ptr(),
+                self.statuses.as_mut_ptr() as *mut MPI_Status,
+            );
+        }
+        self.complete_some(count, result);
+    }
+
+    /// Wait for all active requests to complete, putting (request_index, status) into result for
+    /// every completed request.
+    pub fn wait_all(&mut self, result: &mut Vec<(usize, Status)>) {
+        unsafe {
+            ffi::MPI_Waitall(
+                self.requests.len() as c_int,
+                self.requests.as_mut_ptr(),
+                self.statuses.as_mut_ptr() as *mut MPI_Status,
+            );
+        }
+        self.complete_all(result);
+    }
+
+    /// Wait for all active requests to complete, but don’t bother retrieving their `Status`
+    /// information.
+    pub fn wait_all_without_status(&mut self) {
+        unsafe {
+            ffi::MPI_Waitall(
+                self.requests.len() as c_int,
+                self.requests.as_mut_ptr(),
+                ffi::RSMPI_STATUSES_IGNORE_fn(),
+            );
+        }
+        self.active.iter_mut().for_each(|active| *active = false);
+    }
+
+    /// Test for the completion of any active request. Returns an option containing
+    /// (request_index, status).
+    pub fn test_any(&mut self) -> Option<(usize, Status)> {
+        let mut i = 0;
+        let mut flag = 0;
+        let (_, status) = unsafe {
+            let count = self.requests.len() as c_int;
+            with_uninitialized(|status| {
+                ffi::MPI_Testany(count, self.requests.as_mut_ptr(), &mut i, &mut flag, status)
+            })
+        };
+        if flag != 0 {
+            self.complete_one(i, status)
+        } else {
+            None
+        }
+    }
+
+    /// Test for the completion of some active requests and fill result with the
+    /// (request_index, status) of each completed request.
+    pub fn test_some(&mut self, result: &mut Vec<(usize, Status)>) {
+        let mut count = 0;
+        unsafe {
+            ffi::MPI_Testsome(
+                self.requests.len() as c_int,
+                self.requests.as_mut_ptr(),
+                &mut count,
+                self.indices.as_mut_ptr(),
+                self.statuses.as_mut_ptr() as *mut MPI_Status,
+            );
+        }
+        self.complete_some(count, result);
+    }
+
+    /// Test for the completion of all active requests. If all have completed, puts
+    /// (request_index, status) into result for every completed request and returns `true`.
+    pub fn test_all(&mut self, result: &mut Vec<(usize, Status)>) -> bool {
+        let mut flag = 0;
+        unsafe {
+            ffi::MPI_Testall(
+                self.requests.len() as c_int,
+                self.requests.as_mut_ptr(),
+                &mut flag,
+                self.statuses.as_mut_ptr() as *mut MPI_Status,
+            );
+        }
+        if flag != 0 {
+            self.complete_all(result);
+            true
+        } else {
+            result.clear();
+            false
+        }
+    }
+
+    /// The buffer of the request at index `i`.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the request is active.
+    pub fn buffer(&self, i: usize) -> &D {
+        assert!(
+            !self.active[i],
+            "buffer of an active persistent request accessed"
+        );
+        self.data[i]
+    }
+
+    /// The buffer of the request at index `i`.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the request is active.
+    pub fn buffer_mut(&mut self, i: usize) -> &mut D {
+        assert!(
+            !self.active[i],
+            "buffer of an active persistent request accessed"
+        );
+        self.data[i]
+    }
+}
+
+/// Drop implementation that waits for active requests and frees all requests.
+impl<'a, D: ?Sized, S: Scope<'a>> Drop for PersistentRequestCollection<'a, D, S> {
+    fn drop(&mut self) {
+        if self.active.iter().any(|&active| active) {
+            self.wait_all_without_status();
+        }
+        unsafe {
+            for request in &mut self.requests {
+                ffi::MPI_Request_free(request);
+            }
+            self.scope.unregister();
+        }
+    }
+}
+
+/// A partitioned send request registered with a `Scope` of lifetime `'a`
+///
+/// A partitioned send transfers its buffer as one message whose partitions become ready
+/// independently, e.g. as different threads finish computing them. Like a persistent request,
+/// it is created inactive by `partitioned_send_init()` and can be started and completed any number
+/// of times. `start()` hands out one [`SendPartition`](struct.SendPartition.html) per partition;
+/// each partition can be filled in, possibly on another thread, and is marked ready for transfer
+/// when it is dropped. The request completes once all partitions have been marked ready and sent.
+///
+/// Marking partitions ready from several threads at once requires the `Threading::Multiple`
+/// threading level.
+///
+/// # Examples
+///
+/// See `examples/partitioned.rs`
+///
+/// # Standard section(s)
+///
+/// 4.2 (MPI 4.0)
+#[cfg(feature = "mpi-rt-sys-backend")]
+#[must_use]
+#[derive(Debug)]
+pub struct PartitionedSendRequest<'a, T, S: Scope<'a> = StaticScope> {
+    request: PersistentRequest<'a, [T], S>,
+    partitions: usize,
+}
+
+/// A partitioned receive request registered with a `Scope` of lifetime `'a`
+///
+/// The receiving side of a partitioned message. Once the request has been started, `arrived()`
+/// and `partition()` tell which partitions have been received before the whole message has.
+///
+/// # Examples
+///
+/// See `examples/partitioned.rs`
+///
+/// # Standard section(s)
+///
+/// 4.2 (MPI 4.0)
+#[cfg(feature = "mpi-rt-sys-backend")]
+#[must_use]
+#[derive(Debug)]
+pub struct PartitionedReceiveRequest<'a, T, S: Scope<'a> = StaticScope> {
+    request: PersistentRequest<'a, [T], S>,
+    partitions: usize,
+}
+
+/// One partition of an active partitioned send
+///
+/// Dereferences to the part of the send buffer that belongs to the partition. Dropping the
+/// partition, or calling `ready()`, marks it ready for transfer.
+///
+/// # Standard section(s)
+///
+/// 4.2 (MPI 4.0)
+#[cfg(feature = "mpi-rt-sys-backend")]
+#[derive(Debug)]
+pub struct SendPartition<'r, T> {
+    request: MPI_Request,
+    index: usize,
+    data: &'r mut [T],
+}
+
+#[cfg(feature = "mpi-rt-sys-backend")]
+impl<'a, T, S: Scope<'a>> PartitionedSendRequest<'a, T, S> {
+    /// Construct a partitioned send request from an inactive persistent request returned by
+    /// `MPI_Psend_init()`.
+    ///
+    /// # Safety
+    /// - `request` must have been initialized with `partitions` partitions of
+    ///   `request.buffer().len() / partitions` elements each.
+    pub(crate) unsafe fn from_persistent(
+        request: PersistentRequest<'a, [T], S>,
+        partitions: usize,
+    ) -> Self {
+        Self {
+            request,
+            partitions,
+        }
+    }
+
+    /// The number of partitions.
+    pub fn partitions(&self) -> usize {
+        self.partitions
+    }
+
+    /// Whether the request has been started and not yet completed.
+    pub fn is_active(&self) -> bool {
+        self.request.is_active()
+    }
+
+    /// Start the operation and return its partitions in order.
+    ///
+    /// The request can only be completed once all partitions have been dropped.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the request is already active.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.9, 4.2 (MPI 4.0)
+    pub fn start(&mut self) -> Vec<SendPartition<'_, T>> {
+        self.request.start();
+        let request = self.request.as_raw();
+        let len = self.request.data.len() / self.partitions;
+        self.request
+            .data
+            .chunks_mut(len.max(1))
+            .chain(std::iter::repeat_with(|| &mut [][..]))
+            .take(self.partitions)
+            .enumerate()
+            .map(|(index, data)| SendPartition {
+                request,
+                index,
+                data,
+            })
+            .collect()
+    }
+
+    /// Wait for the operation to finish, leaving the request inactive.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.7.3
+    pub fn wait(&mut self) -> Status {
+        self.request.wait()
+    }
+
+    /// Wait for the operation to finish, but don’t bother retrieving the `Status` information.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.7.3
+    pub fn wait_without_status(&mut self) {
+        self.request.wait_without_status()
+    }
+
+    /// Test whether the operation has finished.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.7.3
+    pub fn test(&mut self) -> Option<Status> {
+        self.request.test()
+    }
+
+    /// The send buffer.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the request is active.
+    pub fn buffer(&self) -> &[T] {
+        self.request.buffer()
+    }
+
+    /// The send buffer.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the request is active.
+    pub fn buffer_mut(&mut self) -> &mut [T] {
+        self.request.buffer_mut()
+    }
+}
+
+#[cfg(feature = "mpi-rt-sys-backend")]
+unsafe impl<'a, T, S: Scope<'a>> AsRaw for PartitionedSendRequest<'a, T, S> {
+    type Raw = MPI_Request;
+    fn as_raw(&self) -> Self::Raw {
+        self.request.as_raw()
+    }
+}
+
+#[cfg(feature = "mpi-rt-sys-backend")]
+impl<'r, T> SendPartition<'r, T> {
+    /// The index of the partition.
+    pub fn index(&self) -> usize {
+        self.index
+    }
+
+    /// Mark the partition ready for transfer. Same as dropping it.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 4.2.2 (MPI 4.0)
+    pub fn ready(self) {}
+}
+
+#[cfg(feature = "mpi-rt-sys-backend")]
+impl<'r, T> std::ops::Deref for SendPartition<'r, T> {
+    type Target = [T];
+    fn deref(&self) -> &[T] {
+        self.data
+    }
+}
+
+#[cfg(feature = "mpi-rt-sys-backend")]
+impl<'r, T> std::ops::DerefMut for SendPartition<'r, T> {
+    fn deref_mut(&mut self) -> &mut [T] {
+        self.data
+    }
+}
+
+#[cfg(feature = "mpi-rt-sys-backend")]
+impl<'r, T> Drop for SendPartition<'r, T> {
+    fn drop(&mut self) {
+        unsafe {
+            ffi::MPI_Pready(self.index as c_int, self.request);
+        }
+    }
+}
+
+#[cfg(feature = "mpi-rt-sys-backend")]
+impl<'a, T, S: Scope<'a>> PartitionedReceiveRequest<'a, T, S> {
+    /// Construct a partitioned receive request from an inactive persistent request returned by
+    /// `MPI_Precv_init()`.
+    ///
+    /// # Safety
+    /// - `request` must have been initialized with `partitions` partitions of
+    ///   `request.buffer().len() / partitions` elements each.
+    pub(crate) unsafe fn from_persistent(
+        request: PersistentRequest<'a, [T], S>,
+        partitions: usize,
+    ) -> Self {
+        Self {
+            request,
+            partitions,
+        }
+    }
+
+    /// The number of partitions.
+    pub fn partitions(&self) -> usize {
+        self.partitions
+    }
+
+    /// Whether the request has been started and not yet completed.
+    pub fn is_active(&self) -> bool {
+        self.request.is_active()
+    }
+
+    /// Start the operation.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the request is already active.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.9, 4.2 (MPI 4.0)
+    pub fn start(&mut self) {
+        self.request.start()
+    }
+
+    /// Whether partition `partition` has been received. Always true for an inactive request.
+    ///
+    /// # Panics
+    ///
+    /// Panics if `partition` is out of range.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 4.2.2 (MPI 4.0)
+    pub fn arrived(&self, partition: usize) -> bool {
+        assert!(
+            partition < self.partitions,
+            "partition {} out of range for {} partitions",
+            partition,
+            self.partitions
+        );
+        if !self.request.is_active() {
+            return true;
+        }
+        unsafe {
+            with_uninitialized(|flag| {
+                ffi::MPI_Parrived(self.request.as_raw(), partition as c_int, flag)
+            })
+            .1 != 0
+        }
+    }
+
+    /// The received data of partition `partition`, or `None` if it has not arrived yet.
+    ///
+    /// # Panics
+    ///
+    /// Panics if `partition` is out of range.
+    pub fn partition(&self, partition: usize) -> Option<&[T]> {
+        if self.arrived(partition) {
+            let len = self.request.data.len() / self.partitions;
+            Some(&self.request.data[partition * len..(partition + 1) * len])
+        } else {
+            None
+        }
+    }
+
+    /// Wait for the operation to finish, leaving the request inactive.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.7.3
+    pub fn wait(&mut self) -> Status {
+        self.request.wait()
+    }
+
+    /// Wait for the operation to finish, but don’t bother retrieving the `Status` information.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.7.3
+    pub fn wait_without_status(&mut self) {
+        self.request.wait_without_status()
+    }
+
+    /// Test whether the operation has finished.
+    ///
+    /// # Standard section(s)
+    ///
+    /// 3.7.3
+    pub fn test(&mut self) -> Option<Status> {
+        self.request.test()
+    }
+
+    /// The receive buffer.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the request is active.
+    pub fn buffer(&self) -> &[T] {
+        self.request.buffer()
+    }
+
+    /// The receive buffer.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the request is active.
+    pub fn buffer_mut(&mut self) -> &mut [T] {
+        self.request.buffer_mut()
+    }
+}
+
+#[cfg(feature = "mpi-rt-sys-backend")]
+unsafe impl<'a, T, S: Scope<'a>> AsRaw for PartitionedReceiveRequest<'a, T, S> {
+    type Raw = MPI_Request;
+    fn as_raw(&self) -> Self::Raw {
+        self.request.as_raw()
+    }
+}
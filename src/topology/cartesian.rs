@@ -4,8 +4,8 @@ use conv::ConvUtil;
 
 use super::{sealed, AsCommunicator, Communicator, IntoTopology, Rank};
 use crate::{
-    datatype::traits::*, ffi, ffi::MPI_Comm, raw::traits::*, topology::SimpleCommunicator,
-    with_uninitialized, with_uninitialized2, Count, IntArray,
+    collective::NeighborhoodCollectives, datatype::traits::*, ffi, ffi::MPI_Comm, raw::traits::*,
+    topology::SimpleCommunicator, with_uninitialized, with_uninitialized2, Count, IntArray,
 };
 
 /// Contains arrays describing the layout of the
@@ -444,6 +444,15 @@ impl Communicator for CartesianCommunicator {
     }
 }
 
+impl NeighborhoodCollectives for CartesianCommunicator {
+    /// Every process has two neighbors in each dimension, including those that do not exist at
+    /// the boundary of a non-periodic dimension.
+    fn neighbor_degrees(&self) -> (Count, Count) {
+        let degree = 2 * self.num_dimensions();
+        (degree, degree)
+    }
+}
+
 impl sealed::AsHandle for CartesianCommunicator {
     fn as_handle(&self) -> &sealed::CommunicatorHandle {
         self.0.as_handle()
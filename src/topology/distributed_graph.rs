@@ -0,0 +1,197 @@
+use std::{mem, os::raw::c_int};
+
+use super::{sealed, AsCommunicator, Communicator, IntoTopology, Rank};
+use crate::{
+    collective::NeighborhoodCollectives, datatype::traits::*, ffi, ffi::MPI_Comm, raw::traits::*,
+    topology::SimpleCommunicator, Count,
+};
+
+/// The weight of an edge in a [`DistributedGraphCommunicator`](struct.DistributedGraphCommunicator.html)
+///
+/// Weights describe how much is communicated along an edge, e.g. the number of bytes. MPI may use
+/// them to place processes that communicate a lot close to each other when reordering ranks.
+pub type Weight = c_int;
+
+/// A `DistributedGraphCommunicator` is an MPI communicator object in which every process knows
+/// the processes it receives from (its sources) and sends to (its destinations). Unlike in a
+/// [`CartesianCommunicator`](struct.CartesianCommunicator.html), the neighborhoods can be
+/// arbitrary, e.g. the adjacency of the partitions of an unstructured mesh.
+///
+/// The neighbors and their weights are queried once when the communicator is created and cached,
+/// so the neighbor queries and the block counts of neighborhood collectives do not call into MPI.
+///
+/// # Examples
+///
+/// See `examples/distributed_graph.rs`
+///
+/// # Standard Section(s)
+///
+/// 7.5.4
+pub struct DistributedGraphCommunicator {
+    comm: SimpleCommunicator,
+    sources: Vec<Rank>,
+    destinations: Vec<Rank>,
+    weights: Option<(Vec<Weight>, Vec<Weight>)>,
+}
+
+impl DistributedGraphCommunicator {
+    /// Given a valid `MPI_Comm` handle in `raw`, returns a `DistributedGraphCommunicator` value
+    /// if, and only if:
+    /// - The handle is not `MPI_COMM_NULL`
+    /// - The topology of the communicator is `MPI_DIST_GRAPH`
+    ///
+    /// Otherwise returns None.
+    ///
+    /// # Parameters
+    /// * `raw` - Handle to a valid `MPI_Comm` object
+    ///
+    /// # Safety
+    /// - `raw` must be a live MPI_Comm handle.
+    /// - `raw` must not be a system communicator handle.
+    /// - `raw` must not be a inter-communicator handle.
+    /// - `raw` must not be used after calling this function.
+    pub unsafe fn try_from_raw(raw: MPI_Comm) -> Option<DistributedGraphCommunicator> {
+        SimpleCommunicator::try_from_raw(raw).and_then(|comm| match comm.into_topology() {
+            IntoTopology::DistributedGraph(c) => Some(c),
+            incorrect => {
+                // Forget the comm object so it's not dropped
+                mem::forget(incorrect);
+
+                None
+            }
+        })
+    }
+
+    /// Wraps a communicator with a distributed graph topology and caches its neighbors.
+    ///
+    /// # Standard section(s)
+    /// 7.5.5 (MPI_Dist_graph_neighbors_count, MPI_Dist_graph_neighbors)
+    pub(super) fn from_simple(comm: SimpleCommunicator) -> DistributedGraphCommunicator {
+        let (mut indegree, mut outdegree, mut weighted) = (0, 0, 0);
+        unsafe {
+            ffi::MPI_Dist_graph_neighbors_count(
+                comm.as_raw(),
+                &mut indegree,
+                &mut outdegree,
+                &mut weighted,
+            );
+        }
+        let degree = |d: Count| -> usize {
+            d.try_into()
+                .expect("rsmpi internal error: MPI implementation returned a negative degree")
+        };
+
+        let mut sources = vec![0; degree(indegree)];
+        let mut destinations = vec![0; degree(outdegree)];
+        let mut source_weights = vec![0; degree(indegree)];
+        let mut destination_weights = vec![0; degree(outdegree)];
+        unsafe {
+            ffi::MPI_Dist_graph_neighbors(
+                comm.as_raw(),
+                indegree,
+                sources.as_mut_ptr(),
+                source_weights.as_mut_ptr(),
+                outdegree,
+                destinations.as_mut_ptr(),
+                destination_weights.as_mut_ptr(),
+            );
+        }
+
+        DistributedGraphCommunicator {
+            comm,
+            sources,
+            destinations,
+            weights: (weighted != 0).then_some((source_weights, destination_weights)),
+        }
+    }
+
+    /// Returns the ranks of the processes this process receives from.
+    ///
+    /// # Standard section(s)
+    /// 7.5.5 (MPI_Dist_graph_neighbors)
+    pub fn sources(&self) -> &[Rank] {
+        &self.sources
+    }
+
+    /// Returns the ranks of the processes this process sends to.
+    ///
+    /// # Standard section(s)
+    /// 7.5.5 (MPI_Dist_graph_neighbors)
+    pub fn destinations(&self) -> &[Rank] {
+        &self.destinations
+    }
+
+    /// Returns the weights of the edges from the [`sources`](#method.sources), or `None` if the
+    /// graph is unweighted.
+    ///
+    /// # Standard section(s)
+    /// 7.5.5 (MPI_Dist_graph_neighbors)
+    pub fn source_weights(&self) -> Option<&[Weight]> {
+        self.weights.as_ref().map(|(s, _)| &s[..])
+    }
+
+    /// Returns the weights of the edges to the [`destinations`](#method.destinations), or `None`
+    /// if the graph is unweighted.
+    ///
+    /// # Standard section(s)
+    /// 7.5.5 (MPI_Dist_graph_neighbors)
+    pub fn destination_weights(&self) -> Option<&[Weight]> {
+        self.weights.as_ref().map(|(_, d)| &d[..])
+    }
+
+    /// Returns whether the graph was created with edge weights.
+    ///
+    /// # Standard section(s)
+    /// 7.5.5 (MPI_Dist_graph_neighbors_count)
+    pub fn is_weighted(&self) -> bool {
+        self.weights.is_some()
+    }
+}
+
+impl Communicator for DistributedGraphCommunicator {
+    fn target_size(&self) -> Rank {
+        self.size()
+    }
+}
+
+impl NeighborhoodCollectives for DistributedGraphCommunicator {
+    fn neighbor_degrees(&self) -> (Count, Count) {
+        (self.sources.count(), self.destinations.count())
+    }
+}
+
+impl sealed::AsHandle for DistributedGraphCommunicator {
+    fn as_handle(&self) -> &sealed::CommunicatorHandle {
+        self.comm.as_handle()
+    }
+}
+
+impl AsCommunicator for DistributedGraphCommunicator {
+    type Out = DistributedGraphCommunicator;
+    fn as_communicator(&self) -> &Self::Out {
+        self
+    }
+}
+
+unsafe impl AsRaw for DistributedGraphCommunicator {
+    type Raw = MPI_Comm;
+    fn as_raw(&self) -> Self::Raw {
+        self.comm.as_raw()
+    }
+}
+
+impl FromRaw for DistributedGraphCommunicator {
+    /// Creates a `DistributedGraphCommunicator` from `raw` and queries its neighbors.
+    ///
+    /// # Parameters
+    /// * `raw` - Handle to a valid `MPI_DIST_GRAPH` `MPI_Comm` object
+    ///
+    /// # Safety
+    /// - `raw` must be a live MPI_Comm handle
+    /// - `raw` must not be an inter-comm handle, the parent handle, or a system handle
+    /// - `raw` must not be used after calling this function.
+    unsafe fn from_raw(raw: <Self as AsRaw>::Raw) -> Self {
+        debug_assert_ne!(raw, ffi::RSMPI_COMM_NULL_fn());
+        DistributedGraphCommunicator::from_simple(SimpleCommunicator::from_raw(raw))
+    }
+}
@@ -17,7 +17,7 @@
 //! - **6.6**: Inter-communication
 //! - **6.7**: Caching
 //! - **6.8**: Naming objects
-//! - **7**: Process topologies
+//! - **7**: Process topologies, graph topologies created with `MPI_Graph_create()`
 //! - **Parts of sections**: 8, 10, 12
 use std::{
     ffi::{CStr, CString},
@@ -40,14 +40,15 @@ use crate::{
 };
 
 mod cartesian;
+mod distributed_graph;
 
 /// Topology traits
 pub mod traits {
     pub use super::{AnyCommunicator, AsCommunicator, Communicator, Group};
 }
 
-// Re-export cartesian functions and types from topology modules.
-pub use self::cartesian::*;
+// Re-export cartesian and distributed graph functions and types from topology modules.
+pub use self::{cartesian::*, distributed_graph::*};
 
 /// Something that has a communicator associated with it
 pub trait AsCommunicator {
@@ -134,7 +135,9 @@ impl SimpleCommunicator {
         match self.topology() {
             Topology::Graph => unimplemented!(),
             Topology::Cartesian => IntoTopology::Cartesian(CartesianCommunicator(self)),
-            Topology::DistributedGraph => unimplemented!(),
+            Topology::DistributedGraph => {
+                IntoTopology::DistributedGraph(DistributedGraphCommunicator::from_simple(self))
+            }
             Topology::Undefined => IntoTopology::Undefined(self),
         }
     }
@@ -310,10 +313,6 @@ impl Communicator for InterCommunicator {
 #[allow(missing_copy_implementations)]
 pub struct GraphCommunicator;
 
-/// Unimplemented
-#[allow(missing_copy_implementations)]
-pub struct DistributedGraphCommunicator;
-
 /// A color used in a communicator split
 #[derive(Copy, Clone, Debug)]
 pub struct Color(c_int);
@@ -701,6 +700,146 @@ pub trait Communicator: sealed::AsHandle {
         }
     }
 
+    /// Creates a communicator with a distributed graph topology in which every process names its
+    /// own neighbors: the processes it receives from and the processes it sends to.
+    ///
+    /// Every edge has to be given by both of its processes, as a destination on the sending
+    /// process and as a source on the receiving process.
+    ///
+    /// * `sources` - ranks of the processes this process receives from
+    /// * `destinations` - ranks of the processes this process sends to
+    /// * `weights` - `None` for an unweighted graph, otherwise the weights of the edges from
+    ///     `sources` and to `destinations`, in that order. Either all processes or none must pass
+    ///     weights.
+    /// * `reorder` - If true, MPI may re-order ranks in the new communicator, e.g. to place
+    ///     processes joined by heavy edges close to each other.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/distributed_graph.rs`
+    ///
+    /// # Standard section(s)
+    /// 7.5.4 (MPI_Dist_graph_create_adjacent)
+    fn create_distributed_graph_communicator_adjacent(
+        &self,
+        sources: &[Rank],
+        destinations: &[Rank],
+        weights: Option<(&[Weight], &[Weight])>,
+        reorder: bool,
+    ) -> DistributedGraphCommunicator {
+        if let Some((source_weights, destination_weights)) = weights {
+            assert_eq!(
+                sources.len(),
+                source_weights.len(),
+                "sources and source weights must be parallel, equal-sized arrays"
+            );
+            assert_eq!(
+                destinations.len(),
+                destination_weights.len(),
+                "destinations and destination weights must be parallel, equal-sized arrays"
+            );
+        }
+
+        unsafe {
+            let (source_weights, destination_weights) = match weights {
+                Some((s, d)) => (s.as_ptr(), d.as_ptr()),
+                None => (
+                    ffi::RSMPI_UNWEIGHTED() as *const _,
+                    ffi::RSMPI_UNWEIGHTED() as *const _,
+                ),
+            };
+            let mut comm_dist_graph = ffi::RSMPI_COMM_NULL_fn();
+            ffi::MPI_Dist_graph_create_adjacent(
+                self.as_raw(),
+                sources.count(),
+                sources.as_ptr(),
+                source_weights,
+                destinations.count(),
+                destinations.as_ptr(),
+                destination_weights,
+                ffi::RSMPI_INFO_NULL_fn(),
+                reorder as Count,
+                &mut comm_dist_graph,
+            );
+            DistributedGraphCommunicator::try_from_raw(comm_dist_graph).expect(
+                "rsmpi internal error: MPI implementation returned an invalid communicator from \
+                 MPI_Dist_graph_create_adjacent()",
+            )
+        }
+    }
+
+    /// Creates a communicator with a distributed graph topology from edges that any process may
+    /// contribute.
+    ///
+    /// Each edge `(source, destination)` is added to the graph, regardless of whether `source` or
+    /// `destination` is the calling process, so the graph can be read in by a few processes. MPI
+    /// then tells every process its neighbors, see
+    /// [`DistributedGraphCommunicator::sources`](struct.DistributedGraphCommunicator.html#method.sources).
+    ///
+    /// * `edges` - `(source, destination)` ranks of the edges this process contributes
+    /// * `weights` - `None` for an unweighted graph, otherwise the weight of each edge. Either all
+    ///     processes or none must pass weights.
+    /// * `reorder` - If true, MPI may re-order ranks in the new communicator, e.g. to place
+    ///     processes joined by heavy edges close to each other.
+    ///
+    /// # Examples
+    ///
+    /// See `examples/distributed_graph.rs`
+    ///
+    /// # Standard section(s)
+    /// 7.5.4 (MPI_Dist_graph_create)
+    fn create_distributed_graph_communicator(
+        &self,
+        edges: &[(Rank, Rank)],
+        weights: Option<&[Weight]>,
+        reorder: bool,
+    ) -> DistributedGraphCommunicator {
+        if let Some(weights) = weights {
+            assert_eq!(
+                edges.len(),
+                weights.len(),
+                "edges and weights must be parallel, equal-sized arrays"
+            );
+        }
+
+        // Runs of edges with the same source are passed as one source with its degree.
+        let mut sources: Vec<Rank> = Vec::new();
+        let mut degrees: Vec<Count> = Vec::new();
+        for &(source, _) in edges {
+            match (sources.last(), degrees.last_mut()) {
+                (Some(&last), Some(degree)) if last == source => *degree += 1,
+                _ => {
+                    sources.push(source);
+                    degrees.push(1);
+                }
+            }
+        }
+        let destinations: Vec<Rank> = edges.iter().map(|&(_, d)| d).collect();
+
+        unsafe {
+            let weights = match weights {
+                Some(w) => w.as_ptr(),
+                None => ffi::RSMPI_UNWEIGHTED() as *const _,
+            };
+            let mut comm_dist_graph = ffi::RSMPI_COMM_NULL_fn();
+            ffi::MPI_Dist_graph_create(
+                self.as_raw(),
+                sources.count(),
+                sources.as_ptr(),
+                degrees.as_ptr(),
+                destinations.as_ptr(),
+                weights,
+                ffi::RSMPI_INFO_NULL_fn(),
+                reorder as Count,
+                &mut comm_dist_graph,
+            );
+            DistributedGraphCommunicator::try_from_raw(comm_dist_graph).expect(
+                "rsmpi internal error: MPI implementation returned an invalid communicator from \
+                 MPI_Dist_graph_create()",
+            )
+        }
+    }
+
     /// Gets the implementation-defined buffer size required to pack 'incount' elements of type
     /// 'datatype'.
     ///